@@ -0,0 +1,29 @@
+"""Performance benchmarks for repositories, services and HTTP endpoints.
+
+Run ``python -m benchmarks run`` to time the suite and store the results as
+JSON, and ``python -m benchmarks compare BASELINE CURRENT`` to flag
+regressions between two stored runs.
+"""
+
+import importlib
+
+from benchmarks.harness import Benchmark, registered_benchmarks
+
+BENCHMARK_MODULES = (
+    "benchmarks.bench_api",
+    "benchmarks.bench_container",
+    "benchmarks.bench_domain",
+    "benchmarks.bench_identifiers",
+    "benchmarks.bench_repositories",
+    "benchmarks.bench_startup",
+)
+
+
+def load_benchmarks() -> list[Benchmark]:
+    """Import every benchmark module and get the registered benchmarks."""
+    for module in BENCHMARK_MODULES:
+        _ = importlib.import_module(module)
+    return registered_benchmarks()
+
+
+__all__ = ["BENCHMARK_MODULES", "load_benchmarks"]
@@ -0,0 +1,202 @@
+"""Command line for running and comparing benchmarks.
+
+Examples:
+    python -m benchmarks run                       # sizes up to 1,000 rows
+    python -m benchmarks run --max-size 1000000    # full 1M-row suite
+    python -m benchmarks run -k repository --output base.json
+    python -m benchmarks compare base.json .benchmarks/latest.json
+    python -m benchmarks imports --check           # cold-start import report
+"""
+
+import argparse
+import sys
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TextIO
+
+from benchmarks import load_benchmarks
+from benchmarks.harness import (
+    BenchmarkResult,
+    compare_results,
+    load_results,
+    run_benchmark,
+    save_results,
+)
+from benchmarks.imports import ENTRY_POINTS, check_profiles, profile_import
+
+RESULTS_DIR = Path(".benchmarks")
+
+DEFAULT_MAX_SIZE = 1_000
+
+DEFAULT_THRESHOLD = 0.10
+
+
+def _format_seconds(seconds: float) -> str:
+    """Format a duration with a readable unit."""
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.2f} ns"
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Create the argument parser."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run benchmarks and store the results")
+    _ = run.add_argument(
+        "-k",
+        "--filter",
+        default="",
+        help="only run benchmarks whose name contains this text",
+    )
+    _ = run.add_argument(
+        "--max-size",
+        type=int,
+        default=DEFAULT_MAX_SIZE,
+        help="skip sizes above this many rows or items (default: %(default)s)",
+    )
+    _ = run.add_argument("--rounds", type=int, default=5)
+    _ = run.add_argument(
+        "--min-time",
+        type=float,
+        default=0.05,
+        help="minimum seconds per round (default: %(default)s)",
+    )
+    _ = run.add_argument(
+        "--output",
+        type=Path,
+        help="results file (default: .benchmarks/<timestamp>.json)",
+    )
+
+    compare = commands.add_parser("compare", help="compare two stored runs")
+    _ = compare.add_argument("baseline", type=Path)
+    _ = compare.add_argument("current", type=Path)
+    _ = compare.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="relative slowdown reported as a regression (default: %(default)s)",
+    )
+
+    imports = commands.add_parser(
+        "imports",
+        help="profile importing the entry points in fresh interpreters",
+    )
+    _ = imports.add_argument(
+        "entry_points",
+        nargs="*",
+        help="modules to import (default: the known entry points)",
+    )
+    _ = imports.add_argument(
+        "--top",
+        type=int,
+        default=5,
+        help="slowest modules listed per entry point (default: %(default)s)",
+    )
+    _ = imports.add_argument(
+        "--check",
+        action="store_true",
+        help="fail when an entry point imports a package it must not",
+    )
+    return parser
+
+
+def _run(args: argparse.Namespace, out: TextIO) -> int:
+    """Run the selected benchmarks and store the results."""
+    results: list[BenchmarkResult] = []
+    for bench in load_benchmarks():
+        for size in bench.sizes:
+            name = bench.qualified_name(size)
+            if size > args.max_size or args.filter not in name:
+                continue
+            result = run_benchmark(
+                bench,
+                size,
+                rounds=args.rounds,
+                min_time=args.min_time,
+            )
+            results.append(result)
+            spread = _format_seconds(result.stddev).strip()
+            _ = out.write(
+                f"{name:60} {_format_seconds(result.median)}  (+/- {spread})\n",
+            )
+    if not results:
+        _ = out.write("No benchmarks matched\n")
+        return 1
+    timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+    output: Path = args.output or RESULTS_DIR / f"{timestamp}.json"
+    save_results(results, output)
+    _ = out.write(f"Saved {len(results)} results to {output}\n")
+    return 0
+
+
+def _compare(args: argparse.Namespace, out: TextIO) -> int:
+    """Compare two stored runs; fail when any benchmark regressed."""
+    report = compare_results(
+        load_results(args.baseline),
+        load_results(args.current),
+        args.threshold,
+    )
+    regressions = {item.name for item in report.regressions}
+    improvements = {item.name for item in report.improvements}
+    for item in report.comparisons:
+        flag = ""
+        if item.name in regressions:
+            flag = "  REGRESSION"
+        elif item.name in improvements:
+            flag = "  faster"
+        line = (
+            f"{item.name:60} {_format_seconds(item.baseline)} -> "
+            f"{_format_seconds(item.current)} {item.change:+8.1%}{flag}"
+        )
+        _ = out.write(line + "\n")
+    for name in report.added:
+        _ = out.write(f"{name:60} new\n")
+    for name in report.missing:
+        _ = out.write(f"{name:60} missing\n")
+    summary = (
+        f"{len(regressions)} regressions beyond {args.threshold:.0%} "
+        f"in {len(report.comparisons)} benchmarks"
+    )
+    _ = out.write(summary + "\n")
+    return 1 if regressions else 0
+
+
+def _imports(args: argparse.Namespace, out: TextIO) -> int:
+    """Report import times; with --check, fail on forbidden imports."""
+    profiles = [profile_import(module) for module in args.entry_points or ENTRY_POINTS]
+    for profile in profiles:
+        _ = out.write(
+            f"{profile.entry_point:60} {_format_seconds(profile.total_us * 1e-6)}\n",
+        )
+        for module, micros in profile.slowest(args.top):
+            _ = out.write(f"    {module:56} {_format_seconds(micros * 1e-6)}\n")
+    problems = check_profiles(profiles) if args.check else []
+    for problem in problems:
+        _ = out.write(f"FORBIDDEN IMPORT: {problem}\n")
+    return 1 if problems else 0
+
+
+def main(argv: Sequence[str] | None = None, out: TextIO = sys.stdout) -> int:
+    """Run the command line.
+
+    Args:
+        argv: Arguments without the program name; defaults to sys.argv
+        out: Stream for the report
+
+    Returns:
+        Process exit code
+    """
+    args = _build_parser().parse_args(argv)
+    if args.command == "run":
+        return _run(args, out)
+    if args.command == "imports":
+        return _imports(args, out)
+    return _compare(args, out)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""Benchmarks for HTTP endpoints through an in-process ASGI client.
+
+Requests go through the full middleware stack and routing of the real
+application, but no network or server process.
+"""
+
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+
+import asyncio
+import tempfile
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import httpx
+from sqlalchemy.engine import Engine
+
+from benchmarks.data import seed_stocks
+from benchmarks.harness import benchmark
+from dependency_injection.composition_root import CompositionRoot
+from src.infrastructure.persistence.database_initializer import initialize_database
+from src.presentation.web.main import app
+
+STOCK_COUNTS = (100, 1_000)
+
+
+def api_get(path: str, stocks: int) -> Iterator[Callable[[], object]]:
+    """Serve GET requests for a path from a database holding ``stocks`` rows.
+
+    Yields:
+        Callable sending one request and returning the response
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = f"sqlite:///{Path(directory) / 'bench.db'}"
+        initialize_database(database_url)
+        container = CompositionRoot.configure(database_url=database_url)
+        engine = container.resolve(Engine)
+        with engine.begin() as connection:
+            seed_stocks(connection, stocks)
+        app.state.di_container = container
+
+        runner = asyncio.Runner()
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://benchmark",
+        )
+
+        def get() -> httpx.Response:
+            """Send one request and check that it succeeded."""
+            response = runner.run(client.get(path))
+            _ = response.raise_for_status()
+            return response
+
+        try:
+            yield get
+        finally:
+            runner.run(client.aclose())
+            runner.close()
+            del app.state.di_container
+            engine.dispose()
+
+
+@benchmark("api")
+def health(_size: int) -> Iterator[Callable[[], object]]:
+    """Serve the health check, the cheapest route."""
+    yield from api_get("/health", 0)
+
+
+@benchmark("api", sizes=STOCK_COUNTS)
+def list_stocks(stocks: int) -> Iterator[Callable[[], object]]:
+    """List every stock."""
+    yield from api_get("/stocks", stocks)
+
+
+@benchmark("api", sizes=STOCK_COUNTS)
+def list_stock_fields(stocks: int) -> Iterator[Callable[[], object]]:
+    """List the symbol and name of every stock, as list views do."""
+    yield from api_get("/stocks?fields=symbol,name", stocks)
+
+
+@benchmark("api", sizes=STOCK_COUNTS)
+def get_stock(stocks: int) -> Iterator[Callable[[], object]]:
+    """Fetch one stock by ID."""
+    yield from api_get(f"/stocks/stock-{stocks // 2}", stocks)
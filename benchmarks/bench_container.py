@@ -0,0 +1,29 @@
+"""Benchmarks for dependency resolution."""
+
+from collections.abc import Callable, Iterator
+
+from sqlalchemy.engine import Engine
+
+from benchmarks.harness import benchmark
+from dependency_injection.composition_root import CompositionRoot
+from src.application.interfaces.stock_service import IStockApplicationService
+
+
+@benchmark("container")
+def resolve_singleton(_size: int) -> Iterator[Callable[[], object]]:
+    """Resolve a registered instance."""
+    container = CompositionRoot.configure(database_url="sqlite:///:memory:")
+    try:
+        yield lambda: container.resolve(Engine)
+    finally:
+        container.resolve(Engine).dispose()
+
+
+@benchmark("container")
+def resolve_application_service(_size: int) -> Iterator[Callable[[], object]]:
+    """Resolve the stock service, as every stock request does."""
+    container = CompositionRoot.configure(database_url="sqlite:///:memory:")
+    try:
+        yield lambda: container.resolve(IStockApplicationService)
+    finally:
+        container.resolve(Engine).dispose()
@@ -0,0 +1,95 @@
+"""Benchmarks for domain value objects and services."""
+
+from collections.abc import Callable, Iterator
+from decimal import Decimal
+
+from benchmarks.data import build_holdings
+from benchmarks.harness import benchmark
+from src.domain.services.portfolio_calculation_service import (
+    PortfolioCalculationService,
+)
+from src.domain.value_objects import Money
+
+POSITION_COUNTS = (100, 1_000, 10_000)
+
+
+@benchmark("domain", sizes=(1_000,))
+def money_addition(count: int) -> Iterator[Callable[[], object]]:
+    """Sum a list of amounts."""
+    amounts = [Money(f"{index}.25") for index in range(count)]
+
+    def add_all() -> Money:
+        """Add the amounts one by one."""
+        total = Money.zero()
+        for amount in amounts:
+            total += amount
+        return total
+
+    yield add_all
+
+
+@benchmark("domain", sizes=(1_000,))
+def money_multiplication(count: int) -> Iterator[Callable[[], object]]:
+    """Scale a list of amounts by a decimal factor."""
+    amounts = [Money(f"{index}.25") for index in range(count)]
+    factor = Decimal("1.07")
+    yield lambda: [amount * factor for amount in amounts]
+
+
+@benchmark("domain", sizes=POSITION_COUNTS)
+def portfolio_total_value(positions: int) -> Iterator[Callable[[], object]]:
+    """Value a portfolio at current prices."""
+    service = PortfolioCalculationService()
+    portfolio, prices = build_holdings(positions)
+    yield lambda: service.calculate_total_value(portfolio, prices)
+
+
+@benchmark("domain", sizes=POSITION_COUNTS)
+def portfolio_position_allocations(positions: int) -> Iterator[Callable[[], object]]:
+    """Compute the weight of every position."""
+    service = PortfolioCalculationService()
+    portfolio, prices = build_holdings(positions)
+    yield lambda: service.calculate_position_allocations(portfolio, prices)
+
+
+@benchmark("domain", sizes=POSITION_COUNTS)
+def portfolio_industry_allocations(positions: int) -> Iterator[Callable[[], object]]:
+    """Compute the weight of every industry."""
+    service = PortfolioCalculationService()
+    portfolio, prices = build_holdings(positions)
+    yield lambda: service.calculate_industry_allocations(portfolio, prices)
+
+
+@benchmark("domain", sizes=POSITION_COUNTS)
+def portfolio_metrics_full(positions: int) -> Iterator[Callable[[], object]]:
+    """Recompute every metric from scratch after one price changes."""
+    service = PortfolioCalculationService()
+    portfolio, prices = build_holdings(positions)
+    symbol = portfolio[0][0].symbol.value
+
+    def tick() -> object:
+        """Change one price and recompute."""
+        prices[symbol] = Money(prices[symbol].value + 1)
+        return service.calculate_metrics(portfolio, prices)
+
+    yield tick
+
+
+@benchmark("domain", sizes=POSITION_COUNTS)
+def portfolio_metrics_incremental(positions: int) -> Iterator[Callable[[], object]]:
+    """Apply one price change to running totals."""
+    portfolio, prices = build_holdings(positions)
+    allocation = PortfolioCalculationService().build_incremental_allocation(
+        portfolio,
+        prices,
+    )
+    symbol = portfolio[0][0].symbol.value
+    price = prices[symbol]
+
+    def tick() -> object:
+        """Change one price in O(1)."""
+        nonlocal price
+        price = Money(price.value + 1)
+        return allocation.update_price(symbol, price)
+
+    yield tick
@@ -0,0 +1,185 @@
+"""Benchmarks comparing entity ID strategies on a transactions-shaped table.
+
+Each strategy gets its own table with an ``id`` primary key and indexed
+``portfolio_id`` and ``stock_id`` references, the shape of the transactions
+table. Random uuid4 keys land on arbitrary index pages, while UUIDv7 keys
+append to the right edge, and binary storage shrinks every index.
+
+Index sizes are not timings, so they are reported separately::
+
+    python -m benchmarks.bench_identifiers --rows 10000000
+"""
+
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+
+import argparse
+import sys
+import uuid
+from collections.abc import Callable, Iterator, Sequence
+from functools import cache
+from itertools import islice
+from typing import Any, TextIO
+
+from sqlalchemy import (
+    Column,
+    Index,
+    MetaData,
+    String,
+    Table,
+    create_engine,
+    insert,
+    text,
+)
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.types import TypeEngine
+
+from benchmarks.data import SEED_CHUNK_SIZE
+from benchmarks.harness import benchmark
+from src.domain.entities.identifiers import uuid7
+from src.infrastructure.persistence.tables.table_utils import BinaryId
+
+ROW_COUNTS = (1_000, 100_000, 1_000_000, 10_000_000)
+
+# Transactions inserted per timed call
+INSERT_BATCH = 1_000
+
+SIZE_QUERY = text(
+    """
+    SELECT name, SUM(pgsize) FROM dbstat
+    WHERE name != 'sqlite_schema'
+    GROUP BY name ORDER BY name
+    """,
+)
+
+# Distinct portfolios and stocks referenced by the synthetic transactions
+PORTFOLIOS = 10
+STOCKS = 1_000
+
+
+def random_uuid() -> str:
+    """Generate a random uuid4 ID, the previous strategy."""
+    return str(uuid.uuid4())
+
+
+# Strategy name -> (column type, ID generator)
+STRATEGIES: dict[str, tuple[Callable[[], TypeEngine[Any]], Callable[[], str]]] = {
+    "uuid4_text": (String, random_uuid),
+    "uuid7_text": (String, uuid7),
+    "uuid7_binary": (BinaryId, uuid7),
+}
+
+
+def strategy_table(strategy: str) -> Table:
+    """Define the transactions-shaped table of a strategy."""
+    id_type, _ = STRATEGIES[strategy]
+    return Table(
+        "transactions",
+        MetaData(),
+        Column("id", id_type(), primary_key=True),
+        Column("portfolio_id", id_type(), nullable=False),
+        Column("stock_id", id_type(), nullable=False),
+        Index("idx_transactions_portfolio", "portfolio_id"),
+        Index("idx_transactions_stock", "stock_id"),
+    )
+
+
+def transaction_rows(strategy: str, count: int) -> Iterator[dict[str, str]]:
+    """Generate ``count`` rows with fresh IDs of a strategy."""
+    _, generate = STRATEGIES[strategy]
+    portfolio_ids = [generate() for _ in range(PORTFOLIOS)]
+    stock_ids = [generate() for _ in range(STOCKS)]
+    for index in range(count):
+        yield {
+            "id": generate(),
+            "portfolio_id": portfolio_ids[index % PORTFOLIOS],
+            "stock_id": stock_ids[index % STOCKS],
+        }
+
+
+def insert_rows(connection: Connection, table: Table, rows: Iterator[Any]) -> None:
+    """Insert rows in chunks with one executemany per chunk."""
+    while chunk := list(islice(rows, SEED_CHUNK_SIZE)):
+        _ = connection.execute(insert(table), chunk)
+
+
+@cache
+def seeded_engine(strategy: str, rows: int) -> Engine:
+    """Get an in-memory database holding ``rows`` transactions of a strategy."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    table = strategy_table(strategy)
+    table.create(engine)
+    with engine.begin() as connection:
+        insert_rows(connection, table, transaction_rows(strategy, rows))
+    return engine
+
+
+def index_bytes(connection: Connection) -> dict[str, int]:
+    """Get the bytes used by the table and each index, from SQLite's dbstat."""
+    rows = connection.execute(SIZE_QUERY)
+    return dict(rows.tuples().all())
+
+
+def _insert_batch(strategy: str, rows: int) -> Iterator[Callable[[], object]]:
+    """Time inserting a batch of new transactions into a seeded table."""
+    table = strategy_table(strategy)
+    with seeded_engine(strategy, rows).connect() as connection:
+        transaction = connection.begin()
+        try:
+
+            def insert_batch() -> None:
+                """Insert one batch of transactions with new IDs."""
+                insert_rows(
+                    connection,
+                    table,
+                    transaction_rows(strategy, INSERT_BATCH),
+                )
+
+            yield insert_batch
+        finally:
+            # Keep the shared seeded database at its size for later runs
+            transaction.rollback()
+
+
+@benchmark("identifiers", sizes=ROW_COUNTS)
+def insert_uuid4_text(rows: int) -> Iterator[Callable[[], object]]:
+    """Insert transactions keyed by random uuid4 text."""
+    yield from _insert_batch("uuid4_text", rows)
+
+
+@benchmark("identifiers", sizes=ROW_COUNTS)
+def insert_uuid7_text(rows: int) -> Iterator[Callable[[], object]]:
+    """Insert transactions keyed by time-ordered UUIDv7 text."""
+    yield from _insert_batch("uuid7_text", rows)
+
+
+@benchmark("identifiers", sizes=ROW_COUNTS)
+def insert_uuid7_binary(rows: int) -> Iterator[Callable[[], object]]:
+    """Insert transactions keyed by UUIDv7 stored as 16 bytes."""
+    yield from _insert_batch("uuid7_binary", rows)
+
+
+def main(argv: Sequence[str] | None = None, out: TextIO = sys.stdout) -> None:
+    """Report the table and index sizes of every strategy.
+
+    Args:
+        argv: Arguments without the program name; defaults to sys.argv
+        out: Stream for the report
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_identifiers")
+    _ = parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args(argv)
+    for strategy in STRATEGIES:
+        with seeded_engine(strategy, args.rows).connect() as connection:
+            sizes = index_bytes(connection)
+        _ = out.write(f"{strategy} ({args.rows:,} rows)\n")
+        for name, size in sizes.items():
+            _ = out.write(f"  {name:40} {size / 1_048_576:10.3f} MiB\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Benchmarks for the SQLAlchemy stock repository at growing table sizes."""
+
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+# pyright: reportArgumentType=false, reportPrivateUsage=false
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import cache
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+
+from benchmarks.data import build_stock, create_memory_engine, seed_stocks
+from benchmarks.harness import benchmark
+from src.domain.value_objects import StockSymbol
+from src.infrastructure.persistence.database_connection import SqlAlchemyConnection
+from src.infrastructure.persistence.tables.stock_table import stock_table
+from src.infrastructure.repositories.sqlalchemy_stock_repository import (
+    SqlAlchemyStockRepository,
+)
+
+ROW_COUNTS = (1_000, 100_000, 1_000_000)
+
+HYDRATION_BATCH = 1_000
+
+# Stocks looked up at once, about the size of a large portfolio
+LOOKUP_BATCH = 100
+
+
+@cache
+def seeded_engine(rows: int) -> Engine:
+    """Get an in-memory database holding ``rows`` stocks, shared per size."""
+    engine = create_memory_engine()
+    with engine.begin() as connection:
+        seed_stocks(connection, rows)
+    return engine
+
+
+def lookup_ids(rows: int) -> list[str]:
+    """Get up to LOOKUP_BATCH stock IDs spread evenly over the table."""
+    step = max(1, rows // LOOKUP_BATCH)
+    return [f"stock-{index}" for index in range(0, rows, step)]
+
+
+@contextmanager
+def stock_repository(rows: int) -> Iterator[SqlAlchemyStockRepository]:
+    """Open a repository in a transaction that is rolled back afterwards.
+
+    Rolling back keeps the shared seeded database unchanged for the next
+    benchmark.
+    """
+    with seeded_engine(rows).connect() as connection:
+        transaction = connection.begin()
+        try:
+            yield SqlAlchemyStockRepository(SqlAlchemyConnection(connection))
+        finally:
+            transaction.rollback()
+
+
+@benchmark("repository", sizes=ROW_COUNTS)
+def stock_get_by_id(rows: int) -> Iterator[Callable[[], object]]:
+    """Look up a stock by primary key."""
+    with stock_repository(rows) as repository:
+        stock_id = f"stock-{rows // 2}"
+        yield lambda: repository.get_by_id(stock_id)
+
+
+@benchmark("repository", sizes=ROW_COUNTS)
+def stock_get_by_symbol(rows: int) -> Iterator[Callable[[], object]]:
+    """Look up a stock by its unique symbol."""
+    with stock_repository(rows) as repository:
+        symbol = build_stock(rows // 2).symbol
+        yield lambda: repository.get_by_symbol(symbol)
+
+
+@benchmark("repository", sizes=ROW_COUNTS)
+def stock_get_by_id_loop(rows: int) -> Iterator[Callable[[], object]]:
+    """Look up a batch of stocks one query at a time, the N+1 pattern."""
+    with stock_repository(rows) as repository:
+        stock_ids = lookup_ids(rows)
+        yield lambda: [repository.get_by_id(stock_id) for stock_id in stock_ids]
+
+
+@benchmark("repository", sizes=ROW_COUNTS)
+def stock_get_many_by_ids(rows: int) -> Iterator[Callable[[], object]]:
+    """Look up the same batch of stocks with one IN query."""
+    with stock_repository(rows) as repository:
+        stock_ids = lookup_ids(rows)
+        yield lambda: repository.get_many_by_ids(stock_ids)
+
+
+@benchmark("repository", sizes=ROW_COUNTS)
+def stock_exists_by_symbol(rows: int) -> Iterator[Callable[[], object]]:
+    """Check whether a symbol is taken."""
+    with stock_repository(rows) as repository:
+        symbol = StockSymbol("ZZZZZ")
+        yield lambda: repository.exists_by_symbol(symbol)
+
+
+@benchmark("repository", sizes=ROW_COUNTS)
+def stock_create_and_delete(rows: int) -> Iterator[Callable[[], object]]:
+    """Insert a stock and delete it again, keeping the table size stable."""
+    with stock_repository(rows) as repository:
+        stock = build_stock(rows)
+
+        def create_and_delete() -> bool:
+            """Run one insert and one delete."""
+            return repository.delete(repository.create(stock))
+
+        yield create_and_delete
+
+
+@benchmark("repository", sizes=ROW_COUNTS)
+def stock_update(rows: int) -> Iterator[Callable[[], object]]:
+    """Rewrite every column of an existing stock."""
+    with stock_repository(rows) as repository:
+        stock = build_stock(rows // 2)
+        yield lambda: repository.update(stock.id, stock)
+
+
+@benchmark("repository", sizes=ROW_COUNTS)
+def stock_search_by_symbol(rows: int) -> Iterator[Callable[[], object]]:
+    """Search with a partial symbol filter."""
+    with stock_repository(rows) as repository:
+        yield lambda: repository.search_stocks(symbol_filter="ABC")
+
+
+@benchmark("repository", sizes=ROW_COUNTS)
+def stock_get_all(rows: int) -> Iterator[Callable[[], object]]:
+    """Load and hydrate the whole table."""
+    with stock_repository(rows) as repository:
+        yield repository.get_all
+
+
+@benchmark("repository", sizes=(HYDRATION_BATCH,))
+def stock_row_hydration(rows: int) -> Iterator[Callable[[], object]]:
+    """Turn already-fetched rows into Stock entities, without SQL."""
+    with seeded_engine(rows).connect() as connection:
+        fetched: list[dict[str, Any]] = [
+            row._asdict() for row in connection.execute(select(*stock_table.c))
+        ]
+    with stock_repository(rows) as repository:
+        # Hydration is private to the repository; time it in isolation
+        hydrate = repository._row_to_entity  # noqa: SLF001
+        yield lambda: [hydrate(row) for row in fetched]
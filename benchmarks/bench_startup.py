@@ -0,0 +1,70 @@
+"""Benchmarks for application startup against an existing database.
+
+Containers restart against a database whose schema is already in place, so
+these time the work ``lifespan`` does before the app is ready: initializing
+the schema and configuring dependency injection.
+"""
+
+import tempfile
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from benchmarks.harness import benchmark
+from dependency_injection.composition_root import CompositionRoot
+from src.infrastructure.persistence.database_factory import create_engine
+from src.infrastructure.persistence.database_initializer import initialize_database
+from src.infrastructure.persistence.tables import metadata
+
+
+@contextmanager
+def existing_database() -> Iterator[str]:
+    """Create a temporary database file with the current schema.
+
+    Yields:
+        URL of the database
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = f"sqlite:///{Path(directory) / 'startup.db'}"
+        initialize_database(database_url)
+        yield database_url
+
+
+@benchmark("startup")
+def create_all_existing_schema(_size: int) -> Iterator[Callable[[], object]]:
+    """Verify every table with ``create_all``, as startup did before."""
+    with existing_database() as database_url:
+        engine = create_engine(database_url)
+        try:
+            yield lambda: metadata.create_all(engine)
+        finally:
+            engine.dispose()
+
+
+@benchmark("startup")
+def initialize_current_schema(_size: int) -> Iterator[Callable[[], object]]:
+    """Initialize a database whose schema fingerprint matches."""
+    with existing_database() as database_url:
+        engine = create_engine(database_url)
+        try:
+            yield lambda: initialize_database(database_url, engine=engine)
+        finally:
+            engine.dispose()
+
+
+@benchmark("startup")
+def start_application(_size: int) -> Iterator[Callable[[], object]]:
+    """Initialize the database and configure DI on one new engine."""
+    with existing_database() as database_url:
+
+        def start() -> None:
+            """Run the startup steps of ``lifespan`` and release the engine."""
+            engine = create_engine(database_url)
+            initialize_database(database_url, engine=engine)
+            _ = CompositionRoot.configure(
+                database_url=database_url,
+                config={"engine": engine},
+            )
+            engine.dispose()
+
+        yield start
@@ -0,0 +1,261 @@
+"""Benchmark registration, timing and result comparison.
+
+Benchmarks are generator functions registered with ``@benchmark``. The code
+before ``yield`` is setup, the yielded callable is what gets timed and the
+code after ``yield`` is teardown::
+
+    @benchmark("domain", sizes=(1_000, 100_000))
+    def money_sum(size: int) -> Iterator[Callable[[], object]]:
+        amounts = [Money(index) for index in range(size)]
+        yield lambda: sum(amounts, Money.zero())
+
+Each size runs as a separate benchmark named ``group.name[size]``. Timing
+follows timeit: the callable is repeated until a round takes at least
+``min_time`` seconds, and statistics are reported per call.
+"""
+
+import json
+import platform
+import statistics
+import time
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+RESULTS_FORMAT_VERSION = 1
+
+BenchmarkSetup = Callable[[int], Iterator[Callable[[], object]]]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A registered benchmark and the sizes it runs at."""
+
+    group: str
+    name: str
+    setup: BenchmarkSetup
+    sizes: tuple[int, ...]
+
+    def qualified_name(self, size: int) -> str:
+        """Get the unique name of one size, e.g. ``repository.get_by_id[1000]``."""
+        return f"{self.group}.{self.name}[{size}]"
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Per-call timing statistics of one benchmark at one size, in seconds."""
+
+    name: str
+    group: str
+    size: int
+    rounds: int
+    calls_per_round: int
+    min: float
+    median: float
+    mean: float
+    stddev: float
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Change in median time of one benchmark between two runs."""
+
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Get the relative change, e.g. 0.25 for 25% slower."""
+        return self.current / self.baseline - 1 if self.baseline else 0.0
+
+
+@dataclass
+class ComparisonReport:
+    """Outcome of comparing two benchmark runs."""
+
+    threshold: float
+    comparisons: list[Comparison] = field(default_factory=list[Comparison])
+    missing: list[str] = field(default_factory=list[str])
+    added: list[str] = field(default_factory=list[str])
+
+    @property
+    def regressions(self) -> list[Comparison]:
+        """Get the benchmarks that slowed down by more than the threshold."""
+        return [item for item in self.comparisons if item.change > self.threshold]
+
+    @property
+    def improvements(self) -> list[Comparison]:
+        """Get the benchmarks that sped up by more than the threshold."""
+        return [item for item in self.comparisons if item.change < -self.threshold]
+
+
+_registry: list[Benchmark] = []
+
+
+def benchmark(
+    group: str,
+    *,
+    sizes: Sequence[int] = (1,),
+) -> Callable[[BenchmarkSetup], BenchmarkSetup]:
+    """Register a benchmark.
+
+    Args:
+        group: Area the benchmark belongs to, e.g. "repository"
+        sizes: Data sizes to run at, passed to the benchmark function
+
+    Returns:
+        Decorator that registers the function and returns it unchanged
+    """
+
+    def register(setup: BenchmarkSetup) -> BenchmarkSetup:
+        """Add the function to the registry."""
+        _registry.append(Benchmark(group, setup.__name__, setup, tuple(sizes)))
+        return setup
+
+    return register
+
+
+def registered_benchmarks() -> list[Benchmark]:
+    """Get all benchmarks registered so far, in registration order."""
+    return list(_registry)
+
+
+def measure(
+    target: Callable[[], object],
+    *,
+    rounds: int = 5,
+    min_time: float = 0.05,
+) -> tuple[int, list[float]]:
+    """Time a callable.
+
+    Args:
+        target: Callable to time
+        rounds: Number of timed rounds
+        min_time: Minimum duration of a round in seconds
+
+    Returns:
+        Calls per round and the per-call duration of each round
+    """
+    # Calibrate like timeit.autorange; the first call also warms caches
+    calls = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(calls):
+            _ = target()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+        calls *= 10 if elapsed < min_time / 10 else 2
+
+    timings: list[float] = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(calls):
+            _ = target()
+        timings.append((time.perf_counter() - started) / calls)
+    return calls, timings
+
+
+def run_benchmark(
+    bench: Benchmark,
+    size: int,
+    *,
+    rounds: int = 5,
+    min_time: float = 0.05,
+) -> BenchmarkResult:
+    """Set up, time and tear down one benchmark at one size.
+
+    Args:
+        bench: Benchmark to run
+        size: Data size passed to the benchmark function
+        rounds: Number of timed rounds
+        min_time: Minimum duration of a round in seconds
+
+    Returns:
+        Timing statistics
+    """
+    steps = bench.setup(size)
+    target = next(steps)
+    try:
+        calls, timings = measure(target, rounds=rounds, min_time=min_time)
+    finally:
+        # Resume the benchmark function past its yield to run the teardown
+        _ = next(steps, None)
+    return BenchmarkResult(
+        name=bench.qualified_name(size),
+        group=bench.group,
+        size=size,
+        rounds=rounds,
+        calls_per_round=calls,
+        min=min(timings),
+        median=statistics.median(timings),
+        mean=statistics.fmean(timings),
+        stddev=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    )
+
+
+def save_results(results: Sequence[BenchmarkResult], path: Path) -> None:
+    """Write results and machine details as JSON.
+
+    Args:
+        results: Results to store
+        path: Output file; parent directories are created
+    """
+    document: dict[str, Any] = {
+        "version": RESULTS_FORMAT_VERSION,
+        "created_at": datetime.now(UTC).isoformat(),
+        "machine": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "benchmarks": [asdict(result) for result in results],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _ = path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+
+def load_results(path: Path) -> list[BenchmarkResult]:
+    """Read results written by save_results.
+
+    Raises:
+        ValueError: If the file is not in a supported format
+    """
+    document = json.loads(path.read_text(encoding="utf-8"))
+    if document.get("version") != RESULTS_FORMAT_VERSION:
+        msg = f"Unsupported benchmark results format in {path}"
+        raise ValueError(msg)
+    return [BenchmarkResult(**item) for item in document["benchmarks"]]
+
+
+def compare_results(
+    baseline: Sequence[BenchmarkResult],
+    current: Sequence[BenchmarkResult],
+    threshold: float,
+) -> ComparisonReport:
+    """Compare median times of two runs.
+
+    Args:
+        baseline: Results of the reference run
+        current: Results of the run under test
+        threshold: Relative slowdown that counts as a regression, e.g. 0.1
+
+    Returns:
+        Per-benchmark changes plus benchmarks present in only one run
+    """
+    before = {result.name: result for result in baseline}
+    after = {result.name: result for result in current}
+    report = ComparisonReport(threshold)
+    for name, result in after.items():
+        if name in before:
+            report.comparisons.append(
+                Comparison(name, before[name].median, result.median),
+            )
+        else:
+            report.added.append(name)
+    report.missing = [name for name in before if name not in after]
+    return report
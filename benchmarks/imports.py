@@ -0,0 +1,145 @@
+"""Import-time profiling of the application's entry points.
+
+Each entry point is imported in a fresh interpreter under
+``python -X importtime``, so the report shows the real cold-start cost of
+importing it. Entry points used by CLI tools and workers must not load the
+web or database stack; ``check_profiles`` reports any that do, so a stray
+eager import fails the check instead of silently slowing every start::
+
+    python -m benchmarks imports --check
+"""
+
+import re
+import subprocess
+import sys
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+WEB_STACK = frozenset({"fastapi", "starlette", "pydantic", "dependency_injector"})
+DATABASE_STACK = frozenset({"sqlalchemy"})
+
+# Entry point -> top-level packages it must not import
+ENTRY_POINTS: Mapping[str, frozenset[str]] = {
+    "src.domain": WEB_STACK | DATABASE_STACK,
+    "src.application": WEB_STACK | DATABASE_STACK,
+    "src.application.services.transaction_import_service": WEB_STACK | DATABASE_STACK,
+    "dependency_injection": WEB_STACK | DATABASE_STACK,
+    "src.infrastructure.config": WEB_STACK | DATABASE_STACK,
+    "src.infrastructure.importers": WEB_STACK | DATABASE_STACK,
+    "src.infrastructure.persistence.tables": WEB_STACK,
+    "dependency_injection.composition_root": frozenset(),
+    "src.presentation.web.main": frozenset(),
+}
+
+# One line of -X importtime output: self and cumulative microseconds, module
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+@dataclass(frozen=True)
+class ImportProfile:
+    """Modules imported by one entry point and the time they took."""
+
+    entry_point: str
+    # Microseconds spent importing the entry point and its parent packages
+    total_us: int
+    # Module -> cumulative microseconds, for every imported module
+    modules: Mapping[str, int]
+
+    @property
+    def packages(self) -> frozenset[str]:
+        """Top-level packages imported along the way."""
+        return frozenset(name.partition(".")[0] for name in self.modules)
+
+    def slowest(self, count: int) -> list[tuple[str, int]]:
+        """Get the modules with the highest cumulative import time.
+
+        Args:
+            count: Number of modules to return
+
+        Returns:
+            (module, cumulative microseconds) pairs, slowest first
+        """
+        ranked = sorted(self.modules.items(), key=_by_time, reverse=True)
+        return [item for item in ranked if item[0] != self.entry_point][:count]
+
+
+def _by_time(item: tuple[str, int]) -> int:
+    """Sort key of a (module, microseconds) pair."""
+    return item[1]
+
+
+def parse_importtime(entry_point: str, output: str) -> ImportProfile:
+    """Parse the ``-X importtime`` report of importing an entry point.
+
+    Modules are listed after the modules they import. Everything up to
+    ``site`` is interpreter startup, which every process pays anyway, and is
+    left out; the remaining top-level lines are the entry point and its
+    parent packages.
+
+    Args:
+        entry_point: Module that was imported
+        output: Standard error of the interpreter
+
+    Returns:
+        Profile of the imported modules
+    """
+    modules: dict[str, int] = {}
+    total = 0
+    started = False
+    for line in output.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match is None:
+            continue
+        indent, module = match.group(3), match.group(4)
+        cumulative = int(match.group(2))
+        if not started:
+            started = module == "site" and not indent
+            continue
+        _ = modules.setdefault(module, cumulative)
+        if not indent:
+            total += cumulative
+    return ImportProfile(entry_point, total, modules)
+
+
+def profile_import(entry_point: str) -> ImportProfile:
+    """Import an entry point in a fresh interpreter and profile it.
+
+    Args:
+        entry_point: Module to import
+
+    Returns:
+        Profile of the imported modules
+
+    Raises:
+        CalledProcessError: If the import fails
+    """
+    completed = subprocess.run(  # noqa: S603 - runs this interpreter only
+        [sys.executable, "-X", "importtime", "-c", f"import {entry_point}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(entry_point, completed.stderr)
+
+
+def check_profiles(
+    profiles: Iterable[ImportProfile],
+    forbidden: Mapping[str, frozenset[str]] = ENTRY_POINTS,
+) -> list[str]:
+    """Find entry points that import packages they must not.
+
+    Args:
+        profiles: Profiles of the entry points
+        forbidden: Entry point -> packages it must not import
+
+    Returns:
+        One message per offending entry point; empty when all pass
+    """
+    problems: list[str] = []
+    for profile in profiles:
+        loaded = profile.packages & forbidden.get(profile.entry_point, frozenset())
+        if loaded:
+            problems.append(
+                f"{profile.entry_point} imports {', '.join(sorted(loaded))}",
+            )
+    return problems
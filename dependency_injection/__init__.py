@@ -2,18 +2,42 @@
 
 Provides dependency injection container and composition root for clean
 architecture dependency management.
+
+Exports are imported on first use: the composition root imports every
+infrastructure module and the container imports dependency-injector, so
+code that only needs the exceptions or lifetimes does not pay for them.
 """
 
-from .composition_root import CompositionRoot
-from .di_container import DIContainer, RegistrationInfo
-from .exceptions import (
-    CircularDependencyError,
-    DependencyInjectionError,
-    DependencyResolutionError,
-    DuplicateRegistrationError,
-    InvalidRegistrationError,
+from typing import TYPE_CHECKING
+
+from src.shared.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .composition_root import CompositionRoot
+    from .di_container import DIContainer, RegistrationInfo
+    from .exceptions import (
+        CircularDependencyError,
+        DependencyInjectionError,
+        DependencyResolutionError,
+        DuplicateRegistrationError,
+        InvalidRegistrationError,
+    )
+    from .lifetimes import Lifetime
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "CircularDependencyError": ".exceptions",
+        "CompositionRoot": ".composition_root",
+        "DIContainer": ".di_container",
+        "DependencyInjectionError": ".exceptions",
+        "DependencyResolutionError": ".exceptions",
+        "DuplicateRegistrationError": ".exceptions",
+        "InvalidRegistrationError": ".exceptions",
+        "Lifetime": ".lifetimes",
+        "RegistrationInfo": ".di_container",
+    },
 )
-from .lifetimes import Lifetime
 
 __all__ = [
     "CircularDependencyError",
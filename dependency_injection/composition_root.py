@@ -10,12 +10,37 @@ from typing import Any
 from sqlalchemy.engine import Engine
 
 # Application layer imports
+from src.application.events import (
+    EventBus,
+    EventSerializer,
+    LiveUpdateHub,
+    OutboxDispatcher,
+    OutboxEventPublisher,
+    subscribe_stock_changes,
+)
+from src.application.interfaces.event_dispatcher import IEventDispatcher
+from src.application.interfaces.holdings_query import IHoldingsQuery
+from src.application.interfaces.stock_query import IStockQuery
 from src.application.interfaces.stock_service import IStockApplicationService
+from src.application.services.portfolio_metrics_service import (
+    PortfolioMetricsService,
+)
 from src.application.services.stock_application_service import StockApplicationService
+from src.application.services.transaction_import_service import (
+    TransactionImportService,
+)
 from src.domain.repositories.interfaces import IStockBookUnitOfWork
 from src.infrastructure.config import database_config
 from src.infrastructure.persistence.database_factory import create_engine
+from src.infrastructure.persistence.group_commit import (
+    GroupCommitConfig,
+    GroupCommitter,
+)
+from src.infrastructure.persistence.query_budget import QueryBudget
 from src.infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from src.infrastructure.queries import SqlAlchemyHoldingsQuery, SqlAlchemyStockQuery
+from src.shared.caching import SingleFlight, TableVersions
+from src.shared.instrumentation import metrics
 
 from .di_container import DIContainer
 
@@ -46,7 +71,9 @@ class CompositionRoot:
 
         Args:
             database_url: Database URL (defaults to Config.database_url)
-            config: Optional configuration overrides
+            config: Optional configuration overrides; an ``engine`` entry
+                reuses an engine already created for the database URL,
+                e.g. the one the database was initialized with
             extra_registrations: Optional function to register additional services
 
         Returns:
@@ -61,7 +88,15 @@ class CompositionRoot:
         db_url = config.get("database_url", database_url)
 
         # Configure infrastructure layer (database, repositories)
-        cls._configure_infrastructure_layer(container, db_url)
+        cls._configure_infrastructure_layer(
+            container,
+            config.get("engine") or create_engine(db_url),
+            group_commit=config.get(
+                "group_commit",
+                database_config.group_commit_enabled,
+            ),
+            query_budget=config.get("query_budget", cls._default_query_budget()),
+        )
 
         # Configure application layer (business logic)
         cls._configure_application_layer(container)
@@ -78,32 +113,123 @@ class CompositionRoot:
     def _configure_infrastructure_layer(
         cls,
         container: DIContainer,
-        db_url: str,
+        engine: Engine,
+        *,
+        group_commit: bool = False,
+        query_budget: QueryBudget | None = None,
     ) -> None:
         """Configure infrastructure layer dependencies.
 
         Args:
             container: DI container to configure
-            db_url: Database URL
+            engine: Database engine shared by every unit of work
+            group_commit: Batch concurrent commits on one writer connection
+            query_budget: Statement limits checked for every unit of work
         """
         # Database engine - singleton
-        engine = create_engine(db_url)
         container.register_instance(Engine, engine)
 
-        # Unit of Work - transient for transaction isolation
+        # Group commit - one shared writer for every unit of work
+        group_committer: GroupCommitter | None = None
+        if group_commit:
+            group_committer = GroupCommitter(
+                engine,
+                GroupCommitConfig(
+                    max_batch=database_config.group_commit_max_batch,
+                    max_delay=database_config.group_commit_max_delay,
+                ),
+            )
+            container.register_instance(GroupCommitter, group_committer)
+
+        # Domain events - one bus and one background dispatcher per app
+        bus = EventBus()
+        serializer = EventSerializer()
+        dispatcher = OutboxDispatcher(
+            lambda: SqlAlchemyUnitOfWork(engine, group_committer=group_committer),
+            bus,
+            serializer,
+        )
+        container.register_instance(EventBus, bus)
+        container.register_instance(EventSerializer, serializer)
+        container.register_instance(IEventDispatcher, dispatcher)
+
+        # Live updates - stock changes are published once to every stream
+        hub = LiveUpdateHub()
+        subscribe_stock_changes(bus, hub)
+        container.register_instance(LiveUpdateHub, hub)
+
+        # Read models - stateless, each query opens its own connection
+        container.register_instance(IHoldingsQuery, SqlAlchemyHoldingsQuery(engine))
+        container.register_instance(IStockQuery, SqlAlchemyStockQuery(engine))
+
+        # Unit of Work - transient for transaction isolation; committed
+        # events wake the dispatcher
         container.register_factory(
             IStockBookUnitOfWork,
-            lambda: SqlAlchemyUnitOfWork(container.resolve(Engine)),
+            lambda: SqlAlchemyUnitOfWork(
+                container.resolve(Engine),
+                on_outbox_commit=dispatcher.notify,
+                group_committer=group_committer,
+                query_budget=query_budget,
+            ),
+        )
+
+    @staticmethod
+    def _default_query_budget() -> QueryBudget | None:
+        """Build the query budget from database configuration.
+
+        Returns:
+            Budget, or None when neither limit is configured
+        """
+        max_queries = database_config.query_budget_max_queries
+        max_repeats = database_config.query_budget_max_repeats
+        if max_queries <= 0 and max_repeats <= 0:
+            return None
+        return QueryBudget(
+            max_queries=max_queries if max_queries > 0 else None,
+            max_repeats=max_repeats if max_repeats > 0 else None,
+            raise_on_exceeded=database_config.query_budget_raise,
         )
 
     @classmethod
     def _configure_application_layer(cls, container: DIContainer) -> None:
         """Configure application layer dependencies."""
-        # Application services - transient to avoid state issues
-        # Register the interface with its implementation
+        # Table versions - singleton advanced by writers, so coalesced reads
+        # and cached responses never outlive a committed write
+        table_versions = TableVersions()
+        container.register_instance(TableVersions, table_versions)
+
+        # Application services - transient to avoid state issues; they share
+        # the stocks table version
         container.register_factory(
             IStockApplicationService,
-            lambda: StockApplicationService(container.resolve(IStockBookUnitOfWork)),
+            lambda: StockApplicationService(
+                container.resolve(IStockBookUnitOfWork),
+                OutboxEventPublisher(container.resolve(EventSerializer)),
+                table_versions["stocks"],
+            ),
+        )
+
+        # Read coalescing - singleton so identical concurrent reads share one
+        # computation
+        read_flight = SingleFlight()
+        container.register_instance(SingleFlight, read_flight)
+        metrics.register_cache("read_singleflight", read_flight.cache_info)
+
+        # Metrics cache - singleton so every request shares cached results
+        # and the input versions that invalidate them
+        metrics_service = PortfolioMetricsService(container.resolve(IHoldingsQuery))
+        container.register_instance(PortfolioMetricsService, metrics_service)
+        metrics.register_cache("portfolio_metrics", metrics_service.cache.cache_info)
+
+        # Transaction import - transient; each chunk uses the unit of work,
+        # and chunks creating stocks advance the shared table version
+        container.register_factory(
+            TransactionImportService,
+            lambda: TransactionImportService(
+                container.resolve(IStockBookUnitOfWork),
+                table_versions=table_versions,
+            ),
         )
 
     # Presentation layer configuration method removed - will be rebuilt later
@@ -21,6 +21,7 @@ class UpdateStockInputs:
     industry_group: str | None = None
     grade: str | None = None
     notes: str | None = None
+    expected_version: int | None = None
 
 
 class UpdateStockCommand:
@@ -38,6 +39,7 @@ class UpdateStockCommand:
     _industry_group: str | None
     _grade: str | None
     _notes: str | None
+    _expected_version: int | None
 
     def __init__(self, inputs: UpdateStockInputs) -> None:
         """Initialize UpdateStockCommand with validation.
@@ -89,6 +91,11 @@ class UpdateStockCommand:
         """Get the notes."""
         return self._notes
 
+    @property
+    def expected_version(self) -> int | None:
+        """Get the stock version the update was based on, if given."""
+        return self._expected_version
+
     def has_updates(self) -> bool:
         """Check if any fields are being updated.
 
@@ -142,6 +149,7 @@ class UpdateStockCommand:
             and self.industry_group == other.industry_group
             and self.grade == other.grade
             and self.notes == other.notes
+            and self.expected_version == other.expected_version
         )
 
     def __hash__(self) -> int:
@@ -155,6 +163,7 @@ class UpdateStockCommand:
                 self.industry_group,
                 self.grade,
                 self.notes,
+                self.expected_version,
             ),
         )
 
@@ -169,7 +178,7 @@ class UpdateStockCommand:
             f"UpdateStockCommand(stock_id={self.stock_id!r}, symbol={self.symbol!r}, "
             f"name={self.name!r}, sector={self.sector!r}, "
             f"industry_group={self.industry_group!r}, grade={self.grade!r}, "
-            f"notes={self.notes!r})"
+            f"notes={self.notes!r}, expected_version={self.expected_version!r})"
         )
 
     def _validate_and_normalize_inputs(
@@ -206,6 +215,7 @@ class UpdateStockCommand:
 
         # Validate grade
         self._validate_grade(inputs.grade)
+        self._validate_expected_version(inputs.expected_version)
 
         return {
             "stock_id": inputs.stock_id,
@@ -215,6 +225,7 @@ class UpdateStockCommand:
             "industry_group": industry_group,
             "grade": inputs.grade,
             "notes": notes,
+            "expected_version": inputs.expected_version,
         }
 
     def _set_attributes(self, normalized_inputs: dict[str, Any]) -> None:
@@ -226,6 +237,11 @@ class UpdateStockCommand:
         object.__setattr__(self, "_industry_group", normalized_inputs["industry_group"])
         object.__setattr__(self, "_grade", normalized_inputs["grade"])
         object.__setattr__(self, "_notes", normalized_inputs["notes"])
+        object.__setattr__(
+            self,
+            "_expected_version",
+            normalized_inputs["expected_version"],
+        )
 
     @staticmethod
     def _validate_stock_id(stock_id: str) -> None:
@@ -295,3 +311,10 @@ class UpdateStockCommand:
             if grade not in valid_grades:
                 msg = f"Invalid grade. Must be one of {valid_grades} or None"
                 raise ValueError(msg)
+
+    @staticmethod
+    def _validate_expected_version(expected_version: int | None) -> None:
+        """Validate the expected stock version."""
+        if expected_version is not None and expected_version < 1:
+            msg = "Expected version must be at least 1"
+            raise ValueError(msg)
@@ -25,6 +25,7 @@ class StockDto:
     industry_group: str | None = None
     grade: str | None = None
     notes: str = ""
+    version: int = 1
 
     def __post_init__(self) -> None:
         """Validate DTO data after initialization."""
@@ -60,4 +61,5 @@ class StockDto:
             ),
             grade=entity.grade.value if entity.grade else None,
             notes=entity.notes.value,
+            version=entity.version,
         )
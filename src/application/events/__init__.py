@@ -0,0 +1,43 @@
+"""Domain event delivery for the application layer.
+
+Application services record events in the transactional outbox through
+OutboxEventPublisher; OutboxDispatcher delivers them to EventBus handlers
+in the background after the transaction commits. LiveUpdateHub fans changes
+out to streaming clients.
+"""
+
+from .dispatcher import DispatcherConfig, OutboxDispatcher
+from .event_bus import EventBus, EventHandler
+from .live_feeds import (
+    stock_change_update,
+    subscribe_stock_changes,
+    target_update,
+    valuation_update,
+)
+from .live_updates import (
+    LIVE_TOPICS,
+    RESYNC,
+    LiveSubscription,
+    LiveUpdate,
+    LiveUpdateHub,
+)
+from .publisher import OutboxEventPublisher
+from .serialization import EventSerializer
+
+__all__ = [
+    "LIVE_TOPICS",
+    "RESYNC",
+    "DispatcherConfig",
+    "EventBus",
+    "EventHandler",
+    "EventSerializer",
+    "LiveSubscription",
+    "LiveUpdate",
+    "LiveUpdateHub",
+    "OutboxDispatcher",
+    "OutboxEventPublisher",
+    "stock_change_update",
+    "subscribe_stock_changes",
+    "target_update",
+    "valuation_update",
+]
@@ -0,0 +1,322 @@
+"""Background delivery of outbox events.
+
+A relay task reads undispatched messages from the outbox in batches and
+feeds them into a bounded asyncio queue; consumer tasks take batches off
+the queue, deliver them through the EventBus and mark them dispatched.
+The bounded queue gives backpressure: when handlers fall behind, the relay
+blocks instead of reading more rows. Delivery is at-least-once, so
+handlers must be idempotent.
+
+A message whose handlers raised stays pending and is delivered again, to
+every handler, after an exponentially growing delay; after max_attempts
+deliveries it is logged and marked dispatched so it cannot block the
+outbox forever. Attempt counts are kept in memory, so a restart retries
+from the first attempt.
+
+Dispatched messages stay in the outbox for a retention period and are
+then deleted by a purge task, so the table does not grow without bound.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from src.application.events.event_bus import EventBus
+from src.application.events.serialization import EventSerializer
+from src.application.interfaces.event_dispatcher import IEventDispatcher
+from src.domain.repositories.interfaces import IStockBookUnitOfWork, OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DispatcherConfig:
+    """Tuning for the OutboxDispatcher."""
+
+    batch_size: int = 100  # Rows per outbox read and messages per delivery
+    queue_size: int = 1000  # Queued messages before the relay blocks
+    poll_interval: float = 1.0  # Seconds between sweeps when not notified
+    workers: int = 1  # Concurrent consumer tasks
+    shutdown_timeout: float = 5.0  # Seconds stop() waits for queued messages
+    max_attempts: int = 5  # Deliveries of a failing message before giving up
+    retry_delay: float = 1.0  # Seconds before the first retry, doubled after
+    retention: float = 86400.0  # Seconds dispatched messages are kept
+    purge_interval: float = 3600.0  # Seconds between purges of expired messages
+
+    def __post_init__(self) -> None:
+        """Validate the configuration.
+
+        Raises:
+            ValueError: If any setting is not positive
+        """
+        for name in ("batch_size", "queue_size", "workers", "max_attempts"):
+            if getattr(self, name) < 1:
+                msg = f"{name} must be at least 1"
+                raise ValueError(msg)
+        for name in ("poll_interval", "retry_delay", "retention", "purge_interval"):
+            if getattr(self, name) <= 0:
+                msg = f"{name} must be positive"
+                raise ValueError(msg)
+
+
+class OutboxDispatcher(IEventDispatcher):
+    """Delivers committed outbox events to EventBus handlers in the background."""
+
+    def __init__(
+        self,
+        unit_of_work_factory: Callable[[], IStockBookUnitOfWork],
+        bus: EventBus,
+        serializer: EventSerializer | None = None,
+        config: DispatcherConfig | None = None,
+    ) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            unit_of_work_factory: Creates a fresh unit of work per outbox access
+            bus: Event bus holding the handlers
+            serializer: Serializer that restores events from messages
+            config: Dispatcher tuning
+        """
+        self._unit_of_work_factory = unit_of_work_factory
+        self._bus = bus
+        self._serializer = serializer or EventSerializer()
+        self._config = config or DispatcherConfig()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[OutboxMessage] | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self._in_flight: set[str] = set()
+        # Failed deliveries per event ID and the loop time of the next attempt
+        self._retries: dict[str, tuple[int, float]] = {}
+        self._last_sequence = 0
+
+    @property
+    def running(self) -> bool:
+        """Check whether the relay and consumer tasks are running."""
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        """Start the relay and consumer tasks in the running event loop."""
+        if self._tasks:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self._config.queue_size)
+        self._wakeup = asyncio.Event()
+        # Pick up events left undelivered by a previous run
+        self._wakeup.set()
+        self._tasks = [
+            asyncio.create_task(self._relay(), name="outbox-relay"),
+            *(
+                asyncio.create_task(self._consume(), name=f"outbox-consumer-{index}")
+                for index in range(self._config.workers)
+            ),
+            asyncio.create_task(self._purge(), name="outbox-purge"),
+        ]
+
+    async def stop(self) -> None:
+        """Stop the tasks after queued messages are delivered or time runs out.
+
+        Messages still undelivered stay pending in the outbox and are
+        delivered after the next start().
+        """
+        tasks, self._tasks = self._tasks, []
+        if not tasks:
+            return
+        _ = tasks[0].cancel()  # Stop reading the outbox first
+        if self._queue is not None:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._queue.join(),
+                    timeout=self._config.shutdown_timeout,
+                )
+        for task in tasks:
+            _ = task.cancel()
+        _ = await asyncio.gather(*tasks, return_exceptions=True)
+        self._loop = None
+        self._queue = None
+        self._wakeup = None
+        self._in_flight.clear()
+        self._retries.clear()
+        self._last_sequence = 0
+
+    def notify(self) -> None:
+        """Wake the relay; safe to call from any thread."""
+        loop, wakeup = self._loop, self._wakeup
+        if loop is None or wakeup is None:
+            return
+        # The event loop may already be closed during shutdown
+        with contextlib.suppress(RuntimeError):
+            _ = loop.call_soon_threadsafe(wakeup.set)
+
+    async def flush(self) -> None:
+        """Queue every pending message and wait until all are delivered.
+
+        Messages waiting for a retry are left for the relay.
+
+        Raises:
+            RuntimeError: If the dispatcher is not running
+        """
+        queue = self._queue
+        if queue is None:
+            msg = "Dispatcher is not running"
+            raise RuntimeError(msg)
+        self._last_sequence = 0
+        while await self._enqueue_pending(queue):
+            pass
+        await queue.join()
+
+    async def _relay(self) -> None:
+        """Move pending outbox messages into the queue when woken or on a timer."""
+        loop, queue, wakeup = self._loop, self._queue, self._wakeup
+        if loop is None or queue is None or wakeup is None:  # pragma: no cover
+            return
+        last_sweep = loop.time()
+        while True:
+            with contextlib.suppress(TimeoutError):
+                _ = await asyncio.wait_for(
+                    wakeup.wait(),
+                    timeout=self._config.poll_interval,
+                )
+            wakeup.clear()
+            # Transactions can commit out of sequence order, so periodically
+            # rescan from the start for rows the cursor already passed
+            if loop.time() - last_sweep >= self._config.poll_interval:
+                self._last_sequence = 0
+                last_sweep = loop.time()
+            try:
+                while await self._enqueue_pending(queue):
+                    pass
+            except Exception:
+                logger.exception("Failed to read the event outbox")
+
+    async def _enqueue_pending(self, queue: asyncio.Queue[OutboxMessage]) -> bool:
+        """Queue one batch of pending messages.
+
+        Returns:
+            True if the batch was full and more messages may be pending
+        """
+        messages = await asyncio.to_thread(self._fetch_pending, self._last_sequence)
+        now = asyncio.get_running_loop().time()
+        for message in messages:
+            if message.sequence is not None:
+                self._last_sequence = max(self._last_sequence, message.sequence)
+            if message.event_id in self._in_flight:
+                continue
+            # Backing off; a later sweep picks the message up again
+            if self._retries.get(message.event_id, (0, now))[1] > now:
+                continue
+            self._in_flight.add(message.event_id)
+            # Blocks while the queue is full, throttling outbox reads
+            await queue.put(message)
+        return len(messages) == self._config.batch_size
+
+    async def _consume(self) -> None:
+        """Deliver queued messages in batches."""
+        queue = self._queue
+        if queue is None:  # pragma: no cover
+            return
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self._config.batch_size:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                await self._deliver(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _deliver(self, batch: list[OutboxMessage]) -> None:
+        """Publish a batch of messages and mark the handled ones dispatched."""
+        event_ids = [message.event_id for message in batch]
+        try:
+            dispatched: list[str] = []
+            for message in batch:
+                try:
+                    event = self._serializer.from_message(message)
+                except (KeyError, TypeError, ValueError):
+                    # Undecodable messages would fail forever; drop them
+                    logger.exception("Cannot restore outbox event %s", message.event_id)
+                    dispatched.append(message.event_id)
+                    continue
+                failures = await self._bus.publish(event)
+                if not failures or not self._schedule_retry(message.event_id):
+                    dispatched.append(message.event_id)
+            if dispatched:
+                _ = await asyncio.to_thread(self._mark_dispatched, dispatched)
+            for event_id in dispatched:
+                _ = self._retries.pop(event_id, None)
+        except Exception:
+            logger.exception("Failed to dispatch %d outbox events", len(batch))
+        finally:
+            self._in_flight.difference_update(event_ids)
+
+    async def _purge(self) -> None:
+        """Delete dispatched messages past the retention, then wait and repeat."""
+        while True:
+            try:
+                purged = await asyncio.to_thread(self._purge_dispatched)
+                if purged:
+                    logger.info("Purged %d dispatched outbox events", purged)
+            except Exception:
+                logger.exception("Failed to purge the event outbox")
+            await asyncio.sleep(self._config.purge_interval)
+
+    def _schedule_retry(self, event_id: str) -> bool:
+        """Record a failed delivery and schedule the next attempt.
+
+        Returns:
+            True if the message should stay pending, False once it has used
+            up its attempts
+        """
+        attempts = self._retries.get(event_id, (0, 0.0))[0] + 1
+        if attempts >= self._config.max_attempts:
+            logger.error(
+                "Giving up on outbox event %s after %d attempts",
+                event_id,
+                attempts,
+            )
+            return False
+        delay = self._config.retry_delay * 2 ** (attempts - 1)
+        retry_at = asyncio.get_running_loop().time() + delay
+        self._retries[event_id] = (attempts, retry_at)
+        logger.warning(
+            "Outbox event %s failed (attempt %d); retrying in %.1fs",
+            event_id,
+            attempts,
+            delay,
+        )
+        return True
+
+    def _fetch_pending(self, after_sequence: int) -> list[OutboxMessage]:
+        """Read one batch of pending messages in a fresh unit of work."""
+        unit_of_work = self._unit_of_work_factory()
+        with unit_of_work:
+            return unit_of_work.outbox.get_pending(
+                self._config.batch_size,
+                after_sequence,
+            )
+
+    def _mark_dispatched(self, event_ids: list[str]) -> int:
+        """Mark messages dispatched in a fresh unit of work."""
+        unit_of_work = self._unit_of_work_factory()
+        with unit_of_work:
+            count = unit_of_work.outbox.mark_dispatched(event_ids)
+            unit_of_work.commit()
+            return count
+
+    def _purge_dispatched(self) -> int:
+        """Delete messages dispatched before the retention in a fresh unit of work."""
+        dispatched_before = datetime.now(UTC) - timedelta(
+            seconds=self._config.retention,
+        )
+        unit_of_work = self._unit_of_work_factory()
+        with unit_of_work:
+            count = unit_of_work.outbox.purge_dispatched(dispatched_before)
+            unit_of_work.commit()
+            return count
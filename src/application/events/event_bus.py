@@ -0,0 +1,87 @@
+"""In-process event bus.
+
+Routes domain events to the handlers subscribed to their type. Handlers
+subscribed to a base class also receive events of its subclasses, so a
+DomainEvent subscriber sees every event. Plain functions run in a worker
+thread so blocking handlers do not stall the event loop; coroutine
+functions are awaited on the loop.
+"""
+
+import asyncio
+import inspect
+import logging
+from collections.abc import Awaitable, Callable
+
+from src.domain.events import DomainEvent
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[DomainEvent], Awaitable[None] | None]
+
+
+class EventBus:
+    """Registry of event handlers with async delivery."""
+
+    def __init__(self) -> None:
+        """Initialize an event bus with no subscribers."""
+        self._handlers: dict[type[DomainEvent], list[EventHandler]] = {}
+        self._resolved: dict[type[DomainEvent], tuple[EventHandler, ...]] = {}
+
+    def subscribe(
+        self,
+        event_type: type[DomainEvent],
+        handler: EventHandler,
+    ) -> None:
+        """Register a handler for an event type and its subclasses.
+
+        Args:
+            event_type: Event class to handle
+            handler: Function or coroutine function taking the event
+        """
+        self._handlers.setdefault(event_type, []).append(handler)
+        self._resolved.clear()
+
+    def handlers_for(self, event_type: type[DomainEvent]) -> tuple[EventHandler, ...]:
+        """Get the handlers for an event type, most specific type first.
+
+        Args:
+            event_type: Event class being delivered
+
+        Returns:
+            Handlers subscribed to the type or any of its base classes
+        """
+        handlers = self._resolved.get(event_type)
+        if handlers is None:
+            handlers = tuple(
+                handler
+                for base in event_type.__mro__
+                for handler in self._handlers.get(base, ())
+            )
+            self._resolved[event_type] = handlers
+        return handlers
+
+    async def publish(self, event: DomainEvent) -> int:
+        """Deliver an event to every matching handler.
+
+        Handlers run one after another in subscription order. A failing
+        handler is logged and does not stop delivery to the others.
+
+        Args:
+            event: Event to deliver
+
+        Returns:
+            Number of handlers that raised
+        """
+        failures = 0
+        for handler in self.handlers_for(type(event)):
+            try:
+                if inspect.iscoroutinefunction(handler):
+                    await handler(event)
+                else:
+                    result = await asyncio.to_thread(handler, event)
+                    if inspect.isawaitable(result):
+                        await result
+            except Exception:
+                failures += 1
+                logger.exception("Event handler failed for %s", event)
+        return failures
@@ -0,0 +1,88 @@
+"""Live updates built from domain events and calculations.
+
+Each function turns one domain result into the LiveUpdate published to
+every subscriber, so the update is computed once however many clients
+listen. Stock changes arrive through the EventBus; valuations and target
+triggers are published by whatever computes them, e.g. price ingestion.
+"""
+
+from src.application.events.event_bus import EventBus
+from src.application.events.live_updates import LiveUpdate, LiveUpdateHub
+from src.domain.events import DomainEvent, StockAddedEvent, StockUpdatedEvent
+from src.domain.services.target_evaluation_service import TargetTrigger
+from src.domain.value_objects import PortfolioMetrics
+
+
+def stock_change_update(event: DomainEvent) -> LiveUpdate:
+    """Build the update for a stock event, keyed by stock ID.
+
+    Args:
+        event: StockAddedEvent or StockUpdatedEvent
+
+    Returns:
+        Update naming the change; clients read the stock for its new state
+    """
+    payload = event.to_payload()
+    return LiveUpdate(
+        "stock",
+        payload["stock_id"],
+        {"change": event.event_type(), **payload},
+    )
+
+
+def valuation_update(portfolio_id: str, metrics: PortfolioMetrics) -> LiveUpdate:
+    """Build the update for a new portfolio valuation.
+
+    Args:
+        portfolio_id: Valued portfolio
+        metrics: Metrics of the portfolio at the latest prices
+
+    Returns:
+        Update keyed by portfolio ID
+    """
+    return LiveUpdate(
+        "valuation",
+        portfolio_id,
+        {
+            "portfolio_id": portfolio_id,
+            "total_value": str(metrics.total_value.value),
+            "position_count": metrics.position_count,
+        },
+    )
+
+
+def target_update(trigger: TargetTrigger) -> LiveUpdate:
+    """Build the update for a target that was hit or failed.
+
+    Args:
+        trigger: Target whose threshold was crossed
+
+    Returns:
+        Update keyed by target ID
+    """
+    return LiveUpdate(
+        "target",
+        trigger.target_id,
+        {
+            "target_id": trigger.target_id,
+            "stock_id": trigger.stock_id,
+            "status": trigger.status,
+            "price": str(trigger.price.value),
+        },
+    )
+
+
+def subscribe_stock_changes(bus: EventBus, hub: LiveUpdateHub) -> None:
+    """Publish every stock added or updated event to the hub.
+
+    Args:
+        bus: Event bus delivering committed events
+        hub: Hub streaming the updates
+    """
+
+    def publish(event: DomainEvent) -> None:
+        """Publish the update for one stock event."""
+        _ = hub.publish(stock_change_update(event))
+
+    bus.subscribe(StockAddedEvent, publish)
+    bus.subscribe(StockUpdatedEvent, publish)
@@ -0,0 +1,215 @@
+"""In-process fan-out of live updates to streaming clients.
+
+Dashboards used to poll the API every few seconds, so every open tab
+recomputed the same data. Producers instead publish each change once as a
+LiveUpdate to the LiveUpdateHub, which hands the same update to every
+subscriber. Each subscriber buffers its pending updates keyed by topic and
+key, so a newer update for the same entity replaces the one still waiting
+(coalescing), and a slow client costs at most ``max_pending`` updates of
+memory: beyond that its buffer is replaced by a single RESYNC update telling
+the client to reload its state.
+
+Publishing is thread-safe; subscribers are read from the event loop they
+were created in. The module has no domain dependencies so the web layer can
+stream updates; live_feeds turns domain results into updates.
+"""
+
+import asyncio
+import contextlib
+import json
+import threading
+from collections.abc import Collection, Mapping
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
+
+# Topics clients can subscribe to
+LIVE_TOPICS = ("stock", "valuation", "target")
+
+
+@dataclass(frozen=True)
+class LiveUpdate:
+    """One change pushed to live clients."""
+
+    topic: str  # One of LIVE_TOPICS, or "resync"
+    key: str  # Entity the update describes; newer updates replace older ones
+    data: Mapping[str, Any]
+
+    @cached_property
+    def json(self) -> str:
+        """Get the data as JSON, encoded once for every subscriber."""
+        return json.dumps(self.data, separators=(",", ":"))
+
+
+# Sent instead of the buffered updates when a client falls too far behind
+RESYNC = LiveUpdate("resync", "", {})
+
+
+class LiveSubscription:
+    """Pending updates of one client, coalesced by topic and key."""
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        topics: frozenset[str],
+        max_pending: int,
+    ) -> None:
+        """Initialize an empty subscription.
+
+        Args:
+            loop: Event loop the client reads updates in
+            topics: Topics delivered to the client
+            max_pending: Buffered updates before the client must resync
+        """
+        self._loop = loop
+        self._topics = topics
+        self._max_pending = max_pending
+        self._lock = threading.Lock()
+        self._pending: dict[tuple[str, str], LiveUpdate] = {}
+        self._ready = asyncio.Event()
+        self._closed = False
+        self.coalesced = 0  # Updates replaced by a newer one before delivery
+        self.resyncs = 0  # Times the buffer overflowed
+
+    @property
+    def topics(self) -> frozenset[str]:
+        """Get the topics delivered to the client."""
+        return self._topics
+
+    @property
+    def closed(self) -> bool:
+        """Check whether the subscription was closed."""
+        return self._closed
+
+    def offer(self, update: LiveUpdate) -> None:
+        """Buffer an update, replacing a pending one for the same entity.
+
+        Args:
+            update: Update to deliver
+        """
+        key = (update.topic, update.key)
+        with self._lock:
+            if self._closed:
+                return
+            was_empty = not self._pending
+            if key in self._pending:
+                self.coalesced += 1
+            elif len(self._pending) >= self._max_pending:
+                # Too far behind: drop the backlog, the client reloads instead
+                self.resyncs += 1
+                self._pending = {(RESYNC.topic, RESYNC.key): RESYNC}
+            self._pending[key] = update
+        if was_empty:
+            self._wake()
+
+    async def next_batch(self, max_wait: float | None = None) -> list[LiveUpdate]:
+        """Wait for pending updates and take them all.
+
+        Args:
+            max_wait: Seconds to wait; None waits until updates arrive
+
+        Returns:
+            Pending updates in arrival order; empty on timeout or once
+            closed and drained
+        """
+        if not self._pending and not self._closed:
+            with contextlib.suppress(TimeoutError):
+                _ = await asyncio.wait_for(self._ready.wait(), max_wait)
+        self._ready.clear()
+        with self._lock:
+            batch, self._pending = self._pending, {}
+        return list(batch.values())
+
+    def close(self) -> None:
+        """Stop accepting updates and wake the reader; safe from any thread.
+
+        Updates already pending are still returned by next_batch().
+        """
+        with self._lock:
+            self._closed = True
+        self._wake()
+
+    def _wake(self) -> None:
+        """Wake the reader in its event loop."""
+        # The event loop may already be closed during shutdown
+        with contextlib.suppress(RuntimeError):
+            _ = self._loop.call_soon_threadsafe(self._ready.set)
+
+
+class LiveUpdateHub:
+    """Publishes each update once to every interested subscriber."""
+
+    def __init__(self, max_pending: int = 256) -> None:
+        """Initialize a hub without subscribers.
+
+        Args:
+            max_pending: Buffered updates per client before it must resync
+
+        Raises:
+            ValueError: If max_pending is below 1
+        """
+        if max_pending < 1:
+            msg = "max_pending must be at least 1"
+            raise ValueError(msg)
+        self._max_pending = max_pending
+        self._lock = threading.Lock()
+        # Replaced on change so publish() iterates without holding the lock
+        self._subscriptions: tuple[LiveSubscription, ...] = ()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Get the number of open subscriptions."""
+        return len(self._subscriptions)
+
+    def subscribe(self, topics: Collection[str] = LIVE_TOPICS) -> LiveSubscription:
+        """Open a subscription read in the running event loop.
+
+        Args:
+            topics: Topics to deliver; RESYNC is always delivered
+
+        Returns:
+            New subscription; pass it to unsubscribe() when the client leaves
+        """
+        subscription = LiveSubscription(
+            asyncio.get_running_loop(),
+            frozenset(topics),
+            self._max_pending,
+        )
+        with self._lock:
+            self._subscriptions = (*self._subscriptions, subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: LiveSubscription) -> None:
+        """Close a subscription and stop delivering to it.
+
+        Args:
+            subscription: Subscription returned by subscribe()
+        """
+        subscription.close()
+        with self._lock:
+            self._subscriptions = tuple(
+                other for other in self._subscriptions if other is not subscription
+            )
+
+    def publish(self, update: LiveUpdate) -> int:
+        """Deliver an update to every subscriber of its topic.
+
+        Args:
+            update: Update to deliver
+
+        Returns:
+            Number of subscriptions the update was offered to
+        """
+        offered = 0
+        for subscription in self._subscriptions:
+            if update.topic in subscription.topics:
+                subscription.offer(update)
+                offered += 1
+        return offered
+
+    def close(self) -> None:
+        """Close every subscription, e.g. at shutdown."""
+        with self._lock:
+            subscriptions, self._subscriptions = self._subscriptions, ()
+        for subscription in subscriptions:
+            subscription.close()
@@ -0,0 +1,39 @@
+"""Recording of domain events in the transactional outbox."""
+
+from collections.abc import Iterable
+
+from src.application.events.serialization import EventSerializer
+from src.domain.events import DomainEvent
+from src.domain.repositories.interfaces import IStockBookUnitOfWork
+
+
+class OutboxEventPublisher:
+    """Writes domain events to the outbox of an active unit of work.
+
+    The events are committed or rolled back together with the changes
+    that raised them; delivery to handlers happens later, outside the
+    request, through the OutboxDispatcher.
+    """
+
+    def __init__(self, serializer: EventSerializer | None = None) -> None:
+        """Initialize the publisher.
+
+        Args:
+            serializer: Serializer for the recorded events
+        """
+        self._serializer = serializer or EventSerializer()
+
+    def record(
+        self,
+        unit_of_work: IStockBookUnitOfWork,
+        events: Iterable[DomainEvent],
+    ) -> None:
+        """Add events to the outbox in the unit of work's transaction.
+
+        Args:
+            unit_of_work: Active unit of work
+            events: Events to record
+        """
+        messages = [self._serializer.to_message(event) for event in events]
+        if messages:
+            unit_of_work.outbox.add(messages)
@@ -0,0 +1,81 @@
+"""Conversion between domain events and outbox messages."""
+
+import json
+from collections.abc import Iterable
+
+from src.domain.events import DomainEvent, StockAddedEvent, StockUpdatedEvent
+from src.domain.repositories.interfaces import OutboxMessage
+
+
+class EventSerializer:
+    """Serializes registered domain event types to and from outbox messages."""
+
+    def __init__(
+        self,
+        event_types: Iterable[type[DomainEvent]] = (
+            StockAddedEvent,
+            StockUpdatedEvent,
+        ),
+    ) -> None:
+        """Initialize the serializer with the event types it can restore.
+
+        Args:
+            event_types: Event classes to register
+        """
+        self._event_types: dict[str, type[DomainEvent]] = {}
+        for event_type in event_types:
+            self.register(event_type)
+
+    def register(self, event_type: type[DomainEvent]) -> None:
+        """Register an event class so stored messages can be restored.
+
+        Args:
+            event_type: Event class to register
+
+        Raises:
+            ValueError: If another class is registered under the same name
+        """
+        name = event_type.event_type()
+        registered = self._event_types.get(name)
+        if registered is not None and registered is not event_type:
+            msg = f"Event type '{name}' is already registered"
+            raise ValueError(msg)
+        self._event_types[name] = event_type
+
+    def to_message(self, event: DomainEvent) -> OutboxMessage:
+        """Serialize an event for the outbox.
+
+        Args:
+            event: Event to serialize
+
+        Returns:
+            OutboxMessage carrying the event
+        """
+        return OutboxMessage(
+            event_id=event.event_id,
+            event_type=event.event_type(),
+            payload=json.dumps(event.to_payload(), separators=(",", ":")),
+            occurred_at=event.occurred_at,
+        )
+
+    def from_message(self, message: OutboxMessage) -> DomainEvent:
+        """Restore the event carried by an outbox message.
+
+        Args:
+            message: Stored message
+
+        Returns:
+            The original event
+
+        Raises:
+            ValueError: If the event type is not registered
+        """
+        event_type = self._event_types.get(message.event_type)
+        if event_type is None:
+            msg = f"Unknown event type '{message.event_type}'"
+            raise ValueError(msg)
+        return event_type.from_payload(
+            json.loads(message.payload),
+            event_id=message.event_id,
+            occurred_at=message.occurred_at,
+        )
@@ -0,0 +1,22 @@
+"""Event dispatcher interface."""
+
+from abc import ABC, abstractmethod
+
+
+class IEventDispatcher(ABC):
+    """Interface for the background delivery of recorded domain events."""
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Start delivering events in the running event loop."""
+        ...
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop delivering events, finishing queued deliveries if possible."""
+        ...
+
+    @abstractmethod
+    def notify(self) -> None:
+        """Signal that new events were committed; safe to call from any thread."""
+        ...
@@ -0,0 +1,75 @@
+"""Portfolio holdings read model interface.
+
+Holdings are a read-side view joining positions with the stock metadata
+portfolio calculations need. They are loaded in one query per batch of
+portfolios and never hydrate full Stock or Position entities.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
+from typing import NamedTuple
+
+from src.domain.value_objects import IndustryGroup, Money, Quantity, StockSymbol
+
+
+class HoldingRow(NamedTuple):
+    """One position with the stock fields portfolio views use.
+
+    Satisfies the HeldSecurity protocol of PortfolioCalculationService.
+    """
+
+    portfolio_id: str
+    stock_id: str
+    symbol: StockSymbol
+    industry_group: IndustryGroup | None
+    grade: str | None
+    quantity: Quantity
+    average_cost: Money
+
+
+def as_calculation_input(
+    rows: Sequence[HoldingRow],
+) -> list[tuple[HoldingRow, Quantity]]:
+    """Pair each holding with its quantity, as PortfolioCalculationService expects.
+
+    Args:
+        rows: Holdings of one portfolio
+
+    Returns:
+        (security, quantity) pairs in the order of the rows
+    """
+    return [(row, row.quantity) for row in rows]
+
+
+class IHoldingsQuery(ABC):
+    """Read-only queries for portfolio holdings."""
+
+    @abstractmethod
+    def get_holdings(self, portfolio_id: str) -> list[HoldingRow]:
+        """Retrieve the holdings of one portfolio with a single query.
+
+        Args:
+            portfolio_id: Portfolio identifier
+
+        Returns:
+            Holdings ordered by symbol; empty for unknown portfolios
+        """
+        ...
+
+    @abstractmethod
+    def get_holdings_for_portfolios(
+        self,
+        portfolio_ids: Iterable[str] | None = None,
+    ) -> dict[str, list[HoldingRow]]:
+        """Retrieve the holdings of several portfolios at once.
+
+        Args:
+            portfolio_ids: Portfolios to load; None loads every portfolio
+                that holds positions
+
+        Returns:
+            Holdings ordered by symbol, keyed by portfolio ID. Every
+            requested portfolio is present, with an empty list if it holds
+            nothing
+        """
+        ...
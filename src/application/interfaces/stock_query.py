@@ -0,0 +1,48 @@
+"""Stock field projection read model interface.
+
+List views usually need a few stock fields, such as symbol and name. The
+projection query reads only the requested columns and returns plain rows,
+without hydrating Stock entities or building full DTOs.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from src.domain.value_objects.stock_query_spec import StockQuerySpec
+
+# Fields a projection may select, named as in StockDto
+STOCK_FIELDS = (
+    "id",
+    "symbol",
+    "name",
+    "sector",
+    "industry_group",
+    "grade",
+    "notes",
+)
+
+StockFieldRow = dict[str, str | None]
+
+
+class IStockQuery(ABC):
+    """Read-only stock queries returning selected fields."""
+
+    @abstractmethod
+    def select_fields(
+        self,
+        fields: Sequence[str],
+        spec: StockQuerySpec | None = None,
+    ) -> list[StockFieldRow]:
+        """Retrieve the given fields of every stock matching a query spec.
+
+        Args:
+            fields: Fields to return, each one of STOCK_FIELDS
+            spec: Filters and sort order; None lists every stock
+
+        Returns:
+            One dict per stock holding exactly the requested fields
+
+        Raises:
+            ValueError: If a field is not one of STOCK_FIELDS
+        """
+        ...
@@ -4,11 +4,22 @@ from abc import ABC, abstractmethod
 
 from src.application.commands.stock import CreateStockCommand, UpdateStockCommand
 from src.application.dto.stock_dto import StockDto
+from src.domain.value_objects.stock_query_spec import StockQuerySpec
 
 
 class IStockApplicationService(ABC):
     """Interface for stock application service."""
 
+    @property
+    @abstractmethod
+    def data_version(self) -> int:
+        """Get the version of the stock data.
+
+        Advances after every committed stock write, so reads can be keyed
+        by the data they see.
+        """
+        ...
+
     @abstractmethod
     def get_all_stocks(self) -> list[StockDto]:
         """Retrieve all stocks.
@@ -50,6 +61,18 @@ class IStockApplicationService(ABC):
         """
         ...
 
+    @abstractmethod
+    def find_stocks(self, spec: StockQuerySpec) -> list[StockDto]:
+        """Retrieve the stocks matching a query spec, in its sort order.
+
+        Args:
+            spec: Filters and sort order of the listing
+
+        Returns:
+            List of stock DTOs matching the spec
+        """
+        ...
+
     @abstractmethod
     def create_stock(self, command: CreateStockCommand) -> StockDto:
         """Create a new stock.
@@ -78,6 +101,8 @@ class IStockApplicationService(ABC):
 
         Raises:
             StockNotFoundError: If stock with given ID doesn't exist
+            ConcurrencyConflictError: If the stock is no longer at the
+                version the update was based on
             ValidationError: If command data is invalid
         """
         ...
@@ -0,0 +1,113 @@
+"""Transaction import source interface.
+
+Broker exports are read as a stream of raw records, each carrying the byte
+offsets it spans so an interrupted import can resume where the last
+committed record ended.
+
+A file may list the same fill twice, e.g. two identical market orders on
+one day, and both are real trades. Sources therefore number identical
+records in file order (``occurrence``), so an import can tell the second
+fill apart from a re-import of the first.
+"""
+
+from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass, replace
+
+
+@dataclass(frozen=True)
+class RawTransaction:
+    """One fill as written in a broker export, not yet validated."""
+
+    offset: int
+    end_offset: int
+    symbol: str
+    transaction_type: str
+    quantity: str
+    price: str
+    transaction_date: str
+    notes: str = ""
+    occurrence: int = 1
+
+    @property
+    def fill_key(self) -> tuple[str, str, str, str, str]:
+        """Get the fields that make two records in one file the same fill.
+
+        Returns:
+            Symbol, type, date, quantity and price as written
+        """
+        return (
+            self.symbol.strip().upper(),
+            self.transaction_type.strip().lower(),
+            self.transaction_date.strip(),
+            self.quantity.strip(),
+            self.price.strip(),
+        )
+
+
+@dataclass(frozen=True)
+class RejectedRow:
+    """A record that could not be imported, and why."""
+
+    offset: int
+    end_offset: int
+    reason: str
+
+
+class OccurrenceCounter:
+    """Numbers identical records of one file in file order.
+
+    Keeps one count per distinct fill, plus one entry per source ID given.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a counter that has seen no records."""
+        self._counts: Counter[tuple[str, str, str, str, str]] = Counter()
+        self._by_source_id: dict[str, int] = {}
+
+    def number(
+        self,
+        record: RawTransaction,
+        source_id: str | None = None,
+    ) -> RawTransaction:
+        """Set the occurrence of the next record read.
+
+        Args:
+            record: Record as parsed, in file order
+            source_id: Identity the export gives the record, such as an
+                OFX FITID; a record repeating a known ID is the same fill
+                and keeps its occurrence
+
+        Returns:
+            The record with its occurrence set
+        """
+        occurrence = (
+            self._by_source_id.get(source_id) if source_id is not None else None
+        )
+        if occurrence is None:
+            self._counts[record.fill_key] += 1
+            occurrence = self._counts[record.fill_key]
+            if source_id is not None:
+                self._by_source_id[source_id] = occurrence
+        return replace(record, occurrence=occurrence)
+
+
+class ITransactionSource(ABC):
+    """Streaming reader for a broker transaction export."""
+
+    @abstractmethod
+    def read(self, start_offset: int = 0) -> Iterator[RawTransaction | RejectedRow]:
+        """Read records one at a time, in file order.
+
+        Args:
+            start_offset: Byte offset to resume from, as reported by an
+                earlier import's checkpoint
+
+        Yields:
+            Raw transactions, with transaction_date in ISO 8601 format and
+            occurrence counted from the start of the file even when
+            resuming, and rejections for records the format parser could
+            not read
+        """
+        ...
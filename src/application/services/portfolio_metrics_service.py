@@ -0,0 +1,189 @@
+"""Portfolio metrics application service.
+
+Serves PortfolioMetrics from a cache keyed by portfolio and by the versions
+of its inputs: the portfolio's positions and the latest price snapshot.
+Position writes and price ingestion bump those versions instead of
+recomputing anything, and readers get the cached metrics until a version
+moves on. Behind the cache, each portfolio read keeps an
+IncrementalAllocation that price ticks and single trades update in place,
+so recomputing after a version bump does not reload the holdings.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+
+from src.application.interfaces.holdings_query import (
+    IHoldingsQuery,
+    as_calculation_input,
+)
+from src.domain.services.exceptions import CalculationError
+from src.domain.services.portfolio_calculation_service import (
+    HeldSecurity,
+    IncrementalAllocation,
+    PortfolioCalculationService,
+)
+from src.domain.value_objects import Money, PortfolioMetrics, Quantity
+from src.shared.caching import VersionedCache
+
+MetricsVersion = tuple[int, int]
+
+
+class PortfolioMetricsService:
+    """Application service for cached portfolio metrics.
+
+    Call update_prices() from price ingestion, record_trade() when a trade
+    changes one position and positions_changed() after other position
+    writes; get_metrics() then serves stale-while-revalidate results from
+    the cache.
+    """
+
+    def __init__(
+        self,
+        holdings_query: IHoldingsQuery,
+        calculation_service: PortfolioCalculationService | None = None,
+        cache: VersionedCache[str, PortfolioMetrics] | None = None,
+    ) -> None:
+        """Initialize service with the holdings read model.
+
+        Args:
+            holdings_query: Read model loading a portfolio's holdings
+            calculation_service: Domain service computing the metrics
+            cache: Metrics cache; a stale-while-revalidate cache by default
+        """
+        self._holdings_query = holdings_query
+        self._calculation_service = calculation_service or PortfolioCalculationService()
+        self._cache: VersionedCache[str, PortfolioMetrics] = (
+            cache if cache is not None else VersionedCache()
+        )
+        self._lock = threading.Lock()
+        self._prices: dict[str, Money] = {}
+        self._price_version = 0
+        self._position_versions: dict[str, int] = {}
+        self._allocations: OrderedDict[str, IncrementalAllocation] = OrderedDict()
+
+    @property
+    def cache(self) -> VersionedCache[str, PortfolioMetrics]:
+        """Get the metrics cache, e.g. to register its statistics."""
+        return self._cache
+
+    def update_prices(self, prices: Mapping[str, Money]) -> bool:
+        """Merge a price batch into the snapshot used for metrics.
+
+        Args:
+            prices: Latest price per stock symbol
+
+        Returns:
+            True if any price changed, which makes every cached entry stale
+        """
+        with self._lock:
+            changed = {
+                symbol: price
+                for symbol, price in prices.items()
+                if self._prices.get(symbol) != price
+            }
+            if not changed:
+                return False
+            self._prices = {**self._prices, **changed}
+            self._price_version += 1
+            for allocation in self._allocations.values():
+                _ = allocation.update_prices(changed)
+            return True
+
+    def record_trade(
+        self,
+        portfolio_id: str,
+        stock: HeldSecurity,
+        quantity: Quantity,
+    ) -> None:
+        """Apply a trade that changed one position of a portfolio.
+
+        Updates the running totals of the portfolio in O(1) instead of
+        reloading its holdings on the next read.
+
+        Args:
+            portfolio_id: Portfolio the trade belongs to
+            stock: Traded security
+            quantity: Quantity held after the trade; zero closes the position
+        """
+        with self._lock:
+            self._bump_positions(portfolio_id)
+            allocation = self._allocations.get(portfolio_id)
+            if allocation is None:
+                return
+            if quantity.value == 0:
+                _ = allocation.remove_position(str(stock.symbol))
+                return
+            try:
+                allocation.set_position(
+                    stock,
+                    quantity,
+                    self._prices.get(str(stock.symbol)),
+                )
+            except CalculationError:
+                # Unpriced new holding; the next read reloads and reports it
+                del self._allocations[portfolio_id]
+
+    def positions_changed(self, *portfolio_ids: str) -> None:
+        """Mark the cached metrics of portfolios as stale after a write.
+
+        Args:
+            portfolio_ids: Portfolios whose positions were written
+        """
+        with self._lock:
+            for portfolio_id in portfolio_ids:
+                self._bump_positions(portfolio_id)
+                _ = self._allocations.pop(portfolio_id, None)
+
+    def get_metrics(self, portfolio_id: str) -> PortfolioMetrics:
+        """Get the metrics of a portfolio at the latest prices.
+
+        Args:
+            portfolio_id: Portfolio identifier
+
+        Returns:
+            Cached metrics when current; outdated metrics while a refresh
+            runs in the background; otherwise freshly computed metrics
+
+        Raises:
+            CalculationError: If a held stock has no price in the snapshot
+        """
+        with self._lock:
+            version: MetricsVersion = (
+                self._position_versions.get(portfolio_id, 0),
+                self._price_version,
+            )
+
+        return self._cache.get(
+            portfolio_id,
+            version,
+            lambda: self._calculate(portfolio_id),
+        )
+
+    def _calculate(self, portfolio_id: str) -> PortfolioMetrics:
+        """Derive metrics from running totals, loading holdings if untracked."""
+        with self._lock:
+            allocation = self._allocations.get(portfolio_id)
+            if allocation is not None:
+                self._allocations.move_to_end(portfolio_id)
+                return allocation.metrics()
+            positions_version = self._position_versions.get(portfolio_id, 0)
+
+        holdings = self._holdings_query.get_holdings(portfolio_id)
+        with self._lock:
+            allocation = self._calculation_service.build_incremental_allocation(
+                as_calculation_input(holdings),
+                self._prices,
+            )
+            # A write during the load makes these holdings outdated
+            if self._position_versions.get(portfolio_id, 0) == positions_version:
+                self._allocations[portfolio_id] = allocation
+                while len(self._allocations) > self._cache.cache_info().maxsize:
+                    _ = self._allocations.popitem(last=False)
+            return allocation.metrics()
+
+    def _bump_positions(self, portfolio_id: str) -> None:
+        """Advance the positions version; call with the lock held."""
+        self._position_versions[portfolio_id] = (
+            self._position_versions.get(portfolio_id, 0) + 1
+        )
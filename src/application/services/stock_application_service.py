@@ -9,16 +9,20 @@ from src.application.commands.stock import (
     UpdateStockCommand,
 )
 from src.application.dto.stock_dto import StockDto
+from src.application.events.publisher import OutboxEventPublisher
 from src.application.interfaces.stock_service import IStockApplicationService
 from src.domain.entities.stock import Stock
+from src.domain.events import StockAddedEvent, StockUpdatedEvent
 from src.domain.exceptions import (
-    StockAlreadyExistsError,
+    ConcurrencyConflictError,
     StockNotFoundError,
 )
 from src.domain.repositories.interfaces import IStockBookUnitOfWork
 from src.domain.value_objects import CompanyName, Grade, IndustryGroup, Notes
 from src.domain.value_objects.sector import Sector
+from src.domain.value_objects.stock_query_spec import StockQuerySpec
 from src.domain.value_objects.stock_symbol import StockSymbol
+from src.shared.caching import DataVersion
 
 
 class StockApplicationService(IStockApplicationService):
@@ -28,13 +32,28 @@ class StockApplicationService(IStockApplicationService):
     coordinating between domain entities and repositories.
     """
 
-    def __init__(self, unit_of_work: IStockBookUnitOfWork) -> None:
+    def __init__(
+        self,
+        unit_of_work: IStockBookUnitOfWork,
+        event_publisher: OutboxEventPublisher | None = None,
+        data_version: DataVersion | None = None,
+    ) -> None:
         """Initialize service with unit of work.
 
         Args:
             unit_of_work: Unit of work for transaction management
+            event_publisher: Records domain events in the transactional outbox
+            data_version: Stock data version shared by every service instance;
+                advanced after each committed write
         """
         self._unit_of_work = unit_of_work
+        self._event_publisher = event_publisher or OutboxEventPublisher()
+        self._data_version = data_version or DataVersion()
+
+    @property
+    def data_version(self) -> int:
+        """Get the version of the stock data."""
+        return self._data_version.current
 
     def create_stock(self, command: CreateStockCommand) -> StockDto:
         """Create a new stock.
@@ -48,11 +67,9 @@ class StockApplicationService(IStockApplicationService):
         Raises:
             StockAlreadyExistsError: If stock with symbol already exists
         """
-        try:
-            with self._unit_of_work:
-                # Check if stock already exists
+        with self._unit_of_work:
+            try:
                 symbol_vo = StockSymbol(command.symbol)
-                self._ensure_stock_does_not_exist(symbol_vo, command.symbol)
 
                 # Create domain entity
                 builder = Stock.Builder().with_symbol(symbol_vo)
@@ -72,17 +89,36 @@ class StockApplicationService(IStockApplicationService):
 
                 stock_entity = builder.build()
 
-                # Persist entity
+                # Persist entity; the repository reports a duplicate symbol
+                # from the unique constraint, so no lookup precedes the insert
                 _ = self._unit_of_work.stocks.create(stock_entity)
 
+                # Record the event in the same transaction; handlers run
+                # after commit without delaying this request
+                self._event_publisher.record(
+                    self._unit_of_work,
+                    [
+                        StockAddedEvent(
+                            stock_symbol=stock_entity.symbol,
+                            stock_name=(
+                                stock_entity.company_name.value
+                                if stock_entity.company_name
+                                else stock_entity.symbol.value
+                            ),
+                            stock_id=stock_entity.id,
+                        ),
+                    ],
+                )
+
                 # Commit transaction
                 self._unit_of_work.commit()
+                _ = self._data_version.bump()
 
                 return StockDto.from_entity(stock_entity)
 
-        except Exception:
-            self._unit_of_work.rollback()
-            raise
+            except Exception:
+                self._unit_of_work.rollback()
+                raise
 
     def get_stock_by_symbol(self, symbol: str) -> StockDto | None:
         """Retrieve stock by symbol.
@@ -167,6 +203,19 @@ class StockApplicationService(IStockApplicationService):
             )
             return [StockDto.from_entity(entity) for entity in stock_entities]
 
+    def find_stocks(self, spec: StockQuerySpec) -> list[StockDto]:
+        """Retrieve the stocks matching a query spec, in its sort order.
+
+        Args:
+            spec: Filters and sort order of the listing
+
+        Returns:
+            List of stock DTOs matching the spec
+        """
+        with self._unit_of_work:
+            stock_entities = self._unit_of_work.stocks.find_stocks(spec)
+            return [StockDto.from_entity(entity) for entity in stock_entities]
+
     def update_stock(self, command: UpdateStockCommand) -> StockDto:
         """Update an existing stock.
 
@@ -179,24 +228,27 @@ class StockApplicationService(IStockApplicationService):
         Raises:
             StockNotFoundError: If stock not found
             StockAlreadyExistsError: If updating symbol to one that already exists
+            ConcurrencyConflictError: If the stock changed since it was read,
+                or is no longer at the command's expected version
             ValueError: If no fields to update
         """
-        try:
-            with self._unit_of_work:
+        with self._unit_of_work:
+            try:
                 # Validate command and retrieve stock entity
                 stock_entity = self._validate_update_command_and_get_stock(command)
 
                 # Apply updates and save
-                self._apply_updates_and_save(command, stock_entity)
+                stored = self._apply_updates_and_save(command, stock_entity)
 
                 # Commit transaction
                 self._unit_of_work.commit()
+                _ = self._data_version.bump()
 
-                return StockDto.from_entity(stock_entity)
+                return StockDto.from_entity(stored)
 
-        except Exception:
-            self._unit_of_work.rollback()
-            raise
+            except Exception:
+                self._unit_of_work.rollback()
+                raise
 
     def _validate_update_command_and_get_stock(
         self,
@@ -209,47 +261,55 @@ class StockApplicationService(IStockApplicationService):
         if stock_entity is None:
             raise StockNotFoundError(identifier=command.stock_id)
 
+        # The conditional update then replaces only the version the client saw
+        expected = command.expected_version
+        if expected is not None and expected != stock_entity.version:
+            msg = "Stock"
+            raise ConcurrencyConflictError(msg, command.stock_id, expected)
+
         # Validate that there are fields to update
         if not command.has_updates():
             msg = "No fields to update"
             raise ValueError(msg)
 
-        # Check for duplicate symbol if symbol is being changed
-        if command.symbol and command.symbol != stock_entity.symbol.value:
-            symbol_vo = StockSymbol(command.symbol)
-            existing_stock = self._unit_of_work.stocks.get_by_symbol(symbol_vo)
-            if existing_stock is not None and existing_stock.id != command.stock_id:
-                raise StockAlreadyExistsError(symbol=command.symbol)
-
+        # A symbol taken by another stock is rejected by the unique
+        # constraint when saving
         return stock_entity
 
     def _apply_updates_and_save(
         self,
         command: UpdateStockCommand,
         stock_entity: Stock,
-    ) -> None:
-        """Apply updates to stock entity and save to repository."""
-        # Get the fields to update and apply them to the entity
-        update_fields = command.get_update_fields()
-        stock_entity.update_fields(**update_fields)
-
-        # Persist changes
-        update_success = self._unit_of_work.stocks.update(stock_entity.id, stock_entity)
-
-        if not update_success:
-            msg = "Failed to update stock"
-            raise ValueError(msg)
-
-    def _ensure_stock_does_not_exist(self, symbol_vo: StockSymbol, symbol: str) -> None:
-        """Ensure that a stock with the given symbol does not already exist.
+    ) -> Stock:
+        """Apply updates to stock entity and save to repository.
 
-        Args:
-            symbol_vo: The StockSymbol value object
-            symbol: The symbol string for error message
+        Returns:
+            The stock as stored by the update
 
         Raises:
-            StockAlreadyExistsError: If stock with symbol already exists
+            StockNotFoundError: If the stock was deleted since it was read
         """
-        existing_stock = self._unit_of_work.stocks.get_by_symbol(symbol_vo)
-        if existing_stock is not None:
-            raise StockAlreadyExistsError(symbol=symbol)
+        # Get the fields to update and apply them to the entity
+        update_fields = command.get_update_fields()
+        stock_entity.update_fields(**update_fields)
+
+        # Persist changes and read back the stored row in one statement
+        stored = self._unit_of_work.stocks.update_and_get(
+            stock_entity.id,
+            stock_entity,
+        )
+
+        if stored is None:
+            raise StockNotFoundError(identifier=stock_entity.id)
+
+        self._event_publisher.record(
+            self._unit_of_work,
+            [
+                StockUpdatedEvent(
+                    stock_symbol=stored.symbol,
+                    stock_id=stored.id,
+                    changed_fields=tuple(update_fields),
+                ),
+            ],
+        )
+        return stored
@@ -0,0 +1,79 @@
+"""Target monitoring application service.
+
+Keeps an index of active targets and, for each batch of prices, persists the
+targets that were hit or failed with one bulk status update.
+"""
+
+from collections.abc import Mapping
+
+from src.domain.repositories.interfaces import IStockBookUnitOfWork
+from src.domain.services.target_evaluation_service import (
+    TargetEvaluationService,
+    TargetIndex,
+    TargetTrigger,
+)
+from src.domain.value_objects import Money
+
+
+class TargetMonitoringService:
+    """Application service for monitoring price targets.
+
+    Active targets are loaded once into a TargetIndex and reused across price
+    batches; call reload() after targets are created or edited elsewhere.
+    """
+
+    def __init__(
+        self,
+        unit_of_work: IStockBookUnitOfWork,
+        evaluation_service: TargetEvaluationService | None = None,
+    ) -> None:
+        """Initialize service with unit of work.
+
+        Args:
+            unit_of_work: Unit of work for transaction management
+            evaluation_service: Domain service for target evaluation
+        """
+        self._unit_of_work = unit_of_work
+        self._evaluation_service = evaluation_service or TargetEvaluationService()
+        self._index: TargetIndex | None = None
+
+    def reload(self) -> int:
+        """Rebuild the index from the active targets in the database.
+
+        Returns:
+            Number of active targets loaded
+        """
+        return len(self._load_index())
+
+    def process_prices(self, prices: Mapping[str, Money]) -> list[TargetTrigger]:
+        """Evaluate a price batch and persist every status change.
+
+        Args:
+            prices: Latest price per stock ID
+
+        Returns:
+            Triggers for the targets that were hit or failed
+        """
+        index = self._index if self._index is not None else self._load_index()
+        triggers = index.evaluate(prices)
+        if not triggers:
+            return triggers
+
+        try:
+            with self._unit_of_work:
+                _ = self._unit_of_work.targets.bulk_update_status(
+                    self._evaluation_service.status_updates(triggers),
+                )
+                self._unit_of_work.commit()
+        except Exception:
+            # The index already dropped these targets; reload on next batch
+            self._index = None
+            raise
+        return triggers
+
+    def _load_index(self) -> TargetIndex:
+        """Load all active targets into a fresh index."""
+        with self._unit_of_work:
+            targets = self._unit_of_work.targets.get_all_active()
+        self._index = self._evaluation_service.build_index(targets)
+        return self._index
@@ -0,0 +1,339 @@
+"""Transaction import application service.
+
+Imports broker exports through a pipeline of generator stages, so files of
+any size are processed in constant memory:
+
+    parse → normalize → chunk → resolve stocks → dedupe → insert
+
+Each chunk is written and committed in its own unit of work. After every
+commit the import reports progress with a checkpoint: the byte offset after
+the last committed record, from which an interrupted import resumes. A
+chunk that created stocks also advances the stocks table version, so
+cached stock reads are built again.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import TypeVar
+
+from src.application.interfaces.transaction_import import (
+    ITransactionSource,
+    RawTransaction,
+    RejectedRow,
+)
+from src.domain.entities.stock import Stock
+from src.domain.entities.transaction import Transaction
+from src.domain.repositories.interfaces import IStockBookUnitOfWork
+from src.domain.value_objects import (
+    Money,
+    Notes,
+    Quantity,
+    StockSymbol,
+    TransactionType,
+)
+from src.shared.caching import TableVersions
+
+DEFAULT_CHUNK_SIZE = 500
+
+# Rejections kept on the progress report; on_rejected sees all of them
+MAX_REPORTED_REJECTIONS = 100
+
+RecordT = TypeVar("RecordT")
+
+
+@dataclass(frozen=True)
+class NormalizedTransaction:
+    """A raw transaction converted to validated value objects."""
+
+    offset: int
+    end_offset: int
+    symbol: StockSymbol
+    transaction_type: TransactionType
+    quantity: Quantity
+    price: Money
+    transaction_date: datetime
+    notes: Notes
+    occurrence: int = 1
+
+
+@dataclass(frozen=True)
+class ImportProgress:
+    """Counts of an import so far and where to resume it."""
+
+    read: int = 0
+    imported: int = 0
+    duplicates: int = 0
+    rejected: int = 0
+    stocks_created: int = 0
+    checkpoint: int = 0
+    rejections: tuple[RejectedRow, ...] = ()
+
+
+def normalize(
+    records: Iterable[RawTransaction | RejectedRow],
+) -> Iterator[NormalizedTransaction | RejectedRow]:
+    """Validate raw records, turning invalid ones into rejections.
+
+    Naive dates are taken to be UTC.
+
+    Args:
+        records: Records from an ITransactionSource
+
+    Yields:
+        Normalized transactions and rejected rows, in input order
+    """
+    for record in records:
+        if isinstance(record, RejectedRow):
+            yield record
+            continue
+        try:
+            yield _normalize(record)
+        except ValueError as e:
+            yield RejectedRow(record.offset, record.end_offset, str(e))
+
+
+def chunked(records: Iterable[RecordT], size: int) -> Iterator[list[RecordT]]:
+    """Group records into lists of at most ``size``.
+
+    Raises:
+        ValueError: If size is below 1
+    """
+    if size < 1:
+        msg = "Chunk size must be at least 1"
+        raise ValueError(msg)
+    chunk: list[RecordT] = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class TransactionImportService:
+    """Application service for importing broker transaction exports."""
+
+    def __init__(
+        self,
+        unit_of_work: IStockBookUnitOfWork,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        table_versions: TableVersions | None = None,
+    ) -> None:
+        """Initialize service with unit of work.
+
+        Args:
+            unit_of_work: Unit of work, entered once per chunk
+            chunk_size: Records written per unit of work
+            table_versions: Table versions shared with cached readers;
+                advanced after committed chunks that changed them
+
+        Raises:
+            ValueError: If chunk_size is below 1
+        """
+        if chunk_size < 1:
+            msg = "Chunk size must be at least 1"
+            raise ValueError(msg)
+        self._unit_of_work = unit_of_work
+        self._chunk_size = chunk_size
+        self._table_versions = table_versions or TableVersions()
+
+    def import_transactions(
+        self,
+        source: ITransactionSource,
+        portfolio_id: str,
+        *,
+        start_offset: int = 0,
+        on_progress: Callable[[ImportProgress], None] | None = None,
+        on_rejected: Callable[[RejectedRow], None] | None = None,
+    ) -> ImportProgress:
+        """Import every transaction of a broker export into a portfolio.
+
+        Unknown symbols are created as stocks, and fills already recorded
+        for the portfolio are skipped, so re-running an import is safe.
+        Identical fills in one file are all imported: the n-th of them is
+        skipped only when the portfolio already holds n such fills.
+
+        Args:
+            source: Broker export to read
+            portfolio_id: Portfolio receiving the transactions
+            start_offset: Checkpoint of an interrupted import to resume from
+            on_progress: Called after each committed chunk
+            on_rejected: Called for every rejected record
+
+        Returns:
+            Final progress of the import
+        """
+        progress = ImportProgress(checkpoint=start_offset)
+        records = normalize(source.read(start_offset))
+        for chunk in chunked(records, self._chunk_size):
+            valid: list[NormalizedTransaction] = []
+            rejections = list(progress.rejections)
+            for record in chunk:
+                if isinstance(record, RejectedRow):
+                    if on_rejected is not None:
+                        on_rejected(record)
+                    if len(rejections) < MAX_REPORTED_REJECTIONS:
+                        rejections.append(record)
+                else:
+                    valid.append(record)
+
+            imported, duplicates, stocks_created = self._write_chunk(
+                valid,
+                portfolio_id,
+            )
+            progress = replace(
+                progress,
+                read=progress.read + len(chunk),
+                imported=progress.imported + imported,
+                duplicates=progress.duplicates + duplicates,
+                rejected=progress.rejected + len(chunk) - len(valid),
+                stocks_created=progress.stocks_created + stocks_created,
+                checkpoint=chunk[-1].end_offset,
+                rejections=tuple(rejections),
+            )
+            if on_progress is not None:
+                on_progress(progress)
+        return progress
+
+    def _write_chunk(
+        self,
+        records: list[NormalizedTransaction],
+        portfolio_id: str,
+    ) -> tuple[int, int, int]:
+        """Resolve stocks, drop duplicates and insert one chunk.
+
+        Returns:
+            Numbers of imported transactions, duplicates and created stocks
+        """
+        if not records:
+            return 0, 0, 0
+        with self._unit_of_work:
+            stocks = self._unit_of_work.stocks.get_many_by_symbols(
+                record.symbol for record in records
+            )
+            missing = [
+                Stock.Builder().with_symbol(symbol).build()
+                for symbol in dict.fromkeys(record.symbol for record in records)
+                if symbol.value not in stocks
+            ]
+            _ = self._unit_of_work.stocks.create_many(missing)
+            stocks.update((stock.symbol.value, stock) for stock in missing)
+
+            candidates = _unique(
+                (
+                    _to_transaction(
+                        record,
+                        portfolio_id,
+                        stocks[record.symbol.value].id,
+                    ),
+                    record.occurrence,
+                )
+                for record in records
+            )
+            stored = self._unit_of_work.transactions.count_stored(
+                [transaction for transaction, _ in candidates],
+            )
+            new = [
+                transaction
+                for transaction, occurrence in candidates
+                if stored.get(transaction.id, 0) < occurrence
+            ]
+            _ = self._unit_of_work.transactions.create_many(new)
+            self._unit_of_work.commit()
+        if missing:
+            _ = self._table_versions["stocks"].bump()
+        return len(new), len(records) - len(new), len(missing)
+
+
+def _normalize(record: RawTransaction) -> NormalizedTransaction:
+    """Convert one raw record to value objects.
+
+    Raises:
+        ValueError: If a field is invalid
+    """
+    transaction_type = TransactionType(record.transaction_type)
+    amount = _decimal(record.quantity, "quantity")
+    # Some brokers sign sold quantities
+    if amount < 0 and transaction_type.is_sell():
+        amount = -amount
+    quantity = Quantity(amount)
+    if quantity.value == 0:
+        msg = "Quantity must be positive"
+        raise ValueError(msg)
+    price = Money(_decimal(record.price, "price"))
+    if price.value < 0:
+        msg = "Price cannot be negative"
+        raise ValueError(msg)
+    try:
+        transaction_date = datetime.fromisoformat(record.transaction_date)
+    except ValueError:
+        msg = f"Invalid transaction date: {record.transaction_date!r}"
+        raise ValueError(msg) from None
+    if transaction_date.tzinfo is None:
+        transaction_date = transaction_date.replace(tzinfo=UTC)
+    return NormalizedTransaction(
+        offset=record.offset,
+        end_offset=record.end_offset,
+        symbol=StockSymbol(record.symbol),
+        transaction_type=transaction_type,
+        quantity=quantity,
+        price=price,
+        transaction_date=transaction_date,
+        notes=Notes(record.notes.strip()),
+        occurrence=record.occurrence,
+    )
+
+
+def _decimal(value: str, field: str) -> Decimal:
+    """Parse a broker number, ignoring thousands separators and currency.
+
+    Raises:
+        ValueError: If the value is not a finite number
+    """
+    cleaned = value.strip().replace(",", "").replace("$", "")
+    try:
+        number = Decimal(cleaned)
+    except ArithmeticError:
+        number = Decimal("NaN")
+    if not number.is_finite():
+        msg = f"Invalid {field}: {value!r}"
+        raise ValueError(msg)
+    return number
+
+
+def _to_transaction(
+    record: NormalizedTransaction,
+    portfolio_id: str,
+    stock_id: str,
+) -> Transaction:
+    """Build the Transaction entity for a normalized record."""
+    return (
+        Transaction.Builder()
+        .with_portfolio_id(portfolio_id)
+        .with_stock_id(stock_id)
+        .with_transaction_type(record.transaction_type)
+        .with_quantity(record.quantity)
+        .with_price(record.price)
+        .with_transaction_date(record.transaction_date)
+        .with_notes(record.notes)
+        .build()
+    )
+
+
+def _unique(
+    candidates: Iterable[tuple[Transaction, int]],
+) -> list[tuple[Transaction, int]]:
+    """Drop records read twice within a chunk, keeping the first of each.
+
+    Records are the same when both the fill and its occurrence match.
+    """
+    by_key: dict[object, tuple[Transaction, int]] = {}
+    for transaction, occurrence in candidates:
+        _ = by_key.setdefault(
+            (transaction.natural_key, occurrence),
+            (transaction, occurrence),
+        )
+    return list(by_key.values())
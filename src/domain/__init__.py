@@ -8,6 +8,7 @@ independent of external concerns like databases or UI frameworks.
 from .exceptions import (
     AlreadyExistsError,
     BusinessRuleViolationError,
+    ConcurrencyConflictError,
     DomainError,
     InactivePortfolioError,
     InvalidStockGradeError,
@@ -23,6 +24,7 @@ from .exceptions import (
 __all__ = [
     "AlreadyExistsError",
     "BusinessRuleViolationError",
+    "ConcurrencyConflictError",
     # Base exceptions
     "DomainError",
     "InactivePortfolioError",
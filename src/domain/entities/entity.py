@@ -3,10 +3,11 @@
 Provides common functionality for all domain entities following DDD principles.
 """
 
-import uuid
 from abc import ABC
 from typing import Any, Self, TypeVar
 
+from src.domain.entities.identifiers import new_id
+
 T = TypeVar("T", bound="Entity")
 
 
@@ -20,15 +21,30 @@ class Entity(ABC):  # noqa: B024
             raise TypeError(msg)
         return super().__new__(cls)
 
-    def __init__(self, id: str | None = None) -> None:
-        """Initialize entity with either provided ID or generate new UUID."""
-        self._id: str = id if id is not None else str(uuid.uuid4())
+    def __init__(self, id: str | None = None, version: int = 1) -> None:
+        """Initialize entity with either provided ID or generate a new one.
+
+        Args:
+            id: Existing entity ID, or None to generate a time-ordered UUID
+            version: Row version the entity was loaded with
+        """
+        self._id: str = id if id is not None else new_id()
+        self._version: int = version
 
     @property
     def id(self) -> str:
         """Get entity ID."""
         return self._id
 
+    @property
+    def version(self) -> int:
+        """Get the row version the entity was loaded with."""
+        return self._version
+
+    def advance_version(self) -> None:
+        """Record that an update of this entity was persisted."""
+        self._version += 1
+
     @classmethod
     def from_persistence(cls: type[Self], id: str, **kwargs: Any) -> Self:
         """Create entity from persistence layer with existing ID."""
@@ -0,0 +1,77 @@
+"""Time-ordered identifiers for domain entities.
+
+Random uuid4 keys land anywhere in a primary key index, so every insert
+touches a different B-tree page. UUID version 7 (RFC 9562) starts with the
+creation time in milliseconds, so new keys append to the right edge of the
+index while still being globally unique and valid UUIDs.
+"""
+
+import secrets
+import threading
+import time
+import uuid
+from collections.abc import Callable
+
+# Bit layout of a UUIDv7: 48-bit timestamp, version, 12-bit counter,
+# variant, 62 random bits
+_TIMESTAMP_MASK = (1 << 48) - 1
+_COUNTER_MAX = (1 << 12) - 1
+_VERSION_7 = 0x7
+_VARIANT_RFC = 0b10
+
+
+class Uuid7Generator:
+    """Generator of UUID version 7 strings that increase monotonically.
+
+    Within one millisecond the 12 bits after the version hold a counter
+    seeded with random bits, so IDs created by one process keep their
+    creation order even when the clock does not advance or steps back.
+    """
+
+    def __init__(self, clock: Callable[[], int] = time.time_ns) -> None:
+        """Initialize the generator.
+
+        Args:
+            clock: Source of the current time in nanoseconds
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_millis = -1
+        self._counter = 0
+
+    def __call__(self) -> str:
+        """Generate the next ID in canonical UUID text form."""
+        with self._lock:
+            millis = self._clock() // 1_000_000
+            if millis > self._last_millis:
+                self._last_millis = millis
+                # Seeding below half the range leaves room to count up
+                self._counter = secrets.randbits(11)
+            else:
+                self._counter += 1
+                if self._counter > _COUNTER_MAX:
+                    # Counter exhausted: borrow the next millisecond
+                    self._last_millis += 1
+                    self._counter = 0
+            millis, counter = self._last_millis, self._counter
+
+        value = (
+            (millis & _TIMESTAMP_MASK) << 80
+            | _VERSION_7 << 76
+            | counter << 64
+            | _VARIANT_RFC << 62
+            | secrets.randbits(62)
+        )
+        return str(uuid.UUID(int=value))
+
+
+uuid7 = Uuid7Generator()
+
+
+def new_id() -> str:
+    """Generate the ID of a new entity.
+
+    Returns:
+        Time-ordered UUID version 7 in canonical text form
+    """
+    return uuid7()
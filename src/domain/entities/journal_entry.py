@@ -12,6 +12,7 @@ from src.domain.entities.entity import Entity
 from src.domain.value_objects import JournalContent
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from datetime import datetime
 
 
@@ -32,6 +33,7 @@ class JournalEntry(Entity):
             self.portfolio_id: str | None = None
             self.stock_id: str | None = None
             self.transaction_id: str | None = None
+            self.tags: Iterable[str] = ()
             self.entity_id: str | None = None
 
         def with_entry_date(self, entry_date: datetime) -> Self:
@@ -59,6 +61,11 @@ class JournalEntry(Entity):
             self.transaction_id = transaction_id
             return self
 
+        def with_tags(self, tags: Iterable[str]) -> Self:
+            """Set the tags."""
+            self.tags = tags
+            return self
+
         def with_id(self, entity_id: str | None) -> Self:
             """Set the entity ID."""
             self.entity_id = entity_id
@@ -84,6 +91,7 @@ class JournalEntry(Entity):
         portfolio_id = _builder_instance.portfolio_id
         stock_id = _builder_instance.stock_id
         transaction_id = _builder_instance.transaction_id
+        tags = _normalize_tags(_builder_instance.tags)
         entity_id = _builder_instance.entity_id
 
         # Validate required fields
@@ -114,6 +122,7 @@ class JournalEntry(Entity):
         self._portfolio_id = portfolio_id
         self._stock_id = stock_id
         self._transaction_id = transaction_id
+        self._tags = tags
 
     # Core attributes
     @property
@@ -141,6 +150,11 @@ class JournalEntry(Entity):
         """Get transaction ID."""
         return self._transaction_id
 
+    @property
+    def tags(self) -> tuple[str, ...]:
+        """Get tags, normalized to lowercase and sorted."""
+        return self._tags
+
     # Business methods
     def is_related_to_portfolio(self) -> bool:
         """Check if entry is related to a portfolio."""
@@ -165,6 +179,14 @@ class JournalEntry(Entity):
         else:
             self._content = content
 
+    def has_tag(self, tag: str) -> bool:
+        """Check if entry is tagged with the given tag (case-insensitive)."""
+        return tag.strip().lower() in self._tags
+
+    def update_tags(self, tags: Iterable[str]) -> None:
+        """Replace entry tags."""
+        self._tags = _normalize_tags(tags)
+
     # Representation
 
     def __str__(self) -> str:
@@ -175,3 +197,19 @@ class JournalEntry(Entity):
     def __repr__(self) -> str:
         """Developer representation."""
         return f"JournalEntry(date={self._entry_date})"
+
+
+def _normalize_tags(tags: Iterable[str]) -> tuple[str, ...]:
+    """Normalize tags to a sorted tuple of unique lowercase strings.
+
+    Raises:
+        ValueError: If a tag is empty or contains a comma
+    """
+    normalized: set[str] = set()
+    for tag in tags:
+        value = tag.strip().lower()
+        if not value or "," in value:
+            msg = f"Invalid tag: {tag!r}"
+            raise ValueError(msg)
+        normalized.add(value)
+    return tuple(sorted(normalized))
@@ -36,6 +36,7 @@ class Position(Entity):
             self.average_cost: Money | None = None
             self.last_transaction_date: datetime | None = None
             self.entity_id: str | None = None
+            self.version: int = 1
 
         def with_portfolio_id(self, portfolio_id: str) -> Self:
             """Set the portfolio ID."""
@@ -70,6 +71,11 @@ class Position(Entity):
             self.entity_id = entity_id
             return self
 
+        def with_version(self, version: int) -> Self:
+            """Set the row version the entity was loaded with."""
+            self.version = version
+            return self
+
         def build(self) -> Position:
             """Build and return the Position instance."""
             return Position(_builder_instance=self)
@@ -87,6 +93,7 @@ class Position(Entity):
         average_cost = _builder_instance.average_cost
         last_transaction_date = _builder_instance.last_transaction_date
         entity_id = _builder_instance.entity_id
+        version = _builder_instance.version
 
         # Validate required fields
         if portfolio_id is None:
@@ -111,7 +118,7 @@ class Position(Entity):
             raise ValueError(msg)
 
         # Store validated attributes
-        super().__init__(id=entity_id)
+        super().__init__(id=entity_id, version=version)
         self._portfolio_id = portfolio_id
         self._stock_id = stock_id
         self._quantity = quantity
@@ -46,6 +46,7 @@ class Stock(Entity):
             self.grade: Grade | None = None
             self.notes: Notes | None = None
             self.entity_id: str | None = None
+            self.version: int = 1
 
         def with_symbol(self, symbol: StockSymbol) -> Self:
             """Set the stock symbol."""
@@ -82,6 +83,11 @@ class Stock(Entity):
             self.entity_id = entity_id
             return self
 
+        def with_version(self, version: int) -> Self:
+            """Set the row version the entity was loaded with."""
+            self.version = version
+            return self
+
         def build(self) -> Stock:
             """Build and return the Stock instance."""
             return Stock(_builder_instance=self)
@@ -100,6 +106,7 @@ class Stock(Entity):
         grade = _builder_instance.grade
         notes = _builder_instance.notes
         entity_id = _builder_instance.entity_id
+        version = _builder_instance.version
 
         # Validate required fields
         if symbol is None:
@@ -107,7 +114,7 @@ class Stock(Entity):
             raise ValueError(msg)
 
         # Initialize parent
-        super().__init__(id=entity_id)
+        super().__init__(id=entity_id, version=version)
 
         # Store value objects directly (they're already validated)
         self._symbol = symbol
@@ -13,6 +13,7 @@ from src.domain.value_objects import Money, Notes, Quantity, TransactionType
 
 if TYPE_CHECKING:
     from datetime import datetime
+    from decimal import Decimal
 
 
 class Transaction(Entity):
@@ -170,6 +171,22 @@ class Transaction(Entity):
         """Get notes."""
         return self._notes
 
+    @property
+    def natural_key(self) -> tuple[str, str, str, datetime, Decimal, Decimal]:
+        """Get the fields that identify the same fill across imports.
+
+        Returns:
+            Portfolio ID, stock ID, type, date, quantity and price
+        """
+        return (
+            self._portfolio_id,
+            self._stock_id,
+            self._transaction_type.value,
+            self._transaction_date,
+            self._quantity.value,
+            self._price.value,
+        )
+
     # Business methods
     def calculate_total_value(self) -> Money:
         """Calculate total transaction value (quantity * price)."""
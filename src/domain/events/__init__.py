@@ -3,3 +3,12 @@
 Domain events represent significant business occurrences
 that other parts of the system may need to react to.
 """
+
+from .base import DomainEvent
+from .stock_events import StockAddedEvent, StockUpdatedEvent
+
+__all__ = [
+    "DomainEvent",
+    "StockAddedEvent",
+    "StockUpdatedEvent",
+]
@@ -6,6 +6,7 @@ loose coupling between aggregates and bounded contexts.
 
 import uuid
 from datetime import UTC, datetime
+from typing import Any, Self
 
 
 class DomainEvent:
@@ -15,13 +16,19 @@ class DomainEvent:
     that other parts of the system may need to react to.
     """
 
-    def __init__(self, occurred_at: datetime | None = None) -> None:
+    def __init__(
+        self,
+        occurred_at: datetime | None = None,
+        *,
+        event_id: str | None = None,
+    ) -> None:
         """Initialize domain event.
 
         Args:
             occurred_at: When the event occurred (defaults to now)
+            event_id: Existing event identifier when restoring a stored event
         """
-        self._event_id = str(uuid.uuid4())
+        self._event_id = event_id or str(uuid.uuid4())
         self._occurred_at = occurred_at or datetime.now(UTC)
 
     @property
@@ -34,6 +41,40 @@ class DomainEvent:
         """Get when the event occurred."""
         return self._occurred_at
 
+    @classmethod
+    def event_type(cls) -> str:
+        """Get the stable name used to store and route this kind of event."""
+        return cls.__name__
+
+    def to_payload(self) -> dict[str, Any]:
+        """Get the event-specific data as JSON-compatible values.
+
+        Returns:
+            Event data, excluding the event ID and timestamp
+        """
+        return {}
+
+    @classmethod
+    def from_payload(
+        cls,
+        payload: dict[str, Any],
+        *,
+        event_id: str,
+        occurred_at: datetime,
+    ) -> Self:
+        """Restore an event from data produced by to_payload.
+
+        Args:
+            payload: Event data from to_payload
+            event_id: Identifier of the original event
+            occurred_at: When the original event occurred
+
+        Returns:
+            Event equal to the original
+        """
+        _ = payload
+        return cls(occurred_at, event_id=event_id)
+
     def __eq__(self, other: object) -> bool:
         """Check equality based on event ID."""
         if not isinstance(other, DomainEvent):
@@ -4,6 +4,7 @@ Events that represent significant occurrences in the stock subdomain.
 """
 
 from datetime import datetime
+from typing import Any, Self
 
 from src.domain.events.base import DomainEvent
 from src.domain.value_objects.stock_symbol import StockSymbol
@@ -20,29 +21,32 @@ class StockAddedEvent(DomainEvent):
         self,
         stock_symbol: StockSymbol,
         stock_name: str,
-        stock_id: int,
+        stock_id: str,
         occurred_at: datetime | None = None,
+        *,
+        event_id: str | None = None,
     ) -> None:
         """Initialize StockAddedEvent.
 
         Args:
             stock_symbol: Symbol of the added stock
             stock_name: Name of the company
-            stock_id: Database ID of the stock
+            stock_id: ID of the stock entity
             occurred_at: When the event occurred
+            event_id: Existing event identifier when restoring a stored event
 
         Raises:
             ValueError: If validation fails
         """
-        super().__init__(occurred_at)
+        super().__init__(occurred_at, event_id=event_id)
 
         # Validate inputs
         if not stock_name or not stock_name.strip():
             msg = "Stock name cannot be empty"
             raise ValueError(msg)
 
-        if stock_id <= 0:
-            msg = "Stock ID must be positive"
+        if not stock_id or not stock_id.strip():
+            msg = "Stock ID cannot be empty"
             raise ValueError(msg)
 
         self._stock_symbol = stock_symbol
@@ -60,10 +64,35 @@ class StockAddedEvent(DomainEvent):
         return self._stock_name
 
     @property
-    def stock_id(self) -> int:
+    def stock_id(self) -> str:
         """Get the stock ID."""
         return self._stock_id
 
+    def to_payload(self) -> dict[str, Any]:
+        """Get the stock data as JSON-compatible values."""
+        return {
+            "stock_symbol": self._stock_symbol.value,
+            "stock_name": self._stock_name,
+            "stock_id": self._stock_id,
+        }
+
+    @classmethod
+    def from_payload(
+        cls,
+        payload: dict[str, Any],
+        *,
+        event_id: str,
+        occurred_at: datetime,
+    ) -> Self:
+        """Restore the event from data produced by to_payload."""
+        return cls(
+            stock_symbol=StockSymbol(payload["stock_symbol"]),
+            stock_name=payload["stock_name"],
+            stock_id=payload["stock_id"],
+            occurred_at=occurred_at,
+            event_id=event_id,
+        )
+
     def __str__(self) -> str:
         """String representation for display."""
         return f"StockAddedEvent(symbol={self.stock_symbol}, name={self.stock_name!r})"
@@ -72,6 +101,98 @@ class StockAddedEvent(DomainEvent):
         """Developer representation."""
         return (
             f"StockAddedEvent(stock_symbol={self.stock_symbol!r}, "
-            f"stock_name={self.stock_name!r}, stock_id={self.stock_id}, "
+            f"stock_name={self.stock_name!r}, stock_id={self.stock_id!r}, "
+            f"occurred_at={self.occurred_at.isoformat()})"
+        )
+
+
+class StockUpdatedEvent(DomainEvent):
+    """Event raised when an existing stock's fields are changed."""
+
+    def __init__(
+        self,
+        stock_symbol: StockSymbol,
+        stock_id: str,
+        changed_fields: tuple[str, ...],
+        occurred_at: datetime | None = None,
+        *,
+        event_id: str | None = None,
+    ) -> None:
+        """Initialize StockUpdatedEvent.
+
+        Args:
+            stock_symbol: Symbol of the stock after the update
+            stock_id: ID of the stock entity
+            changed_fields: Names of the fields included in the update
+            occurred_at: When the event occurred
+            event_id: Existing event identifier when restoring a stored event
+
+        Raises:
+            ValueError: If validation fails
+        """
+        super().__init__(occurred_at, event_id=event_id)
+
+        if not stock_id or not stock_id.strip():
+            msg = "Stock ID cannot be empty"
+            raise ValueError(msg)
+
+        if not changed_fields:
+            msg = "Changed fields cannot be empty"
+            raise ValueError(msg)
+
+        self._stock_symbol = stock_symbol
+        self._stock_id = stock_id
+        self._changed_fields = tuple(sorted(changed_fields))
+
+    @property
+    def stock_symbol(self) -> StockSymbol:
+        """Get the stock symbol."""
+        return self._stock_symbol
+
+    @property
+    def stock_id(self) -> str:
+        """Get the stock ID."""
+        return self._stock_id
+
+    @property
+    def changed_fields(self) -> tuple[str, ...]:
+        """Get the sorted names of the updated fields."""
+        return self._changed_fields
+
+    def to_payload(self) -> dict[str, Any]:
+        """Get the update data as JSON-compatible values."""
+        return {
+            "stock_symbol": self._stock_symbol.value,
+            "stock_id": self._stock_id,
+            "changed_fields": list(self._changed_fields),
+        }
+
+    @classmethod
+    def from_payload(
+        cls,
+        payload: dict[str, Any],
+        *,
+        event_id: str,
+        occurred_at: datetime,
+    ) -> Self:
+        """Restore the event from data produced by to_payload."""
+        return cls(
+            stock_symbol=StockSymbol(payload["stock_symbol"]),
+            stock_id=payload["stock_id"],
+            changed_fields=tuple(payload["changed_fields"]),
+            occurred_at=occurred_at,
+            event_id=event_id,
+        )
+
+    def __str__(self) -> str:
+        """String representation for display."""
+        fields = ", ".join(self._changed_fields)
+        return f"StockUpdatedEvent(symbol={self.stock_symbol}, fields=[{fields}])"
+
+    def __repr__(self) -> str:
+        """Developer representation."""
+        return (
+            f"StockUpdatedEvent(stock_symbol={self.stock_symbol!r}, "
+            f"stock_id={self.stock_id!r}, changed_fields={self.changed_fields!r}, "
             f"occurred_at={self.occurred_at.isoformat()})"
         )
@@ -25,6 +25,7 @@ Exception Hierarchy:
     ├── AlreadyExistsError (duplicate entity)
     │   ├── StockAlreadyExistsError
     │   └── PortfolioAlreadyExistsError
+    ├── ConcurrencyConflictError (entity changed since it was loaded)
     └── BusinessRuleViolationError (business logic violations)
         ├── InvalidStockSymbolError
         ├── InvalidStockGradeError
@@ -57,6 +58,7 @@ Usage Patterns:
 from .base import (
     AlreadyExistsError,
     BusinessRuleViolationError,
+    ConcurrencyConflictError,
     DomainError,
     NotFoundError,
 )
@@ -76,6 +78,7 @@ from .stock import (
 __all__ = [
     "AlreadyExistsError",
     "BusinessRuleViolationError",
+    "ConcurrencyConflictError",
     "DomainError",
     "InactivePortfolioError",
     "InvalidStockGradeError",
@@ -14,6 +14,11 @@ Usage Examples:
     >>> raise AlreadyExistsError("Portfolio", "My Portfolio")
     AlreadyExistsError: Portfolio with identifier 'My Portfolio' already exists
 
+    >>> # Raise a concurrency conflict
+    >>> raise ConcurrencyConflictError("Stock", "stock-1", expected_version=3)
+    ConcurrencyConflictError: Stock with identifier 'stock-1' was modified
+        concurrently (expected version 3)
+
     >>> # Raise a business rule violation
     >>> raise BusinessRuleViolationError(
     ...     rule="minimum_portfolio_value",
@@ -129,6 +134,51 @@ class AlreadyExistsError(DomainError):
         return f"{self.entity_type} with identifier '{self.identifier}' already exists"
 
 
+class ConcurrencyConflictError(DomainError):
+    """Exception raised when an entity changed since it was loaded.
+
+    This exception should be raised when an optimistic update finds that
+    the stored row version no longer matches the version the entity was
+    loaded with. It's typically mapped to HTTP 409 Conflict responses in
+    the presentation layer.
+
+    When to use:
+        - A conditional update matched no row although the entity exists
+        - A client submits a change based on a stale version of an entity
+
+    Example:
+        >>> # In a repository
+        >>> if result.rowcount == 0 and self._exists(stock.id):
+        >>>     raise ConcurrencyConflictError("Stock", stock.id, stock.version)
+    """
+
+    def __init__(
+        self,
+        entity_type: str,
+        identifier: Any,
+        expected_version: int,
+    ) -> None:
+        """Initialize ConcurrencyConflictError.
+
+        Args:
+            entity_type: The type of entity that was modified
+                (e.g., "Stock", "Position")
+            identifier: The identifier of the modified entity
+            expected_version: The row version the update expected to replace
+        """
+        self.entity_type = entity_type
+        self.identifier = identifier
+        self.expected_version = expected_version
+        super().__init__(self._create_message())
+
+    def _create_message(self) -> str:
+        """Create exception message."""
+        return (
+            f"{self.entity_type} with identifier '{self.identifier}' was modified "
+            f"concurrently (expected version {self.expected_version})"
+        )
+
+
 class BusinessRuleViolationError(DomainError):
     """Exception raised when a business rule is violated.
 
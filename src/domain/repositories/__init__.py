@@ -7,6 +7,7 @@ without coupling the domain to specific implementations.
 # Re-export all interfaces from the new package structure
 from .interfaces import (
     IJournalRepository,
+    IOutboxRepository,
     IPortfolioBalanceRepository,
     IPortfolioRepository,
     IStockBookUnitOfWork,
@@ -14,6 +15,9 @@ from .interfaces import (
     ITargetRepository,
     ITransactionRepository,
     IUnitOfWork,
+    JournalSearchPage,
+    JournalSearchResult,
+    OutboxMessage,
 )
 
 # pylint: disable=duplicate-code
@@ -22,6 +26,7 @@ from .interfaces import (
 # to properly expose the public API at different import levels.
 __all__ = [
     "IJournalRepository",
+    "IOutboxRepository",
     "IPortfolioBalanceRepository",
     "IPortfolioRepository",
     "IStockBookUnitOfWork",
@@ -29,4 +34,7 @@ __all__ = [
     "ITargetRepository",
     "ITransactionRepository",
     "IUnitOfWork",
+    "JournalSearchPage",
+    "JournalSearchResult",
+    "OutboxMessage",
 ]
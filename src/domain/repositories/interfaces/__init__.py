@@ -4,7 +4,12 @@ This package contains abstract base classes defining repository contracts
 for each aggregate root in the domain model, following Interface Segregation Principle.
 """
 
-from .journal_repository import IJournalRepository
+from .journal_repository import (
+    IJournalRepository,
+    JournalSearchPage,
+    JournalSearchResult,
+)
+from .outbox_repository import IOutboxRepository, OutboxMessage
 from .portfolio_balance_repository import IPortfolioBalanceRepository
 from .portfolio_repository import IPortfolioRepository
 from .position_repository import IPositionRepository
@@ -15,6 +20,7 @@ from .unit_of_work import IStockBookUnitOfWork, IUnitOfWork
 
 __all__ = [
     "IJournalRepository",
+    "IOutboxRepository",
     "IPortfolioBalanceRepository",
     "IPortfolioRepository",
     "IPositionRepository",
@@ -23,4 +29,7 @@ __all__ = [
     "ITargetRepository",
     "ITransactionRepository",
     "IUnitOfWork",
+    "JournalSearchPage",
+    "JournalSearchResult",
+    "OutboxMessage",
 ]
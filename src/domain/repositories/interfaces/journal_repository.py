@@ -4,11 +4,30 @@ Defines the contract for journal entry data persistence operations.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import date
 
 from src.domain.entities import JournalEntry
 
 
+@dataclass(frozen=True)
+class JournalSearchResult:
+    """A journal entry matched by a full-text search."""
+
+    entry: JournalEntry
+    snippet: str  # Matching excerpt with hits wrapped in [brackets]
+    rank: float  # Relevance score; lower is more relevant
+
+
+@dataclass(frozen=True)
+class JournalSearchPage:
+    """One page of journal search results."""
+
+    results: list[JournalSearchResult]
+    next_cursor: str | None  # Pass to search() for the next page; None at the end
+
+
 class IJournalRepository(ABC):
     """Abstract interface for journal entry data operations."""
 
@@ -133,3 +152,40 @@ class IJournalRepository(ABC):
         Raises:
             DatabaseError: If deletion fails
         """
+
+    @abstractmethod
+    def get_by_tag(self, tag: str, limit: int | None = None) -> list[JournalEntry]:
+        """Retrieve journal entries carrying a tag.
+
+        Args:
+            tag: Tag to match (case-insensitive)
+            limit: Maximum number of entries to return
+
+        Returns:
+            List of JournalEntry domain models, ordered by date (newest first)
+        """
+
+    @abstractmethod
+    def search(
+        self,
+        query: str,
+        *,
+        tags: Sequence[str] = (),
+        limit: int = 20,
+        cursor: str | None = None,
+    ) -> JournalSearchPage:
+        """Full-text search over journal entries, most relevant first.
+
+        Args:
+            query: Search terms; all terms must match, a trailing * matches
+                a prefix
+            tags: Only return entries carrying all of these tags
+            limit: Maximum number of results per page
+            cursor: Cursor from a previous page's next_cursor
+
+        Returns:
+            Page of ranked results
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
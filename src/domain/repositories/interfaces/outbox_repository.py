@@ -0,0 +1,72 @@
+"""Outbox repository interface.
+
+Defines the contract for storing domain events in the same transaction as
+the changes that raised them, for reading them back for dispatch, and for
+deleting them once they have been delivered.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class OutboxMessage:
+    """A serialized domain event waiting in the outbox."""
+
+    event_id: str
+    event_type: str
+    payload: str  # JSON-encoded event data
+    occurred_at: datetime
+    sequence: int | None = None  # Assigned by the store, increasing in write order
+
+
+class IOutboxRepository(ABC):
+    """Abstract interface for the transactional event outbox."""
+
+    @abstractmethod
+    def add(self, messages: Sequence[OutboxMessage]) -> None:
+        """Store messages as part of the current transaction.
+
+        Args:
+            messages: Messages to store
+        """
+
+    @abstractmethod
+    def get_pending(
+        self,
+        limit: int,
+        after_sequence: int = 0,
+    ) -> list[OutboxMessage]:
+        """Retrieve messages that have not been dispatched yet, oldest first.
+
+        Args:
+            limit: Maximum number of messages to return
+            after_sequence: Only return messages written after this sequence
+
+        Returns:
+            Pending messages ordered by sequence
+        """
+
+    @abstractmethod
+    def mark_dispatched(self, event_ids: Sequence[str]) -> int:
+        """Mark messages as delivered so they are not returned again.
+
+        Args:
+            event_ids: IDs of the delivered events
+
+        Returns:
+            Number of messages marked
+        """
+
+    @abstractmethod
+    def purge_dispatched(self, dispatched_before: datetime) -> int:
+        """Delete messages that were delivered before a point in time.
+
+        Args:
+            dispatched_before: Messages dispatched earlier than this are deleted
+
+        Returns:
+            Number of messages deleted
+        """
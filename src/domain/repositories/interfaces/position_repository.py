@@ -4,6 +4,7 @@ Defines the contract for position data persistence operations.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
 from src.domain.entities import Position
 
@@ -41,6 +42,7 @@ class IPositionRepository(ABC):
         Raises:
             ValidationError: If position data is invalid
             BusinessLogicError: If update violates business rules
+            ConcurrencyConflictError: If the position changed since it was loaded
             DatabaseError: If update fails
         """
 
@@ -82,6 +84,21 @@ class IPositionRepository(ABC):
             List of Position domain models for the portfolio
         """
 
+    @abstractmethod
+    def get_positions_for_portfolios(
+        self,
+        portfolio_ids: Iterable[str],
+    ) -> dict[str, list[Position]]:
+        """Retrieve positions of several portfolios with a bounded number of queries.
+
+        Args:
+            portfolio_ids: Portfolio identifiers; duplicates are ignored
+
+        Returns:
+            Position domain models keyed by portfolio ID; every requested
+            portfolio is present, with an empty list if it holds nothing
+        """
+
     @abstractmethod
     def delete(self, position_id: str) -> bool:
         """Delete position by ID.
@@ -4,8 +4,10 @@ Defines the contract for stock data persistence operations.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
 
 from src.domain.entities import Stock
+from src.domain.value_objects.stock_query_spec import StockQuerySpec
 from src.domain.value_objects.stock_symbol import StockSymbol
 
 
@@ -23,7 +25,22 @@ class IStockRepository(ABC):
             ID of the created stock
 
         Raises:
-            ValidationError: If stock data is invalid
+            StockAlreadyExistsError: If a stock with the symbol already exists
+            DatabaseError: If creation fails
+        """
+
+    @abstractmethod
+    def create_many(self, stocks: Sequence[Stock]) -> int:
+        """Create several stock records with one bulk insert.
+
+        Args:
+            stocks: Stock domain models with distinct symbols
+
+        Returns:
+            Number of stocks created
+
+        Raises:
+            StockAlreadyExistsError: If a symbol already exists
             DatabaseError: If creation fails
         """
 
@@ -49,6 +66,31 @@ class IStockRepository(ABC):
             Stock domain model or None if not found
         """
 
+    @abstractmethod
+    def get_many_by_ids(self, stock_ids: Iterable[str]) -> dict[str, Stock]:
+        """Retrieve several stocks by ID with a bounded number of queries.
+
+        Args:
+            stock_ids: Stock identifiers; duplicates are ignored
+
+        Returns:
+            Stock domain models keyed by ID; unknown IDs are absent
+        """
+
+    @abstractmethod
+    def get_many_by_symbols(
+        self,
+        symbols: Iterable[StockSymbol],
+    ) -> dict[str, Stock]:
+        """Retrieve several stocks by symbol with a bounded number of queries.
+
+        Args:
+            symbols: Stock symbol value objects; duplicates are ignored
+
+        Returns:
+            Stock domain models keyed by symbol value; unknown symbols are absent
+        """
+
     @abstractmethod
     def get_all(self) -> list[Stock]:
         """Retrieve all stocks.
@@ -69,7 +111,25 @@ class IStockRepository(ABC):
             True if update successful, False otherwise
 
         Raises:
-            ValidationError: If stock data is invalid
+            StockAlreadyExistsError: If another stock has the new symbol
+            ConcurrencyConflictError: If the stock changed since it was loaded
+            DatabaseError: If update fails
+        """
+
+    @abstractmethod
+    def update_and_get(self, stock_id: str, stock: Stock) -> Stock | None:
+        """Update existing stock and return it as stored, in one round trip.
+
+        Args:
+            stock_id: Stock identifier
+            stock: Updated Stock domain model
+
+        Returns:
+            Stock domain model as stored, or None if not found
+
+        Raises:
+            StockAlreadyExistsError: If another stock has the new symbol
+            ConcurrencyConflictError: If the stock changed since it was loaded
             DatabaseError: If update fails
         """
 
@@ -118,3 +178,14 @@ class IStockRepository(ABC):
         Returns:
             List of Stock domain models matching the criteria
         """
+
+    @abstractmethod
+    def find_stocks(self, spec: StockQuerySpec) -> list[Stock]:
+        """Retrieve the stocks matching a query spec, in its sort order.
+
+        Args:
+            spec: Filters and sort order of the listing
+
+        Returns:
+            List of Stock domain models matching the spec
+        """
@@ -4,6 +4,7 @@ Defines the contract for target data persistence operations.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 
 from src.domain.entities import Target
 
@@ -94,3 +95,14 @@ class ITargetRepository(ABC):
         Returns:
             True if update successful, False otherwise
         """
+
+    @abstractmethod
+    def bulk_update_status(self, statuses: Mapping[str, str]) -> int:
+        """Update the status of many targets in a single statement.
+
+        Args:
+            statuses: New status per target ID
+
+        Returns:
+            Number of targets updated
+        """
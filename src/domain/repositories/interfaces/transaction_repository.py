@@ -4,6 +4,7 @@ Defines the contract for transaction data persistence operations.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from datetime import date
 
 from src.domain.entities import Transaction
@@ -28,6 +29,35 @@ class ITransactionRepository(ABC):
             DatabaseError: If creation fails
         """
 
+    @abstractmethod
+    def create_many(self, transactions: Sequence[Transaction]) -> int:
+        """Create several transactions with one bulk insert.
+
+        Args:
+            transactions: Transaction domain models
+
+        Returns:
+            Number of transactions created
+
+        Raises:
+            DatabaseError: If creation fails
+        """
+
+    @abstractmethod
+    def count_stored(self, transactions: Sequence[Transaction]) -> dict[str, int]:
+        """Count the stored transactions matching each candidate.
+
+        A stored transaction matches when it has the same natural key:
+        portfolio, stock, type, date, quantity and price. Identical fills
+        are all kept, so a key can be stored more than once.
+
+        Args:
+            transactions: Candidate transaction domain models
+
+        Returns:
+            Number of matching stored transactions per candidate ID
+        """
+
     @abstractmethod
     def get_by_id(self, transaction_id: str) -> Transaction | None:
         """Retrieve transaction by ID.
@@ -7,6 +7,7 @@ import types
 from abc import ABC, abstractmethod
 
 from .journal_repository import IJournalRepository
+from .outbox_repository import IOutboxRepository
 from .portfolio_balance_repository import IPortfolioBalanceRepository
 from .portfolio_repository import IPortfolioRepository
 from .position_repository import IPositionRepository
@@ -107,3 +108,8 @@ class IStockBookUnitOfWork(IUnitOfWork):
     @abstractmethod
     def journal(self) -> IJournalRepository:
         """Get journal repository instance."""
+
+    @property
+    @abstractmethod
+    def outbox(self) -> IOutboxRepository:
+        """Get event outbox repository instance."""
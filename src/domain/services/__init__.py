@@ -10,14 +10,27 @@ from .exceptions import (
     InsufficientDataError,
     ValidationError,
 )
-from .portfolio_calculation_service import PortfolioCalculationService
+from .portfolio_calculation_service import (
+    HeldSecurity,
+    Holdings,
+    IncrementalAllocation,
+    PortfolioCalculationService,
+)
+from .price_indicator_service import PriceIndicatorConfig, PriceIndicatorService
 from .risk_assessment_service import RiskAssessmentService
+from .target_evaluation_service import TargetEvaluationService
 
 __all__ = [
     "CalculationError",
     "DomainServiceError",
+    "HeldSecurity",
+    "Holdings",
+    "IncrementalAllocation",
     "InsufficientDataError",
     "PortfolioCalculationService",
+    "PriceIndicatorConfig",
+    "PriceIndicatorService",
     "RiskAssessmentService",
+    "TargetEvaluationService",
     "ValidationError",
 ]
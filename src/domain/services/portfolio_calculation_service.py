@@ -1,18 +1,24 @@
 """Portfolio calculation service.
 
 Provides business logic for portfolio-level calculations that operate
-across multiple stocks and provide aggregated insights.
+across multiple stocks and provide aggregated insights. IncrementalAllocation
+keeps running totals so single trades and price ticks update a portfolio's
+allocations without recomputing them from scratch.
 """
 
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from decimal import Decimal
+from typing import Protocol
 
-from src.domain.entities.stock import Stock
 from src.domain.value_objects import (
+    IndustryGroup,
     Money,
     PortfolioAllocation,
+    PortfolioMetrics,
     PositionAllocation,
     Quantity,
+    StockSymbol,
 )
 
 from .exceptions import CalculationError
@@ -31,6 +37,227 @@ class PortfolioCalculationConfig:
     default_currency: str = "USD"
 
 
+class HeldSecurity(Protocol):
+    """What portfolio calculations need to know about a held stock.
+
+    Stock entities satisfy this, and so do lightweight read-model rows that
+    skip hydrating full entities.
+    """
+
+    @property
+    def symbol(self) -> StockSymbol:
+        """Get the stock symbol."""
+        ...
+
+    @property
+    def industry_group(self) -> IndustryGroup | None:
+        """Get the industry group, if classified."""
+        ...
+
+
+Holdings = Sequence[tuple[HeldSecurity, Quantity]]
+
+
+@dataclass
+class _TrackedPosition:
+    """Running state of one position in an IncrementalAllocation."""
+
+    symbol: StockSymbol
+    industry: str
+    quantity: Decimal
+    price: Decimal
+    value: Decimal
+
+
+class IncrementalAllocation:
+    """Allocation breakdown maintained from running totals.
+
+    Keeps the value of every position and the sum per industry and portfolio,
+    so a quantity or price change is applied in O(1). Percentages are only
+    derived when metrics are read, and reused until the next change.
+    """
+
+    def __init__(self, portfolio: Holdings, prices: Mapping[str, Money]) -> None:
+        """Build running totals for a portfolio.
+
+        Args:
+            portfolio: Held securities and their quantities
+            prices: Current price per stock symbol
+
+        Raises:
+            CalculationError: If a held stock has no price
+        """
+        self._positions: dict[str, _TrackedPosition] = {}
+        self._industry_values: dict[str, Decimal] = {}
+        self._industry_counts: dict[str, int] = {}
+        self._total = Decimal("0")
+        self._metrics: PortfolioMetrics | None = None
+        for stock, quantity in portfolio:
+            self.set_position(stock, quantity, prices.get(str(stock.symbol)))
+
+    def __len__(self) -> int:
+        """Get the number of tracked positions."""
+        return len(self._positions)
+
+    def __contains__(self, symbol: object) -> bool:
+        """Check whether a stock symbol is held."""
+        return symbol in self._positions
+
+    @property
+    def total_value(self) -> Money:
+        """Get the current market value of the portfolio."""
+        return Money(self._total)
+
+    def set_position(
+        self,
+        stock: HeldSecurity,
+        quantity: Quantity,
+        price: Money | None = None,
+    ) -> None:
+        """Set the quantity held of a stock, e.g. after a trade.
+
+        Args:
+            stock: Traded security
+            quantity: Quantity held after the trade
+            price: Price to value the position at; defaults to the last
+                price of a position that is already held
+
+        Raises:
+            CalculationError: If no price is given for a new position
+        """
+        symbol = str(stock.symbol)
+        current = self._positions.get(symbol)
+        if price is not None:
+            unit_price = price.value
+        elif current is not None:
+            unit_price = current.price
+        else:
+            msg = f"Stock {stock.symbol} missing current price"
+            raise CalculationError(msg, operation="incremental_allocation")
+        new_quantity = Decimal(str(quantity.value))
+        value = unit_price * new_quantity
+        industry = stock.industry_group.value if stock.industry_group else "Unknown"
+        self._metrics = None
+
+        if current is not None and current.industry == industry:
+            delta = value - current.value
+            current.quantity = new_quantity
+            current.price = unit_price
+            current.value = value
+            self._industry_values[industry] += delta
+            self._total += delta
+            return
+
+        if current is not None:
+            _ = self.remove_position(symbol)
+        self._positions[symbol] = _TrackedPosition(
+            stock.symbol,
+            industry,
+            new_quantity,
+            unit_price,
+            value,
+        )
+        self._industry_values[industry] = (
+            self._industry_values.get(industry, Decimal("0")) + value
+        )
+        self._industry_counts[industry] = self._industry_counts.get(industry, 0) + 1
+        self._total += value
+
+    def remove_position(self, symbol: str) -> bool:
+        """Stop tracking a closed position.
+
+        Args:
+            symbol: Stock symbol of the position
+
+        Returns:
+            True if the position was tracked
+        """
+        position = self._positions.pop(symbol, None)
+        if position is None:
+            return False
+        self._total -= position.value
+        self._industry_counts[position.industry] -= 1
+        if self._industry_counts[position.industry] == 0:
+            del self._industry_counts[position.industry]
+            del self._industry_values[position.industry]
+        else:
+            self._industry_values[position.industry] -= position.value
+        self._metrics = None
+        return True
+
+    def update_price(self, symbol: str, price: Money) -> bool:
+        """Revalue one position at a new price.
+
+        Args:
+            symbol: Stock symbol the price is for
+            price: Latest price
+
+        Returns:
+            True if the symbol is held and its value changed
+        """
+        position = self._positions.get(symbol)
+        if position is None or position.price == price.value:
+            return False
+        value = price.value * position.quantity
+        delta = value - position.value
+        position.price = price.value
+        position.value = value
+        self._industry_values[position.industry] += delta
+        self._total += delta
+        self._metrics = None
+        return True
+
+    def update_prices(self, prices: Mapping[str, Money]) -> int:
+        """Revalue the held positions of a price batch.
+
+        Args:
+            prices: Latest price per stock symbol; unheld symbols are ignored
+
+        Returns:
+            Number of positions whose value changed
+        """
+        return sum(self.update_price(symbol, price) for symbol, price in prices.items())
+
+    def metrics(self) -> PortfolioMetrics:
+        """Get metrics at the current quantities and prices.
+
+        Returns:
+            The same result PortfolioCalculationService.calculate_metrics
+            gives for the tracked positions
+        """
+        if self._metrics is None:
+            self._metrics = self._build_metrics()
+        return self._metrics
+
+    def _build_metrics(self) -> PortfolioMetrics:
+        """Derive percentages from the running totals."""
+        total_value = Money(self._total)
+        position_allocations: list[PositionAllocation] = []
+        industry_percentages: dict[str, Decimal] = {}
+        if self._total != 0:
+            position_allocations = [
+                PositionAllocation(
+                    symbol=position.symbol,
+                    value=Money(position.value),
+                    percentage=(position.value / self._total) * Decimal("100"),
+                    quantity=int(position.quantity),
+                )
+                for position in self._positions.values()
+            ]
+        for industry, value in self._industry_values.items():
+            industry_percentages[industry] = (
+                (value / self._total) * Decimal("100")
+                if self._total > 0
+                else Decimal("0")
+            )
+        return PortfolioMetrics(
+            total_value=total_value,
+            position_count=len(self._positions),
+            position_allocations=position_allocations,
+            industry_allocation=PortfolioAllocation(industry_percentages, total_value),
+        )
+
+
 class PortfolioCalculationService:
     """Service for portfolio-level calculations and analysis.
 
@@ -49,7 +276,7 @@ class PortfolioCalculationService:
 
     def calculate_total_value(
         self,
-        portfolio: list[tuple[Stock, Quantity]],
+        portfolio: Holdings,
         prices: dict[str, Money],
     ) -> Money:
         """Calculate total portfolio market value."""
@@ -75,7 +302,7 @@ class PortfolioCalculationService:
 
     def calculate_position_value(
         self,
-        _stock: Stock,
+        _stock: HeldSecurity,
         quantity: Quantity,
         current_price: Money,
     ) -> Money:
@@ -84,7 +311,7 @@ class PortfolioCalculationService:
 
     def calculate_position_allocations(
         self,
-        portfolio: list[tuple[Stock, Quantity]],
+        portfolio: Holdings,
         prices: dict[str, Money],
     ) -> list[PositionAllocation]:
         """Calculate allocation percentage for each position."""
@@ -109,7 +336,7 @@ class PortfolioCalculationService:
 
     def _calculate_single_position_allocation(
         self,
-        stock: Stock,
+        stock: HeldSecurity,
         quantity: Quantity,
         prices: dict[str, Money],
         total_value: Money,
@@ -129,7 +356,7 @@ class PortfolioCalculationService:
 
     def calculate_industry_allocations(
         self,
-        portfolio: list[tuple[Stock, Quantity]],
+        portfolio: Holdings,
         prices: dict[str, Money],
     ) -> PortfolioAllocation:
         """Calculate allocation by industry sectors."""
@@ -145,9 +372,57 @@ class PortfolioCalculationService:
 
         return PortfolioAllocation(industry_percentages, total_value)
 
+    def calculate_metrics(
+        self,
+        portfolio: Holdings,
+        prices: dict[str, Money],
+    ) -> PortfolioMetrics:
+        """Calculate total value and both allocations in one pass.
+
+        The total is computed once and shared by the position and industry
+        allocations instead of being recomputed for each.
+        """
+        total_value = self.calculate_total_value(portfolio, prices)
+        position_allocations: list[PositionAllocation] = []
+        industry_percentages: dict[str, Decimal] = {}
+        if total_value.value != 0:
+            position_allocations = [
+                self._calculate_single_position_allocation(
+                    stock,
+                    quantity,
+                    prices,
+                    total_value,
+                )
+                for stock, quantity in portfolio
+            ]
+        if portfolio:
+            industry_percentages = self._convert_to_percentages(
+                self._calculate_industry_values(portfolio, prices),
+                total_value,
+            )
+
+        return PortfolioMetrics(
+            total_value=total_value,
+            position_count=len(portfolio),
+            position_allocations=position_allocations,
+            industry_allocation=PortfolioAllocation(industry_percentages, total_value),
+        )
+
+    def build_incremental_allocation(
+        self,
+        portfolio: Holdings,
+        prices: Mapping[str, Money],
+    ) -> IncrementalAllocation:
+        """Build running allocation totals for a portfolio.
+
+        Raises:
+            CalculationError: If a held stock has no price
+        """
+        return IncrementalAllocation(portfolio, prices)
+
     def _calculate_industry_values(
         self,
-        portfolio: list[tuple[Stock, Quantity]],
+        portfolio: Holdings,
         prices: dict[str, Money],
     ) -> dict[str, Decimal]:
         """Calculate total values by industry."""
@@ -0,0 +1,498 @@
+"""Price indicator service.
+
+Computes moving-average indicators (SMA, EMA, gap to the moving average and
+its rolling maximum) for whole watchlists, and keeps per-stock state so a
+newly appended bar can be folded in without rescanning history.
+"""
+
+import math
+from collections import deque
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from decimal import Decimal
+from itertools import accumulate, islice, pairwise
+
+from src.domain.value_objects import (
+    IndicatorSnapshot,
+    Money,
+    PriceAnalysis,
+    StockSymbol,
+    TrendDirection,
+)
+
+from .exceptions import InsufficientDataError, ValidationError
+
+
+@dataclass(frozen=True)
+class PriceIndicatorConfig:
+    """Configuration for price indicator calculations."""
+
+    moving_average_window: int = 50
+    gap_lookback_window: int = 252  # One trading year
+    trend_lookback: int = 20
+    trend_threshold: Decimal = field(
+        default_factory=lambda: Decimal("0.01"),
+    )  # 1% moving average slope over the lookback
+    max_annualized_volatility: Decimal = field(
+        default_factory=lambda: Decimal("1.0"),
+    )  # Annualized volatility that maps to a score of 1
+    trading_days_per_year: int = 252
+
+    def __post_init__(self) -> None:
+        """Validate window sizes."""
+        for name in ("moving_average_window", "gap_lookback_window", "trend_lookback"):
+            if getattr(self, name) < 1:
+                msg = f"{name} must be positive"
+                raise ValidationError(msg, field=name, value=getattr(self, name))
+
+
+def simple_moving_average(closes: Sequence[float], window: int) -> list[float | None]:
+    """Compute the simple moving average of a price series.
+
+    Uses a prefix-sum array so every window average is a single subtraction,
+    making the whole series O(n) regardless of the window size.
+
+    Args:
+        closes: Closing prices, oldest first
+        window: Number of bars in each average
+
+    Returns:
+        List aligned with closes; None until the first full window
+    """
+    if len(closes) < window:
+        return [None] * len(closes)
+    prefix = [0.0, *accumulate(closes)]
+    averages: list[float | None] = [None] * (window - 1)
+    averages.extend(
+        (prefix[end] - prefix[end - window]) / window
+        for end in range(window, len(prefix))
+    )
+    return averages
+
+
+def exponential_moving_average(
+    closes: Sequence[float],
+    window: int,
+) -> list[float | None]:
+    """Compute the exponential moving average of a price series.
+
+    The average is seeded with the simple average of the first full window,
+    then smoothed with alpha = 2 / (window + 1).
+
+    Args:
+        closes: Closing prices, oldest first
+        window: Smoothing window in bars
+
+    Returns:
+        List aligned with closes; None until the first full window
+    """
+    if len(closes) < window:
+        return [None] * len(closes)
+    alpha = 2.0 / (window + 1)
+    ema = math.fsum(islice(closes, window)) / window
+    averages: list[float | None] = [None] * (window - 1)
+    averages.append(ema)
+    for close in islice(closes, window, None):
+        ema += alpha * (close - ema)
+        averages.append(ema)
+    return averages
+
+
+def gap_percentages(
+    closes: Sequence[float],
+    averages: Sequence[float | None],
+) -> list[float | None]:
+    """Compute each close's distance from its moving average, in percent.
+
+    Args:
+        closes: Closing prices, oldest first
+        averages: Moving average aligned with closes
+
+    Returns:
+        List aligned with closes; None where the average is undefined
+    """
+    return [
+        None if average is None else (close - average) / average * 100.0
+        for close, average in zip(closes, averages, strict=True)
+    ]
+
+
+def rolling_max(values: Sequence[float | None], window: int) -> list[float | None]:
+    """Compute the rolling maximum over a trailing window.
+
+    Uses a monotonic deque so each value is pushed and popped at most once,
+    giving O(n) total work independent of the window size. Undefined (None)
+    values are skipped.
+
+    Args:
+        values: Series to scan, oldest first
+        window: Number of bars in each trailing window
+
+    Returns:
+        List aligned with values; None where the window holds no values
+    """
+    candidates: deque[tuple[int, float]] = deque()
+    maxima: list[float | None] = []
+    for index, value in enumerate(values):
+        _push_max(candidates, index, value, window)
+        maxima.append(candidates[0][1] if candidates else None)
+    return maxima
+
+
+def _push_max(
+    candidates: deque[tuple[int, float]],
+    index: int,
+    value: float | None,
+    window: int,
+) -> None:
+    """Add a value to a monotonic max-deque and evict expired entries."""
+    if value is not None:
+        while candidates and candidates[-1][1] <= value:
+            _ = candidates.pop()
+        candidates.append((index, value))
+    while candidates and candidates[0][0] <= index - window:
+        _ = candidates.popleft()
+
+
+def classify_trend(
+    close: float,
+    average: float,
+    earlier_average: float,
+    threshold: float,
+) -> TrendDirection:
+    """Classify the price trend from the moving average slope.
+
+    Args:
+        close: Latest closing price
+        average: Latest moving average
+        earlier_average: Moving average at the start of the trend lookback
+        threshold: Minimum relative slope for a directional trend
+
+    Returns:
+        UPWARD when price is above a rising average, DOWNWARD when below a
+        falling one, SIDEWAYS otherwise
+    """
+    slope = (average - earlier_average) / earlier_average
+    if close > average and slope > threshold:
+        return TrendDirection.UPWARD
+    if close < average and slope < -threshold:
+        return TrendDirection.DOWNWARD
+    return TrendDirection.SIDEWAYS
+
+
+def _to_decimal(value: float) -> Decimal:
+    """Convert an indicator float to a Decimal at display precision."""
+    return Decimal(str(round(value, 6)))
+
+
+class IndicatorState:
+    """Running indicator state for one stock.
+
+    Holds just enough trailing data (the moving average window, the
+    monotonic deque of gap maxima, recent averages and returns) to fold
+    in a new bar in O(1) amortized time.
+    """
+
+    # Re-sum the window with fsum this often to stop float drift
+    _RESYNC_INTERVAL = 1024
+
+    def __init__(self, symbol: StockSymbol, config: PriceIndicatorConfig) -> None:
+        """Initialize empty state for a stock.
+
+        Args:
+            symbol: Stock the state belongs to
+            config: Indicator configuration
+        """
+        self._symbol = symbol
+        self._config = config
+        self._window_size = config.moving_average_window
+        self._alpha = 2.0 / (self._window_size + 1)
+        self._threshold = float(config.trend_threshold)
+        self._bar_count = 0
+        self._last_close: float | None = None
+        self._window: deque[float] = deque(maxlen=self._window_size)
+        self._window_sum = 0.0
+        self._ema: float | None = None
+        self._gap: float | None = None
+        self._gap_maxima: deque[tuple[int, float]] = deque()
+        self._averages: deque[float] = deque(maxlen=config.trend_lookback + 1)
+        self._returns: deque[float] = deque(maxlen=self._window_size)
+        self._returns_sum = 0.0
+        self._returns_sum_sq = 0.0
+
+    @property
+    def symbol(self) -> StockSymbol:
+        """Get the stock symbol."""
+        return self._symbol
+
+    @property
+    def bar_count(self) -> int:
+        """Get the number of bars folded into the state."""
+        return self._bar_count
+
+    @property
+    def is_ready(self) -> bool:
+        """Check if enough bars have been seen to produce indicators."""
+        return self._gap is not None
+
+    def seed(self, closes: Sequence[float]) -> None:
+        """Load an initial price history into empty state.
+
+        Only the EMA needs the full history; every other piece of state is
+        rebuilt from the trailing bars using the batch series functions.
+
+        Args:
+            closes: Closing prices, oldest first
+
+        Raises:
+            ValidationError: If the state already holds bars or a price is
+                not positive
+        """
+        if self._bar_count:
+            msg = "Indicator state can only be seeded once"
+            raise ValidationError(msg, field="closes")
+        _validate_closes(closes)
+        if not closes:
+            return
+
+        config = self._config
+        tail_size = config.gap_lookback_window + self._window_size - 1
+        tail_size = max(tail_size, config.trend_lookback + self._window_size)
+        tail_start = max(len(closes) - tail_size, 0)
+        tail = closes[tail_start:]
+
+        averages = simple_moving_average(tail, self._window_size)
+        gaps = gap_percentages(tail, averages)
+        for offset, gap in enumerate(gaps):
+            _push_max(
+                self._gap_maxima,
+                tail_start + offset,
+                gap,
+                config.gap_lookback_window,
+            )
+        self._averages.extend(average for average in averages if average is not None)
+        self._gap = gaps[-1]
+        self._ema = exponential_moving_average(closes, self._window_size)[-1]
+
+        self._window.extend(closes[-self._window_size :])
+        self._window_sum = math.fsum(self._window)
+        recent = closes[-(self._window_size + 1) :]
+        self._returns.extend(
+            current / previous - 1.0 for previous, current in pairwise(recent)
+        )
+        self._returns_sum = math.fsum(self._returns)
+        self._returns_sum_sq = math.fsum(r * r for r in self._returns)
+        self._last_close = closes[-1]
+        self._bar_count = len(closes)
+
+    def append(self, close: float) -> None:
+        """Fold one new closing price into the state.
+
+        Args:
+            close: Latest closing price
+
+        Raises:
+            ValidationError: If the price is not positive
+        """
+        _validate_closes((close,))
+        if self._last_close is not None:
+            self._push_return(close / self._last_close - 1.0)
+        self._last_close = close
+
+        if len(self._window) == self._window_size:
+            self._window_sum -= self._window[0]
+        self._window.append(close)
+        self._window_sum += close
+        index = self._bar_count
+        self._bar_count += 1
+        if self._bar_count % self._RESYNC_INTERVAL == 0:
+            self._window_sum = math.fsum(self._window)
+
+        gap: float | None = None
+        if len(self._window) == self._window_size:
+            average = self._window_sum / self._window_size
+            if self._ema is None:
+                self._ema = average
+            else:
+                self._ema += self._alpha * (close - self._ema)
+            gap = (close - average) / average * 100.0
+            self._averages.append(average)
+            self._gap = gap
+        _push_max(self._gap_maxima, index, gap, self._config.gap_lookback_window)
+
+    def snapshot(self) -> IndicatorSnapshot:
+        """Build the latest indicator snapshot.
+
+        Returns:
+            IndicatorSnapshot for the most recent bar
+
+        Raises:
+            InsufficientDataError: If fewer bars than the moving average
+                window have been seen
+        """
+        if (
+            self._gap is None
+            or self._ema is None
+            or self._last_close is None
+            or not self._gap_maxima
+        ):
+            msg = (
+                f"Need at least {self._window_size} bars for {self._symbol}, "
+                f"got {self._bar_count}"
+            )
+            raise InsufficientDataError(msg, required_fields=["closes"])
+
+        average = self._averages[-1]
+        trend = classify_trend(
+            self._last_close,
+            average,
+            self._averages[0],
+            self._threshold,
+        )
+        return IndicatorSnapshot(
+            symbol=self._symbol,
+            current_price=Money(_to_decimal(self._last_close)),
+            moving_average=_to_decimal(average),
+            exponential_average=_to_decimal(self._ema),
+            gap_percentage=_to_decimal(self._gap),
+            max_gap_percentage=_to_decimal(self._gap_maxima[0][1]),
+            trend_direction=trend,
+            volatility_score=self._volatility_score(),
+        )
+
+    def _push_return(self, value: float) -> None:
+        """Add a daily return to the rolling volatility window."""
+        if len(self._returns) == self._returns.maxlen:
+            oldest = self._returns[0]
+            self._returns_sum -= oldest
+            self._returns_sum_sq -= oldest * oldest
+        self._returns.append(value)
+        self._returns_sum += value
+        self._returns_sum_sq += value * value
+
+    def _volatility_score(self) -> Decimal:
+        """Scale annualized volatility of recent returns onto 0-1."""
+        count = len(self._returns)
+        if count < 2:  # noqa: PLR2004
+            return Decimal("0")
+        mean = self._returns_sum / count
+        variance = max(self._returns_sum_sq / count - mean * mean, 0.0)
+        annualized = math.sqrt(variance * self._config.trading_days_per_year)
+        score = annualized / float(self._config.max_annualized_volatility)
+        return _to_decimal(min(score, 1.0))
+
+
+def _validate_closes(closes: Sequence[float]) -> None:
+    """Reject non-positive prices, which make the gap undefined."""
+    for close in closes:
+        if close <= 0:
+            msg = "Closing prices must be positive"
+            raise ValidationError(msg, field="close", value=close)
+
+
+class PriceIndicatorService:
+    """Service for moving-average indicators across a watchlist.
+
+    Batch scans use prefix sums and monotonic deques so each symbol costs
+    O(n) in its history length; the returned states then absorb each new
+    bar in O(1).
+    """
+
+    def __init__(self, config: PriceIndicatorConfig | None = None) -> None:
+        """Initialize price indicator service with optional configuration.
+
+        Args:
+            config: Configuration settings for indicators, uses defaults if None
+        """
+        self.config = config or PriceIndicatorConfig()
+
+    def create_state(
+        self,
+        symbol: StockSymbol,
+        closes: Sequence[float] = (),
+    ) -> IndicatorState:
+        """Create incremental indicator state seeded with a price history.
+
+        Args:
+            symbol: Stock the history belongs to
+            closes: Closing prices, oldest first
+
+        Returns:
+            IndicatorState ready for append()
+        """
+        state = IndicatorState(symbol, self.config)
+        state.seed(closes)
+        return state
+
+    def scan(
+        self,
+        histories: Mapping[StockSymbol, Sequence[float]],
+    ) -> dict[StockSymbol, IndicatorState]:
+        """Build indicator state for every symbol in a watchlist.
+
+        Args:
+            histories: Closing prices per symbol, oldest first
+
+        Returns:
+            Indicator state per symbol
+        """
+        return {
+            symbol: self.create_state(symbol, closes)
+            for symbol, closes in histories.items()
+        }
+
+    def snapshots(
+        self,
+        states: Mapping[StockSymbol, IndicatorState],
+    ) -> dict[StockSymbol, IndicatorSnapshot]:
+        """Collect snapshots for every state with enough history.
+
+        Args:
+            states: Indicator state per symbol
+
+        Returns:
+            Snapshot per symbol; symbols without enough bars are omitted
+        """
+        return {
+            symbol: state.snapshot()
+            for symbol, state in states.items()
+            if state.is_ready
+        }
+
+    def hedge_candidates(
+        self,
+        states: Mapping[StockSymbol, IndicatorState],
+    ) -> list[IndicatorSnapshot]:
+        """Find stocks whose gap to the moving average is at its lookback max.
+
+        Args:
+            states: Indicator state per symbol
+
+        Returns:
+            Snapshots at the hedging trigger, largest gap first
+        """
+        candidates = [
+            snapshot
+            for snapshot in self.snapshots(states).values()
+            if snapshot.is_at_max_gap
+        ]
+        return sorted(
+            candidates,
+            key=lambda snapshot: snapshot.gap_percentage,
+            reverse=True,
+        )
+
+    def analyze_prices(
+        self,
+        histories: Mapping[StockSymbol, Sequence[float]],
+    ) -> list[PriceAnalysis]:
+        """Produce PriceAnalysis results for a whole watchlist.
+
+        Args:
+            histories: Closing prices per symbol, oldest first
+
+        Returns:
+            PriceAnalysis per symbol with enough history
+        """
+        snapshots = self.snapshots(self.scan(histories))
+        return [snapshot.to_price_analysis() for snapshot in snapshots.values()]
@@ -0,0 +1,215 @@
+"""Target evaluation service.
+
+Evaluates active price targets against incoming prices in bulk. Targets are
+indexed per stock into price-sorted threshold arrays so each price update
+finds every crossed pivot or failure with a binary search.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from decimal import Decimal
+
+from src.domain.entities.target import Target
+from src.domain.value_objects import Money
+
+
+@dataclass(frozen=True)
+class TargetTrigger:
+    """A target whose pivot or failure price was crossed."""
+
+    target_id: str
+    stock_id: str
+    status: str  # 'hit' or 'failed'
+    price: Money  # Price that crossed the threshold
+
+
+class _StockThresholds:
+    """Sorted pivot and failure thresholds for the active targets of one stock."""
+
+    def __init__(self, targets: list[Target]) -> None:
+        """Sort the targets by pivot and by failure price."""
+        by_pivot = sorted(targets, key=lambda target: target.pivot_price.value)
+        by_failure = sorted(targets, key=lambda target: target.failure_price.value)
+        self.pivot_prices: list[Decimal] = [
+            target.pivot_price.value for target in by_pivot
+        ]
+        self.pivot_targets: list[Target] = by_pivot
+        self.failure_prices: list[Decimal] = [
+            target.failure_price.value for target in by_failure
+        ]
+        self.failure_targets: list[Target] = by_failure
+
+    def __len__(self) -> int:
+        """Get the number of active targets for the stock."""
+        return len(self.pivot_targets)
+
+    def evaluate(self, price: Decimal) -> tuple[list[Target], list[Target]]:
+        """Split off the targets crossed by a price.
+
+        Pivots at or below the price are hit; failures at or above it have
+        failed. Crossed targets form a prefix of the pivot array and a suffix
+        of the failure array, so both are found with one bisect each and the
+        remaining thresholds stay sorted.
+
+        Args:
+            price: Latest price for the stock
+
+        Returns:
+            Tuple of (hit targets, failed targets)
+        """
+        pivot_cut = bisect_right(self.pivot_prices, price)
+        failure_cut = bisect_left(self.failure_prices, price)
+        hit = self.pivot_targets[:pivot_cut]
+        # A target crossing both thresholds (pivot below failure) counts as hit
+        hit_ids = {target.id for target in hit}
+        failed = [
+            target
+            for target in self.failure_targets[failure_cut:]
+            if target.id not in hit_ids
+        ]
+        if not hit and not failed:
+            return [], []
+
+        del self.pivot_prices[:pivot_cut]
+        del self.pivot_targets[:pivot_cut]
+        del self.failure_prices[failure_cut:]
+        del self.failure_targets[failure_cut:]
+        if hit_ids:
+            self._discard_failures(hit_ids)
+        if failed:
+            self._discard_pivots({target.id for target in failed})
+        return hit, failed
+
+    def _discard_failures(self, target_ids: set[str]) -> None:
+        """Remove resolved targets from the failure arrays."""
+        kept = [
+            index
+            for index, target in enumerate(self.failure_targets)
+            if target.id not in target_ids
+        ]
+        self.failure_prices = [self.failure_prices[index] for index in kept]
+        self.failure_targets = [self.failure_targets[index] for index in kept]
+
+    def _discard_pivots(self, target_ids: set[str]) -> None:
+        """Remove resolved targets from the pivot arrays."""
+        kept = [
+            index
+            for index, target in enumerate(self.pivot_targets)
+            if target.id not in target_ids
+        ]
+        self.pivot_prices = [self.pivot_prices[index] for index in kept]
+        self.pivot_targets = [self.pivot_targets[index] for index in kept]
+
+
+class TargetIndex:
+    """Active targets grouped by stock into sorted price-threshold arrays.
+
+    Building the index costs O(n log n); evaluating a price update for a
+    stock costs O(log n) plus the number of targets it triggers, instead of
+    a scan over every active target.
+    """
+
+    def __init__(self, targets: Iterable[Target]) -> None:
+        """Index the active targets.
+
+        Args:
+            targets: Targets to index; inactive targets are ignored
+        """
+        grouped: dict[str, list[Target]] = {}
+        for target in targets:
+            if target.is_active():
+                grouped.setdefault(target.stock_id, []).append(target)
+        self._by_stock = {
+            stock_id: _StockThresholds(stock_targets)
+            for stock_id, stock_targets in grouped.items()
+        }
+
+    def __len__(self) -> int:
+        """Get the number of active targets still in the index."""
+        return sum(len(thresholds) for thresholds in self._by_stock.values())
+
+    def __contains__(self, stock_id: object) -> bool:
+        """Check if the index holds active targets for a stock."""
+        return stock_id in self._by_stock
+
+    def evaluate(self, prices: Mapping[str, Money]) -> list[TargetTrigger]:
+        """Find and resolve every target crossed by a batch of prices.
+
+        Triggered targets are marked hit or failed and removed from the
+        index, so replaying the same prices yields no new triggers.
+
+        Args:
+            prices: Latest price per stock ID
+
+        Returns:
+            Triggers for the targets that changed status
+        """
+        triggers: list[TargetTrigger] = []
+        for stock_id, price in prices.items():
+            thresholds = self._by_stock.get(stock_id)
+            if thresholds is None:
+                continue
+            hit, failed = thresholds.evaluate(price.value)
+            for target in hit:
+                target.mark_as_hit()
+                triggers.append(_trigger(target, price))
+            for target in failed:
+                target.mark_as_failed()
+                triggers.append(_trigger(target, price))
+            if not thresholds:
+                del self._by_stock[stock_id]
+        return triggers
+
+
+def _trigger(target: Target, price: Money) -> TargetTrigger:
+    """Describe a target's new status after a crossing."""
+    return TargetTrigger(
+        target_id=target.id,
+        stock_id=target.stock_id,
+        status=target.status.value,
+        price=price,
+    )
+
+
+class TargetEvaluationService:
+    """Service for evaluating price targets against market prices."""
+
+    def build_index(self, targets: Iterable[Target]) -> TargetIndex:
+        """Index active targets for repeated bulk evaluation.
+
+        Args:
+            targets: Targets to index, typically all active targets
+
+        Returns:
+            TargetIndex over the active targets
+        """
+        return TargetIndex(targets)
+
+    def evaluate(
+        self,
+        targets: Iterable[Target],
+        prices: Mapping[str, Money],
+    ) -> list[TargetTrigger]:
+        """Evaluate targets against a single batch of prices.
+
+        Args:
+            targets: Targets to evaluate
+            prices: Latest price per stock ID
+
+        Returns:
+            Triggers for the targets that changed status
+        """
+        return self.build_index(targets).evaluate(prices)
+
+    @staticmethod
+    def status_updates(triggers: Iterable[TargetTrigger]) -> dict[str, str]:
+        """Collapse triggers into a target ID to status mapping for persistence.
+
+        Args:
+            triggers: Triggers produced by an evaluation
+
+        Returns:
+            New status per target ID
+        """
+        return {trigger.target_id: trigger.status for trigger in triggers}
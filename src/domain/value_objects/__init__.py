@@ -13,6 +13,7 @@ from .index_change import IndexChange
 from .industry_group import IndustryGroup
 from .journal_content import JournalContent
 from .metrics import (
+    IndicatorSnapshot,
     PortfolioAllocation,
     PortfolioMetrics,
     PositionAllocation,
@@ -26,14 +27,17 @@ from .notes import Notes
 from .portfolio_name import PortfolioName
 from .quantity import Quantity
 from .sector import Sector
+from .stock_query_spec import STOCK_SORT_FIELDS, StockQuerySpec, StockSortKey
 from .stock_symbol import StockSymbol
 from .target_status import TargetStatus
 from .transaction_type import TransactionType
 
 __all__ = [
+    "STOCK_SORT_FIELDS",
     "CompanyName",
     "Grade",
     "IndexChange",
+    "IndicatorSnapshot",
     "IndustryGroup",
     "JournalContent",
     "Money",
@@ -47,6 +51,8 @@ __all__ = [
     "RiskAssessment",
     "RiskLevel",
     "Sector",
+    "StockQuerySpec",
+    "StockSortKey",
     "StockSymbol",
     "TargetStatus",
     "TransactionType",
@@ -5,10 +5,7 @@ Represents an industry group classification with validation rules and immutabili
 
 from typing import Any
 
-from src.domain.value_objects.sector_industry_data import (
-    get_all_valid_industry_groups,
-    get_sector_for_industry,
-)
+from src.domain.value_objects.sector_industry_data import SECTOR_INDUSTRY_INDEX
 
 
 class IndustryGroup:
@@ -40,17 +37,15 @@ class IndustryGroup:
             msg = f"Industry group cannot exceed {self.MAX_LENGTH} characters"
             raise ValueError(msg)
 
-        # Validate that the industry group exists in our domain mapping
-        # Empty string is allowed
-        if normalized_value and normalized_value not in get_all_valid_industry_groups():
+        # Get the sector this industry group belongs to; an unknown industry
+        # group has none. Empty string is allowed
+        expected_sector = SECTOR_INDUSTRY_INDEX.sector_by_industry.get(
+            normalized_value,
+        )
+        if normalized_value and expected_sector is None:
             msg = f"Invalid industry group '{normalized_value}'"
             raise ValueError(msg)
 
-        # Get the sector this industry group belongs to
-        expected_sector = (
-            get_sector_for_industry(normalized_value) if normalized_value else None
-        )
-
         # If sector is provided, validate it matches
         if (
             sector is not None
@@ -111,3 +111,38 @@ class PriceAnalysis:
     def is_volatile(self) -> bool:
         """Check if stock is considered volatile."""
         return self.volatility_score >= Decimal("0.7")
+
+
+@dataclass(frozen=True)
+class IndicatorSnapshot:
+    """Latest moving-average indicators for a single stock."""
+
+    symbol: StockSymbol
+    current_price: Money
+    moving_average: Decimal
+    exponential_average: Decimal
+    gap_percentage: Decimal  # Distance from moving average, in percent
+    max_gap_percentage: Decimal  # Rolling maximum of the gap over the lookback
+    trend_direction: TrendDirection
+    volatility_score: Decimal  # 0-1 scale
+
+    @property
+    def is_at_max_gap(self) -> bool:
+        """Check if the gap above the moving average is at its lookback maximum.
+
+        This is the hedging trigger: price stretched above the moving
+        average as far as it has been over the whole lookback window.
+        """
+        return (
+            self.gap_percentage > Decimal("0")
+            and self.gap_percentage >= self.max_gap_percentage
+        )
+
+    def to_price_analysis(self) -> PriceAnalysis:
+        """Summarize the snapshot as a PriceAnalysis."""
+        return PriceAnalysis(
+            symbol=self.symbol,
+            current_price=self.current_price,
+            trend_direction=self.trend_direction,
+            volatility_score=self.volatility_score,
+        )
@@ -5,10 +5,7 @@ Represents a sector classification with validation rules and immutability.
 
 from typing import Any
 
-from src.domain.value_objects.sector_industry_data import (
-    SECTOR_INDUSTRY_MAPPING,
-    get_all_valid_sectors,
-)
+from src.domain.value_objects.sector_industry_data import SECTOR_INDUSTRY_INDEX
 
 
 class Sector:
@@ -43,7 +40,7 @@ class Sector:
             raise ValueError(msg)
 
         # Validate that the sector exists in our domain mapping
-        if normalized_value not in get_all_valid_sectors():
+        if normalized_value not in SECTOR_INDUSTRY_INDEX.valid_sectors:
             msg = f"Invalid sector '{normalized_value}'"
             raise ValueError(msg)
 
@@ -89,7 +86,7 @@ class Sector:
         Returns:
             True if the industry group belongs to this sector, False otherwise
         """
-        return industry_group in SECTOR_INDUSTRY_MAPPING.get(self._value, [])
+        return SECTOR_INDUSTRY_INDEX.is_valid_combination(self._value, industry_group)
 
     def get_industry_groups(self) -> list[str]:
         """Get the list of valid industry groups for this sector.
@@ -97,4 +94,4 @@ class Sector:
         Returns:
             List of industry group names that belong to this sector
         """
-        return SECTOR_INDUSTRY_MAPPING.get(self._value, [])
+        return list(SECTOR_INDUSTRY_INDEX.industries_by_sector.get(self._value, ()))
@@ -3,8 +3,16 @@
 This module contains the fixed domain knowledge about which industry groups
 belong to which sectors. This data is used by both Sector and IndustryGroup
 value objects to ensure consistency and enable self-validation.
+
+Lookups go through SECTOR_INDUSTRY_INDEX, a frozen index built once at
+import, so validation is a hash lookup instead of a scan of the mapping.
 """
 
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
 # Configuration of sector -> industry groups mapping
 # This represents fixed domain knowledge
 SECTOR_INDUSTRY_MAPPING: dict[str, list[str]] = {
@@ -53,6 +61,108 @@ SECTOR_INDUSTRY_MAPPING: dict[str, list[str]] = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class SectorIndustryIndex:
+    """Precomputed, read-only lookup tables over a sector-industry mapping.
+
+    Sectors and industry groups also get integer codes in declaration
+    order, usable as compact categorical keys for analytics group-bys.
+    Codes are stable within a process but are not meant to be persisted;
+    inserting a new entry in the middle of the mapping renumbers the rest.
+    """
+
+    sectors: tuple[str, ...]  # Indexed by sector code
+    industry_groups: tuple[str, ...]  # Indexed by industry group code
+    sorted_industry_groups: tuple[str, ...]
+    valid_sectors: frozenset[str]
+    valid_industry_groups: frozenset[str]
+    industries_by_sector: Mapping[str, tuple[str, ...]]
+    sector_by_industry: Mapping[str, str]
+    sector_codes: Mapping[str, int]
+    industry_group_codes: Mapping[str, int]
+
+    @classmethod
+    def build(cls, mapping: Mapping[str, list[str]]) -> "SectorIndustryIndex":
+        """Build the index from a sector -> industry groups mapping.
+
+        Args:
+            mapping: Sector names mapped to their industry group names
+
+        Returns:
+            SectorIndustryIndex over the mapping
+        """
+        industries_by_sector = {
+            sys.intern(sector): tuple(sys.intern(industry) for industry in industries)
+            for sector, industries in mapping.items()
+        }
+        sector_by_industry: dict[str, str] = {}
+        for sector, industries in industries_by_sector.items():
+            for industry in industries:
+                # First sector wins, matching the original linear scan
+                _ = sector_by_industry.setdefault(industry, sector)
+
+        sectors = tuple(industries_by_sector)
+        industry_groups = tuple(sector_by_industry)
+        return cls(
+            sectors=sectors,
+            industry_groups=industry_groups,
+            sorted_industry_groups=tuple(
+                sorted(
+                    industry
+                    for industries in industries_by_sector.values()
+                    for industry in industries
+                ),
+            ),
+            valid_sectors=frozenset(sectors),
+            valid_industry_groups=frozenset(industry_groups),
+            industries_by_sector=MappingProxyType(industries_by_sector),
+            sector_by_industry=MappingProxyType(sector_by_industry),
+            sector_codes=MappingProxyType(
+                {sector: code for code, sector in enumerate(sectors)},
+            ),
+            industry_group_codes=MappingProxyType(
+                {industry: code for code, industry in enumerate(industry_groups)},
+            ),
+        )
+
+    def is_valid_combination(self, sector: str, industry_group: str) -> bool:
+        """Check whether an industry group belongs to a sector.
+
+        Args:
+            sector: Sector name
+            industry_group: Industry group name
+
+        Returns:
+            True if the industry group is listed under the sector
+        """
+        return industry_group in self.industries_by_sector.get(sector, ())
+
+    def sector_code(self, sector: str) -> int | None:
+        """Get the integer code for a sector.
+
+        Args:
+            sector: Sector name
+
+        Returns:
+            The sector code, or None for an unknown sector
+        """
+        return self.sector_codes.get(sector)
+
+    def industry_group_code(self, industry_group: str) -> int | None:
+        """Get the integer code for an industry group.
+
+        Args:
+            industry_group: Industry group name
+
+        Returns:
+            The industry group code, or None for an unknown industry group
+        """
+        return self.industry_group_codes.get(industry_group)
+
+
+SECTOR_INDUSTRY_INDEX = SectorIndustryIndex.build(SECTOR_INDUSTRY_MAPPING)
+
+
 def get_sector_for_industry(industry_group: str) -> str | None:
     """Get the sector that contains the given industry group.
 
@@ -62,10 +172,7 @@ def get_sector_for_industry(industry_group: str) -> str | None:
     Returns:
         The sector name if found, None otherwise
     """
-    for sector, industries in SECTOR_INDUSTRY_MAPPING.items():
-        if industry_group in industries:
-            return sector
-    return None
+    return SECTOR_INDUSTRY_INDEX.sector_by_industry.get(industry_group)
 
 
 def get_all_valid_sectors() -> list[str]:
@@ -74,7 +181,7 @@ def get_all_valid_sectors() -> list[str]:
     Returns:
         List of valid sector names
     """
-    return list(SECTOR_INDUSTRY_MAPPING.keys())
+    return list(SECTOR_INDUSTRY_INDEX.sectors)
 
 
 def get_all_valid_industry_groups() -> list[str]:
@@ -83,7 +190,4 @@ def get_all_valid_industry_groups() -> list[str]:
     Returns:
         List of valid industry group names
     """
-    all_industries: list[str] = []
-    for industries in SECTOR_INDUSTRY_MAPPING.values():
-        all_industries.extend(industries)
-    return sorted(all_industries)
+    return list(SECTOR_INDUSTRY_INDEX.sorted_industry_groups)
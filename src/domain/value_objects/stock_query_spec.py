@@ -0,0 +1,54 @@
+"""Stock query specification for the StockBook domain.
+
+Describes which stocks a listing wants and in what order, independently of
+how the repository evaluates it, so filtering and sorting happen in the
+database instead of on the client.
+"""
+
+from dataclasses import dataclass
+
+# Fields a listing can be sorted by, named as in StockDto
+STOCK_SORT_FIELDS = ("symbol", "name", "sector", "industry_group", "grade")
+
+
+@dataclass(frozen=True)
+class StockSortKey:
+    """One key of a multi-key sort."""
+
+    field: str  # One of STOCK_SORT_FIELDS
+    descending: bool = False
+
+    def __post_init__(self) -> None:
+        """Validate the sort field.
+
+        Raises:
+            ValueError: If the field is not one of STOCK_SORT_FIELDS
+        """
+        if self.field not in STOCK_SORT_FIELDS:
+            msg = (
+                f"Cannot sort stocks by {self.field!r}; "
+                + f"allowed fields: {', '.join(STOCK_SORT_FIELDS)}"
+            )
+            raise ValueError(msg)
+
+
+@dataclass(frozen=True)
+class StockQuerySpec:
+    """Filters and sort order of a stock listing.
+
+    Filters left as None match every stock; the ones given are combined
+    with AND. Stocks are ordered by the sort keys in turn, with the symbol
+    breaking ties.
+    """
+
+    sector: str | None = None  # Exact sector
+    industry_group: str | None = None  # Exact industry group
+    grade: str | None = None  # Exact grade
+    symbol_prefix: str | None = None  # Symbols starting with this, any case
+    symbol_contains: str | None = None  # Symbols containing this, any case
+    sort: tuple[StockSortKey, ...] = ()
+
+    @property
+    def is_empty(self) -> bool:
+        """Check whether the spec neither filters nor sorts."""
+        return self == StockQuerySpec()
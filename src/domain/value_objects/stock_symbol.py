@@ -5,7 +5,17 @@ used throughout the trading application.
 """
 
 import re
-from typing import Any
+import threading
+from typing import Any, ClassVar, NamedTuple
+
+
+class SymbolCacheInfo(NamedTuple):
+    """Interning cache statistics, shaped like functools' cache_info()."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
 
 
 class StockSymbol:
@@ -16,42 +26,132 @@ class StockSymbol:
     - Character validation (letters only)
     - Case normalization (uppercase)
     - Whitespace handling
+
+    Instances are interned: constructing a symbol that was seen before
+    returns the shared instance without re-validating, so equal symbols are
+    usually identical and compare by identity. The cache is bounded and
+    evicts its oldest entries first; a symbol constructed after eviction is
+    a new but equal instance. Cache lookups, inserts and statistics are
+    guarded by a lock, so symbols can be constructed from any thread.
     """
 
+    __slots__ = ("_hash", "_value")
+
     # Validation pattern: 1-5 uppercase letters only
     MAX_SYMBOL_LENGTH = 5
     SYMBOL_PATTERN = re.compile(r"^[A-Z]{1,5}$")
 
-    # Private attributes for type checking
+    # Maximum number of raw inputs remembered by the interning cache
+    CACHE_MAX_SIZE = 4096
+    _cache: ClassVar[dict[str, "StockSymbol"]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _hits: ClassVar[int] = 0
+    _misses: ClassVar[int] = 0
+
     _value: str
+    _hash: int
 
-    def __init__(self, symbol: str) -> None:
-        """Initialize StockSymbol with validation and normalization.
+    def __new__(cls, symbol: str) -> "StockSymbol":
+        """Get the interned StockSymbol for a symbol, validating it once.
 
         Args:
             symbol: Stock ticker symbol string
 
+        Returns:
+            Shared StockSymbol instance for the normalized symbol
+
         Raises:
             ValueError: If symbol is invalid format
         """
-        # Normalize the symbol
-        normalized = self.normalize(symbol)
+        cache = StockSymbol._cache
+        # Only exact str instances are cached so str subclasses can't alias
+        if type(symbol) is str:
+            with StockSymbol._lock:
+                cached = cache.get(symbol)
+                if cached is not None:
+                    StockSymbol._hits += 1
+                    return cached
+
+        normalized = cls.normalize(symbol)
+        with StockSymbol._lock:
+            instance = cache.get(normalized)
+            if instance is not None:
+                StockSymbol._hits += 1
+            else:
+                StockSymbol._misses += 1
+        if instance is None:
+            cls._validate(normalized)
+            created = super().__new__(cls)
+            # Use object.__setattr__ to bypass immutability during creation
+            object.__setattr__(created, "_value", normalized)
+            object.__setattr__(created, "_hash", hash(normalized))
+            instance = cls._remember(normalized, created)
+        if type(symbol) is str and symbol != normalized:
+            _ = cls._remember(symbol, instance)
+        return instance
+
+    @classmethod
+    def _validate(cls, normalized: str) -> None:
+        """Validate a normalized symbol.
 
-        # Validate the normalized symbol
+        Args:
+            normalized: Normalized symbol string
+
+        Raises:
+            ValueError: If symbol is invalid format
+        """
         if not normalized:
             msg = "Stock symbol cannot be empty"
             raise ValueError(msg)
-        if len(normalized) < 1 or len(normalized) > self.MAX_SYMBOL_LENGTH:
+        if len(normalized) < 1 or len(normalized) > cls.MAX_SYMBOL_LENGTH:
             raise ValueError(
-                f"Stock symbol must be between 1 and {self.MAX_SYMBOL_LENGTH} "
+                f"Stock symbol must be between 1 and {cls.MAX_SYMBOL_LENGTH} "
                 + "characters",
             )
-        if not self.SYMBOL_PATTERN.match(normalized):
+        if not cls.SYMBOL_PATTERN.match(normalized):
             msg = "Stock symbol must contain only uppercase letters"
             raise ValueError(msg)
 
-        # Use object.__setattr__ to bypass immutability during initialization
-        object.__setattr__(self, "_value", normalized)
+    @classmethod
+    def _remember(cls, key: str, instance: "StockSymbol") -> "StockSymbol":
+        """Add an instance to the interning cache, evicting the oldest entry.
+
+        Returns:
+            The cached instance, which is one another thread stored first
+            if the key raced in while this one was being validated
+        """
+        cache = StockSymbol._cache
+        with StockSymbol._lock:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+            while cache and len(cache) >= cls.CACHE_MAX_SIZE:
+                del cache[next(iter(cache))]
+            cache[key] = instance
+            return instance
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all interned symbols and reset the statistics."""
+        with StockSymbol._lock:
+            StockSymbol._cache.clear()
+            StockSymbol._hits = 0
+            StockSymbol._misses = 0
+
+    @classmethod
+    def cache_info(cls) -> SymbolCacheInfo:
+        """Get interning cache statistics.
+
+        A miss is a symbol validated and created; invalid symbols count
+        as misses too.
+        """
+        with StockSymbol._lock:
+            return SymbolCacheInfo(
+                hits=StockSymbol._hits,
+                misses=StockSymbol._misses,
+                maxsize=cls.CACHE_MAX_SIZE,
+                currsize=len(StockSymbol._cache),
+            )
 
     @property
     def value(self) -> str:
@@ -59,29 +159,33 @@ class StockSymbol:
         return self._value
 
     def __setattr__(self, name: str, value: Any) -> None:
-        """Prevent modification after initialization (immutability)."""
-        if hasattr(self, "_value"):  # Object is already initialized
-            msg = "Cannot modify immutable StockSymbol object"
-            raise AttributeError(msg)
-        super().__setattr__(name, value)
+        """Prevent modification (immutability)."""
+        msg = "Cannot modify immutable StockSymbol object"
+        raise AttributeError(msg)
+
+    def __reduce__(self) -> tuple[type["StockSymbol"], tuple[str]]:
+        """Pickle and copy by value so unpickled symbols are interned."""
+        return (StockSymbol, (self._value,))
 
     def __eq__(self, other: object) -> bool:
         """Check equality with another StockSymbol object."""
+        if self is other:
+            return True
         if not isinstance(other, StockSymbol):
             return False
-        return self.value == other.value
+        return self._value == other._value
 
     def __hash__(self) -> int:
         """Make StockSymbol hashable for use in sets/dicts."""
-        return hash(self.value)
+        return self._hash
 
     def __str__(self) -> str:
         """String representation for display."""
-        return self.value
+        return self._value
 
     def __repr__(self) -> str:
         """Developer representation."""
-        return f"StockSymbol({self.value!r})"
+        return f"StockSymbol({self._value!r})"
 
     @classmethod
     def normalize(cls, symbol: str) -> str:
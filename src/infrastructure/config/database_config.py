@@ -35,6 +35,7 @@ class DatabaseConfig(BaseConfig):
         """Load all configuration settings."""
         self._setup_database_urls()
         self._setup_connection_settings()
+        self._setup_schema_settings()
 
     def _setup_database_urls(self) -> None:
         """Setup database URLs."""
@@ -59,6 +60,40 @@ class DatabaseConfig(BaseConfig):
         )
         self.row_factory = self.get_env_str("STOCKBOOK_DB_ROW_FACTORY", "dict")
 
+        # Group commit batches concurrent write transactions into one commit
+        self.group_commit_enabled = self.get_env_bool(
+            "STOCKBOOK_DB_GROUP_COMMIT",
+            default=False,
+        )
+        self.group_commit_max_batch = self.get_env_int(
+            "STOCKBOOK_DB_GROUP_COMMIT_MAX_BATCH",
+            64,
+        )
+        self.group_commit_max_delay = self.get_env_float(
+            "STOCKBOOK_DB_GROUP_COMMIT_MAX_DELAY",
+            0.005,
+        )
+
+        # Query budget per unit of work; 0 disables a limit
+        self.query_budget_max_queries = self.get_env_int(
+            "STOCKBOOK_DB_QUERY_BUDGET",
+            0,
+        )
+        self.query_budget_max_repeats = self.get_env_int(
+            "STOCKBOOK_DB_QUERY_BUDGET_MAX_REPEATS",
+            0,
+        )
+        self.query_budget_raise = self.get_env_bool(
+            "STOCKBOOK_DB_QUERY_BUDGET_RAISE",
+            default=False,
+        )
+
+    def _setup_schema_settings(self) -> None:
+        """Setup options that change the table definitions."""
+        # Store entity IDs as 16-byte BLOBs instead of 36-character text;
+        # existing databases are converted with id_migration.migrate_ids
+        self.binary_ids = self.get_env_bool("STOCKBOOK_DB_BINARY_IDS", default=False)
+
     def get_connection_string(self, *, test: bool = False) -> str:
         """Get database connection string.
 
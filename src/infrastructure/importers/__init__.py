@@ -0,0 +1,23 @@
+"""Streaming readers for broker transaction exports.
+
+Readers are imported on first use, so a CSV import does not load the OFX
+parser and vice versa.
+"""
+
+from typing import TYPE_CHECKING
+
+from src.shared.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .csv_transaction_source import CsvTransactionSource
+    from .ofx_transaction_source import OfxTransactionSource
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "CsvTransactionSource": ".csv_transaction_source",
+        "OfxTransactionSource": ".ofx_transaction_source",
+    },
+)
+
+__all__ = ["CsvTransactionSource", "OfxTransactionSource"]
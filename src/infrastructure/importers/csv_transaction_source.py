@@ -0,0 +1,171 @@
+"""Streaming reader for broker CSV exports.
+
+The file is read line by line in binary mode so every record knows the byte
+offsets it spans; only the header, the current line and a count per
+distinct fill are held in memory. Resuming still parses the lines before
+the checkpoint, so repeated fills keep the occurrence they had in the
+first run. Quoted fields spanning several lines are not supported.
+"""
+
+import csv
+from collections.abc import Iterator, Mapping
+from datetime import datetime
+from pathlib import Path
+from typing import ClassVar
+
+from src.application.interfaces.transaction_import import (
+    ITransactionSource,
+    OccurrenceCounter,
+    RawTransaction,
+    RejectedRow,
+)
+
+
+class CsvTransactionSource(ITransactionSource):
+    """Transaction source for CSV files with a header row.
+
+    Columns are matched case-insensitively against common broker names, so
+    "Trade Date", "Symbol", "Action", "Quantity" and "Price" work as well as
+    the field names themselves.
+    """
+
+    COLUMN_ALIASES: ClassVar[Mapping[str, tuple[str, ...]]] = {
+        "transaction_date": ("transaction_date", "date", "trade date", "run date"),
+        "symbol": ("symbol", "ticker"),
+        "transaction_type": ("transaction_type", "action", "type", "side"),
+        "quantity": ("quantity", "shares", "qty"),
+        "price": ("price", "unit price", "price ($)"),
+        "notes": ("notes", "description", "memo"),
+    }
+    OPTIONAL_COLUMNS: ClassVar[frozenset[str]] = frozenset({"notes"})
+    ACTION_PREFIXES: ClassVar[Mapping[str, str]] = {
+        "buy": "buy",
+        "bought": "buy",
+        "you bought": "buy",
+        "sell": "sell",
+        "sold": "sell",
+        "you sold": "sell",
+    }
+    DATE_FORMATS: ClassVar[tuple[str, ...]] = ("%m/%d/%Y", "%m/%d/%y", "%d-%b-%Y")
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        delimiter: str = ",",
+        encoding: str = "utf-8",
+    ) -> None:
+        """Initialize the source for a file.
+
+        Args:
+            path: CSV file to read
+            delimiter: Field separator
+            encoding: Text encoding; a UTF-8 byte order mark is skipped
+        """
+        self._path = Path(path)
+        self._delimiter = delimiter
+        self._encoding = encoding
+
+    def read(self, start_offset: int = 0) -> Iterator[RawTransaction | RejectedRow]:
+        """Read records one line at a time.
+
+        Args:
+            start_offset: Byte offset to resume from; earlier lines are
+                read for the header and occurrence counts but not yielded
+
+        Yields:
+            Raw transactions and rejections for unreadable lines
+
+        Raises:
+            ValueError: If the header lacks a required column
+        """
+        with self._path.open("rb") as stream:
+            header = stream.readline()
+            columns = self._columns(header)
+            counter = OccurrenceCounter()
+            offset = len(header)
+            for line in stream:
+                start, offset = offset, offset + len(line)
+                record = self._line(line, columns, start, offset)
+                if isinstance(record, RawTransaction):
+                    record = counter.number(record)
+                if record is not None and start >= start_offset:
+                    yield record
+
+    def _line(
+        self,
+        line: bytes,
+        columns: Mapping[str, int],
+        start: int,
+        end: int,
+    ) -> RawTransaction | RejectedRow | None:
+        """Read one line, or return None for a blank one."""
+        try:
+            text = line.decode(self._encoding)
+        except UnicodeDecodeError:
+            return RejectedRow(start, end, "Line is not valid text")
+        return self._record(text, columns, start, end) if text.strip() else None
+
+    def _columns(self, header: bytes) -> dict[str, int]:
+        """Map field names to column positions.
+
+        Raises:
+            ValueError: If a required column is missing
+        """
+        names = next(
+            csv.reader(
+                [header.decode(self._encoding).removeprefix("\ufeff")],
+                delimiter=self._delimiter,
+            ),
+        )
+        positions = {name.strip().lower(): index for index, name in enumerate(names)}
+        columns: dict[str, int] = {}
+        for field, aliases in self.COLUMN_ALIASES.items():
+            index = next((positions[a] for a in aliases if a in positions), None)
+            if index is not None:
+                columns[field] = index
+            elif field not in self.OPTIONAL_COLUMNS:
+                msg = f"CSV header has no {field} column ({', '.join(aliases)})"
+                raise ValueError(msg)
+        return columns
+
+    def _record(
+        self,
+        text: str,
+        columns: Mapping[str, int],
+        start: int,
+        end: int,
+    ) -> RawTransaction | RejectedRow:
+        """Convert one data line to a raw transaction."""
+        fields = next(csv.reader([text.rstrip("\r\n")], delimiter=self._delimiter))
+        if len(fields) <= max(columns.values()):
+            msg = f"Expected at least {max(columns.values()) + 1} fields"
+            return RejectedRow(start, end, msg)
+        values = {field: fields[index].strip() for field, index in columns.items()}
+        return RawTransaction(
+            offset=start,
+            end_offset=end,
+            symbol=values["symbol"],
+            transaction_type=self._action(values["transaction_type"]),
+            quantity=values["quantity"],
+            price=values["price"],
+            transaction_date=self._date(values["transaction_date"]),
+            notes=values.get("notes", ""),
+        )
+
+    def _action(self, value: str) -> str:
+        """Translate broker wording such as "YOU BOUGHT" to buy or sell."""
+        normalized = value.strip().lower()
+        for prefix, action in self.ACTION_PREFIXES.items():
+            if normalized.startswith(prefix):
+                return action
+        return value
+
+    def _date(self, value: str) -> str:
+        """Convert a broker date to ISO 8601, leaving unknown formats as is."""
+        for date_format in self.DATE_FORMATS:
+            try:
+                return datetime.strptime(value, date_format).isoformat()  # noqa: DTZ007
+            except ValueError:
+                continue
+        return value
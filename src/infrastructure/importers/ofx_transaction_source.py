@@ -0,0 +1,175 @@
+"""Streaming reader for OFX investment statements.
+
+Trades are ``<BUYSTOCK>``/``<SELLSTOCK>`` (and mutual fund or other
+security) aggregates that refer to securities by CUSIP; the ``<SECLIST>``
+maps those IDs to tickers and usually follows the trades. The file is
+therefore scanned twice in fixed-size reads: once for the security list,
+kept as a small ID → ticker map, and once for the trades. Both OFX 1.x SGML,
+where element tags are left open, and OFX 2.x XML are understood.
+
+Each trade's ``<FITID>`` identifies it: identical trades with different
+FITIDs are separate fills, while a FITID listed twice is one fill. The
+trade scan always starts at the beginning of the file so this holds when
+resuming too.
+"""
+
+import re
+from collections.abc import Iterator, Mapping
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import BinaryIO
+
+from src.application.interfaces.transaction_import import (
+    ITransactionSource,
+    OccurrenceCounter,
+    RawTransaction,
+    RejectedRow,
+)
+
+_TRADE_START = re.compile(rb"<((?:BUY|SELL)(?:STOCK|MF|OTHER))>")
+_SECURITY_START = re.compile(rb"<(SECINFO)>")
+_ELEMENT = re.compile(rb"<([A-Z0-9.]+)>([^<\r\n]*)")
+_OFX_DATE = re.compile(
+    r"^(\d{8})(\d{6})?(?:\.\d+)?(?:\[([+-]?\d+(?:\.\d+)?)(?::[^\]]*)?\])?$",
+)
+
+# Longest opening tag the scanner must be able to find across reads
+_MAX_TAG_LENGTH = 16
+
+
+class OfxTransactionSource(ITransactionSource):
+    """Transaction source for OFX investment statement downloads."""
+
+    def __init__(self, path: str | Path, *, read_size: int = 64 * 1024) -> None:
+        """Initialize the source for a file.
+
+        Args:
+            path: OFX file to read
+            read_size: Bytes read from the file at a time
+        """
+        self._path = Path(path)
+        self._read_size = read_size
+
+    def read(self, start_offset: int = 0) -> Iterator[RawTransaction | RejectedRow]:
+        """Read trades one aggregate at a time.
+
+        Args:
+            start_offset: Byte offset to resume from; the security list and
+                the FITIDs of earlier trades are still read
+
+        Yields:
+            Raw transactions, and rejections for trades missing a field
+        """
+        tickers = self._tickers()
+        counter = OccurrenceCounter()
+        with self._path.open("rb") as stream:
+            for aggregate in self._aggregates(stream, 0, _TRADE_START):
+                record = self._trade(aggregate, tickers, counter)
+                if record.offset >= start_offset:
+                    yield record
+
+    def _tickers(self) -> dict[str, str]:
+        """Map security IDs to tickers from the security list."""
+        tickers: dict[str, str] = {}
+        with self._path.open("rb") as stream:
+            for _, _, _, body in self._aggregates(stream, 0, _SECURITY_START):
+                elements = _elements(body)
+                if "UNIQUEID" in elements and "TICKER" in elements:
+                    tickers[elements["UNIQUEID"]] = elements["TICKER"]
+        return tickers
+
+    def _aggregates(
+        self,
+        stream: BinaryIO,
+        offset: int,
+        start_pattern: re.Pattern[bytes],
+    ) -> Iterator[tuple[int, int, str, bytes]]:
+        """Find aggregates opened by a pattern and closed by their end tag.
+
+        Yields:
+            Start and end offsets, tag name and content of each aggregate
+        """
+        buffer = b""
+        eof = False
+        while True:
+            match = start_pattern.search(buffer)
+            if match is not None:
+                name = match.group(1)
+                close = buffer.find(b"</" + name + b">", match.end())
+                if close >= 0:
+                    end = close + len(name) + 3
+                    yield (
+                        offset + match.start(),
+                        offset + end,
+                        name.decode("ascii"),
+                        buffer[match.end() : close],
+                    )
+                    buffer = buffer[end:]
+                    offset += end
+                    continue
+            elif len(buffer) > _MAX_TAG_LENGTH:
+                # Keep only what could be the start of a split tag
+                keep = len(buffer) - _MAX_TAG_LENGTH
+                buffer = buffer[keep:]
+                offset += keep
+            if eof:
+                return
+            data = stream.read(self._read_size)
+            eof = not data
+            buffer += data
+
+    def _trade(
+        self,
+        aggregate: tuple[int, int, str, bytes],
+        tickers: Mapping[str, str],
+        counter: OccurrenceCounter,
+    ) -> RawTransaction | RejectedRow:
+        """Convert one trade aggregate to a numbered raw transaction."""
+        start, end, name, body = aggregate
+        elements = _elements(body)
+        for required in ("UNIQUEID", "UNITS", "UNITPRICE", "DTTRADE"):
+            if required not in elements:
+                return RejectedRow(start, end, f"{name} has no {required}")
+        security = elements["UNIQUEID"]
+        record = RawTransaction(
+            offset=start,
+            end_offset=end,
+            symbol=tickers.get(security, security),
+            transaction_type="buy" if name.startswith("BUY") else "sell",
+            # Sold units are negative in OFX
+            quantity=elements["UNITS"].lstrip("-"),
+            price=elements["UNITPRICE"],
+            transaction_date=_iso_date(elements["DTTRADE"]),
+            notes=elements.get("MEMO", ""),
+        )
+        return counter.number(record, elements.get("FITID"))
+
+
+def _elements(body: bytes) -> dict[str, str]:
+    """Get the first value of each element in an aggregate."""
+    elements: dict[str, str] = {}
+    for match in _ELEMENT.finditer(body):
+        value = match.group(2).strip()
+        if value:
+            _ = elements.setdefault(
+                match.group(1).decode("ascii"),
+                value.decode("latin-1"),
+            )
+    return elements
+
+
+def _iso_date(value: str) -> str:
+    """Convert an OFX date such as 20240115093000.000[-5:EST] to ISO 8601.
+
+    Unknown formats are returned unchanged for validation to reject.
+    """
+    match = _OFX_DATE.match(value)
+    if match is None:
+        return value
+    day, time_of_day, offset_hours = match.groups()
+    parsed = datetime.strptime(day + (time_of_day or "000000"), "%Y%m%d%H%M%S")  # noqa: DTZ007
+    if offset_hours is not None:
+        parsed = parsed.replace(
+            tzinfo=timezone(timedelta(hours=float(offset_hours))),
+        )
+    return parsed.isoformat()
@@ -0,0 +1,42 @@
+"""Helpers for batched queries.
+
+SQLAlchemy renders ``column.in_(values)`` with one bound parameter per value,
+and SQLite rejects statements with more parameters than its limit (999 before
+SQLite 3.32). Batched lookups therefore split their keys into chunks that stay
+below the limit and run one ``IN (...)`` query per chunk.
+"""
+
+from collections.abc import Hashable, Iterable, Iterator
+from itertools import islice
+from typing import TypeVar
+
+# Below SQLite's historical limit, leaving room for other parameters
+MAX_IN_PARAMETERS = 900
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+
+
+def in_chunks(
+    keys: Iterable[KeyT],
+    size: int = MAX_IN_PARAMETERS,
+) -> Iterator[list[KeyT]]:
+    """Split lookup keys into chunks for ``IN (...)`` queries.
+
+    Duplicate keys are dropped, so each key is bound once.
+
+    Args:
+        keys: Keys to look up, in any order
+        size: Maximum number of keys per chunk
+
+    Yields:
+        Lists of at most ``size`` distinct keys, in first-seen order
+
+    Raises:
+        ValueError: If size is below 1
+    """
+    if size < 1:
+        msg = "Chunk size must be at least 1"
+        raise ValueError(msg)
+    unique = iter(dict.fromkeys(keys))
+    while chunk := list(islice(unique, size)):
+        yield chunk
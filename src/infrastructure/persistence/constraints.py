@@ -0,0 +1,55 @@
+"""Classification of integrity errors by the constraint they violate.
+
+Writes rely on the database's constraints instead of probing for conflicts
+first, so repositories need to know which constraint rejected a statement.
+PostgreSQL reports the constraint name; SQLite only reports the columns of a
+unique constraint, which are matched against the table's named constraints.
+"""
+
+import re
+
+from sqlalchemy import Table, UniqueConstraint, exc
+
+_QUOTED_NAME = re.compile(r'constraint "([^"]+)"')
+_SQLITE_UNIQUE = re.compile(r"UNIQUE constraint failed: ([\w.]+(?:, [\w.]+)*)")
+
+
+def violated_constraint(error: exc.IntegrityError, table: Table) -> str | None:
+    """Name the constraint of a table that an integrity error violated.
+
+    Args:
+        error: Integrity error raised by a statement against the table
+        table: Table the statement wrote to
+
+    Returns:
+        Name of the violated constraint, or None if it cannot be identified
+    """
+    diagnostics = getattr(error.orig, "diag", None)
+    name = getattr(diagnostics, "constraint_name", None)
+    if isinstance(name, str):
+        return name
+
+    message = str(error.orig)
+    quoted = _QUOTED_NAME.search(message)
+    if quoted is not None:
+        return quoted.group(1)
+
+    unique = _SQLITE_UNIQUE.search(message)
+    if unique is None:
+        return None
+    columns: set[str] = set()
+    for qualified in unique.group(1).split(", "):
+        table_name, _, column = qualified.rpartition(".")
+        if table_name != table.name:
+            return None
+        columns.add(column)
+    return next(
+        (
+            constraint.name
+            for constraint in table.constraints
+            if isinstance(constraint, UniqueConstraint)
+            and isinstance(constraint.name, str)
+            and {column.name for column in constraint.columns} == columns
+        ),
+        None,
+    )
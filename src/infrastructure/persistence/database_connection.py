@@ -4,12 +4,51 @@ This module provides an adapter that implements the IDatabaseConnection
 protocol by wrapping SQLAlchemy connection objects.
 """
 
-# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportAttributeAccessIssue=false
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportAttributeAccessIssue=false, reportUnknownArgumentType=false
 # mypy: disable-error-code="no-untyped-call,attr-defined"
 
+import time
 from typing import Any
 
 from sqlalchemy.engine import Connection
+from sqlalchemy.sql.expression import Delete, Insert, Select, TextClause, Update
+
+from src.infrastructure.persistence.query_budget import QueryLog, active_query_logs
+from src.shared.instrumentation import FAST_BUCKETS, metrics
+
+_statement_seconds = metrics.histogram(
+    "stockbook_db_statement_duration_seconds",
+    "Time spent executing SQL statements",
+    ("operation", "table"),
+    FAST_BUCKETS,
+)
+_rows_affected = metrics.counter(
+    "stockbook_db_rows_affected_total",
+    "Rows changed by INSERT, UPDATE and DELETE statements",
+    ("operation", "table"),
+)
+
+
+def statement_labels(statement: Any) -> tuple[str, str]:
+    """Describe a statement by operation and main table for metric labels.
+
+    Args:
+        statement: SQLAlchemy Core statement or textual SQL
+
+    Returns:
+        Lower-case operation (select, insert, ...) and table name, or
+        "other" when either cannot be determined
+    """
+    if isinstance(statement, Select):
+        froms = statement.get_final_froms()
+        table = getattr(froms[0], "name", "other") if froms else "other"
+        return "select", str(table)
+    if isinstance(statement, Insert | Update | Delete):
+        operation = type(statement).__name__.lower()
+        return operation, str(getattr(statement.table, "name", "other"))
+    if isinstance(statement, TextClause) and statement.text.strip():
+        return statement.text.split(None, 1)[0].lower(), "other"
+    return "other", "other"
 
 
 class SqlAlchemyConnection:
@@ -20,13 +59,20 @@ class SqlAlchemyConnection:
     separation between infrastructure and domain layers.
     """
 
-    def __init__(self, connection: Connection) -> None:
+    def __init__(
+        self,
+        connection: Connection,
+        query_log: QueryLog | None = None,
+    ) -> None:
         """Initialize the adapter with a SQLAlchemy connection.
 
         Args:
             connection: SQLAlchemy connection object to wrap
+            query_log: Log recording every statement, e.g. of a unit of work
+                with a query budget
         """
         self._connection = connection
+        self._query_log = query_log
 
     def execute(
         self,
@@ -47,11 +93,44 @@ class SqlAlchemyConnection:
         Raises:
             Exception: Database-specific exceptions on failure
         """
-        return self._connection.execute(
-            statement,
-            parameters=parameters,
-            execution_options=execution_options,
-        )
+        logs = active_query_logs()
+        if self._query_log is not None or logs:
+            self._record_query(statement, parameters, logs)
+
+        if not metrics.enabled:
+            return self._connection.execute(
+                statement,
+                parameters=parameters,
+                execution_options=execution_options,
+            )
+
+        operation, table = statement_labels(statement)
+        started = time.perf_counter()
+        try:
+            result = self._connection.execute(
+                statement,
+                parameters=parameters,
+                execution_options=execution_options,
+            )
+        finally:
+            _statement_seconds.observe(time.perf_counter() - started, operation, table)
+        # SELECT row counts are only known once fetched; DML reports them
+        rowcount = getattr(result, "rowcount", -1)
+        if operation != "select" and isinstance(rowcount, int) and rowcount > 0:
+            _rows_affected.inc(operation, table, amount=rowcount)
+        return result
+
+    def _record_query(
+        self,
+        statement: Any,
+        parameters: Any,
+        logs: tuple[QueryLog, ...],
+    ) -> None:
+        """Add a statement to this connection's log and the active logs."""
+        if self._query_log is not None:
+            self._query_log.record(statement, parameters)
+        for log in logs:
+            log.record(statement, parameters)
 
     def commit(self) -> None:
         """Commit the current transaction.
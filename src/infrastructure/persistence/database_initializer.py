@@ -2,30 +2,73 @@
 
 This module provides functions to initialize the database schema,
 creating all necessary tables if they don't already exist.
+
+``create_all`` checks every table and index for existence before creating
+it, which dominates a cold start. The initializer instead stores a
+fingerprint of the schema DDL in the ``schema_info`` table and skips
+``create_all`` entirely while the stored fingerprint matches the code.
+
+``create_all`` never alters a table that already exists, so when the
+schema changed, columns added since the table was created (such as the
+row ``version``) are added with ``ALTER TABLE ... ADD COLUMN`` and indexes
+added since are created. Tables
+whose layout was replaced rather than extended are migrated explicitly
+before ``create_all`` recreates them.
 """
 
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+# pyright: reportArgumentType=false
+
+import hashlib
 import logging
+from collections.abc import Iterator
 from pathlib import Path
 
-from sqlalchemy import MetaData
-from sqlalchemy.engine import Engine
+from sqlalchemy import (
+    CheckConstraint,
+    Column,
+    Constraint,
+    DefaultClause,
+    ForeignKeyConstraint,
+    MetaData,
+    Table,
+    delete,
+    func,
+    insert,
+    inspect,
+    select,
+    text,
+)
+from sqlalchemy import table as table_clause
+from sqlalchemy.engine import Connection, Dialect, Engine
+from sqlalchemy.schema import CreateColumn
+from sqlalchemy.sql.elements import TextClause
 
 from src.infrastructure.persistence.database_factory import create_engine
 
 # Import all tables to ensure they're registered with metadata
 from src.infrastructure.persistence.tables import (
     journal_entry_table,
+    journal_tag_table,
     metadata,
+    outbox_table,
     portfolio_balance_table,
     portfolio_table,
     position_table,
+    schema_info_table,
     stock_table,
     target_table,
     transaction_table,
 )
+from src.infrastructure.persistence.tables.journal_search_index import (
+    SEARCH_INDEX_DDL,
+    verify_journal_search_index,
+)
 
 # These imports are needed to register tables with metadata
 _ = journal_entry_table
+_ = journal_tag_table
+_ = outbox_table
 _ = portfolio_balance_table
 _ = portfolio_table
 _ = position_table
@@ -35,6 +78,9 @@ _ = transaction_table
 
 logger = logging.getLogger(__name__)
 
+# Where the allocation targets of older databases are kept once replaced
+LEGACY_TARGETS_TABLE = "allocation_targets_legacy"
+
 
 def _collect_all_metadata() -> MetaData:
     """Collect all table metadata.
@@ -46,16 +92,295 @@ def _collect_all_metadata() -> MetaData:
     return metadata
 
 
-def _create_tables_if_not_exist(engine: Engine, table_metadata: MetaData) -> None:
-    """Create all tables defined in the metadata if they don't exist.
+def schema_fingerprint(table_metadata: MetaData, dialect: Dialect) -> str:
+    """Compute a fingerprint of the schema described by the metadata.
+
+    Any change to a table, column, type, server default, constraint or
+    index changes the fingerprint, and so does the SQLite search index DDL.
+    The definitions are hashed directly rather than compiled to full DDL,
+    which would cost more than the existence checks being skipped.
 
     Args:
-        engine: SQLAlchemy engine
         table_metadata: MetaData containing table definitions
+        dialect: Dialect the schema is created with
+
+    Returns:
+        Hex SHA-256 digest of the schema
+    """
+    digest = hashlib.sha256()
+    for _, table in sorted(table_metadata.tables.items()):
+        for line in _describe_table(table, dialect):
+            digest.update(line.encode())
+    if dialect.name == "sqlite":
+        for statement in SEARCH_INDEX_DDL:
+            digest.update(statement.encode())
+    return digest.hexdigest()
+
+
+def _describe_table(table: Table, dialect: Dialect) -> Iterator[str]:
+    """Describe a table definition as deterministic lines of text."""
+    yield f"table {table.name}"
+    for col in table.columns:
+        default = col.server_default
+        default_sql = (
+            _sql_text(default.arg) if isinstance(default, DefaultClause) else None
+        )
+        flags = f"{col.nullable} {col.primary_key}"
+        yield f"column {col.name} {col.type.compile(dialect)} {flags} {default_sql}"
+    constraints = (_describe_constraint(item) for item in table.constraints)
+    indexes = (
+        f"index {index.name} {index.unique} {list(map(_sql_text, index.expressions))}"
+        for index in table.indexes
+    )
+    yield from sorted(constraints)
+    yield from sorted(indexes)
+
+
+def _describe_constraint(constraint: Constraint) -> str:
+    """Describe a table constraint as one line of text."""
+    kind = type(constraint).__name__
+    if isinstance(constraint, CheckConstraint):
+        return f"{kind} {constraint.name} {_sql_text(constraint.sqltext)}"
+    if isinstance(constraint, ForeignKeyConstraint):
+        targets = [element.target_fullname for element in constraint.elements]
+        return f"{kind} {constraint.name} {targets} {constraint.ondelete}"
+    # Primary key and unique constraints
+    columns = [col.name for col in getattr(constraint, "columns", ())]
+    return f"{kind} {constraint.name} {columns}"
+
+
+def _sql_text(clause: object) -> str:
+    """Get the SQL of a textual clause, or the name of a column."""
+    if isinstance(clause, TextClause):
+        return clause.text
+    return str(getattr(clause, "name", clause))
+
+
+def _migrate_legacy_targets(connection: Connection) -> None:
+    """Move the allocation targets table of older databases out of the way.
+
+    ``targets`` used to hold allocation percentages and now holds pivot and
+    failure price targets. The old rows have no prices to copy, so an empty
+    table is dropped and a table holding rows is renamed to
+    ``LEGACY_TARGETS_TABLE``. Either way ``create_all`` then creates
+    ``targets`` with the current columns and indexes.
+
+    Args:
+        connection: Connection in the initializing transaction
+    """
+    inspector = inspect(connection)
+    if not inspector.has_table("targets"):
+        return
+    columns = {column["name"] for column in inspector.get_columns("targets")}
+    if "target_percentage" not in columns:
+        return
+
+    count = select(func.count()).select_from(table_clause("targets"))
+    rows = connection.execute(count).scalar()
+    if not rows:
+        _ = connection.execute(text("DROP TABLE targets"))
+        logger.info("Dropped empty legacy targets table")
+        return
+    _ = connection.execute(
+        text(f"ALTER TABLE targets RENAME TO {LEGACY_TARGETS_TABLE}"),
+    )
+    logger.warning(
+        "Kept %d allocation targets in %s, they have no pivot or failure prices",
+        rows,
+        LEGACY_TARGETS_TABLE,
+    )
+
+
+def _add_missing_columns(
+    connection: Connection,
+    table_metadata: MetaData,
+) -> list[str]:
+    """Add the columns that existing tables created from older code lack.
+
+    Runs after ``create_all``, so every table exists. Only columns that
+    rows already stored can take are added: nullable columns and columns
+    with a server default, e.g. ``version INTEGER NOT NULL DEFAULT 1``.
+
+    Args:
+        connection: Connection in the initializing transaction
+        table_metadata: MetaData containing table definitions
+
+    Returns:
+        ``table.column`` names still missing because they could not be added
+    """
+    inspector = inspect(connection)
+    preparer = connection.dialect.identifier_preparer
+    missing: list[str] = []
+    for table in table_metadata.sorted_tables:
+        present = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in present:
+                continue
+            if not _can_add(column):
+                missing.append(f"{table.name}.{column.name}")
+                continue
+            ddl = CreateColumn(column).compile(dialect=connection.dialect)
+            name = preparer.format_table(table)
+            _ = connection.execute(text(f"ALTER TABLE {name} ADD COLUMN {ddl}"))
+            logger.info("Added column %s.%s", table.name, column.name)
+    return missing
+
+
+def _create_missing_indexes(
+    connection: Connection,
+    table_metadata: MetaData,
+    missing_columns: list[str],
+) -> list[str]:
+    """Create the indexes that existing tables created from older code lack.
+
+    ``create_all`` skips a table that exists together with its indexes, so
+    indexes added since the table was created are created here. Indexes over
+    columns that could not be added are left out.
+
+    Args:
+        connection: Connection in the initializing transaction
+        table_metadata: MetaData containing table definitions
+        missing_columns: ``table.column`` names that could not be added
+
+    Returns:
+        Names of the indexes still missing because their columns are
+    """
+    inspector = inspect(connection)
+    skipped: list[str] = []
+    for table in table_metadata.sorted_tables:
+        present = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in present:
+                continue
+            if any(
+                f"{table.name}.{column.name}" in missing_columns
+                for column in index.columns
+            ):
+                skipped.append(str(index.name))
+                continue
+            _ = index.create(connection)
+            logger.info("Created index %s", index.name)
+    return skipped
+
+
+def _find_obsolete_required_columns(
+    connection: Connection,
+    table_metadata: MetaData,
+) -> list[str]:
+    """Find columns left from older code that block inserts.
+
+    A column the schema no longer defines is never written, so inserts fail
+    while it is NOT NULL without a server default. Such tables need an
+    explicit migration like ``_migrate_legacy_targets``.
+
+    Args:
+        connection: Connection in the initializing transaction
+        table_metadata: MetaData containing table definitions
+
+    Returns:
+        ``table.column`` names of the blocking columns
+    """
+    inspector = inspect(connection)
+    obsolete: list[str] = []
+    for table in table_metadata.sorted_tables:
+        for column in inspector.get_columns(table.name):
+            if column["name"] in table.columns:
+                continue
+            if not column["nullable"] and column.get("default") is None:
+                obsolete.append(f"{table.name}.{column['name']}")
+    return obsolete
+
+
+def _can_add(column: Column[object]) -> bool:
+    """Check whether a column can be added to a table holding rows."""
+    return not column.primary_key and (
+        column.nullable or column.server_default is not None
+    )
+
+
+def _apply_schema_changes(
+    connection: Connection,
+    table_metadata: MetaData,
+) -> list[str]:
+    """Bring a database created from older code up to the current schema.
+
+    Replaced tables are migrated first, then missing tables are created and
+    missing columns and indexes added to the tables that already exist.
+
+    Args:
+        connection: Connection in the initializing transaction
+        table_metadata: MetaData containing table definitions
+
+    Returns:
+        Columns and indexes of the schema that could not be applied
     """
+    _migrate_legacy_targets(connection)
     # Create all tables - this is idempotent (won't recreate existing tables)
-    table_metadata.create_all(engine)
+    table_metadata.create_all(connection)
+    missing = _add_missing_columns(connection, table_metadata)
+    skipped = _create_missing_indexes(connection, table_metadata, missing)
+    obsolete = _find_obsolete_required_columns(connection, table_metadata)
+    if missing:
+        logger.warning("Cannot add columns: %s", ", ".join(missing))
+    if obsolete:
+        logger.warning("Obsolete columns block inserts: %s", ", ".join(obsolete))
+    return [*missing, *skipped, *obsolete]
+
+
+def _create_tables_if_schema_changed(engine: Engine, table_metadata: MetaData) -> bool:
+    """Create missing tables unless the stored schema fingerprint matches.
+
+    A matching fingerprint means the tables were created or verified for
+    exactly this schema, so the existence checks are skipped. Tables
+    dropped by hand are not noticed until the schema changes. When the
+    schema changed, existing tables are brought up to it as well. The
+    fingerprint is stored only once the whole schema is applied, so a
+    schema that could not be applied is checked again on the next start.
+
+    Args:
+        engine: SQLAlchemy engine
+        table_metadata: MetaData containing table definitions
+
+    Returns:
+        True if ``create_all`` ran, False if the schema was current
+    """
+    fingerprint = schema_fingerprint(table_metadata, engine.dialect)
+    stored_fingerprint = select(schema_info_table.c.fingerprint)
+    with engine.begin() as connection:
+        schema_info_table.create(connection, checkfirst=True)
+        if connection.execute(stored_fingerprint).scalar() == fingerprint:
+            logger.info("Schema fingerprint matches, skipped table creation")
+            return False
+
+        unapplied = _apply_schema_changes(connection, table_metadata)
+        if unapplied:
+            logger.warning(
+                "Schema fingerprint not stored, not applied: %s",
+                ", ".join(unapplied),
+            )
+        else:
+            _ = connection.execute(delete(schema_info_table))
+            _ = connection.execute(
+                insert(schema_info_table).values(fingerprint=fingerprint),
+            )
     logger.info("Created/verified %d tables", len(table_metadata.tables))
+    return True
+
+
+def _verify_search_index(engine: Engine) -> None:
+    """Rebuild the journal search index if it no longer matches the entries.
+
+    Runs on every start, fast path included, because ``VACUUM`` may
+    renumber the rowids the index is keyed on without any schema change.
+
+    Args:
+        engine: SQLAlchemy engine
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    with engine.begin() as connection:
+        if verify_journal_search_index(connection):
+            logger.warning("Rebuilt journal search index, it did not match entries")
 
 
 def _ensure_db_directory_exists(database_url: str) -> None:
@@ -75,6 +400,7 @@ def _ensure_db_directory_exists(database_url: str) -> None:
 
 def initialize_database(
     database_url: str,
+    engine: Engine | None = None,
 ) -> None:
     """Initialize the database with all required tables.
 
@@ -83,6 +409,8 @@ def initialize_database(
 
     Args:
         database_url: Database connection URL
+        engine: Engine to initialize through, left open so the application
+            can keep using it; defaults to a temporary engine for the URL
 
     Raises:
         Exception: If database initialization fails
@@ -93,17 +421,20 @@ def initialize_database(
         # Ensure directory exists
         _ensure_db_directory_exists(database_url)
 
-        # Create engine using the factory
-        engine = create_engine(database_url)
+        # Create engine using the factory unless the caller shares one
+        init_engine = engine or create_engine(database_url)
 
         # Collect all metadata
         all_metadata = _collect_all_metadata()
 
-        # Create tables if they don't exist
-        _create_tables_if_not_exist(engine, all_metadata)
-
-        # Dispose of the engine to close connections
-        engine.dispose()
+        try:
+            # Create tables unless the schema is unchanged since last time
+            _ = _create_tables_if_schema_changed(init_engine, all_metadata)
+            _verify_search_index(init_engine)
+        finally:
+            if engine is None:
+                # Dispose of our own engine to close connections
+                init_engine.dispose()
 
         logger.info("Database initialized successfully")
 
@@ -5,12 +5,12 @@ that are separated from the main database factory to maintain
 database independence.
 """
 
-# pyright: reportUnknownMemberType=false, reportUntypedFunctionDecorator=false
+# pyright: reportUnknownMemberType=false, reportUntypedFunctionDecorator=false, reportUnknownVariableType=false
 
 from typing import Any
 
-from sqlalchemy import event
-from sqlalchemy.engine import Engine
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.pool import StaticPool
 
 
@@ -60,6 +60,21 @@ def configure_sqlite_connection(
     cursor.close()
 
 
+def begin_explicit_transaction(connection: Connection) -> None:
+    """Start the database transaction immediately on a connection.
+
+    pysqlite defers BEGIN until the first INSERT/UPDATE/DELETE, so a
+    SAVEPOINT issued first opens the transaction itself and releasing it
+    commits everything. Emitting BEGIN up front makes savepoints nest
+    inside the outer transaction as they do on other databases.
+
+    Args:
+        connection: Connection with a newly begun SQLAlchemy transaction
+    """
+    if connection.dialect.name == "sqlite":
+        _ = connection.execute(text("BEGIN"))
+
+
 def get_sqlite_engine_kwargs(database_url: str) -> dict[str, Any]:
     """Get SQLite-specific engine configuration.
 
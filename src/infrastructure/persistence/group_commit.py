@@ -0,0 +1,314 @@
+"""Group commit for units of work sharing a single writer connection.
+
+SQLite allows one writer at a time and syncs the journal to disk on every
+commit, so a burst of small transactions is bound by fsync latency. The
+GroupCommitter funnels units of work through one shared connection: each
+one runs inside its own SAVEPOINT, and a background writer thread commits
+the surrounding transaction once every few milliseconds or after a number
+of units of work, whichever comes first. Callers still see their own
+commit() block until their changes are durable, and get their own error
+if the shared commit fails.
+
+Only writes need the shared connection: units of work read on pooled
+connections of their own (see SqlAlchemyUnitOfWork), so reads neither
+queue for the writer lock nor see changes awaiting the next group commit.
+Engines with a single shared connection, such as in-memory SQLite, cannot
+give readers a connection of their own; there every statement goes
+through the writer.
+"""
+
+# pyright: reportUnknownMemberType=false
+
+import threading
+import time
+from dataclasses import dataclass
+
+from sqlalchemy.engine import Connection, Engine, NestedTransaction, Transaction
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
+
+from src.infrastructure.persistence.dialects.sqlite import begin_explicit_transaction
+
+
+class GroupCommitError(RuntimeError):
+    """Raised to every unit of work in a group whose shared commit failed."""
+
+
+@dataclass(frozen=True)
+class GroupCommitConfig:
+    """Tuning for the GroupCommitter."""
+
+    max_batch: int = 64  # Units of work per commit
+    max_delay: float = 0.005  # Seconds the first unit of work may wait
+
+    def __post_init__(self) -> None:
+        """Validate the configuration.
+
+        Raises:
+            ValueError: If a setting is out of range
+        """
+        if self.max_batch < 1:
+            msg = "max_batch must be at least 1"
+            raise ValueError(msg)
+        if self.max_delay < 0:
+            msg = "max_delay cannot be negative"
+            raise ValueError(msg)
+
+
+class _CommitGroup:
+    """Units of work that become durable with the same commit."""
+
+    def __init__(self) -> None:
+        """Initialize an empty group."""
+        self.size = 0
+        self.opened_at = 0.0
+        self.done = threading.Event()
+        self.error: BaseException | None = None
+
+
+class GroupCommitSlot:
+    """Exclusive use of the shared connection for one unit of work.
+
+    Created by GroupCommitter.acquire(); holds the writer lock until
+    commit() or rollback() releases it.
+    """
+
+    def __init__(
+        self,
+        committer: "GroupCommitter",
+        connection: Connection,
+    ) -> None:
+        """Open a savepoint for the unit of work.
+
+        Args:
+            committer: Owner of the shared connection
+            connection: Shared connection, already inside a transaction
+        """
+        self._committer = committer
+        self._connection = connection
+        self._savepoint: NestedTransaction | None = connection.begin_nested()
+
+    @property
+    def connection(self) -> Connection:
+        """Get the shared connection; only valid until the slot is released."""
+        return self._connection
+
+    @property
+    def active(self) -> bool:
+        """Check whether the slot still holds the writer lock."""
+        return self._savepoint is not None
+
+    def commit(self) -> None:
+        """Keep the changes and wait until the group commit makes them durable.
+
+        Raises:
+            RuntimeError: If the slot was already released
+            GroupCommitError: If the shared commit failed
+        """
+        savepoint = self._take_savepoint()
+        try:
+            savepoint.commit()
+        except BaseException:
+            _ = self._committer.release(failed=True)
+            raise
+        group = self._committer.release(failed=False)
+        if group is None:  # pragma: no cover - release(failed=False) always joins
+            return
+        _ = group.done.wait()
+        if group.error is not None:
+            msg = "Group commit failed"
+            raise GroupCommitError(msg) from group.error
+
+    def rollback(self) -> None:
+        """Discard the changes and release the writer lock.
+
+        Does nothing if the slot was already released.
+        """
+        if self._savepoint is None:
+            return
+        savepoint = self._take_savepoint()
+        try:
+            savepoint.rollback()
+        except BaseException:
+            _ = self._committer.release(failed=True)
+            raise
+        _ = self._committer.release(failed=False, joined=False)
+
+    def _take_savepoint(self) -> NestedTransaction:
+        """Detach the savepoint so the slot cannot be released twice."""
+        savepoint = self._savepoint
+        if savepoint is None:
+            msg = "Group commit slot was already released"
+            raise RuntimeError(msg)
+        self._savepoint = None
+        return savepoint
+
+
+class GroupCommitter:
+    """Coalesces the commits of many units of work into one transaction."""
+
+    def __init__(self, engine: Engine, config: GroupCommitConfig | None = None) -> None:
+        """Initialize the committer and start its writer thread.
+
+        Args:
+            engine: Engine providing the shared writer connection
+            config: Batching limits
+        """
+        self._engine = engine
+        self._config = config or GroupCommitConfig()
+        # These pools hand every caller the writer's own DBAPI connection
+        self._pooled_reads = not isinstance(
+            engine.pool,
+            StaticPool | SingletonThreadPool,
+        )
+        self._writer_lock = threading.Lock()
+        self._state = threading.Condition()
+        self._connection: Connection | None = None
+        self._transaction: Transaction | None = None
+        self._group = _CommitGroup()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run,
+            name="group-commit-writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    @property
+    def config(self) -> GroupCommitConfig:
+        """Get the batching limits."""
+        return self._config
+
+    @property
+    def pooled_reads(self) -> bool:
+        """Check whether reads may use pooled connections besides the writer's."""
+        return self._pooled_reads
+
+    def acquire(self) -> GroupCommitSlot:
+        """Wait for the shared connection and open a savepoint on it.
+
+        Returns:
+            Slot to run one unit of work in
+
+        Raises:
+            RuntimeError: If the committer is closed
+        """
+        _ = self._writer_lock.acquire()
+        if self._closed:
+            self._writer_lock.release()
+            msg = "Group committer is closed"
+            raise RuntimeError(msg)
+        try:
+            return GroupCommitSlot(self, self._open_transaction())
+        except BaseException:
+            self._writer_lock.release()
+            raise
+
+    def release(self, *, failed: bool, joined: bool = True) -> _CommitGroup | None:
+        """Hand the shared connection back after a slot finishes.
+
+        Args:
+            failed: The slot could not end its savepoint, so the shared
+                transaction is unusable and must be discarded
+            joined: The slot's changes belong to the next commit
+
+        Returns:
+            Group whose commit the caller must wait for, if it joined one
+        """
+        group: _CommitGroup | None = None
+        try:
+            if failed:
+                self._abandon_group()
+            elif joined:
+                with self._state:
+                    group = self._group
+                    group.size += 1
+                    if group.size == 1:
+                        group.opened_at = time.monotonic()
+                    self._state.notify_all()
+        finally:
+            self._writer_lock.release()
+        return group
+
+    def flush(self) -> None:
+        """Commit the current group immediately.
+
+        Raises:
+            GroupCommitError: If the commit failed
+        """
+        group = self._commit_group()
+        if group.error is not None:
+            msg = "Group commit failed"
+            raise GroupCommitError(msg) from group.error
+
+    def close(self) -> None:
+        """Commit outstanding work, stop the writer thread and close the connection."""
+        with self._state:
+            if self._closed:
+                return
+            self._closed = True
+            self._state.notify_all()
+        self._thread.join()
+        with self._writer_lock:
+            self._discard_transaction()
+
+    def _open_transaction(self) -> Connection:
+        """Return the shared connection inside a transaction, opening both lazily."""
+        if self._connection is None:
+            self._connection = self._engine.connect()
+        if self._transaction is None:
+            self._transaction = self._connection.begin()
+            begin_explicit_transaction(self._connection)
+        return self._connection
+
+    def _discard_transaction(self, *, invalidate: bool = False) -> None:
+        """Roll back and close the shared connection; the next slot reopens it.
+
+        Args:
+            invalidate: Drop the underlying DBAPI connection instead of
+                returning it to the pool, for when its state is unknown
+        """
+        connection, self._connection = self._connection, None
+        self._transaction = None
+        if connection is not None:
+            if invalidate:
+                connection.invalidate()
+            connection.close()
+
+    def _abandon_group(self) -> None:
+        """Discard the shared transaction and fail the units of work already in it."""
+        with self._state:
+            group, self._group = self._group, _CommitGroup()
+        self._discard_transaction(invalidate=True)
+        group.error = RuntimeError("Shared transaction was rolled back")
+        group.done.set()
+
+    def _run(self) -> None:
+        """Writer thread: commit each group when it is full or old enough."""
+        while True:
+            with self._state:
+                while self._group.size == 0 and not self._closed:
+                    _ = self._state.wait()
+                if self._group.size == 0:
+                    return
+                deadline = self._group.opened_at + self._config.max_delay
+                while self._group.size < self._config.max_batch and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    _ = self._state.wait(remaining)
+            _ = self._commit_group()
+
+    def _commit_group(self) -> _CommitGroup:
+        """Commit the shared transaction and wake the group's callers."""
+        with self._writer_lock:
+            with self._state:
+                group, self._group = self._group, _CommitGroup()
+            transaction, self._transaction = self._transaction, None
+            if transaction is not None:
+                try:
+                    transaction.commit()
+                except Exception as error:  # noqa: BLE001 - reported to every caller
+                    group.error = error
+                    self._discard_transaction(invalidate=True)
+        group.done.set()
+        return group
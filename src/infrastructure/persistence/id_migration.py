@@ -0,0 +1,117 @@
+"""Migration of existing databases to UUID entity IDs.
+
+Databases created before time-ordered IDs store random uuid4 text, and
+older or imported rows may use arbitrary strings such as ``stock-1``.
+``migrate_ids`` copies every table into a database created with the current
+schema, converting each ID and foreign key value with ``to_uuid``. UUID text
+is kept as it is, and any other ID maps to a name-based UUID, so references
+between tables stay consistent. With STOCKBOOK_DB_BINARY_IDS enabled the
+target stores the converted IDs as 16-byte BLOBs.
+"""
+
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+# pyright: reportArgumentType=false
+
+import uuid
+from typing import Any
+
+from sqlalchemy import MetaData, String, Table, column, insert, inspect, select
+from sqlalchemy import table as table_clause
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import type_coerce
+
+# Namespace of the name-based UUIDs given to IDs that are not UUIDs
+LEGACY_ID_NAMESPACE = uuid.UUID("5b0d5c1e-6f8a-4d38-9c52-3f1f6a2b7e40")
+
+MIGRATION_CHUNK_SIZE = 10_000
+
+
+def to_uuid(value: str) -> str:
+    """Convert a stored ID to canonical UUID text.
+
+    Args:
+        value: ID as stored in a text column
+
+    Returns:
+        The ID itself if it is a UUID, otherwise a UUID derived from it
+    """
+    try:
+        return str(uuid.UUID(value))
+    except ValueError:
+        return str(uuid.uuid5(LEGACY_ID_NAMESPACE, value))
+
+
+def id_column_names(table: Table) -> set[str]:
+    """Get the columns of a table that hold entity IDs.
+
+    Args:
+        table: Table definition
+
+    Returns:
+        Names of the ``id`` primary key and of every foreign key column
+    """
+    return {
+        col.name
+        for col in table.columns
+        if col.foreign_keys or (col.primary_key and col.name == "id")
+    }
+
+
+def migrate_ids(
+    source: Connection,
+    target: Connection,
+    metadata: MetaData,
+) -> dict[str, int]:
+    """Copy all tables from a text-ID database, converting the IDs.
+
+    Rows are streamed and inserted in chunks, parents before children, so
+    memory stays flat and foreign keys hold throughout.
+
+    Args:
+        source: Connection to the existing database
+        target: Connection to a database with the schema already created;
+            the caller commits
+        metadata: Table definitions of the target schema
+
+    Returns:
+        Number of rows copied per table; tables missing in the source are
+        skipped
+    """
+    source_tables = set(inspect(source).get_table_names())
+    copied: dict[str, int] = {}
+    for table in metadata.sorted_tables:
+        if table.name in source_tables:
+            copied[table.name] = _copy_table(source, target, table)
+    return copied
+
+
+def _copy_table(source: Connection, target: Connection, table: Table) -> int:
+    """Copy one table in chunks and return the number of rows."""
+    id_columns = id_column_names(table)
+    present = {info["name"] for info in inspect(source).get_columns(table.name)}
+    # Read IDs as plain text and every other column with its target type
+    selected = [
+        type_coerce(
+            column(col.name),
+            String() if col.name in id_columns else col.type,
+        ).label(col.name)
+        for col in table.columns
+        if col.name in present
+    ]
+    stmt = select(*selected).select_from(table_clause(table.name))
+    result = source.execution_options(yield_per=MIGRATION_CHUNK_SIZE).execute(stmt)
+
+    count = 0
+    for partition in result.partitions():
+        rows: list[dict[str, Any]] = [
+            {
+                name: to_uuid(value)
+                if name in id_columns and value is not None
+                else value
+                for name, value in row._asdict().items()
+            }
+            for row in partition
+        ]
+        _ = target.execute(insert(table), rows)
+        count += len(rows)
+    return count
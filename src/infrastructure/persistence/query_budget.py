@@ -0,0 +1,192 @@
+"""Query counting, budgets and N+1 detection.
+
+SqlAlchemyConnection reports every statement to the query logs that are
+recording: the log of its unit of work when that unit of work has a budget,
+and any log opened with ``record_queries()`` in the current context.
+Statements are grouped by shape, their SQL with parameters left as
+placeholders, so "one SELECT per held stock" shows up as a single shape
+executed many times with different parameters: the N+1 pattern.
+
+Nothing is compiled or stored unless a log is recording.
+"""
+
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy.sql import ClauseElement
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceededError(RuntimeError):
+    """Raised when a unit of work issues more queries than its budget allows."""
+
+
+@dataclass(frozen=True)
+class RepeatedStatement:
+    """A statement shape executed several times with different parameters."""
+
+    shape: str
+    executions: int
+    distinct_parameters: int
+
+
+class QueryLog:
+    """Statements executed while recording, grouped by shape."""
+
+    def __init__(self) -> None:
+        """Initialize an empty log."""
+        self.count = 0
+        self._executions: dict[str, int] = {}
+        self._parameters: dict[str, set[str]] = {}
+
+    def record(self, statement: Any, parameters: Any = None) -> None:
+        """Add one executed statement.
+
+        Args:
+            statement: SQLAlchemy statement or textual SQL
+            parameters: Parameters passed alongside the statement
+        """
+        shape, bound = statement_shape(statement)
+        if parameters is not None:
+            bound = f"{bound}|{parameters!r}"
+        self.count += 1
+        self._executions[shape] = self._executions.get(shape, 0) + 1
+        self._parameters.setdefault(shape, set()).add(bound)
+
+    @property
+    def shapes(self) -> dict[str, int]:
+        """Get the number of executions per statement shape."""
+        return dict(self._executions)
+
+    def repeated(self, threshold: int = 2) -> list[RepeatedStatement]:
+        """Find shapes executed at least ``threshold`` times with varying parameters.
+
+        Args:
+            threshold: Minimum number of executions to report
+
+        Returns:
+            Repeated statements, most executed first
+        """
+        repeated = [
+            RepeatedStatement(shape, executions, len(self._parameters[shape]))
+            for shape, executions in self._executions.items()
+            if executions >= threshold and len(self._parameters[shape]) > 1
+        ]
+        return sorted(repeated, key=lambda item: item.executions, reverse=True)
+
+    def describe(self) -> str:
+        """Summarize the log for error messages, most executed shapes first."""
+        lines = [f"{self.count} statements executed:"]
+        for shape, executions in sorted(
+            self._executions.items(),
+            key=lambda item: item[1],
+            reverse=True,
+        ):
+            first_line = " ".join(shape.split())
+            lines.append(f"  {executions} x {first_line}")
+        return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class QueryBudget:
+    """Limits on the statements a single unit of work may execute."""
+
+    max_queries: int | None = None  # Total statements; None for no limit
+    max_repeats: int | None = None  # Executions of one shape with varying params
+    raise_on_exceeded: bool = False  # Raise instead of logging a warning
+
+    def __post_init__(self) -> None:
+        """Validate the budget.
+
+        Raises:
+            ValueError: If a limit is below 1
+        """
+        for name in ("max_queries", "max_repeats"):
+            limit = getattr(self, name)
+            if limit is not None and limit < 1:
+                msg = f"{name} must be at least 1"
+                raise ValueError(msg)
+
+    def violations(self, log: QueryLog) -> list[str]:
+        """Describe how a log exceeds this budget.
+
+        Returns:
+            One message per exceeded limit; empty when within budget
+        """
+        problems: list[str] = []
+        if self.max_queries is not None and log.count > self.max_queries:
+            problems.append(
+                f"{log.count} queries exceed the budget of {self.max_queries}",
+            )
+        if self.max_repeats is not None:
+            for item in log.repeated(self.max_repeats + 1):
+                shape = " ".join(item.shape.split())
+                problems.append(
+                    f"possible N+1: {item.executions} executions of {shape}",
+                )
+        return problems
+
+    def check(self, log: QueryLog) -> None:
+        """Log or raise when a log exceeds this budget.
+
+        Raises:
+            QueryBudgetExceededError: If exceeded and raise_on_exceeded is set
+        """
+        problems = self.violations(log)
+        if not problems:
+            return
+        message = "; ".join(problems)
+        if self.raise_on_exceeded:
+            raise QueryBudgetExceededError(message)
+        logger.warning("Query budget exceeded: %s", message)
+
+
+_active_logs: ContextVar[tuple[QueryLog, ...]] = ContextVar(
+    "active_query_logs",
+    default=(),
+)
+
+
+def statement_shape(statement: Any) -> tuple[str, str]:
+    """Get the parameter-free SQL of a statement and its bound values.
+
+    Args:
+        statement: SQLAlchemy statement or textual SQL
+
+    Returns:
+        SQL with placeholders, and the bound values as text
+    """
+    if isinstance(statement, ClauseElement):
+        compiled = statement.compile()
+        return str(compiled), repr(sorted(compiled.params.items()))
+    return str(statement), ""
+
+
+def active_query_logs() -> tuple[QueryLog, ...]:
+    """Get the logs opened by record_queries() in the current context."""
+    return _active_logs.get()
+
+
+@contextmanager
+def record_queries() -> Iterator[QueryLog]:
+    """Record every statement executed in the current context.
+
+    Contexts are copied into tasks and ``asyncio.to_thread`` calls, so work
+    started inside the block is recorded too.
+
+    Yields:
+        Log that fills up while the block runs
+    """
+    log = QueryLog()
+    token = _active_logs.set((*_active_logs.get(), log))
+    try:
+        yield log
+    finally:
+        _active_logs.reset(token)
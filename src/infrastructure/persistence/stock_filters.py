@@ -0,0 +1,61 @@
+"""Compile stock query specs into SQLAlchemy Core clauses.
+
+Shared by the stock repository and the stock field projection so both
+filter and order listings the same way. Equality filters hit the indexes on
+``sector``, ``industry_group`` and ``grade``; the symbol prefix becomes a
+range on the unique symbol index, since SQLite's case-insensitive ``LIKE``
+cannot use an index. Only a substring match on the symbol scans the table.
+"""
+
+# pyright: reportUnknownArgumentType=false, reportUnknownMemberType=false, reportUnknownVariableType=false, reportArgumentType=false
+
+from typing import Any
+
+from src.domain.value_objects.stock_query_spec import StockQuerySpec
+from src.infrastructure.persistence.tables.stock_table import stock_table
+
+# Sort field -> column, named as in StockDto
+_SORT_COLUMNS: dict[str, Any] = {
+    "symbol": stock_table.c.symbol,
+    "name": stock_table.c.company_name,
+    "sector": stock_table.c.sector,
+    "industry_group": stock_table.c.industry_group,
+    "grade": stock_table.c.grade,
+}
+
+
+def apply_stock_query_spec(stmt: Any, spec: StockQuerySpec) -> Any:
+    """Add the filters and sort order of a spec to a stock SELECT.
+
+    Args:
+        stmt: SELECT over the stocks table
+        spec: Filters and sort order to apply
+
+    Returns:
+        The statement with WHERE and ORDER BY clauses added
+    """
+    if spec.sector is not None:
+        stmt = stmt.where(stock_table.c.sector == spec.sector)
+    if spec.industry_group is not None:
+        stmt = stmt.where(stock_table.c.industry_group == spec.industry_group)
+    if spec.grade is not None:
+        stmt = stmt.where(stock_table.c.grade == spec.grade)
+    if spec.symbol_prefix:
+        # Symbols are stored upper-case; [prefix, next prefix) is an index range
+        prefix = spec.symbol_prefix.upper()
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        stmt = stmt.where(
+            (stock_table.c.symbol >= prefix) & (stock_table.c.symbol < upper),
+        )
+    if spec.symbol_contains:
+        stmt = stmt.where(stock_table.c.symbol.ilike(f"%{spec.symbol_contains}%"))
+
+    order_by = [
+        _SORT_COLUMNS[key.field].desc() if key.descending else _SORT_COLUMNS[key.field]
+        for key in spec.sort
+    ]
+    if spec.sort:
+        # Symbols are unique, so ties always resolve the same way
+        order_by.append(stock_table.c.symbol)
+        stmt = stmt.order_by(*order_by)
+    return stmt
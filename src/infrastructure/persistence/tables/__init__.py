@@ -7,21 +7,35 @@ All tables share a common metadata instance for schema management.
 from src.infrastructure.persistence.tables.journal_entry_table import (
     journal_entry_table,
 )
+from src.infrastructure.persistence.tables.journal_search_index import (
+    journal_search_table,
+)
+from src.infrastructure.persistence.tables.journal_tag_table import journal_tag_table
+from src.infrastructure.persistence.tables.outbox_table import outbox_table
 from src.infrastructure.persistence.tables.portfolio_balance_table import (
     portfolio_balance_table,
 )
 from src.infrastructure.persistence.tables.portfolio_table import portfolio_table
 from src.infrastructure.persistence.tables.position_table import position_table
+from src.infrastructure.persistence.tables.schema_info_table import (
+    schema_info_metadata,
+    schema_info_table,
+)
 from src.infrastructure.persistence.tables.stock_table import metadata, stock_table
 from src.infrastructure.persistence.tables.target_table import target_table
 from src.infrastructure.persistence.tables.transaction_table import transaction_table
 
 __all__ = [
     "journal_entry_table",
+    "journal_search_table",
+    "journal_tag_table",
     "metadata",
+    "outbox_table",
     "portfolio_balance_table",
     "portfolio_table",
     "position_table",
+    "schema_info_metadata",
+    "schema_info_table",
     "stock_table",
     "target_table",
     "transaction_table",
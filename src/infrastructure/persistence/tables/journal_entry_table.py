@@ -21,10 +21,11 @@ journal_entry_table: Table = Table(
     *base_columns(),
     foreign_key_column("portfolio_id", "portfolios", nullable=True),  # Can be general
     foreign_key_column("stock_id", "stocks", nullable=True),  # Can be portfolio-level
+    foreign_key_column("transaction_id", "transactions", nullable=True),
     Column("entry_type", String, nullable=False),
     Column("title", String, nullable=False),
     Column("content", Text, nullable=False),
-    Column("tags", String, nullable=True),  # Comma-separated tags
+    Column("tags", String, nullable=True),  # Comma-separated copy of journal_tags
     Column(
         "entry_date",
         DateTime,
@@ -40,5 +41,6 @@ journal_entry_table: Table = Table(
     # Indexes for common queries
     Index("idx_portfolio_entries", "portfolio_id"),
     Index("idx_stock_entries", "stock_id"),
+    Index("idx_transaction_entries", "transaction_id"),
     Index("idx_entry_date", "entry_date"),
 )
@@ -0,0 +1,145 @@
+"""Full-text search index for journal entries.
+
+SQLAlchemy Core cannot declare SQLite FTS5 virtual tables, so the index is
+created by a DDL hook that runs after ``metadata.create_all``. It is an
+external-content FTS5 table over ``journal_entries`` (no second copy of the
+text) kept in sync by triggers, and is only created on SQLite.
+
+The index is keyed on the implicit rowid of ``journal_entries``, which
+``VACUUM`` may renumber, so startup checks the index against the table
+with ``verify_journal_search_index`` and rebuilds it when they disagree.
+"""
+
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
+
+from typing import Any
+
+from sqlalchemy import MetaData, column, event, exc, table, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql.elements import TextClause
+
+from src.infrastructure.persistence.tables.stock_table import metadata
+
+JOURNAL_SEARCH_TABLE = "journal_entries_fts"
+
+# Lightweight table clause for querying the virtual table with Core
+journal_search_table = table(
+    JOURNAL_SEARCH_TABLE,
+    column("rowid"),
+    column("title"),
+    column("content"),
+)
+
+# Table names are spelled out (not interpolated) so the DDL is a constant
+SEARCH_INDEX_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS journal_entries_fts USING fts5(
+        title,
+        content,
+        content='journal_entries',
+        content_rowid='rowid',
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS journal_entries_fts_insert
+    AFTER INSERT ON journal_entries BEGIN
+        INSERT INTO journal_entries_fts(rowid, title, content)
+        VALUES (new.rowid, new.title, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS journal_entries_fts_delete
+    AFTER DELETE ON journal_entries BEGIN
+        INSERT INTO journal_entries_fts(journal_entries_fts, rowid, title, content)
+        VALUES ('delete', old.rowid, old.title, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS journal_entries_fts_update
+    AFTER UPDATE OF title, content ON journal_entries BEGIN
+        INSERT INTO journal_entries_fts(journal_entries_fts, rowid, title, content)
+        VALUES ('delete', old.rowid, old.title, old.content);
+        INSERT INTO journal_entries_fts(rowid, title, content)
+        VALUES (new.rowid, new.title, new.content);
+    END
+    """,
+)
+
+
+# Needed after VACUUM, which may renumber the implicit rowids the index is keyed on
+REBUILD_JOURNAL_SEARCH_INDEX: TextClause = text(
+    "INSERT INTO journal_entries_fts(journal_entries_fts) VALUES ('rebuild')",
+)
+
+# A rank of 1 also compares the index with the rows of journal_entries
+CHECK_JOURNAL_SEARCH_INDEX: TextClause = text(
+    """
+    INSERT INTO journal_entries_fts(journal_entries_fts, rank)
+    VALUES ('integrity-check', 1)
+    """,
+)
+
+
+def create_journal_search_index(connection: Connection) -> None:
+    """Create the FTS5 index and its sync triggers if they don't exist.
+
+    When the index is created for a database that already holds journal
+    entries, it is rebuilt from the existing rows.
+
+    Args:
+        connection: SQLite connection inside the schema-creation transaction
+    """
+    existed = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": JOURNAL_SEARCH_TABLE},
+    ).first()
+    for statement in SEARCH_INDEX_DDL:
+        _ = connection.execute(text(statement))
+    if existed is None:
+        rebuild_journal_search_index(connection)
+
+
+def rebuild_journal_search_index(connection: Connection) -> None:
+    """Rebuild the FTS5 index from journal_entries.
+
+    Args:
+        connection: SQLite connection
+    """
+    _ = connection.execute(REBUILD_JOURNAL_SEARCH_INDEX)
+
+
+def verify_journal_search_index(connection: Connection) -> bool:
+    """Rebuild the FTS5 index if it no longer matches journal_entries.
+
+    Args:
+        connection: SQLite connection
+
+    Returns:
+        True if the index was rebuilt, False if it was intact or missing
+    """
+    if not connection.dialect.has_table(connection, JOURNAL_SEARCH_TABLE):
+        return False
+    try:
+        _ = connection.execute(CHECK_JOURNAL_SEARCH_INDEX)
+    except exc.DatabaseError:
+        rebuild_journal_search_index(connection)
+        return True
+    return False
+
+
+def _create_search_index_after_tables(
+    target: MetaData,
+    connection: Connection,
+    **kw: Any,
+) -> None:
+    """Create the search index whenever the schema is created on SQLite."""
+    _ = target, kw
+    if connection.dialect.name == "sqlite" and connection.dialect.has_table(
+        connection,
+        "journal_entries",
+    ):
+        create_journal_search_index(connection)
+
+
+event.listen(metadata, "after_create", _create_search_index_after_tables)
@@ -0,0 +1,27 @@
+"""Journal tag table definition using SQLAlchemy Core.
+
+This module defines the normalized tag table for journal entries, one row
+per (entry, tag) pair, so tag filters use an index instead of scanning the
+comma-separated tags column.
+"""
+
+from sqlalchemy import Column, ForeignKey, Index, String, Table
+
+from src.infrastructure.persistence.tables.stock_table import metadata
+from src.infrastructure.persistence.tables.table_utils import entity_id_type
+
+# Define the journal tag table using SQLAlchemy Core
+journal_tag_table: Table = Table(
+    "journal_tags",
+    metadata,
+    Column(
+        "entry_id",
+        entity_id_type(),
+        ForeignKey("journal_entries.id", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    ),
+    Column("tag", String, primary_key=True, nullable=False),  # Lowercase
+    # Tag lookups go tag -> entries; the primary key covers entry -> tags
+    Index("idx_journal_tags_tag", "tag", "entry_id"),
+)
@@ -0,0 +1,40 @@
+"""Event outbox table definition using SQLAlchemy Core.
+
+This module defines the outbox table that stores serialized domain events
+in the same transaction as the changes that raised them, until a
+dispatcher delivers them.
+"""
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Table,
+    Text,
+    text,
+)
+
+from src.infrastructure.persistence.tables.stock_table import metadata
+
+# Define the outbox table using SQLAlchemy Core
+outbox_table: Table = Table(
+    "outbox_events",
+    metadata,
+    # Integer key so rows can be read back in write order
+    Column("sequence", Integer, primary_key=True, autoincrement=True),
+    Column("event_id", String, nullable=False, unique=True),
+    Column("event_type", String, nullable=False),
+    Column("payload", Text, nullable=False),  # JSON-encoded event data
+    Column("occurred_at", DateTime(timezone=True), nullable=False),
+    Column(
+        "created_at",
+        DateTime,
+        nullable=False,
+        server_default=text("CURRENT_TIMESTAMP"),
+    ),
+    Column("dispatched_at", DateTime(timezone=True), nullable=True),
+    # The dispatcher polls for undispatched rows in sequence order
+    Index("idx_outbox_pending", "dispatched_at", "sequence"),
+)
@@ -0,0 +1,26 @@
+"""Schema fingerprint table definition using SQLAlchemy Core.
+
+This module defines the table recording the fingerprint of the schema a
+database was last created or verified with, so startup can skip
+``create_all`` when nothing changed. It has its own metadata: the table is
+bookkeeping of the initializer, not part of the application schema, so
+``create_all`` of the shared metadata and ID migrations leave it alone.
+"""
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, text
+
+schema_info_metadata = MetaData()
+
+# Define the schema info table using SQLAlchemy Core
+schema_info_table: Table = Table(
+    "schema_info",
+    schema_info_metadata,
+    # Hex SHA-256 of the schema DDL; the table holds at most one row
+    Column("fingerprint", String(64), primary_key=True),
+    Column(
+        "created_at",
+        DateTime,
+        nullable=False,
+        server_default=text("CURRENT_TIMESTAMP"),
+    ),
+)
@@ -4,12 +4,15 @@ This module defines the stock table structure using SQLAlchemy's Core
 Table construct (not ORM) to maintain clean architecture separation.
 """
 
-from sqlalchemy import Column, MetaData, String, Table
+from sqlalchemy import Column, Index, MetaData, String, Table
 
 from .table_utils import base_columns
 
-# Create metadata instance for all tables
-metadata: MetaData = MetaData()
+# Create metadata instance for all tables; unique constraints get stable
+# names so integrity errors can be classified by constraint
+metadata: MetaData = MetaData(
+    naming_convention={"uq": "uq_%(table_name)s_%(column_0_name)s"},
+)
 
 # Define the stock table using SQLAlchemy Core
 stock_table: Table = Table(
@@ -22,4 +25,8 @@ stock_table: Table = Table(
     Column("industry_group", String, nullable=True),
     Column("grade", String, nullable=True),
     Column("notes", String, nullable=True),
+    # Listing filters (see stock_filters) compare these for equality
+    Index("idx_stocks_sector", "sector"),
+    Index("idx_stocks_industry_group", "industry_group"),
+    Index("idx_stocks_grade", "grade"),
 )
@@ -9,18 +9,73 @@ Since we're using Core (not ORM), we use factory functions instead
 of class inheritance to share common column definitions.
 """
 
+import uuid
 from typing import Any
 
-from sqlalchemy import CheckConstraint, Column, DateTime, ForeignKey, String, text
+from sqlalchemy import (
+    CheckConstraint,
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    String,
+    text,
+)
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+from src.infrastructure.config import database_config
+
+
+class BinaryId(TypeDecorator[str]):
+    """Entity ID stored as 16 raw bytes instead of 36-character text.
+
+    Entities keep using canonical UUID strings; the conversion happens when
+    values are bound and fetched, so queries and repositories are unchanged.
+    At under half the width of the text form, the primary key and every
+    foreign key index shrink accordingly.
+    """
+
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    # The type stubs expect bind values to be text
+    def process_bind_param(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        value: str | None,
+        dialect: Dialect,
+    ) -> bytes | None:
+        """Convert UUID text to its 16 bytes."""
+        _ = dialect
+        return None if value is None else uuid.UUID(value).bytes
+
+    def process_result_value(
+        self,
+        value: bytes | None,
+        dialect: Dialect,
+    ) -> str | None:
+        """Convert 16 stored bytes back to UUID text."""
+        _ = dialect
+        return None if value is None else str(uuid.UUID(bytes=value))
+
+
+def entity_id_type() -> TypeEngine[Any]:
+    """Get the column type of entity IDs and references to them.
+
+    Returns:
+        BinaryId when STOCKBOOK_DB_BINARY_IDS is set, String otherwise
+    """
+    return BinaryId() if database_config.binary_ids else String()
 
 
 def id_column() -> Column[Any]:
     """Create a standard ID column.
 
     Returns:
-        Column with String type, primary key, not nullable
+        Column with the entity ID type, primary key, not nullable
     """
-    return Column("id", String, primary_key=True, nullable=False)
+    return Column("id", entity_id_type(), primary_key=True, nullable=False)
 
 
 def foreign_key_column(
@@ -41,7 +96,7 @@ def foreign_key_column(
     """
     return Column(
         column_name,
-        String,
+        entity_id_type(),
         ForeignKey(f"{referenced_table}.id"),
         nullable=nullable,
     )
@@ -69,6 +124,19 @@ def timestamp_columns() -> list[Column[Any]]:
     ]
 
 
+def version_column() -> Column[Any]:
+    """Create the row version column used for optimistic concurrency.
+
+    Every successful update increments the version, so an update that
+    still expects the version it loaded matches no row once another
+    writer has committed in between.
+
+    Returns:
+        Column with Integer type, not nullable, starting at 1
+    """
+    return Column("version", Integer, nullable=False, server_default=text("1"))
+
+
 def enum_check_constraint(
     column_name: str,
     allowed_values: list[str],
@@ -93,18 +161,19 @@ def base_columns() -> list[Column[Any]]:
 
     This is the SQLAlchemy Core equivalent of a base table mixin.
     It provides the standard columns that all tables in our system
-    share: id (primary key), created_at, and updated_at.
+    share: id (primary key), created_at, updated_at, and the row
+    version used for optimistic concurrency.
 
     Usage:
         stock_table = Table(
             "stocks",
             metadata,
-            *base_columns(),  # Unpacks id, created_at, updated_at
+            *base_columns(),  # Unpacks id, created_at, updated_at, version
             Column("symbol", String, nullable=False),
             # ... other columns
         )
 
     Returns:
-        List containing id, created_at, and updated_at columns
+        List containing id, created_at, updated_at, and version columns
     """
-    return [id_column(), *timestamp_columns()]
+    return [id_column(), *timestamp_columns(), version_column()]
@@ -1,19 +1,21 @@
 """Target table definition using SQLAlchemy Core.
 
-This module defines the target table structure for portfolio allocation targets.
+This module defines the target table structure for pivot/failure price targets.
 """
 
 from sqlalchemy import (
-    CheckConstraint,
     Column,
+    DateTime,
+    Index,
     Numeric,
+    String,
     Table,
-    UniqueConstraint,
+    text,
 )
 
 from src.infrastructure.persistence.tables.stock_table import metadata
 
-from .table_utils import base_columns, foreign_key_column
+from .table_utils import base_columns, enum_check_constraint, foreign_key_column
 
 # Define the target table using SQLAlchemy Core
 target_table: Table = Table(
@@ -23,15 +25,25 @@ target_table: Table = Table(
     foreign_key_column("portfolio_id", "portfolios"),
     foreign_key_column("stock_id", "stocks"),
     Column(
-        "target_percentage",
-        Numeric(precision=5, scale=2),  # Supports 0.00 to 999.99
+        "pivot_price",
+        Numeric(precision=15, scale=4),  # Support precise pricing
         nullable=False,
     ),
-    # Composite unique constraint
-    UniqueConstraint("portfolio_id", "stock_id", name="uq_portfolio_stock"),
-    # Check constraint for percentage
-    CheckConstraint(
-        "target_percentage >= 0 AND target_percentage <= 100",
-        name="ck_target_percentage_range",
+    Column(
+        "failure_price",
+        Numeric(precision=15, scale=4),  # Support precise pricing
+        nullable=False,
+    ),
+    Column("status", String, nullable=False, server_default=text("'active'")),
+    Column("created_date", DateTime, nullable=False),
+    Column("notes", String, nullable=True),
+    # Check constraint for target status
+    enum_check_constraint(
+        "status",
+        ["active", "hit", "failed", "cancelled"],
+        "ck_target_status",
     ),
+    # Monitoring loads all active targets; lookups go by portfolio or stock
+    Index("idx_target_status_stock", "status", "stock_id"),
+    Index("idx_target_portfolio", "portfolio_id"),
 )
@@ -6,12 +6,16 @@ using SQLAlchemy for transaction management and repository coordination.
 
 # pyright: reportUnknownMemberType=false
 
+import time
 import types
+from collections.abc import Callable
+from typing import Any
 
 from sqlalchemy.engine import Connection, Engine
 
 from src.domain.repositories.interfaces import (
     IJournalRepository,
+    IOutboxRepository,
     IPortfolioBalanceRepository,
     IPortfolioRepository,
     IPositionRepository,
@@ -20,14 +24,38 @@ from src.domain.repositories.interfaces import (
     ITargetRepository,
     ITransactionRepository,
 )
-from src.infrastructure.persistence.database_connection import SqlAlchemyConnection
+from src.infrastructure.persistence.database_connection import (
+    SqlAlchemyConnection,
+    statement_labels,
+)
+from src.infrastructure.persistence.group_commit import GroupCommitSlot, GroupCommitter
 from src.infrastructure.persistence.interfaces import IDatabaseConnection
+from src.infrastructure.persistence.query_budget import QueryBudget, QueryLog
+from src.infrastructure.repositories.sqlalchemy_journal_repository import (
+    SqlAlchemyJournalRepository,
+)
+from src.infrastructure.repositories.sqlalchemy_outbox_repository import (
+    SqlAlchemyOutboxRepository,
+)
 from src.infrastructure.repositories.sqlalchemy_position_repository import (
     SqlAlchemyPositionRepository,
 )
 from src.infrastructure.repositories.sqlalchemy_stock_repository import (
     SqlAlchemyStockRepository,
 )
+from src.infrastructure.repositories.sqlalchemy_target_repository import (
+    SqlAlchemyTargetRepository,
+)
+from src.infrastructure.repositories.sqlalchemy_transaction_repository import (
+    SqlAlchemyTransactionRepository,
+)
+from src.shared.instrumentation import metrics
+
+_unit_of_work_seconds = metrics.histogram(
+    "stockbook_unit_of_work_duration_seconds",
+    "Time from entering to leaving a unit of work",
+    ("outcome",),
+)
 
 
 class SqlAlchemyUnitOfWork(IStockBookUnitOfWork):
@@ -37,13 +65,33 @@ class SqlAlchemyUnitOfWork(IStockBookUnitOfWork):
     that share the same transactional connection.
     """
 
-    def __init__(self, engine: Engine) -> None:
+    def __init__(
+        self,
+        engine: Engine,
+        on_outbox_commit: Callable[[], None] | None = None,
+        group_committer: GroupCommitter | None = None,
+        query_budget: QueryBudget | None = None,
+    ) -> None:
         """Initialize unit of work with SQLAlchemy engine.
 
         Args:
             engine: SQLAlchemy engine for database connections
+            on_outbox_commit: Called after a commit that wrote outbox
+                messages, e.g. to wake the event dispatcher
+            group_committer: When given, run writes on its shared writer
+                connection and let it batch this commit with concurrent
+                ones; reads until the first write use a pooled connection
+            query_budget: When given, count the statements of each use and
+                warn or raise on leaving when they exceed the budget
         """
         self._engine = engine
+        self._on_outbox_commit = on_outbox_commit
+        self._group_committer = group_committer
+        self._query_budget = query_budget
+        self._query_log: QueryLog | None = None
+        self._group_connection: _GroupCommitConnection | None = None
+        self._started_at: float | None = None
+        self._outbox_written = False
         self._connection: Connection | None = None
         self._db_connection: IDatabaseConnection | None = None
         self._stocks: IStockRepository | None = None
@@ -53,6 +101,7 @@ class SqlAlchemyUnitOfWork(IStockBookUnitOfWork):
         self._balances: IPortfolioBalanceRepository | None = None
         self._positions: IPositionRepository | None = None
         self._journal: IJournalRepository | None = None
+        self._outbox: IOutboxRepository | None = None
 
     def __enter__(self) -> "SqlAlchemyUnitOfWork":
         """Enter the unit of work context.
@@ -65,16 +114,30 @@ class SqlAlchemyUnitOfWork(IStockBookUnitOfWork):
         Raises:
             RuntimeError: If unit of work is already active (nested usage)
         """
-        if self._connection is not None:
+        if self._db_connection is not None:
             msg = "Unit of work is already active"
             raise RuntimeError(msg)
 
+        if metrics.enabled:
+            self._started_at = time.perf_counter()
+        if self._query_budget is not None:
+            self._query_log = QueryLog()
+
+        if self._group_committer is not None:
+            self._group_connection = _GroupCommitConnection(
+                self._engine,
+                self._group_committer,
+                self._query_log,
+            )
+            self._db_connection = self._group_connection
+            return self
+
         # Create connection and begin transaction
         self._connection = self._engine.connect()
         _ = self._connection.begin()
 
         # Wrap in our adapter
-        self._db_connection = SqlAlchemyConnection(self._connection)
+        self._db_connection = SqlAlchemyConnection(self._connection, self._query_log)
 
         return self
 
@@ -86,7 +149,9 @@ class SqlAlchemyUnitOfWork(IStockBookUnitOfWork):
     ) -> bool | None:
         """Exit the unit of work context.
 
-        Commits transaction on success, rolls back on exception.
+        Commits transaction on success, rolls back on exception. Without an
+        exception, the statements executed are checked against the query
+        budget.
 
         Args:
             exc_type: Exception type if an exception occurred
@@ -95,25 +160,41 @@ class SqlAlchemyUnitOfWork(IStockBookUnitOfWork):
 
         Returns:
             None to propagate exceptions
+
+        Raises:
+            QueryBudgetExceededError: If over a budget that raises
         """
-        if self._connection is None:
+        if self._db_connection is None:
             return None
+        query_log, self._query_log = self._query_log, None
 
         try:
-            # Let SQLAlchemy's connection context manager handle commit/rollback
-            self._connection.__exit__(exc_type, exc_val, exc_tb)
+            if self._group_connection is not None:
+                # Drop uncommitted writes and return the reader to the pool
+                self._group_connection.close()
+            elif self._connection is not None:
+                # Let SQLAlchemy's connection context manager handle commit/rollback
+                self._connection.__exit__(exc_type, exc_val, exc_tb)
         finally:
+            if self._started_at is not None:
+                _unit_of_work_seconds.observe(
+                    time.perf_counter() - self._started_at,
+                    "ok" if exc_type is None else "error",
+                )
+                self._started_at = None
             # Clean up resources
+            self._group_connection = None
             self._connection = None
             self._db_connection = None
-            self._stocks = None
-            self._portfolios = None
-            self._transactions = None
-            self._targets = None
-            self._balances = None
-            self._positions = None
-            self._journal = None
-
+            self._reset_repositories()
+            self._outbox_written = False
+
+        if (
+            query_log is not None
+            and self._query_budget is not None
+            and exc_type is None
+        ):
+            self._query_budget.check(query_log)
         return None  # Propagate exceptions
 
     @property
@@ -153,9 +234,10 @@ class SqlAlchemyUnitOfWork(IStockBookUnitOfWork):
             if self._db_connection is None:  # pragma: no cover
                 msg = "Database connection unexpectedly None"
                 raise RuntimeError(msg)
-            # TODO: Replace with actual implementation when available
-            self._transactions = _SqlAlchemyTransactionRepository(self._db_connection)  # type: ignore[assignment]
-        return self._transactions  # type: ignore[return-value]
+            self._transactions = SqlAlchemyTransactionRepository(
+                self._db_connection,
+            )
+        return self._transactions
 
     @property
     def targets(self) -> ITargetRepository:
@@ -167,9 +249,8 @@ class SqlAlchemyUnitOfWork(IStockBookUnitOfWork):
             if self._db_connection is None:  # pragma: no cover
                 msg = "Database connection unexpectedly None"
                 raise RuntimeError(msg)
-            # TODO: Replace with actual implementation when available
-            self._targets = _SqlAlchemyTargetRepository(self._db_connection)  # type: ignore[assignment]
-        return self._targets  # type: ignore[return-value]
+            self._targets = SqlAlchemyTargetRepository(self._db_connection)
+        return self._targets
 
     @property
     def balances(self) -> IPortfolioBalanceRepository:
@@ -208,9 +289,24 @@ class SqlAlchemyUnitOfWork(IStockBookUnitOfWork):
             if self._db_connection is None:  # pragma: no cover
                 msg = "Database connection unexpectedly None"
                 raise RuntimeError(msg)
-            # TODO: Replace with actual implementation when available
-            self._journal = _SqlAlchemyJournalRepository(self._db_connection)  # type: ignore[assignment]
-        return self._journal  # type: ignore[return-value]
+            self._journal = SqlAlchemyJournalRepository(self._db_connection)
+        return self._journal
+
+    @property
+    def outbox(self) -> IOutboxRepository:
+        """Get event outbox repository instance."""
+        self._ensure_active()
+        if self._outbox is None:
+            # _ensure_active guarantees _db_connection is not None
+            # Use type guard to satisfy type checker and avoid assert
+            if self._db_connection is None:  # pragma: no cover
+                msg = "Database connection unexpectedly None"
+                raise RuntimeError(msg)
+            self._outbox = SqlAlchemyOutboxRepository(
+                self._db_connection,
+                on_add=self._mark_outbox_written,
+            )
+        return self._outbox
 
     def commit(self) -> None:
         """Commit all changes made during this unit of work.
@@ -221,7 +317,13 @@ class SqlAlchemyUnitOfWork(IStockBookUnitOfWork):
         """
         self._ensure_active()
         if self._db_connection is not None:
+            # With group commit, waits until the group makes writes durable
             self._db_connection.commit()
+        # Announce new events only once they are durable
+        if self._outbox_written:
+            self._outbox_written = False
+            if self._on_outbox_commit is not None:
+                self._on_outbox_commit()
 
     def rollback(self) -> None:
         """Rollback all changes made during this unit of work.
@@ -235,6 +337,11 @@ class SqlAlchemyUnitOfWork(IStockBookUnitOfWork):
         self._ensure_active()
         if self._db_connection is not None:
             self._db_connection.rollback()
+        self._outbox_written = False
+
+    def _mark_outbox_written(self) -> None:
+        """Remember that this transaction wrote outbox messages."""
+        self._outbox_written = True
 
     def _ensure_active(self) -> None:
         """Ensure unit of work is active.
@@ -242,32 +349,112 @@ class SqlAlchemyUnitOfWork(IStockBookUnitOfWork):
         Raises:
             RuntimeError: If unit of work is not active
         """
-        if self._connection is None or self._db_connection is None:
+        if self._db_connection is None:
             msg = "Unit of work is not active"
             raise RuntimeError(msg)
 
+    def _reset_repositories(self) -> None:
+        """Drop repositories bound to the previous connection."""
+        self._stocks = None
+        self._portfolios = None
+        self._transactions = None
+        self._targets = None
+        self._balances = None
+        self._positions = None
+        self._journal = None
+        self._outbox = None
+
+
+class _GroupCommitConnection:
+    """Connection of a unit of work whose writes go through group commit.
+
+    Reads run on a pooled connection opened on first use. The first write
+    takes a slot on the shared writer connection, and every statement runs
+    there until commit or rollback, so the unit of work reads its own
+    writes. Engines without separate reader connections run everything on
+    the writer.
+    """
 
-# Placeholder repository classes - will be replaced with actual implementations
-# These are only here to make the unit tests pass for now
-# Using underscore prefix to indicate these are internal/temporary
-class _SqlAlchemyPortfolioRepository:  # pylint: disable=too-few-public-methods
-    """Placeholder for portfolio repository."""
+    def __init__(
+        self,
+        engine: Engine,
+        group_committer: GroupCommitter,
+        query_log: QueryLog | None,
+    ) -> None:
+        """Initialize without opening a connection or taking a slot.
 
-    def __init__(self, connection: IDatabaseConnection) -> None:
-        """Initialize placeholder repository with database connection."""
-        self._connection = connection
+        Args:
+            engine: Engine providing the reader connection
+            group_committer: Owner of the shared writer connection
+            query_log: Log recording the statements of the unit of work
+        """
+        self._engine = engine
+        self._group_committer = group_committer
+        self._query_log = query_log
+        self._reader: Connection | None = None
+        self._reads: SqlAlchemyConnection | None = None
+        self._slot: GroupCommitSlot | None = None
+        self._writes: SqlAlchemyConnection | None = None
+
+    def execute(
+        self,
+        statement: Any,
+        parameters: dict[str, Any] | list[dict[str, Any]] | None = None,
+        execution_options: dict[str, Any] | None = None,
+    ) -> Any:
+        """Execute a statement on the reader or the writer connection."""
+        return self._route(statement).execute(
+            statement,
+            parameters,
+            execution_options,
+        )
 
+    def commit(self) -> None:
+        """Wait until the group commit makes the writes so far durable.
 
-class _SqlAlchemyTransactionRepository:  # pylint: disable=too-few-public-methods
-    """Placeholder for transaction repository."""
+        Raises:
+            GroupCommitError: If the shared commit failed
+        """
+        slot, self._slot, self._writes = self._slot, None, None
+        if slot is not None:
+            slot.commit()
 
-    def __init__(self, connection: IDatabaseConnection) -> None:
-        """Initialize placeholder repository with database connection."""
-        self._connection = connection
+    def rollback(self) -> None:
+        """Discard the writes since the last commit."""
+        slot, self._slot, self._writes = self._slot, None, None
+        if slot is not None:
+            slot.rollback()
 
+    def close(self) -> None:
+        """Discard uncommitted writes and return the reader to the pool."""
+        try:
+            self.rollback()
+        finally:
+            reader, self._reader, self._reads = self._reader, None, None
+            if reader is not None:
+                reader.close()
+
+    def _route(self, statement: Any) -> SqlAlchemyConnection:
+        """Get the connection a statement runs on, taking a slot for writes."""
+        if self._writes is None and (
+            not self._group_committer.pooled_reads
+            or statement_labels(statement)[0] != "select"
+        ):
+            self._slot = self._group_committer.acquire()
+            self._writes = SqlAlchemyConnection(self._slot.connection, self._query_log)
+        if self._writes is not None:
+            return self._writes
+        if self._reads is None:
+            self._reader = self._engine.connect()
+            self._reads = SqlAlchemyConnection(self._reader, self._query_log)
+        return self._reads
 
-class _SqlAlchemyTargetRepository:  # pylint: disable=too-few-public-methods
-    """Placeholder for target repository."""
+
+# Placeholder repository classes - will be replaced with actual implementations
+# These are only here to make the unit tests pass for now
+# Using underscore prefix to indicate these are internal/temporary
+class _SqlAlchemyPortfolioRepository:  # pylint: disable=too-few-public-methods
+    """Placeholder for portfolio repository."""
 
     def __init__(self, connection: IDatabaseConnection) -> None:
         """Initialize placeholder repository with database connection."""
@@ -280,11 +467,3 @@ class _SqlAlchemyBalanceRepository:  # pylint: disable=too-few-public-methods
     def __init__(self, connection: IDatabaseConnection) -> None:
         """Initialize placeholder repository with database connection."""
         self._connection = connection
-
-
-class _SqlAlchemyJournalRepository:  # pylint: disable=too-few-public-methods
-    """Placeholder for journal repository."""
-
-    def __init__(self, connection: IDatabaseConnection) -> None:
-        """Initialize placeholder repository with database connection."""
-        self._connection = connection
@@ -0,0 +1,6 @@
+"""Read-side query services backed by SQLAlchemy Core."""
+
+from .sqlalchemy_holdings_query import SqlAlchemyHoldingsQuery
+from .sqlalchemy_stock_query import SqlAlchemyStockQuery
+
+__all__ = ["SqlAlchemyHoldingsQuery", "SqlAlchemyStockQuery"]
@@ -0,0 +1,134 @@
+"""SQLAlchemy Core implementation of the portfolio holdings read model."""
+
+# pyright: reportUnknownArgumentType=false, reportUnknownMemberType=false, reportUnknownVariableType=false, reportArgumentType=false
+
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql import Select
+
+from src.application.interfaces.holdings_query import HoldingRow, IHoldingsQuery
+from src.domain.value_objects import IndustryGroup, Money, Quantity, StockSymbol
+from src.infrastructure.persistence.batching import in_chunks
+from src.infrastructure.persistence.database_connection import SqlAlchemyConnection
+from src.infrastructure.persistence.tables.position_table import position_table
+from src.infrastructure.persistence.tables.stock_table import stock_table
+
+# Selected columns, in the order _to_holding reads them
+_HOLDING_COLUMNS = (
+    position_table.c.portfolio_id,
+    position_table.c.stock_id,
+    stock_table.c.symbol,
+    stock_table.c.industry_group,
+    stock_table.c.grade,
+    position_table.c.quantity,
+    position_table.c.average_cost,
+)
+
+
+class SqlAlchemyHoldingsQuery(IHoldingsQuery):
+    """Holdings loaded with one positions JOIN stocks query.
+
+    Each call reads on its own connection outside any unit of work, so
+    dashboards never hold a write transaction open.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        """Initialize the query service.
+
+        Args:
+            engine: SQLAlchemy engine to read from
+        """
+        self._engine = engine
+
+    def get_holdings(self, portfolio_id: str) -> list[HoldingRow]:
+        """Retrieve the holdings of one portfolio with a single query.
+
+        Args:
+            portfolio_id: Portfolio identifier
+
+        Returns:
+            Holdings ordered by symbol; empty for unknown portfolios
+        """
+        stmt = self._holdings_select().where(
+            position_table.c.portfolio_id == portfolio_id,
+        )
+        return [_to_holding(row) for row in self._fetch_all(stmt)]
+
+    def get_holdings_for_portfolios(
+        self,
+        portfolio_ids: Iterable[str] | None = None,
+    ) -> dict[str, list[HoldingRow]]:
+        """Retrieve the holdings of several portfolios at once.
+
+        Runs a single query for all portfolios, or one per chunk of
+        requested portfolio IDs.
+
+        Args:
+            portfolio_ids: Portfolios to load; None loads every portfolio
+                that holds positions
+
+        Returns:
+            Holdings ordered by symbol, keyed by portfolio ID; requested
+            portfolios without holdings map to an empty list
+        """
+        holdings: dict[str, list[HoldingRow]] = {}
+        if portfolio_ids is None:
+            statements = [self._holdings_select()]
+        else:
+            statements: list[Select] = []
+            for chunk in in_chunks(portfolio_ids):
+                holdings.update((portfolio_id, []) for portfolio_id in chunk)
+                statements.append(
+                    self._holdings_select().where(
+                        position_table.c.portfolio_id.in_(chunk),
+                    ),
+                )
+        for stmt in statements:
+            for row in self._fetch_all(stmt):
+                holding = _to_holding(row)
+                holdings.setdefault(holding.portfolio_id, []).append(holding)
+        return holdings
+
+    @staticmethod
+    def _holdings_select() -> Select:
+        """Build the positions JOIN stocks query without filters."""
+        return (
+            select(*_HOLDING_COLUMNS)
+            .select_from(
+                position_table.join(
+                    stock_table,
+                    position_table.c.stock_id == stock_table.c.id,
+                ),
+            )
+            .order_by(position_table.c.portfolio_id, stock_table.c.symbol)
+        )
+
+    def _fetch_all(self, stmt: Select) -> list[Any]:
+        """Run a query on a short-lived connection and fetch every row."""
+        with self._engine.connect() as connection:
+            return SqlAlchemyConnection(connection).execute(stmt).fetchall()
+
+
+def _to_holding(row: Any) -> HoldingRow:
+    """Build a holding from a row in _HOLDING_COLUMNS order."""
+    (
+        portfolio_id,
+        stock_id,
+        symbol,
+        industry_group,
+        grade,
+        quantity,
+        average_cost,
+    ) = row
+    return HoldingRow(
+        portfolio_id=portfolio_id,
+        stock_id=stock_id,
+        symbol=StockSymbol(symbol),
+        industry_group=IndustryGroup(industry_group) if industry_group else None,
+        grade=grade or None,
+        quantity=Quantity(quantity),
+        average_cost=Money(average_cost),
+    )
@@ -0,0 +1,76 @@
+"""SQLAlchemy Core implementation of the stock field projection."""
+
+# pyright: reportUnknownArgumentType=false, reportUnknownMemberType=false, reportUnknownVariableType=false, reportArgumentType=false
+
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Engine
+
+from src.application.interfaces.stock_query import (
+    IStockQuery,
+    StockFieldRow,
+)
+from src.domain.value_objects.stock_query_spec import StockQuerySpec
+from src.infrastructure.persistence.database_connection import SqlAlchemyConnection
+from src.infrastructure.persistence.stock_filters import apply_stock_query_spec
+from src.infrastructure.persistence.tables.stock_table import stock_table
+
+# Field -> selected column, labelled with the field name
+_FIELD_COLUMNS: dict[str, Any] = {
+    "id": stock_table.c.id,
+    "symbol": stock_table.c.symbol,
+    "name": stock_table.c.company_name.label("name"),
+    "sector": stock_table.c.sector,
+    "industry_group": stock_table.c.industry_group,
+    "grade": stock_table.c.grade,
+    # Stocks without notes read as "" like StockDto.notes
+    "notes": func.coalesce(stock_table.c.notes, "").label("notes"),
+}
+
+
+class SqlAlchemyStockQuery(IStockQuery):
+    """Stock projections that select only the requested columns.
+
+    Each call reads on its own connection outside any unit of work, like
+    the holdings read model.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        """Initialize the query service.
+
+        Args:
+            engine: SQLAlchemy engine to read from
+        """
+        self._engine = engine
+
+    def select_fields(
+        self,
+        fields: Sequence[str],
+        spec: StockQuerySpec | None = None,
+    ) -> list[StockFieldRow]:
+        """Retrieve the given fields of every stock matching a query spec.
+
+        Args:
+            fields: Fields to return, each one of STOCK_FIELDS
+            spec: Filters and sort order; None lists every stock
+
+        Returns:
+            One dict per stock holding exactly the requested fields
+
+        Raises:
+            ValueError: If a field is not one of STOCK_FIELDS
+        """
+        unknown = [field for field in fields if field not in _FIELD_COLUMNS]
+        if unknown:
+            msg = f"Unknown stock fields: {', '.join(unknown)}"
+            raise ValueError(msg)
+
+        stmt = select(*(_FIELD_COLUMNS[field] for field in fields))
+        if spec is not None:
+            stmt = apply_stock_query_spec(stmt, spec)
+
+        with self._engine.connect() as connection:
+            rows = SqlAlchemyConnection(connection).execute(stmt).fetchall()
+        return [row._asdict() for row in rows]
@@ -1,9 +1,38 @@
-"""Infrastructure repository implementations."""
+"""Infrastructure repository implementations.
 
-from .sqlalchemy_position_repository import SqlAlchemyPositionRepository
-from .sqlalchemy_stock_repository import SqlAlchemyStockRepository
+Repositories are imported on first use, so importing one of them does not
+import the others.
+"""
+
+from typing import TYPE_CHECKING
+
+from src.shared.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .sqlalchemy_journal_repository import SqlAlchemyJournalRepository
+    from .sqlalchemy_outbox_repository import SqlAlchemyOutboxRepository
+    from .sqlalchemy_position_repository import SqlAlchemyPositionRepository
+    from .sqlalchemy_stock_repository import SqlAlchemyStockRepository
+    from .sqlalchemy_target_repository import SqlAlchemyTargetRepository
+    from .sqlalchemy_transaction_repository import SqlAlchemyTransactionRepository
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "SqlAlchemyJournalRepository": ".sqlalchemy_journal_repository",
+        "SqlAlchemyOutboxRepository": ".sqlalchemy_outbox_repository",
+        "SqlAlchemyPositionRepository": ".sqlalchemy_position_repository",
+        "SqlAlchemyStockRepository": ".sqlalchemy_stock_repository",
+        "SqlAlchemyTargetRepository": ".sqlalchemy_target_repository",
+        "SqlAlchemyTransactionRepository": ".sqlalchemy_transaction_repository",
+    },
+)
 
 __all__ = [
+    "SqlAlchemyJournalRepository",
+    "SqlAlchemyOutboxRepository",
     "SqlAlchemyPositionRepository",
     "SqlAlchemyStockRepository",
+    "SqlAlchemyTargetRepository",
+    "SqlAlchemyTransactionRepository",
 ]
@@ -0,0 +1,478 @@
+"""SQLAlchemy implementation of the Journal repository."""
+
+# pyright: reportUnknownArgumentType=false, reportUnknownMemberType=false, reportArgumentType=false
+# pyright: reportUnknownVariableType=false, reportAttributeAccessIssue=false
+
+import base64
+import binascii
+from collections.abc import Sequence
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Any
+
+from sqlalchemy import and_, func, insert, literal_column, or_, select
+from sqlalchemy import delete as sql_delete
+from sqlalchemy import update as sql_update
+
+from src.domain.entities.journal_entry import JournalEntry
+from src.domain.repositories.interfaces import (
+    IJournalRepository,
+    JournalSearchPage,
+    JournalSearchResult,
+)
+from src.domain.value_objects import JournalContent
+from src.infrastructure.persistence.interfaces import IDatabaseConnection
+from src.infrastructure.persistence.tables.journal_entry_table import (
+    journal_entry_table,
+)
+from src.infrastructure.persistence.tables.journal_search_index import (
+    JOURNAL_SEARCH_TABLE,
+    REBUILD_JOURNAL_SEARCH_INDEX,
+    journal_search_table,
+)
+from src.infrastructure.persistence.tables.journal_tag_table import journal_tag_table
+
+# Title matches count double relative to body matches in BM25 ranking
+_TITLE_WEIGHT = 2.0
+_CONTENT_WEIGHT = 1.0
+_SNIPPET_TOKENS = 16
+_TITLE_LENGTH = 80
+
+# The domain has no entry types yet, so new entries are stored as notes
+_DEFAULT_ENTRY_TYPE = "NOTE"
+
+_search_ref = literal_column(JOURNAL_SEARCH_TABLE)
+_entry_rowid = literal_column(f"{journal_entry_table.name}.rowid")
+
+
+class SqlAlchemyJournalRepository(IJournalRepository):
+    """SQLAlchemy implementation of journal repository.
+
+    Full-text search runs against the FTS5 index kept in sync by triggers
+    (see journal_search_index); tag filters use the journal_tags table.
+    """
+
+    def __init__(self, connection: IDatabaseConnection) -> None:
+        """Initialize the repository.
+
+        Args:
+            connection: Database connection supporting SQLAlchemy Core operations
+        """
+        self._connection = connection
+
+    def create(self, entry: JournalEntry) -> str:
+        """Create a new journal entry with its tags.
+
+        Args:
+            entry: JournalEntry entity to create
+
+        Returns:
+            ID of the created entry
+        """
+        stmt = insert(journal_entry_table).values(**self.entity_to_row(entry))
+        self._connection.execute(stmt)
+        self._insert_tags(entry)
+        return entry.id
+
+    def get_by_id(self, entry_id: str) -> JournalEntry | None:
+        """Retrieve journal entry by ID.
+
+        Args:
+            entry_id: Unique identifier of the entry
+
+        Returns:
+            JournalEntry entity if found, None otherwise
+        """
+        stmt = select(*journal_entry_table.c).where(
+            journal_entry_table.c.id == entry_id,
+        )
+        row = self._connection.execute(stmt).fetchone()
+
+        if row is None:
+            return None
+
+        # Handle both dict (from mocks) and Row objects (from SQLAlchemy)
+        row_dict = row._asdict() if hasattr(row, "_asdict") else row
+        return self.row_to_entity(row_dict)
+
+    def get_recent(self, limit: int | None = None) -> list[JournalEntry]:
+        """Retrieve recent journal entries.
+
+        Args:
+            limit: Maximum number of entries to return
+
+        Returns:
+            List of JournalEntry entities, newest first
+        """
+        return self._fetch_newest_first(limit)
+
+    def get_by_portfolio(
+        self,
+        portfolio_id: str,
+        limit: int | None = None,
+    ) -> list[JournalEntry]:
+        """Retrieve journal entries for a specific portfolio.
+
+        Args:
+            portfolio_id: Portfolio identifier
+            limit: Maximum number of entries to return
+
+        Returns:
+            List of JournalEntry entities, newest first
+        """
+        return self._fetch_newest_first(
+            limit,
+            journal_entry_table.c.portfolio_id == portfolio_id,
+        )
+
+    def get_by_stock(
+        self,
+        stock_id: str,
+        limit: int | None = None,
+    ) -> list[JournalEntry]:
+        """Retrieve journal entries for a specific stock.
+
+        Args:
+            stock_id: Stock identifier
+            limit: Maximum number of entries to return
+
+        Returns:
+            List of JournalEntry entities, newest first
+        """
+        return self._fetch_newest_first(
+            limit,
+            journal_entry_table.c.stock_id == stock_id,
+        )
+
+    def get_by_transaction(self, transaction_id: str) -> list[JournalEntry]:
+        """Retrieve journal entries for a specific transaction.
+
+        Args:
+            transaction_id: Transaction identifier
+
+        Returns:
+            List of JournalEntry entities, newest first
+        """
+        return self._fetch_newest_first(
+            None,
+            journal_entry_table.c.transaction_id == transaction_id,
+        )
+
+    def get_by_date_range(self, start_date: date, end_date: date) -> list[JournalEntry]:
+        """Retrieve journal entries within a date range.
+
+        Args:
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+
+        Returns:
+            List of JournalEntry entities, newest first
+        """
+        start = datetime.combine(start_date, time.min)
+        end = datetime.combine(end_date + timedelta(days=1), time.min)
+        return self._fetch_newest_first(
+            None,
+            journal_entry_table.c.entry_date >= start,
+            journal_entry_table.c.entry_date < end,
+        )
+
+    def get_by_tag(self, tag: str, limit: int | None = None) -> list[JournalEntry]:
+        """Retrieve journal entries carrying a tag.
+
+        Args:
+            tag: Tag to match (case-insensitive)
+            limit: Maximum number of entries to return
+
+        Returns:
+            List of JournalEntry entities, newest first
+        """
+        return self._fetch_newest_first(
+            limit,
+            journal_entry_table.c.id.in_(_entries_tagged_with([tag])),
+        )
+
+    def search(
+        self,
+        query: str,
+        *,
+        tags: Sequence[str] = (),
+        limit: int = 20,
+        cursor: str | None = None,
+    ) -> JournalSearchPage:
+        """Full-text search over journal entries, most relevant first.
+
+        Results are ordered by (BM25 rank, rowid) and paged with a keyset
+        cursor, so later pages cost the same as the first instead of
+        growing with an OFFSET.
+
+        Args:
+            query: Search terms; all terms must match, a trailing * matches
+                a prefix
+            tags: Only return entries carrying all of these tags
+            limit: Maximum number of results per page
+            cursor: Cursor from a previous page's next_cursor
+
+        Returns:
+            Page of ranked results with highlighted snippets
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        match_expression = _to_match_expression(query)
+        if not match_expression:
+            return JournalSearchPage(results=[], next_cursor=None)
+
+        matches = (
+            select(
+                journal_search_table.c.rowid.label("search_rowid"),
+                func.bm25(_search_ref, _TITLE_WEIGHT, _CONTENT_WEIGHT).label("rank"),
+                func.snippet(
+                    _search_ref,
+                    -1,
+                    "[",
+                    "]",
+                    "...",
+                    _SNIPPET_TOKENS,
+                ).label("snippet"),
+            )
+            .where(_search_ref.match(match_expression))
+            .subquery()
+        )
+        columns = [
+            *journal_entry_table.c,
+            matches.c.rank,
+            matches.c.snippet,
+            matches.c.search_rowid,
+        ]
+        stmt: Any = select(*columns).join_from(
+            journal_entry_table,
+            matches,
+            _entry_rowid == matches.c.search_rowid,
+        )
+        if tags:
+            stmt = stmt.where(journal_entry_table.c.id.in_(_entries_tagged_with(tags)))
+        if cursor is not None:
+            last_rank, last_rowid = _decode_cursor(cursor)
+            stmt = stmt.where(
+                or_(
+                    matches.c.rank > last_rank,
+                    and_(
+                        matches.c.rank == last_rank,
+                        matches.c.search_rowid > last_rowid,
+                    ),
+                ),
+            )
+        stmt = stmt.order_by(matches.c.rank, matches.c.search_rowid).limit(limit + 1)
+
+        rows = [
+            row._asdict() if hasattr(row, "_asdict") else row
+            for row in self._connection.execute(stmt).fetchall()
+        ]
+        page = rows[:limit]
+        results = [
+            JournalSearchResult(
+                entry=self.row_to_entity(row),
+                snippet=row["snippet"],
+                rank=row["rank"],
+            )
+            for row in page
+        ]
+        next_cursor = None
+        if len(rows) > limit:
+            last = page[-1]
+            next_cursor = _encode_cursor(last["rank"], last["search_rowid"])
+        return JournalSearchPage(results=results, next_cursor=next_cursor)
+
+    def update(self, entry_id: str, entry: JournalEntry) -> bool:
+        """Update an existing journal entry and replace its tags.
+
+        Args:
+            entry_id: ID of the entry to update
+            entry: JournalEntry entity with updated values
+
+        Returns:
+            True if entry was updated, False if not found
+        """
+        row_data = self.entity_to_row(entry)
+        # Remove fields that shouldn't be updated; the entity carries no
+        # entry type, so the stored one is kept
+        row_data.pop("id", None)
+        row_data.pop("created_at", None)
+        row_data.pop("entry_type", None)
+
+        stmt = (
+            sql_update(journal_entry_table)
+            .where(journal_entry_table.c.id == entry_id)
+            .values(**row_data)
+        )
+        result = self._connection.execute(stmt)
+        if result.rowcount == 0:
+            return False
+
+        self._delete_tags(entry_id)
+        self._insert_tags(entry, entry_id)
+        return True
+
+    def delete(self, entry_id: str) -> bool:
+        """Delete a journal entry and its tags.
+
+        Args:
+            entry_id: Unique identifier of the entry to delete
+
+        Returns:
+            True if deletion successful, False if entry not found
+        """
+        self._delete_tags(entry_id)
+        stmt = sql_delete(journal_entry_table).where(
+            journal_entry_table.c.id == entry_id,
+        )
+        result = self._connection.execute(stmt)
+        return bool(result.rowcount > 0)
+
+    def rebuild_search_index(self) -> None:
+        """Rebuild the full-text index from the stored entries.
+
+        Run after VACUUM or after restoring journal rows outside the
+        repository.
+        """
+        self._connection.execute(REBUILD_JOURNAL_SEARCH_INDEX)
+
+    def entity_to_row(self, entry: JournalEntry) -> dict[str, Any]:
+        """Convert JournalEntry entity to database row dictionary.
+
+        Args:
+            entry: JournalEntry entity to convert
+
+        Returns:
+            Dictionary representing database row
+        """
+        now = datetime.now(UTC)
+
+        return {
+            "id": entry.id,
+            "portfolio_id": entry.portfolio_id,
+            "stock_id": entry.stock_id,
+            "transaction_id": entry.transaction_id,
+            "entry_type": _DEFAULT_ENTRY_TYPE,
+            "title": _title_of(entry.content.value),
+            "content": entry.content.value,
+            "tags": ",".join(entry.tags) or None,
+            "entry_date": entry.entry_date,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    def row_to_entity(self, row: dict[str, Any]) -> JournalEntry:
+        """Convert database row to JournalEntry entity.
+
+        Args:
+            row: Database row as dictionary
+
+        Returns:
+            JournalEntry entity
+        """
+        tags: list[str] = row["tags"].split(",") if row["tags"] else []
+        return (
+            JournalEntry.Builder()
+            .with_id(row["id"])
+            .with_entry_date(row["entry_date"])
+            .with_content(JournalContent(row["content"]))
+            .with_portfolio_id(row["portfolio_id"])
+            .with_stock_id(row["stock_id"])
+            .with_transaction_id(row["transaction_id"])
+            .with_tags(tags)
+            .build()
+        )
+
+    def _fetch_newest_first(
+        self,
+        limit: int | None,
+        *criteria: Any,
+    ) -> list[JournalEntry]:
+        """Select entries matching criteria, newest first, with an optional limit."""
+        stmt: Any = (
+            select(*journal_entry_table.c)
+            .where(*criteria)
+            .order_by(
+                journal_entry_table.c.entry_date.desc(),
+                journal_entry_table.c.id.desc(),
+            )
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        rows = self._connection.execute(stmt).fetchall()
+
+        return [
+            self.row_to_entity(row._asdict() if hasattr(row, "_asdict") else row)
+            for row in rows
+        ]
+
+    def _insert_tags(self, entry: JournalEntry, entry_id: str | None = None) -> None:
+        """Insert one journal_tags row per tag."""
+        if not entry.tags:
+            return
+        self._connection.execute(
+            insert(journal_tag_table),
+            [{"entry_id": entry_id or entry.id, "tag": tag} for tag in entry.tags],
+        )
+
+    def _delete_tags(self, entry_id: str) -> None:
+        """Delete the journal_tags rows for an entry."""
+        self._connection.execute(
+            sql_delete(journal_tag_table).where(
+                journal_tag_table.c.entry_id == entry_id,
+            ),
+        )
+
+
+def _entries_tagged_with(tags: Sequence[str]) -> Any:
+    """Select IDs of entries carrying every one of the tags."""
+    wanted = {tag.strip().lower() for tag in tags}
+    return (
+        select(journal_tag_table.c.entry_id)
+        .where(journal_tag_table.c.tag.in_(wanted))
+        .group_by(journal_tag_table.c.entry_id)
+        .having(func.count() == len(wanted))
+    )
+
+
+def _to_match_expression(query: str) -> str:
+    """Convert free-text search terms into a safe FTS5 MATCH expression.
+
+    Each term is quoted so FTS5 operators and punctuation in user input are
+    matched literally; a trailing * keeps its prefix-match meaning.
+    """
+    terms: list[str] = []
+    for token in query.split():
+        term = token.rstrip("*")
+        if not term:
+            continue
+        quoted = '"' + term.replace('"', '""') + '"'
+        terms.append(quoted + "*" if token.endswith("*") else quoted)
+    return " ".join(terms)
+
+
+def _title_of(content: str) -> str:
+    """Derive an entry title from the first non-blank line of its content."""
+    first_line = next((line for line in content.splitlines() if line.strip()), "")
+    return first_line.strip()[:_TITLE_LENGTH]
+
+
+def _encode_cursor(rank: float, rowid: int) -> str:
+    """Encode a keyset position as an opaque cursor."""
+    raw = f"{rank!r}:{rowid}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[float, int]:
+    """Decode a cursor produced by _encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        rank, rowid = raw.split(":")
+        return float(rank), int(rowid)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        msg = f"Invalid search cursor: {cursor!r}"
+        raise ValueError(msg) from e
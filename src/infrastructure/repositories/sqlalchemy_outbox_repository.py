@@ -0,0 +1,151 @@
+"""SQLAlchemy implementation of the event outbox repository."""
+
+# pyright: reportUnknownArgumentType=false, reportUnknownMemberType=false, reportArgumentType=false
+
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import and_, delete, insert, select
+from sqlalchemy import update as sql_update
+
+from src.domain.repositories.interfaces import IOutboxRepository, OutboxMessage
+from src.infrastructure.persistence.interfaces import IDatabaseConnection
+from src.infrastructure.persistence.tables.outbox_table import outbox_table
+
+
+class SqlAlchemyOutboxRepository(IOutboxRepository):
+    """SQLAlchemy implementation of the transactional event outbox."""
+
+    def __init__(
+        self,
+        connection: IDatabaseConnection,
+        on_add: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize the repository.
+
+        Args:
+            connection: Database connection supporting SQLAlchemy Core operations
+            on_add: Called after messages are written, so the owning unit of
+                work knows to announce them once it commits
+        """
+        self._connection = connection
+        self._on_add = on_add
+
+    def add(self, messages: Sequence[OutboxMessage]) -> None:
+        """Store messages as part of the current transaction.
+
+        Args:
+            messages: Messages to store
+        """
+        if not messages:
+            return
+        self._connection.execute(
+            insert(outbox_table),
+            [
+                {
+                    "event_id": message.event_id,
+                    "event_type": message.event_type,
+                    "payload": message.payload,
+                    "occurred_at": message.occurred_at,
+                }
+                for message in messages
+            ],
+        )
+        if self._on_add is not None:
+            self._on_add()
+
+    def get_pending(
+        self,
+        limit: int,
+        after_sequence: int = 0,
+    ) -> list[OutboxMessage]:
+        """Retrieve messages that have not been dispatched yet, oldest first.
+
+        Args:
+            limit: Maximum number of messages to return
+            after_sequence: Only return messages written after this sequence
+
+        Returns:
+            Pending messages ordered by sequence
+        """
+        columns = list(outbox_table.c)
+        stmt: Any = (
+            select(*columns)
+            .where(
+                and_(
+                    outbox_table.c.dispatched_at.is_(None),
+                    outbox_table.c.sequence > after_sequence,
+                ),
+            )
+            .order_by(outbox_table.c.sequence)
+            .limit(limit)
+        )
+        rows = self._connection.execute(stmt).fetchall()
+
+        return [
+            self.row_to_message(row._asdict() if hasattr(row, "_asdict") else row)
+            for row in rows
+        ]
+
+    def mark_dispatched(self, event_ids: Sequence[str]) -> int:
+        """Mark messages as delivered so they are not returned again.
+
+        Args:
+            event_ids: IDs of the delivered events
+
+        Returns:
+            Number of messages marked
+        """
+        if not event_ids:
+            return 0
+        stmt: Any = (
+            sql_update(outbox_table)
+            .where(
+                and_(
+                    outbox_table.c.event_id.in_(list(event_ids)),
+                    outbox_table.c.dispatched_at.is_(None),
+                ),
+            )
+            .values(dispatched_at=datetime.now(UTC))
+        )
+        result = self._connection.execute(stmt)
+        return int(result.rowcount)
+
+    def purge_dispatched(self, dispatched_before: datetime) -> int:
+        """Delete messages that were delivered before a point in time.
+
+        Pending messages have no dispatched_at and are never deleted.
+
+        Args:
+            dispatched_before: Messages dispatched earlier than this are deleted
+
+        Returns:
+            Number of messages deleted
+        """
+        stmt: Any = delete(outbox_table).where(
+            outbox_table.c.dispatched_at < dispatched_before,
+        )
+        result = self._connection.execute(stmt)
+        return int(result.rowcount)
+
+    def row_to_message(self, row: dict[str, Any]) -> OutboxMessage:
+        """Convert database row to OutboxMessage.
+
+        Args:
+            row: Database row as dictionary
+
+        Returns:
+            OutboxMessage for the row
+        """
+        occurred_at: datetime = row["occurred_at"]
+        # SQLite drops the offset; timestamps are always written in UTC
+        if occurred_at.tzinfo is None:
+            occurred_at = occurred_at.replace(tzinfo=UTC)
+        return OutboxMessage(
+            event_id=row["event_id"],
+            event_type=row["event_type"],
+            payload=row["payload"],
+            occurred_at=occurred_at,
+            sequence=row["sequence"],
+        )
@@ -2,19 +2,25 @@
 
 # pyright: reportUnknownArgumentType=false, reportUnknownMemberType=false, reportArgumentType=false
 
+from collections.abc import Iterable
 from typing import Any
 
 from sqlalchemy import delete as sql_delete
-from sqlalchemy import exc, insert, select
+from sqlalchemy import exc, exists, insert, select
 from sqlalchemy import update as sql_update
 
 from src.domain.entities.position import Position
+from src.domain.exceptions import ConcurrencyConflictError
 from src.domain.repositories.interfaces import IPositionRepository
 from src.domain.value_objects.money import Money
 from src.domain.value_objects.quantity import Quantity
+from src.infrastructure.persistence.batching import in_chunks
+from src.infrastructure.persistence.constraints import violated_constraint
 from src.infrastructure.persistence.interfaces import IDatabaseConnection
 from src.infrastructure.persistence.tables.position_table import position_table
 
+POSITION_CONSTRAINT = "uq_portfolio_stock_position"
+
 
 class SqlAlchemyPositionRepository(IPositionRepository):
     """SQLAlchemy implementation of position repository."""
@@ -47,17 +53,7 @@ class SqlAlchemyPositionRepository(IPositionRepository):
         try:
             self._connection.execute(stmt)
         except exc.IntegrityError as e:
-            # Check if it's a unique constraint violation on portfolio_id + stock_id
-            if (
-                "UNIQUE constraint failed: positions.portfolio_id, positions.stock_id"
-                in str(e)
-                or "uq_portfolio_stock_position" in str(e)
-            ):
-                msg = (
-                    f"Position for portfolio {position.portfolio_id} "
-                    f"and stock {position.stock_id} already exists"
-                )
-                raise ValueError(msg) from e
+            self._raise_for_conflict(e, position)
             raise
         else:
             return position.id
@@ -65,6 +61,9 @@ class SqlAlchemyPositionRepository(IPositionRepository):
     def update(self, position_id: str, position: Position) -> bool:
         """Update an existing position.
 
+        The update only applies while the stored row still has the version
+        the entity was loaded with; on success the entity's version advances.
+
         Args:
             position_id: ID of the position to update
             position: Position entity with updated values
@@ -74,35 +73,66 @@ class SqlAlchemyPositionRepository(IPositionRepository):
 
         Raises:
             ValueError: If updating would violate unique constraints
+            ConcurrencyConflictError: If the position changed since it was loaded
             exc.DatabaseError: For other database errors
         """
         row_data = self.entity_to_row(position)
         # Remove fields that shouldn't be updated
         row_data.pop("id", None)
         row_data.pop("created_at", None)
+        row_data["version"] = position_table.c.version + 1
 
         stmt = (
             sql_update(position_table)
-            .where(position_table.c.id == position_id)
+            .where(
+                (position_table.c.id == position_id)
+                & (position_table.c.version == position.version),
+            )
             .values(**row_data)
         )
 
         try:
             result = self._connection.execute(stmt)
-            return bool(result.rowcount > 0)
         except exc.IntegrityError as e:
-            if (
-                "UNIQUE constraint failed: positions.portfolio_id, positions.stock_id"
-                in str(e)
-                or "uq_portfolio_stock_position" in str(e)
-            ):
-                msg = (
-                    f"Position for portfolio {position.portfolio_id} "
-                    f"and stock {position.stock_id} already exists"
-                )
-                raise ValueError(msg) from e
+            self._raise_for_conflict(e, position)
             raise
 
+        # No affected row means the position is missing or was modified
+        if result.rowcount == 0:
+            self._raise_if_stale(position_id, position.version)
+            return False
+
+        position.advance_version()
+        return True
+
+    def _raise_if_stale(self, position_id: str, expected_version: int) -> None:
+        """Tell a concurrent modification apart from a missing position.
+
+        Raises:
+            ConcurrencyConflictError: If the position exists at another version
+        """
+        stmt = select(exists().where(position_table.c.id == position_id))
+        if self._connection.execute(stmt).scalar():
+            msg = "Position"
+            raise ConcurrencyConflictError(msg, position_id, expected_version)
+
+    def _raise_for_conflict(
+        self,
+        error: exc.IntegrityError,
+        position: Position,
+    ) -> None:
+        """Translate a violated portfolio+stock constraint into ValueError.
+
+        Raises:
+            ValueError: If the error violated the portfolio+stock constraint
+        """
+        if violated_constraint(error, position_table) == POSITION_CONSTRAINT:
+            msg = (
+                f"Position for portfolio {position.portfolio_id} "
+                f"and stock {position.stock_id} already exists"
+            )
+            raise ValueError(msg) from error
+
     def get_by_id(self, position_id: str) -> Position | None:
         """Retrieve position by ID.
 
@@ -143,6 +173,35 @@ class SqlAlchemyPositionRepository(IPositionRepository):
             for row in rows
         ]
 
+    def get_positions_for_portfolios(
+        self,
+        portfolio_ids: Iterable[str],
+    ) -> dict[str, list[Position]]:
+        """Retrieve the positions of several portfolios.
+
+        Runs one query per chunk of portfolio IDs, never one per portfolio.
+
+        Args:
+            portfolio_ids: Portfolio identifiers
+
+        Returns:
+            Position entities keyed by portfolio ID, with an empty list for
+            portfolios without positions
+        """
+        positions: dict[str, list[Position]] = {}
+        for chunk in in_chunks(portfolio_ids):
+            for portfolio_id in chunk:
+                positions[portfolio_id] = []
+            stmt = select(*position_table.c).where(
+                position_table.c.portfolio_id.in_(chunk),
+            )
+            for row in self._connection.execute(stmt).fetchall():
+                position = self.row_to_entity(
+                    row._asdict() if hasattr(row, "_asdict") else row,
+                )
+                positions[position.portfolio_id].append(position)
+        return positions
+
     def get_by_portfolio_and_stock(
         self,
         portfolio_id: str,
@@ -227,6 +286,7 @@ class SqlAlchemyPositionRepository(IPositionRepository):
             "last_transaction_date": position.last_transaction_date,
             "created_at": now,
             "updated_at": now,
+            "version": position.version,
         }
 
     def row_to_entity(self, row: dict[str, Any]) -> Position:
@@ -241,6 +301,7 @@ class SqlAlchemyPositionRepository(IPositionRepository):
         builder = (
             Position.Builder()
             .with_id(row["id"])
+            .with_version(row["version"])
             .with_portfolio_id(row["portfolio_id"])
             .with_stock_id(row["stock_id"])
             .with_quantity(Quantity(row["quantity"]))
@@ -6,6 +6,7 @@ SQLAlchemy Core, maintaining clean architecture separation by avoiding ORM.
 
 # pyright: reportUnknownArgumentType=false, reportUnknownMemberType=false, reportArgumentType=false
 
+from collections.abc import Iterable, Sequence
 from datetime import UTC, datetime
 from typing import Any
 
@@ -14,15 +15,17 @@ from sqlalchemy import (
 )
 from sqlalchemy import (
     exc,
-    func,
+    exists,
     insert,
     select,
 )
 from sqlalchemy import (
     update as sql_update,
 )
+from sqlalchemy.sql.dml import Update
 
 from src.domain.entities.stock import Stock
+from src.domain.exceptions import ConcurrencyConflictError, StockAlreadyExistsError
 from src.domain.repositories.interfaces import IStockRepository
 from src.domain.value_objects import (
     CompanyName,
@@ -30,11 +33,17 @@ from src.domain.value_objects import (
     IndustryGroup,
     Notes,
     Sector,
+    StockQuerySpec,
     StockSymbol,
 )
+from src.infrastructure.persistence.batching import in_chunks
+from src.infrastructure.persistence.constraints import violated_constraint
 from src.infrastructure.persistence.interfaces import IDatabaseConnection
+from src.infrastructure.persistence.stock_filters import apply_stock_query_spec
 from src.infrastructure.persistence.tables.stock_table import stock_table
 
+SYMBOL_CONSTRAINT = "uq_stocks_symbol"
+
 
 class SqlAlchemyStockRepository(IStockRepository):
     """SQLAlchemy Core implementation of the stock repository.
@@ -62,27 +71,50 @@ class SqlAlchemyStockRepository(IStockRepository):
             str: ID of the created stock
 
         Raises:
-            ValueError: If a stock with the same symbol already exists
+            StockAlreadyExistsError: If a stock with the same symbol already exists
             exc.DatabaseError: For other database errors
         """
         # Convert entity to row data
         row_data = self._entity_to_row(stock)
 
-        # Create insert statement
+        # Create insert statement; the unique symbol constraint detects
+        # duplicates without a lookup first
         stmt = insert(stock_table).values(**row_data)
 
         try:
             # Execute the insert
             self._connection.execute(stmt)
         except exc.IntegrityError as e:
-            # Check if it's a unique constraint violation on symbol
-            if "symbol" in str(e):
-                msg = f"Stock with symbol {stock.symbol.value} already exists"
-                raise ValueError(msg) from e
+            self._raise_for_conflict(e, stock.symbol.value)
             raise
         else:
             return stock.id
 
+    def create_many(self, stocks: Sequence[Stock]) -> int:
+        """Create several stock records with one bulk insert.
+
+        Args:
+            stocks: Stock domain entities with distinct symbols
+
+        Returns:
+            Number of stocks created
+
+        Raises:
+            StockAlreadyExistsError: If one of the symbols already exists
+            exc.DatabaseError: For other database errors
+        """
+        if not stocks:
+            return 0
+        try:
+            self._connection.execute(
+                insert(stock_table),
+                [self._entity_to_row(stock) for stock in stocks],
+            )
+        except exc.IntegrityError as e:
+            self._raise_for_conflict(e, ", ".join(s.symbol.value for s in stocks))
+            raise
+        return len(stocks)
+
     def get_by_symbol(self, symbol: StockSymbol) -> Stock | None:
         """Retrieve stock by symbol.
 
@@ -107,6 +139,36 @@ class SqlAlchemyStockRepository(IStockRepository):
         row_dict = row._asdict() if hasattr(row, "_asdict") else row
         return self._row_to_entity(row_dict)
 
+    def _raise_for_conflict(self, error: exc.IntegrityError, symbol: str) -> None:
+        """Translate a violated symbol constraint into a domain error.
+
+        Args:
+            error: Integrity error raised by a write
+            symbol: Symbol or symbols being written, for the error message
+
+        Raises:
+            StockAlreadyExistsError: If the error violated the symbol constraint
+        """
+        if violated_constraint(error, stock_table) == SYMBOL_CONSTRAINT:
+            raise StockAlreadyExistsError(symbol=symbol) from error
+
+    def _raise_if_stale(self, stock_id: str, expected_version: int) -> None:
+        """Tell a concurrent modification apart from a missing stock.
+
+        Called after a conditional update matched no row.
+
+        Args:
+            stock_id: ID of the stock that was being updated
+            expected_version: Row version the update expected to replace
+
+        Raises:
+            ConcurrencyConflictError: If the stock exists at another version
+        """
+        stmt = select(exists().where(stock_table.c.id == stock_id))
+        if self._connection.execute(stmt).scalar():
+            msg = "Stock"
+            raise ConcurrencyConflictError(msg, stock_id, expected_version)
+
     def _entity_to_row(self, stock: Stock) -> dict[str, Any]:
         """Convert Stock entity to database row dictionary.
 
@@ -130,6 +192,7 @@ class SqlAlchemyStockRepository(IStockRepository):
             "notes": stock.notes.value if stock.notes else "",
             "created_at": now,
             "updated_at": now,
+            "version": stock.version,
         }
 
     def _row_to_entity(self, row: dict[str, Any]) -> Stock:
@@ -142,7 +205,10 @@ class SqlAlchemyStockRepository(IStockRepository):
             Stock domain entity
         """
         builder = (
-            Stock.Builder().with_id(row["id"]).with_symbol(StockSymbol(row["symbol"]))
+            Stock.Builder()
+            .with_id(row["id"])
+            .with_version(row["version"])
+            .with_symbol(StockSymbol(row["symbol"]))
         )
 
         if row["company_name"]:
@@ -186,6 +252,52 @@ class SqlAlchemyStockRepository(IStockRepository):
         row_dict = row._asdict() if hasattr(row, "_asdict") else row
         return self._row_to_entity(row_dict)
 
+    def get_many_by_ids(self, stock_ids: Iterable[str]) -> dict[str, Stock]:
+        """Retrieve several stocks by ID.
+
+        Runs one query per chunk of IDs, never one per stock.
+
+        Args:
+            stock_ids: Unique identifiers of the stocks
+
+        Returns:
+            Stock domain entities keyed by ID; unknown IDs are absent
+        """
+        stocks: dict[str, Stock] = {}
+        for chunk in in_chunks(stock_ids):
+            stmt = select(*stock_table.c).where(stock_table.c.id.in_(chunk))
+            for row in self._connection.execute(stmt).fetchall():
+                stock = self._row_to_entity(
+                    row._asdict() if hasattr(row, "_asdict") else row,
+                )
+                stocks[stock.id] = stock
+        return stocks
+
+    def get_many_by_symbols(
+        self,
+        symbols: Iterable[StockSymbol],
+    ) -> dict[str, Stock]:
+        """Retrieve several stocks by symbol.
+
+        Runs one query per chunk of symbols, never one per stock.
+
+        Args:
+            symbols: Stock symbol value objects
+
+        Returns:
+            Stock domain entities keyed by symbol value; unknown symbols are
+            absent
+        """
+        stocks: dict[str, Stock] = {}
+        for chunk in in_chunks(symbol.value for symbol in symbols):
+            stmt = select(*stock_table.c).where(stock_table.c.symbol.in_(chunk))
+            for row in self._connection.execute(stmt).fetchall():
+                stock = self._row_to_entity(
+                    row._asdict() if hasattr(row, "_asdict") else row,
+                )
+                stocks[stock.symbol.value] = stock
+        return stocks
+
     def get_all(self) -> list[Stock]:
         """Retrieve all stocks from the database.
 
@@ -208,6 +320,9 @@ class SqlAlchemyStockRepository(IStockRepository):
     def update(self, stock_id: str, stock: Stock) -> bool:
         """Update an existing stock record.
 
+        The update only applies while the stored row still has the version
+        the entity was loaded with; on success the entity's version advances.
+
         Args:
             stock_id: ID of the stock to update
             stock: Stock domain entity with updated values
@@ -216,39 +331,76 @@ class SqlAlchemyStockRepository(IStockRepository):
             True if the stock was updated, False if not found
 
         Raises:
-            ValueError: If updating would violate unique constraints
+            StockAlreadyExistsError: If another stock has the new symbol
+            ConcurrencyConflictError: If the stock changed since it was loaded
+            exc.DatabaseError: For other database errors
+        """
+        try:
+            # Execute the update
+            result = self._connection.execute(self._update_statement(stock_id, stock))
+        except exc.IntegrityError as e:
+            self._raise_for_conflict(e, stock.symbol.value)
+            raise
+
+        # No affected row means the stock is missing or was modified
+        if result.rowcount == 0:
+            self._raise_if_stale(stock_id, stock.version)
+            return False
+
+        stock.advance_version()
+        return True
+
+    def update_and_get(self, stock_id: str, stock: Stock) -> Stock | None:
+        """Update a stock and read back the stored row in one statement.
+
+        Args:
+            stock_id: ID of the stock to update
+            stock: Stock domain entity with updated values
+
+        Returns:
+            Stock as stored after the update, or None if not found
+
+        Raises:
+            StockAlreadyExistsError: If another stock has the new symbol
+            ConcurrencyConflictError: If the stock changed since it was loaded
             exc.DatabaseError: For other database errors
         """
+        stmt = self._update_statement(stock_id, stock).returning(*stock_table.c)
+        try:
+            row = self._connection.execute(stmt).fetchone()
+        except exc.IntegrityError as e:
+            self._raise_for_conflict(e, stock.symbol.value)
+            raise
+        if row is None:
+            self._raise_if_stale(stock_id, stock.version)
+            return None
+        return self._row_to_entity(row._asdict() if hasattr(row, "_asdict") else row)
+
+    def _update_statement(self, stock_id: str, stock: Stock) -> Update:
+        """Build the conditional UPDATE writing every mutable column of a stock.
+
+        The statement matches only the version the entity was loaded with
+        and increments it, so concurrent writers cannot overwrite each other.
+        """
         # Convert entity to row data (excluding ID and created_at)
         row_data = self._entity_to_row(stock)
         # Remove fields that shouldn't be updated
         row_data.pop("id", None)
         row_data.pop("created_at", None)
 
-        # Update the updated_at timestamp
+        # Update the updated_at timestamp and advance the row version
         row_data["updated_at"] = datetime.now(UTC)
+        row_data["version"] = stock_table.c.version + 1
 
-        # Create update statement
-        stmt = (
+        return (
             sql_update(stock_table)
-            .where(stock_table.c.id == stock_id)
+            .where(
+                (stock_table.c.id == stock_id)
+                & (stock_table.c.version == stock.version),
+            )
             .values(**row_data)
         )
 
-        try:
-            # Execute the update
-            result = self._connection.execute(stmt)
-
-            # Check if any rows were affected
-            return bool(result.rowcount > 0)
-
-        except exc.IntegrityError as e:
-            # Check if it's a unique constraint violation on symbol
-            if "symbol" in str(e):
-                msg = f"Stock with symbol {stock.symbol.value} already exists"
-                raise ValueError(msg) from e
-            raise
-
     def delete(self, stock_id: str) -> bool:
         """Delete a stock record from the database.
 
@@ -283,18 +435,10 @@ class SqlAlchemyStockRepository(IStockRepository):
         Raises:
             exc.DatabaseError: For database errors
         """
-        # Create optimized count query
-        stmt = (
-            select(func.count())  # pylint: disable=not-callable
-            .select_from(stock_table)
-            .where(stock_table.c.symbol == symbol.value)
-        )
+        # EXISTS stops at the first matching index entry instead of counting
+        stmt = select(exists().where(stock_table.c.symbol == symbol.value))
 
-        # Execute query and get scalar result
-        result = self._connection.execute(stmt)
-        count = result.scalar()
-
-        return bool(count > 0)
+        return bool(self._connection.execute(stmt).scalar())
 
     def search_stocks(
         self,
@@ -340,3 +484,24 @@ class SqlAlchemyStockRepository(IStockRepository):
             self._row_to_entity(row._asdict() if hasattr(row, "_asdict") else row)
             for row in rows
         ]
+
+    def find_stocks(self, spec: StockQuerySpec) -> list[Stock]:
+        """Retrieve the stocks matching a query spec, in its sort order.
+
+        Filtering and sorting run in the database, on the stock indexes.
+
+        Args:
+            spec: Filters and sort order of the listing
+
+        Returns:
+            List of Stock entities matching the spec
+
+        Raises:
+            exc.DatabaseError: For database errors
+        """
+        stmt = apply_stock_query_spec(select(*stock_table.c), spec)
+        rows = self._connection.execute(stmt).fetchall()
+        return [
+            self._row_to_entity(row._asdict() if hasattr(row, "_asdict") else row)
+            for row in rows
+        ]
@@ -0,0 +1,234 @@
+"""SQLAlchemy implementation of the Target repository."""
+
+# pyright: reportUnknownArgumentType=false, reportUnknownMemberType=false, reportArgumentType=false
+
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import case, insert, select
+from sqlalchemy import update as sql_update
+
+from src.domain.entities.target import Target
+from src.domain.repositories.interfaces import ITargetRepository
+from src.domain.value_objects import Money, Notes, TargetStatus
+from src.infrastructure.persistence.batching import MAX_IN_PARAMETERS, in_chunks
+from src.infrastructure.persistence.interfaces import IDatabaseConnection
+from src.infrastructure.persistence.tables.target_table import target_table
+
+
+class SqlAlchemyTargetRepository(ITargetRepository):
+    """SQLAlchemy implementation of target repository."""
+
+    def __init__(self, connection: IDatabaseConnection) -> None:
+        """Initialize the repository.
+
+        Args:
+            connection: Database connection supporting SQLAlchemy Core operations
+        """
+        self._connection = connection
+
+    def create(self, target: Target) -> str:
+        """Create a new target in the database.
+
+        Args:
+            target: Target entity to create
+
+        Returns:
+            ID of the created target
+        """
+        stmt = insert(target_table).values(**self.entity_to_row(target))
+        self._connection.execute(stmt)
+        return target.id
+
+    def get_by_id(self, target_id: str) -> Target | None:
+        """Retrieve target by ID.
+
+        Args:
+            target_id: Unique identifier of the target
+
+        Returns:
+            Target entity if found, None otherwise
+        """
+        stmt = select(*target_table.c).where(target_table.c.id == target_id)
+        row = self._connection.execute(stmt).fetchone()
+
+        if row is None:
+            return None
+
+        # Handle both dict (from mocks) and Row objects (from SQLAlchemy)
+        row_dict = row._asdict() if hasattr(row, "_asdict") else row
+        return self.row_to_entity(row_dict)
+
+    def get_active_by_portfolio(self, portfolio_id: str) -> list[Target]:
+        """Retrieve active targets for a portfolio.
+
+        Args:
+            portfolio_id: Portfolio identifier
+
+        Returns:
+            List of active Target entities
+        """
+        return self._get_active(target_table.c.portfolio_id == portfolio_id)
+
+    def get_active_by_stock(self, stock_id: str) -> list[Target]:
+        """Retrieve active targets for a stock.
+
+        Args:
+            stock_id: Stock identifier
+
+        Returns:
+            List of active Target entities
+        """
+        return self._get_active(target_table.c.stock_id == stock_id)
+
+    def get_all_active(self) -> list[Target]:
+        """Retrieve all active targets.
+
+        Returns:
+            List of active Target entities
+        """
+        return self._get_active()
+
+    def update(self, target_id: str, target: Target) -> bool:
+        """Update an existing target.
+
+        Args:
+            target_id: ID of the target to update
+            target: Target entity with updated values
+
+        Returns:
+            True if target was updated, False if not found
+        """
+        row_data = self.entity_to_row(target)
+        # Remove fields that shouldn't be updated
+        row_data.pop("id", None)
+        row_data.pop("created_at", None)
+
+        stmt = (
+            sql_update(target_table)
+            .where(target_table.c.id == target_id)
+            .values(**row_data)
+        )
+        result = self._connection.execute(stmt)
+        return bool(result.rowcount > 0)
+
+    def update_status(self, target_id: str, status: str) -> bool:
+        """Update target status.
+
+        Args:
+            target_id: Target identifier
+            status: New status ('active', 'hit', 'failed', 'cancelled')
+
+        Returns:
+            True if update successful, False if target not found
+
+        Raises:
+            ValueError: If status is not a valid target status
+        """
+        return self.bulk_update_status({target_id: status}) > 0
+
+    def bulk_update_status(self, statuses: Mapping[str, str]) -> int:
+        """Update the status of many targets in a single statement.
+
+        Issues one UPDATE ... SET status = CASE id ... END WHERE id IN (...)
+        per chunk of targets rather than a statement per target. Each target
+        binds three parameters (IN, WHEN and THEN), so chunks hold a third
+        of the usual IN list.
+
+        Args:
+            statuses: New status per target ID
+
+        Returns:
+            Number of targets updated
+
+        Raises:
+            ValueError: If any status is not a valid target status
+        """
+        if not statuses:
+            return 0
+
+        normalized = {
+            target_id: TargetStatus(status).value
+            for target_id, status in statuses.items()
+        }
+        updated_at = _utc_now()
+        updated = 0
+        for chunk in in_chunks(normalized, size=MAX_IN_PARAMETERS // 3):
+            stmt = (
+                sql_update(target_table)
+                .where(target_table.c.id.in_(chunk))
+                .values(
+                    status=case(
+                        {target_id: normalized[target_id] for target_id in chunk},
+                        value=target_table.c.id,
+                    ),
+                    updated_at=updated_at,
+                )
+            )
+            updated += int(self._connection.execute(stmt).rowcount)
+        return updated
+
+    def entity_to_row(self, target: Target) -> dict[str, Any]:
+        """Convert Target entity to database row dictionary.
+
+        Args:
+            target: Target entity to convert
+
+        Returns:
+            Dictionary representing database row
+        """
+        now = _utc_now()
+
+        return {
+            "id": target.id,
+            "portfolio_id": target.portfolio_id,
+            "stock_id": target.stock_id,
+            "pivot_price": target.pivot_price.value,
+            "failure_price": target.failure_price.value,
+            "status": target.status.value,
+            "created_date": target.created_date,
+            "notes": target.notes.value or None,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    def row_to_entity(self, row: dict[str, Any]) -> Target:
+        """Convert database row to Target entity.
+
+        Args:
+            row: Database row as dictionary
+
+        Returns:
+            Target entity
+        """
+        return (
+            Target.Builder()
+            .with_id(row["id"])
+            .with_portfolio_id(row["portfolio_id"])
+            .with_stock_id(row["stock_id"])
+            .with_pivot_price(Money(row["pivot_price"]))
+            .with_failure_price(Money(row["failure_price"]))
+            .with_status(TargetStatus(row["status"]))
+            .with_created_date(row["created_date"])
+            .with_notes(Notes(row["notes"] or ""))
+            .build()
+        )
+
+    def _get_active(self, *criteria: Any) -> list[Target]:
+        """Select active targets matching optional extra criteria."""
+        stmt = select(*target_table.c).where(
+            target_table.c.status == "active",
+            *criteria,
+        )
+        rows = self._connection.execute(stmt).fetchall()
+
+        return [
+            self.row_to_entity(row._asdict() if hasattr(row, "_asdict") else row)
+            for row in rows
+        ]
+
+
+def _utc_now() -> datetime:
+    """Get the current UTC time for timestamp columns."""
+    return datetime.now(UTC)
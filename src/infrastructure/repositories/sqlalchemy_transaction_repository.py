@@ -0,0 +1,309 @@
+"""SQLAlchemy implementation of the Transaction repository."""
+
+# pyright: reportUnknownArgumentType=false, reportUnknownMemberType=false, reportArgumentType=false
+# pyright: reportUnknownVariableType=false, reportCallIssue=false
+
+from collections import Counter
+from collections.abc import Sequence
+from datetime import UTC, date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import delete as sql_delete
+from sqlalchemy import insert, select
+from sqlalchemy import update as sql_update
+
+from src.domain.entities.transaction import Transaction
+from src.domain.repositories.interfaces import ITransactionRepository
+from src.domain.value_objects import Money, Notes, Quantity, TransactionType
+from src.infrastructure.persistence.batching import MAX_IN_PARAMETERS, in_chunks
+from src.infrastructure.persistence.interfaces import IDatabaseConnection
+from src.infrastructure.persistence.tables.transaction_table import transaction_table
+
+# Scale of the quantity and price columns; keys compare stored precision
+_STORED_SCALE = Decimal("0.0001")
+
+StoredKey = tuple[str, str, str, datetime, Decimal, Decimal]
+
+
+class SqlAlchemyTransactionRepository(ITransactionRepository):
+    """SQLAlchemy implementation of transaction repository."""
+
+    def __init__(self, connection: IDatabaseConnection) -> None:
+        """Initialize the repository.
+
+        Args:
+            connection: Database connection supporting SQLAlchemy Core operations
+        """
+        self._connection = connection
+
+    def create(self, transaction: Transaction) -> str:
+        """Create a new transaction in the database.
+
+        Args:
+            transaction: Transaction entity to create
+
+        Returns:
+            ID of the created transaction
+        """
+        stmt = insert(transaction_table).values(**self.entity_to_row(transaction))
+        self._connection.execute(stmt)
+        return transaction.id
+
+    def create_many(self, transactions: Sequence[Transaction]) -> int:
+        """Create several transactions with one bulk insert.
+
+        Args:
+            transactions: Transaction entities
+
+        Returns:
+            Number of transactions created
+        """
+        if not transactions:
+            return 0
+        self._connection.execute(
+            insert(transaction_table),
+            [self.entity_to_row(transaction) for transaction in transactions],
+        )
+        return len(transactions)
+
+    def count_stored(self, transactions: Sequence[Transaction]) -> dict[str, int]:
+        """Count the stored transactions with each candidate's natural key.
+
+        Runs one query per chunk of candidates, restricted to their
+        portfolios, stocks and date range.
+
+        Args:
+            transactions: Candidate transaction entities
+
+        Returns:
+            Number of matching stored transactions per candidate ID
+        """
+        counts: dict[str, int] = {}
+        # Portfolio and stock IDs of a chunk share the parameter limit
+        for chunk in in_chunks(transactions, MAX_IN_PARAMETERS // 2):
+            wanted: dict[StoredKey, list[str]] = {}
+            for transaction in chunk:
+                key = _stored_key(self.entity_to_row(transaction))
+                wanted.setdefault(key, []).append(transaction.id)
+            dates = [key[3] for key in wanted]
+            columns = transaction_table.c
+            stmt = select(
+                columns.portfolio_id,
+                columns.stock_id,
+                columns.transaction_type,
+                columns.transaction_date,
+                columns.quantity,
+                columns.price,
+            ).where(
+                columns.portfolio_id.in_({key[0] for key in wanted}),
+                columns.stock_id.in_({key[1] for key in wanted}),
+                columns.transaction_date.between(min(dates), max(dates)),
+            )
+            stored = Counter(
+                _stored_key(row._asdict() if hasattr(row, "_asdict") else row)
+                for row in self._connection.execute(stmt).fetchall()
+            )
+            for key, ids in wanted.items():
+                counts.update(dict.fromkeys(ids, stored[key]))
+        return counts
+
+    def get_by_id(self, transaction_id: str) -> Transaction | None:
+        """Retrieve transaction by ID.
+
+        Args:
+            transaction_id: Unique identifier of the transaction
+
+        Returns:
+            Transaction entity if found, None otherwise
+        """
+        stmt = select(*transaction_table.c).where(
+            transaction_table.c.id == transaction_id,
+        )
+        row = self._connection.execute(stmt).fetchone()
+
+        if row is None:
+            return None
+
+        # Handle both dict (from mocks) and Row objects (from SQLAlchemy)
+        row_dict = row._asdict() if hasattr(row, "_asdict") else row
+        return self.row_to_entity(row_dict)
+
+    def get_by_portfolio(
+        self,
+        portfolio_id: str,
+        limit: int | None = None,
+    ) -> list[Transaction]:
+        """Retrieve transactions for a specific portfolio.
+
+        Args:
+            portfolio_id: Portfolio identifier
+            limit: Maximum number of transactions to return
+
+        Returns:
+            Transaction entities, newest first
+        """
+        stmt = (
+            select(*transaction_table.c)
+            .where(transaction_table.c.portfolio_id == portfolio_id)
+            .order_by(transaction_table.c.transaction_date.desc())
+            .limit(limit)
+        )
+        return self._select(stmt)
+
+    def get_by_stock(
+        self,
+        stock_id: str,
+        portfolio_id: str | None = None,
+    ) -> list[Transaction]:
+        """Retrieve transactions for a specific stock.
+
+        Args:
+            stock_id: Stock identifier
+            portfolio_id: Optional portfolio filter
+
+        Returns:
+            Transaction entities, oldest first
+        """
+        stmt = select(*transaction_table.c).where(
+            transaction_table.c.stock_id == stock_id,
+        )
+        if portfolio_id is not None:
+            stmt = stmt.where(transaction_table.c.portfolio_id == portfolio_id)
+        return self._select(stmt.order_by(transaction_table.c.transaction_date))
+
+    def get_by_date_range(
+        self,
+        start_date: date,
+        end_date: date,
+        portfolio_id: str | None = None,
+    ) -> list[Transaction]:
+        """Retrieve transactions within a date range.
+
+        Args:
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+            portfolio_id: Optional portfolio filter
+
+        Returns:
+            Transaction entities, oldest first
+        """
+        stmt = select(*transaction_table.c).where(
+            transaction_table.c.transaction_date
+            >= datetime.combine(start_date, time()),
+            transaction_table.c.transaction_date
+            < datetime.combine(end_date + timedelta(days=1), time()),
+        )
+        if portfolio_id is not None:
+            stmt = stmt.where(transaction_table.c.portfolio_id == portfolio_id)
+        return self._select(stmt.order_by(transaction_table.c.transaction_date))
+
+    def update(self, transaction_id: str, transaction: Transaction) -> bool:
+        """Update an existing transaction.
+
+        Args:
+            transaction_id: ID of the transaction to update
+            transaction: Transaction entity with updated values
+
+        Returns:
+            True if the transaction was updated, False if not found
+        """
+        row_data = self.entity_to_row(transaction)
+        # Remove fields that shouldn't be updated
+        row_data.pop("id", None)
+        row_data.pop("created_at", None)
+
+        stmt = (
+            sql_update(transaction_table)
+            .where(transaction_table.c.id == transaction_id)
+            .values(**row_data)
+        )
+        result = self._connection.execute(stmt)
+        return bool(result.rowcount > 0)
+
+    def delete(self, transaction_id: str) -> bool:
+        """Delete a transaction by its ID.
+
+        Args:
+            transaction_id: Unique identifier of the transaction to delete
+
+        Returns:
+            True if deletion successful, False if transaction not found
+        """
+        stmt = sql_delete(transaction_table).where(
+            transaction_table.c.id == transaction_id,
+        )
+        result = self._connection.execute(stmt)
+        return bool(result.rowcount > 0)
+
+    def entity_to_row(self, transaction: Transaction) -> dict[str, Any]:
+        """Convert Transaction entity to database row dictionary.
+
+        Aware transaction dates are stored as naive UTC, since the DateTime
+        column keeps no offset.
+
+        Args:
+            transaction: Transaction entity to convert
+
+        Returns:
+            Dictionary representing database row
+        """
+        now = datetime.now(UTC)
+        transaction_date = transaction.transaction_date
+        if transaction_date.tzinfo is not None:
+            transaction_date = transaction_date.astimezone(UTC).replace(tzinfo=None)
+
+        return {
+            "id": transaction.id,
+            "portfolio_id": transaction.portfolio_id,
+            "stock_id": transaction.stock_id,
+            "transaction_type": transaction.transaction_type.value.upper(),
+            "quantity": transaction.quantity.value,
+            "price": transaction.price.value,
+            "notes": transaction.notes.value or None,
+            "transaction_date": transaction_date,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    def row_to_entity(self, row: dict[str, Any]) -> Transaction:
+        """Convert database row to Transaction entity.
+
+        Args:
+            row: Database row as dictionary
+
+        Returns:
+            Transaction entity with a UTC transaction date
+        """
+        return (
+            Transaction.Builder()
+            .with_id(row["id"])
+            .with_portfolio_id(row["portfolio_id"])
+            .with_stock_id(row["stock_id"])
+            .with_transaction_type(TransactionType(row["transaction_type"]))
+            .with_quantity(Quantity(row["quantity"]))
+            .with_price(Money(row["price"]))
+            .with_transaction_date(row["transaction_date"].replace(tzinfo=UTC))
+            .with_notes(Notes(row["notes"] or ""))
+            .build()
+        )
+
+    def _select(self, stmt: Any) -> list[Transaction]:
+        """Run a select over all columns and convert the rows."""
+        rows = self._connection.execute(stmt).fetchall()
+        return [
+            self.row_to_entity(row._asdict() if hasattr(row, "_asdict") else row)
+            for row in rows
+        ]
+
+
+def _stored_key(row: dict[str, Any]) -> StoredKey:
+    """Build a natural key at the precision the table stores."""
+    return (
+        row["portfolio_id"],
+        row["stock_id"],
+        row["transaction_type"].upper(),
+        row["transaction_date"],
+        Decimal(row["quantity"]).quantize(_STORED_SCALE),
+        Decimal(row["price"]).quantize(_STORED_SCALE),
+    )
@@ -14,22 +14,39 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from dependency_injection.composition_root import CompositionRoot
+from src.application.events.live_updates import LiveUpdateHub
+from src.application.interfaces.event_dispatcher import IEventDispatcher
 from src.domain.exceptions import (
     AlreadyExistsError,
     BusinessRuleViolationError,
+    ConcurrencyConflictError,
     DomainError,
     NotFoundError,
 )
+from src.domain.value_objects.stock_symbol import StockSymbol
 from src.infrastructure.config import database_config
+from src.infrastructure.persistence.database_factory import create_engine
 from src.infrastructure.persistence.database_initializer import initialize_database
+from src.infrastructure.persistence.group_commit import GroupCommitter
 from src.presentation.web.middleware.exception_handler import (
     already_exists_exception_handler,
     business_rule_violation_exception_handler,
+    concurrency_conflict_exception_handler,
     domain_exception_handler,
     generic_exception_handler,
     not_found_exception_handler,
 )
-from src.presentation.web.routers import stock_router
+from src.presentation.web.middleware.instrumentation import (
+    MetricsMiddleware,
+    ProfilingMiddleware,
+)
+from src.presentation.web.middleware.response_cache import (
+    ResponseCache,
+    ResponseCacheMiddleware,
+)
+from src.presentation.web.routers import live_router, metrics_router, stock_router
+from src.shared.config import app_config
+from src.shared.instrumentation import metrics, profiler
 from src.version import __version__
 
 logger = logging.getLogger(__name__)
@@ -52,23 +69,40 @@ async def lifespan(fastapi_app: FastAPI) -> AsyncGenerator[None, None]:
     # Access app state directly instead of using global
 
     # Startup
+    event_dispatcher: IEventDispatcher | None = None
+    live_hub: LiveUpdateHub | None = None
+    group_committer: GroupCommitter | None = None
     try:
         # Get database URL from environment or use default from config
         database_url = os.getenv("DATABASE_URL", database_config.database_url)
 
+        # One engine (and connection pool) for initialization and DI
+        engine = create_engine(database_url)
+
         # Initialize database on startup
         logger.info("Starting database initialization...")
-        initialize_database(database_url)
+        initialize_database(database_url, engine=engine)
         logger.info("Database initialization completed")
 
         # Configure dependency injection
         logger.info("Configuring dependency injection...")
-        di_container = CompositionRoot.configure(database_url=database_url)
+        di_container = CompositionRoot.configure(
+            database_url=database_url,
+            config={"engine": engine},
+        )
 
         # Store DI container in app state for access in dependencies
         fastapi_app.state.di_container = di_container
         logger.info("Dependency injection configured")
 
+        # Deliver domain events in the background
+        event_dispatcher = di_container.resolve(IEventDispatcher)
+        await event_dispatcher.start()
+        live_hub = di_container.resolve(LiveUpdateHub)
+
+        if di_container.is_registered(GroupCommitter):
+            group_committer = di_container.resolve(GroupCommitter)
+
     except (ValueError, TypeError, OSError, RuntimeError):
         # These are the exceptions that could be raised during database initialization:
         # - ValueError/TypeError from database_factory validation
@@ -82,6 +116,14 @@ async def lifespan(fastapi_app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Shutdown
     logger.info("Application shutting down")
+    if live_hub is not None:
+        # End open event streams so their responses complete
+        live_hub.close()
+    if event_dispatcher is not None:
+        await event_dispatcher.stop()
+    if group_committer is not None:
+        # Commit writes still waiting for their group
+        group_committer.close()
 
 
 # Create FastAPI app with lifespan management
@@ -92,6 +134,22 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Tables read by the cached GET endpoints, per path
+CACHED_ROUTES = {"/stocks": ("stocks",)}
+
+# Whole-response cache; innermost so CORS headers are added per client
+response_cache = ResponseCache(
+    max_bytes=app_config.response_cache_max_bytes,
+    max_age=app_config.response_cache_max_age or None,
+)
+app.add_middleware(
+    ResponseCacheMiddleware,
+    cache=response_cache,
+    routes=CACHED_ROUTES,
+    enabled=app_config.response_cache_enabled,
+)
+metrics.register_cache("http_response", response_cache.cache_info)
+
 # Configure CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -101,6 +159,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Instrumentation; the metrics middleware is outermost so it also times
+# profiled requests
+app.add_middleware(ProfilingMiddleware, profiler=profiler)
+app.add_middleware(MetricsMiddleware, registry=metrics)
+metrics.register_cache("stock_symbol", StockSymbol.cache_info)
+
 # Register exception handlers
 app.add_exception_handler(NotFoundError, not_found_exception_handler)
 app.add_exception_handler(AlreadyExistsError, already_exists_exception_handler)
@@ -108,11 +172,17 @@ app.add_exception_handler(
     BusinessRuleViolationError,
     business_rule_violation_exception_handler,
 )
+app.add_exception_handler(
+    ConcurrencyConflictError,
+    concurrency_conflict_exception_handler,
+)
 app.add_exception_handler(DomainError, domain_exception_handler)
 app.add_exception_handler(Exception, generic_exception_handler)
 
 # Include routers
 app.include_router(stock_router.router)
+app.include_router(metrics_router.router)
+app.include_router(live_router.router)
 
 
 @app.get("/")
@@ -130,6 +200,8 @@ async def root() -> dict[str, Any]:
             "/version": "Version information",
             "/health": "Health check endpoint",
             "/stocks": "Stock management endpoints",
+            "/metrics": "Prometheus metrics",
+            "/live": "Server-Sent Events stream of live updates",
             "/docs": "Interactive API documentation",
             "/redoc": "Alternative API documentation",
         },
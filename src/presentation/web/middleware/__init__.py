@@ -8,15 +8,23 @@ common functionality across all web endpoints.
 from .exception_handler import (
     already_exists_exception_handler,
     business_rule_violation_exception_handler,
+    concurrency_conflict_exception_handler,
     domain_exception_handler,
     generic_exception_handler,
     http_exception_handler,
     not_found_exception_handler,
 )
+from .instrumentation import MetricsMiddleware, ProfilingMiddleware
+from .response_cache import ResponseCache, ResponseCacheMiddleware
 
 __all__ = [
+    "MetricsMiddleware",
+    "ProfilingMiddleware",
+    "ResponseCache",
+    "ResponseCacheMiddleware",
     "already_exists_exception_handler",
     "business_rule_violation_exception_handler",
+    "concurrency_conflict_exception_handler",
     "domain_exception_handler",
     "generic_exception_handler",
     "http_exception_handler",
@@ -11,6 +11,7 @@ from fastapi.responses import JSONResponse
 from src.domain.exceptions import (
     AlreadyExistsError,
     BusinessRuleViolationError,
+    ConcurrencyConflictError,
     DomainError,
     NotFoundError,
 )
@@ -66,6 +67,30 @@ async def already_exists_exception_handler(
     )
 
 
+async def concurrency_conflict_exception_handler(
+    _request: Request,
+    exception: Exception,
+) -> JSONResponse:
+    """Handle ConcurrencyConflictError exceptions.
+
+    Maps domain ConcurrencyConflictError to HTTP 409 Conflict response.
+
+    Args:
+        _request: The FastAPI request object
+        exception: The ConcurrencyConflictError exception
+
+    Returns:
+        JSONResponse with 409 status code
+    """
+    if not isinstance(exception, ConcurrencyConflictError):
+        msg = f"Expected ConcurrencyConflictError but got {type(exception).__name__}"
+        raise TypeError(msg)
+    return JSONResponse(
+        status_code=409,
+        content={"detail": str(exception)},
+    )
+
+
 async def business_rule_violation_exception_handler(
     _request: Request,
     exception: Exception,
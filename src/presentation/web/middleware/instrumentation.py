@@ -0,0 +1,151 @@
+"""Request timing and profiling middleware.
+
+Both middlewares are plain ASGI callables rather than BaseHTTPMiddleware
+subclasses, so they add no extra task or response buffering per request.
+When metrics or profiling are disabled they hand the request straight to
+the wrapped application.
+"""
+
+import logging
+import time
+from typing import Any
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.shared.instrumentation import MetricsRegistry, RequestProfiler
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile"
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_label(scope: Scope) -> str:
+    """Get the route template that served a request.
+
+    Uses the path template (e.g. ``/stocks/{stock_id}``) rather than the
+    raw path, so identifiers do not create a metric series per request.
+
+    Args:
+        scope: ASGI scope after routing
+
+    Returns:
+        Route path template, or "unmatched" when no route matched
+    """
+    route: Any = scope.get("route")
+    path = getattr(route, "path", None)
+    return path if isinstance(path, str) else UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """Counts HTTP requests and records their duration per route."""
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            registry: Registry receiving the request metrics
+        """
+        self.app = app
+        self._registry = registry
+        self._requests = registry.counter(
+            "stockbook_http_requests_total",
+            "HTTP requests served",
+            ("method", "route", "status"),
+        )
+        self._duration = registry.histogram(
+            "stockbook_http_request_duration_seconds",
+            "Time spent serving HTTP requests",
+            ("method", "route"),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve the request and record its metrics."""
+        if scope["type"] != "http" or not self._registry.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            """Capture the response status."""
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            method: str = scope["method"]
+            route = route_label(scope)
+            self._duration.observe(time.perf_counter() - started_at, method, route)
+            self._requests.inc(method, route, str(status))
+
+
+class ProfilingMiddleware:
+    """Profiles requests that ask for it or are picked by sampling.
+
+    A request sending ``X-Profile: 1`` gets the profile report back as a
+    plain-text body instead of its normal response. Sampled requests are
+    answered normally and their report is logged.
+    """
+
+    def __init__(self, app: ASGIApp, profiler: RequestProfiler) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            profiler: Profiler deciding which requests to profile
+        """
+        self.app = app
+        self._profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve the request, profiling it when asked or sampled."""
+        if scope["type"] != "http" or not self._profiler.active:
+            await self.app(scope, receive, send)
+            return
+
+        requested = any(
+            name == PROFILE_HEADER and value not in {b"", b"0"}
+            for name, value in scope["headers"]
+        )
+        if not self._profiler.should_profile(requested=requested):
+            await self.app(scope, receive, send)
+            return
+
+        profile = self._profiler.start()
+        if profile is None:
+            # Another request holds the profiler
+            await self.app(scope, receive, send)
+            return
+
+        honoured = requested and self._profiler.enabled
+
+        async def discard(_message: Message) -> None:
+            """Drop the normal response in favour of the report."""
+
+        try:
+            await self.app(scope, receive, discard if honoured else send)
+        finally:
+            report = self._profiler.stop(profile)
+
+        if not honoured:
+            logger.info("Profile of %s %s\n%s", scope["method"], scope["path"], report)
+            return
+        body = report.encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            },
+        )
+        await send({"type": "http.response.body", "body": body})
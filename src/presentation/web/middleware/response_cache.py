@@ -0,0 +1,375 @@
+"""Whole-response cache for hot GET endpoints.
+
+A cached response is replayed as stored bytes, so a hit skips routing,
+the database, model construction and JSON encoding. Entries are keyed by
+method, path and normalized query, and remember the versions of the
+tables the route reads (TableVersions from the DI container); a write
+advances a version, so the next read misses and replaces the entry.
+Bodies are stored gzip-compressed as well when that is smaller, and
+served compressed to clients that accept it. The cache is bounded by the
+total size of the stored bodies and evicts least recently used entries.
+Table versions only see writes made through this process, so entries
+can also be given a maximum age after which they are built again.
+
+Clients can bypass it with ``Cache-Control: no-cache`` or ``max-age=0``
+(the fresh response is stored) or ``no-store`` (nothing is stored).
+Like the instrumentation middleware this is a plain ASGI callable, and it
+passes requests straight through when disabled.
+"""
+
+import gzip
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+from urllib.parse import parse_qsl, urlencode
+
+from starlette import status as http_status
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.shared.caching import TableVersions
+
+CACHE_STATUS_HEADER = b"x-cache"
+
+# Smaller bodies gain too little from compression to store twice
+MIN_COMPRESS_BYTES = 500
+
+# Request directives that skip the lookup; no-store also skips storing
+BYPASS_DIRECTIVES = frozenset({"no-cache", "no-store", "max-age=0"})
+
+# Response headers recomputed for each reply instead of stored
+_VOLATILE_HEADERS = frozenset({b"content-length", CACHE_STATUS_HEADER})
+
+CacheKey = tuple[str, str, str]
+Headers = tuple[tuple[bytes, bytes], ...]
+
+
+class ResponseCacheInfo(NamedTuple):
+    """Cache statistics, shaped like functools' cache_info()."""
+
+    hits: int
+    misses: int
+    currsize: int
+    nbytes: int
+    max_bytes: int
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Serialized response, the table versions it was built from and when."""
+
+    status: int
+    headers: Headers
+    body: bytes
+    gzip_body: bytes | None
+    versions: tuple[int, ...]
+    stored_at: float = 0.0
+
+    @property
+    def nbytes(self) -> int:
+        """Get the bytes the stored bodies take."""
+        return len(self.body) + len(self.gzip_body or b"")
+
+
+class ResponseCache:
+    """LRU of serialized responses bounded by their total size.
+
+    Only touched from the event loop, so it takes no locks.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 16 * 1024 * 1024,
+        max_age: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_bytes: Total bytes of stored bodies, compressed variants
+                included, before the least recently used are evicted
+            max_age: Seconds an entry is served for, or None to serve it
+                until a table it was built from changes
+            clock: Source of the current time in seconds
+
+        Raises:
+            ValueError: If max_bytes is below 1 or max_age is not positive
+        """
+        if max_bytes < 1:
+            msg = "max_bytes must be at least 1"
+            raise ValueError(msg)
+        if max_age is not None and max_age <= 0:
+            msg = "max_age must be positive"
+            raise ValueError(msg)
+        self._max_bytes = max_bytes
+        self._max_age = max_age
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, CachedResponse] = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: CacheKey, versions: tuple[int, ...]) -> CachedResponse | None:
+        """Get the response for a request if built from current data.
+
+        Args:
+            key: Method, path and normalized query
+            versions: Current versions of the tables the route reads
+
+        Returns:
+            The cached response, or None when missing, outdated or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.versions != versions or self._expired(entry):
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry
+
+    def put(
+        self,
+        key: CacheKey,
+        versions: tuple[int, ...],
+        status: int,
+        headers: Headers,
+        body: bytes,
+    ) -> None:
+        """Store a response, compressing it once for every later reader.
+
+        Args:
+            key: Method, path and normalized query
+            versions: Versions of the tables read before building the body
+            status: Response status code
+            headers: Response headers without content-length
+            body: Complete response body
+        """
+        compressed: bytes | None = None
+        if len(body) >= MIN_COMPRESS_BYTES:
+            compressed = gzip.compress(body, mtime=0)
+            if len(compressed) >= len(body):
+                compressed = None
+        entry = CachedResponse(
+            status,
+            headers,
+            body,
+            compressed,
+            versions,
+            self._clock(),
+        )
+        self._discard(key)
+        if entry.nbytes > self._max_bytes:
+            return
+        self._entries[key] = entry
+        self._nbytes += entry.nbytes
+        while self._nbytes > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._nbytes -= evicted.nbytes
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        self._entries.clear()
+        self._nbytes = self._hits = self._misses = 0
+
+    def cache_info(self) -> ResponseCacheInfo:
+        """Get hit, miss and size statistics."""
+        return ResponseCacheInfo(
+            hits=self._hits,
+            misses=self._misses,
+            currsize=len(self._entries),
+            nbytes=self._nbytes,
+            max_bytes=self._max_bytes,
+        )
+
+    def _expired(self, entry: CachedResponse) -> bool:
+        """Check whether an entry is older than the maximum age."""
+        return (
+            self._max_age is not None
+            and self._clock() - entry.stored_at >= self._max_age
+        )
+
+    def _discard(self, key: CacheKey) -> None:
+        """Drop the entry for a key, if any."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry.nbytes
+
+
+def normalize_query(query_string: bytes) -> str:
+    """Order query parameters by name so equivalent URLs share an entry.
+
+    Values of a repeated parameter keep their order.
+
+    Args:
+        query_string: Raw query string from the ASGI scope
+
+    Returns:
+        Canonical query string
+    """
+    pairs = parse_qsl(query_string.decode("latin-1"), keep_blank_values=True)
+    return urlencode(sorted(pairs, key=lambda pair: pair[0]))
+
+
+def _header_tokens(scope: Scope, name: bytes) -> set[str]:
+    """Get the lowercased comma-separated tokens of a request header."""
+    return {
+        token.strip().lower().replace(" ", "")
+        for header, value in scope["headers"]
+        if header == name
+        for token in value.decode("latin-1").split(",")
+    }
+
+
+def _accepts_gzip(scope: Scope) -> bool:
+    """Check whether the client accepts a gzip-encoded body."""
+    for token in _header_tokens(scope, b"accept-encoding"):
+        coding, _, weight = token.partition(";")
+        if coding == "gzip":
+            return weight != "q=0"
+    return False
+
+
+def _table_versions(scope: Scope) -> TableVersions | None:
+    """Get the table versions from the DI container in app state."""
+    app: Any = scope.get("app")
+    container = getattr(getattr(app, "state", None), "di_container", None)
+    if container is None:
+        return None
+    versions: TableVersions = container.resolve(TableVersions)
+    return versions
+
+
+class ResponseCacheMiddleware:
+    """Serves repeated GET requests from a ResponseCache."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        cache: ResponseCache,
+        routes: Mapping[str, Sequence[str]],
+        *,
+        enabled: bool = True,
+    ) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            cache: Cache storing the responses
+            routes: Tables read per cached path; a path also covers the
+                paths below it, e.g. ``{"/stocks": ["stocks"]}``
+            enabled: Whether to cache anything
+        """
+        self.app = app
+        self._cache = cache
+        self._routes = {
+            path.rstrip("/"): tuple(tables) for path, tables in routes.items()
+        }
+        self._enabled = enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve the request from the cache, or serve and store it."""
+        tables = self._cached_tables(scope)
+        versions = _table_versions(scope) if tables is not None else None
+        if tables is None or versions is None:
+            await self.app(scope, receive, send)
+            return
+
+        directives = _header_tokens(scope, b"cache-control")
+        if "no-store" in directives:
+            await self.app(scope, receive, send)
+            return
+
+        key: CacheKey = (
+            scope["method"],
+            scope["path"],
+            normalize_query(scope["query_string"]),
+        )
+        # Read before serving, so a concurrent write outdates the entry
+        current = versions.snapshot(tables)
+        if not directives & BYPASS_DIRECTIVES:
+            cached = self._cache.get(key, current)
+            if cached is not None:
+                await self._replay(cached, send, gzipped=_accepts_gzip(scope))
+                return
+
+        await self.app(scope, receive, self._storing(send, key, current))
+
+    def _cached_tables(self, scope: Scope) -> tuple[str, ...] | None:
+        """Get the tables a request reads, or None if it is not cached."""
+        if not self._enabled or scope["type"] != "http" or scope["method"] != "GET":
+            return None
+        path: str = scope["path"]
+        for prefix, tables in self._routes.items():
+            if path == prefix or path.startswith(prefix + "/"):
+                return tables
+        return None
+
+    def _storing(
+        self,
+        send: Send,
+        key: CacheKey,
+        versions: tuple[int, ...],
+    ) -> Send:
+        """Wrap send to store a successful response once it is complete."""
+        status = 0
+        headers: Headers = ()
+        chunks: list[bytes] = []
+
+        async def send_wrapper(message: Message) -> None:
+            """Collect the response while sending it on."""
+            nonlocal status, headers
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = tuple(message.get("headers", ()))
+                message = {
+                    **message,
+                    "headers": [*headers, (CACHE_STATUS_HEADER, b"MISS")],
+                }
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False) and _storable(status, headers):
+                    self._cache.put(
+                        key,
+                        versions,
+                        status,
+                        tuple(h for h in headers if h[0] not in _VOLATILE_HEADERS),
+                        b"".join(chunks),
+                    )
+            await send(message)
+
+        return send_wrapper
+
+    @staticmethod
+    async def _replay(cached: CachedResponse, send: Send, *, gzipped: bool) -> None:
+        """Send a cached response, compressed if the client accepts it."""
+        headers = [*cached.headers, (CACHE_STATUS_HEADER, b"HIT")]
+        body = cached.body
+        if cached.gzip_body is not None:
+            headers.append((b"vary", b"Accept-Encoding"))
+            if gzipped:
+                body = cached.gzip_body
+                headers.append((b"content-encoding", b"gzip"))
+        headers.append((b"content-length", str(len(body)).encode()))
+        await send(
+            {
+                "type": "http.response.start",
+                "status": cached.status,
+                "headers": headers,
+            },
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+def _storable(status: int, headers: Headers) -> bool:
+    """Check whether a response may be replayed to other clients."""
+    if status != http_status.HTTP_200_OK:
+        return False
+    for name, value in headers:
+        if name in {b"content-encoding", b"set-cookie"}:
+            return False
+        if name == b"cache-control" and (
+            b"no-store" in value.lower() or b"private" in value.lower()
+        ):
+            return False
+    return True
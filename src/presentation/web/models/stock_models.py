@@ -15,6 +15,7 @@ from src.application.commands.stock import (
     UpdateStockInputs,
 )
 from src.application.dto.stock_dto import StockDto
+from src.application.interfaces.stock_query import StockFieldRow
 
 # Constants for validation
 MAX_SYMBOL_LENGTH = 5
@@ -178,6 +179,7 @@ class StockResponse(BaseModel):
     industry_group: str | None = None
     grade: str | None = None
     notes: str = ""
+    version: int = 1
 
     model_config = ConfigDict(
         frozen=True,  # Make immutable
@@ -239,6 +241,7 @@ class StockResponse(BaseModel):
             industry_group=dto.industry_group,
             grade=dto.grade,
             notes=dto.notes,
+            version=dto.version,
         )
 
 
@@ -269,12 +272,40 @@ class StockListResponse(BaseModel):
         return cls(stocks=stocks, total=len(stocks))
 
 
+class SparseStockListResponse(BaseModel):
+    """Response model for a list of stocks restricted to selected fields.
+
+    Each stock holds only the fields requested with ``?fields=``, read
+    straight from the projection query without building full responses.
+    """
+
+    stocks: list[StockFieldRow]
+    total: int
+
+    model_config = ConfigDict(
+        frozen=True,  # Make immutable
+    )
+
+    @classmethod
+    def from_rows(cls, rows: list[StockFieldRow]) -> "SparseStockListResponse":
+        """Create response from projection rows.
+
+        Args:
+            rows: Stocks as dicts of the requested fields
+
+        Returns:
+            SparseStockListResponse instance
+        """
+        return cls(stocks=rows, total=len(rows))
+
+
 class StockUpdateRequest(BaseModel):
     """Request model for updating a stock.
 
     All fields are optional to support partial updates.
     Validates and normalizes input data from API requests before
-    passing to the application layer.
+    passing to the application layer. ``version`` is the stock version
+    the edit was based on; the update is refused if the stock changed.
     """
 
     symbol: str | None = None
@@ -283,6 +314,7 @@ class StockUpdateRequest(BaseModel):
     industry_group: str | None = None
     grade: str | None = None
     notes: str = ""
+    version: int | None = None
 
     model_config = ConfigDict(
         str_strip_whitespace=True,  # Automatically strip whitespace
@@ -398,6 +430,25 @@ class StockUpdateRequest(BaseModel):
         """
         return value.strip()
 
+    @field_validator("version")
+    @classmethod
+    def validate_version(cls, value: int | None) -> int | None:
+        """Validate the expected stock version.
+
+        Args:
+            value: Version the client read, or None
+
+        Returns:
+            The version
+
+        Raises:
+            ValueError: If the version is below 1
+        """
+        if value is not None and value < 1:
+            msg = "Version must be at least 1"
+            raise ValueError(msg)
+        return value
+
     @model_validator(mode="after")
     def validate_sector_industry_relationship(self) -> Self:
         """Validate that industry_group requires sector.
@@ -413,11 +464,17 @@ class StockUpdateRequest(BaseModel):
             raise ValueError(msg)
         return self
 
-    def to_command(self, stock_id: str) -> UpdateStockCommand:
+    def to_command(
+        self,
+        stock_id: str,
+        expected_version: int | None = None,
+    ) -> UpdateStockCommand:
         """Convert request to UpdateStockCommand.
 
         Args:
             stock_id: ID of the stock to update
+            expected_version: Version from an If-Match header, used when
+                the body names none
 
         Returns:
             UpdateStockCommand for application layer
@@ -430,5 +487,8 @@ class StockUpdateRequest(BaseModel):
             industry_group=self.industry_group,
             grade=self.grade,
             notes=self.notes,
+            expected_version=(
+                self.version if self.version is not None else expected_version
+            ),
         )
         return UpdateStockCommand(inputs)
@@ -1,5 +1,5 @@
 """Stock routers for FastAPI presentation layer."""
 
-from . import stock_router
+from . import live_router, metrics_router, stock_router
 
-__all__ = ["stock_router"]
+__all__ = ["live_router", "metrics_router", "stock_router"]
@@ -0,0 +1,147 @@
+"""Server-Sent Events stream of live updates.
+
+Dashboards subscribe once to ``GET /live`` instead of polling the REST
+endpoints. Each change is published once to the LiveUpdateHub and written
+to every open stream as an SSE event named after its topic; a ``resync``
+event tells the client it fell behind and should reload through the REST
+endpoints. Idle streams get a comment line every few seconds so proxies
+keep them open and disconnected clients are noticed.
+"""
+
+from collections.abc import AsyncGenerator, Collection
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+
+from src.application.events.live_updates import (
+    LIVE_TOPICS,
+    LiveUpdate,
+    LiveUpdateHub,
+)
+
+EVENT_STREAM_CONTENT_TYPE = "text/event-stream"
+
+# Seconds between keep-alive comments on an idle stream
+HEARTBEAT_INTERVAL = 15.0
+
+router = APIRouter(prefix="/live", tags=["live"])
+
+
+def get_live_hub(request: Request) -> LiveUpdateHub:
+    """Dependency function to get the LiveUpdateHub from app state.
+
+    Args:
+        request: FastAPI request object containing app state
+
+    Returns:
+        LiveUpdateHub instance
+
+    Raises:
+        RuntimeError: If DI container not configured in app state
+    """
+    if not hasattr(request.app.state, "di_container"):
+        msg = "DI container not configured in app state"
+        raise RuntimeError(msg)
+    hub: LiveUpdateHub = request.app.state.di_container.resolve(LiveUpdateHub)
+    return hub
+
+
+# Module-level singleton for dependency injection to satisfy B008
+live_hub_dependency = Depends(get_live_hub)
+
+
+def _parse_topics(topics: str) -> list[str]:
+    """Split a ``topics`` query value and check it against LIVE_TOPICS.
+
+    Args:
+        topics: Comma-separated topic names
+
+    Returns:
+        Requested topics
+
+    Raises:
+        HTTPException: 422 if no topic or an unknown topic is requested
+    """
+    requested = [name.strip() for name in topics.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in LIVE_TOPICS]
+    if not requested or unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=(
+                f"Invalid topics: {', '.join(unknown) or topics!r}. "
+                f"Allowed topics: {', '.join(LIVE_TOPICS)}"
+            ),
+        )
+    return requested
+
+
+def format_event(update: LiveUpdate) -> str:
+    """Encode an update as one SSE event.
+
+    Args:
+        update: Update to send
+
+    Returns:
+        Event named after the topic with the JSON data
+    """
+    return f"event: {update.topic}\ndata: {update.json}\n\n"
+
+
+async def _event_stream(
+    hub: LiveUpdateHub,
+    topics: Collection[str],
+    heartbeat: float,
+) -> AsyncGenerator[str, None]:
+    """Write live updates until the hub closes or the client leaves.
+
+    The subscription opens when the response starts streaming and closes
+    with it, so a client that never reads cannot leave one behind.
+
+    Args:
+        hub: Hub publishing the updates
+        topics: Topics the client asked for
+        heartbeat: Seconds of silence before a keep-alive comment
+    """
+    subscription = hub.subscribe(topics)
+    try:
+        # Flush the headers right away so the client sees the stream open
+        yield ": connected\n\n"
+        while True:
+            batch = await subscription.next_batch(max_wait=heartbeat)
+            if batch:
+                yield "".join(format_event(update) for update in batch)
+            elif subscription.closed:
+                break
+            else:
+                yield ": keep-alive\n\n"
+    finally:
+        hub.unsubscribe(subscription)
+
+
+@router.get("", response_class=StreamingResponse)
+async def stream_live_updates(
+    topics: Annotated[
+        str | None,
+        Query(description="Comma-separated topics, e.g. stock,valuation"),
+    ] = None,
+    hub: LiveUpdateHub = live_hub_dependency,
+) -> StreamingResponse:
+    """Stream live updates as Server-Sent Events.
+
+    Query parameters:
+    - topics: Topics to receive (stock, valuation, target); all by default
+
+    Returns:
+        Never-ending ``text/event-stream`` response
+
+    Raises:
+        HTTPException: 422 if topics names an unknown topic
+    """
+    requested = _parse_topics(topics) if topics is not None else LIVE_TOPICS
+    return StreamingResponse(
+        _event_stream(hub, requested, HEARTBEAT_INTERVAL),
+        media_type=EVENT_STREAM_CONTENT_TYPE,
+        # Stop proxies from caching or buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,20 @@
+"""Metrics endpoint for Prometheus scraping."""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from src.shared.instrumentation import metrics
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics() -> PlainTextResponse:
+    """Expose collected metrics in the Prometheus text format.
+
+    Returns:
+        Current metric samples
+    """
+    return PlainTextResponse(metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,21 +1,45 @@
 """Stock router for FastAPI endpoints.
 
 Handles HTTP requests related to stock operations and delegates
-to the application layer for business logic.
+to the application layer for business logic. The service blocks on the
+database (and, with group commit, on the shared commit), so its calls run
+in worker threads instead of on the event loop.
+
+Single-stock responses carry the stock's version, in the body and as an
+``ETag``. An update based on an older version, named by the body's
+``version`` or an ``If-Match`` header, is refused with 409 Conflict.
 """
 
+import asyncio
 import logging
 from typing import Annotated, NoReturn
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 
+from src.application.interfaces.stock_query import STOCK_FIELDS, IStockQuery
 from src.application.interfaces.stock_service import IStockApplicationService
+from src.domain.value_objects.stock_query_spec import (
+    STOCK_SORT_FIELDS,
+    StockQuerySpec,
+    StockSortKey,
+)
 from src.presentation.web.models.stock_models import (
+    SparseStockListResponse,
     StockListResponse,
     StockRequest,
     StockResponse,
     StockUpdateRequest,
 )
+from src.shared.caching import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +59,97 @@ def _raise_not_found(stock_id: str) -> NoReturn:
     )
 
 
+def _parse_fields(fields: str) -> list[str]:
+    """Split a ``fields`` query value and check it against STOCK_FIELDS.
+
+    Args:
+        fields: Comma-separated field names
+
+    Returns:
+        Requested fields in order, without duplicates
+
+    Raises:
+        HTTPException: 422 if no field or an unknown field is requested
+    """
+    requested = list(
+        dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()),
+    )
+    unknown = [name for name in requested if name not in STOCK_FIELDS]
+    if not requested or unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=(
+                f"Invalid fields: {', '.join(unknown) or fields!r}. "
+                f"Allowed fields: {', '.join(STOCK_FIELDS)}"
+            ),
+        )
+    return requested
+
+
+def _parse_sort(sort: str) -> tuple[StockSortKey, ...]:
+    """Split a ``sort`` query value such as ``grade:desc,symbol``.
+
+    Args:
+        sort: Comma-separated ``field[:asc|desc]`` keys, ascending by default
+
+    Returns:
+        Sort keys in order
+
+    Raises:
+        HTTPException: 422 if a key names an unknown field or direction
+    """
+    keys: list[StockSortKey] = []
+    for part in sort.split(","):
+        field, _, direction = part.strip().partition(":")
+        direction = direction.strip().lower() or "asc"
+        if field.strip() not in STOCK_SORT_FIELDS or direction not in {"asc", "desc"}:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=(
+                    f"Invalid sort key: {part.strip()!r}. "
+                    f"Sort by field[:asc|desc] with fields: "
+                    f"{', '.join(STOCK_SORT_FIELDS)}"
+                ),
+            )
+        keys.append(StockSortKey(field.strip(), descending=direction == "desc"))
+    return tuple(keys)
+
+
+def _etag(version: int) -> str:
+    """Format a stock version as a strong entity tag."""
+    return f'"{version}"'
+
+
+def _parse_if_match(if_match: str | None) -> int | None:
+    """Read the stock version named by an ``If-Match`` header.
+
+    Args:
+        if_match: Header value such as ``"3"``, or None when absent
+
+    Returns:
+        The version, or None when absent or ``*`` (any version)
+
+    Raises:
+        HTTPException: 412 if the header names no stock version
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    tag = if_match.strip().removeprefix("W/").strip('"')
+    if not tag.isdigit() or int(tag) < 1:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=f"If-Match does not name a stock version: {if_match!r}",
+        )
+    return int(tag)
+
+
+def _clean(value: str | None) -> str | None:
+    """Strip a filter value, treating blank values as no filter."""
+    if value is None or not value.strip():
+        return None
+    return value.strip()
+
+
 # Create router instance
 router = APIRouter(
     prefix="/stocks",
@@ -67,47 +182,130 @@ def get_stock_service(request: Request) -> IStockApplicationService:
     return service
 
 
-# Module-level singleton for dependency injection to satisfy B008
+def get_stock_query(request: Request) -> IStockQuery:
+    """Dependency function to get the IStockQuery read model from app state.
+
+    Args:
+        request: FastAPI request object containing app state
+
+    Returns:
+        IStockQuery instance
+
+    Raises:
+        RuntimeError: If DI container not configured in app state
+    """
+    if not hasattr(request.app.state, "di_container"):
+        msg = "DI container not configured in app state"
+        raise RuntimeError(msg)
+    query: IStockQuery = request.app.state.di_container.resolve(IStockQuery)
+    return query
+
+
+def get_read_flight(request: Request) -> SingleFlight:
+    """Dependency function to get the shared SingleFlight from app state.
+
+    Args:
+        request: FastAPI request object containing app state
+
+    Returns:
+        SingleFlight coalescing identical concurrent reads
+
+    Raises:
+        RuntimeError: If DI container not configured in app state
+    """
+    if not hasattr(request.app.state, "di_container"):
+        msg = "DI container not configured in app state"
+        raise RuntimeError(msg)
+    flight: SingleFlight = request.app.state.di_container.resolve(SingleFlight)
+    return flight
+
+
+# Module-level singletons for dependency injection to satisfy B008
 stock_service_dependency = Depends(get_stock_service)
+stock_query_dependency = Depends(get_stock_query)
+read_flight_dependency = Depends(get_read_flight)
 
 
-@router.get("", response_model=StockListResponse)
-async def get_stocks(
+@router.get("", response_model=StockListResponse | SparseStockListResponse)
+async def get_stocks(  # noqa: PLR0913 - one parameter per query filter
     symbol: Annotated[
         str | None,
         Query(description="Filter by stock symbol (partial match)"),
     ] = None,
+    symbol_prefix: Annotated[
+        str | None,
+        Query(description="Filter by symbols starting with this prefix"),
+    ] = None,
+    sector: Annotated[str | None, Query(description="Filter by sector")] = None,
+    industry_group: Annotated[
+        str | None,
+        Query(description="Filter by industry group"),
+    ] = None,
+    grade: Annotated[str | None, Query(description="Filter by grade")] = None,
+    sort: Annotated[
+        str | None,
+        Query(description="Sort keys, e.g. grade:desc,symbol:asc"),
+    ] = None,
+    fields: Annotated[
+        str | None,
+        Query(description="Comma-separated fields to return, e.g. id,symbol,name"),
+    ] = None,
     service: IStockApplicationService = stock_service_dependency,
-) -> StockListResponse:
-    """Get list of stocks with optional filtering.
+    query: IStockQuery = stock_query_dependency,
+    flight: SingleFlight = read_flight_dependency,
+) -> StockListResponse | SparseStockListResponse:
+    """Get list of stocks with optional filtering and sorting.
+
+    Filters and sort order run in the database, so clients receive only the
+    stocks they asked for, already ordered. The read runs in a worker
+    thread, and identical requests arriving while it runs share its result
+    unless a stock write committed in between.
 
     Query parameters:
     - symbol: Filter by stock symbol (partial match, case-insensitive)
+    - symbol_prefix: Filter by symbols starting with this (case-insensitive)
+    - sector, industry_group, grade: Filter by exact value
+    - sort: Comma-separated field[:asc|desc] keys
+    - fields: Return only these fields; only their columns are read
 
     Returns:
-        StockListResponse containing filtered stocks and total count
+        StockListResponse containing filtered stocks and total count, or
+        SparseStockListResponse when fields are selected
+
+    Raises:
+        HTTPException: 422 if fields or sort name an unknown field
     """
-    # Check if we have any non-empty filters
-    has_filters = False
+    sort_keys = _clean(sort)
+    spec = StockQuerySpec(
+        sector=_clean(sector),
+        industry_group=_clean(industry_group),
+        grade=_clean(grade),
+        symbol_prefix=_clean(symbol_prefix),
+        symbol_contains=_clean(symbol),
+        sort=_parse_sort(sort_keys) if sort_keys else (),
+    )
 
-    # Clean up filter values - empty strings should be None
-    if symbol is not None and symbol.strip():
-        symbol = symbol.strip()
-        has_filters = True
-    else:
-        symbol = None
-
-    # Use appropriate service method based on filters
-    if has_filters:
-        # Use search_stocks with filters
-        stock_dtos = service.search_stocks(
-            symbol_filter=symbol,
-            name_filter=None,  # Not exposed in API
-            industry_filter=None,  # Not exposed in API
+    version = service.data_version
+
+    # Field selection reads only the requested columns, without entities
+    if fields is not None:
+        selected = _parse_fields(fields)
+        rows = await flight.do_in_thread(
+            ("select_fields", tuple(selected), spec, version),
+            lambda: query.select_fields(selected, spec=spec),
+        )
+        return SparseStockListResponse.from_rows(rows)
+
+    if spec.is_empty:
+        stock_dtos = await flight.do_in_thread(
+            ("get_all_stocks", version),
+            service.get_all_stocks,
         )
     else:
-        # No filters - get all stocks
-        stock_dtos = service.get_all_stocks()
+        stock_dtos = await flight.do_in_thread(
+            ("find_stocks", spec, version),
+            lambda: service.find_stocks(spec),
+        )
 
     # Convert DTOs to response model
     return StockListResponse.from_dto_list(stock_dtos)
@@ -116,12 +314,14 @@ async def get_stocks(
 @router.get("/{stock_id}", response_model=StockResponse)
 async def get_stock_by_id(
     stock_id: str,
+    response: Response,
     service: IStockApplicationService = stock_service_dependency,
 ) -> StockResponse:
     """Get a specific stock by its ID.
 
     Args:
         stock_id: The unique identifier of the stock
+        response: Response receiving the ETag header
         service: Stock application service dependency
 
     Returns:
@@ -131,7 +331,7 @@ async def get_stock_by_id(
         HTTPException: 404 if stock not found
     """
     # Get stock from service
-    stock_dto = service.get_stock_by_id(stock_id)
+    stock_dto = await asyncio.to_thread(service.get_stock_by_id, stock_id)
 
     # Check if stock exists
     if stock_dto is None:
@@ -139,12 +339,14 @@ async def get_stock_by_id(
         _raise_not_found(stock_id)
 
     # Convert DTO to response model
+    response.headers["ETag"] = _etag(stock_dto.version)
     return StockResponse.from_dto(stock_dto)
 
 
 @router.post("", response_model=StockResponse, status_code=status.HTTP_201_CREATED)
 async def create_stock(
     stock_request: StockRequest,
+    response: Response,
     service: IStockApplicationService = stock_service_dependency,
 ) -> StockResponse:
     """Create a new stock.
@@ -168,9 +370,10 @@ async def create_stock(
     command = stock_request.to_command()
 
     # Call application service
-    stock_dto = service.create_stock(command)
+    stock_dto = await asyncio.to_thread(service.create_stock, command)
 
     # Convert DTO to response
+    response.headers["ETag"] = _etag(stock_dto.version)
     return StockResponse.from_dto(stock_dto)
 
 
@@ -178,6 +381,11 @@ async def create_stock(
 async def update_stock(
     stock_id: str,
     stock_update: StockUpdateRequest,
+    response: Response,
+    if_match: Annotated[
+        str | None,
+        Header(description="ETag of the stock version the edit is based on"),
+    ] = None,
     service: IStockApplicationService = stock_service_dependency,
 ) -> StockResponse:
     """Update an existing stock.
@@ -192,19 +400,24 @@ async def update_stock(
     - industry_group: New industry group (requires sector)
     - grade: New stock grade (A/B/C/D/F)
     - notes: New additional notes
+    - version: Stock version the edit is based on (optional; an
+      ``If-Match`` header with the stock's ETag works too)
 
     Returns:
         StockResponse with updated stock data
 
     Raises:
         HTTPException: 404 if stock not found, 400 for duplicate symbol,
+                      409 if the stock changed since the given version,
+                      412 for an unreadable If-Match header,
                       422 for validation errors, 500 for server errors
     """
     # Convert request to command
-    command = stock_update.to_command(stock_id)
+    command = stock_update.to_command(stock_id, _parse_if_match(if_match))
 
     # Call application service
-    stock_dto = service.update_stock(command)
+    stock_dto = await asyncio.to_thread(service.update_stock, command)
 
     # Convert DTO to response
+    response.headers["ETag"] = _etag(stock_dto.version)
     return StockResponse.from_dto(stock_dto)
@@ -0,0 +1,14 @@
+"""Caching helpers shared by all layers."""
+
+from src.shared.caching.data_version import DataVersion, TableVersions
+from src.shared.caching.singleflight import SingleFlight, SingleFlightInfo
+from src.shared.caching.versioned_cache import VersionedCache, VersionedCacheInfo
+
+__all__ = [
+    "DataVersion",
+    "SingleFlight",
+    "SingleFlightInfo",
+    "TableVersions",
+    "VersionedCache",
+    "VersionedCacheInfo",
+]
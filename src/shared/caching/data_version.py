@@ -0,0 +1,58 @@
+"""Versions of stored data, advanced by writers.
+
+Readers include the current version in the keys of cached or coalesced
+results, so anything derived from data older than the last committed write
+is never served again.
+"""
+
+import threading
+from collections.abc import Iterable
+
+
+class DataVersion:
+    """Thread-safe counter that writers advance after changing the data."""
+
+    def __init__(self) -> None:
+        """Start at version zero."""
+        self._lock = threading.Lock()
+        self._value = 0
+
+    @property
+    def current(self) -> int:
+        """Get the current version."""
+        return self._value
+
+    def bump(self) -> int:
+        """Advance the version after a committed write.
+
+        Returns:
+            The new version
+        """
+        with self._lock:
+            self._value += 1
+            return self._value
+
+
+class TableVersions:
+    """Data version per table, shared by writers and cached readers."""
+
+    def __init__(self) -> None:
+        """Initialize with every table at version zero."""
+        self._lock = threading.Lock()
+        self._versions: dict[str, DataVersion] = {}
+
+    def __getitem__(self, table: str) -> DataVersion:
+        """Get the version of a table, e.g. to pass it to a writer."""
+        with self._lock:
+            return self._versions.setdefault(table, DataVersion())
+
+    def snapshot(self, tables: Iterable[str]) -> tuple[int, ...]:
+        """Get the current versions of tables, in the order given.
+
+        Args:
+            tables: Tables a result is read from
+
+        Returns:
+            One version per table
+        """
+        return tuple(self[table].current for table in tables)
@@ -0,0 +1,105 @@
+"""Coalescing of identical concurrent reads (singleflight).
+
+When many clients ask for the same data at once, only the first call runs
+the computation; every call with the same key that arrives while it is in
+flight awaits the same asyncio future and shares its result. Nothing is
+kept once the computation finishes, so the next call after it computes
+again. Keys should include the version of the data read, e.g.
+``("find_stocks", spec, data_version.current)``, so a call made after a
+write never joins a computation that may have read the data before it.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, NamedTuple, TypeVar
+
+ResultT = TypeVar("ResultT")
+
+
+class SingleFlightInfo(NamedTuple):
+    """Call statistics, shaped like functools' cache_info()."""
+
+    hits: int  # Calls that joined a computation already in flight
+    misses: int  # Calls that started a computation
+    currsize: int  # Computations in flight
+
+    @property
+    def collapsed_ratio(self) -> float:
+        """Get the share of calls that joined a computation in flight."""
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+class SingleFlight:
+    """Shares one in-flight computation between concurrent identical calls.
+
+    Use one instance per event loop. Callers receive the same result
+    object, so they must not mutate it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize without computations in flight."""
+        self._flights: dict[Hashable, asyncio.Task[Any]] = {}
+        self._collapsed = 0
+        self._started = 0
+
+    async def do(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[ResultT]],
+    ) -> ResultT:
+        """Run a computation, or join the one in flight for the same key.
+
+        The computation runs as its own task, so a caller that is cancelled,
+        e.g. because its client disconnected, does not cancel it for the
+        others.
+
+        Args:
+            key: Identifies the call, e.g. (method, arguments, data version)
+            compute: Starts the computation when none is in flight
+
+        Returns:
+            Result of the computation
+
+        Raises:
+            Exception: Whatever the computation raises, in every caller
+        """
+        task: asyncio.Task[ResultT] | None = self._flights.get(key)
+        if task is None:
+            self._started += 1
+            task = asyncio.ensure_future(compute())
+            self._flights[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self._collapsed += 1
+        return await asyncio.shield(task)
+
+    async def do_in_thread(self, key: Hashable, fn: Callable[[], ResultT]) -> ResultT:
+        """Run a blocking call in a worker thread, or join the one in flight.
+
+        Args:
+            key: Identifies the call, e.g. (method, arguments, data version)
+            fn: Blocking call, e.g. a service method opening a unit of work
+
+        Returns:
+            Result of the call
+
+        Raises:
+            Exception: Whatever the call raises, in every caller
+        """
+        return await self.do(key, lambda: asyncio.to_thread(fn))
+
+    def cache_info(self) -> SingleFlightInfo:
+        """Get joined, started and in-flight call counts."""
+        return SingleFlightInfo(
+            hits=self._collapsed,
+            misses=self._started,
+            currsize=len(self._flights),
+        )
+
+    def _finish(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        """Forget a finished computation so the next call starts a new one."""
+        _ = self._flights.pop(key, None)
+        # Mark a failure as retrieved when every caller was cancelled
+        if not task.cancelled():
+            _ = task.exception()
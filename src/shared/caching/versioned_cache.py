@@ -0,0 +1,201 @@
+"""Cache of computed values keyed by the version of their inputs.
+
+Callers pass the current version of the data a value is derived from, e.g.
+``(positions_version, prices_version)``. An entry computed for an older
+version is stale: it is served immediately while one background refresh
+recomputes it (stale-while-revalidate), so readers never wait for a
+recomputation once a value exists. Concurrent misses for the same key wait
+for a single computation instead of each computing the value.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Generic, NamedTuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+class VersionedCacheInfo(NamedTuple):
+    """Cache statistics, shaped like functools' cache_info()."""
+
+    hits: int
+    misses: int
+    stale_hits: int
+    maxsize: int
+    currsize: int
+
+
+@dataclass
+class _Entry(Generic[ValueT]):
+    """A cached value and the input version it was computed for."""
+
+    value: ValueT
+    version: Hashable
+
+
+class VersionedCache(Generic[KeyT, ValueT]):
+    """Thread-safe LRU cache of values computed from versioned inputs."""
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        *,
+        stale_while_revalidate: bool = True,
+        executor: Executor | None = None,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of keys; least recently used are evicted
+            stale_while_revalidate: Serve outdated values while refreshing
+                them in the background instead of recomputing inline
+            executor: Runs background refreshes; a single worker thread is
+                started on first use when omitted
+
+        Raises:
+            ValueError: If maxsize is below 1
+        """
+        if maxsize < 1:
+            msg = "maxsize must be at least 1"
+            raise ValueError(msg)
+        self._maxsize = maxsize
+        self._stale_while_revalidate = stale_while_revalidate
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._entries: OrderedDict[KeyT, _Entry[ValueT]] = OrderedDict()
+        self._key_locks: dict[KeyT, threading.Lock] = {}
+        self._refreshing: set[KeyT] = set()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stale_hits = 0
+
+    def get(
+        self,
+        key: KeyT,
+        version: Hashable,
+        compute: Callable[[], ValueT],
+    ) -> ValueT:
+        """Get the value for a key, computing it when missing or outdated.
+
+        Args:
+            key: Cache key, e.g. a portfolio ID
+            version: Current version of the inputs the value depends on
+            compute: Computes the value from the current inputs
+
+        Returns:
+            The cached value when its version matches; with
+            stale-while-revalidate, an outdated value while a refresh runs;
+            otherwise a freshly computed value
+
+        Raises:
+            Exception: Whatever compute raises when computing inline
+        """
+        stale: _Entry[ValueT] | None = None
+        refresh = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if entry.version == version:
+                    self._hits += 1
+                    return entry.value
+                if self._stale_while_revalidate:
+                    self._stale_hits += 1
+                    stale = entry
+                    refresh = key not in self._refreshing
+                    self._refreshing.add(key)
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        if stale is not None:
+            if refresh:
+                _ = self._executor_for_refresh().submit(
+                    self._refresh,
+                    key,
+                    version,
+                    compute,
+                )
+            return stale.value
+
+        # One caller computes; the others wait and reuse its result
+        with key_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry.version == version:
+                    self._hits += 1
+                    return entry.value
+                self._misses += 1
+            value = compute()
+            self._store(key, version, value)
+            return value
+
+    def invalidate(self, key: KeyT) -> None:
+        """Drop the entry for a key, so the next read computes inline."""
+        with self._lock:
+            _ = self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._stale_hits = 0
+
+    def cache_info(self) -> VersionedCacheInfo:
+        """Get hit, miss and size statistics."""
+        with self._lock:
+            return VersionedCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                stale_hits=self._stale_hits,
+                maxsize=self._maxsize,
+                currsize=len(self._entries),
+            )
+
+    def close(self) -> None:
+        """Stop the background refresh thread started by this cache."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _executor_for_refresh(self) -> Executor:
+        """Get the refresh executor, starting the default one on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix="cache-refresh",
+                )
+            return self._executor
+
+    def _refresh(
+        self,
+        key: KeyT,
+        version: Hashable,
+        compute: Callable[[], ValueT],
+    ) -> None:
+        """Recompute a stale entry; on failure keep serving the stale value."""
+        try:
+            value = compute()
+        except Exception:
+            logger.exception("Background refresh of cache key %r failed", key)
+        else:
+            self._store(key, version, value)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _store(self, key: KeyT, version: Hashable, value: ValueT) -> None:
+        """Store a computed value and evict the least recently used keys."""
+        with self._lock:
+            self._entries[key] = _Entry(value, version)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                evicted, _ = self._entries.popitem(last=False)
+                _ = self._key_locks.pop(evicted, None)
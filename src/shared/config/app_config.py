@@ -33,6 +33,8 @@ class AppConfig(BaseConfig):
         """Load all configuration settings."""
         self._setup_application_settings()
         self._setup_feature_flags()
+        self._setup_instrumentation()
+        self._setup_response_cache()
 
     def _setup_application_settings(self) -> None:
         """Setup application settings."""
@@ -86,6 +88,40 @@ class AppConfig(BaseConfig):
             ),
         }
 
+    def _setup_instrumentation(self) -> None:
+        """Setup metrics and profiling settings."""
+        self.metrics_enabled = self.get_env_bool("STOCKBOOK_METRICS", default=True)
+        # Profiling is opt-in: allow per-request profiles via header
+        self.profiling_enabled = self.get_env_bool(
+            "STOCKBOOK_PROFILING",
+            default=False,
+        )
+        # Share of all requests to profile and log, from 0 to 1
+        self.profiling_sample_rate = self.get_env_float(
+            "STOCKBOOK_PROFILING_SAMPLE_RATE",
+            0.0,
+        )
+
+    def _setup_response_cache(self) -> None:
+        """Setup the HTTP response cache."""
+        # Opt-in: table versions are per process, so writes made by another
+        # process do not invalidate this one's cached responses
+        self.response_cache_enabled = self.get_env_bool(
+            "STOCKBOOK_RESPONSE_CACHE",
+            default=False,
+        )
+        # Total bytes of cached bodies, compressed variants included
+        self.response_cache_max_bytes = self.get_env_int(
+            "STOCKBOOK_RESPONSE_CACHE_MAX_BYTES",
+            16 * 1024 * 1024,
+        )
+        # Seconds a cached response is served for; bounds how long writes
+        # from other processes go unseen. 0 keeps entries until a write
+        self.response_cache_max_age = self.get_env_float(
+            "STOCKBOOK_RESPONSE_CACHE_MAX_AGE",
+            60.0,
+        )
+
     def is_feature_enabled(self, feature_name: str) -> bool:
         """Check if a feature is enabled."""
         return self.features.get(feature_name, False)
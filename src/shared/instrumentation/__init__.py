@@ -0,0 +1,35 @@
+"""Instrumentation shared by all layers: metrics and profiling.
+
+The module-level ``metrics`` registry and ``profiler`` are configured
+from AppConfig and shared by every instrumented component.
+"""
+
+from src.shared.config import app_config
+from src.shared.instrumentation.metrics import (
+    DEFAULT_BUCKETS,
+    FAST_BUCKETS,
+    CacheStats,
+    Counter,
+    Histogram,
+    MetricsRegistry,
+)
+from src.shared.instrumentation.profiling import RequestProfiler
+
+metrics = MetricsRegistry(enabled=app_config.metrics_enabled)
+
+profiler = RequestProfiler(
+    enabled=app_config.profiling_enabled,
+    sample_rate=app_config.profiling_sample_rate,
+)
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "FAST_BUCKETS",
+    "CacheStats",
+    "Counter",
+    "Histogram",
+    "MetricsRegistry",
+    "RequestProfiler",
+    "metrics",
+    "profiler",
+]
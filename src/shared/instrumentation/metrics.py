@@ -0,0 +1,378 @@
+"""In-process metrics with Prometheus text exposition.
+
+A small, dependency-free subset of the Prometheus client model: counters
+and histograms with fixed label names, plus cache statistics read on
+demand. Instrumented code checks ``registry.enabled`` before timing
+anything, so disabled metrics cost one attribute lookup per call site.
+"""
+
+import itertools
+import math
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Iterator, Sequence
+from typing import Protocol
+
+# Seconds; suited to HTTP requests and units of work
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Seconds; suited to single SQL statements
+FAST_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5)
+
+
+class CacheStats(Protocol):
+    """Cache statistics in the shape of functools' cache_info()."""
+
+    @property
+    def hits(self) -> int:
+        """Get the number of lookups answered from the cache."""
+        ...
+
+    @property
+    def misses(self) -> int:
+        """Get the number of lookups that had to compute a value."""
+        ...
+
+    @property
+    def currsize(self) -> int:
+        """Get the number of cached entries."""
+        ...
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for the text exposition format."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format a label set, e.g. ``{method="GET"}``."""
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    """Named metric with a fixed set of label names."""
+
+    type_name = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        """Initialize the metric.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Names of the labels every sample carries
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _check_labels(self, labelvalues: tuple[str, ...]) -> None:
+        """Validate label values against the label names.
+
+        Raises:
+            ValueError: If the number of values does not match
+        """
+        if len(labelvalues) != len(self.labelnames):
+            msg = (
+                f"{self.name} expects labels {self.labelnames}, "
+                f"got {len(labelvalues)} values"
+            )
+            raise ValueError(msg)
+
+    def render(self) -> Iterator[str]:
+        """Yield the exposition lines for this metric."""
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.type_name}"
+        yield from self._render_samples()
+
+    def _render_samples(self) -> Iterator[str]:
+        """Yield the sample lines for this metric."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Drop all recorded samples."""
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    type_name = "counter"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        """Initialize the counter.
+
+        Args:
+            name: Metric name, conventionally ending in ``_total``
+            documentation: Help text
+            labelnames: Names of the labels every sample carries
+        """
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        """Increase the counter for a label set.
+
+        Args:
+            *labelvalues: Values for the label names, in order
+            amount: Non-negative increment
+
+        Raises:
+            ValueError: If the amount is negative or labels do not match
+        """
+        if amount < 0:
+            msg = "Counters can only increase"
+            raise ValueError(msg)
+        self._check_labels(labelvalues)
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def value(self, *labelvalues: str) -> float:
+        """Get the current value for a label set."""
+        with self._lock:
+            return self._values.get(labelvalues, 0.0)
+
+    def _render_samples(self) -> Iterator[str]:
+        """Yield one line per label set."""
+        with self._lock:
+            values = sorted(self._values.items())
+        for labelvalues, value in values:
+            labels = _format_labels(self.labelnames, labelvalues)
+            yield f"{self.name}{labels} {_format_value(value)}"
+
+    def clear(self) -> None:
+        """Drop all recorded samples."""
+        with self._lock:
+            self._values.clear()
+
+
+class _HistogramSeries:
+    """Bucket counts, sum and count for one label set."""
+
+    __slots__ = ("buckets", "count", "total")
+
+    def __init__(self, size: int) -> None:
+        """Initialize empty buckets."""
+        self.buckets = [0] * size
+        self.count = 0
+        self.total = 0.0
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize the histogram.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Names of the labels every sample carries
+            buckets: Increasing upper bounds; +Inf is added automatically
+
+        Raises:
+            ValueError: If the buckets are empty or not increasing
+        """
+        super().__init__(name, documentation, labelnames)
+        bounds = tuple(float(bound) for bound in buckets if not math.isinf(bound))
+        if not bounds or any(a >= b for a, b in itertools.pairwise(bounds)):
+            msg = "Histogram buckets must be increasing"
+            raise ValueError(msg)
+        self.buckets = bounds
+        self._series: dict[tuple[str, ...], _HistogramSeries] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """Record one observation for a label set.
+
+        Args:
+            value: Observed value
+            *labelvalues: Values for the label names, in order
+        """
+        self._check_labels(labelvalues)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = _HistogramSeries(len(self.buckets) + 1)
+                self._series[labelvalues] = series
+            series.buckets[index] += 1
+            series.count += 1
+            series.total += value
+
+    def count(self, *labelvalues: str) -> int:
+        """Get the number of observations for a label set."""
+        with self._lock:
+            series = self._series.get(labelvalues)
+            return 0 if series is None else series.count
+
+    def _render_samples(self) -> Iterator[str]:
+        """Yield bucket, sum and count lines per label set."""
+        with self._lock:
+            snapshot = sorted(
+                (labelvalues, list(series.buckets), series.total, series.count)
+                for labelvalues, series in self._series.items()
+            )
+        bucket_labelnames = (*self.labelnames, "le")
+        bounds = (*self.buckets, math.inf)
+        for labelvalues, buckets, total, count in snapshot:
+            cumulative = 0
+            for bound, bucket in zip(bounds, buckets, strict=True):
+                cumulative += bucket
+                labels = _format_labels(
+                    bucket_labelnames,
+                    (*labelvalues, _format_value(bound)),
+                )
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, labelvalues)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {count}"
+
+    def clear(self) -> None:
+        """Drop all recorded samples."""
+        with self._lock:
+            self._series.clear()
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together for scraping."""
+
+    def __init__(self, *, enabled: bool = True, prefix: str = "stockbook") -> None:
+        """Initialize an empty registry.
+
+        Args:
+            enabled: Whether instrumented code should record anything
+            prefix: Prefix for the cache statistics metric names
+        """
+        self.enabled = enabled
+        self._prefix = prefix
+        self._lock = threading.Lock()
+        self._metrics: dict[str, _Metric] = {}
+        self._caches: dict[str, Callable[[], CacheStats]] = {}
+
+    def counter(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ) -> Counter:
+        """Get or create a counter.
+
+        Raises:
+            TypeError: If the name is registered as a different kind of metric
+        """
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = Counter(name, documentation, labelnames)
+                self._metrics[name] = metric
+        if not isinstance(metric, Counter):
+            msg = f"Metric {name} is already registered as {metric.type_name}"
+            raise TypeError(msg)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram.
+
+        Raises:
+            TypeError: If the name is registered as a different kind of metric
+        """
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = Histogram(name, documentation, labelnames, buckets)
+                self._metrics[name] = metric
+        if not isinstance(metric, Histogram):
+            msg = f"Metric {name} is already registered as {metric.type_name}"
+            raise TypeError(msg)
+        return metric
+
+    def register_cache(self, name: str, stats: Callable[[], CacheStats]) -> None:
+        """Report hit and miss counts of a cache on every scrape.
+
+        Args:
+            name: Value of the ``cache`` label
+            stats: Returns current statistics, e.g. an lru_cache's cache_info
+        """
+        with self._lock:
+            self._caches[name] = stats
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+            caches = sorted(self._caches.items())
+        lines: list[str] = []
+        for _, metric in metrics:
+            lines.extend(metric.render())
+        if caches:
+            lines.extend(self._render_caches(caches))
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drop all recorded samples, keeping metric definitions."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+    def _render_caches(
+        self,
+        caches: list[tuple[str, Callable[[], CacheStats]]],
+    ) -> Iterator[str]:
+        """Yield hit, miss, ratio and size lines for registered caches."""
+        rows: list[tuple[str, tuple[float, ...]]] = []
+        for cache, info in caches:
+            stats = info()
+            lookups = stats.hits + stats.misses
+            ratio = stats.hits / lookups if lookups else 0.0
+            rows.append((cache, (stats.hits, stats.misses, ratio, stats.currsize)))
+        families = (
+            ("cache_hits_total", "counter", "Cache lookups answered from the cache"),
+            ("cache_misses_total", "counter", "Cache lookups that computed a value"),
+            ("cache_hit_ratio", "gauge", "Share of cache lookups that were hits"),
+            ("cache_size", "gauge", "Entries currently cached"),
+        )
+        for index, (suffix, type_name, documentation) in enumerate(families):
+            name = f"{self._prefix}_{suffix}"
+            yield f"# HELP {name} {documentation}"
+            yield f"# TYPE {name} {type_name}"
+            for cache, values in rows:
+                labels = _format_labels(("cache",), (cache,))
+                yield f"{name}{labels} {_format_value(values[index])}"
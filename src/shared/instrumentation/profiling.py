@@ -0,0 +1,99 @@
+"""Opt-in cProfile hook for sampling request hot paths.
+
+Profiling is off unless enabled by configuration. When enabled, a
+request can ask for a profile explicitly, and a configurable share of
+all requests is profiled at random. Only one profile runs at a time,
+since the interpreter supports a single active profiler; requests that
+arrive meanwhile run unprofiled.
+"""
+
+import cProfile
+import io
+import pstats
+import random
+import threading
+from collections.abc import Callable
+
+
+class RequestProfiler:
+    """Decides which requests to profile and formats the results."""
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = False,
+        sample_rate: float = 0.0,
+        limit: int = 40,
+        sampler: Callable[[], float] = random.random,
+    ) -> None:
+        """Initialize the profiler.
+
+        Args:
+            enabled: Honour explicit profiling requests
+            sample_rate: Share of requests profiled at random, from 0 to 1
+            limit: Number of functions listed in a report
+            sampler: Source of random numbers in [0, 1)
+
+        Raises:
+            ValueError: If the sample rate is outside [0, 1]
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            msg = "Sample rate must be between 0 and 1"
+            raise ValueError(msg)
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self._limit = limit
+        self._sampler = sampler
+        self._active = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        """Check whether any profiling can happen at all."""
+        return self.enabled or self.sample_rate > 0
+
+    def should_profile(self, *, requested: bool) -> bool:
+        """Decide whether to profile a request.
+
+        Args:
+            requested: The request asked for a profile
+
+        Returns:
+            True for honoured requests and for sampled ones
+        """
+        if requested and self.enabled:
+            return True
+        return self.sample_rate > 0 and self._sampler() < self.sample_rate
+
+    def start(self) -> cProfile.Profile | None:
+        """Start profiling unless another profile is already running.
+
+        Returns:
+            Running profile to pass to stop(), or None if busy
+        """
+        if not self._active.acquire(blocking=False):
+            return None
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except BaseException:
+            self._active.release()
+            raise
+        return profile
+
+    def stop(self, profile: cProfile.Profile) -> str:
+        """Stop a profile started by start() and format its report.
+
+        Args:
+            profile: Profile returned by start()
+
+        Returns:
+            Functions sorted by cumulative time
+        """
+        try:
+            profile.disable()
+        finally:
+            self._active.release()
+        output = io.StringIO()
+        stats = pstats.Stats(profile, stream=output)
+        _ = stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self._limit)
+        return output.getvalue()
@@ -0,0 +1,47 @@
+"""Lazy loading of package exports.
+
+Packages re-export names from their modules so callers can import them from
+the package, but then importing the package imports every module and all of
+their dependencies. ``lazy_exports`` builds the module-level ``__getattr__``
+and ``__dir__`` (PEP 562) that import a module only when one of its names is
+first used. Packages keep the real imports under ``TYPE_CHECKING`` so type
+checkers still see the exports.
+"""
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+
+
+def lazy_exports(
+    package: str,
+    exports: Mapping[str, str],
+) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """Build ``__getattr__`` and ``__dir__`` for a package with lazy exports.
+
+    Args:
+        package: Name of the package, i.e. its ``__name__``
+        exports: Exported name -> module defining it, relative to the package
+            (e.g. ``".composition_root"``)
+
+    Returns:
+        Functions to assign to the package's ``__getattr__`` and ``__dir__``
+    """
+    namespace = vars(sys.modules[package])
+
+    def load(name: str) -> object:
+        """Import the module defining an export and return the export."""
+        module = exports.get(name)
+        if module is None:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        value = getattr(importlib.import_module(module, package), name)
+        # Later lookups find the name directly and skip __getattr__
+        namespace[name] = value
+        return value
+
+    def names() -> list[str]:
+        """List the package attributes including exports not loaded yet."""
+        return sorted({*namespace, *exports})
+
+    return load, names
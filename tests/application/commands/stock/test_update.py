@@ -5,6 +5,8 @@ Following TDD approach - these tests define the expected behavior
 of the UpdateStockCommand used for stock update operations.
 """
 
+from typing import Any
+
 import pytest
 
 from src.application.commands.stock import UpdateStockCommand, UpdateStockInputs
@@ -111,6 +113,21 @@ class TestUpdateStockCommand:
         assert command1 == command2
         assert command1 != command3
 
+    def test_update_stock_command_expected_version(self) -> None:
+        """Should carry the expected version without counting it as an update."""
+        command = UpdateStockCommand(
+            UpdateStockInputs(stock_id="test-stock-1", expected_version=3),
+        )
+
+        assert command.expected_version == 3
+        assert not command.has_updates()
+        assert command != UpdateStockCommand(UpdateStockInputs("test-stock-1"))
+        assert "expected_version=3" in repr(command)
+        with pytest.raises(ValueError, match="Expected version must be at least 1"):
+            _ = UpdateStockCommand(
+                UpdateStockInputs(stock_id="test-stock-1", expected_version=0),
+            )
+
     def test_update_stock_command_string_representation(self) -> None:
         """Should have meaningful string representation."""
         inputs = UpdateStockInputs(stock_id="test-stock-1", grade="A")
@@ -345,7 +362,10 @@ class TestUpdateStockCommand:
         ]
 
         for field_name, field_value in fields_to_test:
-            kwargs = {"stock_id": "test-stock-1", field_name: field_value}
+            kwargs: dict[str, Any] = {
+                "stock_id": "test-stock-1",
+                field_name: field_value,
+            }
             inputs = UpdateStockInputs(**kwargs)
             command = UpdateStockCommand(inputs)
             assert (
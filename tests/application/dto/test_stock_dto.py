@@ -6,6 +6,7 @@ of StockDto used for transferring data between layers.
 """
 
 from dataclasses import FrozenInstanceError
+from typing import Any
 from unittest.mock import Mock
 
 import pytest
@@ -383,7 +384,7 @@ class TestStockDto:
         ]
 
         for field_name, different_value in different_fields:
-            kwargs = {
+            kwargs: dict[str, Any] = {
                 "id": "test-id",
                 "symbol": "TEST",
                 "name": "Test Company",
@@ -0,0 +1,406 @@
+"""Tests for the background OutboxDispatcher."""
+
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false, reportArgumentType=false
+
+import asyncio
+import threading
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, Mock
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.engine import Engine
+
+from src.application.events import (
+    DispatcherConfig,
+    EventBus,
+    EventSerializer,
+    OutboxDispatcher,
+    OutboxEventPublisher,
+)
+from src.domain.events import DomainEvent, StockAddedEvent
+from src.domain.repositories.interfaces import IStockBookUnitOfWork, OutboxMessage
+from src.domain.value_objects.stock_symbol import StockSymbol
+from src.infrastructure.persistence.database_factory import create_engine
+from src.infrastructure.persistence.tables import metadata, outbox_table
+from src.infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
+
+
+def create_event(index: int) -> StockAddedEvent:
+    """Helper to create a StockAddedEvent."""
+    return StockAddedEvent(StockSymbol("AAPL"), "Apple Inc.", f"stock-{index}")
+
+
+class TestDispatcherConfig:
+    """Test suite for DispatcherConfig validation."""
+
+    @pytest.mark.parametrize(
+        "field",
+        [
+            "batch_size",
+            "queue_size",
+            "workers",
+            "poll_interval",
+            "max_attempts",
+            "retry_delay",
+            "retention",
+            "purge_interval",
+        ],
+    )
+    def test_rejects_non_positive_values(self, field: str) -> None:
+        """Test that every setting must be positive."""
+        with pytest.raises(ValueError, match=field):
+            _ = DispatcherConfig(**{field: 0})
+
+
+class TestOutboxDispatcher:
+    """Test suite for OutboxDispatcher over a real database."""
+
+    @pytest.fixture
+    def engine(self, tmp_path: Path) -> Engine:
+        """Create a file database shared by the worker threads."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'events.db'}")
+        metadata.create_all(engine)
+        return engine
+
+    @pytest.fixture
+    def bus(self) -> EventBus:
+        """Create an event bus."""
+        return EventBus()
+
+    @staticmethod
+    def _record(
+        engine: Engine,
+        events: list[DomainEvent],
+        dispatcher: OutboxDispatcher | None = None,
+    ) -> None:
+        """Commit events to the outbox as an application service would."""
+        unit_of_work = SqlAlchemyUnitOfWork(
+            engine,
+            on_outbox_commit=dispatcher.notify if dispatcher else None,
+        )
+        with unit_of_work:
+            OutboxEventPublisher().record(unit_of_work, events)
+            unit_of_work.commit()
+
+    @staticmethod
+    def _pending(engine: Engine) -> list[OutboxMessage]:
+        """Read the messages still waiting in the outbox."""
+        with SqlAlchemyUnitOfWork(engine) as unit_of_work:
+            return unit_of_work.outbox.get_pending(100)
+
+    @pytest.mark.anyio
+    async def test_delivers_committed_events_in_background(
+        self,
+        engine: Engine,
+        bus: EventBus,
+    ) -> None:
+        """Test that committed events reach handlers and leave the outbox."""
+        delivered = threading.Event()
+        received: list[DomainEvent] = []
+
+        def on_added(event: DomainEvent) -> None:
+            """Record the event; runs in a worker thread."""
+            received.append(event)
+            delivered.set()
+
+        bus.subscribe(StockAddedEvent, on_added)
+        dispatcher = OutboxDispatcher(lambda: SqlAlchemyUnitOfWork(engine), bus)
+        await dispatcher.start()
+        try:
+            event = create_event(1)
+            # Commit from another thread, like a request handler would
+            await asyncio.to_thread(self._record, engine, [event], dispatcher)
+
+            assert await asyncio.to_thread(delivered.wait, 5)
+            await dispatcher.flush()
+        finally:
+            await dispatcher.stop()
+
+        assert received == [event]
+        assert isinstance(received[0], StockAddedEvent)
+        assert received[0].stock_id == "stock-1"
+        assert self._pending(engine) == []
+
+    @pytest.mark.anyio
+    async def test_start_delivers_backlog_in_batches(
+        self,
+        engine: Engine,
+        bus: EventBus,
+    ) -> None:
+        """Test that events committed before start are delivered."""
+        events: list[DomainEvent] = [create_event(index) for index in range(7)]
+        self._record(engine, events)
+        received: list[DomainEvent] = []
+        bus.subscribe(StockAddedEvent, received.append)
+        dispatcher = OutboxDispatcher(
+            lambda: SqlAlchemyUnitOfWork(engine),
+            bus,
+            EventSerializer(),
+            DispatcherConfig(batch_size=3, queue_size=2, workers=2),
+        )
+
+        await dispatcher.start()
+        await dispatcher.start()  # Already running; no second set of tasks
+        try:
+            assert dispatcher.running
+            await dispatcher.flush()
+        finally:
+            await dispatcher.stop()
+
+        assert not dispatcher.running
+        assert sorted(event.event_id for event in received) == sorted(
+            event.event_id for event in events
+        )
+        assert self._pending(engine) == []
+
+    @pytest.mark.anyio
+    async def test_undecodable_events_are_dropped(
+        self,
+        engine: Engine,
+        bus: EventBus,
+    ) -> None:
+        """Test that unknown event types do not block the outbox."""
+        with SqlAlchemyUnitOfWork(engine) as unit_of_work:
+            unit_of_work.outbox.add(
+                [
+                    OutboxMessage(
+                        event_id="unknown-1",
+                        event_type="RemovedEvent",
+                        payload="{}",
+                        occurred_at=create_event(2).occurred_at,
+                    ),
+                ],
+            )
+            unit_of_work.commit()
+        dispatcher = OutboxDispatcher(lambda: SqlAlchemyUnitOfWork(engine), bus)
+
+        await dispatcher.start()
+        try:
+            await dispatcher.flush()
+        finally:
+            await dispatcher.stop()
+
+        assert self._pending(engine) == []
+
+    @pytest.mark.anyio
+    async def test_failed_handlers_are_retried_with_backoff(
+        self,
+        engine: Engine,
+        bus: EventBus,
+    ) -> None:
+        """Test that an event stays pending until its handlers succeed."""
+        attempts: list[str] = []
+        delivered = threading.Event()
+
+        def on_added(event: DomainEvent) -> None:
+            """Fail twice, then succeed."""
+            attempts.append(event.event_id)
+            if len(attempts) < 3:
+                msg = "handler failed"
+                raise RuntimeError(msg)
+            delivered.set()
+
+        bus.subscribe(StockAddedEvent, on_added)
+        self._record(engine, [create_event(1)])
+        dispatcher = OutboxDispatcher(
+            lambda: SqlAlchemyUnitOfWork(engine),
+            bus,
+            config=DispatcherConfig(poll_interval=0.01, retry_delay=0.2),
+        )
+
+        await dispatcher.start()
+        try:
+            await dispatcher.flush()
+            assert len(attempts) == 1
+            assert len(self._pending(engine)) == 1
+            # Waiting for the backoff, so flush leaves it to the relay
+            await dispatcher.flush()
+            assert len(attempts) == 1
+
+            assert await asyncio.to_thread(delivered.wait, 5)
+            await dispatcher.flush()
+        finally:
+            await dispatcher.stop()
+
+        assert len(attempts) == 3
+        assert self._pending(engine) == []
+
+    @pytest.mark.anyio
+    async def test_failing_events_are_dropped_after_max_attempts(
+        self,
+        engine: Engine,
+        bus: EventBus,
+    ) -> None:
+        """Test that a handler that always fails cannot block the outbox."""
+        attempts: list[str] = []
+
+        def on_fail(event: DomainEvent) -> None:
+            """Fail to handle the event."""
+            attempts.append(event.event_id)
+            msg = "handler failed"
+            raise RuntimeError(msg)
+
+        bus.subscribe(StockAddedEvent, on_fail)
+        self._record(engine, [create_event(1)])
+        dispatcher = OutboxDispatcher(
+            lambda: SqlAlchemyUnitOfWork(engine),
+            bus,
+            config=DispatcherConfig(max_attempts=1),
+        )
+
+        await dispatcher.start()
+        try:
+            await dispatcher.flush()
+        finally:
+            await dispatcher.stop()
+
+        assert len(attempts) == 1
+        assert self._pending(engine) == []
+
+    @pytest.mark.anyio
+    async def test_failed_mark_leaves_events_pending(self, bus: EventBus) -> None:
+        """Test that events stay pending when they cannot be marked."""
+        message = EventSerializer().to_message(create_event(1))
+        unit_of_work = MagicMock(spec=IStockBookUnitOfWork)
+        unit_of_work.__enter__.return_value = unit_of_work
+        unit_of_work.outbox.get_pending.side_effect = [[message], []]
+        unit_of_work.outbox.mark_dispatched.side_effect = RuntimeError("locked")
+        received: list[DomainEvent] = []
+        bus.subscribe(StockAddedEvent, received.append)
+        dispatcher = OutboxDispatcher(lambda: unit_of_work, bus)
+
+        await dispatcher.start()
+        try:
+            await dispatcher.flush()
+        finally:
+            await dispatcher.stop()
+
+        assert [event.event_id for event in received] == [message.event_id]
+
+    @pytest.mark.anyio
+    async def test_relay_survives_outbox_errors_and_rescans(
+        self,
+        bus: EventBus,
+    ) -> None:
+        """Test that read errors are logged and the relay keeps polling."""
+        unit_of_work = MagicMock(spec=IStockBookUnitOfWork)
+        unit_of_work.__enter__.return_value = unit_of_work
+        polled = threading.Event()
+        calls: list[int] = []
+
+        def get_pending(_limit: int, after_sequence: int = 0) -> list[OutboxMessage]:
+            """Fail on the first read, then report an empty outbox."""
+            calls.append(after_sequence)
+            if len(calls) == 1:
+                msg = "database unavailable"
+                raise RuntimeError(msg)
+            if len(calls) >= 3:
+                polled.set()
+            return []
+
+        unit_of_work.outbox.get_pending.side_effect = get_pending
+        dispatcher = OutboxDispatcher(
+            lambda: unit_of_work,
+            bus,
+            config=DispatcherConfig(poll_interval=0.01),
+        )
+
+        await dispatcher.start()
+        try:
+            assert await asyncio.to_thread(polled.wait, 5)
+        finally:
+            await dispatcher.stop()
+
+        assert len(calls) >= 3
+
+    @pytest.mark.anyio
+    async def test_purges_expired_dispatched_events(
+        self,
+        engine: Engine,
+        bus: EventBus,
+    ) -> None:
+        """Test that dispatched events past the retention leave the outbox."""
+        self._record(engine, [create_event(1), create_event(2)])
+        dispatcher = OutboxDispatcher(lambda: SqlAlchemyUnitOfWork(engine), bus)
+        await dispatcher.start()
+        try:
+            await dispatcher.flush()
+        finally:
+            await dispatcher.stop()
+        with engine.begin() as connection:
+            _ = connection.execute(
+                sa.update(outbox_table)
+                .where(outbox_table.c.sequence == 1)
+                .values(dispatched_at=datetime.now(UTC) - timedelta(days=2)),
+            )
+        count = sa.select(sa.func.count()).select_from(outbox_table)
+
+        dispatcher = OutboxDispatcher(
+            lambda: SqlAlchemyUnitOfWork(engine),
+            bus,
+            config=DispatcherConfig(retention=86400.0, purge_interval=0.01),
+        )
+        await dispatcher.start()
+        try:
+            for _ in range(500):
+                with engine.connect() as connection:
+                    if connection.execute(count).scalar() == 1:
+                        break
+                await asyncio.sleep(0.01)
+        finally:
+            await dispatcher.stop()
+
+        with engine.connect() as connection:
+            remaining = connection.execute(
+                sa.select(outbox_table.c.sequence),
+            ).scalars()
+            assert list(remaining) == [2]
+
+    @pytest.mark.anyio
+    async def test_purge_survives_outbox_errors(self, bus: EventBus) -> None:
+        """Test that purge errors are logged and purging is tried again."""
+        unit_of_work = MagicMock(spec=IStockBookUnitOfWork)
+        unit_of_work.__enter__.return_value = unit_of_work
+        unit_of_work.outbox.get_pending.return_value = []
+        purged = threading.Event()
+        calls: list[datetime] = []
+
+        def purge_dispatched(dispatched_before: datetime) -> int:
+            """Fail on the first purge, then delete one message."""
+            calls.append(dispatched_before)
+            if len(calls) == 1:
+                msg = "database locked"
+                raise RuntimeError(msg)
+            purged.set()
+            return 1
+
+        unit_of_work.outbox.purge_dispatched.side_effect = purge_dispatched
+        dispatcher = OutboxDispatcher(
+            lambda: unit_of_work,
+            bus,
+            config=DispatcherConfig(retention=60.0, purge_interval=0.01),
+        )
+
+        await dispatcher.start()
+        try:
+            assert await asyncio.to_thread(purged.wait, 5)
+        finally:
+            await dispatcher.stop()
+
+        assert datetime.now(UTC) - calls[-1] >= timedelta(seconds=60)
+
+    @pytest.mark.anyio
+    async def test_stopped_dispatcher_ignores_lifecycle_calls(
+        self,
+        bus: EventBus,
+    ) -> None:
+        """Test notify and stop before start, and flush without tasks."""
+        dispatcher = OutboxDispatcher(Mock(), bus)
+
+        dispatcher.notify()
+        await dispatcher.stop()
+
+        with pytest.raises(RuntimeError, match="not running"):
+            await dispatcher.flush()
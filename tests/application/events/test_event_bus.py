@@ -0,0 +1,127 @@
+"""Tests for the in-process EventBus."""
+
+import threading
+
+import pytest
+
+from src.application.events import EventBus
+from src.domain.events import DomainEvent, StockAddedEvent, StockUpdatedEvent
+from src.domain.value_objects.stock_symbol import StockSymbol
+
+
+def create_added_event() -> StockAddedEvent:
+    """Helper to create a StockAddedEvent."""
+    return StockAddedEvent(StockSymbol("AAPL"), "Apple Inc.", "stock-1")
+
+
+class TestEventBus:
+    """Test suite for EventBus."""
+
+    def test_handlers_for_includes_base_class_subscribers(self) -> None:
+        """Test that handlers are resolved along the event class hierarchy."""
+        bus = EventBus()
+
+        def on_added(_event: DomainEvent) -> None:
+            """Handle added events."""
+
+        def on_any(_event: DomainEvent) -> None:
+            """Handle all events."""
+
+        bus.subscribe(DomainEvent, on_any)
+        bus.subscribe(StockAddedEvent, on_added)
+
+        assert bus.handlers_for(StockAddedEvent) == (on_added, on_any)
+        assert bus.handlers_for(StockUpdatedEvent) == (on_any,)
+
+    def test_subscribe_invalidates_resolved_handlers(self) -> None:
+        """Test that a new subscription is visible after an earlier lookup."""
+        bus = EventBus()
+        assert bus.handlers_for(StockAddedEvent) == ()
+
+        def on_added(_event: DomainEvent) -> None:
+            """Handle added events."""
+
+        bus.subscribe(StockAddedEvent, on_added)
+
+        assert bus.handlers_for(StockAddedEvent) == (on_added,)
+
+    @pytest.mark.anyio
+    async def test_publish_calls_sync_and_async_handlers(self) -> None:
+        """Test that both plain and coroutine handlers receive the event."""
+        bus = EventBus()
+        received: list[str] = []
+
+        def on_sync(event: DomainEvent) -> None:
+            """Record the event synchronously."""
+            received.append(f"sync:{event.event_id}")
+
+        async def on_async(event: DomainEvent) -> None:
+            """Record the event asynchronously."""
+            received.append(f"async:{event.event_id}")
+
+        bus.subscribe(StockAddedEvent, on_sync)
+        bus.subscribe(StockAddedEvent, on_async)
+        event = create_added_event()
+
+        failures = await bus.publish(event)
+
+        assert failures == 0
+        assert received == [f"sync:{event.event_id}", f"async:{event.event_id}"]
+
+    @pytest.mark.anyio
+    async def test_sync_handlers_run_off_the_event_loop(self) -> None:
+        """Test that plain handlers run in a worker thread, coroutines on the loop."""
+        bus = EventBus()
+        threads: dict[str, threading.Thread] = {}
+
+        def on_sync(_event: DomainEvent) -> None:
+            """Record the thread running the handler."""
+            threads["sync"] = threading.current_thread()
+
+        async def on_async(_event: DomainEvent) -> None:
+            """Record the thread running the coroutine."""
+            threads["async"] = threading.current_thread()
+
+        bus.subscribe(StockAddedEvent, on_sync)
+        bus.subscribe(StockAddedEvent, on_async)
+
+        _ = await bus.publish(create_added_event())
+
+        assert threads["sync"] is not threading.current_thread()
+        assert threads["async"] is threading.current_thread()
+
+    @pytest.mark.anyio
+    async def test_sync_handler_returning_awaitable_is_awaited(self) -> None:
+        """Test that an awaitable returned by a plain callable is awaited."""
+        bus = EventBus()
+        received: list[str] = []
+
+        async def record(event: DomainEvent) -> None:
+            """Record the event."""
+            received.append(event.event_id)
+
+        bus.subscribe(StockAddedEvent, lambda event: record(event))
+        event = create_added_event()
+
+        assert await bus.publish(event) == 0
+        assert received == [event.event_id]
+
+    @pytest.mark.anyio
+    async def test_failing_handler_does_not_stop_delivery(self) -> None:
+        """Test that handler errors are counted and later handlers still run."""
+        bus = EventBus()
+        received: list[DomainEvent] = []
+
+        def on_fail(_event: DomainEvent) -> None:
+            """Fail to handle the event."""
+            msg = "handler failed"
+            raise RuntimeError(msg)
+
+        bus.subscribe(StockAddedEvent, on_fail)
+        bus.subscribe(StockAddedEvent, received.append)
+        event = create_added_event()
+
+        failures = await bus.publish(event)
+
+        assert failures == 1
+        assert received == [event]
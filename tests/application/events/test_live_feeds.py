@@ -0,0 +1,92 @@
+"""Tests for building live updates from domain results."""
+
+from decimal import Decimal
+
+import pytest
+
+from src.application.events import (
+    EventBus,
+    LiveUpdate,
+    LiveUpdateHub,
+    stock_change_update,
+    subscribe_stock_changes,
+    target_update,
+    valuation_update,
+)
+from src.domain.events import StockAddedEvent, StockUpdatedEvent
+from src.domain.services.target_evaluation_service import TargetTrigger
+from src.domain.value_objects import Money, PortfolioAllocation, PortfolioMetrics
+from src.domain.value_objects.stock_symbol import StockSymbol
+
+
+class TestLiveFeeds:
+    """Test suite for the live update builders."""
+
+    def test_stock_change_update_is_keyed_by_stock(self) -> None:
+        """Test that stock events become updates naming the change."""
+        event = StockUpdatedEvent(StockSymbol("AAPL"), "stock-1", ("grade",))
+
+        update = stock_change_update(event)
+
+        assert update == LiveUpdate(
+            "stock",
+            "stock-1",
+            {
+                "change": "StockUpdatedEvent",
+                "stock_symbol": "AAPL",
+                "stock_id": "stock-1",
+                "changed_fields": ["grade"],
+            },
+        )
+
+    def test_valuation_update_is_keyed_by_portfolio(self) -> None:
+        """Test that portfolio metrics become a valuation update."""
+        metrics = PortfolioMetrics(
+            total_value=Money(Decimal("1500.25")),
+            position_count=2,
+            position_allocations=[],
+            industry_allocation=PortfolioAllocation({}, Money(Decimal("1500.25"))),
+        )
+
+        update = valuation_update("portfolio-1", metrics)
+
+        assert update.key == "portfolio-1"
+        assert update.json == (
+            '{"portfolio_id":"portfolio-1","total_value":"1500.25",'
+            '"position_count":2}'
+        )
+
+    def test_target_update_is_keyed_by_target(self) -> None:
+        """Test that a target trigger becomes a target update."""
+        trigger = TargetTrigger("target-1", "stock-1", "hit", Money(Decimal("99.5")))
+
+        update = target_update(trigger)
+
+        assert (update.topic, update.key) == ("target", "target-1")
+        assert update.data == {
+            "target_id": "target-1",
+            "stock_id": "stock-1",
+            "status": "hit",
+            "price": "99.50",
+        }
+
+    @pytest.mark.anyio
+    async def test_stock_events_on_the_bus_reach_subscribers(self) -> None:
+        """Test that added and updated events are published to the hub."""
+        bus = EventBus()
+        hub = LiveUpdateHub()
+        subscribe_stock_changes(bus, hub)
+        subscription = hub.subscribe(["stock"])
+
+        _ = await bus.publish(
+            StockAddedEvent(StockSymbol("AAPL"), "Apple Inc.", "stock-1"),
+        )
+        _ = await bus.publish(
+            StockUpdatedEvent(StockSymbol("MSFT"), "stock-2", ("notes",)),
+        )
+
+        batch = await subscription.next_batch()
+        assert [(update.key, update.data["change"]) for update in batch] == [
+            ("stock-1", "StockAddedEvent"),
+            ("stock-2", "StockUpdatedEvent"),
+        ]
@@ -0,0 +1,121 @@
+"""Tests for the live update hub."""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.application.events import RESYNC, LiveUpdate, LiveUpdateHub
+
+
+def stock_update(key: str, version: int = 1) -> LiveUpdate:
+    """Helper to create a stock update."""
+    return LiveUpdate("stock", key, {"stock_id": key, "version": version})
+
+
+class TestLiveUpdate:
+    """Test suite for LiveUpdate."""
+
+    def test_json_is_compact_and_cached(self) -> None:
+        """Test that the data is encoded once and reused."""
+        update = stock_update("stock-1")
+
+        assert update.json == '{"stock_id":"stock-1","version":1}'
+        assert update.json is update.json
+
+
+class TestLiveUpdateHub:
+    """Test suite for LiveUpdateHub."""
+
+    def test_rejects_empty_buffer(self) -> None:
+        """Test that every client must be able to buffer an update."""
+        with pytest.raises(ValueError, match="max_pending must be at least 1"):
+            _ = LiveUpdateHub(max_pending=0)
+
+    @pytest.mark.anyio
+    async def test_publish_fans_out_to_topic_subscribers(self) -> None:
+        """Test that one update reaches every subscriber of its topic."""
+        hub = LiveUpdateHub()
+        first = hub.subscribe()
+        second = hub.subscribe(["stock"])
+        valuations = hub.subscribe(["valuation"])
+        update = stock_update("stock-1")
+
+        assert hub.publish(update) == 2
+
+        assert await first.next_batch() == [update]
+        assert await second.next_batch() == [update]
+        assert await valuations.next_batch(max_wait=0.01) == []
+
+    @pytest.mark.anyio
+    async def test_newer_update_replaces_pending_one(self) -> None:
+        """Test that rapid updates of one entity coalesce into the latest."""
+        hub = LiveUpdateHub()
+        subscription = hub.subscribe()
+
+        for version in range(1, 4):
+            _ = hub.publish(stock_update("stock-1", version))
+        _ = hub.publish(stock_update("stock-2"))
+
+        batch = await subscription.next_batch()
+
+        assert batch == [stock_update("stock-1", 3), stock_update("stock-2")]
+        assert subscription.coalesced == 2
+
+    @pytest.mark.anyio
+    async def test_slow_client_is_told_to_resync(self) -> None:
+        """Test that overflowing the buffer replaces the backlog with RESYNC."""
+        hub = LiveUpdateHub(max_pending=2)
+        subscription = hub.subscribe()
+
+        for key in ("stock-1", "stock-2", "stock-3"):
+            _ = hub.publish(stock_update(key))
+
+        assert await subscription.next_batch() == [RESYNC, stock_update("stock-3")]
+        assert subscription.resyncs == 1
+
+    @pytest.mark.anyio
+    async def test_publish_from_another_thread_wakes_reader(self) -> None:
+        """Test that producers outside the event loop wake waiting readers."""
+        hub = LiveUpdateHub()
+        subscription = hub.subscribe()
+        update = stock_update("stock-1")
+        reader = asyncio.create_task(subscription.next_batch())
+        await asyncio.sleep(0)
+
+        thread = threading.Thread(target=hub.publish, args=(update,))
+        thread.start()
+        thread.join()
+
+        assert await asyncio.wait_for(reader, timeout=1) == [update]
+
+    @pytest.mark.anyio
+    async def test_unsubscribe_stops_delivery(self) -> None:
+        """Test that a closed subscription receives nothing more."""
+        hub = LiveUpdateHub()
+        subscription = hub.subscribe()
+
+        hub.unsubscribe(subscription)
+
+        assert hub.publish(stock_update("stock-1")) == 0
+        subscription.offer(stock_update("stock-1"))
+        assert subscription.closed
+        assert hub.subscriber_count == 0
+        assert await subscription.next_batch() == []
+
+    @pytest.mark.anyio
+    async def test_close_ends_every_subscription(self) -> None:
+        """Test that closing the hub wakes and closes all readers."""
+        hub = LiveUpdateHub()
+        subscriptions = [hub.subscribe(), hub.subscribe()]
+        readers = [
+            asyncio.create_task(subscription.next_batch())
+            for subscription in subscriptions
+        ]
+        await asyncio.sleep(0)
+
+        hub.close()
+
+        assert await asyncio.wait_for(asyncio.gather(*readers), timeout=1) == [[], []]
+        assert all(subscription.closed for subscription in subscriptions)
+        assert hub.subscriber_count == 0
@@ -0,0 +1,73 @@
+"""Tests for EventSerializer and OutboxEventPublisher."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.events import EventSerializer, OutboxEventPublisher
+from src.domain.events import DomainEvent, StockAddedEvent, StockUpdatedEvent
+from src.domain.repositories.interfaces import IStockBookUnitOfWork
+from src.domain.value_objects.stock_symbol import StockSymbol
+
+
+class TestEventSerializer:
+    """Test suite for EventSerializer."""
+
+    def test_round_trip_restores_equal_events(self) -> None:
+        """Test that events survive serialization unchanged."""
+        serializer = EventSerializer()
+        events: list[DomainEvent] = [
+            StockAddedEvent(StockSymbol("AAPL"), "Apple Inc.", "stock-1"),
+            StockUpdatedEvent(StockSymbol("AAPL"), "stock-1", ("notes", "grade")),
+        ]
+
+        for event in events:
+            message = serializer.to_message(event)
+            restored = serializer.from_message(message)
+
+            assert message.event_type == type(event).__name__
+            assert json.loads(message.payload) == event.to_payload()
+            assert restored == event
+            assert repr(restored) == repr(event)
+
+    def test_unknown_event_type_is_rejected(self) -> None:
+        """Test that messages of unregistered types cannot be restored."""
+        message = EventSerializer().to_message(
+            StockAddedEvent(StockSymbol("AAPL"), "Apple Inc.", "stock-1"),
+        )
+
+        with pytest.raises(ValueError, match="Unknown event type 'StockAddedEvent'"):
+            _ = EventSerializer(event_types=()).from_message(message)
+
+    def test_register_rejects_name_clash(self) -> None:
+        """Test that two classes cannot share an event type name."""
+        serializer = EventSerializer()
+        serializer.register(StockAddedEvent)
+
+        clash = type("StockAddedEvent", (DomainEvent,), {})
+
+        with pytest.raises(ValueError, match="already registered"):
+            serializer.register(clash)
+
+
+class TestOutboxEventPublisher:
+    """Test suite for OutboxEventPublisher."""
+
+    def test_record_adds_messages_to_outbox(self) -> None:
+        """Test that events are written to the unit of work's outbox."""
+        unit_of_work = Mock(spec=IStockBookUnitOfWork)
+        event = StockAddedEvent(StockSymbol("AAPL"), "Apple Inc.", "stock-1")
+
+        OutboxEventPublisher().record(unit_of_work, [event])
+
+        (messages,) = unit_of_work.outbox.add.call_args.args
+        assert [message.event_id for message in messages] == [event.event_id]
+
+    def test_record_without_events_skips_outbox(self) -> None:
+        """Test that nothing is written when there are no events."""
+        unit_of_work = Mock(spec=IStockBookUnitOfWork)
+
+        OutboxEventPublisher().record(unit_of_work, [])
+
+        unit_of_work.outbox.add.assert_not_called()
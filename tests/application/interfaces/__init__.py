@@ -0,0 +1 @@
+"""Tests for application layer interfaces."""
@@ -0,0 +1,64 @@
+"""Tests for the holdings read model interface."""
+
+from decimal import Decimal
+
+import pytest
+
+from src.application.interfaces.holdings_query import (
+    HoldingRow,
+    IHoldingsQuery,
+    as_calculation_input,
+)
+from src.domain.services import PortfolioCalculationService
+from src.domain.value_objects import IndustryGroup, Money, Quantity, StockSymbol
+
+
+def create_holding(symbol: str, quantity: int, industry: str | None) -> HoldingRow:
+    """Helper to create a holding row."""
+    return HoldingRow(
+        portfolio_id="portfolio-1",
+        stock_id=f"stock-{symbol}",
+        symbol=StockSymbol(symbol),
+        industry_group=IndustryGroup(industry) if industry else None,
+        grade="A",
+        quantity=Quantity(quantity),
+        average_cost=Money("10"),
+    )
+
+
+class TestHoldingRow:
+    """Test holdings as input for portfolio calculations."""
+
+    def test_as_calculation_input_pairs_rows_with_quantities(self) -> None:
+        """Should keep row order and pair each row with its quantity."""
+        rows = [create_holding("AAPL", 2, None), create_holding("MSFT", 3, None)]
+
+        pairs = as_calculation_input(rows)
+
+        assert pairs == [(rows[0], Quantity(2)), (rows[1], Quantity(3))]
+
+    def test_rows_feed_the_calculation_service(self) -> None:
+        """Should value and allocate holdings without Stock entities."""
+        rows = [
+            create_holding("AAPL", 2, "Software"),
+            create_holding("MSFT", 3, None),
+        ]
+        prices = {"AAPL": Money("10"), "MSFT": Money("20")}
+        service = PortfolioCalculationService()
+
+        total = service.calculate_total_value(as_calculation_input(rows), prices)
+        industries = service.calculate_industry_allocations(
+            as_calculation_input(rows),
+            prices,
+        )
+
+        assert total == Money("80")
+        assert industries.allocations == {
+            "Software": Decimal(25),
+            "Unknown": Decimal(75),
+        }
+
+    def test_query_interface_is_abstract(self) -> None:
+        """Should not be instantiable without an implementation."""
+        with pytest.raises(TypeError):
+            _ = IHoldingsQuery()  # type: ignore[abstract]
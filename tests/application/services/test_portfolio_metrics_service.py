@@ -0,0 +1,207 @@
+"""
+Tests for PortfolioMetricsService.
+
+Verifies that metrics are served from the cache until the positions or
+price version of a portfolio moves on.
+"""
+
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.interfaces.holdings_query import HoldingRow, IHoldingsQuery
+from src.application.services.portfolio_metrics_service import (
+    PortfolioMetricsService,
+)
+from src.domain.services.exceptions import CalculationError
+from src.domain.value_objects import IndustryGroup, Money, Quantity, StockSymbol
+from src.shared.caching import VersionedCache
+
+
+def create_holding(symbol: str, quantity: int) -> HoldingRow:
+    """Helper to create a holding of portfolio-1 in the Software group."""
+    return HoldingRow(
+        portfolio_id="portfolio-1",
+        stock_id=f"stock-{symbol}",
+        symbol=StockSymbol(symbol),
+        industry_group=IndustryGroup("Software"),
+        grade="A",
+        quantity=Quantity(quantity),
+        average_cost=Money("10"),
+    )
+
+
+class TestPortfolioMetricsService:
+    """Test suite for PortfolioMetricsService."""
+
+    def setup_method(self) -> None:
+        """Set up test dependencies."""
+        self.mock_holdings_query = Mock(spec=IHoldingsQuery)
+        self.mock_holdings_query.get_holdings.return_value = [
+            create_holding("AAPL", 10),
+            create_holding("MSFT", 5),
+        ]
+        self.service = PortfolioMetricsService(
+            self.mock_holdings_query,
+            cache=VersionedCache(stale_while_revalidate=False),
+        )
+        _ = self.service.update_prices({"AAPL": Money("100"), "MSFT": Money("200")})
+
+    def test_get_metrics_calculates_from_holdings(self) -> None:
+        """Should compute metrics from the holdings read model."""
+        metrics = self.service.get_metrics("portfolio-1")
+
+        assert metrics.total_value == Money("2000")
+        assert metrics.position_count == 2
+        assert metrics.industry_allocation.allocations == {"Software": Decimal(100)}
+        self.mock_holdings_query.get_holdings.assert_called_once_with("portfolio-1")
+
+    def test_get_metrics_is_cached(self) -> None:
+        """Should load holdings once while no version changes."""
+        first = self.service.get_metrics("portfolio-1")
+
+        assert self.service.get_metrics("portfolio-1") is first
+        self.mock_holdings_query.get_holdings.assert_called_once()
+
+    def test_unchanged_prices_keep_cache(self) -> None:
+        """Should not invalidate anything for a batch of identical prices."""
+        first = self.service.get_metrics("portfolio-1")
+
+        assert not self.service.update_prices({"AAPL": Money("100")})
+        assert self.service.get_metrics("portfolio-1") is first
+
+    def test_price_change_recomputes(self) -> None:
+        """Should recompute with the merged price snapshot."""
+        _ = self.service.get_metrics("portfolio-1")
+
+        assert self.service.update_prices({"AAPL": Money("150")})
+
+        assert self.service.get_metrics("portfolio-1").total_value == Money("2500")
+
+    def test_positions_changed_recomputes_that_portfolio(self) -> None:
+        """Should reload holdings only for the portfolio that was written."""
+        _ = self.service.get_metrics("portfolio-1")
+        _ = self.service.get_metrics("portfolio-2")
+        self.mock_holdings_query.get_holdings.reset_mock()
+
+        self.service.positions_changed("portfolio-1")
+        _ = self.service.get_metrics("portfolio-1")
+        _ = self.service.get_metrics("portfolio-2")
+
+        self.mock_holdings_query.get_holdings.assert_called_once_with("portfolio-1")
+
+    def test_missing_price_raises_error(self) -> None:
+        """Should surface missing prices instead of caching a result."""
+        self.mock_holdings_query.get_holdings.return_value = [
+            create_holding("NVDA", 1),
+        ]
+
+        with pytest.raises(CalculationError):
+            _ = self.service.get_metrics("portfolio-1")
+
+    def test_default_cache_serves_stale_metrics_while_refreshing(self) -> None:
+        """Should answer from the outdated entry and refresh in the background."""
+        service = PortfolioMetricsService(self.mock_holdings_query)
+        _ = service.update_prices({"AAPL": Money("100"), "MSFT": Money("200")})
+        first = service.get_metrics("portfolio-1")
+        _ = service.update_prices({"AAPL": Money("150")})
+
+        assert service.get_metrics("portfolio-1") is first
+        service.cache.close()
+
+        assert service.get_metrics("portfolio-1").total_value == Money("2500")
+        assert service.cache.cache_info().stale_hits == 1
+
+
+class TestPortfolioMetricsServiceIncrementalUpdates:
+    """Test that trades and price ticks avoid reloading holdings."""
+
+    def setup_method(self) -> None:
+        """Set up a service that has already read portfolio-1."""
+        self.mock_holdings_query = Mock(spec=IHoldingsQuery)
+        self.mock_holdings_query.get_holdings.return_value = [
+            create_holding("AAPL", 10),
+            create_holding("MSFT", 5),
+        ]
+        self.service = PortfolioMetricsService(
+            self.mock_holdings_query,
+            cache=VersionedCache(maxsize=2, stale_while_revalidate=False),
+        )
+        _ = self.service.update_prices({"AAPL": Money("100"), "MSFT": Money("200")})
+        _ = self.service.get_metrics("portfolio-1")
+        self.mock_holdings_query.get_holdings.reset_mock()
+
+    def test_price_tick_updates_without_reload(self) -> None:
+        """Should revalue tracked portfolios in place."""
+        _ = self.service.update_prices({"MSFT": Money("300")})
+
+        assert self.service.get_metrics("portfolio-1").total_value == Money("2500")
+        self.mock_holdings_query.get_holdings.assert_not_called()
+
+    def test_record_trade_updates_without_reload(self) -> None:
+        """Should apply a trade to the running totals."""
+        holding = create_holding("AAPL", 20)
+
+        self.service.record_trade("portfolio-1", holding, holding.quantity)
+
+        assert self.service.get_metrics("portfolio-1").total_value == Money("3000")
+        self.mock_holdings_query.get_holdings.assert_not_called()
+
+    def test_record_trade_with_zero_quantity_closes_position(self) -> None:
+        """Should drop a closed position from the metrics."""
+        holding = create_holding("MSFT", 0)
+
+        self.service.record_trade("portfolio-1", holding, holding.quantity)
+
+        metrics = self.service.get_metrics("portfolio-1")
+        assert metrics.position_count == 1
+        assert metrics.total_value == Money("1000")
+
+    def test_record_trade_for_unpriced_stock_reloads(self) -> None:
+        """Should fall back to a reload that reports the missing price."""
+        holding = create_holding("NVDA", 1)
+        self.mock_holdings_query.get_holdings.return_value = [holding]
+
+        self.service.record_trade("portfolio-1", holding, holding.quantity)
+
+        with pytest.raises(CalculationError):
+            _ = self.service.get_metrics("portfolio-1")
+
+    def test_record_trade_for_untracked_portfolio_invalidates(self) -> None:
+        """Should load holdings on the next read of an untracked portfolio."""
+        holding = create_holding("AAPL", 1)
+
+        self.service.record_trade("portfolio-2", holding, holding.quantity)
+        _ = self.service.get_metrics("portfolio-2")
+
+        self.mock_holdings_query.get_holdings.assert_called_once_with("portfolio-2")
+
+    def test_write_during_load_is_not_tracked(self) -> None:
+        """Should not keep running totals built from outdated holdings."""
+        holdings = [create_holding("AAPL", 1)]
+
+        def load_while_writing(portfolio_id: str) -> list[HoldingRow]:
+            self.service.positions_changed(portfolio_id)
+            return holdings
+
+        self.mock_holdings_query.get_holdings.side_effect = load_while_writing
+        _ = self.service.get_metrics("portfolio-2")
+        self.mock_holdings_query.get_holdings.side_effect = None
+        self.mock_holdings_query.get_holdings.return_value = holdings
+
+        _ = self.service.get_metrics("portfolio-2")
+
+        assert self.mock_holdings_query.get_holdings.call_count == 2
+
+    def test_tracks_at_most_cache_size_portfolios(self) -> None:
+        """Should forget the least recently computed running totals."""
+        _ = self.service.get_metrics("portfolio-2")
+        _ = self.service.get_metrics("portfolio-3")
+        self.mock_holdings_query.get_holdings.reset_mock()
+        _ = self.service.update_prices({"AAPL": Money("101")})
+
+        _ = self.service.get_metrics("portfolio-1")
+        _ = self.service.get_metrics("portfolio-3")
+
+        self.mock_holdings_query.get_holdings.assert_called_once_with("portfolio-1")
@@ -16,18 +16,33 @@ from src.application.commands.stock import (
     UpdateStockInputs,
 )
 from src.application.dto.stock_dto import StockDto
+from src.application.events import EventSerializer
 from src.application.services.stock_application_service import StockApplicationService
 from src.domain.entities.stock import Stock
+from src.domain.events import DomainEvent, StockAddedEvent, StockUpdatedEvent
+from src.domain.exceptions import ConcurrencyConflictError
 from src.domain.exceptions.stock import (
     StockAlreadyExistsError,
     StockNotFoundError,
 )
 from src.domain.repositories.interfaces import IStockBookUnitOfWork, IStockRepository
-from src.domain.value_objects import CompanyName, Grade, IndustryGroup, Notes
+from src.domain.value_objects import (
+    CompanyName,
+    Grade,
+    IndustryGroup,
+    Notes,
+    StockQuerySpec,
+    StockSortKey,
+)
 from src.domain.value_objects.sector import Sector
 from src.domain.value_objects.stock_symbol import StockSymbol
 
 
+def _updated_stock(_stock_id: str, stock: Stock) -> Stock:
+    """Return the stock passed to update_and_get, as if stored unchanged."""
+    return stock
+
+
 class TestStockApplicationService:
     """Test suite for StockApplicationService."""
 
@@ -41,8 +56,20 @@ class TestStockApplicationService:
         self.mock_unit_of_work.__enter__ = Mock(return_value=self.mock_unit_of_work)
         self.mock_unit_of_work.__exit__ = Mock(return_value=None)
 
+        # Updates return the stock as stored
+        self.mock_stock_repository.update_and_get.side_effect = _updated_stock
+
         self.service = StockApplicationService(self.mock_unit_of_work)
 
+    def _recorded_events(self) -> list[DomainEvent]:
+        """Decode the events written to the outbox."""
+        serializer = EventSerializer()
+        return [
+            serializer.from_message(message)
+            for call in self.mock_unit_of_work.outbox.add.call_args_list
+            for message in call.args[0]
+        ]
+
     def test_create_stock_with_valid_command(self) -> None:
         """Should create stock successfully with valid command."""
         # Arrange
@@ -74,8 +101,8 @@ class TestStockApplicationService:
         assert result.grade == "A"
         assert result.notes == "Great company"
 
-        # Verify repository interactions
-        self.mock_stock_repository.get_by_symbol.assert_called_once()
+        # Verify repository interactions; the insert alone detects duplicates
+        self.mock_stock_repository.get_by_symbol.assert_not_called()
         self.mock_stock_repository.create.assert_called_once()
         self.mock_unit_of_work.commit.assert_called_once()
 
@@ -86,6 +113,15 @@ class TestStockApplicationService:
         assert create_call.company_name is not None
         assert create_call.company_name.value == "Apple Inc."
 
+        # Verify the event was recorded in the transaction
+        (event,) = self._recorded_events()
+        assert isinstance(event, StockAddedEvent)
+        assert event.stock_id == result.id
+        assert event.stock_name == "Apple Inc."
+
+        # Reads made from now on see a new data version
+        assert self.service.data_version == 1
+
     def test_create_stock_without_company_name(self) -> None:
         """Should create stock successfully without company name."""
         # Arrange
@@ -116,29 +152,30 @@ class TestStockApplicationService:
         assert str(create_call.symbol) == "TSLA"
         assert create_call.company_name is None
 
+        # The event falls back to the symbol for the name
+        (event,) = self._recorded_events()
+        assert isinstance(event, StockAddedEvent)
+        assert event.stock_name == "TSLA"
+
     def test_create_stock_with_duplicate_symbol_raises_error(self) -> None:
         """Should raise error when trying to create stock with existing symbol."""
         # Arrange
         inputs = CreateStockInputs(symbol="AAPL", name="Apple Inc.")
         command = CreateStockCommand(inputs)
 
-        # Mock repository to return existing stock
-        existing_stock = (
-            Stock.Builder()
-            .with_symbol(StockSymbol("AAPL"))
-            .with_company_name(CompanyName("Existing Apple Inc."))
-            .with_id("stock-id-456")
-            .build()
+        # Mock the unique symbol constraint rejecting the insert
+        self.mock_stock_repository.create.side_effect = StockAlreadyExistsError(
+            symbol="AAPL",
         )
-        self.mock_stock_repository.get_by_symbol.return_value = existing_stock
 
         # Act & Assert
         with pytest.raises(StockAlreadyExistsError):
             _ = self.service.create_stock(command)
 
-        # Verify no creation was attempted
-        self.mock_stock_repository.create.assert_not_called()
+        # Verify nothing was committed
         self.mock_unit_of_work.commit.assert_not_called()
+        self.mock_unit_of_work.rollback.assert_called_once()
+        assert self.service.data_version == 0
 
     def test_create_stock_handles_repository_error(self) -> None:
         """Should handle repository errors gracefully."""
@@ -327,6 +364,27 @@ class TestStockApplicationService:
             industry_filter=industry_filter,
         )
 
+    def test_find_stocks_passes_spec_to_repository(self) -> None:
+        """Should list the stocks matching a spec as DTOs, in repository order."""
+        # Arrange
+        spec = StockQuerySpec(grade="A", sort=(StockSortKey("name"),))
+        mock_entities = [
+            Stock.Builder()
+            .with_id("stock-1")
+            .with_symbol(StockSymbol("AAPL"))
+            .with_company_name(CompanyName("Apple Inc."))
+            .with_grade(Grade("A"))
+            .build(),
+        ]
+        self.mock_stock_repository.find_stocks.return_value = mock_entities
+
+        # Act
+        result = self.service.find_stocks(spec)
+
+        # Assert
+        assert [dto.symbol for dto in result] == ["AAPL"]
+        self.mock_stock_repository.find_stocks.assert_called_once_with(spec)
+
     def test_search_stocks_no_filters(self) -> None:
         """Should search stocks without any filters."""
         # Arrange
@@ -411,7 +469,6 @@ class TestStockApplicationService:
 
         # Mock repository responses
         self.mock_stock_repository.get_by_id.return_value = existing_stock
-        self.mock_stock_repository.update.return_value = True
 
         # Act
         result = self.service.update_stock(command)
@@ -427,9 +484,22 @@ class TestStockApplicationService:
 
         # Verify repository interactions
         self.mock_stock_repository.get_by_id.assert_called_once_with("stock-1")
-        self.mock_stock_repository.update.assert_called_once()
+        self.mock_stock_repository.update_and_get.assert_called_once()
         self.mock_unit_of_work.commit.assert_called_once()
 
+        # Verify the event was recorded in the transaction
+        (event,) = self._recorded_events()
+        assert isinstance(event, StockUpdatedEvent)
+        assert event.stock_id == "stock-1"
+        assert event.changed_fields == (
+            "grade",
+            "industry_group",
+            "name",
+            "notes",
+            "sector",
+        )
+        assert self.service.data_version == 1
+
     def test_update_stock_with_partial_command(self) -> None:
         """Should update only specified fields."""
         # Arrange
@@ -453,7 +523,6 @@ class TestStockApplicationService:
 
         # Mock repository responses
         self.mock_stock_repository.get_by_id.return_value = existing_stock
-        self.mock_stock_repository.update.return_value = True
 
         # Act
         result = self.service.update_stock(command)
@@ -491,8 +560,28 @@ class TestStockApplicationService:
         with pytest.raises(ValueError, match="No fields to update"):
             _ = self.service.update_stock(command)
 
+    def test_update_stock_based_on_stale_version_raises_conflict(self) -> None:
+        """Should refuse an update based on a version the stock moved past."""
+        existing_stock = (
+            Stock.Builder()
+            .with_id("stock-1")
+            .with_symbol(StockSymbol("AAPL"))
+            .with_version(3)
+            .build()
+        )
+        self.mock_stock_repository.get_by_id.return_value = existing_stock
+        command = UpdateStockCommand(
+            UpdateStockInputs(stock_id="stock-1", grade="A", expected_version=2),
+        )
+
+        with pytest.raises(ConcurrencyConflictError):
+            _ = self.service.update_stock(command)
+
+        self.mock_stock_repository.update_and_get.assert_not_called()
+        self.mock_unit_of_work.rollback.assert_called_once()
+
     def test_update_stock_with_repository_failure_raises_error(self) -> None:
-        """Should handle repository update failure."""
+        """Should raise not found when the stock is gone at update time."""
         # Arrange
         inputs = UpdateStockInputs(stock_id="stock-1", grade="A")
         command = UpdateStockCommand(inputs)
@@ -507,10 +596,12 @@ class TestStockApplicationService:
         )
 
         self.mock_stock_repository.get_by_id.return_value = existing_stock
-        self.mock_stock_repository.update.return_value = False  # Simulate failure
+        # Simulate the stock being deleted before the update
+        self.mock_stock_repository.update_and_get.side_effect = None
+        self.mock_stock_repository.update_and_get.return_value = None
 
         # Act & Assert
-        with pytest.raises(ValueError, match="Failed to update stock"):
+        with pytest.raises(StockNotFoundError):
             _ = self.service.update_stock(command)
 
         # Verify rollback was called
@@ -532,7 +623,9 @@ class TestStockApplicationService:
         )
 
         self.mock_stock_repository.get_by_id.return_value = existing_stock
-        self.mock_stock_repository.update.side_effect = Exception("Database error")
+        self.mock_stock_repository.update_and_get.side_effect = Exception(
+            "Database error",
+        )
 
         # Act & Assert
         with pytest.raises(Exception, match="Database error"):
@@ -556,16 +649,10 @@ class TestStockApplicationService:
         )
 
         # Another stock with the target symbol already exists
-        another_stock = (
-            Stock.Builder()
-            .with_id("stock-2")
-            .with_symbol(StockSymbol("MSFT"))
-            .with_company_name(CompanyName("Microsoft Corporation"))
-            .build()
-        )
-
         self.mock_stock_repository.get_by_id.return_value = existing_stock
-        self.mock_stock_repository.get_by_symbol.return_value = another_stock
+        self.mock_stock_repository.update_and_get.side_effect = StockAlreadyExistsError(
+            symbol="MSFT",
+        )
 
         # Act & Assert
         with pytest.raises(StockAlreadyExistsError):
@@ -590,7 +677,6 @@ class TestStockApplicationService:
         )
 
         self.mock_stock_repository.get_by_id.return_value = existing_stock
-        self.mock_stock_repository.update.return_value = True
 
         # Act
         result = self.service.update_stock(command)
@@ -618,10 +704,6 @@ class TestStockApplicationService:
         )
 
         self.mock_stock_repository.get_by_id.return_value = existing_stock
-        self.mock_stock_repository.get_by_symbol.return_value = (
-            None  # No existing stock with new symbol
-        )
-        self.mock_stock_repository.update.return_value = True
 
         # Act
         result = self.service.update_stock(command)
@@ -630,8 +712,8 @@ class TestStockApplicationService:
         assert result.id == "stock-1"
         assert result.symbol == "APLE"
 
-        # Verify symbol check was performed
-        self.mock_stock_repository.get_by_symbol.assert_called_once()
+        # The unique constraint checks the symbol; no lookup is needed
+        self.mock_stock_repository.get_by_symbol.assert_not_called()
 
     def test_create_stock_with_value_object_creation_error(self) -> None:
         """Should handle errors during value object creation."""
@@ -685,7 +767,6 @@ class TestStockApplicationService:
         )
 
         self.mock_stock_repository.get_by_id.return_value = stock_entity
-        self.mock_stock_repository.update.return_value = True
 
         # Act
         result = self.service.update_stock(command)
@@ -730,20 +811,19 @@ class TestStockApplicationService:
         )
 
         self.mock_stock_repository.get_by_id.return_value = stock_entity
-        self.mock_stock_repository.update.return_value = True
 
         # Act
         result = self.service.update_stock(command)
 
         # Assert
         assert result.name == "Updated Apple Inc."
-        self.mock_stock_repository.update.assert_called_once_with(
+        self.mock_stock_repository.update_and_get.assert_called_once_with(
             "stock-1",
             stock_entity,
         )
 
     def test_update_stock_raises_when_repository_update_fails(self) -> None:
-        """Should raise error when repository update fails through update_stock."""
+        """Should raise not found when the update matches no row."""
         # Arrange
         inputs = UpdateStockInputs(stock_id="stock-1", name="Updated Apple Inc.")
         command = UpdateStockCommand(inputs)
@@ -756,10 +836,12 @@ class TestStockApplicationService:
         )
 
         self.mock_stock_repository.get_by_id.return_value = stock_entity
-        self.mock_stock_repository.update.return_value = False  # Simulate failure
+        # Simulate the stock being deleted before the update
+        self.mock_stock_repository.update_and_get.side_effect = None
+        self.mock_stock_repository.update_and_get.return_value = None
 
         # Act & Assert
-        with pytest.raises(ValueError, match="Failed to update stock"):
+        with pytest.raises(StockNotFoundError):
             _ = self.service.update_stock(command)
 
     def test_get_stock_by_symbol_with_invalid_symbol_format(self) -> None:
@@ -837,7 +919,6 @@ class TestStockApplicationService:
         )
 
         self.mock_stock_repository.get_by_id.return_value = stock_entity
-        self.mock_stock_repository.update.return_value = True
 
         # Mock the update_fields method on the entity
         stock_entity.update_fields = Mock()
@@ -0,0 +1,95 @@
+"""
+Tests for TargetMonitoringService.
+
+Verifies that price batches are evaluated against the cached target index
+and that status changes are persisted with one bulk update per batch.
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.services.target_monitoring_service import (
+    TargetMonitoringService,
+)
+from src.domain.entities.target import Target
+from src.domain.repositories.interfaces import IStockBookUnitOfWork, ITargetRepository
+from src.domain.value_objects import Money, TargetStatus
+
+
+def create_target(target_id: str, stock_id: str = "stock-1") -> Target:
+    """Helper to create an active target with a 110 pivot and 90 failure."""
+    return (
+        Target.Builder()
+        .with_id(target_id)
+        .with_portfolio_id("portfolio-1")
+        .with_stock_id(stock_id)
+        .with_pivot_price(Money("110"))
+        .with_failure_price(Money("90"))
+        .with_status(TargetStatus("active"))
+        .with_created_date(datetime(2024, 1, 1, tzinfo=UTC))
+        .build()
+    )
+
+
+class TestTargetMonitoringService:
+    """Test suite for TargetMonitoringService."""
+
+    def setup_method(self) -> None:
+        """Set up test dependencies."""
+        self.mock_target_repository = Mock(spec=ITargetRepository)
+        self.mock_target_repository.get_all_active.return_value = [
+            create_target("t1", "stock-1"),
+            create_target("t2", "stock-2"),
+        ]
+        self.mock_unit_of_work = Mock(spec=IStockBookUnitOfWork)
+        self.mock_unit_of_work.targets = self.mock_target_repository
+
+        # Make unit of work support context manager protocol
+        self.mock_unit_of_work.__enter__ = Mock(return_value=self.mock_unit_of_work)
+        self.mock_unit_of_work.__exit__ = Mock(return_value=None)
+
+        self.service = TargetMonitoringService(self.mock_unit_of_work)
+
+    def test_reload_counts_active_targets(self) -> None:
+        """Should load every active target into the index."""
+        assert self.service.reload() == 2
+        self.mock_target_repository.get_all_active.assert_called_once()
+
+    def test_process_prices_persists_with_single_bulk_update(self) -> None:
+        """Should write all status changes in one bulk update and commit."""
+        triggers = self.service.process_prices(
+            {"stock-1": Money("111"), "stock-2": Money("89")},
+        )
+
+        assert {(t.target_id, t.status) for t in triggers} == {
+            ("t1", "hit"),
+            ("t2", "failed"),
+        }
+        self.mock_target_repository.bulk_update_status.assert_called_once_with(
+            {"t1": "hit", "t2": "failed"},
+        )
+        self.mock_target_repository.update_status.assert_not_called()
+        self.mock_unit_of_work.commit.assert_called_once()
+
+    def test_process_prices_reuses_index(self) -> None:
+        """Should load targets once and skip writes when nothing crosses."""
+        assert self.service.process_prices({"stock-1": Money("100")}) == []
+        assert self.service.process_prices({"stock-2": Money("100")}) == []
+
+        self.mock_target_repository.get_all_active.assert_called_once()
+        self.mock_target_repository.bulk_update_status.assert_not_called()
+
+    def test_failed_persist_forces_reload(self) -> None:
+        """Should drop the index when persisting fails so it is reloaded."""
+        self.mock_target_repository.bulk_update_status.side_effect = RuntimeError(
+            "database is locked",
+        )
+
+        with pytest.raises(RuntimeError, match="database is locked"):
+            _ = self.service.process_prices({"stock-1": Money("120")})
+
+        self.mock_target_repository.bulk_update_status.side_effect = None
+        _ = self.service.process_prices({"stock-1": Money("100")})
+        assert self.mock_target_repository.get_all_active.call_count == 2
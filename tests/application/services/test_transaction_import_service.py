@@ -0,0 +1,326 @@
+"""
+Tests for TransactionImportService.
+
+Verifies that broker records flow through normalization, stock creation,
+deduplication and chunked inserts, with progress reported per chunk.
+"""
+
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.interfaces.transaction_import import (
+    ITransactionSource,
+    RawTransaction,
+    RejectedRow,
+)
+from src.application.services.transaction_import_service import (
+    ImportProgress,
+    NormalizedTransaction,
+    TransactionImportService,
+    chunked,
+    normalize,
+)
+from src.domain.entities.stock import Stock
+from src.domain.entities.transaction import Transaction
+from src.domain.repositories.interfaces import (
+    IStockBookUnitOfWork,
+    IStockRepository,
+    ITransactionRepository,
+)
+from src.domain.value_objects import Quantity, StockSymbol
+from src.shared.caching import TableVersions
+
+
+def raw(
+    offset: int,
+    symbol: str = "AAPL",
+    *,
+    transaction_type: str = "buy",
+    quantity: str = "10",
+    price: str = "100",
+    transaction_date: str = "2024-01-15",
+    occurrence: int = 1,
+) -> RawTransaction:
+    """Helper to create a raw record spanning ten bytes."""
+    return RawTransaction(
+        offset=offset,
+        end_offset=offset + 10,
+        symbol=symbol,
+        transaction_type=transaction_type,
+        quantity=quantity,
+        price=price,
+        transaction_date=transaction_date,
+        occurrence=occurrence,
+    )
+
+
+class ListSource(ITransactionSource):
+    """Transaction source over records in memory."""
+
+    def __init__(self, records: list[RawTransaction | RejectedRow]) -> None:
+        """Initialize with the records to read."""
+        self.records = records
+
+    def read(self, start_offset: int = 0) -> Iterator[RawTransaction | RejectedRow]:
+        """Yield records starting at or after the offset."""
+        return (record for record in self.records if record.offset >= start_offset)
+
+
+class TestNormalize:
+    """Test validation of raw records."""
+
+    def test_converts_fields_to_value_objects(self) -> None:
+        """Should parse broker numbers and default naive dates to UTC."""
+        record = next(
+            normalize([raw(0, price="$1,150.50", quantity="5", occurrence=2)]),
+        )
+
+        assert isinstance(record, NormalizedTransaction)
+        assert (record.offset, record.end_offset) == (0, 10)
+        assert record.symbol == StockSymbol("AAPL")
+        assert record.transaction_type.is_buy()
+        assert record.quantity == Quantity(5)
+        assert record.price.value == Decimal("1150.50")
+        assert record.transaction_date == datetime(2024, 1, 15, tzinfo=UTC)
+        assert record.occurrence == 2
+
+    def test_keeps_sell_sign_and_date_offsets(self) -> None:
+        """Should accept signed sells and keep explicit time zones."""
+        record = next(
+            normalize(
+                [
+                    raw(
+                        0,
+                        transaction_type="sell",
+                        quantity="-3",
+                        transaction_date="2024-01-15T10:00:00-05:00",
+                    ),
+                ],
+            ),
+        )
+
+        assert isinstance(record, NormalizedTransaction)
+        assert record.quantity == Quantity(3)
+        assert record.transaction_date.utcoffset() == timedelta(hours=-5)
+        assert record.transaction_date == datetime(
+            2024,
+            1,
+            15,
+            10,
+            tzinfo=timezone(timedelta(hours=-5)),
+        )
+
+    @pytest.mark.parametrize(
+        ("record", "reason"),
+        [
+            (raw(0, symbol="apple inc"), "symbol"),
+            (raw(0, transaction_type="hold"), "transaction type"),
+            (raw(0, quantity="-1"), "negative"),
+            (raw(0, quantity="0"), "Quantity must be positive"),
+            (raw(0, quantity="ten"), "Invalid quantity"),
+            (raw(0, price="NaN"), "Invalid price"),
+            (raw(0, price="-1"), "negative"),
+            (raw(0, transaction_date="15 Jan"), "Invalid transaction date"),
+        ],
+    )
+    def test_rejects_invalid_records(self, record: RawTransaction, reason: str) -> None:
+        """Should turn validation errors into rejections."""
+        rejection = next(normalize([record]))
+
+        assert isinstance(rejection, RejectedRow)
+        assert (rejection.offset, rejection.end_offset) == (0, 10)
+        assert reason.lower() in rejection.reason.lower()
+
+    def test_passes_source_rejections_through(self) -> None:
+        """Should keep rejections from the parser in order."""
+        rejection = RejectedRow(0, 5, "Unreadable")
+
+        assert list(normalize([rejection])) == [rejection]
+
+
+class TestChunked:
+    """Test grouping records into chunks."""
+
+    def test_groups_records(self) -> None:
+        """Should fill chunks in order and keep the remainder."""
+        assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+        empty: list[int] = []
+        assert list(chunked(empty, 2)) == []
+
+    def test_rejects_empty_chunks(self) -> None:
+        """Should refuse chunk sizes below one."""
+        with pytest.raises(ValueError, match="at least 1"):
+            _ = list(chunked([1], 0))
+
+
+class TestTransactionImportService:
+    """Test suite for TransactionImportService."""
+
+    def setup_method(self) -> None:
+        """Set up test dependencies."""
+        self.mock_stock_repository = Mock(spec=IStockRepository)
+        self.mock_stock_repository.get_many_by_symbols.return_value = {}
+        self.mock_transaction_repository = Mock(spec=ITransactionRepository)
+        self.mock_transaction_repository.count_stored.return_value = {}
+        self.mock_unit_of_work = Mock(spec=IStockBookUnitOfWork)
+        self.mock_unit_of_work.stocks = self.mock_stock_repository
+        self.mock_unit_of_work.transactions = self.mock_transaction_repository
+        self.mock_unit_of_work.__enter__ = Mock(return_value=self.mock_unit_of_work)
+        self.mock_unit_of_work.__exit__ = Mock(return_value=None)
+
+        self.service = TransactionImportService(self.mock_unit_of_work)
+
+    def _inserted(self) -> list[Transaction]:
+        """Get every transaction passed to create_many."""
+        return [
+            transaction
+            for call in self.mock_transaction_repository.create_many.call_args_list
+            for transaction in call.args[0]
+        ]
+
+    def test_imports_in_chunks_with_progress(self) -> None:
+        """Should commit each chunk and report a checkpoint after it."""
+        existing = (
+            Stock.Builder()
+            .with_id("stock-aapl")
+            .with_symbol(StockSymbol("AAPL"))
+            .build()
+        )
+        self.mock_stock_repository.get_many_by_symbols.return_value = {
+            "AAPL": existing,
+        }
+        source = ListSource([raw(0), raw(10, "MSFT"), raw(20, quantity="2")])
+        progress: list[ImportProgress] = []
+
+        service = TransactionImportService(self.mock_unit_of_work, chunk_size=2)
+
+        result = service.import_transactions(
+            source,
+            "portfolio-1",
+            on_progress=progress.append,
+        )
+
+        assert [p.checkpoint for p in progress] == [20, 30]
+        assert result == ImportProgress(
+            read=3,
+            imported=3,
+            stocks_created=1,
+            checkpoint=30,
+        )
+        assert self.mock_unit_of_work.commit.call_count == 2
+        created = self.mock_stock_repository.create_many.call_args_list[0].args[0]
+        assert [stock.symbol.value for stock in created] == ["MSFT"]
+        inserted = self._inserted()
+        assert [t.stock_id for t in inserted] == [
+            "stock-aapl",
+            created[0].id,
+            "stock-aapl",
+        ]
+        assert {t.portfolio_id for t in inserted} == {"portfolio-1"}
+
+    def test_chunks_creating_stocks_advance_the_stocks_version(self) -> None:
+        """Should invalidate cached stock reads after stocks were created."""
+        versions = TableVersions()
+        service = TransactionImportService(
+            self.mock_unit_of_work,
+            chunk_size=1,
+            table_versions=versions,
+        )
+        existing = Stock.Builder().with_symbol(StockSymbol("AAPL")).build()
+        self.mock_stock_repository.get_many_by_symbols.side_effect = [
+            {},
+            {"AAPL": existing},
+        ]
+
+        _ = service.import_transactions(ListSource([raw(0), raw(10)]), "p")
+
+        assert versions["stocks"].current == 1
+
+    def test_skips_duplicates(self) -> None:
+        """Should drop records read twice within a chunk and stored fills."""
+
+        def stored(transactions: list[Transaction]) -> dict[str, int]:
+            return {t.id: int(t.quantity == Quantity(2)) for t in transactions}
+
+        self.mock_transaction_repository.count_stored.side_effect = stored
+        source = ListSource([raw(0), raw(10), raw(20, quantity="2")])
+
+        result = self.service.import_transactions(source, "portfolio-1")
+
+        assert (result.imported, result.duplicates) == (1, 2)
+        assert [t.quantity for t in self._inserted()] == [Quantity(10)]
+
+    def test_imports_identical_fills_not_yet_stored(self) -> None:
+        """Should import the n-th identical fill unless n are stored."""
+
+        def stored(transactions: list[Transaction]) -> dict[str, int]:
+            return dict.fromkeys((t.id for t in transactions), 1)
+
+        self.mock_transaction_repository.count_stored.side_effect = stored
+        source = ListSource([raw(0), raw(10, occurrence=2), raw(20, occurrence=3)])
+
+        result = self.service.import_transactions(source, "portfolio-1")
+
+        assert (result.imported, result.duplicates) == (2, 1)
+        assert len({t.id for t in self._inserted()}) == 2
+
+    def test_reports_rejections(self) -> None:
+        """Should count every rejection and keep a bounded sample."""
+        rejected: list[RejectedRow] = []
+        source = ListSource(
+            [RejectedRow(0, 10, "Unreadable"), raw(10, price="free")],
+        )
+
+        result = self.service.import_transactions(
+            source,
+            "portfolio-1",
+            on_rejected=rejected.append,
+        )
+
+        assert result.rejected == 2
+        assert result.imported == 0
+        assert result.checkpoint == 20
+        assert result.rejections == tuple(rejected)
+        assert rejected[1].reason == "Invalid price: 'free'"
+        self.mock_unit_of_work.commit.assert_not_called()
+
+    def test_rejects_empty_chunks(self) -> None:
+        """Should refuse chunk sizes below one."""
+        with pytest.raises(ValueError, match="at least 1"):
+            _ = TransactionImportService(self.mock_unit_of_work, chunk_size=0)
+
+    def test_rejection_sample_is_bounded(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Should stop keeping rejections once the sample is full."""
+        monkeypatch.setattr(
+            "src.application.services.transaction_import_service."
+            + "MAX_REPORTED_REJECTIONS",
+            1,
+        )
+        source = ListSource([RejectedRow(i * 10, i * 10 + 10, "Bad") for i in range(3)])
+
+        result = self.service.import_transactions(source, "portfolio-1")
+
+        assert result.rejected == 3
+        assert len(result.rejections) == 1
+
+    def test_resumes_from_checkpoint(self) -> None:
+        """Should read the source from the checkpoint onwards."""
+        source = ListSource([raw(0), raw(10, "MSFT")])
+
+        result = self.service.import_transactions(
+            source,
+            "portfolio-1",
+            start_offset=10,
+        )
+
+        assert result.read == 1
+        assert result.checkpoint == 20
+        empty = self.service.import_transactions(ListSource([]), "p", start_offset=7)
+        assert empty == ImportProgress(checkpoint=7)
@@ -0,0 +1,33 @@
+"""Tests for the ID strategy size report."""
+
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+
+import io
+
+from benchmarks.bench_identifiers import STRATEGIES, index_bytes, main, seeded_engine
+
+
+class TestIndexBytes:
+    """Test suite for measuring table and index sizes."""
+
+    def test_reports_table_and_indexes(self) -> None:
+        """Test that the table and both reference indexes are measured."""
+        with seeded_engine("uuid7_binary", 10).connect() as connection:
+            sizes = index_bytes(connection)
+
+        assert set(sizes) >= {
+            "transactions",
+            "idx_transactions_portfolio",
+            "idx_transactions_stock",
+        }
+        assert all(size > 0 for size in sizes.values())
+
+    def test_main_reports_every_strategy(self) -> None:
+        """Test the command line report."""
+        out = io.StringIO()
+
+        main(["--rows", "10"], out)
+
+        report = out.getvalue()
+        assert all(f"{strategy} (10 rows)" in report for strategy in STRATEGIES)
+        assert "MiB" in report
@@ -0,0 +1,139 @@
+"""Tests for benchmark timing, storage and comparison."""
+
+import json
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+
+from benchmarks.harness import (
+    Benchmark,
+    BenchmarkResult,
+    compare_results,
+    load_results,
+    measure,
+    run_benchmark,
+    save_results,
+)
+
+
+def create_result(name: str, median: float) -> BenchmarkResult:
+    """Create a result with the given median."""
+    return BenchmarkResult(
+        name=name,
+        group="test",
+        size=1,
+        rounds=1,
+        calls_per_round=1,
+        min=median,
+        median=median,
+        mean=median,
+        stddev=0.0,
+    )
+
+
+class TestMeasure:
+    """Test suite for measure."""
+
+    def test_calibrates_calls_per_round(self) -> None:
+        """Test that fast callables are repeated to fill a round."""
+        calls: list[int] = []
+
+        repetitions, timings = measure(
+            lambda: calls.append(1),
+            rounds=3,
+            min_time=0.001,
+        )
+
+        assert repetitions > 1
+        assert len(timings) == 3
+        assert len(calls) >= repetitions * 3
+
+    def test_slow_callables_run_once_per_round(self) -> None:
+        """Test that a callable slower than min_time is not repeated."""
+        repetitions, timings = measure(lambda: None, rounds=2, min_time=0)
+
+        assert repetitions == 1
+        assert len(timings) == 2
+
+
+class TestRunBenchmark:
+    """Test suite for run_benchmark."""
+
+    def test_runs_setup_and_teardown_around_timing(self) -> None:
+        """Test the generator protocol and the reported statistics."""
+        events: list[str] = []
+
+        def setup(size: int) -> Iterator[Callable[[], object]]:
+            """Record setup and teardown."""
+            events.append(f"setup {size}")
+            try:
+                yield lambda: None
+            finally:
+                events.append("teardown")
+
+        result = run_benchmark(Benchmark("test", "noop", setup, (5,)), 5, rounds=3)
+
+        assert events == ["setup 5", "teardown"]
+        assert result.name == "test.noop[5]"
+        assert result.rounds == 3
+        assert result.min <= result.median
+
+    def test_single_round_has_no_deviation(self) -> None:
+        """Test statistics of a single round."""
+        bench = Benchmark("test", "noop", lambda _size: iter([lambda: None]), (1,))
+
+        result = run_benchmark(bench, 1, rounds=1, min_time=0)
+
+        assert result.stddev == 0.0
+
+
+class TestResultStorage:
+    """Test suite for saving and loading results."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test that saved results load back unchanged."""
+        results = [create_result("a[1]", 0.5), create_result("b[1]", 0.25)]
+        path = tmp_path / "nested" / "run.json"
+
+        save_results(results, path)
+
+        assert load_results(path) == results
+        assert "python" in json.loads(path.read_text())["machine"]
+
+    def test_rejects_unknown_format(self, tmp_path: Path) -> None:
+        """Test that files from other tools are rejected."""
+        path = tmp_path / "other.json"
+        _ = path.write_text(json.dumps({"version": 99, "benchmarks": []}))
+
+        with pytest.raises(ValueError, match="Unsupported"):
+            _ = load_results(path)
+
+
+class TestCompareResults:
+    """Test suite for compare_results."""
+
+    def test_flags_changes_beyond_threshold(self) -> None:
+        """Test regressions, improvements and benchmarks in one run only."""
+        baseline = [
+            create_result("slower", 1.0),
+            create_result("faster", 1.0),
+            create_result("steady", 1.0),
+            create_result("removed", 1.0),
+            create_result("zero", 0.0),
+        ]
+        current = [
+            create_result("slower", 1.5),
+            create_result("faster", 0.5),
+            create_result("steady", 1.05),
+            create_result("new", 1.0),
+            create_result("zero", 1.0),
+        ]
+
+        report = compare_results(baseline, current, threshold=0.1)
+
+        assert [item.name for item in report.regressions] == ["slower"]
+        assert [item.name for item in report.improvements] == ["faster"]
+        assert report.regressions[0].change == 0.5
+        assert report.added == ["new"]
+        assert report.missing == ["removed"]
@@ -0,0 +1,73 @@
+"""Tests for the import-time report."""
+
+import pytest
+
+from benchmarks.imports import (
+    ENTRY_POINTS,
+    ImportProfile,
+    check_profiles,
+    parse_importtime,
+    profile_import,
+)
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |   encodings
+import time:       300 |        400 | site
+import time:        50 |         50 | app
+import time:       200 |        200 |     sqlalchemy.engine
+import time:       100 |        300 |   sqlalchemy
+import time:        30 |        330 | app.cli
+Traceback noise that is not an import line
+"""
+
+
+class TestParseImporttime:
+    """Test suite for parsing -X importtime output."""
+
+    def test_skips_interpreter_startup(self) -> None:
+        """Should leave out everything up to site."""
+        profile = parse_importtime("app.cli", IMPORTTIME_OUTPUT)
+
+        assert "encodings" not in profile.modules
+        assert "site" not in profile.modules
+
+    def test_totals_entry_point_and_parent_packages(self) -> None:
+        """Should add up the top-level imports after startup."""
+        profile = parse_importtime("app.cli", IMPORTTIME_OUTPUT)
+
+        assert profile.total_us == 380
+        assert profile.packages == {"app", "sqlalchemy"}
+
+    def test_slowest_excludes_the_entry_point(self) -> None:
+        """Should rank imported modules by cumulative time."""
+        profile = parse_importtime("app.cli", IMPORTTIME_OUTPUT)
+
+        assert profile.slowest(2) == [("sqlalchemy", 300), ("sqlalchemy.engine", 200)]
+
+
+class TestCheckProfiles:
+    """Test suite for the forbidden import check."""
+
+    def test_reports_forbidden_packages(self) -> None:
+        """Should name the entry point and the packages it must not import."""
+        profile = ImportProfile("app.cli", 1, {"app.cli": 1, "sqlalchemy": 1})
+
+        problems = check_profiles([profile], {"app.cli": frozenset({"sqlalchemy"})})
+
+        assert problems == ["app.cli imports sqlalchemy"]
+
+    def test_unknown_entry_points_pass(self) -> None:
+        """Should not restrict entry points without a rule."""
+        profile = ImportProfile("other", 1, {"sqlalchemy": 1})
+
+        assert check_profiles([profile], {}) == []
+
+
+@pytest.mark.parametrize(
+    "entry_point",
+    [name for name, forbidden in ENTRY_POINTS.items() if forbidden],
+)
+def test_entry_point_does_not_import_forbidden_packages(entry_point: str) -> None:
+    """Should keep CLI and worker entry points off the web and database stack."""
+    assert check_profiles([profile_import(entry_point)]) == []
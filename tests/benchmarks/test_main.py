@@ -0,0 +1,135 @@
+"""Tests for the benchmark command line."""
+
+import io
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.__main__ import main
+from benchmarks.harness import BenchmarkResult, load_results, save_results
+
+
+def create_result(name: str, median: float) -> BenchmarkResult:
+    """Create a result with the given median."""
+    return BenchmarkResult(
+        name=name,
+        group="test",
+        size=1,
+        rounds=1,
+        calls_per_round=1,
+        min=median,
+        median=median,
+        mean=median,
+        stddev=0.0,
+    )
+
+
+class TestRunCommand:
+    """Test suite for the run command."""
+
+    def test_runs_matching_benchmarks_and_saves_results(self, tmp_path: Path) -> None:
+        """Test filtering by name and the stored results."""
+        out = io.StringIO()
+        output = tmp_path / "run.json"
+
+        code = main(
+            [
+                "run",
+                "-k",
+                "resolve_singleton",
+                "--rounds",
+                "1",
+                "--min-time",
+                "0",
+                "--output",
+                str(output),
+            ],
+            out,
+        )
+
+        assert code == 0
+        assert [result.name for result in load_results(output)] == [
+            "container.resolve_singleton[1]",
+        ]
+        assert "Saved 1 results" in out.getvalue()
+
+    def test_fails_when_nothing_matches(self) -> None:
+        """Test that an empty selection is an error."""
+        out = io.StringIO()
+
+        assert main(["run", "-k", "no-such-benchmark"], out) == 1
+        assert "No benchmarks matched" in out.getvalue()
+
+
+class TestCompareCommand:
+    """Test suite for the compare command."""
+
+    def test_reports_regressions_and_fails(self, tmp_path: Path) -> None:
+        """Test the report and exit code of a regressed run."""
+        baseline, current = tmp_path / "base.json", tmp_path / "head.json"
+        save_results(
+            [
+                create_result("slow", 2.0),
+                create_result("fast", 2e-3),
+                create_result("gone", 1.0),
+            ],
+            baseline,
+        )
+        save_results(
+            [
+                create_result("slow", 3.0),
+                create_result("fast", 2e-9),
+                create_result("new", 2e-6),
+            ],
+            current,
+        )
+        out = io.StringIO()
+
+        code = main(["compare", str(baseline), str(current)], out)
+
+        report = out.getvalue()
+        assert code == 1
+        assert "2.00 s ->     3.00 s   +50.0%  REGRESSION" in report
+        assert "2.00 ms ->     2.00 ns" in report
+        assert "faster" in report
+        assert "new" in report
+        assert "missing" in report
+        assert "1 regressions beyond 10% in 2 benchmarks" in report
+
+    def test_passes_within_threshold(self, tmp_path: Path) -> None:
+        """Test that small changes do not fail the comparison."""
+        baseline, current = tmp_path / "base.json", tmp_path / "head.json"
+        save_results([create_result("steady", 1e-5)], baseline)
+        save_results([create_result("steady", 1.2e-5)], current)
+
+        code = main(
+            ["compare", str(baseline), str(current), "--threshold", "0.25"],
+            io.StringIO(),
+        )
+
+        assert code == 0
+
+
+class TestImportsCommand:
+    """Test suite for the imports command."""
+
+    def test_reports_import_times(self) -> None:
+        """Test the report of an entry point and its slowest imports."""
+        out = io.StringIO()
+
+        code = main(["imports", "src.version", "--top", "1", "--check"], out)
+
+        assert code == 0
+        assert out.getvalue().startswith("src.version")
+
+    def test_check_fails_on_forbidden_imports(self) -> None:
+        """Test that forbidden imports make the check fail."""
+        out = io.StringIO()
+
+        with patch(
+            "benchmarks.__main__.check_profiles",
+            return_value=["src.version imports sqlalchemy"],
+        ):
+            code = main(["imports", "src.version", "--check"], out)
+
+        assert code == 1
+        assert "FORBIDDEN IMPORT: src.version imports sqlalchemy" in out.getvalue()
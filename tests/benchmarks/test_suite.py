@@ -0,0 +1,20 @@
+"""Smoke test that every registered benchmark runs."""
+
+import pytest
+
+from benchmarks import load_benchmarks
+from benchmarks.harness import Benchmark, run_benchmark
+
+BENCHMARKS = load_benchmarks()
+
+
+@pytest.mark.parametrize(
+    "bench",
+    BENCHMARKS,
+    ids=[f"{bench.group}.{bench.name}" for bench in BENCHMARKS],
+)
+def test_benchmark_runs_at_small_size(bench: Benchmark) -> None:
+    """Test setup, one timed call and teardown at a tiny data size."""
+    result = run_benchmark(bench, 10, rounds=1, min_time=0)
+
+    assert result.median >= 0
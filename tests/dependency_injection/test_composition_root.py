@@ -5,16 +5,37 @@ Tests the application-specific dependency configuration that wires
 our clean architecture layers together.
 """
 
+# pyright: reportPrivateUsage=false
+
 from unittest.mock import patch
 
+import pytest
+
 # These imports now exist after implementation
 from dependency_injection.composition_root import CompositionRoot
 from dependency_injection.di_container import DIContainer
+from src.application.interfaces.holdings_query import IHoldingsQuery
+from src.application.services.portfolio_metrics_service import (
+    PortfolioMetricsService,
+)
 from src.application.services.stock_application_service import StockApplicationService
+from src.application.services.transaction_import_service import (
+    TransactionImportService,
+)
 
 # Additional imports needed for tests
 from src.domain.repositories.interfaces import IStockBookUnitOfWork
+from src.infrastructure.config import database_config
+from src.infrastructure.persistence.query_budget import QueryBudget
 from src.infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from src.infrastructure.queries import SqlAlchemyHoldingsQuery
+from src.shared.instrumentation import metrics
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    """Run async tests on asyncio only."""
+    return "asyncio"
 
 
 class TestCompositionRoot:
@@ -71,6 +92,199 @@ class TestCompositionRoot:
             result = stock_service.get_all_stocks()
             assert result == []
 
+    def test_configure_event_dispatch(self) -> None:
+        """Should share one dispatcher that committed units of work notify."""
+        from sqlalchemy.engine import Engine
+
+        from src.application.events import EventSerializer, OutboxDispatcher
+        from src.application.interfaces.event_dispatcher import IEventDispatcher
+        from src.domain.events import StockAddedEvent
+        from src.domain.value_objects.stock_symbol import StockSymbol
+        from src.infrastructure.persistence.tables import metadata
+
+        # Arrange
+        container = CompositionRoot.configure(database_url="sqlite:///:memory:")
+        metadata.create_all(container.resolve(Engine))
+        dispatcher = container.resolve(IEventDispatcher)
+        message = EventSerializer().to_message(
+            StockAddedEvent(StockSymbol("AAPL"), "Apple Inc.", "stock-1"),
+        )
+
+        # Act
+        with patch.object(dispatcher, "notify") as mock_notify:
+            unit_of_work = container.resolve(IStockBookUnitOfWork)
+            with unit_of_work:
+                unit_of_work.outbox.add([message])
+                unit_of_work.commit()
+
+        # Assert
+        assert isinstance(dispatcher, OutboxDispatcher)
+        assert container.resolve(IEventDispatcher) is dispatcher
+        mock_notify.assert_called_once_with()
+
+    def test_configure_group_commit(self) -> None:
+        """Should route every unit of work through one group committer."""
+        from sqlalchemy.engine import Engine
+
+        from src.infrastructure.persistence.group_commit import GroupCommitter
+        from src.infrastructure.persistence.tables import metadata
+
+        # Arrange & Act
+        container = CompositionRoot.configure(
+            database_url="sqlite:///:memory:",
+            config={"group_commit": True},
+        )
+        metadata.create_all(container.resolve(Engine))
+
+        # Assert
+        committer = container.resolve(GroupCommitter)
+        unit_of_work = container.resolve(IStockBookUnitOfWork)
+        with patch.object(committer, "acquire", wraps=committer.acquire) as acquire:
+            with unit_of_work:
+                pass
+            acquire.assert_not_called()
+            with unit_of_work:
+                _ = unit_of_work.outbox.mark_dispatched(["event-1"])
+            acquire.assert_called_once_with()
+        committer.close()
+
+    def test_configure_reuses_given_engine(self) -> None:
+        """Should register the engine passed in config instead of a new one."""
+        from sqlalchemy import create_engine
+        from sqlalchemy.engine import Engine
+
+        engine = create_engine("sqlite:///:memory:")
+
+        container = CompositionRoot.configure(
+            database_url="sqlite:///:memory:",
+            config={"engine": engine},
+        )
+
+        assert container.resolve(Engine) is engine
+
+    def test_configure_holdings_query(self) -> None:
+        """Should register the holdings read model as a singleton."""
+        container = CompositionRoot.configure(database_url="sqlite:///:memory:")
+
+        holdings = container.resolve(IHoldingsQuery)
+
+        assert isinstance(holdings, SqlAlchemyHoldingsQuery)
+        assert container.resolve(IHoldingsQuery) is holdings
+
+    def test_configure_stock_query(self) -> None:
+        """Should register the stock projection read model as a singleton."""
+        from src.application.interfaces.stock_query import IStockQuery
+        from src.infrastructure.queries import SqlAlchemyStockQuery
+
+        container = CompositionRoot.configure(database_url="sqlite:///:memory:")
+
+        query = container.resolve(IStockQuery)
+
+        assert isinstance(query, SqlAlchemyStockQuery)
+        assert container.resolve(IStockQuery) is query
+
+    def test_configure_portfolio_metrics_service(self) -> None:
+        """Should share one metrics service and report its cache."""
+        container = CompositionRoot.configure(database_url="sqlite:///:memory:")
+
+        service = container.resolve(PortfolioMetricsService)
+
+        assert container.resolve(PortfolioMetricsService) is service
+        assert 'cache="portfolio_metrics"' in metrics.render()
+
+    @pytest.mark.anyio
+    async def test_configure_live_update_hub(self) -> None:
+        """Should share one hub that receives stock events from the bus."""
+        from src.application.events import EventBus, LiveUpdateHub
+        from src.domain.events import StockAddedEvent
+        from src.domain.value_objects.stock_symbol import StockSymbol
+
+        container = CompositionRoot.configure(database_url="sqlite:///:memory:")
+
+        hub = container.resolve(LiveUpdateHub)
+        subscription = hub.subscribe(["stock"])
+        _ = await container.resolve(EventBus).publish(
+            StockAddedEvent(StockSymbol("AAPL"), "Apple Inc.", "stock-1"),
+        )
+
+        assert container.resolve(LiveUpdateHub) is hub
+        assert [update.key for update in await subscription.next_batch()] == [
+            "stock-1",
+        ]
+
+    def test_configure_read_coalescing(self) -> None:
+        """Should share one SingleFlight and the stocks table version."""
+        from sqlalchemy.engine import Engine
+
+        from src.application.commands.stock import (
+            CreateStockCommand,
+            CreateStockInputs,
+        )
+        from src.application.interfaces.stock_service import IStockApplicationService
+        from src.infrastructure.persistence.tables import metadata
+        from src.shared.caching import SingleFlight, TableVersions
+
+        container = CompositionRoot.configure(database_url="sqlite:///:memory:")
+        metadata.create_all(container.resolve(Engine))
+        reader = container.resolve(IStockApplicationService)
+
+        _ = container.resolve(IStockApplicationService).create_stock(
+            CreateStockCommand(CreateStockInputs(symbol="AAPL", name="Apple Inc.")),
+        )
+
+        assert reader.data_version == 1
+        assert container.resolve(TableVersions)["stocks"].current == 1
+        assert container.resolve(SingleFlight) is container.resolve(SingleFlight)
+        assert 'cache="read_singleflight"' in metrics.render()
+
+    def test_configure_transaction_import_service(self) -> None:
+        """Should create a new import service for each resolution."""
+        container = CompositionRoot.configure(database_url="sqlite:///:memory:")
+
+        from src.shared.caching import TableVersions
+
+        service = container.resolve(TransactionImportService)
+
+        assert isinstance(service, TransactionImportService)
+        assert container.resolve(TransactionImportService) is not service
+        assert service._table_versions is container.resolve(TableVersions)  # noqa: SLF001
+
+    def test_configure_query_budget(self) -> None:
+        """Should give every unit of work the configured query budget."""
+        budget = QueryBudget(max_queries=10)
+
+        container = CompositionRoot.configure(
+            database_url="sqlite:///:memory:",
+            config={"query_budget": budget},
+        )
+
+        unit_of_work = container.resolve(IStockBookUnitOfWork)
+        assert isinstance(unit_of_work, SqlAlchemyUnitOfWork)
+        assert unit_of_work._query_budget is budget  # noqa: SLF001
+
+    def test_default_query_budget_from_database_config(self) -> None:
+        """Should build the budget from database settings, 0 meaning no limit."""
+        with (
+            patch.object(database_config, "query_budget_max_queries", 0),
+            patch.object(database_config, "query_budget_max_repeats", 0),
+        ):
+            assert CompositionRoot._default_query_budget() is None  # noqa: SLF001
+
+        with (
+            patch.object(database_config, "query_budget_max_queries", 0),
+            patch.object(database_config, "query_budget_max_repeats", 3),
+            patch.object(database_config, "query_budget_raise", new=True),
+        ):
+            budget = CompositionRoot._default_query_budget()  # noqa: SLF001
+
+        assert budget == QueryBudget(max_repeats=3, raise_on_exceeded=True)
+
+        with patch.object(database_config, "query_budget_max_queries", 25):
+            budget = CompositionRoot._default_query_budget()  # noqa: SLF001
+
+        assert budget is not None
+        assert budget.max_queries == 25
+
     def test_configure_presentation_layer(self) -> None:
         """Should configure presentation layer components correctly."""
         # Arrange
@@ -52,6 +52,15 @@ class TestEntity:
         with pytest.raises(AttributeError):
             entity.id = "different-id"  # type: ignore[misc]
 
+    def test_version_starts_at_one_and_advances(self) -> None:
+        """Should carry a row version that advances after each update."""
+        entity = ConcreteEntity()
+        assert entity.version == 1
+
+        entity.advance_version()
+
+        assert entity.version == 2
+
     def test_from_persistence_creates_entity_with_id(self) -> None:
         """Should create entity from persistence with existing ID."""
         test_id = "persistence-id-456"
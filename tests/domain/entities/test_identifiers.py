@@ -0,0 +1,53 @@
+"""Tests for time-ordered entity identifiers."""
+
+import uuid
+from itertools import count
+
+from src.domain.entities.identifiers import Uuid7Generator, new_id
+
+
+def fixed_clock(millis: int) -> int:
+    """Helper returning a constant time in nanoseconds."""
+    return millis * 1_000_000
+
+
+class TestUuid7Generator:
+    """Test suite for UUID version 7 generation."""
+
+    def test_generates_version_7_rfc_uuids(self) -> None:
+        """Should produce canonical UUID text with version 7 and RFC variant."""
+        identifier = new_id()
+        value = uuid.UUID(identifier)
+
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+        assert str(value) == identifier
+
+    def test_timestamp_prefix_orders_ids_by_creation_time(self) -> None:
+        """Should sort IDs from later milliseconds after earlier ones."""
+        ticks = count(1_700_000_000_000)
+        generator = Uuid7Generator(lambda: next(ticks) * 1_000_000)
+
+        ids = [generator() for _ in range(100)]
+
+        assert ids == sorted(ids)
+        assert int(ids[0].replace("-", "")[:12], 16) == 1_700_000_000_000
+
+    def test_ids_within_one_millisecond_stay_monotonic(self) -> None:
+        """Should count up within a millisecond, borrowing the next one."""
+        generator = Uuid7Generator(lambda: fixed_clock(1_700_000_000_000))
+
+        ids = [generator() for _ in range(5_000)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+
+    def test_clock_stepping_back_keeps_order(self) -> None:
+        """Should not go backwards when the clock does."""
+        times = iter([fixed_clock(2_000), fixed_clock(1_000)])
+        generator = Uuid7Generator(lambda: next(times))
+
+        first = generator()
+        second = generator()
+
+        assert second > first
@@ -536,3 +536,55 @@ class TestJournalEntryBuilder:
             match="JournalEntry must be created through Builder",
         ):
             _ = JournalEntry(_builder_instance=None)
+
+    def test_builder_normalizes_tags(self) -> None:
+        """Test that tags are lowercased, deduplicated and sorted."""
+        entry = (
+            JournalEntry.Builder()
+            .with_entry_date(datetime(2024, 1, 15, tzinfo=UTC))
+            .with_content(JournalContent("Test"))
+            .with_tags([" Earnings", "hold", "earnings"])
+            .build()
+        )
+
+        assert entry.tags == ("earnings", "hold")
+        assert entry.has_tag("HOLD")
+        assert not entry.has_tag("sell")
+
+    def test_tags_default_to_empty(self) -> None:
+        """Test that entries without tags have an empty tag tuple."""
+        entry = (
+            JournalEntry.Builder()
+            .with_entry_date(datetime(2024, 1, 15, tzinfo=UTC))
+            .with_content(JournalContent("Test"))
+            .build()
+        )
+
+        assert entry.tags == ()
+
+    @pytest.mark.parametrize("tag", ["", "   ", "a,b"])
+    def test_invalid_tags_rejected(self, tag: str) -> None:
+        """Test that empty tags and tags containing commas are rejected."""
+        builder = (
+            JournalEntry.Builder()
+            .with_entry_date(datetime(2024, 1, 15, tzinfo=UTC))
+            .with_content(JournalContent("Test"))
+            .with_tags([tag])
+        )
+
+        with pytest.raises(ValueError, match="Invalid tag"):
+            _ = builder.build()
+
+    def test_update_tags(self) -> None:
+        """Test that tags can be replaced."""
+        entry = (
+            JournalEntry.Builder()
+            .with_entry_date(datetime(2024, 1, 15, tzinfo=UTC))
+            .with_content(JournalContent("Test"))
+            .with_tags(["hold"])
+            .build()
+        )
+
+        entry.update_tags(["Sell", "review"])
+
+        assert entry.tags == ("review", "sell")
@@ -585,6 +585,37 @@ class TestTransaction:
         assert transaction.portfolio_id == "portfolio-id-1"
         assert transaction.stock_id == "stock-id-1"
 
+    def test_natural_key_ignores_id_and_notes(self) -> None:
+        """Should identify the same fill regardless of ID and notes."""
+        trade_date = datetime(2024, 3, 1, tzinfo=UTC)
+
+        def build(transaction_id: str, notes: str) -> Transaction:
+            return (
+                Transaction.Builder()
+                .with_id(transaction_id)
+                .with_portfolio_id("portfolio-id-1")
+                .with_stock_id("stock-id-1")
+                .with_transaction_type(TransactionType("buy"))
+                .with_quantity(Quantity(10))
+                .with_price(Money(Decimal("12.50")))
+                .with_transaction_date(trade_date)
+                .with_notes(Notes(notes))
+                .build()
+            )
+
+        first = build("first", "")
+        second = build("second", "Imported")
+
+        assert first.natural_key == second.natural_key
+        assert first.natural_key == (
+            "portfolio-id-1",
+            "stock-id-1",
+            "buy",
+            trade_date,
+            Decimal(10),
+            Decimal("12.50"),
+        )
+
 
 class TestTransactionType:
     """Test TransactionType value object validation."""
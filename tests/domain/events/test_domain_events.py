@@ -11,7 +11,7 @@ from typing import Any
 import pytest
 
 from src.domain.events.base import DomainEvent
-from src.domain.events.stock_events import StockAddedEvent
+from src.domain.events.stock_events import StockAddedEvent, StockUpdatedEvent
 from src.domain.value_objects.stock_symbol import StockSymbol
 
 
@@ -88,6 +88,20 @@ class TestDomainEvent:
         assert event.event_id in repr_str
         assert event.occurred_at.isoformat() in repr_str
 
+    def test_domain_event_payload_round_trip(self) -> None:
+        """Should restore a base event from its empty payload."""
+        event = DomainEvent()
+
+        restored = DomainEvent.from_payload(
+            event.to_payload(),
+            event_id=event.event_id,
+            occurred_at=event.occurred_at,
+        )
+
+        assert event.to_payload() == {}
+        assert restored == event
+        assert restored.occurred_at == event.occurred_at
+
 
 class TestStockAddedEvent:
     """Test suite for StockAddedEvent."""
@@ -98,12 +112,12 @@ class TestStockAddedEvent:
         event = StockAddedEvent(
             stock_symbol=symbol,
             stock_name="Apple Inc.",
-            stock_id=123,
+            stock_id="stock-123",
         )
 
         assert event.stock_symbol == symbol
         assert event.stock_name == "Apple Inc."
-        assert event.stock_id == 123
+        assert event.stock_id == "stock-123"
         assert event.occurred_at is not None
         assert event.event_id is not None
 
@@ -112,13 +126,17 @@ class TestStockAddedEvent:
         symbol = StockSymbol("AAPL")
 
         with pytest.raises(ValueError, match="Stock name cannot be empty"):
-            _ = StockAddedEvent(stock_symbol=symbol, stock_name="", stock_id=123)
+            _ = StockAddedEvent(
+                stock_symbol=symbol,
+                stock_name="",
+                stock_id="stock-123",
+            )
 
-        with pytest.raises(ValueError, match="Stock ID must be positive"):
+        with pytest.raises(ValueError, match="Stock ID cannot be empty"):
             _ = StockAddedEvent(
                 stock_symbol=symbol,
                 stock_name="Apple Inc.",
-                stock_id=0,
+                stock_id=" ",
             )
 
     def test_stock_added_event_string_representation(self) -> None:
@@ -127,7 +145,7 @@ class TestStockAddedEvent:
         event = StockAddedEvent(
             stock_symbol=symbol,
             stock_name="Apple Inc.",
-            stock_id=123,
+            stock_id="stock-123",
         )
 
         str_repr = str(event)
@@ -141,14 +159,59 @@ class TestStockAddedEvent:
         event = StockAddedEvent(
             stock_symbol=symbol,
             stock_name="Apple Inc.",
-            stock_id=123,
+            stock_id="stock-123",
         )
 
         repr_str = repr(event)
         assert "StockAddedEvent" in repr_str
         assert "stock_symbol=StockSymbol('AAPL')" in repr_str
         assert "stock_name='Apple Inc.'" in repr_str
-        assert "stock_id=123" in repr_str
+        assert "stock_id='stock-123'" in repr_str
+
+
+class TestStockUpdatedEvent:
+    """Test StockUpdatedEvent."""
+
+    def test_create_stock_updated_event(self) -> None:
+        """Should store the update with sorted field names."""
+        symbol = StockSymbol("AAPL")
+
+        event = StockUpdatedEvent(
+            stock_symbol=symbol,
+            stock_id="stock-123",
+            changed_fields=("notes", "grade"),
+        )
+
+        assert event.stock_symbol == symbol
+        assert event.stock_id == "stock-123"
+        assert event.changed_fields == ("grade", "notes")
+        assert str(event) == "StockUpdatedEvent(symbol=AAPL, fields=[grade, notes])"
+        assert "changed_fields=('grade', 'notes')" in repr(event)
+
+    def test_stock_updated_event_validation(self) -> None:
+        """Should validate required fields."""
+        symbol = StockSymbol("AAPL")
+
+        with pytest.raises(ValueError, match="Stock ID cannot be empty"):
+            _ = StockUpdatedEvent(symbol, " ", ("grade",))
+
+        with pytest.raises(ValueError, match="Changed fields cannot be empty"):
+            _ = StockUpdatedEvent(symbol, "stock-123", ())
+
+    def test_payload_round_trip_keeps_identity(self) -> None:
+        """Should restore an equal event from its payload."""
+        event = StockUpdatedEvent(StockSymbol("AAPL"), "stock-123", ("grade",))
+
+        restored = StockUpdatedEvent.from_payload(
+            event.to_payload(),
+            event_id=event.event_id,
+            occurred_at=event.occurred_at,
+        )
+
+        assert StockUpdatedEvent.event_type() == "StockUpdatedEvent"
+        assert restored == event
+        assert restored.occurred_at == event.occurred_at
+        assert restored.changed_fields == event.changed_fields
 
 
 class TestDomainEventLifecycle:
@@ -159,7 +222,7 @@ class TestDomainEventLifecycle:
         # Create a stock added event
         stock_symbol = StockSymbol("AAPL")
         stock_name = "Apple Inc."
-        stock_id = 1
+        stock_id = "stock-1"
         event = StockAddedEvent(
             stock_symbol=stock_symbol,
             stock_name=stock_name,
@@ -183,7 +246,7 @@ class TestDomainEventLifecycle:
         event = StockAddedEvent(
             stock_symbol=StockSymbol("TEST"),
             stock_name="Test Company",
-            stock_id=1,
+            stock_id="stock-1",
         )
 
         # Should not be able to modify event after creation
@@ -202,14 +265,14 @@ class TestDomainEventLifecycle:
         early_event = StockAddedEvent(
             stock_symbol=StockSymbol("AAPL"),
             stock_name="Apple Inc.",
-            stock_id=1,
+            stock_id="stock-1",
             occurred_at=early_time,
         )
 
         later_event = StockAddedEvent(
             stock_symbol=StockSymbol("MSFT"),
             stock_name="Microsoft Corp",
-            stock_id=2,
+            stock_id="stock-2",
             occurred_at=later_time,
         )
 
@@ -225,7 +288,7 @@ class TestDomainEventLifecycle:
         event = StockAddedEvent(
             stock_symbol=StockSymbol("GOOGL"),
             stock_name="Alphabet Inc.",
-            stock_id=1,
+            stock_id="stock-1",
         )
 
         # Event should have string representation
@@ -249,7 +312,7 @@ class TestDomainEventConsistency:
         event = StockAddedEvent(
             stock_symbol=stock_symbol,
             stock_name="Tesla Inc.",
-            stock_id=1,
+            stock_id="stock-1",
         )
 
         # Event data should remain consistent
@@ -268,7 +331,7 @@ class TestDomainEventConsistency:
             event = StockAddedEvent(
                 stock_symbol=StockSymbol("TEST"),
                 stock_name="Test Company",
-                stock_id=1,
+                stock_id="stock-1",
             )
             events.append(event)
 
@@ -289,7 +352,7 @@ class TestDomainEventConsistency:
             event = StockAddedEvent(
                 stock_symbol=StockSymbol("TEST"),
                 stock_name="Test Company",
-                stock_id=1,
+                stock_id="stock-1",
             )
             events.append(event)
 
@@ -315,7 +378,7 @@ class TestDomainEventPatterns:
             StockAddedEvent(
                 stock_symbol=StockSymbol("TEST"),
                 stock_name="Test Company",
-                stock_id=1,
+                stock_id="stock-1",
             ),
         )
 
@@ -323,7 +386,7 @@ class TestDomainEventPatterns:
             StockAddedEvent(
                 stock_symbol=StockSymbol("TEST"),
                 stock_name="Test Company",
-                stock_id=1,
+                stock_id="stock-1",
             ),
         )
 
@@ -354,7 +417,7 @@ class TestDomainEventPatterns:
             event = StockAddedEvent(
                 stock_symbol=StockSymbol(symbol),
                 stock_name=company_name,
-                stock_id=i + 1,
+                stock_id=f"stock-{i + 1}",
             )
             events.append(event)
 
@@ -384,7 +447,7 @@ class TestDomainEventPatterns:
                     chr(ord("A") + (i % 26)) + chr(ord("A") + ((i // 26) % 26)),
                 ),
                 stock_name=f"Aggregated Company {i}",
-                stock_id=i + 1,
+                stock_id=f"stock-{i + 1}",
                 occurred_at=event_time,
             )
             events.append(event)
@@ -422,7 +485,7 @@ class TestDomainEventPatterns:
             event = StockAddedEvent(
                 stock_symbol=StockSymbol(symbol),
                 stock_name="Test Company",
-                stock_id=i + 1,
+                stock_id=f"stock-{i + 1}",
             )
             events.append(event)
 
@@ -458,7 +521,7 @@ class TestDomainEventEdgeCases:
         early_event = StockAddedEvent(
             stock_symbol=StockSymbol("EARLY"),
             stock_name="Early Company",
-            stock_id=1,
+            stock_id="stock-1",
             occurred_at=datetime.min.replace(tzinfo=UTC),
         )
 
@@ -466,7 +529,7 @@ class TestDomainEventEdgeCases:
         future_event = StockAddedEvent(
             stock_symbol=StockSymbol("FUTUR"),
             stock_name="Future Company",
-            stock_id=2,
+            stock_id="stock-2",
             occurred_at=datetime(2050, 12, 31, 23, 59, 59, tzinfo=UTC),
         )
 
@@ -479,7 +542,7 @@ class TestDomainEventEdgeCases:
         minimal_event = StockAddedEvent(
             stock_symbol=StockSymbol("A"),
             stock_name="Test Company",
-            stock_id=1,
+            stock_id="stock-1",
         )
 
         # Test with maximal symbol (at symbol length limit of 5)
@@ -489,7 +552,7 @@ class TestDomainEventEdgeCases:
         maximal_event = StockAddedEvent(
             stock_symbol=StockSymbol(maximal_symbol),
             stock_name=maximal_name,
-            stock_id=2,
+            stock_id="stock-2",
         )
 
         assert minimal_event.stock_symbol.value == "A"
@@ -511,7 +574,7 @@ class TestDomainEventEdgeCases:
             event = StockAddedEvent(
                 stock_symbol=StockSymbol(symbol),
                 stock_name=f"Company {i}",
-                stock_id=i + 1,
+                stock_id=f"stock-{i + 1}",
             )
             events.append(event)
 
@@ -537,7 +600,7 @@ class TestDomainEventEdgeCases:
             event1 = StockAddedEvent(
                 stock_symbol=StockSymbol(symbol1),
                 stock_name="Batch 1 Company",
-                stock_id=i + 1,
+                stock_id=f"stock-{i + 1}",
             )
             events_batch_1.append(event1)
 
@@ -546,7 +609,7 @@ class TestDomainEventEdgeCases:
             event2 = StockAddedEvent(
                 stock_symbol=StockSymbol(symbol2),
                 stock_name="Batch 2 Company",
-                stock_id=i + 51,
+                stock_id=f"stock-{i + 51}",
             )
             events_batch_2.append(event2)
 
@@ -570,7 +633,7 @@ class TestDomainEventArchitecturalConcerns:
         stock_event = StockAddedEvent(
             stock_symbol=StockSymbol("TEST"),
             stock_name="Test Company",
-            stock_id=1,
+            stock_id="stock-1",
         )
 
         assert isinstance(stock_event, DomainEvent)
@@ -592,7 +655,7 @@ class TestDomainEventArchitecturalConcerns:
         stock_event = StockAddedEvent(
             stock_symbol=StockSymbol("TEST"),
             stock_name="Test Company",
-            stock_id=1,
+            stock_id="stock-1",
         )
         events.append(stock_event)
 
@@ -615,7 +678,7 @@ class TestDomainEventArchitecturalConcerns:
         event = StockAddedEvent(
             stock_symbol=StockSymbol("TEST"),
             stock_name="Test Company",
-            stock_id=1,
+            stock_id="stock-1",
         )
 
         # Event should support metadata attachment (conceptually)
@@ -3,6 +3,7 @@
 from src.domain.exceptions.base import (
     AlreadyExistsError,
     BusinessRuleViolationError,
+    ConcurrencyConflictError,
     DomainError,
     NotFoundError,
 )
@@ -95,6 +96,26 @@ class TestAlreadyExistsError:
         assert str(exception) == f"Account with identifier '{uuid_str}' already exists"
 
 
+class TestConcurrencyConflictError:
+    """Test cases for ConcurrencyConflictError."""
+
+    def test_concurrency_conflict_exception_inheritance(self) -> None:
+        """Test that ConcurrencyConflictError inherits from DomainError."""
+        exception = ConcurrencyConflictError("Stock", "stock-1", 2)
+        assert isinstance(exception, DomainError)
+
+    def test_concurrency_conflict_exception_attributes(self) -> None:
+        """Test that ConcurrencyConflictError stores the expected version."""
+        exception = ConcurrencyConflictError("Position", "pos-1", expected_version=4)
+        assert exception.entity_type == "Position"
+        assert exception.identifier == "pos-1"
+        assert exception.expected_version == 4
+        assert str(exception) == (
+            "Position with identifier 'pos-1' was modified concurrently "
+            "(expected version 4)"
+        )
+
+
 class TestBusinessRuleViolationError:
     """Test cases for BusinessRuleViolationError."""
 
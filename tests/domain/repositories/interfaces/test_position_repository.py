@@ -5,6 +5,7 @@ proper abstractions for position data persistence operations in the domain layer
 """
 
 from abc import ABC
+from collections.abc import Iterable
 from datetime import datetime
 from decimal import Decimal
 from zoneinfo import ZoneInfo
@@ -63,6 +64,16 @@ class MockPositionRepository(IPositionRepository):
             if position.portfolio_id == portfolio_id
         ]
 
+    def get_positions_for_portfolios(
+        self,
+        portfolio_ids: Iterable[str],
+    ) -> dict[str, list[Position]]:
+        """Retrieve positions of several portfolios keyed by portfolio ID."""
+        return {
+            portfolio_id: self.get_by_portfolio(portfolio_id)
+            for portfolio_id in portfolio_ids
+        }
+
     def delete(self, position_id: str) -> bool:
         """Delete position by ID."""
         if position_id in self.positions:
@@ -129,6 +140,7 @@ class TestPositionRepositoryContract:
             "get_by_id",
             "get_by_portfolio_and_stock",
             "get_by_portfolio",
+            "get_positions_for_portfolios",
             "delete",
             "delete_by_portfolio_and_stock",
         ]
@@ -335,6 +347,19 @@ class TestPositionRepositoryContractEdgeCases:
         assert portfolio1_positions[0].stock_id == "stock-1"
         assert portfolio2_positions[0].stock_id == "stock-1"
 
+    def test_get_positions_for_portfolios(self) -> None:
+        """Should key positions by portfolio, including empty portfolios."""
+        position1 = create_test_position("portfolio-1", "stock-1", 100, "150.00")
+        position2 = create_test_position("portfolio-2", "stock-1", 200, "175.00")
+        _ = self.repository.create(position1)
+        _ = self.repository.create(position2)
+
+        positions = self.repository.get_positions_for_portfolios(
+            ["portfolio-1", "portfolio-3"],
+        )
+
+        assert positions == {"portfolio-1": [position1], "portfolio-3": []}
+
     def test_delete_by_portfolio_and_stock_with_multiple_positions(self) -> None:
         """Should delete only the specific position when multiple exist."""
         position1 = create_test_position("portfolio-1", "stock-1", 100, "150.00")
@@ -7,6 +7,7 @@ proper abstractions for data persistence operations in the domain layer.
 
 import types
 from abc import ABC
+from collections.abc import Iterable, Sequence
 
 import pytest
 
@@ -28,6 +29,7 @@ from src.domain.value_objects.grade import Grade
 from src.domain.value_objects.industry_group import IndustryGroup
 from src.domain.value_objects.portfolio_name import PortfolioName
 from src.domain.value_objects.sector import Sector
+from src.domain.value_objects.stock_query_spec import StockQuerySpec
 from src.domain.value_objects.stock_symbol import StockSymbol
 
 
@@ -45,6 +47,11 @@ class MockStockRepository(IStockRepository):
         self.stocks[stock_id] = stock
         return stock_id
 
+    def create_many(self, stocks: Sequence[Stock]) -> int:
+        for stock in stocks:
+            _ = self.create(stock)
+        return len(stocks)
+
     def get_by_id(self, stock_id: str) -> Stock | None:
         return self.stocks.get(stock_id)
 
@@ -57,12 +64,33 @@ class MockStockRepository(IStockRepository):
     def get_all(self) -> list[Stock]:
         return list(self.stocks.values())
 
+    def get_many_by_ids(self, stock_ids: Iterable[str]) -> dict[str, Stock]:
+        return {
+            stock_id: self.stocks[stock_id]
+            for stock_id in stock_ids
+            if stock_id in self.stocks
+        }
+
+    def get_many_by_symbols(
+        self,
+        symbols: Iterable[StockSymbol],
+    ) -> dict[str, Stock]:
+        wanted = {symbol.value for symbol in symbols}
+        return {
+            stock.symbol.value: stock
+            for stock in self.stocks.values()
+            if stock.symbol.value in wanted
+        }
+
     def update(self, stock_id: str, stock: Stock) -> bool:
         if stock_id in self.stocks:
             self.stocks[stock_id] = stock
             return True
         return False
 
+    def update_and_get(self, stock_id: str, stock: Stock) -> Stock | None:
+        return stock if self.update(stock_id, stock) else None
+
     def delete(self, stock_id: str) -> bool:
         if stock_id in self.stocks:
             del self.stocks[stock_id]
@@ -104,6 +132,13 @@ class MockStockRepository(IStockRepository):
 
         return results
 
+    def find_stocks(self, spec: StockQuerySpec) -> list[Stock]:
+        return [
+            stock
+            for stock in self.stocks.values()
+            if spec.grade is None or (stock.grade and stock.grade.value == spec.grade)
+        ]
+
 
 class MockPortfolioRepository(IPortfolioRepository):
     """Mock implementation of IPortfolioRepository for contract testing."""
@@ -275,6 +310,13 @@ class TestStockRepositoryContract:
         assert isinstance(stock_id, str)
         assert len(stock_id) > 0
 
+    def test_create_many_returns_count(self) -> None:
+        """Should return how many stocks were created in bulk."""
+        stocks = [create_test_stock("AAPL", "A"), create_test_stock("MSFT", "B")]
+
+        assert self.repository.create_many(stocks) == 2
+        assert len(self.repository.get_all()) == 2
+
     def test_get_by_id_returns_stock_when_exists(self) -> None:
         """Should return stock when querying by existing ID."""
         stock_id = self.repository.create(self.test_stock)
@@ -304,6 +346,18 @@ class TestStockRepositoryContract:
 
         assert retrieved_stock is None
 
+    def test_get_many_returns_found_stocks_keyed(self) -> None:
+        """Should return only the stocks that exist, keyed by ID or symbol."""
+        stock_id = self.repository.create(self.test_stock)
+
+        by_id = self.repository.get_many_by_ids([stock_id, "non-existent-id"])
+        by_symbol = self.repository.get_many_by_symbols(
+            [self.test_stock.symbol, StockSymbol("NONEX")],
+        )
+
+        assert by_id == {stock_id: self.test_stock}
+        assert by_symbol == {"AAPL": self.test_stock}
+
     def test_get_all_returns_all_stocks(self) -> None:
         """Should return all stocks in repository."""
         stock1 = create_test_stock("AAPL", "A")
@@ -339,6 +393,14 @@ class TestStockRepositoryContract:
 
         assert result is False
 
+    def test_update_and_get_returns_stored_stock(self) -> None:
+        """Should return the updated stock, or None when it does not exist."""
+        stock_id = self.repository.create(self.test_stock)
+        updated_stock = create_test_stock("AAPL", "B")
+
+        assert self.repository.update_and_get(stock_id, updated_stock) is updated_stock
+        assert self.repository.update_and_get("non-existent-id", updated_stock) is None
+
     def test_delete_returns_true_when_successful(self) -> None:
         """Should return True when deletion is successful."""
         stock_id = self.repository.create(self.test_stock)
@@ -398,6 +460,15 @@ class TestStockRepositoryContract:
         assert results[0].grade is not None
         assert results[0].grade.value == "A"
 
+    def test_find_stocks_applies_spec(self) -> None:
+        """Should return only the stocks matching the query spec."""
+        _ = self.repository.create(create_test_stock("AAPL", "A"))
+        _ = self.repository.create(create_test_stock("MSFT", "B"))
+
+        results = self.repository.find_stocks(StockQuerySpec(grade="B"))
+
+        assert [stock.symbol.value for stock in results] == ["MSFT"]
+
     def test_search_stocks_returns_empty_when_no_matches(self) -> None:
         """Should return empty list when no stocks match criteria."""
         _ = self.repository.create(self.test_stock)
@@ -787,6 +858,8 @@ class TestAbstractMethodCoverage:
         assert hasattr(IStockRepository, "create")
         assert hasattr(IStockRepository, "get_by_id")
         assert hasattr(IStockRepository, "get_by_symbol")
+        assert hasattr(IStockRepository, "get_many_by_ids")
+        assert hasattr(IStockRepository, "get_many_by_symbols")
         assert hasattr(IStockRepository, "get_all")
         assert hasattr(IStockRepository, "update")
         assert hasattr(IStockRepository, "delete")
@@ -14,6 +14,7 @@ from src.domain.services.exceptions import CalculationError
 
 # These imports now exist after implementation
 from src.domain.services.portfolio_calculation_service import (
+    IncrementalAllocation,
     PortfolioCalculationService,
 )
 from src.domain.value_objects import (
@@ -404,3 +405,187 @@ class TestPortfolioAllocationAnalysis:
 
     def test_identify_concentration_risks(self) -> None:
         """Should identify positions that are overly concentrated."""
+
+
+class TestPortfolioMetricsCalculation:
+    """Test combined metrics calculation."""
+
+    def test_calculate_metrics_matches_individual_calculations(self) -> None:
+        """Should agree with the separate total and allocation methods."""
+        service = PortfolioCalculationService()
+        portfolio, prices = create_test_portfolio()
+
+        metrics = service.calculate_metrics(portfolio, prices)
+
+        assert metrics.total_value == service.calculate_total_value(portfolio, prices)
+        assert metrics.position_count == 4
+        assert metrics.position_allocations == service.calculate_position_allocations(
+            portfolio,
+            prices,
+        )
+        assert metrics.industry_allocation == service.calculate_industry_allocations(
+            portfolio,
+            prices,
+        )
+
+    def test_calculate_metrics_empty_portfolio(self) -> None:
+        """Should return zero metrics for an empty portfolio."""
+        metrics = PortfolioCalculationService().calculate_metrics([], {})
+
+        assert metrics.total_value == Money.zero()
+        assert metrics.position_count == 0
+        assert metrics.position_allocations == []
+        assert metrics.industry_allocation.allocations == {}
+
+    def test_calculate_metrics_zero_total_value(self) -> None:
+        """Should skip position allocations when everything is worth zero."""
+        stock, quantity, _ = create_test_stock("AAPL", 0.0, 10)
+
+        metrics = PortfolioCalculationService().calculate_metrics(
+            [(stock, quantity)],
+            {"AAPL": Money(Decimal(0))},
+        )
+
+        assert metrics.position_allocations == []
+        assert metrics.industry_allocation.allocations == {"Software": Decimal(0)}
+
+    def test_calculate_metrics_missing_price_raises_error(self) -> None:
+        """Should raise CalculationError when a price is missing."""
+        stock, quantity, _ = create_test_stock("AAPL")
+
+        with pytest.raises(CalculationError):
+            _ = PortfolioCalculationService().calculate_metrics([(stock, quantity)], {})
+
+
+class TestIncrementalAllocation:
+    """Test allocations maintained from running totals."""
+
+    def setup_method(self) -> None:
+        """Set up a tracked test portfolio."""
+        self.service = PortfolioCalculationService()
+        self.portfolio, self.prices = create_test_portfolio()
+        self.allocation = self.service.build_incremental_allocation(
+            self.portfolio,
+            self.prices,
+        )
+
+    def assert_matches_full_calculation(self) -> None:
+        """Assert the tracked metrics equal a from-scratch calculation."""
+        assert self.allocation.metrics() == self.service.calculate_metrics(
+            self.portfolio,
+            self.prices,
+        )
+
+    def test_initial_metrics_match_full_calculation(self) -> None:
+        """Should start from the same metrics as calculate_metrics."""
+        self.assert_matches_full_calculation()
+        assert len(self.allocation) == 4
+        assert "AAPL" in self.allocation
+        assert self.allocation.total_value == Money("8500")
+
+    def test_price_update_matches_full_calculation(self) -> None:
+        """Should revalue one position without a full recomputation."""
+        self.prices["AAPL"] = Money("300")
+
+        assert self.allocation.update_price("AAPL", Money("300"))
+
+        self.assert_matches_full_calculation()
+
+    def test_price_update_ignores_unheld_and_unchanged(self) -> None:
+        """Should report no change for unheld symbols or equal prices."""
+        changed = self.allocation.update_prices(
+            {"AAPL": Money("150"), "NVDA": Money("500"), "GME": Money("25")},
+        )
+
+        assert changed == 1
+        assert self.allocation.total_value == Money("8750")
+
+    def test_metrics_reused_until_change(self) -> None:
+        """Should derive percentages lazily and only once per change."""
+        first = self.allocation.metrics()
+
+        assert self.allocation.metrics() is first
+        _ = self.allocation.update_price("GME", Money("30"))
+        assert self.allocation.metrics() is not first
+
+    def test_set_position_quantity_matches_full_calculation(self) -> None:
+        """Should apply a trade on a held stock at its last price."""
+        stock, _ = self.portfolio[0]
+        self.portfolio[0] = (stock, Quantity(40))
+
+        self.allocation.set_position(stock, Quantity(40))
+
+        self.assert_matches_full_calculation()
+
+    def test_set_position_new_stock_matches_full_calculation(self) -> None:
+        """Should add a new holding at the given price."""
+        stock, quantity, price = create_test_stock("NVDA", 500.00, 2)
+        self.portfolio.append((stock, quantity))
+        self.prices["NVDA"] = price
+
+        self.allocation.set_position(stock, quantity, price)
+
+        self.assert_matches_full_calculation()
+
+    def test_set_position_new_stock_requires_price(self) -> None:
+        """Should reject a new holding without a price."""
+        stock, quantity, _ = create_test_stock("NVDA")
+
+        with pytest.raises(CalculationError):
+            self.allocation.set_position(stock, quantity)
+
+    def test_set_position_industry_change_matches_full_calculation(self) -> None:
+        """Should move a position's value to its new industry."""
+        stock = (
+            Stock.Builder()
+            .with_symbol(StockSymbol("GME"))
+            .with_sector(Sector("Financial Services"))
+            .with_industry_group(IndustryGroup("Banks"))
+            .build()
+        )
+        self.portfolio[3] = (stock, Quantity(50))
+
+        self.allocation.set_position(stock, Quantity(50))
+
+        metrics = self.allocation.metrics()
+        expected = self.service.calculate_metrics(self.portfolio, self.prices)
+        assert metrics.industry_allocation == expected.industry_allocation
+        assert metrics.total_value == expected.total_value
+
+    def test_remove_position(self) -> None:
+        """Should drop a closed position and its empty industry."""
+        stock, quantity, price = create_test_stock("NVDA", 500.00, 2)
+        stock = (
+            Stock.Builder()
+            .with_symbol(stock.symbol)
+            .with_sector(Sector("Financial Services"))
+            .with_industry_group(IndustryGroup("Banks"))
+            .build()
+        )
+        self.allocation.set_position(stock, quantity, price)
+
+        assert self.allocation.remove_position("NVDA")
+        assert self.allocation.remove_position("AAPL")
+        assert not self.allocation.remove_position("NVDA")
+
+        _ = self.portfolio.pop(0)
+        self.assert_matches_full_calculation()
+
+    def test_empty_and_zero_value_portfolios(self) -> None:
+        """Should match calculate_metrics for degenerate portfolios."""
+        stock, quantity, _ = create_test_stock("AAPL", 0.0, 10)
+        zero_prices = {"AAPL": Money(Decimal(0))}
+
+        empty = IncrementalAllocation([], {})
+        zero = IncrementalAllocation([(stock, quantity)], zero_prices)
+
+        assert empty.metrics() == self.service.calculate_metrics([], {})
+        assert zero.metrics() == self.service.calculate_metrics(
+            [(stock, quantity)],
+            zero_prices,
+        )
+
+    def test_missing_price_raises_error(self) -> None:
+        """Should raise CalculationError when a held stock has no price."""
+        with pytest.raises(CalculationError):
+            _ = IncrementalAllocation(self.portfolio, {})
@@ -0,0 +1,268 @@
+"""
+Unit tests for PriceIndicatorService.
+
+Tests the batch moving-average series functions, the incremental indicator
+state, and watchlist-level scanning for hedging candidates.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from src.domain.services.exceptions import InsufficientDataError, ValidationError
+from src.domain.services.price_indicator_service import (
+    IndicatorState,
+    PriceIndicatorConfig,
+    PriceIndicatorService,
+    classify_trend,
+    exponential_moving_average,
+    gap_percentages,
+    rolling_max,
+    simple_moving_average,
+)
+from src.domain.value_objects import StockSymbol, TrendDirection
+
+SMALL_CONFIG = PriceIndicatorConfig(
+    moving_average_window=3,
+    gap_lookback_window=5,
+    trend_lookback=2,
+)
+
+
+def _zigzag(length: int) -> list[float]:
+    """Build a deterministic, gently rising price series with noise."""
+    return [
+        100.0 + index * 0.5 + (3.0 if index % 3 == 0 else -1.0)
+        for index in range(length)
+    ]
+
+
+class TestPriceIndicatorConfig:
+    """Test indicator configuration validation."""
+
+    def test_defaults(self) -> None:
+        """Test default configuration uses the 50-day / one-year windows."""
+        config = PriceIndicatorConfig()
+
+        assert config.moving_average_window == 50
+        assert config.gap_lookback_window == 252
+        assert config.trend_threshold == Decimal("0.01")
+
+    def test_rejects_non_positive_window(self) -> None:
+        """Test windows must be positive."""
+        with pytest.raises(ValidationError, match="moving_average_window"):
+            _ = PriceIndicatorConfig(moving_average_window=0)
+
+
+class TestSeriesFunctions:
+    """Test batch series calculations."""
+
+    def test_simple_moving_average(self) -> None:
+        """Test SMA pads until the first full window."""
+        assert simple_moving_average([1.0, 2.0, 3.0, 4.0], 2) == [None, 1.5, 2.5, 3.5]
+
+    def test_simple_moving_average_short_series(self) -> None:
+        """Test SMA of a series shorter than the window is all None."""
+        assert simple_moving_average([1.0], 2) == [None]
+
+    def test_exponential_moving_average(self) -> None:
+        """Test EMA is seeded with the first SMA then smoothed."""
+        result = exponential_moving_average([1.0, 2.0, 3.0, 4.0], 3)
+
+        assert result == [None, None, 2.0, 3.0]
+
+    def test_exponential_moving_average_short_series(self) -> None:
+        """Test EMA of a series shorter than the window is all None."""
+        assert exponential_moving_average([1.0, 2.0], 3) == [None, None]
+
+    def test_gap_percentages(self) -> None:
+        """Test gap is the percent distance from the average."""
+        assert gap_percentages([110.0, 90.0], [None, 100.0]) == [None, -10.0]
+
+    def test_rolling_max(self) -> None:
+        """Test rolling max skips None and expires old values."""
+        values: list[float | None] = [None, 5.0, 1.0, 2.0, 0.5]
+
+        assert rolling_max(values, 2) == [None, 5.0, 5.0, 2.0, 2.0]
+
+    def test_rolling_max_empty_window(self) -> None:
+        """Test rolling max is None while the window holds no values."""
+        assert rolling_max([None, None], 2) == [None, None]
+
+    @pytest.mark.parametrize(
+        ("close", "average", "earlier", "expected"),
+        [
+            (110.0, 105.0, 100.0, TrendDirection.UPWARD),
+            (90.0, 95.0, 100.0, TrendDirection.DOWNWARD),
+            (110.0, 100.1, 100.0, TrendDirection.SIDEWAYS),
+            (90.0, 105.0, 100.0, TrendDirection.SIDEWAYS),
+        ],
+    )
+    def test_classify_trend(
+        self,
+        close: float,
+        average: float,
+        earlier: float,
+        expected: TrendDirection,
+    ) -> None:
+        """Test trend classification from price and average slope."""
+        assert classify_trend(close, average, earlier, 0.01) == expected
+
+
+class TestIndicatorState:
+    """Test incremental indicator state."""
+
+    def test_not_ready_raises_insufficient_data(self) -> None:
+        """Test snapshot before a full window raises."""
+        state = IndicatorState(StockSymbol("AAPL"), SMALL_CONFIG)
+        state.append(100.0)
+
+        assert not state.is_ready
+        assert state.bar_count == 1
+        with pytest.raises(InsufficientDataError, match="at least 3 bars"):
+            _ = state.snapshot()
+
+    def test_incremental_matches_batch(self) -> None:
+        """Test appending bar by bar gives the same snapshot as seeding."""
+        closes = _zigzag(40)
+        service = PriceIndicatorService(SMALL_CONFIG)
+        seeded = service.create_state(StockSymbol("AAPL"), closes)
+        incremental = service.create_state(StockSymbol("AAPL"))
+        for close in closes:
+            incremental.append(close)
+
+        assert seeded.snapshot() == incremental.snapshot()
+        assert seeded.bar_count == incremental.bar_count == 40
+
+    def test_append_after_seed_matches_batch(self) -> None:
+        """Test a seeded state absorbs new bars like a fresh full scan."""
+        closes = _zigzag(30)
+        service = PriceIndicatorService(SMALL_CONFIG)
+        state = service.create_state(StockSymbol("MSFT"), closes[:20])
+        for close in closes[20:]:
+            state.append(close)
+
+        expected = service.create_state(StockSymbol("MSFT"), closes).snapshot()
+        assert state.snapshot() == expected
+
+    def test_snapshot_values(self) -> None:
+        """Test snapshot values against hand-computed indicators."""
+        closes = [100.0, 100.0, 100.0, 106.0]
+        state = PriceIndicatorService(SMALL_CONFIG).create_state(
+            StockSymbol("AAPL"),
+            closes,
+        )
+
+        snapshot = state.snapshot()
+
+        assert snapshot.moving_average == Decimal("102.0")
+        assert snapshot.exponential_average == Decimal("103.0")
+        assert snapshot.gap_percentage == Decimal("3.921569")
+        assert snapshot.max_gap_percentage == snapshot.gap_percentage
+        assert snapshot.is_at_max_gap
+        assert snapshot.trend_direction == TrendDirection.UPWARD
+
+    def test_gap_max_expires_after_lookback(self) -> None:
+        """Test an old gap peak drops out of the rolling maximum."""
+        state = PriceIndicatorService(SMALL_CONFIG).create_state(
+            StockSymbol("AAPL"),
+            [100.0, 100.0, 130.0],
+        )
+        peak = state.snapshot().max_gap_percentage
+        for _ in range(6):
+            state.append(100.0)
+
+        assert state.snapshot().max_gap_percentage < peak
+
+    def test_volatility_score_is_clamped(self) -> None:
+        """Test wild price swings saturate the volatility score at 1."""
+        state = PriceIndicatorService(SMALL_CONFIG).create_state(
+            StockSymbol("TSLA"),
+            [100.0, 200.0, 100.0, 200.0],
+        )
+
+        assert state.snapshot().volatility_score == Decimal("1.0")
+
+    def test_volatility_score_without_returns(self) -> None:
+        """Test a single-bar window has zero volatility."""
+        config = PriceIndicatorConfig(moving_average_window=1, trend_lookback=1)
+        state = PriceIndicatorService(config).create_state(StockSymbol("AAPL"), [50.0])
+
+        assert state.snapshot().volatility_score == Decimal("0")
+
+    def test_periodic_resync_keeps_average(self) -> None:
+        """Test the running sum stays exact across many appends."""
+        state = IndicatorState(StockSymbol("AAPL"), SMALL_CONFIG)
+        for _ in range(1024):  # One full resync interval
+            state.append(100.1)
+
+        assert state.snapshot().moving_average == Decimal("100.1")
+
+    def test_seed_twice_rejected(self) -> None:
+        """Test seeding a state that already holds bars raises."""
+        state = PriceIndicatorService(SMALL_CONFIG).create_state(
+            StockSymbol("AAPL"),
+            [1.0],
+        )
+
+        with pytest.raises(ValidationError, match="seeded once"):
+            state.seed([2.0])
+
+    def test_rejects_non_positive_close(self) -> None:
+        """Test non-positive prices are rejected."""
+        state = IndicatorState(StockSymbol("AAPL"), SMALL_CONFIG)
+
+        with pytest.raises(ValidationError, match="positive"):
+            state.append(0.0)
+
+    def test_symbol_property(self) -> None:
+        """Test state exposes its symbol."""
+        assert IndicatorState(StockSymbol("AAPL"), SMALL_CONFIG).symbol == StockSymbol(
+            "AAPL",
+        )
+
+
+class TestPriceIndicatorService:
+    """Test watchlist-level indicator operations."""
+
+    def test_default_config(self) -> None:
+        """Test service uses default configuration when none is given."""
+        assert PriceIndicatorService().config == PriceIndicatorConfig()
+
+    def test_snapshots_skip_short_histories(self) -> None:
+        """Test symbols without a full window are omitted."""
+        service = PriceIndicatorService(SMALL_CONFIG)
+        states = service.scan(
+            {StockSymbol("AAPL"): _zigzag(10), StockSymbol("NEW"): [10.0]},
+        )
+
+        assert list(service.snapshots(states)) == [StockSymbol("AAPL")]
+
+    def test_hedge_candidates_sorted_by_gap(self) -> None:
+        """Test candidates are at their max gap, largest gap first."""
+        service = PriceIndicatorService(SMALL_CONFIG)
+        states = service.scan(
+            {
+                StockSymbol("SLOW"): [100.0, 100.0, 100.0, 104.0],
+                StockSymbol("FAST"): [100.0, 100.0, 100.0, 120.0],
+                StockSymbol("DOWN"): [100.0, 100.0, 100.0, 90.0],
+            },
+        )
+
+        candidates = service.hedge_candidates(states)
+
+        assert [c.symbol for c in candidates] == [
+            StockSymbol("FAST"),
+            StockSymbol("SLOW"),
+        ]
+
+    def test_analyze_prices(self) -> None:
+        """Test batch analysis returns PriceAnalysis per ready symbol."""
+        service = PriceIndicatorService(SMALL_CONFIG)
+
+        analyses = service.analyze_prices(
+            {StockSymbol("AAPL"): _zigzag(10), StockSymbol("NEW"): []},
+        )
+
+        assert len(analyses) == 1
+        assert analyses[0].symbol == StockSymbol("AAPL")
@@ -0,0 +1,199 @@
+"""
+Unit tests for TargetEvaluationService.
+
+Tests bulk evaluation of pivot and failure prices through the sorted
+per-stock threshold index.
+"""
+
+from datetime import UTC, datetime
+
+from src.domain.entities.target import Target
+from src.domain.services.target_evaluation_service import (
+    TargetEvaluationService,
+    TargetIndex,
+    TargetTrigger,
+)
+from src.domain.value_objects import Money, TargetStatus
+
+
+def create_target(
+    target_id: str,
+    stock_id: str,
+    pivot: str,
+    failure: str,
+    status: str = "active",
+) -> Target:
+    """Helper to create a target with the given thresholds."""
+    return (
+        Target.Builder()
+        .with_id(target_id)
+        .with_portfolio_id("portfolio-1")
+        .with_stock_id(stock_id)
+        .with_pivot_price(Money(pivot))
+        .with_failure_price(Money(failure))
+        .with_status(TargetStatus(status))
+        .with_created_date(datetime(2024, 1, 1, tzinfo=UTC))
+        .build()
+    )
+
+
+class TestTargetIndex:
+    """Test the sorted threshold index."""
+
+    def test_ignores_inactive_targets(self) -> None:
+        """Test only active targets are indexed."""
+        index = TargetIndex(
+            [
+                create_target("t1", "stock-a", "110", "90"),
+                create_target("t2", "stock-a", "120", "80", status="hit"),
+            ],
+        )
+
+        assert len(index) == 1
+        assert "stock-a" in index
+        assert "stock-b" not in index
+
+    def test_price_between_thresholds_triggers_nothing(self) -> None:
+        """Test a price inside every band leaves targets active."""
+        target = create_target("t1", "stock-a", "110", "90")
+        index = TargetIndex([target])
+
+        assert index.evaluate({"stock-a": Money("100")}) == []
+        assert target.is_active()
+        assert len(index) == 1
+
+    def test_pivot_crossings_found_by_price(self) -> None:
+        """Test every pivot at or below the price is hit."""
+        targets = [
+            create_target("t1", "stock-a", "105", "90"),
+            create_target("t2", "stock-a", "110", "90"),
+            create_target("t3", "stock-a", "120", "90"),
+        ]
+        index = TargetIndex(targets)
+
+        triggers = index.evaluate({"stock-a": Money("110")})
+
+        assert {t.target_id for t in triggers} == {"t1", "t2"}
+        assert all(t.status == "hit" for t in triggers)
+        assert targets[0].is_hit()
+        assert targets[1].is_hit()
+        assert targets[2].is_active()
+        assert len(index) == 1
+
+    def test_failure_crossings_found_by_price(self) -> None:
+        """Test every failure at or above the price has failed."""
+        targets = [
+            create_target("t1", "stock-a", "150", "95"),
+            create_target("t2", "stock-a", "150", "90"),
+            create_target("t3", "stock-a", "150", "80"),
+        ]
+        index = TargetIndex(targets)
+
+        triggers = index.evaluate({"stock-a": Money("90")})
+
+        assert {t.target_id for t in triggers} == {"t1", "t2"}
+        assert all(t.status == "failed" for t in triggers)
+        assert targets[0].is_failed()
+        assert targets[1].is_failed()
+        assert targets[2].is_active()
+
+    def test_resolved_targets_are_not_triggered_again(self) -> None:
+        """Test replaying prices yields no duplicate triggers."""
+        index = TargetIndex(
+            [
+                create_target("t1", "stock-a", "110", "90"),
+                create_target("t2", "stock-a", "130", "70"),
+            ],
+        )
+        _ = index.evaluate({"stock-a": Money("115")})
+
+        assert index.evaluate({"stock-a": Money("115")}) == []
+        # The hit target was removed from the failure side as well
+        triggers = index.evaluate({"stock-a": Money("60")})
+        assert [t.target_id for t in triggers] == ["t2"]
+        assert "stock-a" not in index
+
+    def test_failed_target_removed_from_pivot_side(self) -> None:
+        """Test a failed target cannot later be hit."""
+        index = TargetIndex(
+            [
+                create_target("t1", "stock-a", "110", "90"),
+                create_target("t2", "stock-a", "120", "80"),
+            ],
+        )
+        _ = index.evaluate({"stock-a": Money("85")})
+
+        triggers = index.evaluate({"stock-a": Money("125")})
+
+        assert [t.target_id for t in triggers] == ["t2"]
+        assert triggers[0].status == "hit"
+
+    def test_inverted_thresholds_count_as_hit(self) -> None:
+        """Test a target crossing both thresholds is reported once as hit."""
+        target = create_target("t1", "stock-a", "90", "110")
+        index = TargetIndex([target])
+
+        triggers = index.evaluate({"stock-a": Money("100")})
+
+        assert [(t.target_id, t.status) for t in triggers] == [("t1", "hit")]
+        assert len(index) == 0
+
+    def test_unknown_stock_prices_are_ignored(self) -> None:
+        """Test prices for stocks without targets are skipped."""
+        index = TargetIndex([create_target("t1", "stock-a", "110", "90")])
+
+        assert index.evaluate({"stock-z": Money("1000")}) == []
+
+    def test_batch_across_stocks(self) -> None:
+        """Test one batch resolves targets on several stocks."""
+        index = TargetIndex(
+            [
+                create_target("a1", "stock-a", "110", "90"),
+                create_target("b1", "stock-b", "55", "45"),
+            ],
+        )
+
+        triggers = index.evaluate(
+            {"stock-a": Money("111"), "stock-b": Money("44")},
+        )
+
+        assert {(t.target_id, t.status) for t in triggers} == {
+            ("a1", "hit"),
+            ("b1", "failed"),
+        }
+
+
+class TestTargetEvaluationService:
+    """Test the target evaluation domain service."""
+
+    def test_evaluate_single_batch(self) -> None:
+        """Test one-shot evaluation of targets against prices."""
+        service = TargetEvaluationService()
+        targets = [create_target("t1", "stock-a", "110", "90")]
+
+        triggers = service.evaluate(targets, {"stock-a": Money("112.50")})
+
+        assert triggers == [
+            TargetTrigger("t1", "stock-a", "hit", Money("112.50")),
+        ]
+
+    def test_status_updates(self) -> None:
+        """Test triggers collapse into a status mapping."""
+        triggers = [
+            TargetTrigger("t1", "stock-a", "hit", Money("110")),
+            TargetTrigger("t2", "stock-b", "failed", Money("40")),
+        ]
+
+        assert TargetEvaluationService.status_updates(triggers) == {
+            "t1": "hit",
+            "t2": "failed",
+        }
+
+    def test_build_index(self) -> None:
+        """Test the service builds a reusable index."""
+        index = TargetEvaluationService().build_index(
+            [create_target("t1", "stock-a", "110", "90")],
+        )
+
+        assert isinstance(index, TargetIndex)
+        assert len(index) == 1
@@ -9,6 +9,7 @@ from decimal import Decimal
 
 from src.domain.value_objects import Money
 from src.domain.value_objects.metrics import (
+    IndicatorSnapshot,
     PortfolioAllocation,
     PortfolioMetrics,
     PositionAllocation,
@@ -450,3 +451,43 @@ class TestPriceAnalysis:
         )
 
         assert analysis.is_volatile
+
+
+class TestIndicatorSnapshot:
+    """Test IndicatorSnapshot value object."""
+
+    @staticmethod
+    def _snapshot(gap: str, max_gap: str) -> IndicatorSnapshot:
+        return IndicatorSnapshot(
+            symbol=StockSymbol("AAPL"),
+            current_price=Money(Decimal("110.00")),
+            moving_average=Decimal("100"),
+            exponential_average=Decimal("101"),
+            gap_percentage=Decimal(gap),
+            max_gap_percentage=Decimal(max_gap),
+            trend_direction=TrendDirection.UPWARD,
+            volatility_score=Decimal("0.4"),
+        )
+
+    def test_is_at_max_gap_when_gap_equals_max(self) -> None:
+        """Test a positive gap at its lookback maximum triggers hedging."""
+        assert self._snapshot("10", "10").is_at_max_gap
+
+    def test_is_not_at_max_gap_below_max(self) -> None:
+        """Test a gap below its lookback maximum does not trigger."""
+        assert not self._snapshot("5", "10").is_at_max_gap
+
+    def test_is_not_at_max_gap_when_below_average(self) -> None:
+        """Test a price under its moving average never triggers."""
+        assert not self._snapshot("-2", "-2").is_at_max_gap
+
+    def test_to_price_analysis(self) -> None:
+        """Test conversion keeps the shared price analysis fields."""
+        snapshot = self._snapshot("10", "12")
+
+        analysis = snapshot.to_price_analysis()
+
+        assert analysis.symbol == snapshot.symbol
+        assert analysis.current_price == snapshot.current_price
+        assert analysis.trend_direction == TrendDirection.UPWARD
+        assert analysis.volatility_score == Decimal("0.4")
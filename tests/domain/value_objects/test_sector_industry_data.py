@@ -2,7 +2,14 @@
 Tests for sector_industry_data module.
 """
 
+import pytest
+
 from src.domain.value_objects.sector_industry_data import (
+    SECTOR_INDUSTRY_INDEX,
+    SECTOR_INDUSTRY_MAPPING,
+    SectorIndustryIndex,
+    get_all_valid_industry_groups,
+    get_all_valid_sectors,
     get_sector_for_industry,
 )
 
@@ -15,3 +22,64 @@ class TestSectorIndustryData:
         # Test an industry that doesn't exist in any sector
         result = get_sector_for_industry("UnknownIndustryGroup")
         assert result is None
+
+    def test_get_sector_for_industry_returns_owning_sector(self) -> None:
+        """Test that every mapped industry resolves to its sector."""
+        for sector, industries in SECTOR_INDUSTRY_MAPPING.items():
+            for industry in industries:
+                assert get_sector_for_industry(industry) == sector
+
+    def test_listing_functions_match_mapping(self) -> None:
+        """Test that listings match the mapping and return fresh lists."""
+        assert get_all_valid_sectors() == list(SECTOR_INDUSTRY_MAPPING)
+        industries = get_all_valid_industry_groups()
+        assert industries == sorted(
+            industry
+            for sector_industries in SECTOR_INDUSTRY_MAPPING.values()
+            for industry in sector_industries
+        )
+
+        industries.clear()
+        assert get_all_valid_industry_groups()
+
+
+class TestSectorIndustryIndex:
+    """Test suite for the precomputed SectorIndustryIndex."""
+
+    def test_index_is_read_only(self) -> None:
+        """Test that the shared index cannot be modified."""
+        with pytest.raises(AttributeError):
+            SECTOR_INDUSTRY_INDEX.sectors = ()  # type: ignore[misc]
+        with pytest.raises(TypeError):
+            SECTOR_INDUSTRY_INDEX.sector_by_industry["Software"] = "Energy"  # type: ignore[index]
+
+    def test_is_valid_combination(self) -> None:
+        """Test sector-industry membership checks."""
+        assert SECTOR_INDUSTRY_INDEX.is_valid_combination("Technology", "Software")
+        assert not SECTOR_INDUSTRY_INDEX.is_valid_combination("Energy", "Software")
+        assert not SECTOR_INDUSTRY_INDEX.is_valid_combination("Unknown", "Software")
+
+    def test_codes_round_trip(self) -> None:
+        """Test that integer codes decode back to their names."""
+        for sector in SECTOR_INDUSTRY_INDEX.sectors:
+            code = SECTOR_INDUSTRY_INDEX.sector_code(sector)
+            assert code is not None
+            assert SECTOR_INDUSTRY_INDEX.sectors[code] == sector
+        for industry in SECTOR_INDUSTRY_INDEX.industry_groups:
+            code = SECTOR_INDUSTRY_INDEX.industry_group_code(industry)
+            assert code is not None
+            assert SECTOR_INDUSTRY_INDEX.industry_groups[code] == industry
+
+        assert SECTOR_INDUSTRY_INDEX.sector_code("Unknown") is None
+        assert SECTOR_INDUSTRY_INDEX.industry_group_code("Unknown") is None
+
+    def test_build_keeps_first_sector_for_duplicate_industry(self) -> None:
+        """Test that an industry listed twice belongs to the first sector."""
+        index = SectorIndustryIndex.build(
+            {"Alpha": ["Shared", "Only Alpha"], "Beta": ["Shared"]},
+        )
+
+        assert index.sector_by_industry["Shared"] == "Alpha"
+        assert index.industry_groups == ("Shared", "Only Alpha")
+        assert index.sorted_industry_groups == ("Only Alpha", "Shared", "Shared")
+        assert index.is_valid_combination("Beta", "Shared")
@@ -0,0 +1,54 @@
+"""Tests for the stock query specification."""
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from src.domain.value_objects import STOCK_SORT_FIELDS, StockQuerySpec, StockSortKey
+
+
+class TestStockSortKey:
+    """Test sort key validation."""
+
+    @pytest.mark.parametrize("field", STOCK_SORT_FIELDS)
+    def test_accepts_sortable_fields(self, field: str) -> None:
+        """Should accept every field of the whitelist, ascending by default."""
+        key = StockSortKey(field)
+
+        assert key.field == field
+        assert key.descending is False
+
+    def test_rejects_unknown_field(self) -> None:
+        """Should refuse fields outside the whitelist."""
+        with pytest.raises(ValueError, match="Cannot sort stocks by 'price'"):
+            _ = StockSortKey("price")
+
+
+class TestStockQuerySpec:
+    """Test the stock query specification."""
+
+    def test_default_spec_is_empty(self) -> None:
+        """Should neither filter nor sort by default."""
+        assert StockQuerySpec().is_empty
+
+    @pytest.mark.parametrize(
+        "spec",
+        [
+            StockQuerySpec(sector="Technology"),
+            StockQuerySpec(symbol_prefix="AA"),
+            StockQuerySpec(sort=(StockSortKey("symbol"),)),
+        ],
+    )
+    def test_spec_with_filter_or_sort_is_not_empty(
+        self,
+        spec: StockQuerySpec,
+    ) -> None:
+        """Should report any filter or sort key as non-empty."""
+        assert not spec.is_empty
+
+    def test_is_immutable(self) -> None:
+        """Should refuse changes after construction."""
+        spec = StockQuerySpec(grade="A")
+
+        with pytest.raises(FrozenInstanceError):
+            spec.grade = "B"  # type: ignore[misc]
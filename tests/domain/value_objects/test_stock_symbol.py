@@ -5,6 +5,14 @@ Following TDD approach - these tests define the expected behavior
 before implementation.
 """
 
+# pyright: reportPrivateUsage=false
+
+import copy
+import pickle
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from src.domain.value_objects.stock_symbol import StockSymbol
@@ -156,17 +164,127 @@ class TestStockSymbol:
         symbol = StockSymbol("AAPL")
         assert symbol.value == "AAPL"
 
-    def test_stock_symbol_setattr_during_initialization(self) -> None:
-        """Test that __setattr__ allows setting attributes during initialization."""
-        # Create a partially initialized object
-        symbol = object.__new__(StockSymbol)
+    def test_stock_symbol_rejects_new_attributes(self) -> None:
+        """Test that slots leave no instance dict to add attributes to."""
+        symbol = StockSymbol("AAPL")
 
-        # This exercises the super().__setattr__ branch (line 62)
-        symbol.test_attr = "test_value"
+        with pytest.raises(AttributeError):
+            symbol.test_attr = "test_value"
+        assert not hasattr(symbol, "__dict__")
 
-        # Now properly initialize the object
-        StockSymbol.__init__(symbol, "AAPL")
-        assert symbol.value == "AAPL"
+    def test_stock_symbol_interns_equal_symbols(self) -> None:
+        """Test that raw and normalized inputs share one instance."""
+        symbol = StockSymbol("AAPL")
+
+        assert StockSymbol(" aapl ") is symbol
+        assert StockSymbol("aapl") is symbol
+        assert StockSymbol("AAPL") is symbol
+
+    def test_stock_symbol_invalid_input_not_cached(self) -> None:
+        """Test that invalid symbols raise on every construction."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="only uppercase letters"):
+                _ = StockSymbol("A1")
+
+    def test_stock_symbol_cache_is_bounded(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the cache evicts its oldest entries when full."""
+        StockSymbol.clear_cache()
+        monkeypatch.setattr(StockSymbol, "CACHE_MAX_SIZE", 2)
+
+        first = StockSymbol("AAPL")
+        _ = StockSymbol("MSFT")
+        _ = StockSymbol("GOOGL")
+
+        again = StockSymbol("AAPL")
+        assert again is not first
+        assert again == first
+        assert hash(again) == hash(first)
+        StockSymbol.clear_cache()
+
+    def test_stock_symbol_cache_info_counts_hits_and_misses(self) -> None:
+        """Test that cache statistics track lookups and reset with the cache."""
+        StockSymbol.clear_cache()
+
+        _ = StockSymbol("AAPL")
+        _ = StockSymbol("AAPL")
+        _ = StockSymbol(" aapl ")
+        _ = StockSymbol("MSFT")
+
+        info = StockSymbol.cache_info()
+        assert (info.hits, info.misses) == (2, 2)
+        assert info.currsize == 3  # Raw " aapl " is remembered too
+        assert info.maxsize == StockSymbol.CACHE_MAX_SIZE
+
+        StockSymbol.clear_cache()
+        assert StockSymbol.cache_info()[:2] == (0, 0)
+
+    def test_stock_symbol_cache_is_thread_safe(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that concurrent construction with eviction keeps the cache sound."""
+        StockSymbol.clear_cache()
+        monkeypatch.setattr(StockSymbol, "CACHE_MAX_SIZE", 8)
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        raw = [
+            form.format(letter)
+            for form in ("A{}", " b{}", "c{} ")
+            for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+        ]
+
+        def construct(worker: int) -> list[str]:
+            """Construct every symbol, starting at a per-worker offset."""
+            shifted = raw[worker:] + raw[:worker]
+            return [StockSymbol(symbol).value for symbol in shifted * 20]
+
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(construct, range(8)))
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        for worker, values in enumerate(results):
+            shifted = raw[worker:] + raw[:worker]
+            assert values == [symbol.strip().upper() for symbol in shifted * 20]
+        info = StockSymbol.cache_info()
+        assert info.hits + info.misses == 8 * 20 * len(raw)
+        assert info.currsize <= 8
+        StockSymbol.clear_cache()
+
+    def test_stock_symbol_racing_misses_share_one_instance(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that threads validating the same symbol at once get one instance."""
+        StockSymbol.clear_cache()
+        barrier = threading.Barrier(2, timeout=5)
+        validate = StockSymbol._validate  # noqa: SLF001
+
+        def validate_together(normalized: str) -> None:
+            """Validate only once both threads have missed the cache."""
+            _ = barrier.wait()
+            validate(normalized)
+
+        monkeypatch.setattr(StockSymbol, "_validate", validate_together)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first, second = pool.map(StockSymbol, ["MSFT", "MSFT"])
+
+        assert first is second
+        assert StockSymbol.cache_info()[:2] == (0, 2)
+        StockSymbol.clear_cache()
+
+    def test_stock_symbol_copy_and_pickle_preserve_identity(self) -> None:
+        """Test that copies and unpickled symbols resolve to the interned one."""
+        symbol = StockSymbol("AAPL")
+
+        assert copy.copy(symbol) is symbol
+        assert copy.deepcopy(symbol) is symbol
+        assert pickle.loads(pickle.dumps(symbol)) is symbol  # noqa: S301
 
     def test_stock_symbol_is_valid_with_type_error(self) -> None:
         """Test is_valid returns False when normalize raises TypeError."""
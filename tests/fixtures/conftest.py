@@ -14,6 +14,7 @@ from .infrastructure import (
     mock_target_repository,
     mock_transaction_repository,
     mock_unit_of_work,
+    query_log,
     sample_stocks,
     seed_test_portfolio_sqlalchemy,
     seed_test_stocks_sqlalchemy,
@@ -31,6 +32,7 @@ __all__ = [
     "mock_target_repository",
     "mock_transaction_repository",
     "mock_unit_of_work",
+    "query_log",
     "sample_stocks",
     "seed_test_portfolio_sqlalchemy",
     "seed_test_stocks_sqlalchemy",
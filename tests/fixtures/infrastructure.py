@@ -6,12 +6,14 @@ This module provides:
 2. Mock repository fixtures
 3. Test data builder for Stock
 4. SQLAlchemy-based data seeding functions
+5. Query count assertions
 """
 
 # pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
 # pyright: reportUnusedVariable=false, reportUnknownArgumentType=false
 
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from unittest.mock import Mock
 
@@ -29,6 +31,7 @@ from src.domain.repositories.interfaces import (
     IStockRepository,
     ITargetRepository,
     ITransactionRepository,
+    JournalSearchPage,
 )
 from src.domain.value_objects import (
     CompanyName,
@@ -38,6 +41,7 @@ from src.domain.value_objects import (
     Sector,
     StockSymbol,
 )
+from src.infrastructure.persistence.query_budget import QueryLog, record_queries
 from src.infrastructure.persistence.tables import metadata
 from src.infrastructure.persistence.tables.portfolio_table import portfolio_table
 from src.infrastructure.persistence.tables.stock_table import stock_table
@@ -109,6 +113,11 @@ def sqlalchemy_connection(
 # =============================================================================
 
 
+def _updated_stock(_stock_id: str, stock: Stock) -> Stock:
+    """Return the stock passed to update_and_get, as if stored unchanged."""
+    return stock
+
+
 @pytest.fixture
 def mock_stock_repository() -> Mock:
     """
@@ -121,10 +130,14 @@ def mock_stock_repository() -> Mock:
 
     # Set up default return values
     mock.create.return_value = "stock-123"
+    mock.create_many.return_value = 0
     mock.get_by_id.return_value = None
     mock.get_by_symbol.return_value = None
+    mock.get_many_by_ids.return_value = {}
+    mock.get_many_by_symbols.return_value = {}
     mock.get_all.return_value = []
     mock.update.return_value = True
+    mock.update_and_get.side_effect = _updated_stock
     mock.delete.return_value = True
     mock.exists_by_symbol.return_value = False
 
@@ -166,6 +179,8 @@ def mock_transaction_repository() -> Mock:
 
     # Set up default return values
     mock.create.return_value = "transaction-123"
+    mock.create_many.return_value = 0
+    mock.count_stored.return_value = {}
     mock.get_by_id.return_value = None
     mock.get_by_portfolio.return_value = []
     mock.get_by_stock.return_value = []
@@ -194,6 +209,7 @@ def mock_target_repository() -> Mock:
     mock.get_all_active.return_value = []
     mock.update.return_value = True
     mock.update_status.return_value = True
+    mock.bulk_update_status.return_value = 0
 
     return mock
 
@@ -236,6 +252,8 @@ def mock_journal_repository() -> Mock:
     mock.get_by_stock.return_value = []
     mock.get_by_transaction.return_value = []
     mock.get_by_date_range.return_value = []
+    mock.get_by_tag.return_value = []
+    mock.search.return_value = JournalSearchPage(results=[], next_cursor=None)
     mock.update.return_value = True
     mock.delete.return_value = True
 
@@ -519,3 +537,53 @@ def seed_test_portfolio_sqlalchemy(
     _ = conn.execute(stmt)
     # Don't commit here - let the caller manage transactions
     return portfolio_id
+
+
+# =============================================================================
+# Query Count Assertions
+# =============================================================================
+
+
+@contextmanager
+def assert_max_queries(
+    limit: int,
+    *,
+    max_repeats: int | None = None,
+) -> Iterator[QueryLog]:
+    """
+    Assert that a block executes at most ``limit`` statements.
+
+    Works as a context manager or as a test decorator::
+
+        with assert_max_queries(2):
+            service.get_all_stocks()
+
+        @assert_max_queries(1)
+        def test_lookup() -> None: ...
+
+    Args:
+        limit: Maximum number of statements
+        max_repeats: When given, also fail if one statement shape runs more
+            than this many times with different parameters (N+1 queries)
+
+    Yields:
+        QueryLog: Statements recorded so far
+    """
+    with record_queries() as log:
+        yield log
+    assert log.count <= limit, f"Expected at most {limit} queries\n{log.describe()}"
+    if max_repeats is not None:
+        repeated = log.repeated(max_repeats + 1)
+        assert not repeated, f"Possible N+1 queries\n{log.describe()}"
+
+
+@pytest.fixture
+def query_log() -> Generator[QueryLog, None, None]:
+    """
+    Record every statement executed during a test.
+
+    Yields:
+        QueryLog: Statements executed so far
+    """
+    with record_queries() as log:
+        yield log
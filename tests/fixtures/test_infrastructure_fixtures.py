@@ -5,7 +5,7 @@ This module tests that all fixtures work correctly and provide
 the expected functionality for infrastructure testing.
 """
 
-# pyright: reportUnusedImport=false, reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false, reportUnusedCallResult=false, reportUnnecessaryTypeIgnoreComment=false
+# pyright: reportUnusedImport=false, reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false, reportUnusedCallResult=false, reportUnnecessaryTypeIgnoreComment=false, reportArgumentType=false
 
 from typing import cast
 from unittest.mock import Mock
@@ -20,10 +20,13 @@ from src.domain.repositories.interfaces import (
     IStockRepository,
 )
 from src.domain.value_objects import StockSymbol
+from src.infrastructure.persistence.database_connection import SqlAlchemyConnection
+from src.infrastructure.persistence.query_budget import QueryLog
 from src.infrastructure.persistence.tables.stock_table import stock_table
 
 from .infrastructure import (
     StockBuilder,
+    assert_max_queries,
     seed_test_portfolio_sqlalchemy,
     seed_test_stocks_sqlalchemy,
 )
@@ -296,3 +299,68 @@ class TestSQLAlchemyFixtures:
         assert row is not None
         assert row.name == "Test Portfolio"
         assert row.currency == "USD"
+
+
+class TestQueryCountAssertions:
+    """Test the query count helpers."""
+
+    def test_passes_within_limit(self, sqlalchemy_connection: Connection) -> None:
+        """Should record statements and pass within the limit."""
+        adapter = SqlAlchemyConnection(sqlalchemy_connection)
+
+        with assert_max_queries(1) as log:
+            _ = adapter.execute(select(stock_table))
+
+        assert log.count == 1
+
+    def test_fails_over_limit(self, sqlalchemy_connection: Connection) -> None:
+        """Should fail with the statements listed."""
+        adapter = SqlAlchemyConnection(sqlalchemy_connection)
+
+        def run() -> None:
+            """Execute two statements with a limit of one."""
+            with assert_max_queries(1):
+                _ = adapter.execute(select(stock_table))
+                _ = adapter.execute(select(stock_table))
+
+        with pytest.raises(AssertionError, match="Expected at most 1 queries"):
+            run()
+
+    def test_fails_on_repeated_statements(
+        self,
+        sqlalchemy_connection: Connection,
+    ) -> None:
+        """Should fail when one shape repeats more often than allowed."""
+        adapter = SqlAlchemyConnection(sqlalchemy_connection)
+
+        def run() -> None:
+            """Look up three stocks one at a time."""
+            with assert_max_queries(10, max_repeats=2):
+                for symbol in ("AAPL", "MSFT", "GOOG"):
+                    _ = adapter.execute(
+                        select(stock_table).where(stock_table.c.symbol == symbol),
+                    )
+
+        with pytest.raises(AssertionError, match="Possible N\\+1 queries"):
+            run()
+
+    def test_passes_without_repeats(self, sqlalchemy_connection: Connection) -> None:
+        """Should accept distinct statements under a repeat limit."""
+        adapter = SqlAlchemyConnection(sqlalchemy_connection)
+
+        with assert_max_queries(2, max_repeats=1):
+            _ = adapter.execute(select(stock_table))
+
+    @assert_max_queries(0)
+    def test_decorates_tests(self) -> None:
+        """Should apply to a whole test when used as a decorator."""
+
+    def test_query_log_fixture(
+        self,
+        query_log: QueryLog,
+        sqlalchemy_connection: Connection,
+    ) -> None:
+        """Should record statements executed during the test."""
+        _ = SqlAlchemyConnection(sqlalchemy_connection).execute(select(stock_table))
+
+        assert query_log.count == 1
@@ -70,6 +70,13 @@ class TestDatabaseConfigDefaults:
         assert config.connection_timeout == 30
         assert config.foreign_keys_enabled is True
         assert config.row_factory == "dict"
+        assert config.group_commit_enabled is False
+        assert config.group_commit_max_batch == 64
+        assert config.group_commit_max_delay == 0.005
+        assert config.query_budget_max_queries == 0
+        assert config.query_budget_max_repeats == 0
+        assert config.query_budget_raise is False
+        assert config.binary_ids is False
 
     def test_get_connection_string_default(self) -> None:
         """Test connection string retrieval for main database."""
@@ -133,6 +140,42 @@ class TestDatabaseConfigEnvironment:
         config = DatabaseConfig()
         assert config.row_factory == "row"
 
+    @patch.dict(os.environ, {"STOCKBOOK_DB_BINARY_IDS": "true"})
+    def test_binary_ids_from_env(self) -> None:
+        """Test enabling 16-byte ID storage from environment."""
+        config = DatabaseConfig()
+        assert config.binary_ids is True
+
+    @patch.dict(
+        os.environ,
+        {
+            "STOCKBOOK_DB_GROUP_COMMIT": "true",
+            "STOCKBOOK_DB_GROUP_COMMIT_MAX_BATCH": "16",
+            "STOCKBOOK_DB_GROUP_COMMIT_MAX_DELAY": "0.01",
+        },
+    )
+    def test_group_commit_from_env(self) -> None:
+        """Test enabling and tuning group commit from environment."""
+        config = DatabaseConfig()
+        assert config.group_commit_enabled is True
+        assert config.group_commit_max_batch == 16
+        assert config.group_commit_max_delay == 0.01
+
+    @patch.dict(
+        os.environ,
+        {
+            "STOCKBOOK_DB_QUERY_BUDGET": "20",
+            "STOCKBOOK_DB_QUERY_BUDGET_MAX_REPEATS": "5",
+            "STOCKBOOK_DB_QUERY_BUDGET_RAISE": "true",
+        },
+    )
+    def test_query_budget_from_env(self) -> None:
+        """Test setting the query budget from environment."""
+        config = DatabaseConfig()
+        assert config.query_budget_max_queries == 20
+        assert config.query_budget_max_repeats == 5
+        assert config.query_budget_raise is True
+
     @patch.dict(
         os.environ,
         {
@@ -0,0 +1 @@
+"""Tests for broker transaction export readers."""
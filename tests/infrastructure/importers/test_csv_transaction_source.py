@@ -0,0 +1,107 @@
+"""Tests for CsvTransactionSource."""
+
+from pathlib import Path
+
+import pytest
+
+from src.application.interfaces.transaction_import import RawTransaction, RejectedRow
+from src.infrastructure.importers import CsvTransactionSource
+
+
+def write_csv(tmp_path: Path, content: bytes) -> Path:
+    """Helper to write a CSV export."""
+    path = tmp_path / "export.csv"
+    _ = path.write_bytes(content)
+    return path
+
+
+class TestCsvTransactionSource:
+    """Test reading broker CSV exports."""
+
+    def test_reads_records_with_byte_offsets(self, tmp_path: Path) -> None:
+        """Should map broker columns and report the bytes each line spans."""
+        header = (
+            b"\xef\xbb\xbfRun Date,Action,Symbol,Quantity,Price ($),Description\r\n"
+        )
+        first = b'01/15/2024,YOU BOUGHT,AAPL,10,"1,150.25",Opening lot\r\n'
+        second = b"2024-02-01,Sell,msft,-5,300,\r\n"
+        path = write_csv(tmp_path, header + first + second)
+
+        records = list(CsvTransactionSource(path).read())
+
+        assert records == [
+            RawTransaction(
+                offset=len(header),
+                end_offset=len(header + first),
+                symbol="AAPL",
+                transaction_type="buy",
+                quantity="10",
+                price="1,150.25",
+                transaction_date="2024-01-15T00:00:00",
+                notes="Opening lot",
+            ),
+            RawTransaction(
+                offset=len(header + first),
+                end_offset=len(header + first + second),
+                symbol="msft",
+                transaction_type="sell",
+                quantity="-5",
+                price="300",
+                transaction_date="2024-02-01",
+            ),
+        ]
+
+    def test_resumes_from_offset(self, tmp_path: Path) -> None:
+        """Should skip to the checkpoint but still read the header."""
+        header = b"symbol;type;quantity;price;date\n"
+        first = b"AAPL;buy;1;10;01-Jan-2024\n"
+        path = write_csv(tmp_path, header + first + b"MSFT;buy;2;20;01-Feb-2024\n")
+        source = CsvTransactionSource(path, delimiter=";")
+
+        records = list(source.read(start_offset=len(header + first)))
+
+        assert len(records) == 1
+        assert isinstance(records[0], RawTransaction)
+        assert records[0].symbol == "MSFT"
+        assert records[0].transaction_date == "2024-02-01T00:00:00"
+        assert next(iter(source.read(start_offset=3))) == next(iter(source.read()))
+
+    def test_numbers_identical_fills_from_the_start(self, tmp_path: Path) -> None:
+        """Should count repeated fills in file order, also when resuming."""
+        header = b"symbol,type,quantity,price,date\n"
+        fill = b"AAPL,buy,10,100,2024-01-15\n"
+        other = b"MSFT,buy,1,1,x\n"
+        path = write_csv(tmp_path, header + fill + other + b" aapl" + fill[4:])
+        source = CsvTransactionSource(path)
+
+        records = list(source.read())
+        resumed = list(source.read(start_offset=len(header + fill)))
+
+        assert [r.occurrence for r in records if isinstance(r, RawTransaction)] == [
+            1,
+            1,
+            2,
+        ]
+        assert resumed == records[1:]
+
+    def test_rejects_unreadable_lines(self, tmp_path: Path) -> None:
+        """Should reject short and undecodable lines and skip blank ones."""
+        path = write_csv(
+            tmp_path,
+            b"symbol,type,quantity,price,date\n\n\xff\xfe\nAAPL,buy\nAAPL,hold,1,2,x\n",
+        )
+
+        records = list(CsvTransactionSource(path).read())
+
+        assert records[0] == RejectedRow(33, 36, "Line is not valid text")
+        assert records[1] == RejectedRow(36, 45, "Expected at least 5 fields")
+        assert isinstance(records[2], RawTransaction)
+        assert records[2].transaction_type == "hold"
+        assert records[2].transaction_date == "x"
+
+    def test_missing_column_raises(self, tmp_path: Path) -> None:
+        """Should refuse files without a required column."""
+        path = write_csv(tmp_path, b"symbol,type,quantity,date\n")
+
+        with pytest.raises(ValueError, match="no price column"):
+            _ = list(CsvTransactionSource(path).read())
@@ -0,0 +1,90 @@
+"""Integration tests importing broker exports into a real database."""
+
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false, reportCallIssue=false, reportArgumentType=false
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.engine import Engine
+
+from src.application.services.transaction_import_service import (
+    TransactionImportService,
+)
+from src.infrastructure.importers import CsvTransactionSource
+from src.infrastructure.persistence.tables import (
+    metadata,
+    portfolio_table,
+    stock_table,
+    transaction_table,
+)
+from src.infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
+
+EXPORT = b"""Date,Action,Symbol,Quantity,Price
+01/15/2024,YOU BOUGHT,AAPL,10,150.25
+01/16/2024,YOU BOUGHT,MSFT,5,400
+01/16/2024,YOU BOUGHT,MSFT,5,400
+01/17/2024,DIVIDEND,MSFT,,
+01/18/2024,YOU SOLD,AAPL,-4,155
+"""
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Engine:
+    """Provide a file database with one portfolio and one stock."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'import.db'}")
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        _ = connection.execute(
+            insert(portfolio_table).values(id="portfolio-1", name="Family"),
+        )
+        _ = connection.execute(
+            insert(stock_table).values(id="stock-aapl", symbol="AAPL"),
+        )
+    return engine
+
+
+class TestTransactionImportIntegration:
+    """Test the import pipeline from a CSV file to stored transactions."""
+
+    def test_import_is_idempotent_and_resumable(
+        self,
+        engine: Engine,
+        tmp_path: Path,
+    ) -> None:
+        """Should store each fill once, however often the file is imported.
+
+        The two identical MSFT lines are separate fills and both stored.
+        """
+        path = tmp_path / "export.csv"
+        _ = path.write_bytes(EXPORT)
+        service = TransactionImportService(SqlAlchemyUnitOfWork(engine), chunk_size=2)
+        source = CsvTransactionSource(path)
+
+        first = service.import_transactions(source, "portfolio-1")
+        # After the header and the first two fills
+        halfway = len(b"".join(EXPORT.splitlines(keepends=True)[:3]))
+        resumed = service.import_transactions(
+            source,
+            "portfolio-1",
+            start_offset=halfway,
+        )
+
+        assert (first.imported, first.duplicates, first.rejected) == (4, 0, 1)
+        assert first.stocks_created == 1
+        assert first.checkpoint == len(EXPORT)
+        assert (resumed.read, resumed.imported, resumed.duplicates) == (3, 0, 2)
+        with engine.connect() as connection:
+            stored = connection.execute(
+                select(transaction_table.c.transaction_type, stock_table.c.symbol)
+                .select_from(transaction_table.join(stock_table))
+                .order_by(transaction_table.c.transaction_date),
+            ).all()
+            symbols = connection.execute(select(stock_table.c.symbol)).scalars()
+            assert sorted(symbols) == ["AAPL", "MSFT"]
+        assert [tuple(row) for row in stored] == [
+            ("BUY", "AAPL"),
+            ("BUY", "MSFT"),
+            ("BUY", "MSFT"),
+            ("SELL", "AAPL"),
+        ]
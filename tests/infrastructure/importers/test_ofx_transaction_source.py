@@ -0,0 +1,114 @@
+"""Tests for OfxTransactionSource."""
+
+from pathlib import Path
+
+from src.application.interfaces.transaction_import import RawTransaction, RejectedRow
+from src.infrastructure.importers import OfxTransactionSource
+
+BUY = b"""<BUYSTOCK><INVBUY><INVTRAN><FITID>1<DTTRADE>20240115093000.000[-5:EST]
+<MEMO>Opening lot</INVTRAN><SECID><UNIQUEID>037833100<UNIQUEIDTYPE>CUSIP</SECID>
+<UNITS>10<UNITPRICE>150.25<TOTAL>-1502.50</INVBUY><BUYTYPE>BUY</BUYSTOCK>
+"""
+SELL = b"""<SELLMF><INVSELL><INVTRAN><FITID>2<DTTRADE>20240201</INVTRAN>
+<SECID><UNIQUEID>922908363<UNIQUEIDTYPE>CUSIP</SECID><UNITS>-5<UNITPRICE>400
+</INVSELL><SELLTYPE>SELL</SELLMF>
+"""
+INCOMPLETE = b"<SELLSTOCK><INVSELL><UNITS>-1</INVSELL></SELLSTOCK>\n"
+SECURITIES = b"""<SECLIST><STOCKINFO><SECINFO><SECID><UNIQUEID>037833100
+<UNIQUEIDTYPE>CUSIP</SECID><NAME>Apple Inc<TICKER>AAPL</SECINFO></STOCKINFO>
+<STOCKINFO><SECINFO><SECID><UNIQUEID>999<UNIQUEIDTYPE>CUSIP</SECID></SECINFO>
+</STOCKINFO></SECLIST>
+"""
+HEADER = b"OFXHEADER:100\nDATA:OFXSGML\n\n<OFX><INVSTMTRS><INVTRANLIST>\n"
+
+
+def write_ofx(tmp_path: Path, *parts: bytes) -> Path:
+    """Helper to write an OFX statement."""
+    path = tmp_path / "statement.ofx"
+    _ = path.write_bytes(b"".join(parts))
+    return path
+
+
+class TestOfxTransactionSource:
+    """Test reading OFX investment statements."""
+
+    def test_reads_trades_with_tickers_from_security_list(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Should resolve CUSIPs through the security list after the trades."""
+        path = write_ofx(tmp_path, HEADER, BUY, SELL, b"</INVTRANLIST>", SECURITIES)
+
+        records = list(OfxTransactionSource(path, read_size=7).read())
+
+        start = len(HEADER)
+        assert records == [
+            RawTransaction(
+                offset=start,
+                end_offset=start + len(BUY) - 1,
+                symbol="AAPL",
+                transaction_type="buy",
+                quantity="10",
+                price="150.25",
+                transaction_date="2024-01-15T09:30:00-05:00",
+                notes="Opening lot",
+            ),
+            RawTransaction(
+                offset=start + len(BUY),
+                end_offset=start + len(BUY) + len(SELL) - 1,
+                symbol="922908363",
+                transaction_type="sell",
+                quantity="5",
+                price="400",
+                transaction_date="2024-02-01T00:00:00",
+            ),
+        ]
+
+    def test_resumes_from_offset(self, tmp_path: Path) -> None:
+        """Should skip trades before the checkpoint."""
+        path = write_ofx(tmp_path, HEADER, BUY, SELL, SECURITIES)
+
+        records = list(OfxTransactionSource(path).read(len(HEADER) + len(BUY)))
+
+        assert len(records) == 1
+        assert isinstance(records[0], RawTransaction)
+        assert records[0].transaction_type == "sell"
+
+    def test_numbers_identical_trades_by_fitid(self, tmp_path: Path) -> None:
+        """Should count trades with new FITIDs and repeat known ones."""
+        twin = BUY.replace(b"<FITID>1", b"<FITID>1b")
+        path = write_ofx(tmp_path, HEADER, BUY, twin, BUY, SECURITIES)
+        source = OfxTransactionSource(path)
+
+        records = list(source.read())
+        resumed = list(source.read(len(HEADER) + len(BUY)))
+
+        assert [r.occurrence for r in records if isinstance(r, RawTransaction)] == [
+            1,
+            2,
+            1,
+        ]
+        assert resumed == records[1:]
+
+    def test_rejects_incomplete_trades(self, tmp_path: Path) -> None:
+        """Should reject trades missing a field and ignore unterminated ones."""
+        path = write_ofx(tmp_path, HEADER, INCOMPLETE, b"<BUYSTOCK><UNITS>1")
+
+        records = list(OfxTransactionSource(path).read())
+
+        assert records == [
+            RejectedRow(
+                len(HEADER),
+                len(HEADER) + len(INCOMPLETE) - 1,
+                "SELLSTOCK has no UNIQUEID",
+            ),
+        ]
+
+    def test_unknown_date_format_is_passed_through(self, tmp_path: Path) -> None:
+        """Should leave dates it cannot read for validation to reject."""
+        path = write_ofx(tmp_path, HEADER, BUY.replace(b"20240115093000.000", b"x"))
+
+        records = list(OfxTransactionSource(path).read())
+
+        assert isinstance(records[0], RawTransaction)
+        assert records[0].transaction_date == "x[-5:EST]"
@@ -26,6 +26,7 @@ class TestJournalEntryTable:
         assert "id" in columns
         assert "portfolio_id" in columns
         assert "stock_id" in columns
+        assert "transaction_id" in columns
         assert "entry_type" in columns
         assert "title" in columns
         assert "content" in columns
@@ -69,19 +70,21 @@ class TestJournalEntryTable:
         # Nullable columns (optional relationships)
         assert columns["portfolio_id"].nullable is True
         assert columns["stock_id"].nullable is True
+        assert columns["transaction_id"].nullable is True
         assert columns["tags"].nullable is True
 
     def test_journal_entry_table_foreign_keys(self) -> None:
         """Test that journal_entry table has correct foreign key relationships."""
         foreign_keys = list(journal_entry_table.foreign_keys)
 
-        # Should have two foreign keys (even if nullable)
-        assert len(foreign_keys) == 2
+        # Should have three foreign keys (even if nullable)
+        assert len(foreign_keys) == 3
 
         # Check foreign key targets
         fk_targets = {fk.target_fullname for fk in foreign_keys}
         assert "portfolios.id" in fk_targets
         assert "stocks.id" in fk_targets
+        assert "transactions.id" in fk_targets
 
     def test_entry_type_check_constraint(self) -> None:
         """Test that entry_type has a check constraint for valid values."""
@@ -162,6 +165,7 @@ class TestJournalEntryTable:
             "id",
             "portfolio_id",
             "stock_id",
+            "transaction_id",
             "entry_type",
             "title",
             "content",
@@ -169,5 +173,6 @@ class TestJournalEntryTable:
             "entry_date",
             "created_at",
             "updated_at",
+            "version",
         }
         assert column_names == expected_columns
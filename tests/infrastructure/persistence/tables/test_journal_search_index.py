@@ -0,0 +1,120 @@
+"""Tests for the journal full-text search index."""
+
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false, reportArgumentType=false
+
+import sqlalchemy as sa
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+
+from src.infrastructure.persistence.tables import (
+    journal_entry_table,
+    journal_search_table,
+    metadata,
+)
+from src.infrastructure.persistence.tables.journal_search_index import (
+    JOURNAL_SEARCH_TABLE,
+    create_journal_search_index,
+    verify_journal_search_index,
+)
+
+
+class TestJournalSearchIndex:
+    """Test suite for the journal FTS5 index DDL hook."""
+
+    def test_index_created_with_schema(self, temp_database: Engine) -> None:
+        """Test that create_all also creates the FTS5 table and triggers."""
+        metadata.create_all(temp_database)
+
+        inspector = inspect(temp_database)
+        assert JOURNAL_SEARCH_TABLE in inspector.get_table_names()
+        with temp_database.connect() as connection:
+            triggers = connection.execute(
+                sa.text("SELECT name FROM sqlite_master WHERE type = 'trigger'"),
+            ).scalars()
+            assert set(triggers) >= {
+                "journal_entries_fts_insert",
+                "journal_entries_fts_delete",
+                "journal_entries_fts_update",
+            }
+
+    def test_index_skipped_without_journal_table(self, temp_database: Engine) -> None:
+        """Test that creating unrelated tables does not create the index."""
+        metadata.create_all(temp_database, tables=[metadata.tables["stocks"]])
+
+        assert JOURNAL_SEARCH_TABLE not in inspect(temp_database).get_table_names()
+
+    def test_existing_entries_indexed_on_creation(self, temp_database: Engine) -> None:
+        """Test that entries written before the index existed become searchable."""
+        metadata.create_all(temp_database)
+        with temp_database.begin() as connection:
+            for trigger in ("insert", "delete", "update"):
+                _ = connection.execute(
+                    sa.text(f"DROP TRIGGER {JOURNAL_SEARCH_TABLE}_{trigger}"),
+                )
+            _ = connection.execute(sa.text(f"DROP TABLE {JOURNAL_SEARCH_TABLE}"))
+            _ = connection.execute(
+                sa.insert(journal_entry_table).values(
+                    id="j1",
+                    entry_type="NOTE",
+                    title="Earnings",
+                    content="Earnings beat",
+                ),
+            )
+
+            create_journal_search_index(connection)
+
+            matches = connection.execute(
+                sa.select(journal_search_table.c.rowid).where(
+                    sa.text(f"{JOURNAL_SEARCH_TABLE} MATCH 'beat'"),
+                ),
+            ).all()
+        assert len(matches) == 1
+
+    def test_verify_keeps_matching_index(self, temp_database: Engine) -> None:
+        """Test that an index in sync with the entries is not rebuilt."""
+        metadata.create_all(temp_database)
+        with temp_database.begin() as connection:
+            _ = connection.execute(
+                sa.insert(journal_entry_table).values(
+                    id="j1",
+                    entry_type="NOTE",
+                    title="Earnings",
+                    content="Earnings beat",
+                ),
+            )
+
+            assert not verify_journal_search_index(connection)
+
+    def test_verify_rebuilds_after_rowids_change(self, temp_database: Engine) -> None:
+        """Test that renumbered entries, as after VACUUM, are found again."""
+        metadata.create_all(temp_database)
+        with temp_database.begin() as connection:
+            _ = connection.execute(
+                sa.insert(journal_entry_table).values(
+                    id="j1",
+                    entry_type="NOTE",
+                    title="Earnings",
+                    content="Earnings beat",
+                ),
+            )
+            # Changing only the rowid leaves the index pointing at old rowids
+            _ = connection.execute(
+                sa.text("UPDATE journal_entries SET rowid = rowid + 100"),
+            )
+
+            assert verify_journal_search_index(connection)
+
+            matches = connection.execute(
+                sa.select(journal_search_table.c.rowid).where(
+                    sa.text(f"{JOURNAL_SEARCH_TABLE} MATCH 'beat'"),
+                ),
+            ).scalars()
+            rowids = connection.execute(
+                sa.text("SELECT rowid FROM journal_entries"),
+            ).scalars()
+            assert list(matches) == list(rowids)
+
+    def test_verify_skips_missing_index(self, temp_database: Engine) -> None:
+        """Test that a database without the index is left alone."""
+        with temp_database.begin() as connection:
+            assert not verify_journal_search_index(connection)
@@ -0,0 +1,42 @@
+"""Tests for journal tag table definition."""
+
+import sqlalchemy as sa
+
+from src.infrastructure.persistence.tables.journal_tag_table import (
+    journal_tag_table,
+    metadata,
+)
+
+
+class TestJournalTagTable:
+    """Test suite for journal tag table definition."""
+
+    def test_journal_tag_table_exists(self) -> None:
+        """Test that journal_tags table is defined on the shared metadata."""
+        assert journal_tag_table.name == "journal_tags"
+        assert journal_tag_table.metadata is metadata
+
+    def test_primary_key_is_entry_and_tag(self) -> None:
+        """Test that each (entry, tag) pair is stored once."""
+        assert [col.name for col in journal_tag_table.primary_key.columns] == [
+            "entry_id",
+            "tag",
+        ]
+        assert isinstance(journal_tag_table.c.tag.type, sa.String)
+
+    def test_entry_foreign_key_cascades(self) -> None:
+        """Test that tags are removed with their journal entry."""
+        (foreign_key,) = journal_tag_table.foreign_keys
+
+        assert foreign_key.target_fullname == "journal_entries.id"
+        assert foreign_key.ondelete == "CASCADE"
+
+    def test_tag_lookup_index(self) -> None:
+        """Test that tag lookups are covered by an index."""
+        indexes = {index.name: index for index in journal_tag_table.indexes}
+
+        assert "idx_journal_tags_tag" in indexes
+        assert [col.name for col in indexes["idx_journal_tags_tag"].columns] == [
+            "tag",
+            "entry_id",
+        ]
@@ -0,0 +1,35 @@
+"""Tests for event outbox table definition."""
+
+from src.infrastructure.persistence.tables.outbox_table import metadata, outbox_table
+
+
+class TestOutboxTable:
+    """Test suite for event outbox table definition."""
+
+    def test_outbox_table_exists(self) -> None:
+        """Test that outbox_events table is defined on the shared metadata."""
+        assert outbox_table.name == "outbox_events"
+        assert outbox_table.metadata is metadata
+
+    def test_sequence_is_primary_key(self) -> None:
+        """Test that messages are ordered by an autoincrementing sequence."""
+        assert [col.name for col in outbox_table.primary_key.columns] == ["sequence"]
+
+    def test_event_id_is_unique(self) -> None:
+        """Test that an event is stored once."""
+        assert outbox_table.c.event_id.unique
+        assert not outbox_table.c.event_id.nullable
+
+    def test_dispatched_at_is_nullable(self) -> None:
+        """Test that pending messages have no dispatch time."""
+        assert outbox_table.c.dispatched_at.nullable
+
+    def test_pending_index(self) -> None:
+        """Test that pending message scans are covered by an index."""
+        indexes = {index.name: index for index in outbox_table.indexes}
+
+        assert "idx_outbox_pending" in indexes
+        assert [col.name for col in indexes["idx_outbox_pending"].columns] == [
+            "dispatched_at",
+            "sequence",
+        ]
@@ -160,5 +160,6 @@ class TestPortfolioBalanceTable:
             "average_cost",
             "created_at",
             "updated_at",
+            "version",
         }
         assert column_names == expected_columns
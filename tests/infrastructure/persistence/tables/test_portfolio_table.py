@@ -98,5 +98,6 @@ class TestPortfolioTable:
             "currency",
             "created_at",
             "updated_at",
+            "version",
         }
         assert column_names == expected_columns
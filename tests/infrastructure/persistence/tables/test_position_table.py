@@ -163,6 +163,7 @@ class TestPositionTable:
             "last_transaction_date",
             "created_at",
             "updated_at",
+            "version",
         }
         assert column_names == expected_columns
 
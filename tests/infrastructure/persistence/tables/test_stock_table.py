@@ -44,6 +44,7 @@ class TestStockTableDefinition:
             "notes",
             "created_at",
             "updated_at",
+            "version",
         }
         assert column_names == expected_columns
 
@@ -113,12 +114,15 @@ class TestStockTableDefinition:
         symbol_column = stock_table.c.symbol
         assert symbol_column.unique is True
 
-        # Check for any additional indexes
-        index_names = {idx.name for idx in stock_table.indexes if idx.name}
-        # At minimum, we should have indexes on commonly queried fields
-        # The actual index names will depend on implementation
-        # For now, we just verify the table can have indexes
-        assert isinstance(index_names, set)
+        # Listing filters compare these columns for equality
+        indexed = {
+            idx.name: [col.name for col in idx.columns] for idx in stock_table.indexes
+        }
+        assert indexed == {
+            "idx_stocks_sector": ["sector"],
+            "idx_stocks_industry_group": ["industry_group"],
+            "idx_stocks_grade": ["grade"],
+        }
 
     def test_column_types_are_explicit(self) -> None:
         """Should use explicit SQLAlchemy types, not generic ones."""
@@ -130,6 +134,8 @@ class TestStockTableDefinition:
             # For SQLite compatibility, Text/String are acceptable
             if column.name in ["created_at", "updated_at"]:
                 assert isinstance(column.type, types.DateTime)
+            elif column.name == "version":
+                assert isinstance(column.type, types.Integer)
             else:
                 assert isinstance(column.type, String | Text)
 
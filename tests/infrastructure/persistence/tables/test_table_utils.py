@@ -4,23 +4,36 @@ Tests the factory functions that provide common column patterns
 for SQLAlchemy Core table definitions.
 """
 
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+# pyright: reportArgumentType=false
+
+import uuid
+from unittest.mock import patch
+
 import pytest
 from sqlalchemy import (
     Column,
     DateTime,
+    Integer,
     MetaData,
     String,
     Table,
     create_engine,
     insert,
+    select,
+    text,
 )
 
+from src.infrastructure.config import database_config
 from src.infrastructure.persistence.tables.table_utils import (
+    BinaryId,
     base_columns,
+    entity_id_type,
     enum_check_constraint,
     foreign_key_column,
     id_column,
     timestamp_columns,
+    version_column,
 )
 
 
@@ -56,6 +69,43 @@ class TestIdColumn:
         assert test_table.columns["id"].primary_key is True
 
 
+class TestBinaryId:
+    """Test the 16-byte entity ID type."""
+
+    def test_round_trips_uuid_text_through_sixteen_bytes(self) -> None:
+        """Should store 16 bytes and read back the same UUID text."""
+        metadata = MetaData()
+        test_table = Table(
+            "binary_entities",
+            metadata,
+            Column("id", BinaryId(), primary_key=True),
+            Column("parent_id", BinaryId(), nullable=True),
+        )
+        engine = create_engine("sqlite:///:memory:")
+        metadata.create_all(engine)
+        identifier = str(uuid.uuid4())
+
+        with engine.connect() as connection:
+            _ = connection.execute(insert(test_table).values(id=identifier))
+            found = connection.execute(
+                select(test_table).where(test_table.c.id == identifier),
+            ).one()
+            stored = connection.execute(
+                text("SELECT id FROM binary_entities"),
+            ).scalar_one()
+
+        assert found.id == identifier
+        assert found.parent_id is None
+        assert stored == uuid.UUID(identifier).bytes
+
+    def test_id_columns_use_binary_type_when_enabled(self) -> None:
+        """Should switch ID and foreign key columns to BinaryId."""
+        with patch.object(database_config, "binary_ids", new=True):
+            assert isinstance(entity_id_type(), BinaryId)
+            assert isinstance(id_column().type, BinaryId)
+            assert isinstance(foreign_key_column("stock_id", "stocks").type, BinaryId)
+
+
 class TestTimestampColumns:
     """Test timestamp columns factory function."""
 
@@ -114,16 +164,17 @@ class TestBaseColumns:
     """Test base columns factory function."""
 
     def test_creates_all_base_columns(self) -> None:
-        """Should create id, created_at, and updated_at columns."""
+        """Should create id, created_at, updated_at, and version columns."""
         # Act
         columns = base_columns()
 
         # Assert
-        assert len(columns) == 3
+        assert len(columns) == 4
         column_names = [col.name for col in columns]
         assert "id" in column_names
         assert "created_at" in column_names
         assert "updated_at" in column_names
+        assert "version" in column_names
 
     def test_base_columns_in_table_definition(self) -> None:
         """Should provide all common columns when used in table."""
@@ -145,7 +196,7 @@ class TestBaseColumns:
         assert test_table.columns["id"].primary_key is True
 
     def test_base_columns_order(self) -> None:
-        """Should return columns in correct order: id, created_at, updated_at."""
+        """Should return columns in order: id, created_at, updated_at, version."""
         # Act
         columns = base_columns()
 
@@ -153,6 +204,23 @@ class TestBaseColumns:
         assert columns[0].name == "id"
         assert columns[1].name == "created_at"
         assert columns[2].name == "updated_at"
+        assert columns[3].name == "version"
+
+
+class TestVersionColumn:
+    """Test row version column factory function."""
+
+    def test_creates_version_column(self) -> None:
+        """Should create a non-nullable integer column starting at 1."""
+        # Act
+        column = version_column()
+
+        # Assert
+        assert column.name == "version"
+        assert isinstance(column.type, Integer)
+        assert column.nullable is False
+        assert column.server_default is not None
+        assert str(column.server_default.arg) == "1"
 
 
 class TestForeignKeyColumn:
@@ -279,8 +347,8 @@ class TestTableUtilsIntegration:
 
         # Assert
         assert (
-            len(test_table.columns) == 6
-        )  # id, created_at, updated_at, customer_id, status, total_amount
+            len(test_table.columns) == 7
+        )  # id, created_at, updated_at, version, customer_id, status, total_amount
         assert test_table.columns["id"].primary_key is True
         assert "customer_id" in test_table.columns
         assert "status" in test_table.columns
@@ -309,11 +377,11 @@ class TestTableUtilsIntegration:
         assert "test_entities" in inspector.get_table_names()
 
         # Test insert with auto-generated timestamps
-        with engine.connect() as conn:  # type: ignore[var-annotated]
-            conn.execute(  # type: ignore[no-untyped-call]
+        with engine.connect() as conn:
+            conn.execute(
                 insert(test_table).values(
                     id="test-id-1",
                     name="Test Entity",
                 ),
             )
-            conn.commit()  # type: ignore[no-untyped-call]
+            conn.commit()
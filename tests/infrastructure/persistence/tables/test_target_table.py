@@ -23,7 +23,11 @@ class TestTargetTable:
         assert "id" in columns
         assert "portfolio_id" in columns
         assert "stock_id" in columns
-        assert "target_percentage" in columns
+        assert "pivot_price" in columns
+        assert "failure_price" in columns
+        assert "status" in columns
+        assert "created_date" in columns
+        assert "notes" in columns
         assert "created_at" in columns
         assert "updated_at" in columns
 
@@ -35,7 +39,10 @@ class TestTargetTable:
         assert isinstance(columns["id"].type, sa.String)
         assert isinstance(columns["portfolio_id"].type, sa.String)
         assert isinstance(columns["stock_id"].type, sa.String)
-        assert isinstance(columns["target_percentage"].type, sa.Numeric)
+        assert isinstance(columns["pivot_price"].type, sa.Numeric)
+        assert isinstance(columns["failure_price"].type, sa.Numeric)
+        assert isinstance(columns["status"].type, sa.String)
+        assert isinstance(columns["created_date"].type, sa.DateTime)
         assert isinstance(columns["created_at"].type, sa.DateTime)
         assert isinstance(columns["updated_at"].type, sa.DateTime)
 
@@ -50,7 +57,10 @@ class TestTargetTable:
         assert columns["id"].nullable is False
         assert columns["portfolio_id"].nullable is False
         assert columns["stock_id"].nullable is False
-        assert columns["target_percentage"].nullable is False
+        assert columns["pivot_price"].nullable is False
+        assert columns["failure_price"].nullable is False
+        assert columns["status"].nullable is False
+        assert columns["notes"].nullable is True
         assert columns["created_at"].nullable is False
         assert columns["updated_at"].nullable is False
 
@@ -66,40 +76,45 @@ class TestTargetTable:
         assert "portfolios.id" in fk_targets
         assert "stocks.id" in fk_targets
 
-    def test_target_table_unique_constraint(self) -> None:
-        """Test that target table has unique constraint on portfolio_id + stock_id."""
-        # Check for composite unique constraint
-        constraints = [
-            c for c in target_table.constraints if isinstance(c, sa.UniqueConstraint)
+    def test_target_table_status_check_constraint(self) -> None:
+        """Test that status is limited to the target lifecycle values."""
+        constraints = {
+            c.name: c
+            for c in target_table.constraints
+            if isinstance(c, sa.CheckConstraint)
+        }
+
+        assert "ck_target_status" in constraints
+        sql_text = str(constraints["ck_target_status"].sqltext)
+        for status in ("active", "hit", "failed", "cancelled"):
+            assert f"'{status}'" in sql_text
+
+    def test_target_table_indexes(self) -> None:
+        """Test that active-target monitoring queries are indexed."""
+        indexes = {index.name: index for index in target_table.indexes}
+
+        assert [c.name for c in indexes["idx_target_status_stock"].columns] == [
+            "status",
+            "stock_id",
         ]
-        assert len(constraints) >= 1
-
-        # Find the constraint with both columns
-        found = False
-        for constraint in constraints:
-            col_names = {col.name for col in constraint.columns}
-            if col_names == {"portfolio_id", "stock_id"}:
-                found = True
-                break
-        assert found, "Missing unique constraint on (portfolio_id, stock_id)"
-
-    def test_target_percentage_precision(self) -> None:
-        """Test that target_percentage has correct precision for percentages."""
+        assert "idx_target_portfolio" in indexes
+
+    def test_price_precision(self) -> None:
+        """Test that pivot and failure prices keep sub-cent precision."""
         columns = {col.name: col for col in target_table.columns}
-        percentage_type = columns["target_percentage"].type
 
-        # Should be Numeric with precision for percentages (e.g., 99.99%)
-        assert isinstance(percentage_type, sa.Numeric)
-        assert percentage_type.precision is not None
-        assert percentage_type.precision >= 5
-        assert percentage_type.scale is not None
-        assert percentage_type.scale >= 2
+        for name in ("pivot_price", "failure_price"):
+            price_type = columns[name].type
+            assert isinstance(price_type, sa.Numeric)
+            assert price_type.precision == 15
+            assert price_type.scale == 4
 
     def test_target_table_defaults(self) -> None:
         """Test that target table has correct default values."""
         columns = {col.name: col for col in target_table.columns}
 
         # Timestamps should have defaults
+        assert columns["status"].server_default is not None
         assert columns["created_at"].server_default is not None
         assert columns["updated_at"].server_default is not None
 
@@ -130,8 +145,13 @@ class TestTargetTable:
             "id",
             "portfolio_id",
             "stock_id",
-            "target_percentage",
+            "pivot_price",
+            "failure_price",
+            "status",
+            "created_date",
+            "notes",
             "created_at",
             "updated_at",
+            "version",
         }
         assert column_names == expected_columns
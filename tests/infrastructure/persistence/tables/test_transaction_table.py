@@ -183,5 +183,6 @@ class TestTransactionTable:
             "transaction_date",
             "created_at",
             "updated_at",
+            "version",
         }
         assert column_names == expected_columns
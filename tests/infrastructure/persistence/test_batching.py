@@ -0,0 +1,36 @@
+"""Tests for batched query helpers."""
+
+import pytest
+
+from src.infrastructure.persistence.batching import MAX_IN_PARAMETERS, in_chunks
+
+
+class TestInChunks:
+    """Test splitting lookup keys for IN queries."""
+
+    def test_splits_into_chunks_of_at_most_size(self) -> None:
+        """Should yield full chunks followed by the remainder."""
+        assert list(in_chunks(range(7), size=3)) == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_drops_duplicates_keeping_first_seen_order(self) -> None:
+        """Should bind each key once."""
+        assert list(in_chunks(["b", "a", "b", "c", "a"], size=2)) == [
+            ["b", "a"],
+            ["c"],
+        ]
+
+    def test_empty_keys_yield_nothing(self) -> None:
+        """Should yield no chunks, so callers run no query."""
+        assert list(in_chunks(list[str]())) == []
+
+    def test_default_size_stays_below_sqlite_limit(self) -> None:
+        """Should keep chunks below SQLite's historical 999 parameter limit."""
+        chunks = list(in_chunks(range(2_000)))
+
+        assert MAX_IN_PARAMETERS < 999
+        assert [len(chunk) for chunk in chunks] == [900, 900, 200]
+
+    def test_rejects_size_below_one(self) -> None:
+        """Should reject chunk sizes that cannot make progress."""
+        with pytest.raises(ValueError, match="at least 1"):
+            _ = list(in_chunks([1], size=0))
@@ -0,0 +1,81 @@
+"""Tests for classifying integrity errors by constraint."""
+
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, exc, insert
+
+from src.infrastructure.persistence.constraints import violated_constraint
+from src.infrastructure.persistence.tables import (
+    metadata,
+    position_table,
+    stock_table,
+)
+
+
+def integrity_error(orig: Exception) -> exc.IntegrityError:
+    """Helper to wrap a driver error the way SQLAlchemy does."""
+    return exc.IntegrityError("INSERT ...", params={}, orig=orig)
+
+
+class TestViolatedConstraint:
+    """Test naming the constraint behind an integrity error."""
+
+    def test_sqlite_unique_violation_is_matched_by_columns(self) -> None:
+        """Should map SQLite's column list to the named constraint."""
+        engine = create_engine("sqlite:///:memory:")
+        metadata.create_all(engine)
+        with engine.connect() as connection:
+            _ = connection.execute(insert(stock_table).values(id="1", symbol="AAPL"))
+            with pytest.raises(exc.IntegrityError) as raised:
+                _ = connection.execute(
+                    insert(stock_table).values(id="2", symbol="AAPL"),
+                )
+
+        assert violated_constraint(raised.value, stock_table) == "uq_stocks_symbol"
+
+    def test_composite_unique_violation(self) -> None:
+        """Should match constraints spanning several columns."""
+        error = integrity_error(
+            Exception(
+                "UNIQUE constraint failed: positions.portfolio_id, positions.stock_id",
+            ),
+        )
+
+        assert violated_constraint(error, position_table) == (
+            "uq_portfolio_stock_position"
+        )
+
+    def test_driver_diagnostics_take_precedence(self) -> None:
+        """Should use the constraint name reported by the driver."""
+        orig = Exception("duplicate key")
+        orig.diag = SimpleNamespace(constraint_name="uq_stocks_symbol")  # type: ignore[attr-defined]
+
+        assert violated_constraint(integrity_error(orig), stock_table) == (
+            "uq_stocks_symbol"
+        )
+
+    def test_quoted_constraint_name_in_message(self) -> None:
+        """Should read PostgreSQL-style messages naming the constraint."""
+        error = integrity_error(
+            Exception('duplicate key value violates unique constraint "uq_x"'),
+        )
+
+        assert violated_constraint(error, stock_table) == "uq_x"
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "FOREIGN KEY constraint failed",
+            "NOT NULL constraint failed: stocks.symbol",
+            "UNIQUE constraint failed: portfolios.name",
+            "UNIQUE constraint failed: stocks.id",
+        ],
+    )
+    def test_unidentified_violations_return_none(self, message: str) -> None:
+        """Should return None for other tables and unnamed constraints."""
+        error = integrity_error(Exception(message))
+
+        assert violated_constraint(error, stock_table) is None
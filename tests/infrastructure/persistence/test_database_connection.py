@@ -6,15 +6,24 @@ protocol to wrap SQLAlchemy connection objects.
 """
 
 # pyright: reportPrivateUsage=false, reportCallIssue=false, reportUnusedCallResult=false
+# pyright: reportUnknownVariableType=false, reportUnknownArgumentType=false, reportArgumentType=false
 
-from unittest.mock import Mock
+from typing import Any
+from unittest.mock import Mock, patch
 
 import pytest
+from sqlalchemy import create_engine, delete, insert, select, text, update
 from sqlalchemy.engine import Connection
 from sqlalchemy.exc import DatabaseError
 
-from src.infrastructure.persistence.database_connection import SqlAlchemyConnection
+from src.infrastructure.persistence.database_connection import (
+    SqlAlchemyConnection,
+    statement_labels,
+)
 from src.infrastructure.persistence.interfaces import IDatabaseConnection
+from src.infrastructure.persistence.query_budget import QueryLog, record_queries
+from src.infrastructure.persistence.tables import metadata, stock_table
+from src.shared.instrumentation import metrics
 
 
 class TestSqlAlchemyConnectionConstruction:
@@ -225,3 +234,99 @@ class TestSqlAlchemyConnectionClose:
 
         # Assert
         assert mock_connection.close.call_count == 2
+
+
+class TestSqlAlchemyConnectionMetrics:
+    """Test statement timing and row counting."""
+
+    @pytest.mark.parametrize(
+        ("statement", "expected"),
+        [
+            (select(stock_table.c.symbol), ("select", "stocks")),
+            (insert(stock_table), ("insert", "stocks")),
+            (update(stock_table), ("update", "stocks")),
+            (delete(stock_table), ("delete", "stocks")),
+            (text("PRAGMA foreign_keys=ON"), ("pragma", "other")),
+            (text("  "), ("other", "other")),
+            (Mock(), ("other", "other")),
+        ],
+    )
+    def test_statement_labels(self, statement: Any, expected: tuple[str, str]) -> None:
+        """Should label statements by operation and main table."""
+        assert statement_labels(statement) == expected
+
+    def test_records_duration_and_rows_affected(self) -> None:
+        """Should time every statement and count rows changed by DML."""
+        duration = metrics.histogram("stockbook_db_statement_duration_seconds", "")
+        rows = metrics.counter("stockbook_db_rows_affected_total", "")
+        selects = duration.count("select", "stocks")
+        inserted = rows.value("insert", "stocks")
+        engine = create_engine("sqlite:///:memory:")
+        metadata.create_all(engine)
+
+        with engine.connect() as connection:
+            adapter = SqlAlchemyConnection(connection)
+            _ = adapter.execute(
+                insert(stock_table),
+                parameters=[
+                    {"id": "stock-1", "symbol": "AAPL"},
+                    {"id": "stock-2", "symbol": "MSFT"},
+                ],
+            )
+            _ = adapter.execute(select(stock_table.c.symbol))
+
+        assert duration.count("select", "stocks") == selects + 1
+        assert rows.value("insert", "stocks") == inserted + 2
+
+    def test_records_duration_of_failed_statements(self) -> None:
+        """Should time statements that raise."""
+        duration = metrics.histogram("stockbook_db_statement_duration_seconds", "")
+        failures = duration.count("other", "other")
+        mock_connection = Mock(spec=Connection)
+        mock_connection.execute.side_effect = DatabaseError("locked", {}, Exception())
+
+        with pytest.raises(DatabaseError, match="locked"):
+            _ = SqlAlchemyConnection(mock_connection).execute(Mock())
+
+        assert duration.count("other", "other") == failures + 1
+
+    def test_disabled_metrics_record_nothing(self) -> None:
+        """Should skip instrumentation entirely when metrics are disabled."""
+        duration = metrics.histogram("stockbook_db_statement_duration_seconds", "")
+        failures = duration.count("other", "other")
+        mock_connection = Mock(spec=Connection)
+        mock_result = Mock()
+        mock_connection.execute.return_value = mock_result
+
+        with patch.object(metrics, "enabled", new=False):
+            result = SqlAlchemyConnection(mock_connection).execute(Mock())
+
+        assert result is mock_result
+        assert duration.count("other", "other") == failures
+
+
+class TestSqlAlchemyConnectionQueryLog:
+    """Test recording statements for query budgets."""
+
+    def test_records_to_own_and_active_logs(self) -> None:
+        """Should add each statement to its log and every active log."""
+        mock_connection = Mock(spec=Connection)
+        own_log = QueryLog()
+        adapter = SqlAlchemyConnection(mock_connection, own_log)
+
+        with record_queries() as active_log:
+            _ = adapter.execute(text("SELECT 1"))
+        _ = adapter.execute(text("SELECT 2"))
+
+        assert own_log.count == 2
+        assert active_log.count == 1
+
+    def test_records_nothing_without_logs(self) -> None:
+        """Should skip compiling statements when nothing is recording."""
+        mock_connection = Mock(spec=Connection)
+        adapter = SqlAlchemyConnection(mock_connection)
+
+        with patch.object(QueryLog, "record") as record:
+            _ = adapter.execute(text("SELECT 1"))
+
+        record.assert_not_called()
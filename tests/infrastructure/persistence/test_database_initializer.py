@@ -1,6 +1,8 @@
 """Tests for database initialization functionality."""
 
 # pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
+# pyright: reportArgumentType=false, reportAttributeAccessIssue=false, reportUnknownArgumentType=false
+# pyright: reportPrivateUsage=false
 
 import tempfile
 from collections.abc import Generator
@@ -10,9 +12,142 @@ from unittest.mock import Mock, patch
 import pytest
 import sqlalchemy as sa
 from sqlalchemy import inspect
-from sqlalchemy.engine import Connection
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import StaticPool
 
-from src.infrastructure.persistence.database_initializer import initialize_database
+from src.infrastructure.persistence.database_initializer import (
+    LEGACY_TARGETS_TABLE,
+    _create_tables_if_schema_changed,
+    _verify_search_index,
+    initialize_database,
+    schema_fingerprint,
+)
+from src.infrastructure.persistence.tables import (
+    metadata,
+    portfolio_table,
+    schema_info_table,
+    stock_table,
+    target_table,
+)
+
+# Tables of the first released schema, as created by its initializer
+BASELINE_SCHEMA = (
+    """
+    CREATE TABLE stocks (
+        id VARCHAR NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+        symbol VARCHAR NOT NULL,
+        company_name VARCHAR,
+        sector VARCHAR,
+        industry_group VARCHAR,
+        grade VARCHAR,
+        notes VARCHAR,
+        PRIMARY KEY (id),
+        UNIQUE (symbol)
+    )
+    """,
+    """
+    CREATE TABLE portfolios (
+        id VARCHAR NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+        name VARCHAR NOT NULL,
+        description VARCHAR,
+        currency VARCHAR DEFAULT 'USD' NOT NULL,
+        PRIMARY KEY (id),
+        UNIQUE (name)
+    )
+    """,
+    """
+    CREATE TABLE journal_entries (
+        id VARCHAR NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+        portfolio_id VARCHAR,
+        stock_id VARCHAR,
+        entry_type VARCHAR NOT NULL,
+        title VARCHAR NOT NULL,
+        content TEXT NOT NULL,
+        tags VARCHAR,
+        entry_date DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+        PRIMARY KEY (id),
+        CONSTRAINT ck_entry_type
+            CHECK (entry_type IN ('RESEARCH', 'DECISION', 'REVIEW', 'NOTE')),
+        FOREIGN KEY(portfolio_id) REFERENCES portfolios (id),
+        FOREIGN KEY(stock_id) REFERENCES stocks (id)
+    )
+    """,
+    "CREATE INDEX idx_portfolio_entries ON journal_entries (portfolio_id)",
+    "CREATE INDEX idx_stock_entries ON journal_entries (stock_id)",
+    "CREATE INDEX idx_entry_date ON journal_entries (entry_date)",
+    """
+    CREATE TABLE portfolio_balances (
+        id VARCHAR NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+        portfolio_id VARCHAR NOT NULL,
+        stock_id VARCHAR NOT NULL,
+        quantity NUMERIC(15, 4) DEFAULT 0 NOT NULL,
+        average_cost NUMERIC(15, 4) DEFAULT 0 NOT NULL,
+        PRIMARY KEY (id),
+        CONSTRAINT uq_portfolio_stock_balance UNIQUE (portfolio_id, stock_id),
+        FOREIGN KEY(portfolio_id) REFERENCES portfolios (id),
+        FOREIGN KEY(stock_id) REFERENCES stocks (id)
+    )
+    """,
+    """
+    CREATE TABLE positions (
+        id VARCHAR NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+        portfolio_id VARCHAR NOT NULL,
+        stock_id VARCHAR NOT NULL,
+        quantity NUMERIC(15, 4) DEFAULT 0 NOT NULL,
+        average_cost NUMERIC(15, 4) DEFAULT 0 NOT NULL,
+        last_transaction_date DATETIME,
+        PRIMARY KEY (id),
+        CONSTRAINT uq_portfolio_stock_position UNIQUE (portfolio_id, stock_id),
+        FOREIGN KEY(portfolio_id) REFERENCES portfolios (id),
+        FOREIGN KEY(stock_id) REFERENCES stocks (id)
+    )
+    """,
+    """
+    CREATE TABLE targets (
+        id VARCHAR NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+        portfolio_id VARCHAR NOT NULL,
+        stock_id VARCHAR NOT NULL,
+        target_percentage NUMERIC(5, 2) NOT NULL,
+        PRIMARY KEY (id),
+        CONSTRAINT uq_portfolio_stock UNIQUE (portfolio_id, stock_id),
+        CONSTRAINT ck_target_percentage_range
+            CHECK (target_percentage >= 0 AND target_percentage <= 100),
+        FOREIGN KEY(portfolio_id) REFERENCES portfolios (id),
+        FOREIGN KEY(stock_id) REFERENCES stocks (id)
+    )
+    """,
+    """
+    CREATE TABLE transactions (
+        id VARCHAR NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+        portfolio_id VARCHAR NOT NULL,
+        stock_id VARCHAR NOT NULL,
+        transaction_type VARCHAR NOT NULL,
+        quantity NUMERIC(15, 4) NOT NULL,
+        price NUMERIC(15, 4) NOT NULL,
+        commission NUMERIC(10, 2) DEFAULT 0,
+        notes VARCHAR,
+        transaction_date DATETIME NOT NULL,
+        PRIMARY KEY (id),
+        CONSTRAINT ck_transaction_type CHECK (transaction_type IN ('BUY', 'SELL')),
+        FOREIGN KEY(portfolio_id) REFERENCES portfolios (id),
+        FOREIGN KEY(stock_id) REFERENCES stocks (id)
+    )
+    """,
+)
 
 
 class TestDatabaseInitializer:
@@ -60,6 +195,15 @@ class TestDatabaseInitializer:
             "portfolio_balances",
             "positions",
             "journal_entries",
+            "journal_tags",
+            "outbox_events",
+            "schema_info",
+            # FTS5 search index and its shadow tables
+            "journal_entries_fts",
+            "journal_entries_fts_config",
+            "journal_entries_fts_data",
+            "journal_entries_fts_docsize",
+            "journal_entries_fts_idx",
         }
         assert set(table_names) == expected_tables
 
@@ -85,6 +229,15 @@ class TestDatabaseInitializer:
             "portfolio_balances",
             "positions",
             "journal_entries",
+            "journal_tags",
+            "outbox_events",
+            "schema_info",
+            # FTS5 search index and its shadow tables
+            "journal_entries_fts",
+            "journal_entries_fts_config",
+            "journal_entries_fts_data",
+            "journal_entries_fts_docsize",
+            "journal_entries_fts_idx",
         }
         assert set(table_names) == expected_tables
 
@@ -154,3 +307,311 @@ class TestDatabaseInitializer:
 
         # No file should be created for memory databases
         # Just verify it doesn't raise an error
+
+    def test_initialize_database_records_schema_fingerprint(
+        self,
+        temp_db_path: str,
+    ) -> None:
+        """Test that the fingerprint of the created schema is stored."""
+        db_url = f"sqlite:///{temp_db_path}"
+        initialize_database(db_url)
+
+        engine = sa.create_engine(db_url)
+        with engine.connect() as conn:
+            stored = conn.execute(sa.select(schema_info_table.c.fingerprint)).all()
+
+        assert stored == [(schema_fingerprint(metadata, engine.dialect),)]
+
+    def test_initialize_database_skips_create_all_for_current_schema(
+        self,
+        temp_db_path: str,
+    ) -> None:
+        """Test that a matching fingerprint skips the table checks."""
+        db_url = f"sqlite:///{temp_db_path}"
+        initialize_database(db_url)
+
+        with patch.object(sa.MetaData, "create_all") as mock_create_all:
+            initialize_database(db_url)
+
+        mock_create_all.assert_not_called()
+
+    def test_initialize_database_creates_tables_when_schema_changed(
+        self,
+        temp_db_path: str,
+    ) -> None:
+        """Test that a stale fingerprint runs create_all and is replaced."""
+        db_url = f"sqlite:///{temp_db_path}"
+        initialize_database(db_url)
+        engine = sa.create_engine(db_url)
+        with engine.begin() as conn:
+            _ = conn.execute(sa.update(schema_info_table).values(fingerprint="old"))
+            _ = conn.execute(sa.text("DROP TABLE targets"))
+
+        initialize_database(db_url)
+
+        assert "targets" in inspect(engine).get_table_names()
+        with engine.connect() as conn:
+            stored = conn.execute(sa.select(schema_info_table.c.fingerprint)).all()
+        assert stored == [(schema_fingerprint(metadata, engine.dialect),)]
+
+    def test_initialize_database_adds_version_to_older_tables(
+        self,
+        temp_db_path: str,
+    ) -> None:
+        """Test that tables created before the version column gain it."""
+        db_url = f"sqlite:///{temp_db_path}"
+        initialize_database(db_url)
+        engine = sa.create_engine(db_url)
+        with engine.begin() as conn:
+            _ = conn.execute(sa.update(schema_info_table).values(fingerprint="old"))
+            for table in ("stocks", "positions"):
+                _ = conn.execute(sa.text(f"ALTER TABLE {table} DROP COLUMN version"))
+            _ = conn.execute(
+                sa.text("INSERT INTO stocks (id, symbol) VALUES ('s', 'A')"),
+            )
+
+        initialize_database(db_url)
+
+        for table in ("stocks", "positions"):
+            columns = {col["name"]: col for col in inspect(engine).get_columns(table)}
+            assert not columns["version"]["nullable"]
+        with engine.connect() as conn:
+            version = conn.execute(sa.text("SELECT version FROM stocks")).scalar()
+        assert version == 1
+
+    def test_fingerprint_waits_for_columns_that_cannot_be_added(self) -> None:
+        """Test that a schema not fully applied is checked again next time."""
+        engine = sa.create_engine("sqlite:///:memory:", poolclass=StaticPool)
+        with engine.begin() as conn:
+            _ = conn.execute(sa.text("CREATE TABLE notes (id INTEGER PRIMARY KEY)"))
+        changed = sa.MetaData()
+        _ = sa.Table(
+            "notes",
+            changed,
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("title", sa.String, nullable=False),
+            sa.Column("body", sa.String),
+            sa.Index("idx_notes_title", "title"),
+            sa.Index("idx_notes_body", "body"),
+        )
+
+        with patch(
+            "src.infrastructure.persistence.database_initializer.logger",
+        ) as mock_logger:
+            assert _create_tables_if_schema_changed(engine, changed)
+
+        columns = [col["name"] for col in inspect(engine).get_columns("notes")]
+        assert columns == ["id", "body"]
+        indexes = [index["name"] for index in inspect(engine).get_indexes("notes")]
+        assert indexes == ["idx_notes_body"]
+        _, unapplied = mock_logger.warning.call_args.args
+        assert unapplied == "notes.title, idx_notes_title"
+        with engine.connect() as conn:
+            stored = conn.execute(sa.select(schema_info_table.c.fingerprint)).all()
+        assert stored == []
+        assert _create_tables_if_schema_changed(engine, changed)
+
+    def test_fingerprint_waits_for_obsolete_required_columns(self) -> None:
+        """Test that a column no longer written but still required is reported."""
+        engine = sa.create_engine("sqlite:///:memory:", poolclass=StaticPool)
+        with engine.begin() as conn:
+            _ = conn.execute(
+                sa.text(
+                    """
+                    CREATE TABLE notes (
+                        id INTEGER PRIMARY KEY,
+                        legacy VARCHAR NOT NULL,
+                        kept VARCHAR NOT NULL DEFAULT 'x',
+                        spare VARCHAR
+                    )
+                    """,
+                ),
+            )
+        changed = sa.MetaData()
+        _ = sa.Table("notes", changed, sa.Column("id", sa.Integer, primary_key=True))
+
+        with patch(
+            "src.infrastructure.persistence.database_initializer.logger",
+        ) as mock_logger:
+            assert _create_tables_if_schema_changed(engine, changed)
+
+        _, unapplied = mock_logger.warning.call_args.args
+        assert unapplied == "notes.legacy"
+        with engine.connect() as conn:
+            stored = conn.execute(sa.select(schema_info_table.c.fingerprint)).all()
+        assert stored == []
+
+    def test_initialize_database_rebuilds_stale_search_index(self) -> None:
+        """Test that the search index is checked even on the fast path."""
+        engine = sa.create_engine("sqlite:///:memory:", poolclass=StaticPool)
+        initialize_database("sqlite:///:memory:", engine=engine)
+        with engine.begin() as conn:
+            _ = conn.execute(
+                sa.text(
+                    """
+                    INSERT INTO journal_entries (id, entry_type, title, content)
+                    VALUES ('j1', 'NOTE', 'Earnings', 'Earnings beat')
+                    """,
+                ),
+            )
+            _ = conn.execute(
+                sa.text("UPDATE journal_entries SET rowid = rowid + 100"),
+            )
+
+        with patch(
+            "src.infrastructure.persistence.database_initializer.logger",
+        ) as mock_logger:
+            initialize_database("sqlite:///:memory:", engine=engine)
+
+        mock_logger.warning.assert_called_once()
+        with engine.connect() as conn:
+            matches = conn.execute(
+                sa.text(
+                    """
+                    SELECT rowid FROM journal_entries_fts
+                    WHERE journal_entries_fts MATCH 'beat'
+                    """,
+                ),
+            ).all()
+        assert matches == [(101,)]
+
+    def test_search_index_check_skipped_on_other_databases(self) -> None:
+        """Test that only SQLite databases have their search index checked."""
+        engine = Mock()
+        engine.dialect.name = "postgresql"
+
+        _verify_search_index(engine)
+
+        engine.begin.assert_not_called()
+
+    def test_initialize_database_keeps_given_engine_open(self) -> None:
+        """Test that a shared engine is used and not disposed."""
+        engine = sa.create_engine("sqlite:///:memory:", poolclass=StaticPool)
+
+        with patch.object(engine, "dispose") as mock_dispose:
+            initialize_database("sqlite:///:memory:", engine=engine)
+
+        mock_dispose.assert_not_called()
+        assert "stocks" in inspect(engine).get_table_names()
+
+
+class TestBaselineUpgrade:
+    """Test suite for upgrading databases created with the baseline schema."""
+
+    @pytest.fixture
+    def engine(self) -> Generator[Engine, None, None]:
+        """Create an in-memory database holding the baseline schema."""
+        engine = sa.create_engine("sqlite:///:memory:", poolclass=StaticPool)
+        with engine.begin() as conn:
+            for statement in BASELINE_SCHEMA:
+                _ = conn.execute(sa.text(statement))
+            _ = conn.execute(
+                sa.insert(portfolio_table).values(id="portfolio-1", name="Family"),
+            )
+            _ = conn.execute(sa.insert(stock_table).values(id="stock-1", symbol="A"))
+        yield engine
+        engine.dispose()
+
+    def test_upgrade_recreates_empty_targets_table(self, engine: Engine) -> None:
+        """Test that an empty allocation targets table gets the new layout."""
+        initialize_database("sqlite:///:memory:", engine=engine)
+
+        inspector = inspect(engine)
+        columns = {col["name"] for col in inspector.get_columns("targets")}
+        assert columns == {col.name for col in target_table.columns}
+        assert LEGACY_TARGETS_TABLE not in inspector.get_table_names()
+        with engine.begin() as conn:
+            _ = conn.execute(
+                sa.insert(target_table).values(
+                    id="t1",
+                    portfolio_id="portfolio-1",
+                    stock_id="stock-1",
+                    pivot_price=110,
+                    failure_price=90,
+                    created_date=sa.func.current_timestamp(),
+                ),
+            )
+
+    def test_upgrade_creates_indexes_of_existing_tables(
+        self,
+        engine: Engine,
+    ) -> None:
+        """Test that indexes added to tables that already exist are created."""
+        initialize_database("sqlite:///:memory:", engine=engine)
+
+        inspector = inspect(engine)
+        for table in metadata.sorted_tables:
+            present = {index["name"] for index in inspector.get_indexes(table.name)}
+            assert {index.name for index in table.indexes} <= present
+        with engine.connect() as conn:
+            rows = conn.execute(
+                sa.text(
+                    "EXPLAIN QUERY PLAN SELECT id FROM stocks WHERE sector = 'Energy'",
+                ),
+            ).all()
+        plan = "\n".join(row[-1] for row in rows)
+        assert "idx_stocks_sector" in plan
+
+    def test_upgrade_stores_fingerprint_once_applied(self, engine: Engine) -> None:
+        """Test that an upgraded database takes the fast path from then on."""
+        with patch(
+            "src.infrastructure.persistence.database_initializer.logger",
+        ) as mock_logger:
+            assert _create_tables_if_schema_changed(engine, metadata)
+            assert not _create_tables_if_schema_changed(engine, metadata)
+
+        mock_logger.warning.assert_not_called()
+        with engine.connect() as conn:
+            stored = conn.execute(sa.select(schema_info_table.c.fingerprint)).all()
+        assert stored == [(schema_fingerprint(metadata, engine.dialect),)]
+
+    def test_upgrade_keeps_allocation_targets_aside(self, engine: Engine) -> None:
+        """Test that stored allocation targets survive the targets rebuild."""
+        with engine.begin() as conn:
+            _ = conn.execute(
+                sa.text(
+                    """
+                    INSERT INTO targets (id, portfolio_id, stock_id, target_percentage)
+                    VALUES ('t1', 'portfolio-1', 'stock-1', 25)
+                    """,
+                ),
+            )
+
+        initialize_database("sqlite:///:memory:", engine=engine)
+        initialize_database("sqlite:///:memory:", engine=engine)
+
+        columns = {col["name"] for col in inspect(engine).get_columns("targets")}
+        assert "target_percentage" not in columns
+        with engine.connect() as conn:
+            legacy = conn.execute(
+                sa.text(f"SELECT id, target_percentage FROM {LEGACY_TARGETS_TABLE}"),
+            ).all()
+            targets = conn.execute(sa.select(target_table.c.id)).all()
+        assert legacy == [("t1", 25)]
+        assert targets == []
+
+
+class TestSchemaFingerprint:
+    """Test suite for the schema fingerprint."""
+
+    def test_fingerprint_is_stable(self) -> None:
+        """Test that the same schema always gives the same fingerprint."""
+        dialect = sa.create_engine("sqlite://").dialect
+
+        assert schema_fingerprint(metadata, dialect) == schema_fingerprint(
+            metadata,
+            dialect,
+        )
+
+    def test_fingerprint_changes_with_schema(self) -> None:
+        """Test that adding a column changes the fingerprint."""
+        dialect = sa.create_engine("sqlite://").dialect
+        changed = sa.MetaData()
+        for table in metadata.sorted_tables:
+            _ = table.to_metadata(changed)
+        changed.tables["stocks"].append_column(sa.Column("exchange", sa.String))
+
+        assert schema_fingerprint(changed, dialect) != schema_fingerprint(
+            metadata,
+            dialect,
+        )
@@ -0,0 +1,351 @@
+"""Tests for group commit of units of work on a shared writer connection."""
+
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false, reportArgumentType=false
+
+import threading
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine
+
+from src.domain.entities.stock import Stock
+from src.domain.exceptions import StockAlreadyExistsError
+from src.domain.value_objects import StockSymbol
+from src.infrastructure.persistence.database_factory import create_engine
+from src.infrastructure.persistence.group_commit import (
+    GroupCommitConfig,
+    GroupCommitError,
+    GroupCommitter,
+)
+from src.infrastructure.persistence.tables import metadata, stock_table
+from src.infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
+
+
+def create_stock(symbol: str) -> Stock:
+    """Helper to create a stock entity."""
+    return Stock.Builder().with_symbol(StockSymbol(symbol)).build()
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Generator[Engine, None, None]:
+    """Create a file database usable from several threads."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'group.db'}")
+    metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def committer(engine: Engine) -> Generator[GroupCommitter, None, None]:
+    """Create a group committer that waits long enough to batch."""
+    committer = GroupCommitter(engine, GroupCommitConfig(max_batch=8, max_delay=0.05))
+    yield committer
+    committer.close()
+
+
+def stored_symbols(engine: Engine) -> set[str]:
+    """Read the committed stock symbols through a separate connection."""
+    with engine.connect() as connection:
+        rows = connection.execute(select(stock_table.c.symbol)).fetchall()
+        return {row.symbol for row in rows}
+
+
+def count_commits(engine: Engine) -> list[int]:
+    """Record every real COMMIT issued on the engine."""
+    commits: list[int] = []
+
+    def on_commit(_connection: Any) -> None:
+        """Count the commit."""
+        commits.append(1)
+
+    event.listen(engine, "commit", on_commit)
+    return commits
+
+
+class TestGroupCommitConfig:
+    """Test suite for GroupCommitConfig validation."""
+
+    def test_rejects_invalid_limits(self) -> None:
+        """Test that batch size and delay are range checked."""
+        with pytest.raises(ValueError, match="max_batch"):
+            _ = GroupCommitConfig(max_batch=0)
+        with pytest.raises(ValueError, match="max_delay"):
+            _ = GroupCommitConfig(max_delay=-1)
+
+
+class TestGroupCommitter:
+    """Test suite for GroupCommitter with a real database."""
+
+    def test_concurrent_units_of_work_share_commits(
+        self,
+        engine: Engine,
+        committer: GroupCommitter,
+    ) -> None:
+        """Test that concurrent writers are coalesced into fewer commits."""
+        commits = count_commits(engine)
+        symbols = [f"SYM{letter}" for letter in "ABCDEFGH"]
+        errors: list[BaseException] = []
+        start = threading.Barrier(len(symbols))
+
+        def write(symbol: str) -> None:
+            """Insert one stock in its own unit of work."""
+            unit_of_work = SqlAlchemyUnitOfWork(engine, group_committer=committer)
+            _ = start.wait()
+            try:
+                self._write(unit_of_work, symbol)
+                # Durable as soon as commit() returns
+                assert symbol in stored_symbols(engine)
+            except BaseException as error:  # noqa: BLE001 - checked below
+                errors.append(error)
+
+        threads = [threading.Thread(target=write, args=(s,)) for s in symbols]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert stored_symbols(engine) == set(symbols)
+        assert 1 <= len(commits) < len(symbols)
+
+    def test_failed_unit_of_work_does_not_affect_its_group(
+        self,
+        engine: Engine,
+        committer: GroupCommitter,
+    ) -> None:
+        """Test that one caller's error only rolls back its own savepoint."""
+        with SqlAlchemyUnitOfWork(engine, group_committer=committer) as first:
+            _ = first.stocks.create(create_stock("AAPL"))
+            first.commit()
+
+            # Same unit of work continues on a new slot after committing
+            _ = first.stocks.create(create_stock("MSFT"))
+            first.rollback()
+            first.rollback()  # Nothing left to roll back
+
+        failing = SqlAlchemyUnitOfWork(engine, group_committer=committer)
+        with pytest.raises(StockAlreadyExistsError), failing:
+            _ = failing.stocks.create(create_stock("AAPL"))
+
+        with SqlAlchemyUnitOfWork(engine, group_committer=committer) as last:
+            _ = last.stocks.create(create_stock("GOOG"))
+            last.commit()
+
+        with SqlAlchemyUnitOfWork(engine, group_committer=committer) as abandoned:
+            # Leaving without commit discards the changes
+            _ = abandoned.stocks.create(create_stock("AMZN"))
+
+        committer.flush()
+        assert stored_symbols(engine) == {"AAPL", "GOOG"}
+
+    def test_failed_commit_is_reported_to_callers(
+        self,
+        engine: Engine,
+        committer: GroupCommitter,
+    ) -> None:
+        """Test that a failing group commit raises and loses the group's work."""
+
+        def fail(_connection: Any) -> None:
+            """Fail the commit."""
+            msg = "disk full"
+            raise OSError(msg)
+
+        event.listen(engine, "commit", fail)
+        unit_of_work = SqlAlchemyUnitOfWork(engine, group_committer=committer)
+        with unit_of_work:
+            _ = unit_of_work.stocks.create(create_stock("AAPL"))
+            with pytest.raises(GroupCommitError) as error_info:
+                unit_of_work.commit()
+        event.remove(engine, "commit", fail)
+
+        assert isinstance(error_info.value.__cause__, OSError)
+        with SqlAlchemyUnitOfWork(engine, group_committer=committer) as retry:
+            _ = retry.stocks.create(create_stock("MSFT"))
+            retry.commit()
+        assert stored_symbols(engine) == {"MSFT"}
+
+    def test_flush_reports_commit_failure(
+        self,
+        engine: Engine,
+        committer: GroupCommitter,
+    ) -> None:
+        """Test that flush raises when the shared commit fails."""
+        slot = committer.acquire()
+        slot.rollback()
+
+        def fail(_connection: Any) -> None:
+            """Fail the commit."""
+            msg = "disk full"
+            raise OSError(msg)
+
+        event.listen(engine, "commit", fail)
+        with pytest.raises(GroupCommitError):
+            committer.flush()
+        event.remove(engine, "commit", fail)
+
+        committer.flush()  # No open transaction left to commit
+
+    def test_slot_cannot_be_committed_twice(self, committer: GroupCommitter) -> None:
+        """Test that a released slot rejects commit and ignores rollback."""
+        slot = committer.acquire()
+        assert slot.active
+        slot.commit()
+
+        assert not slot.active
+        slot.rollback()
+        with pytest.raises(RuntimeError, match="already released"):
+            slot.commit()
+
+    def test_close_commits_waiting_work_and_rejects_new_slots(
+        self,
+        engine: Engine,
+    ) -> None:
+        """Test that close flushes the open group and stops accepting work."""
+        committer = GroupCommitter(engine, GroupCommitConfig(max_delay=60))
+        unit_of_work = SqlAlchemyUnitOfWork(engine, group_committer=committer)
+        joined = threading.Event()
+        release = committer.release
+
+        def release_and_signal(**kwargs: Any) -> Any:
+            """Release the slot and report that the writer joined a group."""
+            group = release(**kwargs)
+            joined.set()
+            return group
+
+        writer = threading.Thread(target=self._write, args=(unit_of_work, "AAPL"))
+        with patch.object(committer, "release", side_effect=release_and_signal):
+            writer.start()
+            assert joined.wait(5)
+
+        committer.close()
+        committer.close()
+        writer.join()
+
+        assert committer.config.max_delay == 60
+        assert stored_symbols(engine) == {"AAPL"}
+        with pytest.raises(RuntimeError, match="closed"):
+            _ = committer.acquire()
+
+    def test_reads_skip_the_writer_and_its_uncommitted_changes(
+        self,
+        engine: Engine,
+        committer: GroupCommitter,
+    ) -> None:
+        """Test that reads run on a pooled connection while a slot is held."""
+        seen: list[list[str]] = []
+
+        def read() -> None:
+            """Read the stocks in a unit of work of its own."""
+            with SqlAlchemyUnitOfWork(engine, group_committer=committer) as reader:
+                seen.append([stock.symbol.value for stock in reader.stocks.get_all()])
+
+        with SqlAlchemyUnitOfWork(engine, group_committer=committer) as writer:
+            _ = writer.stocks.create(create_stock("AAPL"))
+            thread = threading.Thread(target=read)
+            thread.start()
+            thread.join(5)
+
+            assert not thread.is_alive()
+            assert seen == [[]]
+            # The writer reads its own uncommitted changes
+            assert writer.stocks.get_by_symbol(StockSymbol("AAPL")) is not None
+            writer.commit()
+
+            assert writer.stocks.get_by_symbol(StockSymbol("AAPL")) is not None
+
+        read()
+        assert seen[-1] == ["AAPL"]
+
+    def test_single_connection_engine_reads_through_the_writer(self) -> None:
+        """Test that in-memory databases run every statement on the writer."""
+        engine = create_engine("sqlite:///:memory:")
+        metadata.create_all(engine)
+        committer = GroupCommitter(engine)
+        try:
+            with (
+                patch.object(committer, "acquire", wraps=committer.acquire) as acquire,
+                SqlAlchemyUnitOfWork(engine, group_committer=committer) as reader,
+            ):
+                assert reader.stocks.get_all() == []
+
+            assert not committer.pooled_reads
+            acquire.assert_called_once_with()
+        finally:
+            committer.close()
+            engine.dispose()
+
+    @staticmethod
+    def _write(unit_of_work: SqlAlchemyUnitOfWork, symbol: str) -> None:
+        """Insert one stock and commit."""
+        with unit_of_work:
+            _ = unit_of_work.stocks.create(create_stock(symbol))
+            unit_of_work.commit()
+
+
+class TestGroupCommitSlotFailures:
+    """Test suite for savepoint failures on the shared connection."""
+
+    @pytest.fixture
+    def connection(self) -> Mock:
+        """Create a mock shared connection."""
+        connection = Mock()
+        connection.dialect.name = "mock"
+        return connection
+
+    @pytest.fixture
+    def mock_committer(self, connection: Mock) -> Generator[GroupCommitter, None, None]:
+        """Create a committer over a mock engine."""
+        engine = Mock(spec=Engine)
+        engine.pool = Mock()
+        engine.connect.return_value = connection
+        committer = GroupCommitter(engine)
+        yield committer
+        committer.close()
+
+    def test_savepoint_release_failure_abandons_group(
+        self,
+        connection: Mock,
+        mock_committer: GroupCommitter,
+    ) -> None:
+        """Test that a broken savepoint discards the shared transaction."""
+        connection.begin_nested.return_value.commit.side_effect = OSError("lost")
+        slot = mock_committer.acquire()
+
+        with pytest.raises(OSError, match="lost"):
+            slot.commit()
+
+        connection.invalidate.assert_called_once()
+        connection.close.assert_called_once()
+        # The lock was released and a new connection can be opened
+        mock_committer.acquire().rollback()
+
+    def test_savepoint_rollback_failure_abandons_group(
+        self,
+        connection: Mock,
+        mock_committer: GroupCommitter,
+    ) -> None:
+        """Test that a failed rollback to savepoint discards the transaction."""
+        connection.begin_nested.return_value.rollback.side_effect = OSError("lost")
+        slot = mock_committer.acquire()
+
+        with pytest.raises(OSError, match="lost"):
+            slot.rollback()
+
+        connection.close.assert_called_once()
+
+    def test_acquire_releases_lock_when_savepoint_fails(
+        self,
+        connection: Mock,
+        mock_committer: GroupCommitter,
+    ) -> None:
+        """Test that a failed acquire does not leave the writer locked."""
+        connection.begin_nested.side_effect = [OSError("busy"), Mock()]
+
+        with pytest.raises(OSError, match="busy"):
+            _ = mock_committer.acquire()
+
+        mock_committer.acquire().rollback()
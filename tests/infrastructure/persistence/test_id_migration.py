@@ -0,0 +1,114 @@
+"""Tests for migrating databases to UUID entity IDs."""
+
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+# pyright: reportArgumentType=false, reportAttributeAccessIssue=false
+
+import uuid
+from decimal import Decimal
+
+from sqlalchemy import MetaData, create_engine, insert, select, text
+
+from src.infrastructure.persistence.id_migration import (
+    LEGACY_ID_NAMESPACE,
+    id_column_names,
+    migrate_ids,
+    to_uuid,
+)
+from src.infrastructure.persistence.tables import (
+    metadata,
+    portfolio_table,
+    position_table,
+    stock_table,
+)
+from src.infrastructure.persistence.tables.table_utils import BinaryId
+
+
+def binary_schema() -> MetaData:
+    """Helper copying the schema with IDs stored as BinaryId."""
+    binary = MetaData()
+    for table in metadata.sorted_tables:
+        copy = table.to_metadata(binary)
+        for name in id_column_names(table):
+            copy.c[name].type = BinaryId()
+    return binary
+
+
+class TestToUuid:
+    """Test converting stored IDs to UUID text."""
+
+    def test_uuid_text_is_kept(self) -> None:
+        """Should keep IDs that already are UUIDs."""
+        identifier = str(uuid.uuid4())
+
+        assert to_uuid(identifier) == identifier
+
+    def test_other_ids_map_to_stable_name_based_uuids(self) -> None:
+        """Should derive the same UUID for the same legacy ID."""
+        assert to_uuid("stock-1") == str(uuid.uuid5(LEGACY_ID_NAMESPACE, "stock-1"))
+        assert to_uuid("stock-1") != to_uuid("stock-2")
+
+
+class TestIdColumnNames:
+    """Test finding the ID columns of a table."""
+
+    def test_primary_and_foreign_keys(self) -> None:
+        """Should include the id column and every foreign key."""
+        assert id_column_names(position_table) == {"id", "portfolio_id", "stock_id"}
+        assert id_column_names(stock_table) == {"id"}
+
+
+class TestMigrateIds:
+    """Test copying a text-ID database into a binary-ID schema."""
+
+    def test_copies_rows_and_keeps_references_consistent(self) -> None:
+        """Should convert IDs and foreign keys to the same UUIDs."""
+        source_engine = create_engine("sqlite:///:memory:")
+        metadata.create_all(source_engine)
+        target_schema = binary_schema()
+        target_engine = create_engine("sqlite:///:memory:")
+        target_schema.create_all(target_engine)
+        with source_engine.begin() as source:
+            _ = source.execute(insert(stock_table).values(id="stock-1", symbol="AAPL"))
+            _ = source.execute(
+                insert(portfolio_table).values(id="portfolio-1", name="Main"),
+            )
+            _ = source.execute(
+                insert(position_table).values(
+                    id=str(uuid.uuid4()),
+                    portfolio_id="portfolio-1",
+                    stock_id="stock-1",
+                    quantity=Decimal(10),
+                    average_cost=Decimal("12.50"),
+                ),
+            )
+
+        with source_engine.connect() as source, target_engine.begin() as target:
+            copied = migrate_ids(source, target, target_schema)
+
+        assert copied["stocks"] == 1
+        assert copied["positions"] == 1
+        assert copied["transactions"] == 0
+        with target_engine.connect() as target:
+            stocks = target_schema.tables["stocks"]
+            positions = target_schema.tables["positions"]
+            stock_id = target.execute(select(stocks.c.id)).scalar_one()
+            position = target.execute(select(positions)).one()
+            stored = target.execute(text("SELECT id FROM stocks")).scalar_one()
+
+        assert stock_id == to_uuid("stock-1")
+        assert position.stock_id == stock_id
+        assert position.portfolio_id == to_uuid("portfolio-1")
+        assert position.quantity == Decimal(10)
+        assert stored == uuid.UUID(stock_id).bytes
+
+    def test_skips_tables_missing_in_source(self) -> None:
+        """Should copy only the tables an older database has."""
+        source_engine = create_engine("sqlite:///:memory:")
+        stock_table.to_metadata(MetaData()).create(source_engine)
+        target_engine = create_engine("sqlite:///:memory:")
+        metadata.create_all(target_engine)
+
+        with source_engine.connect() as source, target_engine.begin() as target:
+            copied = migrate_ids(source, target, metadata)
+
+        assert copied == {"stocks": 0}
@@ -19,6 +19,7 @@ from src.application.commands.stock import CreateStockCommand, CreateStockInputs
 from src.application.interfaces.stock_service import IStockApplicationService
 from src.application.services.stock_application_service import StockApplicationService
 from src.domain.entities.stock import Stock
+from src.domain.exceptions import StockAlreadyExistsError
 from src.domain.repositories.interfaces import (
     IStockBookUnitOfWork,
     IStockRepository,
@@ -147,8 +148,8 @@ class TestUnitOfWorkIntegration:
 
         # Act - Try to create duplicate (should fail)
         with pytest.raises(  # noqa: PT012
-            ValueError,
-            match="Stock with symbol MSFT already exists",
+            StockAlreadyExistsError,
+            match="'MSFT' already exists",
         ):
             with unit_of_work:
                 duplicate = (
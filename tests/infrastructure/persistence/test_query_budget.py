@@ -0,0 +1,191 @@
+"""Tests for query logs, budgets and N+1 detection."""
+
+# pyright: reportArgumentType=false, reportUnknownArgumentType=false
+
+import logging
+
+import pytest
+from sqlalchemy import select, text
+
+from src.infrastructure.persistence.query_budget import (
+    QueryBudget,
+    QueryBudgetExceededError,
+    QueryLog,
+    RepeatedStatement,
+    active_query_logs,
+    record_queries,
+    statement_shape,
+)
+from src.infrastructure.persistence.tables import stock_table
+
+
+def _lookup(symbol: str) -> object:
+    """Build the same SELECT with a different bound symbol."""
+    return select(stock_table).where(stock_table.c.symbol == symbol)
+
+
+class TestStatementShape:
+    """Test grouping statements by their SQL."""
+
+    def test_bound_values_are_not_part_of_the_shape(self) -> None:
+        """Should give one shape for statements differing only in values."""
+        first_shape, first_values = statement_shape(_lookup("AAPL"))
+        second_shape, second_values = statement_shape(_lookup("MSFT"))
+
+        assert first_shape == second_shape
+        assert ":symbol_1" in first_shape
+        assert first_values != second_values
+
+    def test_textual_sql(self) -> None:
+        """Should use the text of plain SQL strings."""
+        assert statement_shape("SELECT 1") == ("SELECT 1", "")
+
+
+class TestQueryLog:
+    """Test recording statements."""
+
+    def test_counts_statements_by_shape(self) -> None:
+        """Should count every statement and each shape."""
+        log = QueryLog()
+
+        log.record(_lookup("AAPL"))
+        log.record(_lookup("MSFT"))
+        log.record(text("SELECT 1"))
+
+        assert log.count == 3
+        assert sorted(log.shapes.values()) == [1, 2]
+
+    def test_repeated_requires_different_parameters(self) -> None:
+        """Should only report shapes run with varying parameters."""
+        log = QueryLog()
+        for _ in range(3):
+            log.record(text("SELECT 1"))
+        for symbol in ("AAPL", "MSFT", "GOOG"):
+            log.record(_lookup(symbol))
+
+        repeated = log.repeated()
+
+        assert len(repeated) == 1
+        assert repeated[0].executions == 3
+        assert repeated[0].distinct_parameters == 3
+        assert "stocks" in repeated[0].shape
+
+    def test_explicit_parameters_distinguish_executions(self) -> None:
+        """Should treat parameters passed with the statement as varying values."""
+        log = QueryLog()
+        statement = text("SELECT * FROM stocks WHERE id = :id")
+
+        log.record(statement, {"id": "stock-1"})
+        log.record(statement, {"id": "stock-2"})
+
+        assert log.repeated() == [
+            RepeatedStatement("SELECT * FROM stocks WHERE id = :id", 2, 2),
+        ]
+
+    def test_repeated_threshold_and_order(self) -> None:
+        """Should report shapes at the threshold, most executed first."""
+        log = QueryLog()
+        for index in range(3):
+            log.record(text("SELECT :n"), {"n": index})
+        for index in range(2):
+            log.record(_lookup(str(index)))
+
+        assert [item.executions for item in log.repeated()] == [3, 2]
+        assert [item.executions for item in log.repeated(3)] == [3]
+
+    def test_describe(self) -> None:
+        """Should list shapes on one line each, most executed first."""
+        log = QueryLog()
+        log.record(text("SELECT 1"))
+        log.record(text("SELECT\n  2"))
+        log.record(text("SELECT\n  2"))
+
+        assert log.describe() == (
+            "3 statements executed:\n  2 x SELECT 2\n  1 x SELECT 1"
+        )
+
+
+class TestQueryBudget:
+    """Test checking logs against budgets."""
+
+    @staticmethod
+    def _log(count: int) -> QueryLog:
+        """Create a log of ``count`` lookups with different symbols."""
+        log = QueryLog()
+        for index in range(count):
+            log.record(_lookup(f"S{index}"))
+        return log
+
+    def test_rejects_limits_below_one(self) -> None:
+        """Should reject limits that would fail every unit of work."""
+        with pytest.raises(ValueError, match="max_queries must be at least 1"):
+            _ = QueryBudget(max_queries=0)
+        with pytest.raises(ValueError, match="max_repeats must be at least 1"):
+            _ = QueryBudget(max_repeats=0)
+
+    def test_within_budget(self) -> None:
+        """Should report nothing when limits hold."""
+        budget = QueryBudget(max_queries=3, max_repeats=3)
+
+        assert budget.violations(self._log(3)) == []
+
+    def test_too_many_queries(self) -> None:
+        """Should report a total above the limit."""
+        budget = QueryBudget(max_queries=2)
+
+        assert budget.violations(self._log(3)) == [
+            "3 queries exceed the budget of 2",
+        ]
+
+    def test_repeated_statements(self) -> None:
+        """Should report a shape repeated more often than allowed as N+1."""
+        budget = QueryBudget(max_repeats=2)
+
+        violations = budget.violations(self._log(3))
+
+        assert len(violations) == 1
+        assert violations[0].startswith("possible N+1: 3 executions of SELECT")
+
+    def test_unlimited_budget(self) -> None:
+        """Should accept any log without limits."""
+        assert QueryBudget().violations(self._log(50)) == []
+
+    def test_check_logs_a_warning(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Should warn about an exceeded budget by default."""
+        with caplog.at_level(logging.WARNING):
+            QueryBudget(max_queries=1).check(self._log(2))
+
+        assert "Query budget exceeded: 2 queries exceed" in caplog.text
+
+    def test_check_within_budget_is_silent(
+        self,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Should not log when within budget."""
+        with caplog.at_level(logging.WARNING):
+            QueryBudget(max_queries=2).check(self._log(2))
+
+        assert caplog.text == ""
+
+    def test_check_raises_when_configured(self) -> None:
+        """Should raise instead of warning when asked to."""
+        budget = QueryBudget(max_queries=1, raise_on_exceeded=True)
+        log = self._log(2)
+
+        with pytest.raises(QueryBudgetExceededError, match="2 queries exceed"):
+            budget.check(log)
+
+
+class TestRecordQueries:
+    """Test context-scoped recording."""
+
+    def test_nested_logs_are_active_inside_their_block(self) -> None:
+        """Should activate logs for their block only."""
+        assert active_query_logs() == ()
+
+        with record_queries() as outer:
+            with record_queries() as inner:
+                assert active_query_logs() == (outer, inner)
+            assert active_query_logs() == (outer,)
+
+        assert active_query_logs() == ()
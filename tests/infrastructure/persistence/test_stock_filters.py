@@ -0,0 +1,129 @@
+"""Tests for compiling stock query specs into SQLAlchemy Core."""
+
+# pyright: reportUnknownMemberType=false, reportUnknownArgumentType=false, reportUnknownVariableType=false, reportArgumentType=false
+
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.engine import Connection
+
+from src.domain.value_objects import StockQuerySpec, StockSortKey
+from src.infrastructure.persistence.stock_filters import apply_stock_query_spec
+from src.infrastructure.persistence.tables import metadata, stock_table
+
+
+@pytest.fixture
+def connection() -> Iterator[Connection]:
+    """Create an in-memory database with the current schema."""
+    engine = create_engine("sqlite:///:memory:")
+    metadata.create_all(engine)
+    with engine.connect() as connection:
+        yield connection
+    engine.dispose()
+
+
+def compile_spec(spec: StockQuerySpec) -> Any:
+    """Compile a SELECT of every stock column filtered by a spec."""
+    return apply_stock_query_spec(select(*stock_table.c), spec)
+
+
+def query_plan(connection: Connection, spec: StockQuerySpec) -> str:
+    """Get SQLite's ``EXPLAIN QUERY PLAN`` for a spec, one step per line."""
+    sql = compile_spec(spec).compile(
+        connection,
+        compile_kwargs={"literal_binds": True},
+    )
+    rows = connection.execute(text(f"EXPLAIN QUERY PLAN {sql}")).fetchall()
+    return "\n".join(row[-1] for row in rows)
+
+
+class TestApplyStockQuerySpec:
+    """Test the WHERE and ORDER BY clauses built from a spec."""
+
+    def test_empty_spec_leaves_statement_unchanged(self) -> None:
+        """Should neither filter nor order for an empty spec."""
+        sql = str(compile_spec(StockQuerySpec()))
+
+        assert "WHERE" not in sql
+        assert "ORDER BY" not in sql
+
+    def test_sort_keys_keep_order_and_direction(self) -> None:
+        """Should order by each key, then by symbol for stable ties."""
+        spec = StockQuerySpec(
+            sort=(StockSortKey("grade", descending=True), StockSortKey("name")),
+        )
+
+        sql = str(compile_spec(spec))
+
+        assert sql.endswith(
+            "ORDER BY stocks.grade DESC, stocks.company_name, stocks.symbol",
+        )
+
+    @pytest.mark.parametrize(
+        ("prefix", "bounds"),
+        [("aa", ("AA", "AB")), ("Z", ("Z", "[")), ("BRK.", ("BRK.", "BRK/"))],
+    )
+    def test_symbol_prefix_becomes_a_range(
+        self,
+        prefix: str,
+        bounds: tuple[str, str],
+    ) -> None:
+        """Should bound the upper-cased prefix by its successor."""
+        compiled = compile_spec(StockQuerySpec(symbol_prefix=prefix)).compile()
+
+        assert "stocks.symbol >= :symbol_1 AND stocks.symbol < :symbol_2" in str(
+            compiled,
+        )
+        assert (compiled.params["symbol_1"], compiled.params["symbol_2"]) == bounds
+
+
+class TestStockFilterIndexes:
+    """Test that SQLite answers each filter from an index."""
+
+    @pytest.mark.parametrize(
+        ("spec", "index"),
+        [
+            (StockQuerySpec(sector="Technology"), "idx_stocks_sector (sector=?)"),
+            (
+                StockQuerySpec(industry_group="Software"),
+                "idx_stocks_industry_group (industry_group=?)",
+            ),
+            (StockQuerySpec(grade="A"), "idx_stocks_grade (grade=?)"),
+        ],
+    )
+    def test_equality_filters_search_their_index(
+        self,
+        connection: Connection,
+        spec: StockQuerySpec,
+        index: str,
+    ) -> None:
+        """Should search the column's index instead of scanning the table."""
+        assert f"SEARCH stocks USING INDEX {index}" in query_plan(connection, spec)
+
+    def test_symbol_prefix_searches_the_symbol_index(
+        self,
+        connection: Connection,
+    ) -> None:
+        """Should turn the prefix into a range search on the unique index."""
+        plan = query_plan(connection, StockQuerySpec(symbol_prefix="AA"))
+
+        assert "USING INDEX" in plan
+        assert "(symbol>? AND symbol<?)" in plan
+
+    def test_sorted_filter_still_searches_an_index(
+        self,
+        connection: Connection,
+    ) -> None:
+        """Should search an index when filtering and sorting together."""
+        spec = StockQuerySpec(
+            sector="Technology",
+            grade="A",
+            sort=(StockSortKey("name"),),
+        )
+
+        plan = query_plan(connection, spec)
+
+        assert "SEARCH stocks USING INDEX idx_stocks_" in plan
+        assert "SCAN stocks" not in plan
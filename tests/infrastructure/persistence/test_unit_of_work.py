@@ -7,15 +7,20 @@ and provides repository instances for the StockBook domain.
 
 # pyright: reportPrivateUsage=false, reportCallIssue=false, reportUnusedCallResult=false
 
+import logging
+from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
+from sqlalchemy import create_engine
 from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.exc import DatabaseError
 
 from src.domain.repositories.interfaces import (
     IJournalRepository,
+    IOutboxRepository,
     IPortfolioBalanceRepository,
     IPortfolioRepository,
     IPositionRepository,
@@ -23,8 +28,15 @@ from src.domain.repositories.interfaces import (
     IStockRepository,
     ITargetRepository,
     ITransactionRepository,
+    OutboxMessage,
 )
 from src.infrastructure.persistence.database_connection import SqlAlchemyConnection
+from src.infrastructure.persistence.group_commit import GroupCommitter
+from src.infrastructure.persistence.query_budget import (
+    QueryBudget,
+    QueryBudgetExceededError,
+)
+from src.infrastructure.persistence.tables import metadata
 from src.infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWork
 from src.infrastructure.repositories.sqlalchemy_position_repository import (
     SqlAlchemyPositionRepository,
@@ -32,6 +44,7 @@ from src.infrastructure.repositories.sqlalchemy_position_repository import (
 from src.infrastructure.repositories.sqlalchemy_stock_repository import (
     SqlAlchemyStockRepository,
 )
+from src.shared.instrumentation import metrics
 
 
 class TestSqlAlchemyUnitOfWorkConstruction:
@@ -246,7 +259,7 @@ class TestSqlAlchemyUnitOfWorkRepositoryProperties:
         assert active_uow.portfolios is repository
 
     @patch(
-        "src.infrastructure.persistence.unit_of_work._SqlAlchemyTransactionRepository",
+        "src.infrastructure.persistence.unit_of_work.SqlAlchemyTransactionRepository",
     )
     def test_transactions_property_returns_transaction_repository(
         self,
@@ -268,7 +281,7 @@ class TestSqlAlchemyUnitOfWorkRepositoryProperties:
         # Should return same instance on subsequent calls
         assert active_uow.transactions is repository
 
-    @patch("src.infrastructure.persistence.unit_of_work._SqlAlchemyTargetRepository")
+    @patch("src.infrastructure.persistence.unit_of_work.SqlAlchemyTargetRepository")
     def test_targets_property_returns_target_repository(
         self,
         mock_repo_class: Mock,
@@ -310,7 +323,7 @@ class TestSqlAlchemyUnitOfWorkRepositoryProperties:
         # Should return same instance on subsequent calls
         assert active_uow.balances is repository
 
-    @patch("src.infrastructure.persistence.unit_of_work._SqlAlchemyJournalRepository")
+    @patch("src.infrastructure.persistence.unit_of_work.SqlAlchemyJournalRepository")
     def test_journal_property_returns_journal_repository(
         self,
         mock_repo_class: Mock,
@@ -331,6 +344,25 @@ class TestSqlAlchemyUnitOfWorkRepositoryProperties:
         # Should return same instance on subsequent calls
         assert active_uow.journal is repository
 
+    @patch("src.infrastructure.persistence.unit_of_work.SqlAlchemyOutboxRepository")
+    def test_outbox_property_returns_outbox_repository(
+        self,
+        mock_repo_class: Mock,
+        active_uow: Any,
+    ) -> None:
+        """Should return IOutboxRepository instance."""
+        # Arrange
+        mock_repo_instance = Mock(spec=IOutboxRepository)
+        mock_repo_class.return_value = mock_repo_instance
+
+        # Act
+        repository = active_uow.outbox
+
+        # Assert
+        assert repository is mock_repo_instance
+        mock_repo_class.assert_called_once()
+        assert active_uow.outbox is repository
+
     def test_all_repositories_share_same_connection(self, active_uow: Any) -> None:
         """Should ensure all repositories use the same database connection."""
         # Act - Access all repositories
@@ -421,6 +453,201 @@ class TestSqlAlchemyUnitOfWorkTransactionMethods:
             uow.rollback()
 
 
+class TestSqlAlchemyUnitOfWorkMetrics:
+    """Test the unit of work duration metric."""
+
+    def test_records_duration_by_outcome(self) -> None:
+        """Should time each unit of work and label failures."""
+        duration = metrics.histogram("stockbook_unit_of_work_duration_seconds", "")
+        ok, error = duration.count("ok"), duration.count("error")
+        engine = create_engine("sqlite:///:memory:")
+
+        with SqlAlchemyUnitOfWork(engine):
+            pass
+
+        def fail() -> None:
+            """Raise inside a unit of work."""
+            with SqlAlchemyUnitOfWork(engine):
+                msg = "failed"
+                raise ValueError(msg)
+
+        with pytest.raises(ValueError, match="failed"):
+            fail()
+
+        assert duration.count("ok") == ok + 1
+        assert duration.count("error") == error + 1
+
+    def test_disabled_metrics_record_nothing(self) -> None:
+        """Should not time units of work when metrics are disabled."""
+        duration = metrics.histogram("stockbook_unit_of_work_duration_seconds", "")
+        ok = duration.count("ok")
+
+        with (
+            patch.object(metrics, "enabled", new=False),
+            SqlAlchemyUnitOfWork(create_engine("sqlite:///:memory:")),
+        ):
+            pass
+
+        assert duration.count("ok") == ok
+
+
+class TestSqlAlchemyUnitOfWorkQueryBudget:
+    """Test checking statements against a query budget."""
+
+    @pytest.fixture
+    def engine(self) -> Engine:
+        """Create an in-memory database with all tables."""
+        engine = create_engine("sqlite:///:memory:")
+        metadata.create_all(engine)
+        return engine
+
+    @staticmethod
+    def _look_up_stocks(uow: SqlAlchemyUnitOfWork, count: int) -> None:
+        """Look up ``count`` stocks one at a time, the N+1 pattern."""
+        for index in range(count):
+            _ = uow.stocks.get_by_id(f"stock-{index}")
+
+    def test_raises_when_over_budget(self, engine: Engine) -> None:
+        """Should raise on leaving a unit of work that ran too many queries."""
+        budget = QueryBudget(max_queries=2, raise_on_exceeded=True)
+        uow = SqlAlchemyUnitOfWork(engine, query_budget=budget)
+
+        def run() -> None:
+            """Run three queries in one unit of work."""
+            with uow:
+                self._look_up_stocks(uow, 3)
+
+        with pytest.raises(QueryBudgetExceededError, match="3 queries exceed"):
+            run()
+
+    def test_counts_each_use_separately(self, engine: Engine) -> None:
+        """Should start a new count each time the unit of work is entered."""
+        budget = QueryBudget(max_queries=2, raise_on_exceeded=True)
+        uow = SqlAlchemyUnitOfWork(engine, query_budget=budget)
+
+        for _ in range(3):
+            with uow:
+                self._look_up_stocks(uow, 2)
+
+    def test_warns_about_repeated_statements(
+        self,
+        engine: Engine,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Should log a likely N+1 pattern by default."""
+        uow = SqlAlchemyUnitOfWork(engine, query_budget=QueryBudget(max_repeats=2))
+
+        with caplog.at_level(logging.WARNING), uow:
+            self._look_up_stocks(uow, 3)
+
+        assert "possible N+1: 3 executions" in caplog.text
+
+    def test_skips_check_when_an_exception_is_raised(self, engine: Engine) -> None:
+        """Should let the original exception propagate unchanged."""
+        budget = QueryBudget(max_queries=1, raise_on_exceeded=True)
+        uow = SqlAlchemyUnitOfWork(engine, query_budget=budget)
+
+        def fail() -> None:
+            """Exceed the budget, then fail."""
+            with uow:
+                self._look_up_stocks(uow, 2)
+                msg = "failed"
+                raise ValueError(msg)
+
+        with pytest.raises(ValueError, match="failed"):
+            fail()
+
+    def test_counts_statements_on_group_commit_connection(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Should also count statements run on the shared writer connection."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'group.db'}")
+        metadata.create_all(engine)
+        committer = GroupCommitter(engine)
+        budget = QueryBudget(max_queries=1, raise_on_exceeded=True)
+        uow = SqlAlchemyUnitOfWork(
+            engine,
+            group_committer=committer,
+            query_budget=budget,
+        )
+
+        def run() -> None:
+            """Run queries before and after a commit."""
+            with uow:
+                self._look_up_stocks(uow, 1)
+                uow.commit()
+                self._look_up_stocks(uow, 1)
+
+        try:
+            with pytest.raises(QueryBudgetExceededError, match="2 queries"):
+                run()
+        finally:
+            committer.close()
+            engine.dispose()
+
+
+class TestSqlAlchemyUnitOfWorkOutboxNotification:
+    """Test the commit notification for written outbox messages."""
+
+    @pytest.fixture
+    def engine(self) -> Engine:
+        """Create an in-memory database with all tables."""
+        engine = create_engine("sqlite:///:memory:")
+        metadata.create_all(engine)
+        return engine
+
+    @staticmethod
+    def _message(event_id: str) -> OutboxMessage:
+        """Create an outbox message."""
+        return OutboxMessage(
+            event_id=event_id,
+            event_type="StockAddedEvent",
+            payload="{}",
+            occurred_at=datetime.now(UTC),
+        )
+
+    def test_commit_notifies_after_outbox_write(self, engine: Engine) -> None:
+        """Should call the hook once per commit that wrote messages."""
+        on_commit = Mock()
+        uow = SqlAlchemyUnitOfWork(engine, on_outbox_commit=on_commit)
+
+        with uow:
+            uow.commit()
+            on_commit.assert_not_called()
+
+            uow.outbox.add([self._message("event-1")])
+            on_commit.assert_not_called()
+            uow.commit()
+            on_commit.assert_called_once_with()
+
+            uow.commit()
+            on_commit.assert_called_once_with()
+
+    def test_rollback_discards_pending_notification(self, engine: Engine) -> None:
+        """Should not notify for messages that were rolled back."""
+        on_commit = Mock()
+        uow = SqlAlchemyUnitOfWork(engine, on_outbox_commit=on_commit)
+
+        with uow:
+            uow.outbox.add([self._message("event-1")])
+            uow.rollback()
+            uow.commit()
+
+        on_commit.assert_not_called()
+
+    def test_commit_without_hook(self, engine: Engine) -> None:
+        """Should commit outbox messages when no hook is configured."""
+        uow = SqlAlchemyUnitOfWork(engine)
+
+        with uow:
+            uow.outbox.add([self._message("event-1")])
+            uow.commit()
+
+        with uow:
+            assert len(uow.outbox.get_pending(10)) == 1
+
+
 class TestPlaceholderRepositories:
     """Test placeholder repository implementations."""
 
@@ -429,10 +656,7 @@ class TestPlaceholderRepositories:
         # Arrange
         from src.infrastructure.persistence.unit_of_work import (
             _SqlAlchemyBalanceRepository,
-            _SqlAlchemyJournalRepository,
             _SqlAlchemyPortfolioRepository,
-            _SqlAlchemyTargetRepository,
-            _SqlAlchemyTransactionRepository,
         )
 
         mock_connection = Mock(spec=SqlAlchemyConnection)
@@ -440,17 +664,11 @@ class TestPlaceholderRepositories:
         # Act & Assert - Test each placeholder repository
         # Verify that repositories can be instantiated with connection
         portfolio_repo = _SqlAlchemyPortfolioRepository(mock_connection)
-        transaction_repo = _SqlAlchemyTransactionRepository(mock_connection)
-        target_repo = _SqlAlchemyTargetRepository(mock_connection)
         balance_repo = _SqlAlchemyBalanceRepository(mock_connection)
-        journal_repo = _SqlAlchemyJournalRepository(mock_connection)
 
         # All repositories should be successfully created
         assert isinstance(portfolio_repo, _SqlAlchemyPortfolioRepository)
-        assert isinstance(transaction_repo, _SqlAlchemyTransactionRepository)
-        assert isinstance(target_repo, _SqlAlchemyTargetRepository)
         assert isinstance(balance_repo, _SqlAlchemyBalanceRepository)
-        assert isinstance(journal_repo, _SqlAlchemyJournalRepository)
 
 
 class TestSqlAlchemyUnitOfWorkErrorHandling:
@@ -0,0 +1 @@
+"""Tests for read-side query services."""
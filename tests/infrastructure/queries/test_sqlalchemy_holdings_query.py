@@ -0,0 +1,149 @@
+"""Tests for the SQLAlchemy holdings read model."""
+
+# pyright: reportUnknownMemberType=false, reportUnknownArgumentType=false, reportUnknownVariableType=false
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Engine
+
+from src.application.interfaces.holdings_query import IHoldingsQuery
+from src.domain.value_objects import IndustryGroup, Money, Quantity, StockSymbol
+from src.infrastructure.persistence.tables import (
+    metadata,
+    portfolio_table,
+    position_table,
+    stock_table,
+)
+from src.infrastructure.queries import SqlAlchemyHoldingsQuery
+from tests.fixtures.infrastructure import assert_max_queries
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Iterator[Engine]:
+    """Create a database with two portfolios holding three positions."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'holdings.db'}")
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        _ = connection.execute(
+            insert(portfolio_table),
+            [
+                {"id": "growth", "name": "Growth"},
+                {"id": "income", "name": "Income"},
+                {"id": "empty", "name": "Empty"},
+            ],
+        )
+        _ = connection.execute(
+            insert(stock_table),
+            [
+                {
+                    "id": "stock-msft",
+                    "symbol": "MSFT",
+                    "industry_group": "Software",
+                    "grade": "A",
+                },
+                {
+                    "id": "stock-aapl",
+                    "symbol": "AAPL",
+                    "industry_group": None,
+                    "grade": None,
+                },
+            ],
+        )
+        _ = connection.execute(
+            insert(position_table),
+            [
+                {
+                    "id": "pos-1",
+                    "portfolio_id": "growth",
+                    "stock_id": "stock-msft",
+                    "quantity": 10,
+                    "average_cost": "300.50",
+                },
+                {
+                    "id": "pos-2",
+                    "portfolio_id": "growth",
+                    "stock_id": "stock-aapl",
+                    "quantity": 5,
+                    "average_cost": "150",
+                },
+                {
+                    "id": "pos-3",
+                    "portfolio_id": "income",
+                    "stock_id": "stock-msft",
+                    "quantity": 1,
+                    "average_cost": "250",
+                },
+            ],
+        )
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def holdings(engine: Engine) -> SqlAlchemyHoldingsQuery:
+    """Create the query service."""
+    return SqlAlchemyHoldingsQuery(engine)
+
+
+class TestSqlAlchemyHoldingsQuery:
+    """Test loading holdings with positions joined to stocks."""
+
+    def test_implements_interface(self, holdings: SqlAlchemyHoldingsQuery) -> None:
+        """Should implement the application read model interface."""
+        assert isinstance(holdings, IHoldingsQuery)
+
+    def test_get_holdings_joins_stock_fields(
+        self,
+        holdings: SqlAlchemyHoldingsQuery,
+    ) -> None:
+        """Should return one row per position, ordered by symbol, in one query."""
+        with assert_max_queries(1):
+            rows = holdings.get_holdings("growth")
+
+        assert [row.symbol for row in rows] == [
+            StockSymbol("AAPL"),
+            StockSymbol("MSFT"),
+        ]
+        aapl, msft = rows
+        assert aapl.industry_group is None
+        assert aapl.grade is None
+        assert aapl.quantity == Quantity(5)
+        assert msft.stock_id == "stock-msft"
+        assert msft.industry_group == IndustryGroup("Software")
+        assert msft.grade == "A"
+        assert msft.average_cost == Money("300.50")
+
+    def test_get_holdings_of_unknown_portfolio(
+        self,
+        holdings: SqlAlchemyHoldingsQuery,
+    ) -> None:
+        """Should return no rows for portfolios without positions."""
+        assert holdings.get_holdings("missing") == []
+
+    def test_get_holdings_for_requested_portfolios(
+        self,
+        holdings: SqlAlchemyHoldingsQuery,
+    ) -> None:
+        """Should key rows by portfolio and include empty portfolios."""
+        with assert_max_queries(1):
+            rows = holdings.get_holdings_for_portfolios(["income", "empty"])
+
+        assert list(rows) == ["income", "empty"]
+        assert [row.symbol.value for row in rows["income"]] == ["MSFT"]
+        assert rows["empty"] == []
+
+    def test_get_holdings_for_all_portfolios(
+        self,
+        holdings: SqlAlchemyHoldingsQuery,
+    ) -> None:
+        """Should load every portfolio holding positions in one query."""
+        with assert_max_queries(1):
+            rows = holdings.get_holdings_for_portfolios()
+
+        assert {
+            portfolio_id: [row.symbol.value for row in portfolio_rows]
+            for portfolio_id, portfolio_rows in rows.items()
+        } == {"growth": ["AAPL", "MSFT"], "income": ["MSFT"]}
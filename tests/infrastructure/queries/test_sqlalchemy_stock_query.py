@@ -0,0 +1,122 @@
+"""Tests for the SQLAlchemy stock field projection."""
+
+# pyright: reportUnknownMemberType=false, reportUnknownArgumentType=false, reportUnknownVariableType=false, reportPrivateUsage=false
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Engine
+
+from src.application.interfaces.stock_query import STOCK_FIELDS, IStockQuery
+from src.domain.value_objects import StockQuerySpec, StockSortKey
+from src.infrastructure.persistence.tables import metadata, stock_table
+from src.infrastructure.queries import SqlAlchemyStockQuery
+from src.infrastructure.queries.sqlalchemy_stock_query import _FIELD_COLUMNS
+from tests.fixtures.infrastructure import assert_max_queries
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Iterator[Engine]:
+    """Create a database with two stocks."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'stocks.db'}")
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        _ = connection.execute(
+            insert(stock_table),
+            [
+                {
+                    "id": "stock-aapl",
+                    "symbol": "AAPL",
+                    "company_name": "Apple Inc.",
+                    "sector": "Technology",
+                    "notes": "Long research notes",
+                },
+                {
+                    "id": "stock-msft",
+                    "symbol": "MSFT",
+                    "company_name": None,
+                    "sector": None,
+                    "notes": None,
+                },
+            ],
+        )
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def stocks(engine: Engine) -> SqlAlchemyStockQuery:
+    """Create the query service."""
+    return SqlAlchemyStockQuery(engine)
+
+
+class TestSqlAlchemyStockQuery:
+    """Test selecting stock fields without hydrating entities."""
+
+    def test_implements_interface(self, stocks: SqlAlchemyStockQuery) -> None:
+        """Should implement the application read model interface."""
+        assert isinstance(stocks, IStockQuery)
+
+    def test_every_whitelisted_field_has_a_column(self) -> None:
+        """Should map each field of the whitelist to a column."""
+        assert set(_FIELD_COLUMNS) == set(STOCK_FIELDS)
+
+    def test_selects_only_requested_columns(
+        self,
+        stocks: SqlAlchemyStockQuery,
+    ) -> None:
+        """Should push the field list into one SELECT."""
+        with assert_max_queries(1) as log:
+            rows = stocks.select_fields(["symbol", "name"])
+
+        sql = next(iter(log.shapes))
+        assert "notes" not in sql
+        assert "sector" not in sql
+        assert sorted(rows, key=str) == [
+            {"symbol": "AAPL", "name": "Apple Inc."},
+            {"symbol": "MSFT", "name": None},
+        ]
+
+    def test_rows_keep_requested_field_order(
+        self,
+        stocks: SqlAlchemyStockQuery,
+    ) -> None:
+        """Should return keys in the requested order."""
+        rows = stocks.select_fields(
+            ["name", "id"],
+            spec=StockQuerySpec(symbol_contains="aap"),
+        )
+
+        assert [list(row) for row in rows] == [["name", "id"]]
+
+    def test_applies_filters_and_sort_of_spec(
+        self,
+        stocks: SqlAlchemyStockQuery,
+    ) -> None:
+        """Should filter and order the projection like the repository."""
+        spec = StockQuerySpec(sort=(StockSortKey("symbol", descending=True),))
+
+        assert stocks.select_fields(["symbol"], spec=spec) == [
+            {"symbol": "MSFT"},
+            {"symbol": "AAPL"},
+        ]
+        assert stocks.select_fields(
+            ["symbol"],
+            spec=StockQuerySpec(sector="Technology"),
+        ) == [{"symbol": "AAPL"}]
+
+    def test_missing_notes_read_as_empty(self, stocks: SqlAlchemyStockQuery) -> None:
+        """Should return "" for stocks without notes, like StockDto."""
+        rows = stocks.select_fields(
+            ["notes"],
+            spec=StockQuerySpec(symbol_contains="MSFT"),
+        )
+
+        assert rows == [{"notes": ""}]
+
+    def test_unknown_field_is_rejected(self, stocks: SqlAlchemyStockQuery) -> None:
+        """Should refuse fields outside the whitelist."""
+        with pytest.raises(ValueError, match="Unknown stock fields: password"):
+            _ = stocks.select_fields(["symbol", "password"])
@@ -0,0 +1,363 @@
+"""Tests for SqlAlchemyJournalRepository implementation."""
+
+# pyright: reportUnknownVariableType=false, reportUnknownMemberType=false
+
+from collections.abc import Iterator
+from datetime import UTC, date, datetime
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, func, insert, select, text
+from sqlalchemy.engine import Connection
+
+from src.domain.entities.journal_entry import JournalEntry
+from src.domain.repositories.interfaces import IJournalRepository
+from src.domain.value_objects import JournalContent
+from src.infrastructure.persistence.database_connection import SqlAlchemyConnection
+from src.infrastructure.persistence.interfaces import IDatabaseConnection
+from src.infrastructure.persistence.tables import (
+    journal_tag_table,
+    metadata,
+    portfolio_table,
+    stock_table,
+)
+from src.infrastructure.persistence.tables.journal_search_index import (
+    JOURNAL_SEARCH_TABLE,
+)
+from src.infrastructure.repositories.sqlalchemy_journal_repository import (
+    SqlAlchemyJournalRepository,
+)
+
+
+def create_entry(
+    entry_id: str,
+    content: str,
+    *,
+    day: int = 15,
+    tags: tuple[str, ...] = (),
+    stock_id: str | None = None,
+    portfolio_id: str | None = None,
+) -> JournalEntry:
+    """Helper to create a journal entry."""
+    return (
+        JournalEntry.Builder()
+        .with_id(entry_id)
+        .with_entry_date(datetime(2024, 1, day, 9, 30, tzinfo=UTC))
+        .with_content(JournalContent(content))
+        .with_stock_id(stock_id)
+        .with_portfolio_id(portfolio_id)
+        .with_tags(tags)
+        .build()
+    )
+
+
+class TestSqlAlchemyJournalRepository:
+    """Test suite for SqlAlchemyJournalRepository with a mock connection."""
+
+    @pytest.fixture
+    def mock_connection(self) -> Mock:
+        """Create a mock database connection."""
+        return Mock(spec=IDatabaseConnection)
+
+    @pytest.fixture
+    def journal_repository(self, mock_connection: Mock) -> SqlAlchemyJournalRepository:
+        """Create a journal repository with mock connection."""
+        return SqlAlchemyJournalRepository(mock_connection)
+
+    def test_repository_implements_interface(
+        self,
+        journal_repository: SqlAlchemyJournalRepository,
+    ) -> None:
+        """Test that repository implements IJournalRepository interface."""
+        assert isinstance(journal_repository, IJournalRepository)
+
+    def test_entity_to_row_denormalizes_tags_and_title(
+        self,
+        journal_repository: SqlAlchemyJournalRepository,
+    ) -> None:
+        """Test that tags and the first line as title are written to the row."""
+        row = journal_repository.entity_to_row(
+            create_entry(
+                "j1",
+                "\n  Earnings beat  \nRaised guidance for the year.",
+                tags=("hold", "earnings"),
+            ),
+        )
+
+        assert row["tags"] == "earnings,hold"
+        assert row["title"] == "Earnings beat"
+        assert row["entry_type"] == "NOTE"
+
+    def test_entity_to_row_truncates_long_title(
+        self,
+        journal_repository: SqlAlchemyJournalRepository,
+    ) -> None:
+        """Test that a long first line is cut to the title length."""
+        row = journal_repository.entity_to_row(create_entry("j1", "x" * 100))
+
+        assert row["title"] == "x" * 80
+
+    def test_get_by_id_handles_dict_rows(
+        self,
+        journal_repository: SqlAlchemyJournalRepository,
+        mock_connection: Mock,
+    ) -> None:
+        """Test that plain dict rows are converted to entities."""
+        row = journal_repository.entity_to_row(create_entry("j1", "Note"))
+        mock_connection.execute.return_value.fetchone.return_value = row
+
+        entry = journal_repository.get_by_id("j1")
+
+        assert entry is not None
+        assert entry.tags == ()
+
+    def test_blank_query_skips_database(
+        self,
+        journal_repository: SqlAlchemyJournalRepository,
+        mock_connection: Mock,
+    ) -> None:
+        """Test that a query with no searchable terms returns an empty page."""
+        page = journal_repository.search("  * ")
+
+        assert page.results == []
+        assert page.next_cursor is None
+        mock_connection.execute.assert_not_called()
+
+    @pytest.mark.parametrize("cursor", ["not-base64!", "bm90LWEtY3Vyc29y"])
+    def test_malformed_cursor_rejected(
+        self,
+        journal_repository: SqlAlchemyJournalRepository,
+        cursor: str,
+    ) -> None:
+        """Test that cursors not produced by search are rejected."""
+        with pytest.raises(ValueError, match="Invalid search cursor"):
+            _ = journal_repository.search("earnings", cursor=cursor)
+
+
+class TestSqlAlchemyJournalRepositoryIntegration:
+    """Integration tests for SqlAlchemyJournalRepository with a real database."""
+
+    @pytest.fixture
+    def connection(self) -> Iterator[Connection]:
+        """Provide a connection to a fresh in-memory database."""
+        engine = create_engine("sqlite:///:memory:")
+        metadata.create_all(engine)
+        with engine.connect() as connection, connection.begin():
+            yield connection
+        engine.dispose()
+
+    @pytest.fixture
+    def journal_repository(self, connection: Connection) -> SqlAlchemyJournalRepository:
+        """Create a journal repository over a seeded in-memory database."""
+        _ = connection.execute(
+            insert(portfolio_table).values(id="portfolio-1", name="Family"),
+        )
+        _ = connection.execute(insert(stock_table).values(id="stock-1", symbol="AAPL"))
+        return SqlAlchemyJournalRepository(SqlAlchemyConnection(connection))
+
+    def test_create_and_get_by_id(
+        self,
+        journal_repository: SqlAlchemyJournalRepository,
+    ) -> None:
+        """Test round-tripping an entry with tags."""
+        _ = journal_repository.create(
+            create_entry("j1", "Revenue beat by 5%", tags=("Earnings", "hold")),
+        )
+
+        entry = journal_repository.get_by_id("j1")
+
+        assert entry is not None
+        assert entry.content == JournalContent("Revenue beat by 5%")
+        assert entry.tags == ("earnings", "hold")
+        assert journal_repository.get_by_id("missing") is None
+
+    def test_relation_and_date_lookups(
+        self,
+        journal_repository: SqlAlchemyJournalRepository,
+    ) -> None:
+        """Test lookups by stock, portfolio, date range and recency."""
+        _ = journal_repository.create(
+            create_entry("j1", "Old", day=1, stock_id="stock-1"),
+        )
+        _ = journal_repository.create(
+            create_entry("j2", "Mid", day=10, portfolio_id="portfolio-1"),
+        )
+        _ = journal_repository.create(
+            create_entry("j3", "New", day=20, stock_id="stock-1"),
+        )
+
+        assert [e.id for e in journal_repository.get_recent(2)] == ["j3", "j2"]
+        assert [e.id for e in journal_repository.get_by_stock("stock-1")] == [
+            "j3",
+            "j1",
+        ]
+        assert [e.id for e in journal_repository.get_by_portfolio("portfolio-1")] == [
+            "j2",
+        ]
+        assert journal_repository.get_by_transaction("transaction-1") == []
+        in_range = journal_repository.get_by_date_range(
+            date(2024, 1, 1),
+            date(2024, 1, 10),
+        )
+        assert [e.id for e in in_range] == ["j2", "j1"]
+
+    def test_search_ranks_and_highlights(
+        self,
+        journal_repository: SqlAlchemyJournalRepository,
+    ) -> None:
+        """Test BM25 ranking puts denser matches first with snippets."""
+        _ = journal_repository.create(
+            create_entry(
+                "j1",
+                "Strong earnings. Earnings beat again, earnings growth.",
+            ),
+        )
+        _ = journal_repository.create(
+            create_entry("j2", "Chart looks extended; earnings are next month."),
+        )
+        _ = journal_repository.create(
+            create_entry("j3", "Trimmed position on weakness."),
+        )
+
+        page = journal_repository.search("earnings")
+
+        assert [r.entry.id for r in page.results] == ["j1", "j2"]
+        assert "[earnings]" in page.results[1].snippet.lower()
+        assert page.results[0].rank <= page.results[1].rank
+        assert page.next_cursor is None
+
+    def test_search_treats_operators_literally(
+        self,
+        journal_repository: SqlAlchemyJournalRepository,
+    ) -> None:
+        """Test user input with FTS5 syntax characters does not error."""
+        _ = journal_repository.create(create_entry("j1", "Stop-loss at 50 (hard)"))
+
+        page = journal_repository.search('stop-loss "hard" OR')
+
+        assert page.results == []
+        assert [r.entry.id for r in journal_repository.search("stop-loss").results] == [
+            "j1",
+        ]
+
+    def test_search_prefix_and_stemming(
+        self,
+        journal_repository: SqlAlchemyJournalRepository,
+    ) -> None:
+        """Test prefix queries and porter stemming."""
+        _ = journal_repository.create(create_entry("j1", "Dividends were increased"))
+
+        assert len(journal_repository.search("divid*").results) == 1
+        assert len(journal_repository.search("increase").results) == 1
+
+    def test_search_keyset_pagination(
+        self,
+        journal_repository: SqlAlchemyJournalRepository,
+    ) -> None:
+        """Test cursors walk every result exactly once."""
+        for index in range(5):
+            _ = journal_repository.create(
+                create_entry(f"j{index}", "Earnings " + "review " * index),
+            )
+
+        seen: list[str] = []
+        cursor: str | None = None
+        pages = 0
+        while True:
+            page = journal_repository.search("earnings", limit=2, cursor=cursor)
+            seen.extend(r.entry.id for r in page.results)
+            pages += 1
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert pages == 3
+        assert sorted(seen) == [f"j{index}" for index in range(5)]
+
+    def test_search_filters_by_all_tags(
+        self,
+        journal_repository: SqlAlchemyJournalRepository,
+    ) -> None:
+        """Test tag filters require every tag."""
+        _ = journal_repository.create(
+            create_entry("j1", "Earnings call", tags=("earnings", "hold")),
+        )
+        _ = journal_repository.create(
+            create_entry("j2", "Earnings call", tags=("earnings",)),
+        )
+
+        page = journal_repository.search("call", tags=["Earnings", "HOLD"])
+
+        assert [r.entry.id for r in page.results] == ["j1"]
+        assert [e.id for e in journal_repository.get_by_tag("earnings")] == ["j2", "j1"]
+
+    def test_update_reindexes_content_and_tags(
+        self,
+        journal_repository: SqlAlchemyJournalRepository,
+    ) -> None:
+        """Test updates keep the search index and tag table in sync."""
+        _ = journal_repository.create(
+            create_entry("j1", "Bought the dip", tags=("buy",)),
+        )
+
+        updated = create_entry("j1", "Sold into strength", tags=("sell",))
+        assert journal_repository.update("j1", updated)
+        assert not journal_repository.update("missing", updated)
+
+        assert journal_repository.search("dip").results == []
+        assert len(journal_repository.search("strength").results) == 1
+        assert journal_repository.get_by_tag("buy") == []
+        assert [e.id for e in journal_repository.get_by_tag("sell")] == ["j1"]
+
+    def test_update_keeps_entry_type_and_retitles(
+        self,
+        journal_repository: SqlAlchemyJournalRepository,
+        connection: Connection,
+    ) -> None:
+        """Test updates keep a stored entry type and take the new first line."""
+        _ = journal_repository.create(create_entry("j1", "Thesis\nCheap on FCF"))
+        _ = connection.execute(
+            text("UPDATE journal_entries SET entry_type = 'RESEARCH'"),
+        )
+
+        assert journal_repository.update(
+            "j1",
+            create_entry("j1", "Thesis revised\nMargins shrinking"),
+        )
+
+        row = connection.execute(
+            text("SELECT entry_type, title FROM journal_entries"),
+        ).one()
+        assert row == ("RESEARCH", "Thesis revised")
+
+    def test_delete_removes_entry_tags_and_index(
+        self,
+        journal_repository: SqlAlchemyJournalRepository,
+        connection: Connection,
+    ) -> None:
+        """Test deletes clean up tags and the search index."""
+        _ = journal_repository.create(create_entry("j1", "Exit plan", tags=("plan",)))
+
+        assert journal_repository.delete("j1")
+        assert not journal_repository.delete("j1")
+
+        assert journal_repository.search("exit").results == []
+        tag_count = connection.execute(
+            select(func.count()).select_from(journal_tag_table),
+        ).scalar_one()
+        assert tag_count == 0
+
+    def test_rebuild_search_index(
+        self,
+        journal_repository: SqlAlchemyJournalRepository,
+        connection: Connection,
+    ) -> None:
+        """Test the index can be rebuilt from stored rows."""
+        _ = journal_repository.create(create_entry("j1", "Rebuild me"))
+        fts = JOURNAL_SEARCH_TABLE
+        _ = connection.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('delete-all')"))
+        assert journal_repository.search("rebuild").results == []
+
+        journal_repository.rebuild_search_index()
+
+        assert len(journal_repository.search("rebuild").results) == 1
@@ -0,0 +1,146 @@
+"""Tests for SqlAlchemyOutboxRepository implementation."""
+
+# pyright: reportUnknownVariableType=false, reportUnknownMemberType=false, reportUnknownArgumentType=false, reportArgumentType=false
+
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.engine import Connection
+
+from src.domain.repositories.interfaces import IOutboxRepository, OutboxMessage
+from src.infrastructure.persistence.database_connection import SqlAlchemyConnection
+from src.infrastructure.persistence.interfaces import IDatabaseConnection
+from src.infrastructure.persistence.tables import metadata, outbox_table
+from src.infrastructure.repositories.sqlalchemy_outbox_repository import (
+    SqlAlchemyOutboxRepository,
+)
+
+
+def create_message(event_id: str) -> OutboxMessage:
+    """Helper to create an outbox message."""
+    return OutboxMessage(
+        event_id=event_id,
+        event_type="StockAddedEvent",
+        payload='{"stock_id":"stock-1"}',
+        occurred_at=datetime(2024, 1, 15, 9, 30, tzinfo=UTC),
+    )
+
+
+class TestSqlAlchemyOutboxRepository:
+    """Test suite for SqlAlchemyOutboxRepository with a mock connection."""
+
+    def test_repository_implements_interface(self) -> None:
+        """Test that repository implements IOutboxRepository interface."""
+        repository = SqlAlchemyOutboxRepository(Mock(spec=IDatabaseConnection))
+
+        assert isinstance(repository, IOutboxRepository)
+
+    def test_empty_calls_do_not_touch_database(self) -> None:
+        """Test that empty batches skip the database and the add hook."""
+        connection = Mock(spec=IDatabaseConnection)
+        on_add = Mock()
+        repository = SqlAlchemyOutboxRepository(connection, on_add=on_add)
+
+        repository.add([])
+
+        assert repository.mark_dispatched([]) == 0
+        connection.execute.assert_not_called()
+        on_add.assert_not_called()
+
+
+class TestSqlAlchemyOutboxRepositoryIntegration:
+    """Integration tests for SqlAlchemyOutboxRepository with a real database."""
+
+    @pytest.fixture
+    def connection(self) -> Iterator[Connection]:
+        """Provide a connection to a fresh in-memory database."""
+        engine = create_engine("sqlite:///:memory:")
+        metadata.create_all(engine)
+        with engine.connect() as connection, connection.begin():
+            yield connection
+        engine.dispose()
+
+    @pytest.fixture
+    def on_add(self) -> Mock:
+        """Hook called after messages are written."""
+        return Mock()
+
+    @pytest.fixture
+    def outbox_repository(
+        self,
+        connection: Connection,
+        on_add: Mock,
+    ) -> SqlAlchemyOutboxRepository:
+        """Create an outbox repository over an in-memory database."""
+        return SqlAlchemyOutboxRepository(SqlAlchemyConnection(connection), on_add)
+
+    def test_add_and_get_pending_round_trip(
+        self,
+        outbox_repository: SqlAlchemyOutboxRepository,
+        on_add: Mock,
+    ) -> None:
+        """Test that stored messages come back in order with UTC timestamps."""
+        outbox_repository.add([create_message("e1"), create_message("e2")])
+
+        pending = outbox_repository.get_pending(10)
+
+        on_add.assert_called_once_with()
+        assert [message.event_id for message in pending] == ["e1", "e2"]
+        assert pending[0].payload == '{"stock_id":"stock-1"}'
+        assert pending[0].occurred_at == datetime(2024, 1, 15, 9, 30, tzinfo=UTC)
+        assert pending[0].sequence is not None
+        assert pending[1].sequence is not None
+        assert pending[0].sequence < pending[1].sequence
+
+    def test_get_pending_honours_limit_and_cursor(
+        self,
+        outbox_repository: SqlAlchemyOutboxRepository,
+    ) -> None:
+        """Test paging through pending messages by sequence."""
+        outbox_repository.add([create_message(f"e{index}") for index in range(5)])
+
+        first_page = outbox_repository.get_pending(2)
+        last_sequence = first_page[-1].sequence
+        assert last_sequence is not None
+        second_page = outbox_repository.get_pending(10, after_sequence=last_sequence)
+
+        assert [message.event_id for message in first_page] == ["e0", "e1"]
+        assert [message.event_id for message in second_page] == ["e2", "e3", "e4"]
+
+    def test_mark_dispatched_hides_messages(
+        self,
+        outbox_repository: SqlAlchemyOutboxRepository,
+    ) -> None:
+        """Test that dispatched messages are no longer pending."""
+        outbox_repository.add([create_message("e1"), create_message("e2")])
+
+        assert outbox_repository.mark_dispatched(["e1", "missing"]) == 1
+        assert outbox_repository.mark_dispatched(["e1"]) == 0
+
+        pending = outbox_repository.get_pending(10)
+        assert [message.event_id for message in pending] == ["e2"]
+
+    def test_purge_dispatched_deletes_only_expired_messages(
+        self,
+        connection: Connection,
+        outbox_repository: SqlAlchemyOutboxRepository,
+    ) -> None:
+        """Test that pending and recently dispatched messages are kept."""
+        outbox_repository.add([create_message(f"e{index}") for index in range(3)])
+        _ = outbox_repository.mark_dispatched(["e0", "e1"])
+        now = datetime.now(UTC)
+        _ = connection.execute(
+            update(outbox_table)
+            .where(outbox_table.c.event_id == "e0")
+            .values(dispatched_at=now - timedelta(days=2)),
+        )
+
+        assert outbox_repository.purge_dispatched(now - timedelta(days=1)) == 1
+
+        remaining = connection.execute(
+            select(outbox_table.c.event_id).order_by(outbox_table.c.sequence),
+        ).scalars()
+        assert list(remaining) == ["e1", "e2"]
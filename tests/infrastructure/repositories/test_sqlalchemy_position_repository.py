@@ -13,9 +13,11 @@ from sqlalchemy.engine import Engine
 from sqlalchemy.exc import IntegrityError
 
 from src.domain.entities.position import Position
+from src.domain.exceptions import ConcurrencyConflictError
 from src.domain.repositories.interfaces import IPositionRepository
 from src.domain.value_objects.money import Money
 from src.domain.value_objects.quantity import Quantity
+from src.infrastructure.persistence.batching import MAX_IN_PARAMETERS
 from src.infrastructure.persistence.interfaces import IDatabaseConnection
 from src.infrastructure.repositories.sqlalchemy_position_repository import (
     SqlAlchemyPositionRepository,
@@ -87,7 +89,10 @@ class TestSqlAlchemyPositionRepository:
         mock_connection.execute.side_effect = IntegrityError(
             "statement",
             "params",
-            Exception("uq_portfolio_stock_position violation"),
+            Exception(
+                'duplicate key value violates unique constraint "'
+                + 'uq_portfolio_stock_position"',
+            ),
         )
 
         with pytest.raises(
@@ -132,6 +137,7 @@ class TestSqlAlchemyPositionRepository:
 
         assert result is True
         mock_connection.execute.assert_called_once()
+        assert sample_position.version == 2
 
     def test_update_returns_false_when_position_not_found(
         self,
@@ -140,9 +146,10 @@ class TestSqlAlchemyPositionRepository:
         sample_position: Position,
     ) -> None:
         """Test that update returns False when position not found."""
-        # Mock no rows affected
+        # Mock no rows affected and no row with the ID
         mock_result = Mock()
         mock_result.rowcount = 0
+        mock_result.scalar.return_value = False
         mock_connection.execute.return_value = mock_result
 
         result = position_repository.update("non-existent", sample_position)
@@ -160,7 +167,10 @@ class TestSqlAlchemyPositionRepository:
         mock_connection.execute.side_effect = IntegrityError(
             "statement",
             "params",
-            Exception("uq_portfolio_stock_position violation"),
+            Exception(
+                'duplicate key value violates unique constraint "'
+                + 'uq_portfolio_stock_position"',
+            ),
         )
 
         with pytest.raises(
@@ -204,6 +214,7 @@ class TestSqlAlchemyPositionRepository:
             "quantity": Decimal("100.0000"),
             "average_cost": Decimal("50.00"),
             "last_transaction_date": datetime(2024, 1, 15, 10, 30, 0, tzinfo=UTC),
+            "version": 1,
         }
 
         mock_result = Mock()
@@ -248,6 +259,7 @@ class TestSqlAlchemyPositionRepository:
             "quantity": Decimal("100.0000"),
             "average_cost": Decimal("50.00"),
             "last_transaction_date": None,
+            "version": 1,
         }
 
         mock_row2 = Mock()
@@ -258,6 +270,7 @@ class TestSqlAlchemyPositionRepository:
             "quantity": Decimal("200.0000"),
             "average_cost": Decimal("25.00"),
             "last_transaction_date": None,
+            "version": 1,
         }
 
         mock_result = Mock()
@@ -299,6 +312,7 @@ class TestSqlAlchemyPositionRepository:
             "quantity": Decimal("100.0000"),
             "average_cost": Decimal("50.00"),
             "last_transaction_date": datetime(2024, 1, 15, 10, 30, 0, tzinfo=UTC),
+            "version": 1,
         }
 
         mock_result = Mock()
@@ -354,9 +368,10 @@ class TestSqlAlchemyPositionRepository:
         mock_connection: Mock,
     ) -> None:
         """Test that delete returns False when position not found."""
-        # Mock no rows affected
+        # Mock no rows affected and no row with the ID
         mock_result = Mock()
         mock_result.rowcount = 0
+        mock_result.scalar.return_value = False
         mock_connection.execute.return_value = mock_result
 
         result = position_repository.delete("non-existent")
@@ -388,9 +403,10 @@ class TestSqlAlchemyPositionRepository:
         mock_connection: Mock,
     ) -> None:
         """Test that delete_by_portfolio_and_stock returns False when not found."""
-        # Mock no rows affected
+        # Mock no rows affected and no row with the ID
         mock_result = Mock()
         mock_result.rowcount = 0
+        mock_result.scalar.return_value = False
         mock_connection.execute.return_value = mock_result
 
         result = position_repository.delete_by_portfolio_and_stock(
@@ -424,6 +440,7 @@ class TestSqlAlchemyPositionRepository:
         )
         assert "created_at" in row
         assert "updated_at" in row
+        assert row["version"] == 1
 
     def test_entity_to_row_handles_none_last_transaction_date(
         self,
@@ -456,6 +473,7 @@ class TestSqlAlchemyPositionRepository:
             "quantity": Decimal("100.5000"),
             "average_cost": Decimal("45.75"),
             "last_transaction_date": datetime(2024, 1, 15, 10, 30, 0, tzinfo=UTC),
+            "version": 1,
         }
 
         position = position_repository.row_to_entity(row)
@@ -487,6 +505,7 @@ class TestSqlAlchemyPositionRepository:
             "quantity": Decimal("100.0000"),
             "average_cost": Decimal("50.00"),
             "last_transaction_date": None,
+            "version": 1,
         }
 
         position = position_repository.row_to_entity(row)
@@ -494,6 +513,30 @@ class TestSqlAlchemyPositionRepository:
         assert position.last_transaction_date is None
 
 
+class TestSqlAlchemyPositionRepositoryBatchedReads:
+    """Test loading positions of many portfolios in chunked queries."""
+
+    def test_runs_one_query_per_chunk(self) -> None:
+        """Should bind each portfolio ID once and stay under the parameter limit."""
+        mock_connection = Mock(spec=IDatabaseConnection)
+        mock_connection.execute.return_value.fetchall.return_value = []
+        repository = SqlAlchemyPositionRepository(mock_connection)
+        portfolio_ids = [f"portfolio-{index}" for index in range(MAX_IN_PARAMETERS + 1)]
+
+        positions = repository.get_positions_for_portfolios(portfolio_ids * 2)
+
+        assert mock_connection.execute.call_count == 2
+        assert list(positions) == portfolio_ids
+
+    def test_no_portfolios_runs_no_query(self) -> None:
+        """Should not query the database for an empty request."""
+        mock_connection = Mock(spec=IDatabaseConnection)
+        repository = SqlAlchemyPositionRepository(mock_connection)
+
+        assert repository.get_positions_for_portfolios([]) == {}
+        mock_connection.execute.assert_not_called()
+
+
 class TestSqlAlchemyPositionRepositoryIntegration:
     """Integration tests for SqlAlchemyPositionRepository with real database."""
 
@@ -580,6 +623,31 @@ class TestSqlAlchemyPositionRepositoryIntegration:
         assert retrieved_position.stock_id == "stock-789"
         assert retrieved_position.quantity == Quantity(Decimal("100.0000"))
 
+    def test_stale_update_raises_concurrency_conflict(
+        self,
+        position_repository: SqlAlchemyPositionRepository,
+        sample_position: Position,
+        test_db: Path,
+    ) -> None:
+        """Test that an update based on a replaced version is rejected."""
+        import sqlalchemy as sa
+
+        engine = sa.create_engine(f"sqlite:///{test_db}")
+        self._setup_test_data(engine)
+        _ = position_repository.create(sample_position)
+        first = position_repository.get_by_id("pos-123")
+        second = position_repository.get_by_id("pos-123")
+        assert first is not None
+        assert second is not None
+
+        assert position_repository.update("pos-123", first) is True
+        with pytest.raises(ConcurrencyConflictError, match="expected version 1"):
+            _ = position_repository.update("pos-123", second)
+
+        stored = position_repository.get_by_id("pos-123")
+        assert stored is not None
+        assert stored.version == 2
+
     def test_unique_constraint_enforcement(
         self,
         position_repository: SqlAlchemyPositionRepository,
@@ -625,6 +693,40 @@ class TestSqlAlchemyPositionRepositoryIntegration:
         ):
             _ = position_repository.create(position2)
 
+    def test_get_positions_for_portfolios(
+        self,
+        position_repository: SqlAlchemyPositionRepository,
+        test_db: Path,
+    ) -> None:
+        """Test loading positions of several portfolios at once."""
+        import sqlalchemy as sa
+
+        engine = sa.create_engine(f"sqlite:///{test_db}")
+        self._setup_test_data(engine)
+        for position_id, portfolio_id, stock_id in (
+            ("pos-1", "portfolio-456", "stock-789"),
+            ("pos-2", "portfolio-456", "stock-abc"),
+            ("pos-3", "portfolio-789", "stock-789"),
+        ):
+            _ = position_repository.create(
+                Position.Builder()
+                .with_id(position_id)
+                .with_portfolio_id(portfolio_id)
+                .with_stock_id(stock_id)
+                .with_quantity(Quantity(Decimal(10)))
+                .with_average_cost(Money(Decimal("50.00")))
+                .build(),
+            )
+
+        positions = position_repository.get_positions_for_portfolios(
+            ["portfolio-456", "portfolio-789", "portfolio-empty", "portfolio-456"],
+        )
+
+        assert list(positions) == ["portfolio-456", "portfolio-789", "portfolio-empty"]
+        assert {p.id for p in positions["portfolio-456"]} == {"pos-1", "pos-2"}
+        assert [p.id for p in positions["portfolio-789"]] == ["pos-3"]
+        assert positions["portfolio-empty"] == []
+
     def _setup_test_data(self, engine: Engine) -> None:
         """Setup required test data (portfolios and stocks)."""
         from src.infrastructure.persistence.tables.portfolio_table import (
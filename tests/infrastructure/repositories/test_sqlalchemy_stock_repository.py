@@ -7,14 +7,17 @@ following TDD principles to define expected behavior before implementation.
 
 # pyright: reportPrivateUsage=false, reportUnknownArgumentType=false
 # pyright: reportUnusedImport=false, reportUnusedCallResult=false
+# pyright: reportUnknownVariableType=false, reportUnknownMemberType=false
 
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from unittest.mock import Mock
 
 import pytest
-from sqlalchemy import exc
+from sqlalchemy import create_engine, exc, insert
 
 from src.domain.entities.stock import Stock
+from src.domain.exceptions import ConcurrencyConflictError, StockAlreadyExistsError
 from src.domain.repositories.interfaces import IStockRepository
 from src.domain.value_objects import (
     CompanyName,
@@ -22,12 +25,18 @@ from src.domain.value_objects import (
     IndustryGroup,
     Notes,
     Sector,
+    StockQuerySpec,
+    StockSortKey,
     StockSymbol,
 )
+from src.infrastructure.persistence.batching import MAX_IN_PARAMETERS
+from src.infrastructure.persistence.database_connection import SqlAlchemyConnection
 from src.infrastructure.persistence.interfaces import IDatabaseConnection
+from src.infrastructure.persistence.tables import metadata, stock_table
 from src.infrastructure.repositories.sqlalchemy_stock_repository import (
     SqlAlchemyStockRepository,
 )
+from tests.fixtures.infrastructure import assert_max_queries
 
 
 class TestSqlAlchemyStockRepositoryConstruction:
@@ -56,11 +65,14 @@ class TestSqlAlchemyStockRepositoryConstruction:
         assert hasattr(repository, "create")
         assert hasattr(repository, "get_by_id")
         assert hasattr(repository, "get_by_symbol")
+        assert hasattr(repository, "get_many_by_ids")
+        assert hasattr(repository, "get_many_by_symbols")
         assert hasattr(repository, "get_all")
         assert hasattr(repository, "update")
         assert hasattr(repository, "delete")
         assert hasattr(repository, "exists_by_symbol")
         assert hasattr(repository, "search_stocks")
+        assert hasattr(repository, "find_stocks")
 
 
 class TestSqlAlchemyStockRepositoryCreate:
@@ -225,9 +237,9 @@ class TestSqlAlchemyStockRepositoryCreate:
         # Arrange
         mock_connection = Mock(spec=IDatabaseConnection)
         mock_connection.execute.side_effect = exc.IntegrityError(
-            "UNIQUE constraint failed: stocks.symbol",
+            "INSERT INTO stocks ...",
             params={},
-            orig=Exception(),
+            orig=Exception("UNIQUE constraint failed: stocks.symbol"),
         )
 
         repository = SqlAlchemyStockRepository(mock_connection)
@@ -240,7 +252,7 @@ class TestSqlAlchemyStockRepositoryCreate:
         )
 
         # Act & Assert
-        with pytest.raises(ValueError, match="Stock with symbol AAPL already exists"):
+        with pytest.raises(StockAlreadyExistsError, match="'AAPL' already exists"):
             repository.create(stock)
 
     def test_create_propagates_other_database_errors(self) -> None:
@@ -314,6 +326,7 @@ class TestSqlAlchemyStockRepositoryGetBySymbol:
             "notes": "Tech giant",
             "created_at": datetime.now(UTC),
             "updated_at": datetime.now(UTC),
+            "version": 1,
         }
 
         mock_result.fetchone.return_value = mock_row
@@ -383,6 +396,7 @@ class TestSqlAlchemyStockRepositoryGetBySymbol:
             "notes": None,
             "created_at": datetime.now(UTC),
             "updated_at": datetime.now(UTC),
+            "version": 1,
         }
 
         mock_result.fetchone.return_value = mock_row
@@ -418,6 +432,7 @@ class TestSqlAlchemyStockRepositoryGetBySymbol:
             "notes": "Test stock",
             "created_at": datetime.now(UTC),
             "updated_at": datetime.now(UTC),
+            "version": 1,
         }
 
         mock_result.fetchone.return_value = mock_row
@@ -529,6 +544,7 @@ class TestSqlAlchemyStockRepositoryDataMapping:
             "notes": "Database notes",
             "created_at": datetime.now(UTC),
             "updated_at": datetime.now(UTC),
+            "version": 1,
         }
         mock_result = Mock()
         mock_result.fetchone.return_value = mock_row
@@ -572,6 +588,7 @@ class TestSqlAlchemyStockRepositoryGetById:
             "notes": "Parent of Google",
             "created_at": datetime.now(UTC),
             "updated_at": datetime.now(UTC),
+            "version": 1,
         }
 
         mock_result.fetchone.return_value = mock_row
@@ -639,6 +656,143 @@ class TestSqlAlchemyStockRepositoryGetById:
             repository.get_by_id("test-id")
 
 
+class TestSqlAlchemyStockRepositoryGetMany:
+    """Test the batched get_many_by_ids and get_many_by_symbols methods."""
+
+    @staticmethod
+    def symbol(index: int) -> str:
+        """Get a unique symbol of upper-case letters, e.g. "AAB" for 1."""
+        letters = ""
+        for _ in range(3):
+            index, remainder = divmod(index, 26)
+            letters = chr(ord("A") + remainder) + letters
+        return letters
+
+    @pytest.fixture
+    def repository(self) -> Iterator[SqlAlchemyStockRepository]:
+        """Create a repository over an in-memory database with 2,000 stocks."""
+        engine = create_engine("sqlite:///:memory:")
+        metadata.create_all(engine)
+        with engine.connect() as connection:
+            _ = connection.execute(
+                insert(stock_table),
+                [
+                    {"id": f"stock-{index}", "symbol": self.symbol(index)}
+                    for index in range(2_000)
+                ],
+            )
+            yield SqlAlchemyStockRepository(SqlAlchemyConnection(connection))
+        engine.dispose()
+
+    def test_get_many_by_ids_returns_found_stocks(
+        self,
+        repository: SqlAlchemyStockRepository,
+    ) -> None:
+        """Should key found stocks by ID and skip unknown IDs."""
+        with assert_max_queries(1):
+            stocks = repository.get_many_by_ids(["stock-1", "stock-2", "missing"])
+
+        assert sorted(stocks) == ["stock-1", "stock-2"]
+        assert stocks["stock-2"].symbol.value == "AAC"
+
+    def test_get_many_by_symbols_returns_found_stocks(
+        self,
+        repository: SqlAlchemyStockRepository,
+    ) -> None:
+        """Should key found stocks by symbol value and skip unknown symbols."""
+        symbols = [StockSymbol("AAB"), StockSymbol("AAC"), StockSymbol("NONE")]
+
+        with assert_max_queries(1):
+            stocks = repository.get_many_by_symbols(symbols)
+
+        assert sorted(stocks) == ["AAB", "AAC"]
+        assert stocks["AAB"].id == "stock-1"
+
+    def test_large_requests_are_chunked(
+        self,
+        repository: SqlAlchemyStockRepository,
+    ) -> None:
+        """Should run one query per chunk below the bound-parameter limit."""
+        stock_ids = [f"stock-{index}" for index in range(2_000)]
+
+        with assert_max_queries(3) as log:
+            stocks = repository.get_many_by_ids(stock_ids + stock_ids)
+
+        assert len(stocks) == 2_000
+        assert log.count == -(-2_000 // MAX_IN_PARAMETERS)
+
+    def test_empty_request_runs_no_query(
+        self,
+        repository: SqlAlchemyStockRepository,
+    ) -> None:
+        """Should not query the database for an empty request."""
+        with assert_max_queries(0):
+            assert repository.get_many_by_ids([]) == {}
+            assert repository.get_many_by_symbols([]) == {}
+
+
+class TestSqlAlchemyStockRepositoryCreateMany:
+    """Test the bulk create_many method."""
+
+    @pytest.fixture
+    def repository(self) -> Iterator[SqlAlchemyStockRepository]:
+        """Create a repository over an empty in-memory database."""
+        engine = create_engine("sqlite:///:memory:")
+        metadata.create_all(engine)
+        with engine.connect() as connection:
+            yield SqlAlchemyStockRepository(SqlAlchemyConnection(connection))
+        engine.dispose()
+
+    def test_create_many_inserts_with_one_statement(
+        self,
+        repository: SqlAlchemyStockRepository,
+    ) -> None:
+        """Should insert every stock in a single executemany."""
+        stocks = [
+            Stock.Builder().with_symbol(StockSymbol(symbol)).build()
+            for symbol in ("AAPL", "MSFT", "NVDA")
+        ]
+
+        with assert_max_queries(1):
+            created = repository.create_many(stocks)
+
+        assert created == 3
+        assert len(repository.get_all()) == 3
+
+    def test_create_many_empty_runs_no_query(
+        self,
+        repository: SqlAlchemyStockRepository,
+    ) -> None:
+        """Should not touch the database for an empty list."""
+        with assert_max_queries(0):
+            assert repository.create_many([]) == 0
+
+    def test_create_many_rejects_existing_symbol(
+        self,
+        repository: SqlAlchemyStockRepository,
+    ) -> None:
+        """Should translate a duplicate symbol into StockAlreadyExistsError."""
+        _ = repository.create(Stock.Builder().with_symbol(StockSymbol("AAPL")).build())
+        stocks = [Stock.Builder().with_symbol(StockSymbol("AAPL")).build()]
+
+        with pytest.raises(StockAlreadyExistsError, match="already exists"):
+            _ = repository.create_many(stocks)
+
+    def test_create_many_propagates_other_integrity_errors(self) -> None:
+        """Should re-raise integrity errors unrelated to symbols."""
+        mock_connection = Mock(spec=IDatabaseConnection)
+        mock_connection.execute.side_effect = exc.IntegrityError(
+            "NOT NULL constraint failed: stocks.id",
+            params={},
+            orig=Exception(),
+        )
+        repository = SqlAlchemyStockRepository(mock_connection)
+        stocks = [Stock.Builder().with_symbol(StockSymbol("AAPL")).build()]
+
+        with pytest.raises(exc.IntegrityError):
+            _ = repository.create_many(stocks)
+
+
 class TestSqlAlchemyStockRepositoryGetAll:
     """Test the get_all method of the repository."""
 
@@ -685,6 +839,7 @@ class TestSqlAlchemyStockRepositoryGetAll:
                 "notes": "iPhone maker",
                 "created_at": datetime.now(UTC),
                 "updated_at": datetime.now(UTC),
+                "version": 1,
             },
             {
                 "id": "stock-2",
@@ -696,6 +851,7 @@ class TestSqlAlchemyStockRepositoryGetAll:
                 "notes": "",
                 "created_at": datetime.now(UTC),
                 "updated_at": datetime.now(UTC),
+                "version": 1,
             },
             {
                 "id": "stock-3",
@@ -707,6 +863,7 @@ class TestSqlAlchemyStockRepositoryGetAll:
                 "notes": None,
                 "created_at": datetime.now(UTC),
                 "updated_at": datetime.now(UTC),
+                "version": 1,
             },
         ]
 
@@ -814,6 +971,7 @@ class TestSqlAlchemyStockRepositoryUpdate:
         mock_connection = Mock(spec=IDatabaseConnection)
         mock_result = Mock()
         mock_result.rowcount = 0  # No rows affected
+        mock_result.scalar.return_value = False  # No row with the ID
         mock_connection.execute.return_value = mock_result
 
         repository = SqlAlchemyStockRepository(mock_connection)
@@ -889,9 +1047,9 @@ class TestSqlAlchemyStockRepositoryUpdate:
         # Arrange
         mock_connection = Mock(spec=IDatabaseConnection)
         mock_connection.execute.side_effect = exc.IntegrityError(
-            "UNIQUE constraint failed: stocks.symbol",
+            "INSERT INTO stocks ...",
             params={},
-            orig=Exception(),
+            orig=Exception("UNIQUE constraint failed: stocks.symbol"),
         )
 
         repository = SqlAlchemyStockRepository(mock_connection)
@@ -904,7 +1062,7 @@ class TestSqlAlchemyStockRepositoryUpdate:
         )  # Trying to change to existing symbol
 
         # Act & Assert
-        with pytest.raises(ValueError, match="Stock with symbol MSFT already exists"):
+        with pytest.raises(StockAlreadyExistsError, match="'MSFT' already exists"):
             repository.update("test-id", stock)
 
     def test_update_propagates_non_symbol_integrity_errors(self) -> None:
@@ -935,6 +1093,110 @@ class TestSqlAlchemyStockRepositoryUpdate:
             repository.update("test-id", stock)
 
 
+class TestSqlAlchemyStockRepositoryUpdateAndGet:
+    """Test the update_and_get method against an in-memory database."""
+
+    @pytest.fixture
+    def repository(self) -> Iterator[SqlAlchemyStockRepository]:
+        """Create a repository over an empty in-memory database."""
+        engine = create_engine("sqlite:///:memory:")
+        metadata.create_all(engine)
+        with engine.connect() as connection:
+            yield SqlAlchemyStockRepository(SqlAlchemyConnection(connection))
+        engine.dispose()
+
+    def test_update_and_get_returns_stored_row_in_one_statement(
+        self,
+        repository: SqlAlchemyStockRepository,
+    ) -> None:
+        """Should write the stock and read it back with UPDATE ... RETURNING."""
+        stock = Stock.Builder().with_symbol(StockSymbol("AAPL")).build()
+        _ = repository.create(stock)
+        stock.update_fields(name="Apple Inc.", grade="A")
+
+        with assert_max_queries(1):
+            stored = repository.update_and_get(stock.id, stock)
+
+        assert stored is not None
+        assert stored.id == stock.id
+        assert stored.company_name == CompanyName("Apple Inc.")
+        assert stored.grade == Grade("A")
+        assert stored.version == 2
+
+    def test_update_advances_loaded_version(
+        self,
+        repository: SqlAlchemyStockRepository,
+    ) -> None:
+        """Should increment the stored and in-memory version on update."""
+        stock = Stock.Builder().with_symbol(StockSymbol("AAPL")).build()
+        _ = repository.create(stock)
+
+        assert repository.update(stock.id, stock) is True
+        assert stock.version == 2
+        stored = repository.get_by_id(stock.id)
+        assert stored is not None
+        assert stored.version == 2
+
+    def test_stale_update_raises_concurrency_conflict(
+        self,
+        repository: SqlAlchemyStockRepository,
+    ) -> None:
+        """Should reject an update based on a version another writer replaced."""
+        _ = repository.create(Stock.Builder().with_symbol(StockSymbol("AAPL")).build())
+        first = repository.get_by_symbol(StockSymbol("AAPL"))
+        second = repository.get_by_symbol(StockSymbol("AAPL"))
+        assert first is not None
+        assert second is not None
+        first.update_fields(grade="A")
+        second.update_fields(grade="B")
+        _ = repository.update_and_get(first.id, first)
+
+        with pytest.raises(ConcurrencyConflictError, match="expected version 1"):
+            _ = repository.update_and_get(second.id, second)
+        with pytest.raises(ConcurrencyConflictError):
+            _ = repository.update(second.id, second)
+
+        stored = repository.get_by_id(first.id)
+        assert stored is not None
+        assert stored.grade == Grade("A")
+
+    def test_update_and_get_returns_none_when_missing(
+        self,
+        repository: SqlAlchemyStockRepository,
+    ) -> None:
+        """Should return None when no stock has the ID."""
+        stock = Stock.Builder().with_symbol(StockSymbol("AAPL")).build()
+
+        assert repository.update_and_get("missing", stock) is None
+
+    def test_update_and_get_rejects_taken_symbol(
+        self,
+        repository: SqlAlchemyStockRepository,
+    ) -> None:
+        """Should classify the unique symbol violation as a duplicate stock."""
+        _ = repository.create(Stock.Builder().with_symbol(StockSymbol("MSFT")).build())
+        stock = Stock.Builder().with_symbol(StockSymbol("AAPL")).build()
+        _ = repository.create(stock)
+        stock.update_fields(symbol="MSFT")
+
+        with pytest.raises(StockAlreadyExistsError, match="'MSFT' already exists"):
+            _ = repository.update_and_get(stock.id, stock)
+
+    def test_update_and_get_propagates_other_integrity_errors(self) -> None:
+        """Should re-raise integrity errors unrelated to the symbol."""
+        mock_connection = Mock(spec=IDatabaseConnection)
+        mock_connection.execute.side_effect = exc.IntegrityError(
+            "UPDATE stocks ...",
+            params={},
+            orig=Exception("NOT NULL constraint failed: stocks.symbol"),
+        )
+        repository = SqlAlchemyStockRepository(mock_connection)
+        stock = Stock.Builder().with_symbol(StockSymbol("AAPL")).build()
+
+        with pytest.raises(exc.IntegrityError):
+            _ = repository.update_and_get(stock.id, stock)
+
+
 class TestSqlAlchemyStockRepositoryDelete:
     """Test the delete method of the repository."""
 
@@ -1022,7 +1284,7 @@ class TestSqlAlchemyStockRepositoryExistsBySymbol:
         # Arrange
         mock_connection = Mock(spec=IDatabaseConnection)
         mock_result = Mock()
-        mock_result.scalar.return_value = 1  # COUNT(*) returns 1
+        mock_result.scalar.return_value = True  # EXISTS found a row
         mock_connection.execute.return_value = mock_result
 
         repository = SqlAlchemyStockRepository(mock_connection)
@@ -1034,17 +1296,19 @@ class TestSqlAlchemyStockRepositoryExistsBySymbol:
         # Assert
         assert result is True
 
-        # Verify the select statement
+        # Verify the select statement probes with EXISTS rather than COUNT
         call_args = mock_connection.execute.call_args
         statement = call_args[0][0]
         assert statement.is_select
+        assert "EXISTS" in str(statement)
+        assert "count" not in str(statement).lower()
 
     def test_exists_by_symbol_returns_false_when_stock_not_exists(self) -> None:
         """Should return False when stock with symbol does not exist."""
         # Arrange
         mock_connection = Mock(spec=IDatabaseConnection)
         mock_result = Mock()
-        mock_result.scalar.return_value = 0  # COUNT(*) returns 0
+        mock_result.scalar.return_value = False  # EXISTS found nothing
         mock_connection.execute.return_value = mock_result
 
         repository = SqlAlchemyStockRepository(mock_connection)
@@ -1094,6 +1358,7 @@ class TestSqlAlchemyStockRepositorySearchStocks:
                 "notes": "",
                 "created_at": datetime.now(UTC),
                 "updated_at": datetime.now(UTC),
+                "version": 1,
             },
             {
                 "id": "stock-2",
@@ -1105,6 +1370,7 @@ class TestSqlAlchemyStockRepositorySearchStocks:
                 "notes": "",
                 "created_at": datetime.now(UTC),
                 "updated_at": datetime.now(UTC),
+                "version": 1,
             },
         ]
 
@@ -1137,6 +1403,7 @@ class TestSqlAlchemyStockRepositorySearchStocks:
                 "notes": "",
                 "created_at": datetime.now(UTC),
                 "updated_at": datetime.now(UTC),
+                "version": 1,
             },
         ]
 
@@ -1174,6 +1441,7 @@ class TestSqlAlchemyStockRepositorySearchStocks:
                 "notes": "",
                 "created_at": datetime.now(UTC),
                 "updated_at": datetime.now(UTC),
+                "version": 1,
             },
         ]
 
@@ -1207,6 +1475,7 @@ class TestSqlAlchemyStockRepositorySearchStocks:
                 "notes": "",
                 "created_at": datetime.now(UTC),
                 "updated_at": datetime.now(UTC),
+                "version": 1,
             },
         ]
 
@@ -1240,6 +1509,7 @@ class TestSqlAlchemyStockRepositorySearchStocks:
                 "notes": "",
                 "created_at": datetime.now(UTC),
                 "updated_at": datetime.now(UTC),
+                "version": 1,
             },
         ]
 
@@ -1288,6 +1558,140 @@ class TestSqlAlchemyStockRepositorySearchStocks:
             repository.search_stocks()
 
 
+class TestSqlAlchemyStockRepositoryFindStocks:
+    """Test filtering and sorting stocks by a query spec in the database."""
+
+    @pytest.fixture
+    def repository(self) -> Iterator[SqlAlchemyStockRepository]:
+        """Create a repository over an in-memory database with four stocks."""
+        engine = create_engine("sqlite:///:memory:")
+        metadata.create_all(engine)
+        with engine.connect() as connection:
+            _ = connection.execute(
+                insert(stock_table),
+                [
+                    {
+                        "id": f"stock-{symbol.lower()}",
+                        "symbol": symbol,
+                        "company_name": name,
+                        "sector": sector,
+                        "industry_group": industry_group,
+                        "grade": grade,
+                    }
+                    for symbol, name, sector, industry_group, grade in [
+                        ("AAPL", "Apple", "Technology", "Hardware", "A"),
+                        ("AMZN", "Amazon", "Consumer Goods", "Automotive", "B"),
+                        ("MSFT", "Microsoft", "Technology", "Software", "A"),
+                        ("XOM", "Exxon", "Energy", None, "C"),
+                    ]
+                ],
+            )
+            yield SqlAlchemyStockRepository(SqlAlchemyConnection(connection))
+        engine.dispose()
+
+    @staticmethod
+    def symbols(stocks: list[Stock]) -> list[str]:
+        """Get the symbols of stocks in order."""
+        return [stock.symbol.value for stock in stocks]
+
+    def test_empty_spec_returns_every_stock(
+        self,
+        repository: SqlAlchemyStockRepository,
+    ) -> None:
+        """Should not filter when the spec sets nothing."""
+        assert len(repository.find_stocks(StockQuerySpec())) == 4
+
+    def test_filters_are_combined(
+        self,
+        repository: SqlAlchemyStockRepository,
+    ) -> None:
+        """Should AND the equality filters in one query."""
+        spec = StockQuerySpec(sector="Technology", grade="A", industry_group="Software")
+
+        with assert_max_queries(1):
+            stocks = repository.find_stocks(spec)
+
+        assert self.symbols(stocks) == ["MSFT"]
+
+    @pytest.mark.parametrize(
+        ("prefix", "expected"),
+        [("A", ["AAPL", "AMZN"]), ("am", ["AMZN"]), ("AMZN", ["AMZN"]), ("Z", [])],
+    )
+    def test_symbol_prefix_matches_any_case(
+        self,
+        repository: SqlAlchemyStockRepository,
+        prefix: str,
+        expected: list[str],
+    ) -> None:
+        """Should match symbols starting with the prefix."""
+        spec = StockQuerySpec(
+            symbol_prefix=prefix,
+            sort=(StockSortKey("symbol"),),
+        )
+
+        stocks = repository.find_stocks(spec)
+
+        assert self.symbols(stocks) == expected
+
+    def test_symbol_contains_matches_any_case(
+        self,
+        repository: SqlAlchemyStockRepository,
+    ) -> None:
+        """Should match symbols containing the substring."""
+        stocks = repository.find_stocks(StockQuerySpec(symbol_contains="a"))
+
+        assert sorted(self.symbols(stocks)) == ["AAPL", "AMZN"]
+
+    def test_sorts_by_several_keys(
+        self,
+        repository: SqlAlchemyStockRepository,
+    ) -> None:
+        """Should order by each key in turn, breaking ties by symbol."""
+        spec = StockQuerySpec(
+            sort=(StockSortKey("grade"), StockSortKey("name", descending=True)),
+        )
+
+        stocks = repository.find_stocks(spec)
+
+        assert self.symbols(stocks) == ["MSFT", "AAPL", "AMZN", "XOM"]
+
+    def test_ties_resolve_by_symbol(
+        self,
+        repository: SqlAlchemyStockRepository,
+    ) -> None:
+        """Should order stocks with equal sort keys by symbol."""
+        spec = StockQuerySpec(sort=(StockSortKey("sector", descending=True),))
+
+        stocks = repository.find_stocks(spec)
+
+        assert self.symbols(stocks) == ["AAPL", "MSFT", "XOM", "AMZN"]
+
+    def test_handles_dict_rows(self) -> None:
+        """Should map rows that are plain dicts, as mocks return them."""
+        mock_connection = Mock(spec=IDatabaseConnection)
+        mock_result = Mock()
+        mock_result.fetchall.return_value = [
+            {
+                "id": "stock-1",
+                "symbol": "AAPL",
+                "company_name": "Apple Inc.",
+                "sector": "Technology",
+                "industry_group": "Hardware",
+                "grade": "A",
+                "notes": "",
+                "created_at": datetime.now(UTC),
+                "updated_at": datetime.now(UTC),
+                "version": 1,
+            },
+        ]
+        mock_connection.execute.return_value = mock_result
+        repository = SqlAlchemyStockRepository(mock_connection)
+
+        stocks = repository.find_stocks(StockQuerySpec())
+
+        assert self.symbols(stocks) == ["AAPL"]
+
+
 class TestSqlAlchemyStockRepositoryStubMethods:
     """Test that stub methods for unimplemented interface methods exist."""
 
@@ -1306,3 +1710,4 @@ class TestSqlAlchemyStockRepositoryStubMethods:
         assert hasattr(repository, "delete")
         assert hasattr(repository, "exists_by_symbol")
         assert hasattr(repository, "search_stocks")
+        assert hasattr(repository, "find_stocks")
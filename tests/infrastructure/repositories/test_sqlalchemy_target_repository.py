@@ -0,0 +1,259 @@
+"""Tests for SqlAlchemyTargetRepository implementation."""
+
+# pyright: reportUnknownVariableType=false, reportUnknownMemberType=false
+
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Connection
+
+from src.domain.entities.target import Target
+from src.domain.repositories.interfaces import ITargetRepository
+from src.domain.value_objects import Money, Notes, TargetStatus
+from src.infrastructure.persistence.batching import MAX_IN_PARAMETERS
+from src.infrastructure.persistence.database_connection import SqlAlchemyConnection
+from src.infrastructure.persistence.interfaces import IDatabaseConnection
+from src.infrastructure.persistence.tables import (
+    metadata,
+    portfolio_table,
+    stock_table,
+)
+from src.infrastructure.repositories.sqlalchemy_target_repository import (
+    SqlAlchemyTargetRepository,
+)
+
+
+def create_target(
+    target_id: str,
+    stock_id: str = "stock-1",
+    pivot: str = "110.00",
+    failure: str = "90.00",
+) -> Target:
+    """Helper to create an active target."""
+    return (
+        Target.Builder()
+        .with_id(target_id)
+        .with_portfolio_id("portfolio-1")
+        .with_stock_id(stock_id)
+        .with_pivot_price(Money(pivot))
+        .with_failure_price(Money(failure))
+        .with_status(TargetStatus("active"))
+        .with_created_date(datetime(2024, 1, 15, 10, 30, tzinfo=UTC))
+        .with_notes(Notes("Breakout watch"))
+        .build()
+    )
+
+
+class TestSqlAlchemyTargetRepository:
+    """Test suite for SqlAlchemyTargetRepository with a mock connection."""
+
+    @pytest.fixture
+    def mock_connection(self) -> Mock:
+        """Create a mock database connection."""
+        return Mock(spec=IDatabaseConnection)
+
+    @pytest.fixture
+    def target_repository(self, mock_connection: Mock) -> SqlAlchemyTargetRepository:
+        """Create a target repository with mock connection."""
+        return SqlAlchemyTargetRepository(mock_connection)
+
+    def test_repository_implements_interface(
+        self,
+        target_repository: SqlAlchemyTargetRepository,
+    ) -> None:
+        """Test that repository implements ITargetRepository interface."""
+        assert isinstance(target_repository, ITargetRepository)
+
+    def test_bulk_update_status_empty_skips_database(
+        self,
+        target_repository: SqlAlchemyTargetRepository,
+        mock_connection: Mock,
+    ) -> None:
+        """Test that an empty status mapping issues no statement."""
+        assert target_repository.bulk_update_status({}) == 0
+        mock_connection.execute.assert_not_called()
+
+    def test_bulk_update_status_issues_single_statement(
+        self,
+        target_repository: SqlAlchemyTargetRepository,
+        mock_connection: Mock,
+    ) -> None:
+        """Test that many status changes go out in one UPDATE."""
+        mock_connection.execute.return_value.rowcount = 3
+
+        updated = target_repository.bulk_update_status(
+            {"t1": "hit", "t2": "failed", "t3": "HIT"},
+        )
+
+        assert updated == 3
+        mock_connection.execute.assert_called_once()
+        statement = mock_connection.execute.call_args[0][0]
+        assert statement.table.name == "targets"
+
+    def test_bulk_update_status_chunks_large_batches(
+        self,
+        target_repository: SqlAlchemyTargetRepository,
+        mock_connection: Mock,
+    ) -> None:
+        """Test that large batches stay below SQLite's parameter limit."""
+        mock_connection.execute.return_value.rowcount = 1
+        chunk_size = MAX_IN_PARAMETERS // 3
+
+        updated = target_repository.bulk_update_status(
+            {f"t{index}": "hit" for index in range(2 * chunk_size + 1)},
+        )
+
+        assert updated == 3
+        assert mock_connection.execute.call_count == 3
+        for call in mock_connection.execute.call_args_list:
+            params = call[0][0].compile().params
+            assert len(params) <= MAX_IN_PARAMETERS + 1
+
+    def test_bulk_update_status_rejects_invalid_status(
+        self,
+        target_repository: SqlAlchemyTargetRepository,
+        mock_connection: Mock,
+    ) -> None:
+        """Test that invalid statuses are rejected before touching the database."""
+        with pytest.raises(ValueError, match="Target status must be one of"):
+            _ = target_repository.bulk_update_status({"t1": "exploded"})
+        mock_connection.execute.assert_not_called()
+
+    def test_get_by_id_handles_dict_rows(
+        self,
+        target_repository: SqlAlchemyTargetRepository,
+        mock_connection: Mock,
+    ) -> None:
+        """Test that plain dict rows are converted to entities."""
+        row = target_repository.entity_to_row(create_target("t1"))
+        mock_connection.execute.return_value.fetchone.return_value = row
+
+        target = target_repository.get_by_id("t1")
+
+        assert target is not None
+        assert target.id == "t1"
+
+    def test_row_to_entity_handles_missing_notes(
+        self,
+        target_repository: SqlAlchemyTargetRepository,
+    ) -> None:
+        """Test that NULL notes become empty notes."""
+        row = target_repository.entity_to_row(create_target("t1"))
+        row["notes"] = None
+
+        target = target_repository.row_to_entity(row)
+
+        assert not target.has_notes()
+
+
+class TestSqlAlchemyTargetRepositoryIntegration:
+    """Integration tests for SqlAlchemyTargetRepository with a real database."""
+
+    @pytest.fixture
+    def connection(self) -> Iterator[Connection]:
+        """Provide a connection to a fresh in-memory database."""
+        engine = create_engine("sqlite:///:memory:")
+        metadata.create_all(engine)
+        with engine.connect() as connection, connection.begin():
+            yield connection
+        engine.dispose()
+
+    @pytest.fixture
+    def target_repository(self, connection: Connection) -> SqlAlchemyTargetRepository:
+        """Create a target repository over a seeded in-memory database."""
+        _ = connection.execute(
+            insert(portfolio_table).values(id="portfolio-1", name="Family"),
+        )
+        for stock_id, symbol in (("stock-1", "AAPL"), ("stock-2", "MSFT")):
+            _ = connection.execute(
+                insert(stock_table).values(id=stock_id, symbol=symbol),
+            )
+        return SqlAlchemyTargetRepository(SqlAlchemyConnection(connection))
+
+    def test_create_and_get_by_id(
+        self,
+        target_repository: SqlAlchemyTargetRepository,
+    ) -> None:
+        """Test round-tripping a target through the database."""
+        _ = target_repository.create(create_target("t1", pivot="110.25"))
+
+        target = target_repository.get_by_id("t1")
+
+        assert target is not None
+        assert target.pivot_price == Money(Decimal("110.25"))
+        assert target.failure_price == Money(Decimal("90.00"))
+        assert target.is_active()
+        assert target.notes == Notes("Breakout watch")
+
+    def test_get_by_id_returns_none_when_missing(
+        self,
+        target_repository: SqlAlchemyTargetRepository,
+    ) -> None:
+        """Test that unknown IDs return None."""
+        assert target_repository.get_by_id("missing") is None
+
+    def test_active_queries_exclude_resolved_targets(
+        self,
+        target_repository: SqlAlchemyTargetRepository,
+    ) -> None:
+        """Test active lookups by portfolio, stock and overall."""
+        for target in (
+            create_target("t1", "stock-1"),
+            create_target("t2", "stock-2"),
+            create_target("t3", "stock-2"),
+        ):
+            _ = target_repository.create(target)
+        assert target_repository.update_status("t3", "cancelled")
+
+        assert {t.id for t in target_repository.get_all_active()} == {"t1", "t2"}
+        assert [t.id for t in target_repository.get_active_by_stock("stock-2")] == [
+            "t2",
+        ]
+        assert {
+            t.id for t in target_repository.get_active_by_portfolio("portfolio-1")
+        } == {"t1", "t2"}
+
+    def test_bulk_update_status_sets_each_status(
+        self,
+        target_repository: SqlAlchemyTargetRepository,
+    ) -> None:
+        """Test a single bulk update applies per-target statuses."""
+        for target_id in ("t1", "t2", "t3"):
+            _ = target_repository.create(create_target(target_id))
+
+        updated = target_repository.bulk_update_status(
+            {"t1": "hit", "t2": "failed", "missing": "hit"},
+        )
+
+        assert updated == 2
+        statuses = {
+            target_id: target.status.value
+            for target_id in ("t1", "t2", "t3")
+            if (target := target_repository.get_by_id(target_id)) is not None
+        }
+        assert statuses == {"t1": "hit", "t2": "failed", "t3": "active"}
+
+    def test_update_status_returns_false_when_missing(
+        self,
+        target_repository: SqlAlchemyTargetRepository,
+    ) -> None:
+        """Test updating an unknown target reports no change."""
+        assert not target_repository.update_status("missing", "hit")
+
+    def test_update_replaces_fields(
+        self,
+        target_repository: SqlAlchemyTargetRepository,
+    ) -> None:
+        """Test full updates persist edited thresholds."""
+        _ = target_repository.create(create_target("t1"))
+
+        assert target_repository.update("t1", create_target("t1", pivot="125.00"))
+        assert not target_repository.update("missing", create_target("missing"))
+
+        target = target_repository.get_by_id("t1")
+        assert target is not None
+        assert target.pivot_price == Money("125.00")
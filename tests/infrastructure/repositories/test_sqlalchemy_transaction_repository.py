@@ -0,0 +1,244 @@
+"""Tests for SqlAlchemyTransactionRepository implementation."""
+
+# pyright: reportUnknownVariableType=false, reportUnknownMemberType=false
+
+from collections.abc import Iterator
+from datetime import UTC, date, datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Connection
+
+from src.domain.entities.transaction import Transaction
+from src.domain.repositories.interfaces import ITransactionRepository
+from src.domain.value_objects import Money, Notes, Quantity, TransactionType
+from src.infrastructure.persistence.database_connection import SqlAlchemyConnection
+from src.infrastructure.persistence.interfaces import IDatabaseConnection
+from src.infrastructure.persistence.tables import (
+    metadata,
+    portfolio_table,
+    stock_table,
+)
+from src.infrastructure.repositories.sqlalchemy_transaction_repository import (
+    SqlAlchemyTransactionRepository,
+)
+from tests.fixtures.infrastructure import assert_max_queries
+
+
+def create_transaction(
+    transaction_id: str,
+    *,
+    stock_id: str = "stock-1",
+    transaction_type: str = "buy",
+    quantity: str = "10",
+    price: str = "100.00",
+    trade_date: datetime | None = None,
+    notes: str = "",
+) -> Transaction:
+    """Helper to create a transaction in portfolio-1."""
+    return (
+        Transaction.Builder()
+        .with_id(transaction_id)
+        .with_portfolio_id("portfolio-1")
+        .with_stock_id(stock_id)
+        .with_transaction_type(TransactionType(transaction_type))
+        .with_quantity(Quantity(quantity))
+        .with_price(Money(price))
+        .with_transaction_date(trade_date or datetime(2024, 1, 15, tzinfo=UTC))
+        .with_notes(Notes(notes))
+        .build()
+    )
+
+
+class TestSqlAlchemyTransactionRepository:
+    """Test suite for SqlAlchemyTransactionRepository with a mock connection."""
+
+    @pytest.fixture
+    def mock_connection(self) -> Mock:
+        """Create a mock database connection."""
+        return Mock(spec=IDatabaseConnection)
+
+    @pytest.fixture
+    def repository(self, mock_connection: Mock) -> SqlAlchemyTransactionRepository:
+        """Create a transaction repository with mock connection."""
+        return SqlAlchemyTransactionRepository(mock_connection)
+
+    def test_repository_implements_interface(
+        self,
+        repository: SqlAlchemyTransactionRepository,
+    ) -> None:
+        """Test that repository implements ITransactionRepository interface."""
+        assert isinstance(repository, ITransactionRepository)
+
+    def test_create_many_empty_skips_database(
+        self,
+        repository: SqlAlchemyTransactionRepository,
+        mock_connection: Mock,
+    ) -> None:
+        """Test that an empty list issues no statement."""
+        assert repository.create_many([]) == 0
+        assert repository.count_stored([]) == {}
+        mock_connection.execute.assert_not_called()
+
+    def test_entity_to_row_stores_naive_utc_dates(
+        self,
+        repository: SqlAlchemyTransactionRepository,
+    ) -> None:
+        """Test that aware dates are converted to naive UTC."""
+        eastern = timezone(timedelta(hours=-5))
+        transaction = create_transaction(
+            "t1",
+            trade_date=datetime(2024, 1, 15, 10, tzinfo=eastern),
+        )
+
+        row = repository.entity_to_row(transaction)
+
+        assert row["transaction_date"] == datetime(2024, 1, 15, 15)  # noqa: DTZ001
+        assert row["transaction_type"] == "BUY"
+        assert row["notes"] is None
+
+    def test_get_by_id_handles_dict_rows(
+        self,
+        repository: SqlAlchemyTransactionRepository,
+        mock_connection: Mock,
+    ) -> None:
+        """Test that plain dict rows are converted to entities."""
+        row = repository.entity_to_row(create_transaction("t1", notes="First"))
+        mock_connection.execute.return_value.fetchone.return_value = row
+
+        transaction = repository.get_by_id("t1")
+
+        assert transaction is not None
+        assert transaction.notes == Notes("First")
+        assert transaction.transaction_date == datetime(2024, 1, 15, tzinfo=UTC)
+
+
+class TestSqlAlchemyTransactionRepositoryIntegration:
+    """Integration tests for SqlAlchemyTransactionRepository with a real database."""
+
+    @pytest.fixture
+    def connection(self) -> Iterator[Connection]:
+        """Provide a connection to a fresh in-memory database."""
+        engine = create_engine("sqlite:///:memory:")
+        metadata.create_all(engine)
+        with engine.connect() as connection, connection.begin():
+            yield connection
+        engine.dispose()
+
+    @pytest.fixture
+    def repository(self, connection: Connection) -> SqlAlchemyTransactionRepository:
+        """Create a transaction repository over a seeded in-memory database."""
+        _ = connection.execute(
+            insert(portfolio_table).values(id="portfolio-1", name="Family"),
+        )
+        for stock_id, symbol in (("stock-1", "AAPL"), ("stock-2", "MSFT")):
+            _ = connection.execute(
+                insert(stock_table).values(id=stock_id, symbol=symbol),
+            )
+        return SqlAlchemyTransactionRepository(SqlAlchemyConnection(connection))
+
+    def test_create_and_get_by_id(
+        self,
+        repository: SqlAlchemyTransactionRepository,
+    ) -> None:
+        """Test round-tripping a transaction through the database."""
+        _ = repository.create(create_transaction("t1", price="150.2500"))
+
+        transaction = repository.get_by_id("t1")
+
+        assert transaction is not None
+        assert transaction.is_buy()
+        assert transaction.quantity == Quantity(10)
+        assert transaction.price == Money(Decimal("150.25"))
+        assert transaction.transaction_date == datetime(2024, 1, 15, tzinfo=UTC)
+
+    def test_get_by_id_returns_none_when_missing(
+        self,
+        repository: SqlAlchemyTransactionRepository,
+    ) -> None:
+        """Test that unknown IDs return None."""
+        assert repository.get_by_id("missing") is None
+
+    def test_queries_filter_and_order(
+        self,
+        repository: SqlAlchemyTransactionRepository,
+    ) -> None:
+        """Test lookups by portfolio, stock and date range."""
+        first = datetime(2024, 1, 1, 9, tzinfo=UTC)
+        _ = repository.create_many(
+            [
+                create_transaction("t1", trade_date=first),
+                create_transaction(
+                    "t2",
+                    stock_id="stock-2",
+                    trade_date=first + timedelta(days=1),
+                ),
+                create_transaction("t3", trade_date=first + timedelta(days=2)),
+            ],
+        )
+
+        newest = repository.get_by_portfolio("portfolio-1", limit=2)
+        by_stock = repository.get_by_stock("stock-1", portfolio_id="portfolio-1")
+        in_range = repository.get_by_date_range(
+            date(2024, 1, 2),
+            date(2024, 1, 3),
+            portfolio_id="portfolio-1",
+        )
+
+        assert [t.id for t in newest] == ["t3", "t2"]
+        assert [t.id for t in by_stock] == ["t1", "t3"]
+        assert [t.id for t in in_range] == ["t2", "t3"]
+        assert [t.id for t in repository.get_by_stock("stock-2")] == ["t2"]
+        assert len(repository.get_by_date_range(date(2024, 1, 1), date(2024, 1, 1)))
+
+    def test_update_and_delete(
+        self,
+        repository: SqlAlchemyTransactionRepository,
+    ) -> None:
+        """Test updating and deleting a stored transaction."""
+        _ = repository.create(create_transaction("t1"))
+
+        assert repository.update("t1", create_transaction("t1", quantity="12"))
+        assert not repository.update("missing", create_transaction("missing"))
+        updated = repository.get_by_id("t1")
+        assert updated is not None
+        assert updated.quantity == Quantity(12)
+
+        assert repository.delete("t1")
+        assert not repository.delete("t1")
+
+    def test_count_stored_matches_natural_key(
+        self,
+        repository: SqlAlchemyTransactionRepository,
+    ) -> None:
+        """Test that every stored fill matching a candidate is counted."""
+        _ = repository.create_many(
+            [
+                create_transaction("t1"),
+                create_transaction("t1-again"),
+                create_transaction("t2", stock_id="stock-2", price="20.123456"),
+            ],
+        )
+        candidates = [
+            create_transaction("same", notes="Re-imported"),
+            create_transaction("rounded", stock_id="stock-2", price="20.1235"),
+            create_transaction("other-price", price="101"),
+            create_transaction("other-type", transaction_type="sell"),
+            create_transaction(
+                "other-date",
+                trade_date=datetime(2024, 1, 16, tzinfo=UTC),
+            ),
+        ]
+
+        with assert_max_queries(1):
+            counts = repository.count_stored(candidates)
+
+        assert counts == {
+            "same": 2,
+            "rounded": 1,
+            "other-price": 0,
+            "other-type": 0,
+            "other-date": 0,
+        }
@@ -14,6 +14,7 @@ from fastapi.testclient import TestClient
 
 from src.application.dto.stock_dto import StockDto
 from src.application.interfaces.stock_service import IStockApplicationService
+from src.domain.value_objects import StockQuerySpec
 
 
 class TestStockEndpoints:
@@ -136,9 +137,9 @@ class TestStockEndpoints:
     ) -> None:
         """Should filter stocks by symbol (partial match, case-insensitive)."""
         # Arrange
-        # Mock the search_stocks method to return filtered results
+        # Mock the find_stocks method to return filtered results
         filtered_stocks = [stock for stock in sample_stock_dtos if "AP" in stock.symbol]
-        mock_stock_service.search_stocks.return_value = filtered_stocks
+        mock_stock_service.find_stocks.return_value = filtered_stocks
 
         # Act
         response = client.get("/stocks", params={"symbol": "ap"})
@@ -151,10 +152,8 @@ class TestStockEndpoints:
         assert data["stocks"][0]["symbol"] == "AAPL"
 
         # Verify the service was called with correct filter
-        mock_stock_service.search_stocks.assert_called_once_with(
-            symbol_filter="ap",
-            name_filter=None,
-            industry_filter=None,
+        mock_stock_service.find_stocks.assert_called_once_with(
+            StockQuerySpec(symbol_contains="ap"),
         )
 
     def test_get_stocks_no_matches(
@@ -166,7 +165,7 @@ class TestStockEndpoints:
         """Should return empty list when no stocks match the filter."""
         # Arrange
         # Return empty list for non-matching filter
-        mock_stock_service.search_stocks.return_value = []
+        mock_stock_service.find_stocks.return_value = []
 
         # Act
         response = client.get("/stocks", params={"symbol": "INVALID"})
@@ -178,10 +177,8 @@ class TestStockEndpoints:
         assert len(data["stocks"]) == 0
 
         # Verify the service was called with the filter
-        mock_stock_service.search_stocks.assert_called_once_with(
-            symbol_filter="INVALID",
-            name_filter=None,
-            industry_filter=None,
+        mock_stock_service.find_stocks.assert_called_once_with(
+            StockQuerySpec(symbol_contains="INVALID"),
         )
 
     def test_get_stocks_invalid_query_parameter(
@@ -219,7 +216,7 @@ class TestStockEndpoints:
         """Should perform case-insensitive symbol filtering."""
         # Arrange
         apple_stock = [stock for stock in sample_stock_dtos if stock.symbol == "AAPL"]
-        mock_stock_service.search_stocks.return_value = apple_stock
+        mock_stock_service.find_stocks.return_value = apple_stock
 
         # Act - test with various cases
         test_cases = ["AAPL", "aapl", "AaPl", "aApL"]
@@ -234,7 +231,7 @@ class TestStockEndpoints:
             assert data["stocks"][0]["symbol"] == "AAPL"
 
         # Verify the service was called with the correct number of times
-        assert mock_stock_service.search_stocks.call_count == len(test_cases)
+        assert mock_stock_service.find_stocks.call_count == len(test_cases)
 
     def test_get_stocks_empty_filter_returns_all(
         self,
@@ -308,7 +305,7 @@ class TestStockEndpoints:
             grade="A",
             notes="E-commerce and cloud leader",
         )
-        mock_stock_service.search_stocks.return_value = [matching_stock]
+        mock_stock_service.find_stocks.return_value = [matching_stock]
 
         # Act
         response = client.get("/stocks", params={"symbol": "amz"})
@@ -320,10 +317,8 @@ class TestStockEndpoints:
         assert data["stocks"][0]["symbol"] == "AMZN"
 
         # Verify the service was called with the symbol filter
-        mock_stock_service.search_stocks.assert_called_once_with(
-            symbol_filter="amz",
-            name_filter=None,
-            industry_filter=None,
+        mock_stock_service.find_stocks.assert_called_once_with(
+            StockQuerySpec(symbol_contains="amz"),
         )
 
     def test_get_stock_by_id_success(
@@ -1136,3 +1131,48 @@ class TestStockEndpoints:
         assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
         data = response.json()
         assert data["detail"] == "An unexpected error occurred"
+
+
+class TestStockVersioning:
+    """Test optimistic concurrency through the API with a real database."""
+
+    @pytest.fixture
+    def client(self) -> Generator[TestClient, None, None]:
+        """Create a test client whose stock service uses an in-memory database."""
+        from sqlalchemy.engine import Engine
+
+        from dependency_injection.composition_root import CompositionRoot
+        from src.infrastructure.persistence.tables import metadata
+        from src.presentation.web.main import app
+        from src.presentation.web.routers import stock_router
+
+        container = CompositionRoot.configure(database_url="sqlite:///:memory:")
+        metadata.create_all(container.resolve(Engine))
+        app.dependency_overrides[stock_router.get_stock_service] = lambda: (
+            container.resolve(IStockApplicationService)
+        )
+
+        with TestClient(app, raise_server_exceptions=False) as test_client:
+            yield test_client
+
+        app.dependency_overrides.clear()
+
+    def test_stale_edit_returns_conflict(self, client: TestClient) -> None:
+        """Should refuse an update based on a version another edit replaced."""
+        created = client.post("/stocks", json={"symbol": "AAPL", "name": "Apple"})
+        stock_id = created.json()["id"]
+
+        first = client.put(
+            f"/stocks/{stock_id}",
+            json={"grade": "A"},
+            headers={"If-Match": created.headers["etag"]},
+        )
+        stale = client.put(f"/stocks/{stock_id}", json={"grade": "B", "version": 1})
+        current = client.get(f"/stocks/{stock_id}")
+
+        assert created.json()["version"] == 1
+        assert first.status_code == status.HTTP_200_OK
+        assert first.headers["etag"] == '"2"'
+        assert stale.status_code == status.HTTP_409_CONFLICT
+        assert current.json()["grade"] == "A"
+        assert current.json()["version"] == 2
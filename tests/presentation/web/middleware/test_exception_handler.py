@@ -12,12 +12,14 @@ from fastapi.responses import JSONResponse
 from src.domain.exceptions.base import (
     AlreadyExistsError,
     BusinessRuleViolationError,
+    ConcurrencyConflictError,
     DomainError,
     NotFoundError,
 )
 from src.presentation.web.middleware.exception_handler import (
     already_exists_exception_handler,
     business_rule_violation_exception_handler,
+    concurrency_conflict_exception_handler,
     domain_exception_handler,
     generic_exception_handler,
     http_exception_handler,
@@ -104,6 +106,42 @@ class TestAlreadyExistsExceptionHandler:
         assert response.body == expected
 
 
+class TestConcurrencyConflictExceptionHandler:
+    """Test handling of ConcurrencyConflictError exceptions."""
+
+    @pytest.mark.anyio
+    async def test_concurrency_conflict_returns_409(self) -> None:
+        """Should return 409 Conflict for ConcurrencyConflictError."""
+        # Arrange
+        request = Mock(spec=Request)
+        exception = ConcurrencyConflictError("Stock", "stock-1", expected_version=2)
+
+        # Act
+        response = await concurrency_conflict_exception_handler(request, exception)
+
+        # Assert
+        assert isinstance(response, JSONResponse)
+        assert response.status_code == 409
+        expected = (
+            b'{"detail":"Stock with identifier \'stock-1\' was modified '
+            b'concurrently (expected version 2)"}'
+        )
+        assert response.body == expected
+
+    @pytest.mark.anyio
+    async def test_concurrency_conflict_handler_with_wrong_exception_type(
+        self,
+    ) -> None:
+        """Should raise TypeError if wrong exception type is passed."""
+        request = Mock(spec=Request)
+
+        with pytest.raises(
+            TypeError,
+            match="Expected ConcurrencyConflictError but got ValueError",
+        ):
+            _ = await concurrency_conflict_exception_handler(request, ValueError())
+
+
 class TestBusinessRuleViolationExceptionHandler:
     """Test handling of BusinessRuleViolationError exceptions."""
 
@@ -0,0 +1,145 @@
+"""Tests for the request metrics and profiling middleware."""
+
+# pyright: reportUnusedFunction=false
+
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from src.presentation.web.middleware.instrumentation import (
+    MetricsMiddleware,
+    ProfilingMiddleware,
+)
+from src.shared.instrumentation import MetricsRegistry, RequestProfiler
+
+
+def create_app() -> FastAPI:
+    """Create an app with a few routes to instrument."""
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int) -> dict[str, int]:
+        """Return an item."""
+        if item_id == 0:
+            raise HTTPException(status_code=404, detail="missing")
+        return {"id": item_id}
+
+    @app.get("/crash")
+    async def crash() -> None:
+        """Fail with an unhandled error."""
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    return app
+
+
+class TestMetricsMiddleware:
+    """Test suite for MetricsMiddleware."""
+
+    @pytest.fixture
+    def registry(self) -> MetricsRegistry:
+        """Create an empty registry."""
+        return MetricsRegistry()
+
+    @pytest.fixture
+    def client(self, registry: MetricsRegistry) -> TestClient:
+        """Create a client for an instrumented app."""
+        app = create_app()
+        app.add_middleware(MetricsMiddleware, registry=registry)
+        return TestClient(app, raise_server_exceptions=False)
+
+    def test_records_requests_by_route_template(
+        self,
+        client: TestClient,
+        registry: MetricsRegistry,
+    ) -> None:
+        """Test that identifiers do not leak into labels."""
+        assert client.get("/items/1").status_code == 200
+        assert client.get("/items/2").status_code == 200
+        assert client.get("/items/0").status_code == 404
+        assert client.get("/nowhere").status_code == 404
+
+        requests = registry.counter("stockbook_http_requests_total", "")
+        duration = registry.histogram("stockbook_http_request_duration_seconds", "")
+        assert requests.value("GET", "/items/{item_id}", "200") == 2
+        assert requests.value("GET", "/items/{item_id}", "404") == 1
+        assert requests.value("GET", "unmatched", "404") == 1
+        assert duration.count("GET", "/items/{item_id}") == 3
+
+    def test_unhandled_errors_count_as_server_errors(
+        self,
+        client: TestClient,
+        registry: MetricsRegistry,
+    ) -> None:
+        """Test that requests failing without a response are recorded as 500."""
+        assert client.get("/crash").status_code == 500
+
+        requests = registry.counter("stockbook_http_requests_total", "")
+        assert requests.value("GET", "/crash", "500") == 1
+
+    def test_disabled_registry_records_nothing(
+        self,
+        client: TestClient,
+        registry: MetricsRegistry,
+    ) -> None:
+        """Test that disabled metrics pass requests straight through."""
+        registry.enabled = False
+
+        assert client.get("/items/1").status_code == 200
+
+        requests = registry.counter("stockbook_http_requests_total", "")
+        assert requests.value("GET", "/items/{item_id}", "200") == 0
+
+
+class TestProfilingMiddleware:
+    """Test suite for ProfilingMiddleware."""
+
+    @staticmethod
+    def _client(profiler: RequestProfiler) -> TestClient:
+        """Create a client for a profiled app."""
+        app = create_app()
+        app.add_middleware(ProfilingMiddleware, profiler=profiler)
+        return TestClient(app)
+
+    def test_requested_profile_replaces_response(self) -> None:
+        """Test that X-Profile returns the report when profiling is enabled."""
+        client = self._client(RequestProfiler(enabled=True))
+
+        response = client.get("/items/1", headers={"X-Profile": "1"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "Ordered by: cumulative time" in response.text
+
+    def test_unrequested_or_disabled_profiles_are_ignored(self) -> None:
+        """Test normal responses without a request or with profiling off."""
+        enabled = self._client(RequestProfiler(enabled=True))
+        disabled = self._client(RequestProfiler())
+
+        assert enabled.get("/items/1", headers={"X-Profile": "0"}).json() == {"id": 1}
+        assert disabled.get("/items/1", headers={"X-Profile": "1"}).json() == {"id": 1}
+
+    def test_sampled_requests_are_logged(
+        self,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test that sampled requests answer normally and log the report."""
+        client = self._client(RequestProfiler(sample_rate=1.0))
+
+        with caplog.at_level("INFO"):
+            response = client.get("/items/1")
+
+        assert response.json() == {"id": 1}
+        assert "Profile of GET /items/1" in caplog.text
+
+    def test_busy_profiler_serves_request_unprofiled(self) -> None:
+        """Test that a request waiting on another profile is not blocked."""
+        profiler = RequestProfiler(enabled=True)
+        client = self._client(profiler)
+
+        with patch.object(profiler, "start", return_value=None):
+            response = client.get("/items/1", headers={"X-Profile": "1"})
+
+        assert response.json() == {"id": 1}
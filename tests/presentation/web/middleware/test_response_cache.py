@@ -0,0 +1,333 @@
+"""Tests for the whole-response cache middleware."""
+
+# pyright: reportUnusedFunction=false
+
+import gzip
+import os
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from src.presentation.web.middleware.response_cache import (
+    CACHE_STATUS_HEADER,
+    ResponseCache,
+    ResponseCacheMiddleware,
+    normalize_query,
+)
+from src.shared.caching import TableVersions
+
+LARGE_NOTES = "Steady dividend payer. " * 50
+
+
+def create_app(calls: list[str]) -> FastAPI:
+    """Create an app whose routes record each call they serve."""
+    app = FastAPI()
+
+    @app.get("/stocks")
+    async def list_stocks(grade: str = "", sector: str = "") -> dict[str, str]:
+        """Return a listing large enough to compress."""
+        calls.append("list")
+        return {"grade": grade, "sector": sector, "notes": LARGE_NOTES}
+
+    @app.get("/stocks/{stock_id}")
+    async def get_stock(stock_id: str) -> dict[str, str]:
+        """Return one small stock."""
+        calls.append(stock_id)
+        return {"id": stock_id}
+
+    @app.post("/stocks")
+    async def create_stock() -> dict[str, str]:
+        """Pretend to create a stock."""
+        calls.append("create")
+        return {"id": "new"}
+
+    @app.get("/stocks-report")
+    async def report() -> dict[str, str]:
+        """Serve a path that only shares the prefix of a cached route."""
+        calls.append("report")
+        return {}
+
+    @app.get("/stocks/private/{kind}")
+    async def private(kind: str, response: Response) -> dict[str, str]:
+        """Return responses that must not be replayed to other clients."""
+        calls.append(kind)
+        if kind == "cookie":
+            response.set_cookie("session", "secret")
+        elif kind == "header":
+            response.headers["Cache-Control"] = "private"
+        else:
+            response.status_code = 202
+        return {}
+
+    return app
+
+
+class TestResponseCache:
+    """Test suite for ResponseCache."""
+
+    def test_rejects_invalid_max_bytes(self) -> None:
+        """Test that the cache must be able to hold a byte."""
+        with pytest.raises(ValueError, match="max_bytes must be at least 1"):
+            _ = ResponseCache(max_bytes=0)
+
+    def test_rejects_invalid_max_age(self) -> None:
+        """Test that a maximum age must be positive when given."""
+        with pytest.raises(ValueError, match="max_age must be positive"):
+            _ = ResponseCache(max_age=0)
+
+    def test_expired_entry_is_a_miss(self) -> None:
+        """Test that an entry is served only until it reaches the maximum age."""
+        now = [100.0]
+        cache = ResponseCache(max_age=30, clock=lambda: now[0])
+        cache.put(("GET", "/stocks", ""), (1,), 200, (), b"[]")
+
+        now[0] = 129.0
+        assert cache.get(("GET", "/stocks", ""), (1,)) is not None
+        now[0] = 130.0
+        assert cache.get(("GET", "/stocks", ""), (1,)) is None
+
+    def test_outdated_entry_is_a_miss(self) -> None:
+        """Test that an entry built from older table versions is not served."""
+        cache = ResponseCache()
+        cache.put(("GET", "/stocks", ""), (1,), 200, (), b"[]")
+
+        assert cache.get(("GET", "/stocks", ""), (2,)) is None
+        assert cache.get(("GET", "/stocks", ""), (1,)) is not None
+        assert cache.cache_info()[:3] == (1, 1, 1)
+
+    def test_large_bodies_are_stored_compressed_too(self) -> None:
+        """Test that compression is kept only where it saves space."""
+        cache = ResponseCache()
+        large = LARGE_NOTES.encode()
+        cache.put(("GET", "/large", ""), (), 200, (), large)
+        cache.put(("GET", "/small", ""), (), 200, (), b"{}")
+        cache.put(("GET", "/random", ""), (), 200, (), os.urandom(600))
+
+        entry = cache.get(("GET", "/large", ""), ())
+        assert entry is not None
+        assert entry.gzip_body is not None
+        assert gzip.decompress(entry.gzip_body) == large
+        for path in ("/small", "/random"):
+            stored = cache.get(("GET", path, ""), ())
+            assert stored is not None
+            assert stored.gzip_body is None
+
+    def test_least_recently_used_are_evicted_by_size(self) -> None:
+        """Test that the total stored bytes stay within the bound."""
+        cache = ResponseCache(max_bytes=10)
+        cache.put(("GET", "/a", ""), (), 200, (), b"aaaa")
+        cache.put(("GET", "/b", ""), (), 200, (), b"bbbb")
+        _ = cache.get(("GET", "/a", ""), ())
+
+        cache.put(("GET", "/c", ""), (), 200, (), b"cccc")
+        cache.put(("GET", "/huge", ""), (), 200, (), b"x" * 11)
+
+        assert cache.get(("GET", "/b", ""), ()) is None
+        assert cache.get(("GET", "/huge", ""), ()) is None
+        assert cache.cache_info().currsize == 2
+        assert cache.cache_info().nbytes == 8
+
+    def test_replacing_an_entry_releases_its_bytes(self) -> None:
+        """Test that storing a key again does not count it twice."""
+        cache = ResponseCache()
+        cache.put(("GET", "/a", ""), (1,), 200, (), b"aaaa")
+        cache.put(("GET", "/a", ""), (2,), 200, (), b"aa")
+
+        assert cache.cache_info().nbytes == 2
+
+        cache.clear()
+
+        assert cache.cache_info()[:4] == (0, 0, 0, 0)
+
+
+class TestNormalizeQuery:
+    """Test suite for normalize_query."""
+
+    def test_orders_parameters_by_name(self) -> None:
+        """Test that parameter order does not create separate entries."""
+        assert normalize_query(b"sector=Energy&grade=A") == "grade=A&sector=Energy"
+        assert normalize_query(b"b=2&a=&b=1") == "a=&b=2&b=1"
+
+
+class TestResponseCacheMiddleware:
+    """Test suite for ResponseCacheMiddleware."""
+
+    @pytest.fixture
+    def calls(self) -> list[str]:
+        """Collect the calls that reached the routes."""
+        return []
+
+    @pytest.fixture
+    def versions(self) -> TableVersions:
+        """Create the table versions writers advance."""
+        return TableVersions()
+
+    @pytest.fixture
+    def cache(self) -> ResponseCache:
+        """Create an empty response cache."""
+        return ResponseCache()
+
+    @pytest.fixture
+    def client(
+        self,
+        calls: list[str],
+        versions: TableVersions,
+        cache: ResponseCache,
+    ) -> TestClient:
+        """Create a client for an app caching the stock routes."""
+        app = create_app(calls)
+        app.add_middleware(
+            ResponseCacheMiddleware,
+            cache=cache,
+            routes={"/stocks/": ["stocks"]},
+        )
+        container = Mock()
+        container.resolve.return_value = versions
+        app.state.di_container = container
+        return TestClient(app)
+
+    def test_repeated_request_is_served_from_cache(
+        self,
+        client: TestClient,
+        calls: list[str],
+    ) -> None:
+        """Test that a hit replays the stored response without the route."""
+        first = client.get("/stocks?sector=Energy&grade=A")
+        second = client.get("/stocks?grade=A&sector=Energy")
+
+        assert first.headers[CACHE_STATUS_HEADER.decode()] == "MISS"
+        assert second.headers[CACHE_STATUS_HEADER.decode()] == "HIT"
+        assert second.json() == first.json()
+        assert second.headers["content-type"] == "application/json"
+        assert calls == ["list"]
+
+    def test_hit_is_compressed_for_clients_accepting_gzip(
+        self,
+        client: TestClient,
+    ) -> None:
+        """Test that the pre-compressed body is sent when accepted."""
+        _ = client.get("/stocks")
+
+        compressed = client.get("/stocks", headers={"Accept-Encoding": "gzip, br"})
+        identity = client.get("/stocks", headers={"Accept-Encoding": "identity"})
+        refused = client.get("/stocks", headers={"Accept-Encoding": "gzip;q=0"})
+
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert compressed.json()["notes"] == LARGE_NOTES
+        assert int(compressed.headers["content-length"]) < len(LARGE_NOTES)
+        for response in (identity, refused):
+            assert "content-encoding" not in response.headers
+            assert response.headers["vary"] == "Accept-Encoding"
+            assert response.json()["notes"] == LARGE_NOTES
+
+    def test_small_hit_is_sent_uncompressed(self, client: TestClient) -> None:
+        """Test that a body stored without gzip variant is sent as is."""
+        _ = client.get("/stocks/stock-1")
+
+        response = client.get("/stocks/stock-1")
+
+        assert response.headers[CACHE_STATUS_HEADER.decode()] == "HIT"
+        assert "content-encoding" not in response.headers
+        assert "vary" not in response.headers
+        assert response.json() == {"id": "stock-1"}
+
+    def test_write_side_version_bump_invalidates(
+        self,
+        client: TestClient,
+        calls: list[str],
+        versions: TableVersions,
+    ) -> None:
+        """Test that a read after a committed write is built again."""
+        _ = client.get("/stocks")
+
+        _ = versions["stocks"].bump()
+        response = client.get("/stocks")
+
+        assert response.headers[CACHE_STATUS_HEADER.decode()] == "MISS"
+        assert calls == ["list", "list"]
+
+    @pytest.mark.parametrize("directive", ["no-cache", "max-age=0"])
+    def test_client_no_cache_revalidates(
+        self,
+        client: TestClient,
+        calls: list[str],
+        directive: str,
+    ) -> None:
+        """Test that no-cache skips the lookup but stores the result."""
+        _ = client.get("/stocks")
+
+        fresh = client.get("/stocks", headers={"Cache-Control": directive})
+        cached = client.get("/stocks")
+
+        assert fresh.headers[CACHE_STATUS_HEADER.decode()] == "MISS"
+        assert cached.headers[CACHE_STATUS_HEADER.decode()] == "HIT"
+        assert calls == ["list", "list"]
+
+    def test_client_no_store_bypasses_cache(
+        self,
+        client: TestClient,
+        calls: list[str],
+        cache: ResponseCache,
+    ) -> None:
+        """Test that no-store neither reads nor writes the cache."""
+        response = client.get("/stocks", headers={"Cache-Control": "No-Store"})
+
+        assert CACHE_STATUS_HEADER.decode() not in response.headers
+        assert cache.cache_info().currsize == 0
+        assert calls == ["list"]
+
+    @pytest.mark.parametrize("kind", ["cookie", "header", "accepted"])
+    def test_unshareable_responses_are_not_stored(
+        self,
+        client: TestClient,
+        cache: ResponseCache,
+        kind: str,
+    ) -> None:
+        """Test that private, cookie-setting or non-200 responses are skipped."""
+        _ = client.get(f"/stocks/private/{kind}")
+
+        assert cache.cache_info().currsize == 0
+
+    def test_other_requests_pass_through(
+        self,
+        client: TestClient,
+        calls: list[str],
+        cache: ResponseCache,
+    ) -> None:
+        """Test that writes and uncached paths are not cached."""
+        for _ in range(2):
+            _ = client.post("/stocks")
+            _ = client.get("/stocks-report")
+
+        assert calls == ["create", "report", "create", "report"]
+        assert cache.cache_info().misses == 0
+
+    def test_disabled_or_unconfigured_app_passes_through(
+        self,
+        calls: list[str],
+        cache: ResponseCache,
+    ) -> None:
+        """Test that nothing is cached when disabled or without a container."""
+        disabled = create_app(calls)
+        disabled.add_middleware(
+            ResponseCacheMiddleware,
+            cache=cache,
+            routes={"/stocks": ["stocks"]},
+            enabled=False,
+        )
+        disabled.state.di_container = Mock()
+        unconfigured = create_app(calls)
+        unconfigured.add_middleware(
+            ResponseCacheMiddleware,
+            cache=cache,
+            routes={"/stocks": ["stocks"]},
+        )
+
+        for app in (disabled, unconfigured):
+            for _ in range(2):
+                _ = TestClient(app).get("/stocks")
+
+        assert calls == ["list"] * 4
+        assert cache.cache_info().misses == 0
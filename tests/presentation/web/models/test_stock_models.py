@@ -13,6 +13,7 @@ from pydantic import ValidationError
 from src.application.commands.stock import CreateStockCommand
 from src.application.dto.stock_dto import StockDto
 from src.presentation.web.models.stock_models import (
+    SparseStockListResponse,
     StockListResponse,
     StockRequest,
     StockResponse,
@@ -427,6 +428,7 @@ class TestStockResponse:
             "industry_group": None,
             "grade": "A",
             "notes": "",
+            "version": 1,
         }
         assert json_data == expected
 
@@ -448,12 +450,13 @@ class TestStockResponse:
             "symbol": "AAPL",
             "name": "Apple Inc.",
             "notes": "",
+            "version": 1,
         }
         assert json_data == expected
 
     def test_stock_response_from_json(self) -> None:
         """Should deserialize from JSON correctly."""
-        json_data = {
+        json_data: dict[str, Any] = {
             "id": "stock-123",
             "symbol": "AAPL",
             "name": "Apple Inc.",
@@ -627,6 +630,7 @@ class TestStockModelsIntegration:
             "industry_group": None,
             "grade": "B",
             "notes": "",
+            "version": 1,
         }
         assert response_json == expected_response
 
@@ -811,6 +815,21 @@ class TestStockListResponse:
         assert json_data["stocks"][1]["symbol"] == "MSFT"
 
 
+class TestSparseStockListResponse:
+    """Test suite for SparseStockListResponse."""
+
+    def test_from_rows_keeps_only_selected_fields(self) -> None:
+        """Should serialize each stock with exactly its selected fields."""
+        rows: list[dict[str, str | None]] = [
+            {"symbol": "AAPL", "name": "Apple Inc."},
+            {"symbol": "MSFT", "name": None},
+        ]
+
+        response = SparseStockListResponse.from_rows(rows)
+
+        assert response.model_dump() == {"stocks": rows, "total": 2}
+
+
 class TestStockUpdateRequest:
     """Test suite for StockUpdateRequest validation and behavior."""
 
@@ -974,6 +993,15 @@ class TestStockUpdateRequest:
         assert command.grade is None
         assert command.notes == ""
 
+    def test_stock_update_request_version_becomes_expected_version(self) -> None:
+        """Should prefer the body version over one from If-Match."""
+        assert StockUpdateRequest(version=2).to_command("s", 5).expected_version == 2
+        assert StockUpdateRequest().to_command("s", 5).expected_version == 5
+        assert StockUpdateRequest().to_command("s").expected_version is None
+
+        with pytest.raises(ValidationError, match="Version must be at least 1"):
+            _ = StockUpdateRequest(version=0)
+
     def test_stock_update_request_extra_fields_rejected(self) -> None:
         """Should reject extra fields not in model."""
         with pytest.raises(ValidationError) as exc_info:
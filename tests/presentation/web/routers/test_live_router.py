@@ -0,0 +1,120 @@
+"""Unit tests for the live updates router."""
+
+# pyright: reportPrivateUsage=false
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.application.events.live_updates import LiveUpdate, LiveUpdateHub
+from src.presentation.web.routers import live_router
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    """Run async tests on asyncio only."""
+    return "asyncio"
+
+
+@pytest.fixture
+def hub() -> LiveUpdateHub:
+    """Create an empty hub."""
+    return LiveUpdateHub()
+
+
+@pytest.fixture
+def client(hub: LiveUpdateHub) -> TestClient:
+    """Create a client whose container resolves the hub."""
+    app = FastAPI()
+    app.include_router(live_router.router)
+    mock_di_container = Mock()
+    mock_di_container.resolve.return_value = hub
+    app.state.di_container = mock_di_container
+    return TestClient(app)
+
+
+def publish_then_close(hub: LiveUpdateHub, *updates: LiveUpdate) -> threading.Thread:
+    """Publish updates once a client subscribes, then end every stream.
+
+    The test client returns after the response completes, so closing the
+    hub is what lets the request finish.
+    """
+
+    def run() -> None:
+        """Wait for the subscriber, publish and close."""
+        deadline = time.monotonic() + 5
+        while hub.subscriber_count == 0 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        for update in updates:
+            _ = hub.publish(update)
+        hub.close()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+class TestLiveRouter:
+    """Test suite for the /live endpoint."""
+
+    def test_streams_published_updates_as_events(
+        self,
+        client: TestClient,
+        hub: LiveUpdateHub,
+    ) -> None:
+        """Should write each update as an SSE event named after its topic."""
+        thread = publish_then_close(
+            hub,
+            LiveUpdate("stock", "stock-1", {"stock_id": "stock-1"}),
+            LiveUpdate("valuation", "portfolio-1", {"total_value": "10.00"}),
+        )
+
+        response = client.get("/live?topics=stock")
+        thread.join()
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.headers["cache-control"] == "no-cache"
+        assert response.text == (
+            ': connected\n\nevent: stock\ndata: {"stock_id":"stock-1"}\n\n'
+        )
+        assert hub.subscriber_count == 0
+
+    @pytest.mark.parametrize("topics", ["stock,prices", "", " , "])
+    def test_invalid_topics_are_rejected(
+        self,
+        client: TestClient,
+        hub: LiveUpdateHub,
+        topics: str,
+    ) -> None:
+        """Should answer 422 naming the allowed topics."""
+        response = client.get(f"/live?topics={topics}")
+
+        assert response.status_code == 422
+        assert "Allowed topics: stock, valuation, target" in response.json()["detail"]
+        assert hub.subscriber_count == 0
+
+    @pytest.mark.anyio
+    async def test_idle_stream_sends_keep_alive(self, hub: LiveUpdateHub) -> None:
+        """Should write a comment when no update arrives in time."""
+        stream = live_router._event_stream(hub, ["stock"], heartbeat=0.01)  # noqa: SLF001
+
+        assert await anext(stream) == ": connected\n\n"
+        assert await anext(stream) == ": keep-alive\n\n"
+        assert hub.subscriber_count == 1
+
+        await stream.aclose()
+
+        assert hub.subscriber_count == 0
+
+    def test_get_live_hub_without_di_container_raises_error(self) -> None:
+        """Should raise RuntimeError when DI container is not configured."""
+        mock_request = Mock()
+        mock_request.app.state = Mock(spec=[])
+
+        with pytest.raises(RuntimeError, match="DI container not configured"):
+            _ = live_router.get_live_hub(mock_request)
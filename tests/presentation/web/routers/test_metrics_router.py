@@ -0,0 +1,30 @@
+"""Unit tests for the metrics router."""
+
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.presentation.web.routers import metrics_router
+from src.shared.instrumentation import MetricsRegistry
+
+
+class TestMetricsRouter:
+    """Test suite for the /metrics endpoint."""
+
+    def test_exposes_registry_in_prometheus_format(self) -> None:
+        """Test the body and content type of a scrape."""
+        registry = MetricsRegistry()
+        registry.counter("stockbook_test_total", "Test counter").inc(amount=3)
+        app = FastAPI()
+        app.include_router(metrics_router.router)
+
+        with patch.object(metrics_router, "metrics", registry):
+            response = TestClient(app).get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == (
+            metrics_router.PROMETHEUS_CONTENT_TYPE
+        )
+        assert "# TYPE stockbook_test_total counter" in response.text
+        assert "stockbook_test_total 3.0" in response.text
@@ -4,19 +4,39 @@ Unit tests for stock router.
 These tests specifically target the router logic to achieve 100% coverage.
 """
 
+import asyncio
+import threading
+import time
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from src.application.dto.stock_dto import StockDto
+from src.application.interfaces.stock_query import IStockQuery
 from src.application.interfaces.stock_service import IStockApplicationService
 from src.domain.exceptions import (
+    ConcurrencyConflictError,
     StockAlreadyExistsError,
     StockNotFoundError,
 )
+from src.domain.value_objects import StockQuerySpec, StockSortKey
 from src.presentation.web.routers import stock_router
+from src.shared.caching import SingleFlight
+
+
+def mock_container(service: Mock, query: Mock | None = None) -> Mock:
+    """Create a DI container mock resolving the router's dependencies."""
+    services = {
+        IStockApplicationService: service,
+        IStockQuery: query or Mock(spec=IStockQuery),
+        SingleFlight: SingleFlight(),
+    }
+    container = Mock()
+    container.resolve.side_effect = services.__getitem__
+    return container
 
 
 class TestStockRouter:
@@ -58,12 +78,14 @@ class TestStockRouter:
         from src.domain.exceptions import (
             AlreadyExistsError,
             BusinessRuleViolationError,
+            ConcurrencyConflictError,
             DomainError,
             NotFoundError,
         )
         from src.presentation.web.middleware.exception_handler import (
             already_exists_exception_handler,
             business_rule_violation_exception_handler,
+            concurrency_conflict_exception_handler,
             domain_exception_handler,
             generic_exception_handler,
             not_found_exception_handler,
@@ -80,15 +102,15 @@ class TestStockRouter:
             BusinessRuleViolationError,
             business_rule_violation_exception_handler,
         )
+        app.add_exception_handler(
+            ConcurrencyConflictError,
+            concurrency_conflict_exception_handler,
+        )
         app.add_exception_handler(DomainError, domain_exception_handler)
         app.add_exception_handler(Exception, generic_exception_handler)
 
-        # Create a mock DI container
-        mock_di_container = Mock()
-        mock_di_container.resolve.return_value = mock_service
-
-        # Set the DI container in app state
-        app.state.di_container = mock_di_container
+        # Set a mock DI container in app state
+        app.state.di_container = mock_container(mock_service)
 
         return app
 
@@ -134,7 +156,7 @@ class TestStockRouter:
 
         # Verify get_all_stocks was called
         mock_service.get_all_stocks.assert_called_once()
-        mock_service.search_stocks.assert_not_called()
+        mock_service.find_stocks.assert_not_called()
 
     def test_get_stocks_with_symbol_filter(
         self,
@@ -142,9 +164,9 @@ class TestStockRouter:
         sample_stock_dtos: list[StockDto],
         app: FastAPI,
     ) -> None:
-        """Should call search_stocks with symbol filter."""
+        """Should call find_stocks with symbol filter."""
         filtered_stocks = [sample_stock_dtos[0]]  # Just AAPL
-        mock_service.search_stocks.return_value = filtered_stocks
+        mock_service.find_stocks.return_value = filtered_stocks
 
         # Mock service is already set up in the app fixture
 
@@ -156,11 +178,9 @@ class TestStockRouter:
         assert data["total"] == 1
         assert data["stocks"][0]["symbol"] == "AAPL"
 
-        # Verify search_stocks was called with correct parameters
-        mock_service.search_stocks.assert_called_once_with(
-            symbol_filter="AAPL",
-            name_filter=None,
-            industry_filter=None,
+        # Verify find_stocks was called with correct parameters
+        mock_service.find_stocks.assert_called_once_with(
+            StockQuerySpec(symbol_contains="AAPL"),
         )
 
     def test_get_stocks_with_multiple_filters(
@@ -168,7 +188,7 @@ class TestStockRouter:
         mock_service: Mock,
         app: FastAPI,
     ) -> None:
-        """Should call search_stocks with all provided filters."""
+        """Should call find_stocks with all provided filters."""
         filtered_stock = [
             StockDto(
                 id="stock-003",
@@ -178,7 +198,7 @@ class TestStockRouter:
                 grade="A",
             ),
         ]
-        mock_service.search_stocks.return_value = filtered_stock
+        mock_service.find_stocks.return_value = filtered_stock
 
         # Mock service is already set up in the app fixture
 
@@ -192,10 +212,8 @@ class TestStockRouter:
         data = response.json()
         assert data["total"] == 1
 
-        mock_service.search_stocks.assert_called_once_with(
-            symbol_filter="GOOGL",
-            name_filter=None,
-            industry_filter=None,
+        mock_service.find_stocks.assert_called_once_with(
+            StockQuerySpec(symbol_contains="GOOGL"),
         )
 
     def test_get_stocks_empty_string_filters_ignored(
@@ -216,7 +234,7 @@ class TestStockRouter:
 
         # Should call get_all_stocks since all filters are empty
         mock_service.get_all_stocks.assert_called_once()
-        mock_service.search_stocks.assert_not_called()
+        mock_service.find_stocks.assert_not_called()
 
     def test_get_stocks_whitespace_trimmed_from_filters(
         self,
@@ -224,7 +242,7 @@ class TestStockRouter:
         app: FastAPI,
     ) -> None:
         """Should trim whitespace from filter values."""
-        mock_service.search_stocks.return_value = []
+        mock_service.find_stocks.return_value = []
 
         # Mock service is already set up in the app fixture
 
@@ -237,10 +255,8 @@ class TestStockRouter:
         assert response.status_code == 200
 
         # Verify whitespace was trimmed
-        mock_service.search_stocks.assert_called_once_with(
-            symbol_filter="AAPL",
-            name_filter=None,
-            industry_filter=None,
+        mock_service.find_stocks.assert_called_once_with(
+            StockQuerySpec(symbol_contains="AAPL"),
         )
 
     def test_get_stocks_service_exception_returns_500(
@@ -265,7 +281,7 @@ class TestStockRouter:
         app: FastAPI,
     ) -> None:
         """Should handle service exceptions when using filters."""
-        mock_service.search_stocks.side_effect = ValueError("Invalid filter")
+        mock_service.find_stocks.side_effect = ValueError("Invalid filter")
 
         # Mock service is already set up in the app fixture
 
@@ -510,6 +526,87 @@ class TestStockRouter:
         data = response.json()
         assert "Stock with identifier 'MSFT' already exists" in data["detail"]
 
+    def test_single_stock_responses_carry_the_version(
+        self,
+        mock_service: Mock,
+        client: TestClient,
+    ) -> None:
+        """Should return the stock version in the body and as ETag."""
+        stock = StockDto(id="stock-001", symbol="AAPL", version=4)
+        mock_service.get_stock_by_id.return_value = stock
+        mock_service.create_stock.return_value = stock
+        mock_service.update_stock.return_value = stock
+
+        responses = [
+            client.get("/stocks/stock-001"),
+            client.post("/stocks", json={"symbol": "AAPL"}),
+            client.put("/stocks/stock-001", json={"grade": "A"}),
+        ]
+
+        for response in responses:
+            assert response.json()["version"] == 4
+            assert response.headers["etag"] == '"4"'
+
+    @pytest.mark.parametrize(
+        ("body", "if_match", "expected"),
+        [
+            ({"grade": "A", "version": 2}, None, 2),
+            ({"grade": "A"}, '"3"', 3),
+            ({"grade": "A"}, 'W/"5"', 5),
+            ({"grade": "A", "version": 2}, '"3"', 2),
+            ({"grade": "A"}, "*", None),
+        ],
+    )
+    def test_update_stock_passes_expected_version(
+        self,
+        mock_service: Mock,
+        sample_stock_dtos: list[StockDto],
+        client: TestClient,
+        body: dict[str, object],
+        if_match: str | None,
+        expected: int | None,
+    ) -> None:
+        """Should base the update on the body version or If-Match header."""
+        mock_service.update_stock.return_value = sample_stock_dtos[0]
+        headers = {"If-Match": if_match} if if_match is not None else {}
+
+        response = client.put("/stocks/stock-001", json=body, headers=headers)
+
+        assert response.status_code == 200
+        command = mock_service.update_stock.call_args[0][0]
+        assert command.expected_version == expected
+
+    def test_update_stock_stale_version_conflict(
+        self,
+        mock_service: Mock,
+        client: TestClient,
+    ) -> None:
+        """Should return 409 when the stock changed since the given version."""
+        mock_service.update_stock.side_effect = ConcurrencyConflictError(
+            "Stock",
+            "stock-001",
+            2,
+        )
+
+        response = client.put("/stocks/stock-001", json={"grade": "A", "version": 2})
+
+        assert response.status_code == 409
+
+    def test_update_stock_unreadable_if_match(
+        self,
+        mock_service: Mock,
+        client: TestClient,
+    ) -> None:
+        """Should return 412 when If-Match names no stock version."""
+        response = client.put(
+            "/stocks/stock-001",
+            json={"grade": "A"},
+            headers={"If-Match": '"abc"'},
+        )
+
+        assert response.status_code == 412
+        mock_service.update_stock.assert_not_called()
+
     def test_update_stock_not_found(self, mock_service: Mock, app: FastAPI) -> None:
         """Should return 404 when stock doesn't exist."""
         # Arrange
@@ -919,3 +1016,243 @@ class TestStockRouter:
         assert response.status_code == 500
         data = response.json()
         assert data["detail"] == "An unexpected error occurred"
+
+
+class TestStockFieldSelection:
+    """Test suite for ?fields= on the stock list endpoint."""
+
+    @pytest.fixture
+    def mock_query(self) -> Mock:
+        """Create a mock stock projection query."""
+        query = Mock(spec=IStockQuery)
+        query.select_fields.return_value = [{"symbol": "AAPL", "name": "Apple Inc."}]
+        return query
+
+    @pytest.fixture
+    def mock_service(self) -> Mock:
+        """Create a mock stock application service."""
+        return Mock(spec=IStockApplicationService)
+
+    @pytest.fixture
+    def client(self, mock_service: Mock, mock_query: Mock) -> TestClient:
+        """Create a client whose container resolves the service and query."""
+        app = FastAPI()
+        app.include_router(stock_router.router)
+        app.state.di_container = mock_container(mock_service, mock_query)
+        return TestClient(app)
+
+    def test_fields_use_projection_query(
+        self,
+        client: TestClient,
+        mock_service: Mock,
+        mock_query: Mock,
+    ) -> None:
+        """Should return only the selected fields, bypassing the service."""
+        response = client.get("/stocks?fields=symbol, name,symbol&symbol= aap ")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "stocks": [{"symbol": "AAPL", "name": "Apple Inc."}],
+            "total": 1,
+        }
+        mock_query.select_fields.assert_called_once_with(
+            ["symbol", "name"],
+            spec=StockQuerySpec(symbol_contains="aap"),
+        )
+        mock_service.get_all_stocks.assert_not_called()
+
+    @pytest.mark.parametrize("fields", ["symbol,password", "", " , "])
+    def test_invalid_fields_are_rejected(
+        self,
+        client: TestClient,
+        mock_query: Mock,
+        fields: str,
+    ) -> None:
+        """Should answer 422 naming the allowed fields."""
+        response = client.get(f"/stocks?fields={fields}")
+
+        assert response.status_code == 422
+        assert "Allowed fields: id, symbol, name" in response.json()["detail"]
+        mock_query.select_fields.assert_not_called()
+
+    def test_get_stock_query_without_di_container_raises_error(self) -> None:
+        """Should raise RuntimeError when DI container is not configured."""
+        mock_request = Mock()
+        mock_request.app.state = Mock(spec=[])
+
+        with pytest.raises(RuntimeError, match="DI container not configured"):
+            _ = stock_router.get_stock_query(mock_request)
+
+
+class TestStockFiltersAndSort:
+    """Test pushing ``GET /stocks`` filters and sort order into one spec."""
+
+    @pytest.fixture
+    def mock_service(self) -> Mock:
+        """Create a mock stock application service."""
+        service = Mock(spec=IStockApplicationService)
+        service.find_stocks.return_value = []
+        return service
+
+    @pytest.fixture
+    def client(self, mock_service: Mock) -> TestClient:
+        """Create a client whose container resolves the service."""
+        app = FastAPI()
+        app.include_router(stock_router.router)
+        app.state.di_container = mock_container(mock_service)
+        return TestClient(app)
+
+    def test_filters_and_sort_form_one_spec(
+        self,
+        client: TestClient,
+        mock_service: Mock,
+    ) -> None:
+        """Should pass every filter and sort key to the service at once."""
+        response = client.get(
+            "/stocks",
+            params={
+                "sector": "Technology",
+                "industry_group": " Software ",
+                "grade": "A",
+                "symbol_prefix": "ms",
+                "sort": "grade:desc, name ,symbol:ASC",
+            },
+        )
+
+        assert response.status_code == 200
+        mock_service.find_stocks.assert_called_once_with(
+            StockQuerySpec(
+                sector="Technology",
+                industry_group="Software",
+                grade="A",
+                symbol_prefix="ms",
+                sort=(
+                    StockSortKey("grade", descending=True),
+                    StockSortKey("name"),
+                    StockSortKey("symbol"),
+                ),
+            ),
+        )
+        mock_service.get_all_stocks.assert_not_called()
+
+    def test_blank_sort_lists_everything(
+        self,
+        client: TestClient,
+        mock_service: Mock,
+    ) -> None:
+        """Should ignore a blank sort like other blank filters."""
+        mock_service.get_all_stocks.return_value = []
+
+        response = client.get("/stocks", params={"sort": " ", "grade": ""})
+
+        assert response.status_code == 200
+        mock_service.get_all_stocks.assert_called_once()
+        mock_service.find_stocks.assert_not_called()
+
+    @pytest.mark.parametrize("sort", ["price", "symbol:up", "symbol,", ":desc"])
+    def test_invalid_sort_is_rejected(
+        self,
+        client: TestClient,
+        mock_service: Mock,
+        sort: str,
+    ) -> None:
+        """Should answer 422 naming the sortable fields."""
+        response = client.get("/stocks", params={"sort": sort})
+
+        assert response.status_code == 422
+        assert (
+            "symbol, name, sector, industry_group, grade" in response.json()["detail"]
+        )
+        mock_service.find_stocks.assert_not_called()
+
+
+class TestStockReadCoalescing:
+    """Test sharing one read between identical concurrent requests."""
+
+    @pytest.fixture
+    def anyio_backend(self) -> str:
+        """Run async tests on asyncio only."""
+        return "asyncio"
+
+    @pytest.mark.anyio
+    async def test_identical_requests_share_one_read(self) -> None:
+        """Should read once for requests arriving while the read runs."""
+        service = Mock(spec=IStockApplicationService)
+        container = mock_container(service)
+        flight: SingleFlight = container.resolve(SingleFlight)
+
+        def blocking_read() -> list[StockDto]:
+            """Hold the read until the other requests have joined it."""
+            deadline = time.monotonic() + 5
+            while flight.cache_info().hits < 2 and time.monotonic() < deadline:
+                time.sleep(0.001)
+            return [StockDto(id="stock-1", symbol="AAPL", name="Apple Inc.")]
+
+        service.data_version = 7
+        service.get_all_stocks.side_effect = blocking_read
+        app = FastAPI()
+        app.include_router(stock_router.router)
+        app.state.di_container = container
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://test",
+        ) as client:
+            responses = await asyncio.gather(
+                *(client.get("/stocks") for _ in range(3)),
+            )
+
+        assert [response.json()["total"] for response in responses] == [1, 1, 1]
+        service.get_all_stocks.assert_called_once_with()
+        assert flight.cache_info() == (2, 1, 0)
+
+    def test_get_read_flight_without_di_container_raises_error(self) -> None:
+        """Should raise RuntimeError when DI container is not configured."""
+        mock_request = Mock()
+        mock_request.app.state = Mock(spec=[])
+
+        with pytest.raises(RuntimeError, match="DI container not configured"):
+            _ = stock_router.get_read_flight(mock_request)
+
+
+class TestStockServiceOffloading:
+    """Test that blocking service calls leave the event loop free."""
+
+    @pytest.fixture
+    def anyio_backend(self) -> str:
+        """Run async tests on asyncio only."""
+        return "asyncio"
+
+    @pytest.mark.anyio
+    async def test_service_calls_run_off_the_event_loop(self) -> None:
+        """Should call the blocking service from worker threads."""
+        service = Mock(spec=IStockApplicationService)
+        threads: list[threading.Thread] = []
+        stock = StockDto(id="stock-1", symbol="AAPL", name="Apple Inc.")
+
+        def record_thread(*_args: object) -> StockDto:
+            """Record the thread running the service call."""
+            threads.append(threading.current_thread())
+            return stock
+
+        service.get_stock_by_id.side_effect = record_thread
+        service.create_stock.side_effect = record_thread
+        service.update_stock.side_effect = record_thread
+        app = FastAPI()
+        app.include_router(stock_router.router)
+        app.state.di_container = mock_container(service)
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://test",
+        ) as client:
+            body = {"symbol": "AAPL", "name": "Apple Inc."}
+            responses = [
+                await client.get("/stocks/stock-1"),
+                await client.post("/stocks", json=body),
+                await client.put("/stocks/stock-1", json=body),
+            ]
+
+        assert [response.status_code for response in responses] == [200, 201, 200]
+        assert len(threads) == 3
+        assert threading.current_thread() not in threads
@@ -3,6 +3,7 @@
 from src.domain.exceptions.base import (
     AlreadyExistsError,
     BusinessRuleViolationError,
+    ConcurrencyConflictError,
     DomainError,
     NotFoundError,
 )
@@ -21,6 +22,7 @@ class TestExceptionHandlerRegistration:
         assert NotFoundError in exception_handlers
         assert AlreadyExistsError in exception_handlers
         assert BusinessRuleViolationError in exception_handlers
+        assert ConcurrencyConflictError in exception_handlers
         assert DomainError in exception_handlers
         assert Exception in exception_handlers
 
@@ -29,16 +31,17 @@ class TestExceptionHandlerRegistration:
         # Get the exception handlers from the app
         exception_handlers = app.exception_handlers
 
-        # We should have at least our 5 custom handlers
+        # We should have at least our 6 custom handlers
         # (NotFoundError, AlreadyExistsError, BusinessRuleViolationError,
-        #  DomainError, Exception)
-        assert len(exception_handlers) >= 5
+        #  ConcurrencyConflictError, DomainError, Exception)
+        assert len(exception_handlers) >= 6
 
     def test_handler_functions_are_correct(self) -> None:
         """Verify that the correct handler functions are registered."""
         from src.presentation.web.middleware.exception_handler import (
             already_exists_exception_handler,
             business_rule_violation_exception_handler,
+            concurrency_conflict_exception_handler,
             domain_exception_handler,
             generic_exception_handler,
             not_found_exception_handler,
@@ -56,5 +59,9 @@ class TestExceptionHandlerRegistration:
             exception_handlers[BusinessRuleViolationError]
             == business_rule_violation_exception_handler
         )
+        assert (
+            exception_handlers[ConcurrencyConflictError]
+            == concurrency_conflict_exception_handler
+        )
         assert exception_handlers[DomainError] == domain_exception_handler
         assert exception_handlers[Exception] == generic_exception_handler
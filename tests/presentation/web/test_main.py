@@ -1,5 +1,7 @@
 """Tests for the main FastAPI application."""
 
+# pyright: reportPrivateUsage=false
+
 import os
 import re
 from collections.abc import Iterator
@@ -61,6 +63,75 @@ class TestMainApp:
             expected_url = os.getenv("DATABASE_URL", database_config.database_url)
             assert call_args[0] == expected_url
 
+    def test_initialization_and_di_share_one_engine(
+        self,
+        mock_database_initializer: Mock,
+    ) -> None:
+        """Test that the DI container reuses the engine used for initialization."""
+        from sqlalchemy.engine import Engine
+
+        from src.presentation.web.main import app
+
+        with TestClient(app):
+            engine = mock_database_initializer.call_args.kwargs["engine"]
+            assert app.state.di_container.resolve(Engine) is engine
+
+    def test_group_committer_closed_on_shutdown(
+        self,
+        mock_database_initializer: Mock,
+    ) -> None:
+        """Test that an enabled group committer is closed with the app."""
+        from src.infrastructure.config import database_config
+        from src.infrastructure.persistence.group_commit import GroupCommitter
+        from src.presentation.web.main import app
+
+        _ = mock_database_initializer
+        with (
+            patch.object(database_config, "group_commit_enabled", new=True),
+            patch.object(GroupCommitter, "close", autospec=True) as mock_close,
+            TestClient(app),
+        ):
+            mock_close.assert_not_called()
+
+        mock_close.assert_called_once()
+
+    def test_live_hub_closed_on_shutdown(
+        self,
+        mock_database_initializer: Mock,
+    ) -> None:
+        """Test that open live update streams are ended with the app."""
+        from src.application.events.live_updates import LiveUpdateHub
+        from src.presentation.web.main import app
+
+        _ = mock_database_initializer
+        with (
+            patch.object(LiveUpdateHub, "close", autospec=True) as mock_close,
+            TestClient(app),
+        ):
+            mock_close.assert_not_called()
+
+        mock_close.assert_called_once()
+
+    def test_metrics_endpoint_reports_requests(self, client: TestClient) -> None:
+        """Test that served requests and cache statistics are exposed."""
+        _ = client.get("/health")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'route="/health"' in response.text
+        assert 'stockbook_cache_hits_total{cache="stock_symbol"}' in response.text
+        assert 'stockbook_cache_hits_total{cache="http_response"}' in response.text
+
+    def test_response_cache_uses_configured_max_age(self) -> None:
+        """Test that cached responses expire after the configured age."""
+        from src.presentation.web.main import response_cache
+        from src.shared.config import app_config
+
+        max_age = response_cache._max_age  # noqa: SLF001
+        assert max_age == (app_config.response_cache_max_age or None)
+
     def test_health_check_endpoint(self, client: TestClient) -> None:
         """Test the health check endpoint returns successful response."""
         response = client.get("/health")
@@ -84,6 +155,8 @@ class TestMainApp:
         assert "endpoints" in data
         assert "/health" in data["endpoints"]
         assert "/docs" in data["endpoints"]
+        assert "/metrics" in data["endpoints"]
+        assert "/live" in data["endpoints"]
 
     def test_version_endpoint(self, client: TestClient) -> None:
         """Test version endpoint returns correct version information."""
@@ -0,0 +1,28 @@
+"""Tests for data versions advanced by writers."""
+
+from src.shared.caching import DataVersion, TableVersions
+
+
+class TestDataVersion:
+    """Test suite for DataVersion."""
+
+    def test_bump_advances_the_version(self) -> None:
+        """Test that each write moves the version on by one."""
+        version = DataVersion()
+
+        assert version.current == 0
+        assert version.bump() == 1
+        assert version.current == 1
+
+
+class TestTableVersions:
+    """Test suite for TableVersions."""
+
+    def test_each_table_has_one_shared_version(self) -> None:
+        """Test that writers and readers of a table see the same version."""
+        versions = TableVersions()
+
+        _ = versions["stocks"].bump()
+
+        assert versions["stocks"] is versions["stocks"]
+        assert versions.snapshot(["stocks", "transactions"]) == (1, 0)
@@ -0,0 +1,158 @@
+"""Tests for coalescing identical concurrent calls."""
+
+# pyright: reportPrivateUsage=false
+
+import asyncio
+import threading
+
+import pytest
+
+from src.shared.caching import SingleFlight, SingleFlightInfo
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    """Run async tests on asyncio only."""
+    return "asyncio"
+
+
+class GatedComputation:
+    """Computation that counts its runs and waits until released."""
+
+    def __init__(self, result: str = "result") -> None:
+        """Create a computation that is not yet released."""
+        self.result = result
+        self.runs = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> str:
+        """Count the run and wait for the release."""
+        self.runs += 1
+        _ = await self.release.wait()
+        return self.result
+
+
+class TestSingleFlight:
+    """Test suite for SingleFlight."""
+
+    @pytest.mark.anyio
+    async def test_concurrent_calls_share_one_computation(self) -> None:
+        """Test that identical calls in flight await the same result."""
+        flight = SingleFlight()
+        compute = GatedComputation()
+
+        callers = [asyncio.create_task(flight.do("key", compute)) for _ in range(3)]
+        await asyncio.sleep(0)
+        compute.release.set()
+
+        assert await asyncio.gather(*callers) == ["result"] * 3
+        assert compute.runs == 1
+        assert flight.cache_info() == SingleFlightInfo(hits=2, misses=1, currsize=0)
+
+    @pytest.mark.anyio
+    async def test_different_keys_compute_separately(self) -> None:
+        """Test that calls with other arguments or versions do not coalesce."""
+        flight = SingleFlight()
+        compute = GatedComputation()
+        compute.release.set()
+
+        _ = await asyncio.gather(
+            flight.do(("find_stocks", "Energy", 1), compute),
+            flight.do(("find_stocks", "Energy", 2), compute),
+        )
+
+        assert compute.runs == 2
+
+    @pytest.mark.anyio
+    async def test_finished_computation_is_not_reused(self) -> None:
+        """Test that a later call computes again instead of caching."""
+        flight = SingleFlight()
+        compute = GatedComputation()
+        compute.release.set()
+
+        _ = await flight.do("key", compute)
+        _ = await flight.do("key", compute)
+
+        assert compute.runs == 2
+        assert flight.cache_info().currsize == 0
+
+    @pytest.mark.anyio
+    async def test_failure_reaches_every_caller(self) -> None:
+        """Test that an exception is raised in all callers and not kept."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def failing() -> str:
+            """Fail once released."""
+            _ = await release.wait()
+            msg = "boom"
+            raise RuntimeError(msg)
+
+        callers = [asyncio.create_task(flight.do("key", failing)) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*callers, return_exceptions=True)
+        assert [str(result) for result in results] == ["boom", "boom"]
+        assert flight.cache_info().currsize == 0
+
+    @pytest.mark.anyio
+    async def test_cancelled_caller_does_not_cancel_others(self) -> None:
+        """Test that a disconnecting client leaves the computation running."""
+        flight = SingleFlight()
+        compute = GatedComputation()
+        leader = asyncio.create_task(flight.do("key", compute))
+        follower = asyncio.create_task(flight.do("key", compute))
+        await asyncio.sleep(0)
+
+        _ = leader.cancel()
+        await asyncio.sleep(0)
+        compute.release.set()
+
+        assert await follower == "result"
+        assert leader.cancelled()
+
+    @pytest.mark.anyio
+    async def test_cancelled_computation_is_forgotten(self) -> None:
+        """Test that a computation cancelled at shutdown is dropped."""
+        flight = SingleFlight()
+        caller = asyncio.create_task(flight.do("key", GatedComputation()))
+        await asyncio.sleep(0)
+
+        _ = flight._flights["key"].cancel()  # noqa: SLF001
+
+        with pytest.raises(asyncio.CancelledError):
+            _ = await caller
+        assert flight.cache_info().currsize == 0
+
+    @pytest.mark.anyio
+    async def test_do_in_thread_runs_blocking_call_once(self) -> None:
+        """Test that blocking calls run in a worker thread and coalesce."""
+        flight = SingleFlight()
+        release = threading.Event()
+        threads: list[str] = []
+
+        def blocking() -> str:
+            """Record the thread and wait for the release."""
+            threads.append(threading.current_thread().name)
+            _ = release.wait(timeout=5)
+            return "rows"
+
+        callers = [
+            asyncio.create_task(flight.do_in_thread("key", blocking)) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*callers) == ["rows", "rows"]
+        assert len(threads) == 1
+        assert threads[0] != threading.current_thread().name
+
+
+class TestSingleFlightInfo:
+    """Test suite for SingleFlightInfo."""
+
+    def test_collapsed_ratio(self) -> None:
+        """Test the share of calls that joined a computation in flight."""
+        assert SingleFlightInfo(hits=3, misses=1, currsize=0).collapsed_ratio == 0.75
+        assert SingleFlightInfo(hits=0, misses=0, currsize=0).collapsed_ratio == 0.0
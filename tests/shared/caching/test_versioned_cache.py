@@ -0,0 +1,189 @@
+"""Tests for the versioned stale-while-revalidate cache."""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, Future
+from typing import Any
+
+import pytest
+
+from src.shared.caching import VersionedCache, VersionedCacheInfo
+
+
+class InlineExecutor(Executor):
+    """Executor running submitted work immediately, for deterministic tests."""
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> "Future[Any]":
+        """Run the function and return its completed future."""
+        future: Future[Any] = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+class Counter:
+    """Compute function returning how often it was called."""
+
+    def __init__(self) -> None:
+        """Start counting from zero."""
+        self.calls = 0
+
+    def __call__(self) -> int:
+        """Count a call."""
+        self.calls += 1
+        return self.calls
+
+
+def failing() -> int:
+    """Compute function that always fails."""
+    msg = "boom"
+    raise RuntimeError(msg)
+
+
+class TestVersionedCache:
+    """Test suite for VersionedCache."""
+
+    def test_rejects_invalid_maxsize(self) -> None:
+        """Test that the cache must hold at least one entry."""
+        with pytest.raises(ValueError, match="at least 1"):
+            _ = VersionedCache[str, int](maxsize=0)
+
+    def test_computes_once_per_version(self) -> None:
+        """Test that a current entry is served without recomputing."""
+        cache = VersionedCache[str, int]()
+        compute = Counter()
+
+        assert cache.get("a", 1, compute) == 1
+        assert cache.get("a", 1, compute) == 1
+
+        assert compute.calls == 1
+        assert cache.cache_info() == VersionedCacheInfo(
+            hits=1,
+            misses=1,
+            stale_hits=0,
+            maxsize=1024,
+            currsize=1,
+        )
+
+    def test_serves_stale_value_while_refreshing(self) -> None:
+        """Test that an outdated entry is returned and refreshed."""
+        cache = VersionedCache[str, int](executor=InlineExecutor())
+        compute = Counter()
+        _ = cache.get("a", 1, compute)
+
+        assert cache.get("a", 2, compute) == 1
+        assert cache.get("a", 2, compute) == 2
+
+        assert compute.calls == 2
+        assert cache.cache_info().stale_hits == 1
+
+    def test_schedules_one_refresh_per_key(self) -> None:
+        """Test that concurrent stale reads share a pending refresh."""
+        release = threading.Event()
+        cache = VersionedCache[str, int]()
+        _ = cache.get("a", 1, lambda: 1)
+        calls: list[int] = []
+
+        def slow() -> int:
+            calls.append(1)
+            _ = release.wait(5)
+            return 2
+
+        assert cache.get("a", 2, slow) == 1
+        assert cache.get("a", 2, slow) == 1
+        release.set()
+        cache.close()
+
+        assert calls == [1]
+        assert cache.get("a", 2, slow) == 2
+
+    def test_recomputes_inline_without_stale_while_revalidate(self) -> None:
+        """Test that outdated entries block for a recomputation when disabled."""
+        cache = VersionedCache[str, int](stale_while_revalidate=False)
+        compute = Counter()
+        _ = cache.get("a", 1, compute)
+
+        assert cache.get("a", 2, compute) == 2
+        assert cache.cache_info().misses == 2
+
+    def test_failed_refresh_keeps_stale_value(
+        self,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test that a refresh error is logged and the stale value kept."""
+        cache = VersionedCache[str, int](executor=InlineExecutor())
+        _ = cache.get("a", 1, lambda: 1)
+
+        with caplog.at_level(logging.ERROR):
+            assert cache.get("a", 2, failing) == 1
+
+        assert "Background refresh" in caplog.text
+        assert cache.get("a", 2, lambda: 3) == 1
+
+    def test_miss_propagates_compute_errors(self) -> None:
+        """Test that inline computation errors reach the caller uncached."""
+        cache = VersionedCache[str, int]()
+
+        with pytest.raises(RuntimeError, match="boom"):
+            _ = cache.get("a", 1, failing)
+
+        assert cache.cache_info().currsize == 0
+
+    def test_concurrent_misses_compute_once(self) -> None:
+        """Test that callers racing on a missing key share one computation."""
+        cache = VersionedCache[str, int]()
+        calls: list[int] = []
+
+        def slow() -> int:
+            calls.append(1)
+            time.sleep(0.05)
+            return 1
+
+        threads = [
+            threading.Thread(target=cache.get, args=("a", 1, slow)) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert calls == [1]
+        assert cache.cache_info().hits == 3
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test that the cache keeps at most maxsize keys."""
+        cache = VersionedCache[str, int](maxsize=2)
+        _ = cache.get("a", 1, lambda: 1)
+        _ = cache.get("b", 1, lambda: 2)
+        _ = cache.get("a", 1, lambda: 1)
+        _ = cache.get("c", 1, lambda: 3)
+
+        assert cache.get("b", 1, lambda: 20) == 20
+        assert cache.cache_info().currsize == 2
+
+    def test_invalidate_and_clear(self) -> None:
+        """Test that dropped entries are recomputed inline."""
+        cache = VersionedCache[str, int]()
+        _ = cache.get("a", 1, lambda: 1)
+
+        cache.invalidate("a")
+        assert cache.get("a", 1, lambda: 2) == 2
+
+        cache.clear()
+        assert cache.cache_info() == VersionedCacheInfo(0, 0, 0, 1024, 0)
+
+    def test_close_keeps_supplied_executor_running(self) -> None:
+        """Test that close only stops the executor the cache started."""
+        executor = InlineExecutor()
+        cache = VersionedCache[str, int](executor=executor)
+
+        cache.close()
+
+        assert executor.submit(lambda: 1).result() == 1
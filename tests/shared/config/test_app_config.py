@@ -94,6 +94,20 @@ class TestAppConfigDefaults:
         assert config.features["journal_system"] is False
         assert config.features["analytics"] is False
 
+    def test_default_instrumentation_settings(self) -> None:
+        """Test that metrics are on and profiling is off by default."""
+        config = AppConfig()
+        assert config.metrics_enabled is True
+        assert config.profiling_enabled is False
+        assert config.profiling_sample_rate == 0.0
+
+    def test_default_response_cache_settings(self) -> None:
+        """Test that the response cache is off by default."""
+        config = AppConfig()
+        assert config.response_cache_enabled is False
+        assert config.response_cache_max_bytes == 16 * 1024 * 1024
+        assert config.response_cache_max_age == 60.0
+
     def test_default_future_features_disabled(self) -> None:
         """Test that future features are disabled by default."""
         config = AppConfig()
@@ -142,6 +156,36 @@ class TestAppConfigEnvironment:
         config = AppConfig()
         assert config.features["analytics"] is True
 
+    @patch.dict(
+        os.environ,
+        {
+            "STOCKBOOK_METRICS": "false",
+            "STOCKBOOK_PROFILING": "true",
+            "STOCKBOOK_PROFILING_SAMPLE_RATE": "0.01",
+        },
+    )
+    def test_instrumentation_settings_from_env(self) -> None:
+        """Test loading metrics and profiling settings from environment."""
+        config = AppConfig()
+        assert config.metrics_enabled is False
+        assert config.profiling_enabled is True
+        assert config.profiling_sample_rate == 0.01
+
+    @patch.dict(
+        os.environ,
+        {
+            "STOCKBOOK_RESPONSE_CACHE": "true",
+            "STOCKBOOK_RESPONSE_CACHE_MAX_BYTES": "1048576",
+            "STOCKBOOK_RESPONSE_CACHE_MAX_AGE": "5.5",
+        },
+    )
+    def test_response_cache_settings_from_env(self) -> None:
+        """Test loading response cache settings from environment."""
+        config = AppConfig()
+        assert config.response_cache_enabled is True
+        assert config.response_cache_max_bytes == 1048576
+        assert config.response_cache_max_age == 5.5
+
     @patch.dict(
         os.environ,
         {
@@ -0,0 +1 @@
+"""Tests for shared instrumentation modules."""
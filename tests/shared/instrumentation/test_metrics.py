@@ -0,0 +1,149 @@
+"""Tests for the in-process metrics registry."""
+
+from functools import lru_cache
+
+import pytest
+
+from src.shared.instrumentation.metrics import Counter, Histogram, MetricsRegistry
+
+
+class TestCounter:
+    """Test suite for Counter."""
+
+    def test_counts_per_label_set(self) -> None:
+        """Test that increments accumulate separately per label set."""
+        counter = Counter("requests_total", "Requests", ("method",))
+
+        counter.inc("GET")
+        counter.inc("GET", amount=2)
+        counter.inc("POST")
+
+        assert counter.value("GET") == 3
+        assert counter.value("POST") == 1
+        assert counter.value("PUT") == 0
+
+    def test_rejects_negative_amounts(self) -> None:
+        """Test that counters cannot decrease."""
+        counter = Counter("requests_total", "Requests")
+
+        with pytest.raises(ValueError, match="only increase"):
+            counter.inc(amount=-1)
+
+    def test_rejects_wrong_number_of_labels(self) -> None:
+        """Test that label values must match the label names."""
+        counter = Counter("requests_total", "Requests", ("method", "route"))
+
+        with pytest.raises(ValueError, match="expects labels"):
+            counter.inc("GET")
+
+    def test_renders_escaped_samples(self) -> None:
+        """Test the exposition lines of a counter."""
+        counter = Counter("requests_total", "Requests", ("route",))
+        counter.inc('/a"b\\c\n')
+
+        assert list(counter.render()) == [
+            "# HELP requests_total Requests",
+            "# TYPE requests_total counter",
+            'requests_total{route="/a\\"b\\\\c\\n"} 1.0',
+        ]
+
+
+class TestHistogram:
+    """Test suite for Histogram."""
+
+    def test_renders_cumulative_buckets(self) -> None:
+        """Test bucket, sum and count lines."""
+        histogram = Histogram("latency_seconds", "Latency", ("route",), (0.1, 1.0))
+
+        histogram.observe(0.05, "/a")
+        histogram.observe(0.1, "/a")
+        histogram.observe(5.0, "/a")
+
+        assert histogram.count("/a") == 3
+        assert histogram.count("/b") == 0
+        assert list(histogram.render())[2:] == [
+            'latency_seconds_bucket{route="/a",le="0.1"} 2',
+            'latency_seconds_bucket{route="/a",le="1.0"} 2',
+            'latency_seconds_bucket{route="/a",le="+Inf"} 3',
+            'latency_seconds_sum{route="/a"} 5.15',
+            'latency_seconds_count{route="/a"} 3',
+        ]
+
+    @pytest.mark.parametrize("buckets", [(), (1.0, 0.5), (1.0, 1.0)])
+    def test_rejects_unordered_buckets(self, buckets: tuple[float, ...]) -> None:
+        """Test that buckets must be non-empty and increasing."""
+        with pytest.raises(ValueError, match="increasing"):
+            _ = Histogram("latency_seconds", "Latency", buckets=buckets)
+
+    def test_clear_drops_samples(self) -> None:
+        """Test that clear removes all series."""
+        histogram = Histogram("latency_seconds", "Latency")
+        histogram.observe(0.2)
+
+        histogram.clear()
+
+        assert histogram.count() == 0
+        assert len(list(histogram.render())) == 2
+
+
+class TestMetricsRegistry:
+    """Test suite for MetricsRegistry."""
+
+    def test_returns_existing_metrics_by_name(self) -> None:
+        """Test that metrics are created once and shared."""
+        registry = MetricsRegistry()
+
+        counter = registry.counter("hits_total", "Hits")
+        histogram = registry.histogram("latency_seconds", "Latency")
+
+        assert registry.counter("hits_total", "Hits") is counter
+        assert registry.histogram("latency_seconds", "Latency") is histogram
+
+    def test_rejects_kind_mismatch(self) -> None:
+        """Test that one name cannot be two kinds of metric."""
+        registry = MetricsRegistry()
+        _ = registry.counter("hits_total", "Hits")
+        _ = registry.histogram("latency_seconds", "Latency")
+
+        with pytest.raises(TypeError, match="already registered as counter"):
+            _ = registry.histogram("hits_total", "Hits")
+        with pytest.raises(TypeError, match="already registered as histogram"):
+            _ = registry.counter("latency_seconds", "Latency")
+
+    def test_render_includes_cache_statistics(self) -> None:
+        """Test hit, miss, ratio and size families for registered caches."""
+        registry = MetricsRegistry(prefix="app")
+
+        @lru_cache(maxsize=8)
+        def square(value: int) -> int:
+            """Square a number."""
+            return value * value
+
+        _ = [square(1), square(1), square(1), square(2)]
+        registry.register_cache("squares", square.cache_info)
+        registry.register_cache("empty", lru_cache(maxsize=1)(abs).cache_info)
+
+        text = registry.render()
+
+        assert 'app_cache_hits_total{cache="squares"} 2.0' in text
+        assert 'app_cache_misses_total{cache="squares"} 2.0' in text
+        assert 'app_cache_hit_ratio{cache="squares"} 0.5' in text
+        assert 'app_cache_hit_ratio{cache="empty"} 0.0' in text
+        assert 'app_cache_size{cache="squares"} 2.0' in text
+        assert "# TYPE app_cache_hit_ratio gauge" in text
+
+    def test_render_and_reset(self) -> None:
+        """Test that render lists every metric and reset clears samples."""
+        registry = MetricsRegistry()
+        registry.counter("b_total", "B").inc()
+        registry.histogram("a_seconds", "A").observe(0.01)
+
+        text = registry.render()
+        registry.reset()
+
+        assert text.index("a_seconds") < text.index("b_total")
+        assert text.endswith("b_total 1.0\n")
+        assert registry.render() == (
+            "# HELP a_seconds A\n# TYPE a_seconds histogram\n"
+            "# HELP b_total B\n# TYPE b_total counter\n"
+        )
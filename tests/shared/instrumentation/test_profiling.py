@@ -0,0 +1,85 @@
+"""Tests for the opt-in request profiler."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.shared.instrumentation.profiling import RequestProfiler
+
+
+def busy_work() -> int:
+    """Do something worth profiling."""
+    return sum(range(1000))
+
+
+class TestRequestProfiler:
+    """Test suite for RequestProfiler."""
+
+    @pytest.mark.parametrize("rate", [-0.1, 1.5])
+    def test_rejects_invalid_sample_rate(self, rate: float) -> None:
+        """Test that the sample rate must be a share."""
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            _ = RequestProfiler(sample_rate=rate)
+
+    def test_disabled_profiler_profiles_nothing(self) -> None:
+        """Test that profiling is off by default, even when requested."""
+        profiler = RequestProfiler()
+
+        assert not profiler.active
+        assert not profiler.should_profile(requested=True)
+
+    def test_honours_requests_when_enabled(self) -> None:
+        """Test explicit profiling requests."""
+        profiler = RequestProfiler(enabled=True)
+
+        assert profiler.active
+        assert profiler.should_profile(requested=True)
+        assert not profiler.should_profile(requested=False)
+
+    def test_samples_requests_at_the_configured_rate(self) -> None:
+        """Test random sampling against the sample rate."""
+        draws = iter([0.05, 0.5])
+        profiler = RequestProfiler(sample_rate=0.1, sampler=lambda: next(draws))
+
+        assert profiler.active
+        assert profiler.should_profile(requested=False)
+        assert not profiler.should_profile(requested=True)
+
+    def test_report_lists_profiled_functions(self) -> None:
+        """Test that a profile report names the functions that ran."""
+        profiler = RequestProfiler(enabled=True, limit=5)
+
+        profile = profiler.start()
+        assert profile is not None
+        _ = busy_work()
+        report = profiler.stop(profile)
+
+        assert "busy_work" in report
+        assert "cumulative" in report
+
+    def test_only_one_profile_at_a_time(self) -> None:
+        """Test that start returns None while another profile runs."""
+        profiler = RequestProfiler(enabled=True)
+
+        profile = profiler.start()
+        assert profile is not None
+        assert profiler.start() is None
+        _ = profiler.stop(profile)
+
+        second = profiler.start()
+        assert second is not None
+        _ = profiler.stop(second)
+
+    def test_start_releases_lock_when_enable_fails(self) -> None:
+        """Test that a failed start does not block later profiles."""
+        profiler = RequestProfiler(enabled=True)
+
+        with (
+            patch("cProfile.Profile.enable", side_effect=ValueError("busy")),
+            pytest.raises(ValueError, match="busy"),
+        ):
+            _ = profiler.start()
+
+        profile = profiler.start()
+        assert profile is not None
+        _ = profiler.stop(profile)
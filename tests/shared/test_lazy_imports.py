@@ -0,0 +1,49 @@
+"""Tests for lazily loaded package exports."""
+
+import sys
+import types
+
+import pytest
+
+from dependency_injection.lifetimes import Lifetime
+from src.shared.lazy_imports import lazy_exports
+
+
+@pytest.fixture
+def package(monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+    """Register an empty package exporting Lifetime lazily."""
+    module = types.ModuleType("lazy_test_package")
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    load, names = lazy_exports(
+        module.__name__,
+        {"Lifetime": "dependency_injection.lifetimes"},
+    )
+    module.__getattr__ = load  # type: ignore[attr-defined]
+    module.__dir__ = names
+    return module
+
+
+class TestLazyExports:
+    """Test suite for lazy_exports."""
+
+    def test_export_is_imported_on_first_access(
+        self,
+        package: types.ModuleType,
+    ) -> None:
+        """Should resolve the export and cache it on the package."""
+        assert "Lifetime" not in vars(package)
+
+        assert package.Lifetime is Lifetime
+        assert vars(package)["Lifetime"] is Lifetime
+
+    def test_unknown_name_raises_attribute_error(
+        self,
+        package: types.ModuleType,
+    ) -> None:
+        """Should behave like a missing module attribute."""
+        with pytest.raises(AttributeError, match="has no attribute 'Missing'"):
+            _ = package.Missing
+
+    def test_dir_lists_exports_not_loaded_yet(self, package: types.ModuleType) -> None:
+        """Should include lazy exports in dir()."""
+        assert "Lifetime" in dir(package)